@@ -0,0 +1,66 @@
+"""
+Benchmark how long `import gymnast` takes in a fresh interpreter, using
+python -X importtime.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--top N] [--max-ms MS]
+
+Reports the best total import time over the runs, the modules that took
+longest to import themselves, and whether any of the slow optional
+dependencies got pulled in.  With --max-ms, exits with an error if the import
+took longer than that, so it can be used as a check.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Things that shouldn't get imported until they're actually needed
+LAZY_MODULES = ('numpy', 'bidict', 'pkg_resources')
+
+def import_times(module='gymnast'):
+    """Import module in a new interpreter and return a dict mapping each
+    module imported to its (self, cumulative) import times in microseconds"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                           'import ' + module],
+                          env=env, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us, cumul_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue # Header line
+        times[fields[2].strip()] = (self_us, cumul_us)
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs',   type=int,   default=5)
+    parser.add_argument('--top',    type=int,   default=10)
+    parser.add_argument('--max-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    runs  = [import_times() for _ in range(args.runs)]
+    best  = min(runs, key=lambda t: t['gymnast'][1])
+    total = best['gymnast'][1]/1000.
+    print('import gymnast: {:.1f} ms (best of {})'.format(total, args.runs))
+    print('\nSlowest modules (self time):')
+    slowest = sorted(best.items(), key=lambda i: i[1][0], reverse=True)
+    for name, (self_us, _) in slowest[:args.top]:
+        print('  {:8.1f} ms  {}'.format(self_us/1000., name))
+    eager = [m for m in LAZY_MODULES if m in best]
+    print('\nImported eagerly: {}'.format(', '.join(eager) or 'none'))
+    if args.max_ms is not None and total > args.max_ms:
+        sys.exit('Import took {:.1f} ms, more than {} ms'.format(total,
+                                                                args.max_ms))
+
+if __name__ == '__main__':
+    main()
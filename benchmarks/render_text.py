@@ -0,0 +1,68 @@
+"""
+Benchmark text extraction with PdfFastRenderer against PdfSimpleRenderer,
+which give the same text.
+
+Usage:
+    python benchmarks/render_text.py FILE [FILE ...] [--runs N]
+
+For each file, reports how long each renderer takes over all of the pages,
+both cold (a freshly parsed document, so the content streams are decoded and
+compiled too) and warm (the best of the runs after that), and checks that the
+two renderers agree.
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gymnast.pdf_doc  import PdfDocument
+from gymnast.renderer import PdfSimpleRenderer, PdfFastRenderer
+
+RENDERERS = (PdfSimpleRenderer, PdfFastRenderer)
+
+def render_all(renderer, pages):
+    """Render all of the pages, returning the text and the time it took"""
+    start = time.perf_counter()
+    text  = [renderer(page).render() for page in pages]
+    return text, time.perf_counter() - start
+
+def bench(filename, runs):
+    """Time each renderer on a file.  Returns a dict mapping each renderer to
+    its (text, cold time, warm time)."""
+    results = {}
+    for renderer in RENDERERS:
+        pages      = list(PdfDocument(filename).parse().Pages)
+        text, cold = render_all(renderer, pages)
+        warm = min(render_all(renderer, pages)[1] for _ in range(runs))
+        results[renderer] = (text, cold, warm)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    mismatched = []
+    for filename in args.files:
+        results = bench(filename, args.runs)
+        print(os.path.basename(filename))
+        base = results[PdfSimpleRenderer]
+        for renderer, (text, cold, warm) in results.items():
+            print('  {:18} cold {:8.1f} ms ({:4.1f}x)  warm {:8.1f} ms '
+                  '({:4.1f}x)'.format(renderer.__name__, cold*1000,
+                                      base[1]/cold, warm*1000,
+                                      base[2]/warm))
+        if results[PdfFastRenderer][0] != base[0]:
+            mismatched.append(filename)
+    if mismatched:
+        sys.exit('Text differs for: {}'.format(', '.join(mismatched)))
+
+if __name__ == '__main__':
+    main()
@@ -18,7 +18,11 @@ __status__    = 'Alpha'
 from .pdf_doc    import PdfDocument
 from .renderer   import PdfBaseRenderer, PdfTextRenderer
 
-from pkg_resources import resource_string
-__version__ = resource_string(__name__, 'VERSION').decode('ascii').strip()
+def _read_version():
+    """Read the version from the VERSION file next to us"""
+    import os
+    with open(os.path.join(os.path.dirname(__file__), 'VERSION')) as f:
+        return f.read().strip()
+__version__ = _read_version()
 
 __all__ = ['PdfDocument', 'PdfBaseRenderer', 'PdfTextRenderer']
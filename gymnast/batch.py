@@ -0,0 +1,211 @@
+"""
+Batch text extraction using pools of worker processes, either over many
+documents or over the pages of one big one.
+
+Usage:
+    from gymnast.batch import extract_text
+    for result in extract_text(paths, jobs=8, timeout=60):
+        if result.error:
+            log(result.path, result.error)
+        else:
+            store(result.path, result.pages)
+
+Results come back in the order the documents finish, not the order they went
+in.  For a single document, see PdfDocument.extract_pages().
+"""
+
+import os
+import signal
+import warnings
+from collections        import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from array              import array
+from itertools          import islice, chain
+
+from .pdf_doc  import PdfDocument
+from .renderer import PdfTextRenderer
+
+__all__ = ['extract_text', 'extract_pages', 'ExtractResult', 'DocumentTimeout']
+
+ExtractResult = namedtuple('ExtractResult', ('path', 'pages', 'error'))
+ExtractResult.__doc__ = """Text extracted from one document.  pages is a list
+of the text of each page, or None if it failed, in which case error
+describes what went wrong."""
+
+class DocumentTimeout(Exception):
+    """Raised in a worker when a document takes too long"""
+    pass
+
+def _raise_timeout(signum, frame):
+    raise DocumentTimeout()
+
+def _extract_document(path, timeout, renderer, renderer_kwargs):
+    """Extract the text of every page in the document at path, returning an
+    ExtractResult.  Exceptions are caught and reported in the result."""
+    use_timer = timeout and hasattr(signal, 'setitimer')
+    if use_timer:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            with PdfDocument(path) as doc:
+                doc.parse()
+                pages = [renderer(page, **renderer_kwargs).render()
+                         for page in doc.Pages]
+        return ExtractResult(path, pages, None)
+    except DocumentTimeout:
+        return ExtractResult(path, None,
+                             'Timed out after {} seconds'.format(timeout))
+    except Exception as e:
+        return ExtractResult(path, None, '{}: {}'.format(type(e).__name__, e))
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def _extract_chunk(paths, timeout, renderer, renderer_kwargs):
+    """Worker task: extract a chunk of documents"""
+    return [_extract_document(path, timeout, renderer, renderer_kwargs)
+            for path in paths]
+
+def _chunks(iterable, size):
+    """Split iterable into lists of (at most) size items"""
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+def extract_text(paths, jobs=None, timeout=None, chunksize=1,
+                 renderer=PdfTextRenderer, **renderer_kwargs):
+    """Extract the text from many PDF files in parallel.  This is a generator
+    yielding an ExtractResult for each path as it finishes.
+
+    Arguments:
+        paths     - Iterable of file names.  It's consumed lazily, so it can
+                    be arbitrarily long.
+        jobs      - Number of worker processes (default os.cpu_count())
+        timeout   - Optional time limit in seconds for each document.  Only
+                    enforced where signal.setitimer exists (i.e., not on
+                    Windows).
+        chunksize - Number of documents sent to a worker at a time.  Larger
+                    chunks mean less overhead but coarser load balancing.
+        renderer  - Renderer class used for each page (default
+                    PdfTextRenderer).  It must be importable by the workers.
+
+    Any other keyword arguments (e.g., fixed_width) are passed to the
+    renderer.
+
+    A document that fails to parse or render only gets an error in its
+    result.  If a worker process dies outright, the pool is restarted and
+    the documents that were in flight are retried one at a time, so that
+    only the one responsible ends up with an error."""
+    jobs     = jobs or os.cpu_count() or 1
+    chunks   = _chunks(paths, chunksize)
+    args     = (timeout, renderer, renderer_kwargs)
+    executor = ProcessPoolExecutor(jobs)
+    pending  = {} # future: (chunk, whether it's a retry)
+    retries  = []
+    try:
+        while True:
+            if retries:
+                # Survivors of a crash go one at a time, so that if it
+                # happens again we know exactly whose fault it was
+                if not pending:
+                    chunk = retries.pop()
+                    pending[executor.submit(_extract_chunk, chunk, *args)] = \
+                        (chunk, True)
+            else:
+                # Keep a couple of chunks queued per worker without
+                # submitting the whole (possibly huge) list up front
+                for chunk in islice(chunks, 2*jobs - len(pending)):
+                    pending[executor.submit(_extract_chunk, chunk, *args)] = \
+                        (chunk, False)
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken  = False
+            for future in done:
+                chunk, retried = pending.pop(future)
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    if not retried:
+                        retries.extend([path] for path in chunk)
+                        continue
+                    results = [ExtractResult(chunk[0], None,
+                                             'Worker process died')]
+                for result in results:
+                    yield result
+            if broken:
+                # Everything else in flight went down with the pool
+                for chunk, retried in pending.values():
+                    retries.extend([path] for path in chunk)
+                pending = {}
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(jobs)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+# Each page worker process gets its own copy of the document
+_worker_doc = None
+
+def _init_page_worker(path, xrefs):
+    """Open the document in a page worker, reusing the parent's xrefs"""
+    global _worker_doc
+    _worker_doc = PdfDocument(path)
+    _worker_doc.adopt_xrefs(xrefs)
+
+def _render_pages(obj_nos, gens, renderer, renderer_kwargs):
+    """Page worker task: render the pages with the given object keys"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return [renderer(_worker_doc.get_object(obj_no, gen).parsed_object,
+                         **renderer_kwargs).render()
+                for obj_no, gen in zip(obj_nos, gens)]
+
+def extract_pages(document, indices=None, renderer=PdfTextRenderer,
+                  workers=None, **renderer_kwargs):
+    """Render pages of a parsed PdfDocument, spread across worker processes,
+    and return a list of the results in the same order as indices.
+
+    The workers reopen the document's file themselves, so all they get
+    sent is its path, its cross reference index, and the object numbers of
+    the pages they're to render.  Documents that didn't come from a file
+    are rendered in this process.
+
+    Arguments:
+        document - The (parsed) PdfDocument
+        indices  - Iterable of page indices (default all of them)
+        renderer - Renderer class (default PdfTextRenderer)
+        workers  - Number of worker processes (default os.cpu_count())
+
+    Any other keyword arguments (e.g., fixed_width, tab_width) are passed to
+    the renderer, so they have to be picklable."""
+    pages = document.Pages
+    if indices is None:
+        indices = range(len(pages))
+    pages   = [pages[i] for i in indices]
+    workers = workers or os.cpu_count() or 1
+    keys    = [page.object_key for page in pages]
+    if workers == 1 or document.filename is None or None in keys:
+        return [renderer(page, **renderer_kwargs).render() for page in pages]
+
+    obj_nos = array('q', (k[0] for k in keys))
+    gens    = array('l', (k[1] for k in keys))
+    # Contiguous slices, a few per worker to even out the load
+    size = max(1, -(-len(keys) // (4*workers)))
+    bounds = range(0, len(keys), size)
+    with ProcessPoolExecutor(workers, initializer=_init_page_worker,
+                             initargs=(document.filename,
+                                       document.xrefs)) as executor:
+        results = executor.map(_render_pages,
+                               (obj_nos[i:i+size] for i in bounds),
+                               (gens[i:i+size]    for i in bounds),
+                               (renderer        for i in bounds),
+                               (renderer_kwargs for i in bounds))
+        return list(chain.from_iterable(results))
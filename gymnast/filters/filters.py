@@ -3,30 +3,163 @@ Implement and register our stream filters
 """
 
 import base64
+import binascii
 import codecs
 import io
 import zlib
+from warnings import warn
 from .stream_filter import StreamFilter
+from ..misc         import get_numpy
 
 # The best are the ones that are already done for us
 def a85decode(data, **kwargs):
     return base64.a85decode(data)
 def a85encode(data, **kwargs):
     return base64.a85decode(data)
+def a85_iter_decode(chunks, **kwargs):
+    """Decode ASCII85 data a chunk at a time.  Each chunk is decoded up to its
+    last complete group, and the rest is carried over to the next."""
+    carry = b''
+    for chunk in chunks:
+        data  = carry + bytes(chunk).translate(None, b' \t\n\r\v')
+        # z (four zero bytes) is a group to itself, so everything after the
+        # last one is in groups of five
+        start = data.rfind(b'z') + 1
+        split = start + (len(data) - start)//5*5
+        if split:
+            yield base64.a85decode(data[:split])
+        carry = data[split:]
+    if carry:
+        yield base64.a85decode(carry)
 
 def flate_decode(data, **kwargs):
-    return zlib.decompress(data)
+    return unpredict(zlib.decompress(data), **kwargs)
 def flate_encode(data, **kwargs):
     return zlib.compress(data)
-StreamFilter.register('ASCII85Decode', a85decode, b'~>', a85encode)
-StreamFilter.register('FlateDecode', flate_decode, None, flate_encode)
+def flate_iter_decode(chunks, **kwargs):
+    """Inflate the data a chunk at a time, with no more than
+    StreamFilter.CHUNK_SIZE bytes coming out of each decompress() call"""
+    return iter_unpredict(inflate_chunks(chunks), **kwargs)
+def inflate_chunks(chunks):
+    inflater = zlib.decompressobj()
+    size     = StreamFilter.CHUNK_SIZE
+    for chunk in chunks:
+        while chunk and not inflater.eof:
+            data = inflater.decompress(chunk, size)
+            if data:
+                yield data
+            chunk = inflater.unconsumed_tail
+        if inflater.eof:
+            break
+    data = inflater.flush()
+    if data:
+        yield data
+StreamFilter.register('ASCII85Decode', a85decode, b'~>', a85encode,
+                      a85_iter_decode)
+StreamFilter.register('FlateDecode', flate_decode, None, flate_encode,
+                      flate_iter_decode)
 
 
+def unpredict(data, Predictor=1, Colors=1, BitsPerComponent=8, Columns=1,
+              **kwargs):
+    """Reverse the predictor function, if any, applied to Flate or LZW
+    encoded data before compression.  See Reference pp. 75-77."""
+    if Predictor == 1:
+        return data
+    elif Predictor < 10:
+        warn('TIFF predictors not implemented')
+        return data
+    bpp    = max(1, Colors*BitsPerComponent//8)
+    rowlen = (Colors*BitsPerComponent*Columns + 7)//8
+    return unpredict_png(data, bpp, rowlen, bytes(rowlen))
+
+def iter_unpredict(chunks, Predictor=1, Colors=1, BitsPerComponent=8,
+                   Columns=1, **kwargs):
+    """unpredict() for data that comes in chunks.  Rows split between chunks
+    are carried over to the next one."""
+    if Predictor == 1:
+        return chunks
+    elif Predictor < 10:
+        warn('TIFF predictors not implemented')
+        return chunks
+    bpp    = max(1, Colors*BitsPerComponent//8)
+    rowlen = (Colors*BitsPerComponent*Columns + 7)//8
+    return _iter_unpredict_png(chunks, bpp, rowlen)
+def _iter_unpredict_png(chunks, bpp, rowlen):
+    prev  = bytes(rowlen)
+    carry = b''
+    for chunk in chunks:
+        data  = carry + chunk
+        nrows = len(data)//(rowlen + 1)
+        if nrows:
+            output = unpredict_png(data, bpp, rowlen, prev)
+            prev   = output[-rowlen:]
+            yield output
+        carry = data[nrows*(rowlen + 1):]
+
+def unpredict_png(data, bpp, rowlen, prev):
+    """Reverse PNG predictors, where each row gets its own algorithm (given in
+    the first byte of the row) and is based on the row above it.  prev is
+    the row before the first one in data (all zeros to start with).  Any
+    incomplete row at the end is dropped."""
+    nrows  = len(data)//(rowlen + 1)
+    numpy  = get_numpy() if nrows else None
+    if numpy is not None:
+        rows = numpy.frombuffer(data, numpy.uint8, nrows*(rowlen + 1))
+        rows = rows.reshape(nrows, rowlen + 1)
+        algs = rows[:, 0]
+        if (algs == 0).all():
+            return rows[:, 1:].tobytes()
+        elif (algs == 2).all():
+            # Up all the way down, which is just a running sum
+            rows = rows[:, 1:].cumsum(axis=0, dtype=numpy.uint8)
+            return (rows + numpy.frombuffer(prev, numpy.uint8)).tobytes()
+    output = bytearray()
+    prev   = bytearray(prev)
+    for i in range(0, nrows*(rowlen + 1), rowlen + 1):
+        alg = data[i]
+        row = bytearray(data[i+1:i+rowlen+1])
+        if   alg == 1: # Sub
+            for j in range(bpp, rowlen):
+                row[j] = (row[j] + row[j-bpp]) & 0xFF
+        elif alg == 2: # Up
+            row = bytearray((a + b) & 0xFF for a, b in zip(row, prev))
+        elif alg == 3: # Average
+            for j in range(rowlen):
+                left   = row[j-bpp] if j >= bpp else 0
+                row[j] = (row[j] + ((left + prev[j]) >> 1)) & 0xFF
+        elif alg == 4: # Paeth
+            for j in range(rowlen):
+                left  = row[j-bpp]  if j >= bpp else 0
+                ulft  = prev[j-bpp] if j >= bpp else 0
+                est   = left + prev[j] - ulft
+                dists = (abs(est - left), abs(est - prev[j]), abs(est - ulft))
+                if   dists[0] <= dists[1] and dists[0] <= dists[2]: pred = left
+                elif dists[1] <= dists[2]:                          pred = prev[j]
+                else:                                               pred = ulft
+                row[j] = (row[j] + pred) & 0xFF
+        output += row
+        prev    = row
+    return bytes(output)
+
 def hex_decode(data):
     return codecs.decode(data, 'hex')
 def hex_encode(data):
     return codecs.encode(data, 'hex')
-StreamFilter.register('ASCIIHexDecode', hex_decode, b'>', hex_encode)
+def hex_iter_decode(chunks, **kwargs):
+    """Decode hex data a chunk at a time, skipping whitespace.  An odd final
+    digit is taken to be followed by a 0 (Reference p. 69)."""
+    carry = b''
+    for chunk in chunks:
+        data  = carry + bytes(chunk).translate(None, b' \t\n\r\f\0')
+        split = len(data) & ~1
+        if split:
+            yield binascii.unhexlify(data[:split])
+        carry = data[split:]
+    if carry:
+        yield binascii.unhexlify(carry + b'0')
+StreamFilter.register('ASCIIHexDecode', hex_decode, b'>', hex_encode,
+                      hex_iter_decode)
 
 
 def lzw_decode(data, **kwargs):
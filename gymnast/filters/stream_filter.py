@@ -6,18 +6,30 @@ from collections import namedtuple
 from warnings    import warn
 from ..misc      import ensure_str, MetaGettable
 
-base = namedtuple('StreamFilter', ('filter_name','decoder', 'EOD', 'encoder'))
-base.__new__.__defaults__ = (None, None)
+base = namedtuple('StreamFilter', ('filter_name','decoder', 'EOD', 'encoder',
+                                   'iter_decoder'))
+base.__new__.__defaults__ = (None, None, None)
 class StreamFilterBase(base):
-    """Stream filter class."""
+    """Stream filter class.  Filters with an iter_decoder can also decode
+    their data a chunk at a time."""
     def decode(self, data, **kwargs):
         """Decode the encoded stream. Keyword arguments are the parameters from
         the stream dictionary."""
         if self.EOD:
-            end = data.find(bytes(self.EOD))
+            data = bytes(data) # memoryviews don't have find()
+            end  = data.find(bytes(self.EOD))
             return self.decoder(data[:end if end > 0 else None], **kwargs)
         else:
             return self.decoder(data, **kwargs)
+    def iter_decode(self, chunks, **kwargs):
+        """Decode the encoded stream given as an iterable of chunks of bytes,
+        yielding the decoded data in chunks.  Filters without an iter_decoder
+        have to join all of the chunks and decode them at once."""
+        if self.EOD:
+            chunks = until_marker(chunks, bytes(self.EOD))
+        if self.iter_decoder:
+            return self.iter_decoder(chunks, **kwargs)
+        return iter((self.decoder(b''.join(chunks), **kwargs), ))
     def encode(self, data, **kwargs):
         """Encode the stream data. Keyword arguments are the parameters from
         the stream dictionary."""
@@ -36,12 +48,28 @@ class StreamFilter(object):
     https://partners.adobe.com/public/developer/en/ps/sdk/TN5603.Filters.pdf"""
     # Nothing to see here.  Pay no attention to that man behind the curtain.
     _filters    = {}
-    _nop_filter = StreamFilterBase('NOPFilter', lambda x: x)
+    _nop_filter = StreamFilterBase('NOPFilter', lambda x: x,
+                                   iter_decoder=lambda chunks, **kwargs: chunks)
+    # Most data a filter's iter_decoder should hold at once or yield as a
+    # single chunk (roughly, as the encoded chunks come in whatever size)
+    CHUNK_SIZE = 1 << 16
 
     @classmethod
-    def register(cls, filter_name, decoder, eod=None, encoder=None):
-        """Register a new stream filter"""
-        new_filt = StreamFilterBase(filter_name, decoder, eod, encoder)
+    def register(cls, filter_name, decoder, eod=None, encoder=None,
+                 iter_decoder=None):
+        """Register a new stream filter.
+
+        Arguments:
+            filter_name  - The filter's name, e.g. 'FlateDecode'
+            decoder      - Function decoding bytes, taking the stream's
+                           decode parameters as keyword arguments
+            eod          - End of data marker, if any
+            encoder      - Function encoding bytes, like decoder
+            iter_decoder - Optional function taking an iterable of chunks of
+                           encoded bytes (and the parameters, like decoder)
+                           and yielding the decoded data in chunks"""
+        new_filt = StreamFilterBase(filter_name, decoder, eod, encoder,
+                                    iter_decoder)
         cls._filters[filter_name] = new_filt
 
     @classmethod
@@ -51,3 +79,22 @@ class StreamFilter(object):
             return cls._filters[filter_name]
         except KeyError:
             return cls._nop_filter
+
+def until_marker(chunks, marker):
+    """Yield the chunks up to the first occurence of marker, which can be split
+    between them"""
+    tail = b''
+    keep = len(marker) - 1
+    for chunk in chunks:
+        chunk = tail + bytes(chunk)
+        end   = chunk.find(marker)
+        if end >= 0:
+            if end:
+                yield chunk[:end]
+            return
+        split = max(len(chunk) - keep, 0)
+        chunk, tail = chunk[:split], chunk[split:]
+        if chunk:
+            yield chunk
+    if tail:
+        yield tail
@@ -5,14 +5,15 @@ Miscellaneous functions and classes that get used in various places
 import io
 import re
 import struct
-from functools import wraps
+from collections import UserList
+from functools   import wraps
 
 from .pdf_constants import WHITESPACE
 
 __all__ = [
     # Static functions
     'buffer_data', 'ensure_str', 'ensure_list', 'is_digit',
-    'read_until', 'force_decode', 'consume_whitespace',
+    'read_until', 'force_decode', 'consume_whitespace', 'get_numpy',
     # Decorators
     'classproperty',
     # Classes
@@ -29,6 +30,19 @@ def int_from_bytes(val):
         # Older Python, so pad it and unpack
         return struct.unpack('>L', b'\x00'*(4-len(val))+val)[0]
 
+_numpy = None
+def get_numpy():
+    """Return the numpy module, or None if it isn't installed.  It's optional
+    and slow to import, so we only import it when it's first needed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
 def _is_buffered_bytesio(data):
     """Check if the argument is a buffered bytes io object"""
     if   not isinstance(data, io.BufferedIOBase):              return False
@@ -140,8 +154,9 @@ def ensure_str(val):
     else:
         raise ValueError('Expected bytes or string')
 def ensure_list(val):
-    """Converts the argument to a list, wrapping in [] if needed"""
-    return val if isinstance(val, list) else [val]
+    """Converts the argument to a list, wrapping in [] if needed.  List-like
+    objects (e.g., PdfArrays) are left as they are."""
+    return val if isinstance(val, (list, UserList)) else [val]
 
 #def iterbytes(bstring):
 #    """Turn a bytes object into a generator that yields bytes instead of ints"""
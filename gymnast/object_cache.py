@@ -0,0 +1,156 @@
+"""
+Bounded cache of a document's parsed indirect objects
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from itertools   import chain
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections     import MutableMapping
+
+from .pdf_types import PdfDict, PdfArray, PdfStream
+
+__all__ = ['ObjectCache']
+
+class ObjectCache(MutableMapping):
+    """Dict-like cache of PdfIndirectObjects keyed by (object number,
+    generation).  If given an entry or byte budget, the least recently used
+    objects are dropped to stay under it; they can always be parsed again
+    from the file.
+
+    Pinned objects are kept regardless and don't count against the budget.
+    Anything whose /Type is in pin_types (by default the catalog, page tree
+    nodes, and fonts) is pinned automatically.
+
+    The cache is safe to use from multiple threads."""
+    PIN_TYPES = frozenset(('Catalog', 'Pages', 'Font'))
+
+    def __init__(self, max_entries=None, max_bytes=None, pin_types=PIN_TYPES):
+        """Create a new cache.
+
+        Arguments:
+            max_entries - Maximum number of unpinned objects (default None,
+                          i.e., no limit)
+            max_bytes   - Rough limit on the memory used by unpinned objects
+                          (default None)
+            pin_types   - Object types to pin automatically"""
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.pin_types   = frozenset(pin_types)
+        self._objects    = OrderedDict() # key: (object, size)
+        self._pinned     = {}
+        self._nbytes     = 0
+        self._lock       = threading.RLock()
+
+    @property
+    def nbytes(self):
+        """Estimated memory used by the unpinned objects"""
+        return self._nbytes
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                return self._pinned[key]
+            except KeyError:
+                pass
+            obj, size = self._objects[key]
+            self._objects.move_to_end(key)
+            if isinstance(obj.value, PdfStream):
+                # Streams grow when they get decoded
+                self._resize(key, obj, size)
+            return obj
+
+    def __setitem__(self, key, obj):
+        with self._lock:
+            if key in self._pinned or self._is_pinned_type(obj):
+                self.pin(key, obj)
+                return
+            self._discard(key)
+            self._objects[key] = (obj, 0)
+            self._resize(key, obj, 0)
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key in self._pinned:
+                del self._pinned[key]
+            elif key in self._objects:
+                self._discard(key)
+            else:
+                raise KeyError(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._pinned or key in self._objects
+    def __iter__(self):
+        with self._lock:
+            return chain(list(self._pinned), list(self._objects))
+    def __len__(self):
+        with self._lock:
+            return len(self._pinned) + len(self._objects)
+
+    def pin(self, key, obj=None):
+        """Keep the object with the specified key (adding it if obj is
+        given) in the cache until it's unpinned"""
+        with self._lock:
+            if obj is None:
+                obj = self[key]
+            self._discard(key)
+            self._pinned[key] = obj
+
+    def unpin(self, key):
+        """Return a pinned object to the normal eviction rules"""
+        with self._lock:
+            obj = self._pinned.pop(key)
+            self._objects[key] = (obj, 0)
+            self._resize(key, obj, 0)
+
+    def evict_all(self):
+        """Drop everything that isn't pinned"""
+        with self._lock:
+            self._objects.clear()
+            self._nbytes = 0
+
+    def _is_pinned_type(self, obj):
+        value = obj.value
+        return (isinstance(value, PdfDict)
+                and value.get('Type') in self.pin_types)
+
+    def _discard(self, key):
+        try:
+            self._nbytes -= self._objects.pop(key)[1]
+        except KeyError:
+            pass
+
+    def _resize(self, key, obj, old_size):
+        """Update the size of an entry and evict whatever we need to"""
+        size = self._sizeof(obj.value)
+        self._objects[key] = (obj, size)
+        self._nbytes += size - old_size
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used objects until we're within budget"""
+        objects = self._objects
+        while objects and (
+                (self.max_entries is not None
+                 and len(objects) > self.max_entries)
+                or (self.max_bytes is not None
+                    and self._nbytes > self.max_bytes)):
+            self._nbytes -= objects.popitem(last=False)[1][1]
+
+    @staticmethod
+    def _sizeof(value):
+        """Rough estimate of the memory used by a parsed object.  Containers
+        only go one level deep, which is plenty for a cache budget."""
+        size = sys.getsizeof(value)
+        if isinstance(value, PdfStream):
+            size += value.nbytes + ObjectCache._sizeof(value.header)
+        elif isinstance(value, PdfDict):
+            size += sum(sys.getsizeof(k) + sys.getsizeof(v)
+                        for k, v in value.data.items())
+        elif isinstance(value, PdfArray):
+            size += sum(sys.getsizeof(v) for v in value.data)
+        return size
@@ -0,0 +1,64 @@
+"""
+Compressed object streams - Reference pp. 100-105
+"""
+
+from array import array
+
+from .exc        import PdfError, PdfParseError
+from .pdf_lexer  import PdfLexer
+from .pdf_parser import PdfParser
+from .pdf_types  import PdfIndirectObject, PdfStream
+
+__all__ = ['ObjectStream']
+
+class ObjectStream(object):
+    """A decoded object stream (/Type /ObjStm).  The stream data starts with
+    N pairs of integers, the object number and offset (relative to /First)
+    of each object in the stream, followed by the objects themselves.  The
+    objects are only parsed when asked for."""
+    def __init__(self, stream, document):
+        """Decode stream, the PdfStream of an object stream in document"""
+        if not isinstance(stream, PdfStream):
+            raise PdfError('Object stream expected, got {}'\
+                           .format(type(stream).__name__))
+        header = stream.header
+        if header.get('Type') != 'ObjStm':
+            raise PdfError('Type "ObjStm" expected, got "{}"'\
+                           .format(header.get('Type')))
+        self._document = document
+        self._parser   = PdfParser(document)
+        self._data     = stream.decode(cache=False)
+        self._first    = header['First']
+        nobjs          = header['N']
+        try:
+            pairs = array('q', map(int, self._data[:self._first].split()))
+        except ValueError:
+            raise PdfParseError('Invalid object stream header')
+        if len(pairs) < 2*nobjs:
+            raise PdfParseError('Object stream header is too short')
+        self._obj_nos = pairs[0:2*nobjs:2]
+        self._offsets = pairs[1:2*nobjs:2]
+
+    def __len__(self):
+        return len(self._obj_nos)
+
+    @property
+    def nbytes(self):
+        """Size of the decoded stream data"""
+        return len(self._data)
+
+    def get_object(self, index, obj_no=None):
+        """Parse the index-th object in the stream and return it as a
+        PdfIndirectObject.  If obj_no is specified and it isn't the index-th
+        object, we go looking for it instead."""
+        if obj_no is not None and (index >= len(self._obj_nos)
+                                   or self._obj_nos[index] != obj_no):
+            try:
+                index = self._obj_nos.index(obj_no)
+            except ValueError:
+                raise PdfError('Object {} not found in object stream'\
+                               .format(obj_no))
+        lexer = PdfLexer(self._data, self._first + self._offsets[index])
+        obj   = self._parser.parse_simple_object(lexer)
+        # Objects in object streams always have generation 0
+        return PdfIndirectObject(self._obj_nos[index], 0, obj, self._document)
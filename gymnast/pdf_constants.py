@@ -1,16 +1,76 @@
 """
 Constants needed mostly for PDF character encoding
+
+The encoding tables and glyph list are fairly big, so they're only loaded
+from the data files the first time they're used.
 """
 
 import binascii
 import os
-from bidict import bidict
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections     import Mapping
 
-__all__  = ['EOLS', 'WHITESPACE', 'BASE_ENCODINGS', 'GLYPH_LIST']
+__all__  = ['EOLS', 'WHITESPACE', 'DELIMITERS', 'ENCODING_NAMES',
+            'BASE_ENCODINGS', 'GLYPH_LIST']
 DATA_DIR = os.path.dirname(os.path.abspath(__file__))+'/data/'
 
 EOLS       = frozenset((b'\r', b'\n', b'\r\n'))
 WHITESPACE = frozenset((b' ', b'\t', b'\r', b'\n', b'\f', b'\x00'))
+DELIMITERS = frozenset((b'/', b'<', b'(', b'{', b'[', b'%'))
+
+# The base encodings in pdf_encodings.txt, in column order
+ENCODING_NAMES = ('StandardEncoding', 'MacRomanEncoding',
+                  'WinAnsiEncoding', 'PDFDocEncoding')
+
+class LazyMapping(Mapping):
+    """Read-only mapping whose contents come from calling loader the first
+    time they're needed"""
+    def __init__(self, loader):
+        self._loader = loader
+        self._data   = None
+
+    @property
+    def data(self):
+        """The loaded dict"""
+        if self._data is None:
+            # Racing threads will just both load it
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+    def __iter__(self):
+        return iter(self.data)
+    def __len__(self):
+        return len(self.data)
+    def __contains__(self, key):
+        return key in self.data
+
+class GlyphList(LazyMapping):
+    """The Adobe Glyph List, mapping glyph names to unicode characters.
+    Several names can map to the same character, e.g., 'forall' and
+    'universal', in which case the reverse lookup (inv) gives the first."""
+    def __init__(self, loader):
+        super(GlyphList, self).__init__(loader)
+        self._inv = None
+
+    @property
+    def inv(self):
+        """Mapping of characters back to glyph names"""
+        if self._inv is None:
+            inv = {}
+            for name, char in self.data.items():
+                inv.setdefault(char, name)
+            self._inv = inv
+        return self._inv
+
+    def __getitem__(self, key):
+        # GLYPH_LIST[:char] does a reverse lookup, as with a bidict
+        if isinstance(key, slice):
+            return self.inv[key.stop]
+        return self.data[key]
 
 def octal_to_int(oct_str):
     """Convert an octal string to an int, respecting None"""
@@ -20,11 +80,10 @@ def get_base_encodings():
     """Load the base PDF encoding schemes and parse it into a nice dict."""
     with open(DATA_DIR+'/pdf_encodings.txt') as f:
         lines = [l.split(';') for l in f.read().splitlines() if l[0] != '#']
-    encodings = ('StandardEncoding', 'MacRomanEncoding',
-                 'WinAnsiEncoding', 'PDFDocEncoding')
-    return {l[0]:dict(zip(encodings,map(octal_to_int, l[1:]))) for l in lines}
+    return {l[0]:dict(zip(ENCODING_NAMES, map(octal_to_int, l[1:])))
+            for l in lines}
 
-BASE_ENCODINGS = get_base_encodings()
+BASE_ENCODINGS = LazyMapping(get_base_encodings)
 
 def decode_hex(hex_str):
     """Convert a hex string to bytes and treat as a utf-16-be string"""
@@ -32,13 +91,13 @@ def decode_hex(hex_str):
                      for i in hex_str.split()]).decode('utf-16-be')
 
 def get_glyph_list():
-    """Load the Adobe Glyph list into a bidict.
+    """Load the Adobe Glyph list into a dict.
     https://partners.adobe.com/public/developer/en/opentype/glyphlist.txt"""
 
     with open(DATA_DIR + 'glyphlist.txt') as f:
         lines = [l.split(';') for l in f.read().splitlines() if l[0] != '#']
-    # Dedupe, because Adobe
-    glyph_set = {l[0] for l in lines}
-    return bidict({l[0]: decode_hex(l[1]) for l in lines if l[0] not in glyph_set})
+    # Dicts keep their order, so the first of the names for a character is
+    # still the first one in GLYPH_LIST.inv
+    return {name: decode_hex(code) for name, code in lines}
 
-GLYPH_LIST = get_glyph_list()
+GLYPH_LIST = GlyphList(get_glyph_list)
@@ -2,37 +2,108 @@
 The main PDF Document class
 """
 
+import mmap
+import six
+import threading
+from collections import OrderedDict
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections     import Sequence
+
 from .exc           import PdfError, PdfParseError
-from .misc          import buffer_data, read_until, force_decode, \
-                           consume_whitespace, is_digit, ReCacher, \
-                           int_from_bytes
+from .misc          import read_until, force_decode, consume_whitespace, \
+                           is_digit, ReCacher
 from .pdf_constants import EOLS
+from .object_cache  import ObjectCache
+from .object_stream import ObjectStream
+from .pdf_lexer     import PdfLexer
 from .pdf_parser    import PdfParser
-from .pdf_types     import PdfHeader, PdfXref, PdfObjectReference, PdfDict
+from .pdf_types     import PdfHeader, PdfObjectReference, PdfDict
+from .pdf_elements  import PdfPageNode
+from .xref_index    import XrefIndex
 
 __all__ = ['PdfDocument']
 
 class PdfDocument(object):
     """The main PDF Document class"""
-    _opened_file = False
+    # Number of decoded object streams to keep around
+    OBJSTM_CACHE_SIZE = 8
 
-    def __init__(self, data):
-        """Initialize a new PdfDocument based on data.
+    def __init__(self, data, max_cached_objects=None, max_cached_bytes=None):
+        """Initialize a new PdfDocument based on data.  Files are memory
+        mapped rather than read in, so nothing gets copied until it's needed.
 
         Arguments:
-            data - Either a binary string or a binary, readable stream
-                   (e.g, BytesIO or a binary mode file)"""
-        if isinstance(data, str):
-            data = open(data, 'rb')
-            self._opened_file = True
-        self._data = buffer_data(data)
+            data               - Either a file name, a binary string, an
+                                 mmap, or a binary, readable stream (e.g,
+                                 BytesIO or a binary mode file)
+            max_cached_objects - Optional limit on the number of parsed
+                                 objects to keep in memory
+            max_cached_bytes   - Optional limit on the (estimated) memory
+                                 used by parsed objects
+
+        Objects dropped from the cache are reparsed if they're needed again.
+        The catalog, page tree nodes, and fonts are always kept (see
+        ObjectCache)."""
+        self._filename = data if isinstance(data, str) else None
+        self._buffer, self._owns_buffer = self._map_data(data)
+        self._data = PdfLexer.wrap(self._buffer)
+        self._closed = False
         self._parser = PdfParser(self)
         # These get used in parse()
         self._pages       = None
         self._version     = None
-        self._ind_objects = {}
+        self._ind_objects = ObjectCache(max_cached_objects, max_cached_bytes)
         self._xrefs       = None
-        self._page_index  = None
+        self._page_index  = {} # unique_id: index
+        self._elements    = {} # object key: shared element
+        self._objstms     = OrderedDict()
+        self._objstm_lock = threading.Lock()
+
+    @staticmethod
+    def _map_data(data):
+        """Get a buffer of data, memory mapping it if it's a file.  Returns
+        the buffer and whether we're responsible for closing it."""
+        if isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            return data, False
+        if isinstance(data, str):
+            with open(data, 'rb') as f:
+                return PdfDocument._map_data(f)
+        try:
+            # The mapping holds its own reference to the file, so it doesn't
+            # matter if f gets closed out from under us
+            return mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ), True
+        except (AttributeError, OSError, ValueError):
+            # Not a real file (e.g., BytesIO) or an empty one, which can't be
+            # mapped.  Let the lexer deal with it.
+            return data, False
+
+    def close(self):
+        """Release the underlying file mapping, if we made one.  Objects
+        already parsed out of the document remain usable, streams included.
+        Objects that haven't been parsed yet can't be read once the mapping is
+        gone, so getting them raises a PdfError."""
+        self._data.close()
+        if self._owns_buffer:
+            try:
+                self._buffer.close()
+                self._closed = True
+            except BufferError:
+                # Stream objects still hold views into the map, so leave it
+                # for the garbage collector to clean up after them.
+                pass
+            self._owns_buffer = False
+
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    def __del__(self):
+        try:
+            self.close()
+        except AttributeError:
+            pass
 
     def parse(self):
         """Parse the data into a workable PDF document"""
@@ -66,43 +137,81 @@ class PdfDocument(object):
             self._id = None
 
     def parse_object(self, offset):
-        """Parse the indirecte object located at the specified offset and add
-        it to the documents objects dict, returning the stream position to its
-        initial location"""
-        pos = self._data.tell()
-        obj = self._parser.parse_indirect_object(self._data, offset)
+        """Parse the indirecte object located at the specified offset, add it
+        to the documents objects dict, and return it.  The parsing gets its
+        own cursor into the data rather than moving the document's, so it's
+        safe to do from several threads at once."""
+        if self._closed:
+            raise PdfError('Document is closed')
+        lexer = PdfLexer(self._data.buffer, offset)
+        obj   = self._parser.parse_indirect_object(lexer)
         self.indirect_objects[obj.object_key] = obj
-        self._data.seek(pos)
+        return obj
 
-    def __del__(self):
-        """Cleanup on deletion"""
-        if self._opened_file:
-            self._data.close()
+    def parse_stream_object(self, stream_no, index, obj_no=None):
+        """Parse the index-th object in the object stream with object number
+        stream_no (see parse_object)"""
+        obj = self.get_object_stream(stream_no).get_object(index, obj_no)
+        self.indirect_objects[obj.object_key] = obj
+        return obj
+
+    def get_object_stream(self, stream_no):
+        """The decoded ObjectStream with object number stream_no.  The most
+        recently used ones are kept, so that we aren't constantly
+        re-decompressing them but also don't keep all of them around."""
+        with self._objstm_lock:
+            objstm = self._objstms.pop(stream_no, None)
+        if objstm is None:
+            # Decode outside of the lock.  zlib releases the GIL, so other
+            # threads can get on with things in the meantime.
+            objstm = ObjectStream(self.get_object(stream_no, 0).value, self)
+        with self._objstm_lock:
+            self._objstms[stream_no] = objstm
+            while len(self._objstms) > self.OBJSTM_CACHE_SIZE:
+                self._objstms.popitem(last=False)
+        return objstm
 
     def _get_structure(self, startxref=None):
         """Build the basic document structure.  Xrefs and trailers can come in
         two forms: either as literals in the file or as stream objects.  When
         presented as objects, the stream header also acts as the trailer, and
         the stream data is a set of xref records.  As far as I can tell, there
-        is no rule against mixing and matching."""
+        is no rule against mixing and matching.
+
+        Sections are read from the last update back through the Prev links,
+        with newer entries and trailer keys taking precedence over older."""
 
         if not startxref:
             startxref = self._get_startxref(self._data)
+        xrefs   = XrefIndex(self)
+        trailer = PdfDict()
+        visited = set()
+        while startxref is not None and startxref not in visited:
+            visited.add(startxref)
+            new_trailer = self._get_xref_section(startxref, xrefs)
+            for key, val in six.iteritems(new_trailer):
+                trailer.setdefault(key, val)
+            startxref = new_trailer.get('Prev')
+        return xrefs, trailer
 
-        self._data.seek(startxref)
+    def _get_xref_section(self, offset, xrefs):
+        """Add the entries from the xref section at offset to xrefs and
+        return the section's trailer"""
+        self._data.seek(offset)
         if self._data.read(1).isdigit():
-            xrefs, trailer = self._get_xref_stream(startxref)
-        else:
-            xrefs   = self._get_xref_table(startxref)
-            trailer = self._get_trailer()
+            return self._get_xref_stream(offset, xrefs)
+        section = XrefIndex(self)
+        self._get_xref_table(offset, section)
+        trailer = self._get_trailer()
+        # Hybrid files keep the entries for compressed objects in a separate
+        # stream (p. 109).  Those are the ones that newer readers should use,
+        # so they go in ahead of the table's.
         try:
-            new_xrefs, new_trailer = self._get_structure(trailer['Prev'])
+            self._get_xref_stream(trailer['XRefStm'], xrefs)
         except KeyError:
             pass
-        else:
-            xrefs.update(new_xrefs)
-            trailer.update(new_trailer)
-        return xrefs, trailer
+        xrefs.merge(section)
+        return trailer
 
     @staticmethod
     def _get_header(data):
@@ -151,7 +260,7 @@ class PdfDocument(object):
             raise PdfParseError('startxref not found')
         return int(lines[1])
 
-    def _get_xref_table(self, offset):
+    def _get_xref_table(self, offset, xrefs):
         """Get the data in an xref table located at the specified offset.
         These have a very specific format described on pp. 93-97 of the
         Adobe PDF Reference. Here's the short version:
@@ -166,8 +275,7 @@ class PdfDocument(object):
         0000001000 00007 n\\r\\n, that means that object (obj_0+i, 00007) is
         located at offset 1000 into the file and that it is in use.
 
-        Returns a dict with keys (objno, generation) and PdfXref objects as
-        values."""
+        The entries are added to the XrefIndex xrefs."""
 
         data = self._data
         data.seek(offset)
@@ -176,64 +284,43 @@ class PdfDocument(object):
             msg = "Expected 'xref', found '{}'."
             raise PdfParseError(msg.format(force_decode(token)))
         consume_whitespace(data, EOLS)
-        xrefs = {}
         while is_digit(data.peek(1)[0]):
-            xrefs.update(self._get_xref_subsection())
-        return xrefs
+            self._get_xref_subsection(xrefs)
 
-    def _get_xref_stream(self, offset):
+    def _get_xref_stream(self, offset, xrefs):
         """Extract Xrefs from a cross reference stream located at the specified
-        offset.  See pp. 106 - 109."""
+        offset into xrefs and return the stream header.  See pp. 106 - 109."""
         obj = self._parser.parse_indirect_object(self._data, offset)
-        return self.parse_xref_obj(obj)
+        return self.parse_xref_obj(obj, xrefs)[1]
 
-    def parse_xref_obj(self, obj):
+    def parse_xref_obj(self, obj, xrefs=None):
+        """Parse the xref stream in the indirect object obj into xrefs (a new
+        XrefIndex if not specified).  Returns xrefs and the stream header."""
         stream = obj.value
         header = stream.header
         if header['Type'] != 'XRef':
             raise PdfError('Type "XRef" expected, got "{}"'.format(header['Type']))
-        id0 = header.get('Index', (0,))[0]
+        if xrefs is None:
+            xrefs = XrefIndex(self, header['Size'])
+        # Pairs of (first object number, number of objects)
+        index = header.get('Index', [0, header['Size']])
         # Field widths.  Because of PDF's affinity for micro-optimation via
         # default values, the first first may be skipped, in which case
-        widths = header['W']
+        widths = list(header['W'])
         if len(widths) == 2:
             widths.insert(0, 0)
-        recsize = sum(widths)
-        data = stream.data
-        # Divide, parse, and dictify
-        recs = [(id0 + i, data[i*recsize:(i+1)*recsize])
-                for i in range(header['Size'])]
-        xrefs = (self._parse_xrefstrm_rec(r[0], r[1], widths) for r in recs)
-        xrefs = {(x['object_id'], x['generation']): x for x in xrefs}
+        xrefs.add_stream(stream.data, widths, index)
         return xrefs, header
 
-    def _parse_xrefstrm_rec(self, obj_id, data, widths):
-        if widths[0] == 0:
-            rec_type = 1
-        else:
-            rec_type = int_from_bytes(data[:widths[0]])
-        val_2 = data[widths[0]:widths[1]]
-        val_3 = data[widths[1]:] # Type and obj_no are 1 and 2
-        if rec_type == 0:
-            return PdfXref(self, obj_id, val_2, val_3, False)
-        if rec_type == 1:
-            return PdfXref(self, obj_id, val_2, val_3 if widths[2] else 0, True)
-        if rec_type == 2:
-            #TODO
-            raise NotImplementedError('Object streams not yet implemented')
-
-    def _get_xref_subsection(self):
-        """Exctract an Xref subsection from data.  This method assumes data's
-        stream position to already be at the start of the subsection and leaves
-        it at the start of the next line. Returns a dict with keys
-        (objno, generation) and PdfXref objects as values."""
+    def _get_xref_subsection(self, xrefs):
+        """Exctract an Xref subsection from data into xrefs.  This method
+        assumes data's stream position to already be at the start of the
+        subsection and leaves it at the start of the next line."""
         header = read_until(self._data, EOLS)
         id0, nlines = map(int, header.split())
         consume_whitespace(self._data, EOLS)
-        lines = self._data.read(20*nlines).decode().splitlines()
+        xrefs.add_table(id0, self._data.read(20*nlines))
         consume_whitespace(self._data, EOLS)
-        return {x.key: x for x in (PdfXref.from_line(self, id0+i, l)
-                                   for i, l in enumerate(lines))}
 
     def _get_trailer(self):
         """Gets a document trailer located at the current stream position.
@@ -267,25 +354,85 @@ class PdfDocument(object):
 
     @property
     def Pages(self):
-        """Flattened list of pages"""
+        """Sequence of the document's pages.  Pages are only looked up when
+        they're asked for (see page())."""
         if self._pages is None:
-            self._pages = self._build_page_list(self.Root.Pages)
+            self._pages = PdfPageList(self)
         return self._pages
 
+    @property
+    def page_count(self):
+        """Number of pages in the document, straight from the page tree"""
+        return self.Root.Pages.Count
+
+    def page(self, index):
+        """Get the page with the specified (zero-based) index.  Only the page
+        tree nodes on the path down to it get parsed."""
+        count = self.page_count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('Page index out of range')
+        page = self.Root.Pages.get_page(index)
+        self._page_index[page.unique_id] = index
+        return page
+
+    def iter_pages(self):
+        """Generator over the document's pages, in order"""
+        for index, page in enumerate(self.Root.Pages.iter_pages()):
+            self._page_index[page.unique_id] = index
+            yield page
+
+    def extract_pages(self, indices=None, renderer=None, workers=None,
+                      **renderer_kwargs):
+        """Render the pages with the specified indices (default all) in
+        parallel worker processes, returning the results in order.  See
+        gymnast.batch.extract_pages for details."""
+        from .batch    import extract_pages
+        from .renderer import PdfTextRenderer
+        return extract_pages(self, indices, renderer or PdfTextRenderer,
+                             workers, **renderer_kwargs)
+
     def get_page_index(self, page):
-        """Retrieve the index into self.Pages for the given page"""
-        if self._page_index is None:
-            self._page_index = dict(enumerate(p.unique_id for p in self.Pages))
-        return self._page_index.get(page.unique_id)
-
-    @classmethod
-    def _build_page_list(cls, page):
-        """Build the list of page objects by recursively descending the page
-        node tree"""
+        """Retrieve the index into self.Pages for the given page, or None if
+        it isn't in the page tree.  Pages we've already come across are
+        looked up directly.  Otherwise, we walk up the tree from the page,
+        counting the pages in the kids ahead of it at each level."""
         try:
-            return sum((cls._build_page_list(p) for p in page.Kids), [])
-        except AttributeError:
-            return [page]
+            return self._page_index[page.unique_id]
+        except KeyError:
+            pass
+        index  = 0
+        key    = page.object_key
+        parent = page.get('Parent')
+        while parent is not None:
+            node = parent.value
+            for kid in node['Kids'].value:
+                if getattr(kid, 'object_key', None) == key:
+                    break
+                index += PdfPageNode.kid_count(kid.value)
+            else:
+                return None
+            key    = parent.object_key
+            parent = node.get('Parent')
+        self._page_index[page.unique_id] = index
+        return index
+
+    @property
+    def filename(self):
+        """Name of the file the document was opened from, if any"""
+        return self._filename
+    @property
+    def xrefs(self):
+        """The document's XrefIndex"""
+        return self._xrefs
+
+    def adopt_xrefs(self, xrefs):
+        """Use an XrefIndex built elsewhere (e.g., by another process that
+        parsed the same file) instead of parsing our own.  The document can
+        then look up objects but has no trailer information."""
+        xrefs.attach(self)
+        self._xrefs = xrefs
 
     @property
     def indirect_objects(self):
@@ -298,6 +445,63 @@ class PdfDocument(object):
         except KeyError:
             raise PdfError('No object exists with that number and generation')
 
+    def get_element(self, obj, element_type=None):
+        """Get the PdfElement for obj, which is usually an indirect reference.
+        Elements for indirect objects are built once and then shared by
+        everything in the document that refers to them, e.g., the fonts and
+        resource dicts used on thousands of pages.  Unlike the objects
+        themselves, they're never evicted.
+
+        Arguments:
+            obj          - PdfObjectReference, PdfIndirectObject, or direct
+                           object
+            element_type - PdfElement subclass to use (default whatever
+                           obj.parsed_object would give)"""
+        key = getattr(obj, 'object_key', None)
+        if key is not None:
+            try:
+                return self._elements[key]
+            except KeyError:
+                pass
+        if element_type is None:
+            element = obj.parsed_object
+        else:
+            element = element_type.from_object(obj, key, self)
+        if key is not None:
+            # Another thread may have beaten us to it
+            element = self._elements.setdefault(key, element)
+        return element
+
+class PdfPageList(Sequence):
+    """Read-only, list-like view of a document's pages.  Indexing goes
+    through PdfDocument.page() and iterating through iter_pages(), so nothing
+    is parsed before it's needed."""
+    def __init__(self, document):
+        self._document = document
+    def __len__(self):
+        return self._document.page_count
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._document.page(i)
+                    for i in range(*key.indices(len(self)))]
+        return self._document.page(key)
+    def __iter__(self):
+        return self._document.iter_pages()
+    def __contains__(self, page):
+        try:
+            self.index(page)
+        except ValueError:
+            return False
+        return True
+    def index(self, page):
+        """Index of page, via PdfDocument.get_page_index()"""
+        index = None
+        if getattr(page, 'document', None) is self._document:
+            index = self._document.get_page_index(page)
+        if index is None:
+            raise ValueError('Page is not in the document')
+        return index
+
 class PdfElementList(object):
     """List-like object that auto-deferences its PDF object elements"""
     def __init__(self, *args, **kwargs):
@@ -4,7 +4,8 @@ PDF Fonts
 from .base_font import PdfBaseFont, FontDescriptor, FontEncoding
 from .type1     import Type1Font
 from .true_type import TrueTypeFont
+from .type0     import Type0Font, CIDFont
 from .pdf_font  import PdfFont
 
 __all__ = ['PdfBaseFont', 'FontDescriptor', 'FontEncoding', 'PdfFont',
-           'Type1Font', 'TrueTypeFont']
+           'Type1Font', 'TrueTypeFont', 'Type0Font', 'CIDFont']
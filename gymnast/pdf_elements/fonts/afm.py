@@ -0,0 +1,120 @@
+"""
+Adobe Font Metrics (AFM) files and the precompiled metrics for the standard
+14 fonts.  The AFM files in data/afm are only read by this module, which is
+run as a script to regenerate std14_metrics.py and std14_kerning.py:
+
+    python -m gymnast.pdf_elements.fonts.afm
+"""
+
+import os
+from pprint import pformat
+
+from ...pdf_constants import DATA_DIR
+
+AFM_DIR = DATA_DIR + 'afm/'
+OUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Global font information to keep, and whether each is numeric
+GLOBAL_KEYS = (('FontName',     False),
+               ('FamilyName',   False),
+               ('Weight',       False),
+               ('CharacterSet', False),
+               ('ItalicAngle',  True),
+               ('Ascender',     True),
+               ('Descender',    True),
+               ('CapHeight',    True),
+               ('XHeight',      True),
+               ('StdHW',        True),
+               ('StdVW',        True))
+
+METRICS_HEADER = '''"""
+Metrics for the standard 14 fonts, compiled from the AFM files in data/afm.
+Generated by gymnast.pdf_elements.fonts.afm - do not edit.
+
+FONTS maps each font name to a dict of its global metrics plus Chars, a string
+of whitespace separated (character code, glyph name, width) triples in the
+font's built-in encoding (code -1 for unencoded glyphs).  It's only split up
+when the font is first used (see type1.get_std_metrics).
+"""
+
+'''
+
+KERNING_HEADER = '''"""
+Kerning pairs for the standard 14 fonts, compiled from the AFM files in
+data/afm.  Generated by gymnast.pdf_elements.fonts.afm - do not edit.
+
+KERN_PAIRS maps font names to a string of whitespace separated (left glyph,
+right glyph, adjustment) triples (see type1.get_std_kerning).
+"""
+
+'''
+
+def to_number(val):
+    """Convert an AFM number to an int if we can or a float if we must,
+    respecting Nones"""
+    if val is None:
+        return None
+    val = float(val)
+    return int(val) if val.is_integer() else val
+
+def load_afm_file(fname):
+    """Load an Adobe Font Metrics file.  This is somewhat crude, but sufficient
+    for these purposes.  Returns a dict of the global keys' values, with the
+    lines of any sections under their names (e.g., 'CharMetrics')."""
+    DO_NOTHINGS =  {'EndFontMetrics', 'StartFontMetrics',
+                    'EndKernData', 'StartKernData'}
+    SECTIONS = {'StartCharMetrics', 'StartKernPairs', 'StartTrackKern'}
+    with open(fname) as f:
+        lines =  [l for l in f.read().splitlines()
+                  if l.strip() and l[:8] != 'Comment '][::-1]
+    data = {}
+    while lines:
+        line = lines.pop().split()
+        if   line[0] in DO_NOTHINGS or line[0][:3] == 'End':
+            continue
+        elif line[0] in SECTIONS:
+            data[line[0][5:]] = lines[-int(line[1]):][::-1]
+            del lines[-int(line[1]):]
+        else:
+            data[line[0]] = ' '.join(line[1:])
+    return data
+
+def compile_font(fname):
+    """Parse an AFM file into the font's entry in FONTS and its kerning pairs
+    string"""
+    parsed  = load_afm_file(fname)
+    metrics = {key: to_number(parsed.get(key)) if numeric else parsed.get(key)
+               for key, numeric in GLOBAL_KEYS}
+    metrics['IsFixedPitch'] = (parsed.get('IsFixedPitch') == 'true')
+    metrics['FontBBox'] = tuple(to_number(i)
+                                for i in parsed['FontBBox'].split())
+    chars = []
+    for line in parsed['CharMetrics']:
+        fields = dict(i.split(None, 1) for i in line.split(';') if i.strip())
+        chars.append('{} {} {}'.format(int(fields['C']), fields['N'].strip(),
+                                       to_number(fields['WX'])))
+    metrics['Chars'] = ' '.join(chars)
+    kern_pairs = ' '.join(' '.join(line.split()[1:])
+                          for line in parsed.get('KernPairs', [])
+                          if line.startswith('KPX '))
+    return metrics, kern_pairs
+
+def write_metrics(out_dir=OUT_DIR, afm_dir=AFM_DIR):
+    """Compile all of the AFM files in afm_dir into the std14_metrics and
+    std14_kerning modules in out_dir"""
+    fonts, kerning = {}, {}
+    for fname in sorted(os.listdir(afm_dir)):
+        if fname.endswith('.afm'):
+            metrics, kern_pairs = compile_font(os.path.join(afm_dir, fname))
+            fonts[metrics['FontName']] = metrics
+            if kern_pairs:
+                kerning[metrics['FontName']] = kern_pairs
+    with open(os.path.join(out_dir, 'std14_metrics.py'), 'w') as f:
+        f.write(METRICS_HEADER)
+        f.write('FONTS = ' + pformat(fonts, width=79) + '\n')
+    with open(os.path.join(out_dir, 'std14_kerning.py'), 'w') as f:
+        f.write(KERNING_HEADER)
+        f.write('KERN_PAIRS = ' + pformat(kerning, width=79) + '\n')
+
+if __name__ == '__main__':
+    write_metrics()
@@ -2,16 +2,37 @@
 Font objects
 """
 
+import codecs
 import six
-import struct
-from bidict    import collapsingbidict
 
 from ..pdf_element    import PdfElement
-from ...pdf_constants import BASE_ENCODINGS, GLYPH_LIST
+from ...pdf_constants import BASE_ENCODINGS, ENCODING_NAMES, GLYPH_LIST
 from ...pdf_matrix    import PdfMatrix
-from ...pdf_types     import PdfLiteralString, PdfDict, PdfNull, PdfName
+from ...pdf_types     import PdfLiteralString, PdfDict, PdfNull, PdfName, \
+                             PdfString
 from ...exc           import PdfError
 
+def glyph_to_unicode(name):
+    """Unicode text for a glyph name, using the Adobe Glyph List and the
+    uniXXXX and uXXXX[XX] naming conventions.  Returns None if the name
+    isn't recognized."""
+    try:
+        return GLYPH_LIST[name]
+    except KeyError:
+        pass
+    base = name.split('.', 1)[0] # Variants like A.swash
+    if base != name and base in GLYPH_LIST:
+        return GLYPH_LIST[base]
+    try:
+        if base[:3] == 'uni' and len(base) >= 7 and (len(base) - 3) % 4 == 0:
+            return ''.join(chr(int(base[i:i+4], 16))
+                           for i in range(3, len(base), 4))
+        if base[:1] == 'u' and 5 <= len(base) <= 7:
+            return chr(int(base[1:], 16))
+    except ValueError:
+        pass
+    return None
+
 class PdfBaseFont(PdfElement):
     """Base PDF Font.  Right now this is exclusively Type 1."""
 
@@ -20,6 +41,12 @@ class PdfBaseFont(PdfElement):
         self._encoding  = None
         self._codec     = None
         self._avg_width = None
+        self._widths    = None
+        self._fdesc     = None
+        self._to_unicode    = False
+        self._width_table   = None
+        self._unicode_table = None
+        self._charmap       = False
 
     def text_space_coords(self, x, y):
         """Convert a vector in glyph space to text space"""
@@ -32,22 +59,141 @@ class PdfBaseFont(PdfElement):
         if self._encoding:
             return self._encoding
         try:
-            obj = self._object['Encoding'].parsed_object
+            obj = self._object['Encoding']
         except KeyError:
-            self._encoding = FontEncoding(PdfDict({}))
+            self._encoding = FontEncoding.from_name('StandardEncoding')
         else:
-            if isinstance(obj, FontEncoding):
-                self._encoding = obj
+            if isinstance(obj.value, PdfDict):
+                self._encoding = self._get_element(obj, FontEncoding)
             else:
-                self._encoding = FontEncoding.from_name(obj)
+                self._encoding = FontEncoding.from_name(obj.value)
         return self._encoding
     @property
+    def Widths(self):
+        """The font's Widths array"""
+        if self._widths is None:
+            try:
+                self._widths = self._object['Widths'].value
+            except KeyError:
+                raise AttributeError('Object has no attribute "Widths"')
+        return self._widths
+    @property
+    def FontDescriptor(self):
+        """The font's parsed FontDescriptor"""
+        if self._fdesc is None:
+            try:
+                obj = self._object['FontDescriptor']
+            except KeyError:
+                raise AttributeError('Object has no attribute "FontDescriptor"')
+            self._fdesc = self._get_element(obj, FontDescriptor)
+        return self._fdesc
+    @property
+    def ToUnicode(self):
+        """The font's compiled ToUnicode CMap, or None if it doesn't have
+        one"""
+        if self._to_unicode is False: # We need None
+            from .cmap import get_cmap
+            try:
+                obj = self._object['ToUnicode']
+            except KeyError:
+                self._to_unicode = None
+            else:
+                try:
+                    self._to_unicode = get_cmap(obj)
+                except PdfError:
+                    # A broken CMap is no worse than a missing one
+                    self._to_unicode = None
+        return self._to_unicode
+    @property
     def codec(self):
         """codecs.Codec object based on the font's Endcoding"""
         if not self._codec:
             self._codec = self._get_codec()
         return self._codec
 
+    def string_codes(self, string):
+        """The character codes in a string from a content stream, as bytes.
+        Plain str objects are treated as Latin-1."""
+        if isinstance(string, PdfString):
+            return bytes(string)
+        if isinstance(string, (bytes, bytearray)):
+            return bytes(string)
+        return string.encode('latin-1', 'replace')
+
+    @property
+    def width_table(self):
+        """Tuple of the glyph space widths of all 256 character codes"""
+        if self._width_table is None:
+            missing = self._missing_width()
+            table   = [missing]*256
+            try:
+                first, widths = self.FirstChar, self.Widths
+            except AttributeError:
+                first, widths = 0, ()
+            for code, width in enumerate(widths, first):
+                if 0 <= code < 256:
+                    table[code] = float(width)
+            self._width_table = tuple(table)
+        return self._width_table
+
+    @property
+    def unicode_table(self):
+        """str.translate table mapping each character code to its unicode
+        text.  The ToUnicode CMap takes precedence over the Encoding."""
+        if self._unicode_table is None:
+            cmap = self.ToUnicode
+            if cmap is not None and 1 not in cmap.code_lengths:
+                cmap = None
+            table = {}
+            for code in range(256):
+                text = cmap.get(code) if cmap is not None else None
+                if text is None:
+                    try:
+                        text = glyph_to_unicode(self.get_glyph_name(code))
+                    except KeyError:
+                        pass
+                table[code] = text if text is not None else chr(code)
+            self._unicode_table = table
+        return self._unicode_table
+
+    @property
+    def charmap(self):
+        """unicode_table as a 256 character decoding table for
+        codecs.charmap_decode(), or None if some code's text is more than one
+        character long (e.g., ligatures from a ToUnicode CMap)"""
+        if self._charmap is False:
+            table = self.unicode_table
+            if all(len(table[code]) == 1 and table[code] != '\ufffe'
+                   for code in range(256)):
+                self._charmap = ''.join(table[code] for code in range(256))
+            else:
+                self._charmap = None
+        return self._charmap
+
+    def code_counts(self, codes):
+        """Number of character codes in codes and how many of them are
+        spaces (code 32), for character and word spacing"""
+        return len(codes), codes.count(b' ')
+
+    def string_width(self, codes):
+        """Total glyph space width of the character codes in codes (as
+        returned by string_codes)"""
+        return sum(map(self.width_table.__getitem__, codes))
+
+    def decode_codes(self, codes):
+        """Translate the character codes in codes to unicode"""
+        charmap = self.charmap
+        if charmap is not None:
+            return codecs.charmap_decode(codes, 'strict', charmap)[0]
+        return codes.decode('latin-1').translate(self.unicode_table)
+
+    def _missing_width(self):
+        """Width of the glyphs the Widths array doesn't cover"""
+        try:
+            return float(self.FontDescriptor.get('MissingWidth', 0))
+        except AttributeError:
+            return 0.
+
     def to_text(self, string):
         """Convert the string to a unicode representation based on the font's
         encoding."""
@@ -56,23 +202,18 @@ class PdfBaseFont(PdfElement):
         """Translate a string based on the font's encoding.  This is kind of
         twisted, so here's the basic explanation for Latin1 fonts:
 
-        1. First, try to use the font's ToUnicode CMap (not yet implemented)
+        1. First, try to use the font's ToUnicode CMap
         2. If there's no ToUnicode, use the font's Encoding:
            a. Use the Encoding (including the Differences array, if defined)
               to map the character code to a name.
            b. Look up that name's UTF-16 value in the Adobe Glyph List
 
-        TODO: CMap"""
-        val = char.encode('utf-16-be')
-        intval = struct.unpack(">Q", b'\x00'*(8-len(val))+val)[0]
-        try:
-            return GLYPH_LIST[self.get_glyph_name(intval)]
-        except KeyError:
-            return char
+        Both are precomputed in unicode_table."""
+        return self.unicode_table.get(ord(char), char)
 
     def decode_string(self, string):
-        """Convenience method to translate a string one character at a time."""
-        return ''.join(self.decode_char(c) for c in string)
+        """Translate a string from a content stream to unicode"""
+        return self.decode_codes(self.string_codes(string))
 
     def get_glyph_width(self, glyph, missing_width=0):
         """Return the width of the specified glyph in the current font.
@@ -81,9 +222,12 @@ class PdfBaseFont(PdfElement):
         Arguments:
             glyph - a one character string"""
         if not isinstance(glyph, int):
-            glyph = self.Encoding.get_char_code(GLYPH_LIST[:glyph])
+            glyph = self.Encoding.get_char_code(GLYPH_LIST.inv[glyph])
         if not (self.FirstChar <= glyph <= self.LastChar):
-            return self.FontDescriptor.get('MissingWidth', missing_width)
+            try:
+                return self.FontDescriptor.get('MissingWidth', missing_width)
+            except AttributeError:
+                return missing_width
         return self.Widths[glyph - self.FirstChar]
 
     def get_glyph_name(self, code):
@@ -139,10 +283,13 @@ class FontDescriptor(PdfElement):
 
 class FontEncoding(PdfElement):
     """Font encoding object as described in Appendix D"""
-    #This should never change ever, but why hardcode in two places?
-    VALID_ENCODINGS = set(six.next(iter(BASE_ENCODINGS.values())).keys())
+    VALID_ENCODINGS = frozenset(ENCODING_NAMES)
+    # Encodings made by from_name()
+    _named_encodings = {}
 
     def __init__(self, obj, obj_key=None, document=None):
+        # bidict takes a while to import, so wait until we need it
+        from bidict import collapsingbidict
         super(FontEncoding, self).__init__(obj, obj_key, document)
         base_encoding = obj.value.get('BaseEncoding', 'StandardEncoding')
         if base_encoding not in self.VALID_ENCODINGS:
@@ -183,11 +330,15 @@ class FontEncoding(PdfElement):
     def get_glyph_name(self, code):
         return self._glyphmap.inv[code]
     def get_char_code(self, name):
-        try:
-            return self._glyphmap[name]
-        except KeyError:
-            print('Ruh Roh!')
+        """Character code of the glyph name, or None if it isn't encoded"""
+        return self._glyphmap.get(name)
     @classmethod
     def from_name(cls, encoding_name):
-        """Return an FontEncoding object when given a name"""
-        return cls(PdfDict({'BaseEncoding': encoding_name}))
+        """Return an FontEncoding object when given a name.  These are shared
+        by every font that uses the same base encoding."""
+        try:
+            return cls._named_encodings[encoding_name]
+        except KeyError:
+            pass
+        encoding = cls(PdfDict({'BaseEncoding': encoding_name}))
+        return cls._named_encodings.setdefault(encoding_name, encoding)
@@ -0,0 +1,259 @@
+"""
+CMaps - Reference pp. 379-395 (character collections and CMaps) and
+pp. 472-474 (ToUnicode CMaps)
+
+CMaps map character codes, which can be one to four bytes long, to either
+unicode text (ToUnicode CMaps, via bfchar and bfrange) or CIDs (via cidchar
+and cidrange).  The codespace ranges say how long each code is.  Once
+parsed, a CMap is compiled into a lookup table, and identical CMaps (e.g.,
+the same ToUnicode CMap embedded in several fonts or documents) are only
+parsed once per process.
+"""
+
+import threading
+from warnings    import warn
+from array       import array
+from bisect      import bisect_right
+from collections import OrderedDict
+
+from ...exc        import PdfParseError, NotImplementedWarning
+from ...pdf_parser import PdfParser
+from ...pdf_types  import PdfRaw, PdfString, PdfStream, PdfName
+
+__all__ = ['CMap', 'get_cmap', 'get_predefined_cmap']
+
+def code_to_int(code):
+    """Character code bytes to an int"""
+    return int.from_bytes(bytes(code), 'big')
+
+def utf16_to_text(code):
+    """Decode the UTF-16BE destination of a bfchar or bfrange"""
+    return bytes(code).decode('utf_16_be', 'replace')
+
+class CMap(object):
+    """A compiled CMap.  Mappings are kept in a dict for single codes and
+    small maps, and otherwise as sorted ranges searched by bisection."""
+    # Maps with at most this many codes in their ranges are expanded into the
+    # dict instead
+    DENSE_LIMIT = 512
+
+    def __init__(self, codespace, chars, ranges, name=None):
+        """Build a CMap.  Usually you'll want parse() instead.
+
+        Arguments:
+            codespace - List of (number of bytes, low code, high code)
+            chars     - Dict mapping codes to values
+            ranges    - List of (low code, high code, value) tuples.  value
+                        is either an int (a CID), a str (the text of the low
+                        code, with the last character incremented for each
+                        code after it), or a list with a value for each code.
+            name      - Optional CMapName"""
+        self.name       = name
+        self._codespace = sorted(codespace)
+        self._lengths   = sorted({n for n, _, _ in codespace})
+        if sum(hi - lo + 1 for lo, hi, _ in ranges) <= self.DENSE_LIMIT:
+            dense = {}
+            for low, high, value in ranges:
+                for code in range(low, high + 1):
+                    dense[code] = self._range_value(low, value, code)
+            dense.update(chars)
+            chars, ranges = dense, []
+        ranges.sort(key=lambda r: r[0])
+        self._chars  = chars
+        self._starts = array('L', (r[0] for r in ranges))
+        self._ends   = array('L', (r[1] for r in ranges))
+        self._values = [r[2] for r in ranges]
+
+    @staticmethod
+    def _range_value(low, value, code):
+        """Value for code in the range starting at low"""
+        if isinstance(value, int):
+            return value + code - low
+        if isinstance(value, str):
+            return value[:-1] + chr(ord(value[-1]) + code - low)
+        return value[code - low]
+
+    def __len__(self):
+        return len(self._chars) + sum(e - s + 1 for s, e in zip(self._starts,
+                                                                 self._ends))
+
+    def get(self, code, default=None):
+        """The value code maps to, or default"""
+        try:
+            return self._chars[code]
+        except KeyError:
+            pass
+        i = bisect_right(self._starts, code) - 1
+        if i < 0 or code > self._ends[i]:
+            return default
+        return self._range_value(self._starts[i], self._values[i], code)
+
+    def __getitem__(self, code):
+        val = self.get(code)
+        if val is None:
+            raise KeyError(code)
+        return val
+    def __contains__(self, code):
+        return self.get(code) is not None
+
+    def find(self, value):
+        """The lowest code that maps to value, or None"""
+        codes = [c for c, v in self._chars.items() if v == value]
+        for low, high, val in zip(self._starts, self._ends, self._values):
+            if isinstance(val, int):
+                if isinstance(value, int) and val <= value <= val + high - low:
+                    codes.append(low + value - val)
+            elif isinstance(val, str):
+                if isinstance(value, str) and len(value) == len(val) \
+                        and value[:-1] == val[:-1] \
+                        and 0 <= ord(value[-1]) - ord(val[-1]) <= high - low:
+                    codes.append(low + ord(value[-1]) - ord(val[-1]))
+            elif value in val:
+                codes.append(low + val.index(value))
+        return min(codes) if codes else None
+
+    @property
+    def code_lengths(self):
+        """Sorted list of the code lengths (in bytes) in the codespace"""
+        return self._lengths
+
+    def split(self, data):
+        """Split a byte string into a list of its character codes, as ints,
+        using the codespace ranges"""
+        lengths = self._lengths
+        if len(lengths) == 1:
+            # Everything's the same length, which is the usual case
+            n = lengths[0]
+            if n == 1:
+                return list(data)
+            return [int.from_bytes(data[i:i+n], 'big')
+                    for i in range(0, len(data) - n + 1, n)]
+        codes = []
+        pos   = 0
+        while pos < len(data):
+            for n in lengths:
+                code = int.from_bytes(data[pos:pos+n], 'big')
+                if pos + n <= len(data) and self._in_codespace(n, code):
+                    break
+            else:
+                # Not a valid code, so use the shortest length (p. 389)
+                n    = lengths[0]
+                code = int.from_bytes(data[pos:pos+n], 'big')
+            codes.append(code)
+            pos += n
+        return codes
+
+    def _in_codespace(self, nbytes, code):
+        return any(n == nbytes and lo <= code <= hi
+                   for n, lo, hi in self._codespace)
+
+    def decode(self, data, default=''):
+        """Translate a byte string to text using a ToUnicode CMap"""
+        get = self.get
+        return ''.join([get(c, default) for c in self.split(data)])
+
+    @classmethod
+    def parse(cls, data):
+        """Parse the (decoded) data of a CMap stream"""
+        codespace, chars, ranges = [], {}, []
+        name     = None
+        operands = []
+        for obj in PdfParser().iterparse(data):
+            if not isinstance(obj, PdfRaw):
+                operands.append(obj)
+                continue
+            op = bytes(obj)
+            if op == b'endcodespacerange':
+                for lo, hi in zip(operands[0::2], operands[1::2]):
+                    codespace.append((len(bytes(lo)), code_to_int(lo),
+                                      code_to_int(hi)))
+            elif op == b'endbfchar':
+                for src, dst in zip(operands[0::2], operands[1::2]):
+                    if isinstance(dst, PdfName):
+                        # Some producers use glyph names (pre-PDF 1.5)
+                        from .base_font import glyph_to_unicode
+                        dst = glyph_to_unicode(dst) or ''
+                    else:
+                        dst = utf16_to_text(dst)
+                    chars[code_to_int(src)] = dst
+                    cls._note_length(codespace, src)
+            elif op == b'endbfrange':
+                for lo, hi, dst in zip(operands[0::3], operands[1::3],
+                                       operands[2::3]):
+                    if isinstance(dst, PdfString):
+                        dst = utf16_to_text(dst)
+                        if not dst:
+                            continue
+                    else:
+                        dst = [utf16_to_text(d) for d in dst]
+                    ranges.append((code_to_int(lo), code_to_int(hi), dst))
+                    cls._note_length(codespace, lo)
+            elif op == b'endcidchar':
+                for src, cid in zip(operands[0::2], operands[1::2]):
+                    chars[code_to_int(src)] = int(cid)
+            elif op == b'endcidrange':
+                for lo, hi, cid in zip(operands[0::3], operands[1::3],
+                                       operands[2::3]):
+                    ranges.append((code_to_int(lo), code_to_int(hi),
+                                   int(cid)))
+            elif op == b'def' and len(operands) >= 2 \
+                    and operands[-2] == 'CMapName':
+                name = operands[-1]
+            operands = []
+        if not codespace:
+            raise PdfParseError('CMap has no codespace ranges or mappings')
+        return cls(codespace, chars, ranges, name)
+
+    @staticmethod
+    def _note_length(codespace, code):
+        """Some ToUnicode CMaps leave out the codespace ranges, so we guess
+        them from the codes that get mapped"""
+        if not any(n == len(bytes(code)) for n, _, _ in codespace):
+            nbytes = len(bytes(code))
+            codespace.append((nbytes, 0, 256**nbytes - 1))
+
+    @classmethod
+    def identity(cls, nbytes=2):
+        """The Identity-H/Identity-V CMap, mapping each 2 byte code to the
+        CID with the same value"""
+        top = 256**nbytes - 1
+        return cls([(nbytes, 0, top)], {}, [(0, top, 0)],
+                   'Identity-H' if nbytes == 2 else None)
+
+def get_predefined_cmap(name):
+    """Get one of the predefined CMaps by name.  Only the Identity CMaps are
+    included, so anything else is treated as Identity-H with a warning."""
+    try:
+        return _predefined_cmaps[name]
+    except KeyError:
+        pass
+    if name not in ('Identity-H', 'Identity-V'):
+        warn('Predefined CMap "{}" not yet supported'.format(name),
+             NotImplementedWarning)
+    return _predefined_cmaps.setdefault(name, CMap.identity())
+_predefined_cmaps = {}
+
+# Compiled CMaps, keyed by the digest of their data
+CMAP_CACHE_SIZE = 256
+_cmap_cache = OrderedDict()
+_cmap_lock  = threading.Lock()
+
+def get_cmap(obj):
+    """Get the compiled CMap for a CMap stream (or its decoded data).
+    CMaps with the same content are shared."""
+    import hashlib # Slow to import, and most documents don't need it
+    value = getattr(obj, 'value', obj)
+    data  = value.data if isinstance(value, PdfStream) else bytes(value)
+    key  = hashlib.sha1(data).digest()
+    with _cmap_lock:
+        try:
+            _cmap_cache.move_to_end(key)
+            return _cmap_cache[key]
+        except KeyError:
+            pass
+    cmap = CMap.parse(data)
+    with _cmap_lock:
+        _cmap_cache[key] = cmap
+        while len(_cmap_cache) > CMAP_CACHE_SIZE:
+            _cmap_cache.popitem(last=False)
+    return cmap
@@ -5,6 +5,7 @@ PdfFont class: Switchboard for the actual font classes
 from warnings      import warn
 from .type1        import Type1Font
 from .true_type    import TrueTypeFont
+from .type0        import Type0Font, CIDFont
 from .base_font    import PdfBaseFont
 from ..pdf_element import PdfElement
 from ...exc        import NotImplementedWarning
@@ -17,9 +18,13 @@ class PdfFont(PdfElement):
         if obj['Type'] != 'Font':
             raise ValueError('Not a font')
         if obj['Subtype'] == 'Type1':
-            return Type1Font(obj, obj_key)
+            return Type1Font(obj, obj_key, document)
         if obj['Subtype'] == 'TrueType':
-            return TrueTypeFont(obj, obj_key)
+            return TrueTypeFont(obj, obj_key, document)
+        if obj['Subtype'] == 'Type0':
+            return Type0Font(obj, obj_key, document)
+        if obj['Subtype'] in ('CIDFontType0', 'CIDFontType2'):
+            return CIDFont(obj, obj_key, document)
         warn('Font subtype "{}" not yet supported'.format(obj['Subtype']),
              NotImplementedWarning)
         return PdfBaseFont(obj, obj_key, document)
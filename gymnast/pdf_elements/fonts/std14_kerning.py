@@ -0,0 +1,6204 @@
+"""
+Kerning pairs for the standard 14 fonts, compiled from the AFM files in
+data/afm.  Generated by gymnast.pdf_elements.fonts.afm - do not edit.
+
+KERN_PAIRS maps font names to a string of whitespace separated (left glyph,
+right glyph, adjustment) triples (see type1.get_std_kerning).
+"""
+
+KERN_PAIRS = {'Helvetica': 'A C -30 A Cacute -30 A Ccaron -30 A Ccedilla -30 A G -30 A '
+              'Gbreve -30 A Gcommaaccent -30 A O -30 A Oacute -30 A '
+              'Ocircumflex -30 A Odieresis -30 A Ograve -30 A Ohungarumlaut '
+              '-30 A Omacron -30 A Oslash -30 A Otilde -30 A Q -30 A T -120 A '
+              'Tcaron -120 A Tcommaaccent -120 A U -50 A Uacute -50 A '
+              'Ucircumflex -50 A Udieresis -50 A Ugrave -50 A Uhungarumlaut '
+              '-50 A Umacron -50 A Uogonek -50 A Uring -50 A V -70 A W -50 A '
+              'Y -100 A Yacute -100 A Ydieresis -100 A u -30 A uacute -30 A '
+              'ucircumflex -30 A udieresis -30 A ugrave -30 A uhungarumlaut '
+              '-30 A umacron -30 A uogonek -30 A uring -30 A v -40 A w -40 A '
+              'y -40 A yacute -40 A ydieresis -40 Aacute C -30 Aacute Cacute '
+              '-30 Aacute Ccaron -30 Aacute Ccedilla -30 Aacute G -30 Aacute '
+              'Gbreve -30 Aacute Gcommaaccent -30 Aacute O -30 Aacute Oacute '
+              '-30 Aacute Ocircumflex -30 Aacute Odieresis -30 Aacute Ograve '
+              '-30 Aacute Ohungarumlaut -30 Aacute Omacron -30 Aacute Oslash '
+              '-30 Aacute Otilde -30 Aacute Q -30 Aacute T -120 Aacute Tcaron '
+              '-120 Aacute Tcommaaccent -120 Aacute U -50 Aacute Uacute -50 '
+              'Aacute Ucircumflex -50 Aacute Udieresis -50 Aacute Ugrave -50 '
+              'Aacute Uhungarumlaut -50 Aacute Umacron -50 Aacute Uogonek -50 '
+              'Aacute Uring -50 Aacute V -70 Aacute W -50 Aacute Y -100 '
+              'Aacute Yacute -100 Aacute Ydieresis -100 Aacute u -30 Aacute '
+              'uacute -30 Aacute ucircumflex -30 Aacute udieresis -30 Aacute '
+              'ugrave -30 Aacute uhungarumlaut -30 Aacute umacron -30 Aacute '
+              'uogonek -30 Aacute uring -30 Aacute v -40 Aacute w -40 Aacute '
+              'y -40 Aacute yacute -40 Aacute ydieresis -40 Abreve C -30 '
+              'Abreve Cacute -30 Abreve Ccaron -30 Abreve Ccedilla -30 Abreve '
+              'G -30 Abreve Gbreve -30 Abreve Gcommaaccent -30 Abreve O -30 '
+              'Abreve Oacute -30 Abreve Ocircumflex -30 Abreve Odieresis -30 '
+              'Abreve Ograve -30 Abreve Ohungarumlaut -30 Abreve Omacron -30 '
+              'Abreve Oslash -30 Abreve Otilde -30 Abreve Q -30 Abreve T -120 '
+              'Abreve Tcaron -120 Abreve Tcommaaccent -120 Abreve U -50 '
+              'Abreve Uacute -50 Abreve Ucircumflex -50 Abreve Udieresis -50 '
+              'Abreve Ugrave -50 Abreve Uhungarumlaut -50 Abreve Umacron -50 '
+              'Abreve Uogonek -50 Abreve Uring -50 Abreve V -70 Abreve W -50 '
+              'Abreve Y -100 Abreve Yacute -100 Abreve Ydieresis -100 Abreve '
+              'u -30 Abreve uacute -30 Abreve ucircumflex -30 Abreve '
+              'udieresis -30 Abreve ugrave -30 Abreve uhungarumlaut -30 '
+              'Abreve umacron -30 Abreve uogonek -30 Abreve uring -30 Abreve '
+              'v -40 Abreve w -40 Abreve y -40 Abreve yacute -40 Abreve '
+              'ydieresis -40 Acircumflex C -30 Acircumflex Cacute -30 '
+              'Acircumflex Ccaron -30 Acircumflex Ccedilla -30 Acircumflex G '
+              '-30 Acircumflex Gbreve -30 Acircumflex Gcommaaccent -30 '
+              'Acircumflex O -30 Acircumflex Oacute -30 Acircumflex '
+              'Ocircumflex -30 Acircumflex Odieresis -30 Acircumflex Ograve '
+              '-30 Acircumflex Ohungarumlaut -30 Acircumflex Omacron -30 '
+              'Acircumflex Oslash -30 Acircumflex Otilde -30 Acircumflex Q '
+              '-30 Acircumflex T -120 Acircumflex Tcaron -120 Acircumflex '
+              'Tcommaaccent -120 Acircumflex U -50 Acircumflex Uacute -50 '
+              'Acircumflex Ucircumflex -50 Acircumflex Udieresis -50 '
+              'Acircumflex Ugrave -50 Acircumflex Uhungarumlaut -50 '
+              'Acircumflex Umacron -50 Acircumflex Uogonek -50 Acircumflex '
+              'Uring -50 Acircumflex V -70 Acircumflex W -50 Acircumflex Y '
+              '-100 Acircumflex Yacute -100 Acircumflex Ydieresis -100 '
+              'Acircumflex u -30 Acircumflex uacute -30 Acircumflex '
+              'ucircumflex -30 Acircumflex udieresis -30 Acircumflex ugrave '
+              '-30 Acircumflex uhungarumlaut -30 Acircumflex umacron -30 '
+              'Acircumflex uogonek -30 Acircumflex uring -30 Acircumflex v '
+              '-40 Acircumflex w -40 Acircumflex y -40 Acircumflex yacute -40 '
+              'Acircumflex ydieresis -40 Adieresis C -30 Adieresis Cacute -30 '
+              'Adieresis Ccaron -30 Adieresis Ccedilla -30 Adieresis G -30 '
+              'Adieresis Gbreve -30 Adieresis Gcommaaccent -30 Adieresis O '
+              '-30 Adieresis Oacute -30 Adieresis Ocircumflex -30 Adieresis '
+              'Odieresis -30 Adieresis Ograve -30 Adieresis Ohungarumlaut -30 '
+              'Adieresis Omacron -30 Adieresis Oslash -30 Adieresis Otilde '
+              '-30 Adieresis Q -30 Adieresis T -120 Adieresis Tcaron -120 '
+              'Adieresis Tcommaaccent -120 Adieresis U -50 Adieresis Uacute '
+              '-50 Adieresis Ucircumflex -50 Adieresis Udieresis -50 '
+              'Adieresis Ugrave -50 Adieresis Uhungarumlaut -50 Adieresis '
+              'Umacron -50 Adieresis Uogonek -50 Adieresis Uring -50 '
+              'Adieresis V -70 Adieresis W -50 Adieresis Y -100 Adieresis '
+              'Yacute -100 Adieresis Ydieresis -100 Adieresis u -30 Adieresis '
+              'uacute -30 Adieresis ucircumflex -30 Adieresis udieresis -30 '
+              'Adieresis ugrave -30 Adieresis uhungarumlaut -30 Adieresis '
+              'umacron -30 Adieresis uogonek -30 Adieresis uring -30 '
+              'Adieresis v -40 Adieresis w -40 Adieresis y -40 Adieresis '
+              'yacute -40 Adieresis ydieresis -40 Agrave C -30 Agrave Cacute '
+              '-30 Agrave Ccaron -30 Agrave Ccedilla -30 Agrave G -30 Agrave '
+              'Gbreve -30 Agrave Gcommaaccent -30 Agrave O -30 Agrave Oacute '
+              '-30 Agrave Ocircumflex -30 Agrave Odieresis -30 Agrave Ograve '
+              '-30 Agrave Ohungarumlaut -30 Agrave Omacron -30 Agrave Oslash '
+              '-30 Agrave Otilde -30 Agrave Q -30 Agrave T -120 Agrave Tcaron '
+              '-120 Agrave Tcommaaccent -120 Agrave U -50 Agrave Uacute -50 '
+              'Agrave Ucircumflex -50 Agrave Udieresis -50 Agrave Ugrave -50 '
+              'Agrave Uhungarumlaut -50 Agrave Umacron -50 Agrave Uogonek -50 '
+              'Agrave Uring -50 Agrave V -70 Agrave W -50 Agrave Y -100 '
+              'Agrave Yacute -100 Agrave Ydieresis -100 Agrave u -30 Agrave '
+              'uacute -30 Agrave ucircumflex -30 Agrave udieresis -30 Agrave '
+              'ugrave -30 Agrave uhungarumlaut -30 Agrave umacron -30 Agrave '
+              'uogonek -30 Agrave uring -30 Agrave v -40 Agrave w -40 Agrave '
+              'y -40 Agrave yacute -40 Agrave ydieresis -40 Amacron C -30 '
+              'Amacron Cacute -30 Amacron Ccaron -30 Amacron Ccedilla -30 '
+              'Amacron G -30 Amacron Gbreve -30 Amacron Gcommaaccent -30 '
+              'Amacron O -30 Amacron Oacute -30 Amacron Ocircumflex -30 '
+              'Amacron Odieresis -30 Amacron Ograve -30 Amacron Ohungarumlaut '
+              '-30 Amacron Omacron -30 Amacron Oslash -30 Amacron Otilde -30 '
+              'Amacron Q -30 Amacron T -120 Amacron Tcaron -120 Amacron '
+              'Tcommaaccent -120 Amacron U -50 Amacron Uacute -50 Amacron '
+              'Ucircumflex -50 Amacron Udieresis -50 Amacron Ugrave -50 '
+              'Amacron Uhungarumlaut -50 Amacron Umacron -50 Amacron Uogonek '
+              '-50 Amacron Uring -50 Amacron V -70 Amacron W -50 Amacron Y '
+              '-100 Amacron Yacute -100 Amacron Ydieresis -100 Amacron u -30 '
+              'Amacron uacute -30 Amacron ucircumflex -30 Amacron udieresis '
+              '-30 Amacron ugrave -30 Amacron uhungarumlaut -30 Amacron '
+              'umacron -30 Amacron uogonek -30 Amacron uring -30 Amacron v '
+              '-40 Amacron w -40 Amacron y -40 Amacron yacute -40 Amacron '
+              'ydieresis -40 Aogonek C -30 Aogonek Cacute -30 Aogonek Ccaron '
+              '-30 Aogonek Ccedilla -30 Aogonek G -30 Aogonek Gbreve -30 '
+              'Aogonek Gcommaaccent -30 Aogonek O -30 Aogonek Oacute -30 '
+              'Aogonek Ocircumflex -30 Aogonek Odieresis -30 Aogonek Ograve '
+              '-30 Aogonek Ohungarumlaut -30 Aogonek Omacron -30 Aogonek '
+              'Oslash -30 Aogonek Otilde -30 Aogonek Q -30 Aogonek T -120 '
+              'Aogonek Tcaron -120 Aogonek Tcommaaccent -120 Aogonek U -50 '
+              'Aogonek Uacute -50 Aogonek Ucircumflex -50 Aogonek Udieresis '
+              '-50 Aogonek Ugrave -50 Aogonek Uhungarumlaut -50 Aogonek '
+              'Umacron -50 Aogonek Uogonek -50 Aogonek Uring -50 Aogonek V '
+              '-70 Aogonek W -50 Aogonek Y -100 Aogonek Yacute -100 Aogonek '
+              'Ydieresis -100 Aogonek u -30 Aogonek uacute -30 Aogonek '
+              'ucircumflex -30 Aogonek udieresis -30 Aogonek ugrave -30 '
+              'Aogonek uhungarumlaut -30 Aogonek umacron -30 Aogonek uogonek '
+              '-30 Aogonek uring -30 Aogonek v -40 Aogonek w -40 Aogonek y '
+              '-40 Aogonek yacute -40 Aogonek ydieresis -40 Aring C -30 Aring '
+              'Cacute -30 Aring Ccaron -30 Aring Ccedilla -30 Aring G -30 '
+              'Aring Gbreve -30 Aring Gcommaaccent -30 Aring O -30 Aring '
+              'Oacute -30 Aring Ocircumflex -30 Aring Odieresis -30 Aring '
+              'Ograve -30 Aring Ohungarumlaut -30 Aring Omacron -30 Aring '
+              'Oslash -30 Aring Otilde -30 Aring Q -30 Aring T -120 Aring '
+              'Tcaron -120 Aring Tcommaaccent -120 Aring U -50 Aring Uacute '
+              '-50 Aring Ucircumflex -50 Aring Udieresis -50 Aring Ugrave -50 '
+              'Aring Uhungarumlaut -50 Aring Umacron -50 Aring Uogonek -50 '
+              'Aring Uring -50 Aring V -70 Aring W -50 Aring Y -100 Aring '
+              'Yacute -100 Aring Ydieresis -100 Aring u -30 Aring uacute -30 '
+              'Aring ucircumflex -30 Aring udieresis -30 Aring ugrave -30 '
+              'Aring uhungarumlaut -30 Aring umacron -30 Aring uogonek -30 '
+              'Aring uring -30 Aring v -40 Aring w -40 Aring y -40 Aring '
+              'yacute -40 Aring ydieresis -40 Atilde C -30 Atilde Cacute -30 '
+              'Atilde Ccaron -30 Atilde Ccedilla -30 Atilde G -30 Atilde '
+              'Gbreve -30 Atilde Gcommaaccent -30 Atilde O -30 Atilde Oacute '
+              '-30 Atilde Ocircumflex -30 Atilde Odieresis -30 Atilde Ograve '
+              '-30 Atilde Ohungarumlaut -30 Atilde Omacron -30 Atilde Oslash '
+              '-30 Atilde Otilde -30 Atilde Q -30 Atilde T -120 Atilde Tcaron '
+              '-120 Atilde Tcommaaccent -120 Atilde U -50 Atilde Uacute -50 '
+              'Atilde Ucircumflex -50 Atilde Udieresis -50 Atilde Ugrave -50 '
+              'Atilde Uhungarumlaut -50 Atilde Umacron -50 Atilde Uogonek -50 '
+              'Atilde Uring -50 Atilde V -70 Atilde W -50 Atilde Y -100 '
+              'Atilde Yacute -100 Atilde Ydieresis -100 Atilde u -30 Atilde '
+              'uacute -30 Atilde ucircumflex -30 Atilde udieresis -30 Atilde '
+              'ugrave -30 Atilde uhungarumlaut -30 Atilde umacron -30 Atilde '
+              'uogonek -30 Atilde uring -30 Atilde v -40 Atilde w -40 Atilde '
+              'y -40 Atilde yacute -40 Atilde ydieresis -40 B U -10 B Uacute '
+              '-10 B Ucircumflex -10 B Udieresis -10 B Ugrave -10 B '
+              'Uhungarumlaut -10 B Umacron -10 B Uogonek -10 B Uring -10 B '
+              'comma -20 B period -20 C comma -30 C period -30 Cacute comma '
+              '-30 Cacute period -30 Ccaron comma -30 Ccaron period -30 '
+              'Ccedilla comma -30 Ccedilla period -30 D A -40 D Aacute -40 D '
+              'Abreve -40 D Acircumflex -40 D Adieresis -40 D Agrave -40 D '
+              'Amacron -40 D Aogonek -40 D Aring -40 D Atilde -40 D V -70 D W '
+              '-40 D Y -90 D Yacute -90 D Ydieresis -90 D comma -70 D period '
+              '-70 Dcaron A -40 Dcaron Aacute -40 Dcaron Abreve -40 Dcaron '
+              'Acircumflex -40 Dcaron Adieresis -40 Dcaron Agrave -40 Dcaron '
+              'Amacron -40 Dcaron Aogonek -40 Dcaron Aring -40 Dcaron Atilde '
+              '-40 Dcaron V -70 Dcaron W -40 Dcaron Y -90 Dcaron Yacute -90 '
+              'Dcaron Ydieresis -90 Dcaron comma -70 Dcaron period -70 Dcroat '
+              'A -40 Dcroat Aacute -40 Dcroat Abreve -40 Dcroat Acircumflex '
+              '-40 Dcroat Adieresis -40 Dcroat Agrave -40 Dcroat Amacron -40 '
+              'Dcroat Aogonek -40 Dcroat Aring -40 Dcroat Atilde -40 Dcroat V '
+              '-70 Dcroat W -40 Dcroat Y -90 Dcroat Yacute -90 Dcroat '
+              'Ydieresis -90 Dcroat comma -70 Dcroat period -70 F A -80 F '
+              'Aacute -80 F Abreve -80 F Acircumflex -80 F Adieresis -80 F '
+              'Agrave -80 F Amacron -80 F Aogonek -80 F Aring -80 F Atilde '
+              '-80 F a -50 F aacute -50 F abreve -50 F acircumflex -50 F '
+              'adieresis -50 F agrave -50 F amacron -50 F aogonek -50 F aring '
+              '-50 F atilde -50 F comma -150 F e -30 F eacute -30 F ecaron '
+              '-30 F ecircumflex -30 F edieresis -30 F edotaccent -30 F '
+              'egrave -30 F emacron -30 F eogonek -30 F o -30 F oacute -30 F '
+              'ocircumflex -30 F odieresis -30 F ograve -30 F ohungarumlaut '
+              '-30 F omacron -30 F oslash -30 F otilde -30 F period -150 F r '
+              '-45 F racute -45 F rcaron -45 F rcommaaccent -45 J A -20 J '
+              'Aacute -20 J Abreve -20 J Acircumflex -20 J Adieresis -20 J '
+              'Agrave -20 J Amacron -20 J Aogonek -20 J Aring -20 J Atilde '
+              '-20 J a -20 J aacute -20 J abreve -20 J acircumflex -20 J '
+              'adieresis -20 J agrave -20 J amacron -20 J aogonek -20 J aring '
+              '-20 J atilde -20 J comma -30 J period -30 J u -20 J uacute -20 '
+              'J ucircumflex -20 J udieresis -20 J ugrave -20 J uhungarumlaut '
+              '-20 J umacron -20 J uogonek -20 J uring -20 K O -50 K Oacute '
+              '-50 K Ocircumflex -50 K Odieresis -50 K Ograve -50 K '
+              'Ohungarumlaut -50 K Omacron -50 K Oslash -50 K Otilde -50 K e '
+              '-40 K eacute -40 K ecaron -40 K ecircumflex -40 K edieresis '
+              '-40 K edotaccent -40 K egrave -40 K emacron -40 K eogonek -40 '
+              'K o -40 K oacute -40 K ocircumflex -40 K odieresis -40 K '
+              'ograve -40 K ohungarumlaut -40 K omacron -40 K oslash -40 K '
+              'otilde -40 K u -30 K uacute -30 K ucircumflex -30 K udieresis '
+              '-30 K ugrave -30 K uhungarumlaut -30 K umacron -30 K uogonek '
+              '-30 K uring -30 K y -50 K yacute -50 K ydieresis -50 '
+              'Kcommaaccent O -50 Kcommaaccent Oacute -50 Kcommaaccent '
+              'Ocircumflex -50 Kcommaaccent Odieresis -50 Kcommaaccent Ograve '
+              '-50 Kcommaaccent Ohungarumlaut -50 Kcommaaccent Omacron -50 '
+              'Kcommaaccent Oslash -50 Kcommaaccent Otilde -50 Kcommaaccent e '
+              '-40 Kcommaaccent eacute -40 Kcommaaccent ecaron -40 '
+              'Kcommaaccent ecircumflex -40 Kcommaaccent edieresis -40 '
+              'Kcommaaccent edotaccent -40 Kcommaaccent egrave -40 '
+              'Kcommaaccent emacron -40 Kcommaaccent eogonek -40 Kcommaaccent '
+              'o -40 Kcommaaccent oacute -40 Kcommaaccent ocircumflex -40 '
+              'Kcommaaccent odieresis -40 Kcommaaccent ograve -40 '
+              'Kcommaaccent ohungarumlaut -40 Kcommaaccent omacron -40 '
+              'Kcommaaccent oslash -40 Kcommaaccent otilde -40 Kcommaaccent u '
+              '-30 Kcommaaccent uacute -30 Kcommaaccent ucircumflex -30 '
+              'Kcommaaccent udieresis -30 Kcommaaccent ugrave -30 '
+              'Kcommaaccent uhungarumlaut -30 Kcommaaccent umacron -30 '
+              'Kcommaaccent uogonek -30 Kcommaaccent uring -30 Kcommaaccent y '
+              '-50 Kcommaaccent yacute -50 Kcommaaccent ydieresis -50 L T '
+              '-110 L Tcaron -110 L Tcommaaccent -110 L V -110 L W -70 L Y '
+              '-140 L Yacute -140 L Ydieresis -140 L quotedblright -140 L '
+              'quoteright -160 L y -30 L yacute -30 L ydieresis -30 Lacute T '
+              '-110 Lacute Tcaron -110 Lacute Tcommaaccent -110 Lacute V -110 '
+              'Lacute W -70 Lacute Y -140 Lacute Yacute -140 Lacute Ydieresis '
+              '-140 Lacute quotedblright -140 Lacute quoteright -160 Lacute y '
+              '-30 Lacute yacute -30 Lacute ydieresis -30 Lcaron T -110 '
+              'Lcaron Tcaron -110 Lcaron Tcommaaccent -110 Lcaron V -110 '
+              'Lcaron W -70 Lcaron Y -140 Lcaron Yacute -140 Lcaron Ydieresis '
+              '-140 Lcaron quotedblright -140 Lcaron quoteright -160 Lcaron y '
+              '-30 Lcaron yacute -30 Lcaron ydieresis -30 Lcommaaccent T -110 '
+              'Lcommaaccent Tcaron -110 Lcommaaccent Tcommaaccent -110 '
+              'Lcommaaccent V -110 Lcommaaccent W -70 Lcommaaccent Y -140 '
+              'Lcommaaccent Yacute -140 Lcommaaccent Ydieresis -140 '
+              'Lcommaaccent quotedblright -140 Lcommaaccent quoteright -160 '
+              'Lcommaaccent y -30 Lcommaaccent yacute -30 Lcommaaccent '
+              'ydieresis -30 Lslash T -110 Lslash Tcaron -110 Lslash '
+              'Tcommaaccent -110 Lslash V -110 Lslash W -70 Lslash Y -140 '
+              'Lslash Yacute -140 Lslash Ydieresis -140 Lslash quotedblright '
+              '-140 Lslash quoteright -160 Lslash y -30 Lslash yacute -30 '
+              'Lslash ydieresis -30 O A -20 O Aacute -20 O Abreve -20 O '
+              'Acircumflex -20 O Adieresis -20 O Agrave -20 O Amacron -20 O '
+              'Aogonek -20 O Aring -20 O Atilde -20 O T -40 O Tcaron -40 O '
+              'Tcommaaccent -40 O V -50 O W -30 O X -60 O Y -70 O Yacute -70 '
+              'O Ydieresis -70 O comma -40 O period -40 Oacute A -20 Oacute '
+              'Aacute -20 Oacute Abreve -20 Oacute Acircumflex -20 Oacute '
+              'Adieresis -20 Oacute Agrave -20 Oacute Amacron -20 Oacute '
+              'Aogonek -20 Oacute Aring -20 Oacute Atilde -20 Oacute T -40 '
+              'Oacute Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 Oacute '
+              'W -30 Oacute X -60 Oacute Y -70 Oacute Yacute -70 Oacute '
+              'Ydieresis -70 Oacute comma -40 Oacute period -40 Ocircumflex A '
+              '-20 Ocircumflex Aacute -20 Ocircumflex Abreve -20 Ocircumflex '
+              'Acircumflex -20 Ocircumflex Adieresis -20 Ocircumflex Agrave '
+              '-20 Ocircumflex Amacron -20 Ocircumflex Aogonek -20 '
+              'Ocircumflex Aring -20 Ocircumflex Atilde -20 Ocircumflex T -40 '
+              'Ocircumflex Tcaron -40 Ocircumflex Tcommaaccent -40 '
+              'Ocircumflex V -50 Ocircumflex W -30 Ocircumflex X -60 '
+              'Ocircumflex Y -70 Ocircumflex Yacute -70 Ocircumflex Ydieresis '
+              '-70 Ocircumflex comma -40 Ocircumflex period -40 Odieresis A '
+              '-20 Odieresis Aacute -20 Odieresis Abreve -20 Odieresis '
+              'Acircumflex -20 Odieresis Adieresis -20 Odieresis Agrave -20 '
+              'Odieresis Amacron -20 Odieresis Aogonek -20 Odieresis Aring '
+              '-20 Odieresis Atilde -20 Odieresis T -40 Odieresis Tcaron -40 '
+              'Odieresis Tcommaaccent -40 Odieresis V -50 Odieresis W -30 '
+              'Odieresis X -60 Odieresis Y -70 Odieresis Yacute -70 Odieresis '
+              'Ydieresis -70 Odieresis comma -40 Odieresis period -40 Ograve '
+              'A -20 Ograve Aacute -20 Ograve Abreve -20 Ograve Acircumflex '
+              '-20 Ograve Adieresis -20 Ograve Agrave -20 Ograve Amacron -20 '
+              'Ograve Aogonek -20 Ograve Aring -20 Ograve Atilde -20 Ograve T '
+              '-40 Ograve Tcaron -40 Ograve Tcommaaccent -40 Ograve V -50 '
+              'Ograve W -30 Ograve X -60 Ograve Y -70 Ograve Yacute -70 '
+              'Ograve Ydieresis -70 Ograve comma -40 Ograve period -40 '
+              'Ohungarumlaut A -20 Ohungarumlaut Aacute -20 Ohungarumlaut '
+              'Abreve -20 Ohungarumlaut Acircumflex -20 Ohungarumlaut '
+              'Adieresis -20 Ohungarumlaut Agrave -20 Ohungarumlaut Amacron '
+              '-20 Ohungarumlaut Aogonek -20 Ohungarumlaut Aring -20 '
+              'Ohungarumlaut Atilde -20 Ohungarumlaut T -40 Ohungarumlaut '
+              'Tcaron -40 Ohungarumlaut Tcommaaccent -40 Ohungarumlaut V -50 '
+              'Ohungarumlaut W -30 Ohungarumlaut X -60 Ohungarumlaut Y -70 '
+              'Ohungarumlaut Yacute -70 Ohungarumlaut Ydieresis -70 '
+              'Ohungarumlaut comma -40 Ohungarumlaut period -40 Omacron A -20 '
+              'Omacron Aacute -20 Omacron Abreve -20 Omacron Acircumflex -20 '
+              'Omacron Adieresis -20 Omacron Agrave -20 Omacron Amacron -20 '
+              'Omacron Aogonek -20 Omacron Aring -20 Omacron Atilde -20 '
+              'Omacron T -40 Omacron Tcaron -40 Omacron Tcommaaccent -40 '
+              'Omacron V -50 Omacron W -30 Omacron X -60 Omacron Y -70 '
+              'Omacron Yacute -70 Omacron Ydieresis -70 Omacron comma -40 '
+              'Omacron period -40 Oslash A -20 Oslash Aacute -20 Oslash '
+              'Abreve -20 Oslash Acircumflex -20 Oslash Adieresis -20 Oslash '
+              'Agrave -20 Oslash Amacron -20 Oslash Aogonek -20 Oslash Aring '
+              '-20 Oslash Atilde -20 Oslash T -40 Oslash Tcaron -40 Oslash '
+              'Tcommaaccent -40 Oslash V -50 Oslash W -30 Oslash X -60 Oslash '
+              'Y -70 Oslash Yacute -70 Oslash Ydieresis -70 Oslash comma -40 '
+              'Oslash period -40 Otilde A -20 Otilde Aacute -20 Otilde Abreve '
+              '-20 Otilde Acircumflex -20 Otilde Adieresis -20 Otilde Agrave '
+              '-20 Otilde Amacron -20 Otilde Aogonek -20 Otilde Aring -20 '
+              'Otilde Atilde -20 Otilde T -40 Otilde Tcaron -40 Otilde '
+              'Tcommaaccent -40 Otilde V -50 Otilde W -30 Otilde X -60 Otilde '
+              'Y -70 Otilde Yacute -70 Otilde Ydieresis -70 Otilde comma -40 '
+              'Otilde period -40 P A -120 P Aacute -120 P Abreve -120 P '
+              'Acircumflex -120 P Adieresis -120 P Agrave -120 P Amacron -120 '
+              'P Aogonek -120 P Aring -120 P Atilde -120 P a -40 P aacute -40 '
+              'P abreve -40 P acircumflex -40 P adieresis -40 P agrave -40 P '
+              'amacron -40 P aogonek -40 P aring -40 P atilde -40 P comma '
+              '-180 P e -50 P eacute -50 P ecaron -50 P ecircumflex -50 P '
+              'edieresis -50 P edotaccent -50 P egrave -50 P emacron -50 P '
+              'eogonek -50 P o -50 P oacute -50 P ocircumflex -50 P odieresis '
+              '-50 P ograve -50 P ohungarumlaut -50 P omacron -50 P oslash '
+              '-50 P otilde -50 P period -180 Q U -10 Q Uacute -10 Q '
+              'Ucircumflex -10 Q Udieresis -10 Q Ugrave -10 Q Uhungarumlaut '
+              '-10 Q Umacron -10 Q Uogonek -10 Q Uring -10 R O -20 R Oacute '
+              '-20 R Ocircumflex -20 R Odieresis -20 R Ograve -20 R '
+              'Ohungarumlaut -20 R Omacron -20 R Oslash -20 R Otilde -20 R T '
+              '-30 R Tcaron -30 R Tcommaaccent -30 R U -40 R Uacute -40 R '
+              'Ucircumflex -40 R Udieresis -40 R Ugrave -40 R Uhungarumlaut '
+              '-40 R Umacron -40 R Uogonek -40 R Uring -40 R V -50 R W -30 R '
+              'Y -50 R Yacute -50 R Ydieresis -50 Racute O -20 Racute Oacute '
+              '-20 Racute Ocircumflex -20 Racute Odieresis -20 Racute Ograve '
+              '-20 Racute Ohungarumlaut -20 Racute Omacron -20 Racute Oslash '
+              '-20 Racute Otilde -20 Racute T -30 Racute Tcaron -30 Racute '
+              'Tcommaaccent -30 Racute U -40 Racute Uacute -40 Racute '
+              'Ucircumflex -40 Racute Udieresis -40 Racute Ugrave -40 Racute '
+              'Uhungarumlaut -40 Racute Umacron -40 Racute Uogonek -40 Racute '
+              'Uring -40 Racute V -50 Racute W -30 Racute Y -50 Racute Yacute '
+              '-50 Racute Ydieresis -50 Rcaron O -20 Rcaron Oacute -20 Rcaron '
+              'Ocircumflex -20 Rcaron Odieresis -20 Rcaron Ograve -20 Rcaron '
+              'Ohungarumlaut -20 Rcaron Omacron -20 Rcaron Oslash -20 Rcaron '
+              'Otilde -20 Rcaron T -30 Rcaron Tcaron -30 Rcaron Tcommaaccent '
+              '-30 Rcaron U -40 Rcaron Uacute -40 Rcaron Ucircumflex -40 '
+              'Rcaron Udieresis -40 Rcaron Ugrave -40 Rcaron Uhungarumlaut '
+              '-40 Rcaron Umacron -40 Rcaron Uogonek -40 Rcaron Uring -40 '
+              'Rcaron V -50 Rcaron W -30 Rcaron Y -50 Rcaron Yacute -50 '
+              'Rcaron Ydieresis -50 Rcommaaccent O -20 Rcommaaccent Oacute '
+              '-20 Rcommaaccent Ocircumflex -20 Rcommaaccent Odieresis -20 '
+              'Rcommaaccent Ograve -20 Rcommaaccent Ohungarumlaut -20 '
+              'Rcommaaccent Omacron -20 Rcommaaccent Oslash -20 Rcommaaccent '
+              'Otilde -20 Rcommaaccent T -30 Rcommaaccent Tcaron -30 '
+              'Rcommaaccent Tcommaaccent -30 Rcommaaccent U -40 Rcommaaccent '
+              'Uacute -40 Rcommaaccent Ucircumflex -40 Rcommaaccent Udieresis '
+              '-40 Rcommaaccent Ugrave -40 Rcommaaccent Uhungarumlaut -40 '
+              'Rcommaaccent Umacron -40 Rcommaaccent Uogonek -40 Rcommaaccent '
+              'Uring -40 Rcommaaccent V -50 Rcommaaccent W -30 Rcommaaccent Y '
+              '-50 Rcommaaccent Yacute -50 Rcommaaccent Ydieresis -50 S comma '
+              '-20 S period -20 Sacute comma -20 Sacute period -20 Scaron '
+              'comma -20 Scaron period -20 Scedilla comma -20 Scedilla period '
+              '-20 Scommaaccent comma -20 Scommaaccent period -20 T A -120 T '
+              'Aacute -120 T Abreve -120 T Acircumflex -120 T Adieresis -120 '
+              'T Agrave -120 T Amacron -120 T Aogonek -120 T Aring -120 T '
+              'Atilde -120 T O -40 T Oacute -40 T Ocircumflex -40 T Odieresis '
+              '-40 T Ograve -40 T Ohungarumlaut -40 T Omacron -40 T Oslash '
+              '-40 T Otilde -40 T a -120 T aacute -120 T abreve -60 T '
+              'acircumflex -120 T adieresis -120 T agrave -120 T amacron -60 '
+              'T aogonek -120 T aring -120 T atilde -60 T colon -20 T comma '
+              '-120 T e -120 T eacute -120 T ecaron -120 T ecircumflex -120 T '
+              'edieresis -120 T edotaccent -120 T egrave -60 T emacron -60 T '
+              'eogonek -120 T hyphen -140 T o -120 T oacute -120 T '
+              'ocircumflex -120 T odieresis -120 T ograve -120 T '
+              'ohungarumlaut -120 T omacron -60 T oslash -120 T otilde -60 T '
+              'period -120 T r -120 T racute -120 T rcaron -120 T '
+              'rcommaaccent -120 T semicolon -20 T u -120 T uacute -120 T '
+              'ucircumflex -120 T udieresis -120 T ugrave -120 T '
+              'uhungarumlaut -120 T umacron -60 T uogonek -120 T uring -120 T '
+              'w -120 T y -120 T yacute -120 T ydieresis -60 Tcaron A -120 '
+              'Tcaron Aacute -120 Tcaron Abreve -120 Tcaron Acircumflex -120 '
+              'Tcaron Adieresis -120 Tcaron Agrave -120 Tcaron Amacron -120 '
+              'Tcaron Aogonek -120 Tcaron Aring -120 Tcaron Atilde -120 '
+              'Tcaron O -40 Tcaron Oacute -40 Tcaron Ocircumflex -40 Tcaron '
+              'Odieresis -40 Tcaron Ograve -40 Tcaron Ohungarumlaut -40 '
+              'Tcaron Omacron -40 Tcaron Oslash -40 Tcaron Otilde -40 Tcaron '
+              'a -120 Tcaron aacute -120 Tcaron abreve -60 Tcaron acircumflex '
+              '-120 Tcaron adieresis -120 Tcaron agrave -120 Tcaron amacron '
+              '-60 Tcaron aogonek -120 Tcaron aring -120 Tcaron atilde -60 '
+              'Tcaron colon -20 Tcaron comma -120 Tcaron e -120 Tcaron eacute '
+              '-120 Tcaron ecaron -120 Tcaron ecircumflex -120 Tcaron '
+              'edieresis -120 Tcaron edotaccent -120 Tcaron egrave -60 Tcaron '
+              'emacron -60 Tcaron eogonek -120 Tcaron hyphen -140 Tcaron o '
+              '-120 Tcaron oacute -120 Tcaron ocircumflex -120 Tcaron '
+              'odieresis -120 Tcaron ograve -120 Tcaron ohungarumlaut -120 '
+              'Tcaron omacron -60 Tcaron oslash -120 Tcaron otilde -60 Tcaron '
+              'period -120 Tcaron r -120 Tcaron racute -120 Tcaron rcaron '
+              '-120 Tcaron rcommaaccent -120 Tcaron semicolon -20 Tcaron u '
+              '-120 Tcaron uacute -120 Tcaron ucircumflex -120 Tcaron '
+              'udieresis -120 Tcaron ugrave -120 Tcaron uhungarumlaut -120 '
+              'Tcaron umacron -60 Tcaron uogonek -120 Tcaron uring -120 '
+              'Tcaron w -120 Tcaron y -120 Tcaron yacute -120 Tcaron '
+              'ydieresis -60 Tcommaaccent A -120 Tcommaaccent Aacute -120 '
+              'Tcommaaccent Abreve -120 Tcommaaccent Acircumflex -120 '
+              'Tcommaaccent Adieresis -120 Tcommaaccent Agrave -120 '
+              'Tcommaaccent Amacron -120 Tcommaaccent Aogonek -120 '
+              'Tcommaaccent Aring -120 Tcommaaccent Atilde -120 Tcommaaccent '
+              'O -40 Tcommaaccent Oacute -40 Tcommaaccent Ocircumflex -40 '
+              'Tcommaaccent Odieresis -40 Tcommaaccent Ograve -40 '
+              'Tcommaaccent Ohungarumlaut -40 Tcommaaccent Omacron -40 '
+              'Tcommaaccent Oslash -40 Tcommaaccent Otilde -40 Tcommaaccent a '
+              '-120 Tcommaaccent aacute -120 Tcommaaccent abreve -60 '
+              'Tcommaaccent acircumflex -120 Tcommaaccent adieresis -120 '
+              'Tcommaaccent agrave -120 Tcommaaccent amacron -60 Tcommaaccent '
+              'aogonek -120 Tcommaaccent aring -120 Tcommaaccent atilde -60 '
+              'Tcommaaccent colon -20 Tcommaaccent comma -120 Tcommaaccent e '
+              '-120 Tcommaaccent eacute -120 Tcommaaccent ecaron -120 '
+              'Tcommaaccent ecircumflex -120 Tcommaaccent edieresis -120 '
+              'Tcommaaccent edotaccent -120 Tcommaaccent egrave -60 '
+              'Tcommaaccent emacron -60 Tcommaaccent eogonek -120 '
+              'Tcommaaccent hyphen -140 Tcommaaccent o -120 Tcommaaccent '
+              'oacute -120 Tcommaaccent ocircumflex -120 Tcommaaccent '
+              'odieresis -120 Tcommaaccent ograve -120 Tcommaaccent '
+              'ohungarumlaut -120 Tcommaaccent omacron -60 Tcommaaccent '
+              'oslash -120 Tcommaaccent otilde -60 Tcommaaccent period -120 '
+              'Tcommaaccent r -120 Tcommaaccent racute -120 Tcommaaccent '
+              'rcaron -120 Tcommaaccent rcommaaccent -120 Tcommaaccent '
+              'semicolon -20 Tcommaaccent u -120 Tcommaaccent uacute -120 '
+              'Tcommaaccent ucircumflex -120 Tcommaaccent udieresis -120 '
+              'Tcommaaccent ugrave -120 Tcommaaccent uhungarumlaut -120 '
+              'Tcommaaccent umacron -60 Tcommaaccent uogonek -120 '
+              'Tcommaaccent uring -120 Tcommaaccent w -120 Tcommaaccent y '
+              '-120 Tcommaaccent yacute -120 Tcommaaccent ydieresis -60 U A '
+              '-40 U Aacute -40 U Abreve -40 U Acircumflex -40 U Adieresis '
+              '-40 U Agrave -40 U Amacron -40 U Aogonek -40 U Aring -40 U '
+              'Atilde -40 U comma -40 U period -40 Uacute A -40 Uacute Aacute '
+              '-40 Uacute Abreve -40 Uacute Acircumflex -40 Uacute Adieresis '
+              '-40 Uacute Agrave -40 Uacute Amacron -40 Uacute Aogonek -40 '
+              'Uacute Aring -40 Uacute Atilde -40 Uacute comma -40 Uacute '
+              'period -40 Ucircumflex A -40 Ucircumflex Aacute -40 '
+              'Ucircumflex Abreve -40 Ucircumflex Acircumflex -40 Ucircumflex '
+              'Adieresis -40 Ucircumflex Agrave -40 Ucircumflex Amacron -40 '
+              'Ucircumflex Aogonek -40 Ucircumflex Aring -40 Ucircumflex '
+              'Atilde -40 Ucircumflex comma -40 Ucircumflex period -40 '
+              'Udieresis A -40 Udieresis Aacute -40 Udieresis Abreve -40 '
+              'Udieresis Acircumflex -40 Udieresis Adieresis -40 Udieresis '
+              'Agrave -40 Udieresis Amacron -40 Udieresis Aogonek -40 '
+              'Udieresis Aring -40 Udieresis Atilde -40 Udieresis comma -40 '
+              'Udieresis period -40 Ugrave A -40 Ugrave Aacute -40 Ugrave '
+              'Abreve -40 Ugrave Acircumflex -40 Ugrave Adieresis -40 Ugrave '
+              'Agrave -40 Ugrave Amacron -40 Ugrave Aogonek -40 Ugrave Aring '
+              '-40 Ugrave Atilde -40 Ugrave comma -40 Ugrave period -40 '
+              'Uhungarumlaut A -40 Uhungarumlaut Aacute -40 Uhungarumlaut '
+              'Abreve -40 Uhungarumlaut Acircumflex -40 Uhungarumlaut '
+              'Adieresis -40 Uhungarumlaut Agrave -40 Uhungarumlaut Amacron '
+              '-40 Uhungarumlaut Aogonek -40 Uhungarumlaut Aring -40 '
+              'Uhungarumlaut Atilde -40 Uhungarumlaut comma -40 Uhungarumlaut '
+              'period -40 Umacron A -40 Umacron Aacute -40 Umacron Abreve -40 '
+              'Umacron Acircumflex -40 Umacron Adieresis -40 Umacron Agrave '
+              '-40 Umacron Amacron -40 Umacron Aogonek -40 Umacron Aring -40 '
+              'Umacron Atilde -40 Umacron comma -40 Umacron period -40 '
+              'Uogonek A -40 Uogonek Aacute -40 Uogonek Abreve -40 Uogonek '
+              'Acircumflex -40 Uogonek Adieresis -40 Uogonek Agrave -40 '
+              'Uogonek Amacron -40 Uogonek Aogonek -40 Uogonek Aring -40 '
+              'Uogonek Atilde -40 Uogonek comma -40 Uogonek period -40 Uring '
+              'A -40 Uring Aacute -40 Uring Abreve -40 Uring Acircumflex -40 '
+              'Uring Adieresis -40 Uring Agrave -40 Uring Amacron -40 Uring '
+              'Aogonek -40 Uring Aring -40 Uring Atilde -40 Uring comma -40 '
+              'Uring period -40 V A -80 V Aacute -80 V Abreve -80 V '
+              'Acircumflex -80 V Adieresis -80 V Agrave -80 V Amacron -80 V '
+              'Aogonek -80 V Aring -80 V Atilde -80 V G -40 V Gbreve -40 V '
+              'Gcommaaccent -40 V O -40 V Oacute -40 V Ocircumflex -40 V '
+              'Odieresis -40 V Ograve -40 V Ohungarumlaut -40 V Omacron -40 V '
+              'Oslash -40 V Otilde -40 V a -70 V aacute -70 V abreve -70 V '
+              'acircumflex -70 V adieresis -70 V agrave -70 V amacron -70 V '
+              'aogonek -70 V aring -70 V atilde -70 V colon -40 V comma -125 '
+              'V e -80 V eacute -80 V ecaron -80 V ecircumflex -80 V '
+              'edieresis -80 V edotaccent -80 V egrave -80 V emacron -80 V '
+              'eogonek -80 V hyphen -80 V o -80 V oacute -80 V ocircumflex '
+              '-80 V odieresis -80 V ograve -80 V ohungarumlaut -80 V omacron '
+              '-80 V oslash -80 V otilde -80 V period -125 V semicolon -40 V '
+              'u -70 V uacute -70 V ucircumflex -70 V udieresis -70 V ugrave '
+              '-70 V uhungarumlaut -70 V umacron -70 V uogonek -70 V uring '
+              '-70 W A -50 W Aacute -50 W Abreve -50 W Acircumflex -50 W '
+              'Adieresis -50 W Agrave -50 W Amacron -50 W Aogonek -50 W Aring '
+              '-50 W Atilde -50 W O -20 W Oacute -20 W Ocircumflex -20 W '
+              'Odieresis -20 W Ograve -20 W Ohungarumlaut -20 W Omacron -20 W '
+              'Oslash -20 W Otilde -20 W a -40 W aacute -40 W abreve -40 W '
+              'acircumflex -40 W adieresis -40 W agrave -40 W amacron -40 W '
+              'aogonek -40 W aring -40 W atilde -40 W comma -80 W e -30 W '
+              'eacute -30 W ecaron -30 W ecircumflex -30 W edieresis -30 W '
+              'edotaccent -30 W egrave -30 W emacron -30 W eogonek -30 W '
+              'hyphen -40 W o -30 W oacute -30 W ocircumflex -30 W odieresis '
+              '-30 W ograve -30 W ohungarumlaut -30 W omacron -30 W oslash '
+              '-30 W otilde -30 W period -80 W u -30 W uacute -30 W '
+              'ucircumflex -30 W udieresis -30 W ugrave -30 W uhungarumlaut '
+              '-30 W umacron -30 W uogonek -30 W uring -30 W y -20 W yacute '
+              '-20 W ydieresis -20 Y A -110 Y Aacute -110 Y Abreve -110 Y '
+              'Acircumflex -110 Y Adieresis -110 Y Agrave -110 Y Amacron -110 '
+              'Y Aogonek -110 Y Aring -110 Y Atilde -110 Y O -85 Y Oacute -85 '
+              'Y Ocircumflex -85 Y Odieresis -85 Y Ograve -85 Y Ohungarumlaut '
+              '-85 Y Omacron -85 Y Oslash -85 Y Otilde -85 Y a -140 Y aacute '
+              '-140 Y abreve -70 Y acircumflex -140 Y adieresis -140 Y agrave '
+              '-140 Y amacron -70 Y aogonek -140 Y aring -140 Y atilde -140 Y '
+              'colon -60 Y comma -140 Y e -140 Y eacute -140 Y ecaron -140 Y '
+              'ecircumflex -140 Y edieresis -140 Y edotaccent -140 Y egrave '
+              '-140 Y emacron -70 Y eogonek -140 Y hyphen -140 Y i -20 Y '
+              'iacute -20 Y iogonek -20 Y o -140 Y oacute -140 Y ocircumflex '
+              '-140 Y odieresis -140 Y ograve -140 Y ohungarumlaut -140 Y '
+              'omacron -140 Y oslash -140 Y otilde -140 Y period -140 Y '
+              'semicolon -60 Y u -110 Y uacute -110 Y ucircumflex -110 Y '
+              'udieresis -110 Y ugrave -110 Y uhungarumlaut -110 Y umacron '
+              '-110 Y uogonek -110 Y uring -110 Yacute A -110 Yacute Aacute '
+              '-110 Yacute Abreve -110 Yacute Acircumflex -110 Yacute '
+              'Adieresis -110 Yacute Agrave -110 Yacute Amacron -110 Yacute '
+              'Aogonek -110 Yacute Aring -110 Yacute Atilde -110 Yacute O -85 '
+              'Yacute Oacute -85 Yacute Ocircumflex -85 Yacute Odieresis -85 '
+              'Yacute Ograve -85 Yacute Ohungarumlaut -85 Yacute Omacron -85 '
+              'Yacute Oslash -85 Yacute Otilde -85 Yacute a -140 Yacute '
+              'aacute -140 Yacute abreve -70 Yacute acircumflex -140 Yacute '
+              'adieresis -140 Yacute agrave -140 Yacute amacron -70 Yacute '
+              'aogonek -140 Yacute aring -140 Yacute atilde -70 Yacute colon '
+              '-60 Yacute comma -140 Yacute e -140 Yacute eacute -140 Yacute '
+              'ecaron -140 Yacute ecircumflex -140 Yacute edieresis -140 '
+              'Yacute edotaccent -140 Yacute egrave -140 Yacute emacron -70 '
+              'Yacute eogonek -140 Yacute hyphen -140 Yacute i -20 Yacute '
+              'iacute -20 Yacute iogonek -20 Yacute o -140 Yacute oacute -140 '
+              'Yacute ocircumflex -140 Yacute odieresis -140 Yacute ograve '
+              '-140 Yacute ohungarumlaut -140 Yacute omacron -70 Yacute '
+              'oslash -140 Yacute otilde -140 Yacute period -140 Yacute '
+              'semicolon -60 Yacute u -110 Yacute uacute -110 Yacute '
+              'ucircumflex -110 Yacute udieresis -110 Yacute ugrave -110 '
+              'Yacute uhungarumlaut -110 Yacute umacron -110 Yacute uogonek '
+              '-110 Yacute uring -110 Ydieresis A -110 Ydieresis Aacute -110 '
+              'Ydieresis Abreve -110 Ydieresis Acircumflex -110 Ydieresis '
+              'Adieresis -110 Ydieresis Agrave -110 Ydieresis Amacron -110 '
+              'Ydieresis Aogonek -110 Ydieresis Aring -110 Ydieresis Atilde '
+              '-110 Ydieresis O -85 Ydieresis Oacute -85 Ydieresis '
+              'Ocircumflex -85 Ydieresis Odieresis -85 Ydieresis Ograve -85 '
+              'Ydieresis Ohungarumlaut -85 Ydieresis Omacron -85 Ydieresis '
+              'Oslash -85 Ydieresis Otilde -85 Ydieresis a -140 Ydieresis '
+              'aacute -140 Ydieresis abreve -70 Ydieresis acircumflex -140 '
+              'Ydieresis adieresis -140 Ydieresis agrave -140 Ydieresis '
+              'amacron -70 Ydieresis aogonek -140 Ydieresis aring -140 '
+              'Ydieresis atilde -70 Ydieresis colon -60 Ydieresis comma -140 '
+              'Ydieresis e -140 Ydieresis eacute -140 Ydieresis ecaron -140 '
+              'Ydieresis ecircumflex -140 Ydieresis edieresis -140 Ydieresis '
+              'edotaccent -140 Ydieresis egrave -140 Ydieresis emacron -70 '
+              'Ydieresis eogonek -140 Ydieresis hyphen -140 Ydieresis i -20 '
+              'Ydieresis iacute -20 Ydieresis iogonek -20 Ydieresis o -140 '
+              'Ydieresis oacute -140 Ydieresis ocircumflex -140 Ydieresis '
+              'odieresis -140 Ydieresis ograve -140 Ydieresis ohungarumlaut '
+              '-140 Ydieresis omacron -140 Ydieresis oslash -140 Ydieresis '
+              'otilde -140 Ydieresis period -140 Ydieresis semicolon -60 '
+              'Ydieresis u -110 Ydieresis uacute -110 Ydieresis ucircumflex '
+              '-110 Ydieresis udieresis -110 Ydieresis ugrave -110 Ydieresis '
+              'uhungarumlaut -110 Ydieresis umacron -110 Ydieresis uogonek '
+              '-110 Ydieresis uring -110 a v -20 a w -20 a y -30 a yacute -30 '
+              'a ydieresis -30 aacute v -20 aacute w -20 aacute y -30 aacute '
+              'yacute -30 aacute ydieresis -30 abreve v -20 abreve w -20 '
+              'abreve y -30 abreve yacute -30 abreve ydieresis -30 '
+              'acircumflex v -20 acircumflex w -20 acircumflex y -30 '
+              'acircumflex yacute -30 acircumflex ydieresis -30 adieresis v '
+              '-20 adieresis w -20 adieresis y -30 adieresis yacute -30 '
+              'adieresis ydieresis -30 agrave v -20 agrave w -20 agrave y -30 '
+              'agrave yacute -30 agrave ydieresis -30 amacron v -20 amacron w '
+              '-20 amacron y -30 amacron yacute -30 amacron ydieresis -30 '
+              'aogonek v -20 aogonek w -20 aogonek y -30 aogonek yacute -30 '
+              'aogonek ydieresis -30 aring v -20 aring w -20 aring y -30 '
+              'aring yacute -30 aring ydieresis -30 atilde v -20 atilde w -20 '
+              'atilde y -30 atilde yacute -30 atilde ydieresis -30 b b -10 b '
+              'comma -40 b l -20 b lacute -20 b lcommaaccent -20 b lslash -20 '
+              'b period -40 b u -20 b uacute -20 b ucircumflex -20 b '
+              'udieresis -20 b ugrave -20 b uhungarumlaut -20 b umacron -20 b '
+              'uogonek -20 b uring -20 b v -20 b y -20 b yacute -20 b '
+              'ydieresis -20 c comma -15 c k -20 c kcommaaccent -20 cacute '
+              'comma -15 cacute k -20 cacute kcommaaccent -20 ccaron comma '
+              '-15 ccaron k -20 ccaron kcommaaccent -20 ccedilla comma -15 '
+              'ccedilla k -20 ccedilla kcommaaccent -20 colon space -50 comma '
+              'quotedblright -100 comma quoteright -100 e comma -15 e period '
+              '-15 e v -30 e w -20 e x -30 e y -20 e yacute -20 e ydieresis '
+              '-20 eacute comma -15 eacute period -15 eacute v -30 eacute w '
+              '-20 eacute x -30 eacute y -20 eacute yacute -20 eacute '
+              'ydieresis -20 ecaron comma -15 ecaron period -15 ecaron v -30 '
+              'ecaron w -20 ecaron x -30 ecaron y -20 ecaron yacute -20 '
+              'ecaron ydieresis -20 ecircumflex comma -15 ecircumflex period '
+              '-15 ecircumflex v -30 ecircumflex w -20 ecircumflex x -30 '
+              'ecircumflex y -20 ecircumflex yacute -20 ecircumflex ydieresis '
+              '-20 edieresis comma -15 edieresis period -15 edieresis v -30 '
+              'edieresis w -20 edieresis x -30 edieresis y -20 edieresis '
+              'yacute -20 edieresis ydieresis -20 edotaccent comma -15 '
+              'edotaccent period -15 edotaccent v -30 edotaccent w -20 '
+              'edotaccent x -30 edotaccent y -20 edotaccent yacute -20 '
+              'edotaccent ydieresis -20 egrave comma -15 egrave period -15 '
+              'egrave v -30 egrave w -20 egrave x -30 egrave y -20 egrave '
+              'yacute -20 egrave ydieresis -20 emacron comma -15 emacron '
+              'period -15 emacron v -30 emacron w -20 emacron x -30 emacron y '
+              '-20 emacron yacute -20 emacron ydieresis -20 eogonek comma -15 '
+              'eogonek period -15 eogonek v -30 eogonek w -20 eogonek x -30 '
+              'eogonek y -20 eogonek yacute -20 eogonek ydieresis -20 f a -30 '
+              'f aacute -30 f abreve -30 f acircumflex -30 f adieresis -30 f '
+              'agrave -30 f amacron -30 f aogonek -30 f aring -30 f atilde '
+              '-30 f comma -30 f dotlessi -28 f e -30 f eacute -30 f ecaron '
+              '-30 f ecircumflex -30 f edieresis -30 f edotaccent -30 f '
+              'egrave -30 f emacron -30 f eogonek -30 f o -30 f oacute -30 f '
+              'ocircumflex -30 f odieresis -30 f ograve -30 f ohungarumlaut '
+              '-30 f omacron -30 f oslash -30 f otilde -30 f period -30 f '
+              'quotedblright 60 f quoteright 50 g r -10 g racute -10 g rcaron '
+              '-10 g rcommaaccent -10 gbreve r -10 gbreve racute -10 gbreve '
+              'rcaron -10 gbreve rcommaaccent -10 gcommaaccent r -10 '
+              'gcommaaccent racute -10 gcommaaccent rcaron -10 gcommaaccent '
+              'rcommaaccent -10 h y -30 h yacute -30 h ydieresis -30 k e -20 '
+              'k eacute -20 k ecaron -20 k ecircumflex -20 k edieresis -20 k '
+              'edotaccent -20 k egrave -20 k emacron -20 k eogonek -20 k o '
+              '-20 k oacute -20 k ocircumflex -20 k odieresis -20 k ograve '
+              '-20 k ohungarumlaut -20 k omacron -20 k oslash -20 k otilde '
+              '-20 kcommaaccent e -20 kcommaaccent eacute -20 kcommaaccent '
+              'ecaron -20 kcommaaccent ecircumflex -20 kcommaaccent edieresis '
+              '-20 kcommaaccent edotaccent -20 kcommaaccent egrave -20 '
+              'kcommaaccent emacron -20 kcommaaccent eogonek -20 kcommaaccent '
+              'o -20 kcommaaccent oacute -20 kcommaaccent ocircumflex -20 '
+              'kcommaaccent odieresis -20 kcommaaccent ograve -20 '
+              'kcommaaccent ohungarumlaut -20 kcommaaccent omacron -20 '
+              'kcommaaccent oslash -20 kcommaaccent otilde -20 m u -10 m '
+              'uacute -10 m ucircumflex -10 m udieresis -10 m ugrave -10 m '
+              'uhungarumlaut -10 m umacron -10 m uogonek -10 m uring -10 m y '
+              '-15 m yacute -15 m ydieresis -15 n u -10 n uacute -10 n '
+              'ucircumflex -10 n udieresis -10 n ugrave -10 n uhungarumlaut '
+              '-10 n umacron -10 n uogonek -10 n uring -10 n v -20 n y -15 n '
+              'yacute -15 n ydieresis -15 nacute u -10 nacute uacute -10 '
+              'nacute ucircumflex -10 nacute udieresis -10 nacute ugrave -10 '
+              'nacute uhungarumlaut -10 nacute umacron -10 nacute uogonek -10 '
+              'nacute uring -10 nacute v -20 nacute y -15 nacute yacute -15 '
+              'nacute ydieresis -15 ncaron u -10 ncaron uacute -10 ncaron '
+              'ucircumflex -10 ncaron udieresis -10 ncaron ugrave -10 ncaron '
+              'uhungarumlaut -10 ncaron umacron -10 ncaron uogonek -10 ncaron '
+              'uring -10 ncaron v -20 ncaron y -15 ncaron yacute -15 ncaron '
+              'ydieresis -15 ncommaaccent u -10 ncommaaccent uacute -10 '
+              'ncommaaccent ucircumflex -10 ncommaaccent udieresis -10 '
+              'ncommaaccent ugrave -10 ncommaaccent uhungarumlaut -10 '
+              'ncommaaccent umacron -10 ncommaaccent uogonek -10 ncommaaccent '
+              'uring -10 ncommaaccent v -20 ncommaaccent y -15 ncommaaccent '
+              'yacute -15 ncommaaccent ydieresis -15 ntilde u -10 ntilde '
+              'uacute -10 ntilde ucircumflex -10 ntilde udieresis -10 ntilde '
+              'ugrave -10 ntilde uhungarumlaut -10 ntilde umacron -10 ntilde '
+              'uogonek -10 ntilde uring -10 ntilde v -20 ntilde y -15 ntilde '
+              'yacute -15 ntilde ydieresis -15 o comma -40 o period -40 o v '
+              '-15 o w -15 o x -30 o y -30 o yacute -30 o ydieresis -30 '
+              'oacute comma -40 oacute period -40 oacute v -15 oacute w -15 '
+              'oacute x -30 oacute y -30 oacute yacute -30 oacute ydieresis '
+              '-30 ocircumflex comma -40 ocircumflex period -40 ocircumflex v '
+              '-15 ocircumflex w -15 ocircumflex x -30 ocircumflex y -30 '
+              'ocircumflex yacute -30 ocircumflex ydieresis -30 odieresis '
+              'comma -40 odieresis period -40 odieresis v -15 odieresis w -15 '
+              'odieresis x -30 odieresis y -30 odieresis yacute -30 odieresis '
+              'ydieresis -30 ograve comma -40 ograve period -40 ograve v -15 '
+              'ograve w -15 ograve x -30 ograve y -30 ograve yacute -30 '
+              'ograve ydieresis -30 ohungarumlaut comma -40 ohungarumlaut '
+              'period -40 ohungarumlaut v -15 ohungarumlaut w -15 '
+              'ohungarumlaut x -30 ohungarumlaut y -30 ohungarumlaut yacute '
+              '-30 ohungarumlaut ydieresis -30 omacron comma -40 omacron '
+              'period -40 omacron v -15 omacron w -15 omacron x -30 omacron y '
+              '-30 omacron yacute -30 omacron ydieresis -30 oslash a -55 '
+              'oslash aacute -55 oslash abreve -55 oslash acircumflex -55 '
+              'oslash adieresis -55 oslash agrave -55 oslash amacron -55 '
+              'oslash aogonek -55 oslash aring -55 oslash atilde -55 oslash b '
+              '-55 oslash c -55 oslash cacute -55 oslash ccaron -55 oslash '
+              'ccedilla -55 oslash comma -95 oslash d -55 oslash dcroat -55 '
+              'oslash e -55 oslash eacute -55 oslash ecaron -55 oslash '
+              'ecircumflex -55 oslash edieresis -55 oslash edotaccent -55 '
+              'oslash egrave -55 oslash emacron -55 oslash eogonek -55 oslash '
+              'f -55 oslash g -55 oslash gbreve -55 oslash gcommaaccent -55 '
+              'oslash h -55 oslash i -55 oslash iacute -55 oslash icircumflex '
+              '-55 oslash idieresis -55 oslash igrave -55 oslash imacron -55 '
+              'oslash iogonek -55 oslash j -55 oslash k -55 oslash '
+              'kcommaaccent -55 oslash l -55 oslash lacute -55 oslash '
+              'lcommaaccent -55 oslash lslash -55 oslash m -55 oslash n -55 '
+              'oslash nacute -55 oslash ncaron -55 oslash ncommaaccent -55 '
+              'oslash ntilde -55 oslash o -55 oslash oacute -55 oslash '
+              'ocircumflex -55 oslash odieresis -55 oslash ograve -55 oslash '
+              'ohungarumlaut -55 oslash omacron -55 oslash oslash -55 oslash '
+              'otilde -55 oslash p -55 oslash period -95 oslash q -55 oslash '
+              'r -55 oslash racute -55 oslash rcaron -55 oslash rcommaaccent '
+              '-55 oslash s -55 oslash sacute -55 oslash scaron -55 oslash '
+              'scedilla -55 oslash scommaaccent -55 oslash t -55 oslash '
+              'tcommaaccent -55 oslash u -55 oslash uacute -55 oslash '
+              'ucircumflex -55 oslash udieresis -55 oslash ugrave -55 oslash '
+              'uhungarumlaut -55 oslash umacron -55 oslash uogonek -55 oslash '
+              'uring -55 oslash v -70 oslash w -70 oslash x -85 oslash y -70 '
+              'oslash yacute -70 oslash ydieresis -70 oslash z -55 oslash '
+              'zacute -55 oslash zcaron -55 oslash zdotaccent -55 otilde '
+              'comma -40 otilde period -40 otilde v -15 otilde w -15 otilde x '
+              '-30 otilde y -30 otilde yacute -30 otilde ydieresis -30 p '
+              'comma -35 p period -35 p y -30 p yacute -30 p ydieresis -30 '
+              'period quotedblright -100 period quoteright -100 period space '
+              '-60 quotedblright space -40 quoteleft quoteleft -57 quoteright '
+              'd -50 quoteright dcroat -50 quoteright quoteright -57 '
+              'quoteright r -50 quoteright racute -50 quoteright rcaron -50 '
+              'quoteright rcommaaccent -50 quoteright s -50 quoteright sacute '
+              '-50 quoteright scaron -50 quoteright scedilla -50 quoteright '
+              'scommaaccent -50 quoteright space -70 r a -10 r aacute -10 r '
+              'abreve -10 r acircumflex -10 r adieresis -10 r agrave -10 r '
+              'amacron -10 r aogonek -10 r aring -10 r atilde -10 r colon 30 '
+              'r comma -50 r i 15 r iacute 15 r icircumflex 15 r idieresis 15 '
+              'r igrave 15 r imacron 15 r iogonek 15 r k 15 r kcommaaccent 15 '
+              'r l 15 r lacute 15 r lcommaaccent 15 r lslash 15 r m 25 r n 25 '
+              'r nacute 25 r ncaron 25 r ncommaaccent 25 r ntilde 25 r p 30 r '
+              'period -50 r semicolon 30 r t 40 r tcommaaccent 40 r u 15 r '
+              'uacute 15 r ucircumflex 15 r udieresis 15 r ugrave 15 r '
+              'uhungarumlaut 15 r umacron 15 r uogonek 15 r uring 15 r v 30 r '
+              'y 30 r yacute 30 r ydieresis 30 racute a -10 racute aacute -10 '
+              'racute abreve -10 racute acircumflex -10 racute adieresis -10 '
+              'racute agrave -10 racute amacron -10 racute aogonek -10 racute '
+              'aring -10 racute atilde -10 racute colon 30 racute comma -50 '
+              'racute i 15 racute iacute 15 racute icircumflex 15 racute '
+              'idieresis 15 racute igrave 15 racute imacron 15 racute iogonek '
+              '15 racute k 15 racute kcommaaccent 15 racute l 15 racute '
+              'lacute 15 racute lcommaaccent 15 racute lslash 15 racute m 25 '
+              'racute n 25 racute nacute 25 racute ncaron 25 racute '
+              'ncommaaccent 25 racute ntilde 25 racute p 30 racute period -50 '
+              'racute semicolon 30 racute t 40 racute tcommaaccent 40 racute '
+              'u 15 racute uacute 15 racute ucircumflex 15 racute udieresis '
+              '15 racute ugrave 15 racute uhungarumlaut 15 racute umacron 15 '
+              'racute uogonek 15 racute uring 15 racute v 30 racute y 30 '
+              'racute yacute 30 racute ydieresis 30 rcaron a -10 rcaron '
+              'aacute -10 rcaron abreve -10 rcaron acircumflex -10 rcaron '
+              'adieresis -10 rcaron agrave -10 rcaron amacron -10 rcaron '
+              'aogonek -10 rcaron aring -10 rcaron atilde -10 rcaron colon 30 '
+              'rcaron comma -50 rcaron i 15 rcaron iacute 15 rcaron '
+              'icircumflex 15 rcaron idieresis 15 rcaron igrave 15 rcaron '
+              'imacron 15 rcaron iogonek 15 rcaron k 15 rcaron kcommaaccent '
+              '15 rcaron l 15 rcaron lacute 15 rcaron lcommaaccent 15 rcaron '
+              'lslash 15 rcaron m 25 rcaron n 25 rcaron nacute 25 rcaron '
+              'ncaron 25 rcaron ncommaaccent 25 rcaron ntilde 25 rcaron p 30 '
+              'rcaron period -50 rcaron semicolon 30 rcaron t 40 rcaron '
+              'tcommaaccent 40 rcaron u 15 rcaron uacute 15 rcaron '
+              'ucircumflex 15 rcaron udieresis 15 rcaron ugrave 15 rcaron '
+              'uhungarumlaut 15 rcaron umacron 15 rcaron uogonek 15 rcaron '
+              'uring 15 rcaron v 30 rcaron y 30 rcaron yacute 30 rcaron '
+              'ydieresis 30 rcommaaccent a -10 rcommaaccent aacute -10 '
+              'rcommaaccent abreve -10 rcommaaccent acircumflex -10 '
+              'rcommaaccent adieresis -10 rcommaaccent agrave -10 '
+              'rcommaaccent amacron -10 rcommaaccent aogonek -10 rcommaaccent '
+              'aring -10 rcommaaccent atilde -10 rcommaaccent colon 30 '
+              'rcommaaccent comma -50 rcommaaccent i 15 rcommaaccent iacute '
+              '15 rcommaaccent icircumflex 15 rcommaaccent idieresis 15 '
+              'rcommaaccent igrave 15 rcommaaccent imacron 15 rcommaaccent '
+              'iogonek 15 rcommaaccent k 15 rcommaaccent kcommaaccent 15 '
+              'rcommaaccent l 15 rcommaaccent lacute 15 rcommaaccent '
+              'lcommaaccent 15 rcommaaccent lslash 15 rcommaaccent m 25 '
+              'rcommaaccent n 25 rcommaaccent nacute 25 rcommaaccent ncaron '
+              '25 rcommaaccent ncommaaccent 25 rcommaaccent ntilde 25 '
+              'rcommaaccent p 30 rcommaaccent period -50 rcommaaccent '
+              'semicolon 30 rcommaaccent t 40 rcommaaccent tcommaaccent 40 '
+              'rcommaaccent u 15 rcommaaccent uacute 15 rcommaaccent '
+              'ucircumflex 15 rcommaaccent udieresis 15 rcommaaccent ugrave '
+              '15 rcommaaccent uhungarumlaut 15 rcommaaccent umacron 15 '
+              'rcommaaccent uogonek 15 rcommaaccent uring 15 rcommaaccent v '
+              '30 rcommaaccent y 30 rcommaaccent yacute 30 rcommaaccent '
+              'ydieresis 30 s comma -15 s period -15 s w -30 sacute comma -15 '
+              'sacute period -15 sacute w -30 scaron comma -15 scaron period '
+              '-15 scaron w -30 scedilla comma -15 scedilla period -15 '
+              'scedilla w -30 scommaaccent comma -15 scommaaccent period -15 '
+              'scommaaccent w -30 semicolon space -50 space T -50 space '
+              'Tcaron -50 space Tcommaaccent -50 space V -50 space W -40 '
+              'space Y -90 space Yacute -90 space Ydieresis -90 space '
+              'quotedblleft -30 space quoteleft -60 v a -25 v aacute -25 v '
+              'abreve -25 v acircumflex -25 v adieresis -25 v agrave -25 v '
+              'amacron -25 v aogonek -25 v aring -25 v atilde -25 v comma -80 '
+              'v e -25 v eacute -25 v ecaron -25 v ecircumflex -25 v '
+              'edieresis -25 v edotaccent -25 v egrave -25 v emacron -25 v '
+              'eogonek -25 v o -25 v oacute -25 v ocircumflex -25 v odieresis '
+              '-25 v ograve -25 v ohungarumlaut -25 v omacron -25 v oslash '
+              '-25 v otilde -25 v period -80 w a -15 w aacute -15 w abreve '
+              '-15 w acircumflex -15 w adieresis -15 w agrave -15 w amacron '
+              '-15 w aogonek -15 w aring -15 w atilde -15 w comma -60 w e -10 '
+              'w eacute -10 w ecaron -10 w ecircumflex -10 w edieresis -10 w '
+              'edotaccent -10 w egrave -10 w emacron -10 w eogonek -10 w o '
+              '-10 w oacute -10 w ocircumflex -10 w odieresis -10 w ograve '
+              '-10 w ohungarumlaut -10 w omacron -10 w oslash -10 w otilde '
+              '-10 w period -60 x e -30 x eacute -30 x ecaron -30 x '
+              'ecircumflex -30 x edieresis -30 x edotaccent -30 x egrave -30 '
+              'x emacron -30 x eogonek -30 y a -20 y aacute -20 y abreve -20 '
+              'y acircumflex -20 y adieresis -20 y agrave -20 y amacron -20 y '
+              'aogonek -20 y aring -20 y atilde -20 y comma -100 y e -20 y '
+              'eacute -20 y ecaron -20 y ecircumflex -20 y edieresis -20 y '
+              'edotaccent -20 y egrave -20 y emacron -20 y eogonek -20 y o '
+              '-20 y oacute -20 y ocircumflex -20 y odieresis -20 y ograve '
+              '-20 y ohungarumlaut -20 y omacron -20 y oslash -20 y otilde '
+              '-20 y period -100 yacute a -20 yacute aacute -20 yacute abreve '
+              '-20 yacute acircumflex -20 yacute adieresis -20 yacute agrave '
+              '-20 yacute amacron -20 yacute aogonek -20 yacute aring -20 '
+              'yacute atilde -20 yacute comma -100 yacute e -20 yacute eacute '
+              '-20 yacute ecaron -20 yacute ecircumflex -20 yacute edieresis '
+              '-20 yacute edotaccent -20 yacute egrave -20 yacute emacron -20 '
+              'yacute eogonek -20 yacute o -20 yacute oacute -20 yacute '
+              'ocircumflex -20 yacute odieresis -20 yacute ograve -20 yacute '
+              'ohungarumlaut -20 yacute omacron -20 yacute oslash -20 yacute '
+              'otilde -20 yacute period -100 ydieresis a -20 ydieresis aacute '
+              '-20 ydieresis abreve -20 ydieresis acircumflex -20 ydieresis '
+              'adieresis -20 ydieresis agrave -20 ydieresis amacron -20 '
+              'ydieresis aogonek -20 ydieresis aring -20 ydieresis atilde -20 '
+              'ydieresis comma -100 ydieresis e -20 ydieresis eacute -20 '
+              'ydieresis ecaron -20 ydieresis ecircumflex -20 ydieresis '
+              'edieresis -20 ydieresis edotaccent -20 ydieresis egrave -20 '
+              'ydieresis emacron -20 ydieresis eogonek -20 ydieresis o -20 '
+              'ydieresis oacute -20 ydieresis ocircumflex -20 ydieresis '
+              'odieresis -20 ydieresis ograve -20 ydieresis ohungarumlaut -20 '
+              'ydieresis omacron -20 ydieresis oslash -20 ydieresis otilde '
+              '-20 ydieresis period -100 z e -15 z eacute -15 z ecaron -15 z '
+              'ecircumflex -15 z edieresis -15 z edotaccent -15 z egrave -15 '
+              'z emacron -15 z eogonek -15 z o -15 z oacute -15 z ocircumflex '
+              '-15 z odieresis -15 z ograve -15 z ohungarumlaut -15 z omacron '
+              '-15 z oslash -15 z otilde -15 zacute e -15 zacute eacute -15 '
+              'zacute ecaron -15 zacute ecircumflex -15 zacute edieresis -15 '
+              'zacute edotaccent -15 zacute egrave -15 zacute emacron -15 '
+              'zacute eogonek -15 zacute o -15 zacute oacute -15 zacute '
+              'ocircumflex -15 zacute odieresis -15 zacute ograve -15 zacute '
+              'ohungarumlaut -15 zacute omacron -15 zacute oslash -15 zacute '
+              'otilde -15 zcaron e -15 zcaron eacute -15 zcaron ecaron -15 '
+              'zcaron ecircumflex -15 zcaron edieresis -15 zcaron edotaccent '
+              '-15 zcaron egrave -15 zcaron emacron -15 zcaron eogonek -15 '
+              'zcaron o -15 zcaron oacute -15 zcaron ocircumflex -15 zcaron '
+              'odieresis -15 zcaron ograve -15 zcaron ohungarumlaut -15 '
+              'zcaron omacron -15 zcaron oslash -15 zcaron otilde -15 '
+              'zdotaccent e -15 zdotaccent eacute -15 zdotaccent ecaron -15 '
+              'zdotaccent ecircumflex -15 zdotaccent edieresis -15 zdotaccent '
+              'edotaccent -15 zdotaccent egrave -15 zdotaccent emacron -15 '
+              'zdotaccent eogonek -15 zdotaccent o -15 zdotaccent oacute -15 '
+              'zdotaccent ocircumflex -15 zdotaccent odieresis -15 zdotaccent '
+              'ograve -15 zdotaccent ohungarumlaut -15 zdotaccent omacron -15 '
+              'zdotaccent oslash -15 zdotaccent otilde -15',
+ 'Helvetica-Bold': 'A C -40 A Cacute -40 A Ccaron -40 A Ccedilla -40 A G -50 '
+                   'A Gbreve -50 A Gcommaaccent -50 A O -40 A Oacute -40 A '
+                   'Ocircumflex -40 A Odieresis -40 A Ograve -40 A '
+                   'Ohungarumlaut -40 A Omacron -40 A Oslash -40 A Otilde -40 '
+                   'A Q -40 A T -90 A Tcaron -90 A Tcommaaccent -90 A U -50 A '
+                   'Uacute -50 A Ucircumflex -50 A Udieresis -50 A Ugrave -50 '
+                   'A Uhungarumlaut -50 A Umacron -50 A Uogonek -50 A Uring '
+                   '-50 A V -80 A W -60 A Y -110 A Yacute -110 A Ydieresis '
+                   '-110 A u -30 A uacute -30 A ucircumflex -30 A udieresis '
+                   '-30 A ugrave -30 A uhungarumlaut -30 A umacron -30 A '
+                   'uogonek -30 A uring -30 A v -40 A w -30 A y -30 A yacute '
+                   '-30 A ydieresis -30 Aacute C -40 Aacute Cacute -40 Aacute '
+                   'Ccaron -40 Aacute Ccedilla -40 Aacute G -50 Aacute Gbreve '
+                   '-50 Aacute Gcommaaccent -50 Aacute O -40 Aacute Oacute '
+                   '-40 Aacute Ocircumflex -40 Aacute Odieresis -40 Aacute '
+                   'Ograve -40 Aacute Ohungarumlaut -40 Aacute Omacron -40 '
+                   'Aacute Oslash -40 Aacute Otilde -40 Aacute Q -40 Aacute T '
+                   '-90 Aacute Tcaron -90 Aacute Tcommaaccent -90 Aacute U '
+                   '-50 Aacute Uacute -50 Aacute Ucircumflex -50 Aacute '
+                   'Udieresis -50 Aacute Ugrave -50 Aacute Uhungarumlaut -50 '
+                   'Aacute Umacron -50 Aacute Uogonek -50 Aacute Uring -50 '
+                   'Aacute V -80 Aacute W -60 Aacute Y -110 Aacute Yacute '
+                   '-110 Aacute Ydieresis -110 Aacute u -30 Aacute uacute -30 '
+                   'Aacute ucircumflex -30 Aacute udieresis -30 Aacute ugrave '
+                   '-30 Aacute uhungarumlaut -30 Aacute umacron -30 Aacute '
+                   'uogonek -30 Aacute uring -30 Aacute v -40 Aacute w -30 '
+                   'Aacute y -30 Aacute yacute -30 Aacute ydieresis -30 '
+                   'Abreve C -40 Abreve Cacute -40 Abreve Ccaron -40 Abreve '
+                   'Ccedilla -40 Abreve G -50 Abreve Gbreve -50 Abreve '
+                   'Gcommaaccent -50 Abreve O -40 Abreve Oacute -40 Abreve '
+                   'Ocircumflex -40 Abreve Odieresis -40 Abreve Ograve -40 '
+                   'Abreve Ohungarumlaut -40 Abreve Omacron -40 Abreve Oslash '
+                   '-40 Abreve Otilde -40 Abreve Q -40 Abreve T -90 Abreve '
+                   'Tcaron -90 Abreve Tcommaaccent -90 Abreve U -50 Abreve '
+                   'Uacute -50 Abreve Ucircumflex -50 Abreve Udieresis -50 '
+                   'Abreve Ugrave -50 Abreve Uhungarumlaut -50 Abreve Umacron '
+                   '-50 Abreve Uogonek -50 Abreve Uring -50 Abreve V -80 '
+                   'Abreve W -60 Abreve Y -110 Abreve Yacute -110 Abreve '
+                   'Ydieresis -110 Abreve u -30 Abreve uacute -30 Abreve '
+                   'ucircumflex -30 Abreve udieresis -30 Abreve ugrave -30 '
+                   'Abreve uhungarumlaut -30 Abreve umacron -30 Abreve '
+                   'uogonek -30 Abreve uring -30 Abreve v -40 Abreve w -30 '
+                   'Abreve y -30 Abreve yacute -30 Abreve ydieresis -30 '
+                   'Acircumflex C -40 Acircumflex Cacute -40 Acircumflex '
+                   'Ccaron -40 Acircumflex Ccedilla -40 Acircumflex G -50 '
+                   'Acircumflex Gbreve -50 Acircumflex Gcommaaccent -50 '
+                   'Acircumflex O -40 Acircumflex Oacute -40 Acircumflex '
+                   'Ocircumflex -40 Acircumflex Odieresis -40 Acircumflex '
+                   'Ograve -40 Acircumflex Ohungarumlaut -40 Acircumflex '
+                   'Omacron -40 Acircumflex Oslash -40 Acircumflex Otilde -40 '
+                   'Acircumflex Q -40 Acircumflex T -90 Acircumflex Tcaron '
+                   '-90 Acircumflex Tcommaaccent -90 Acircumflex U -50 '
+                   'Acircumflex Uacute -50 Acircumflex Ucircumflex -50 '
+                   'Acircumflex Udieresis -50 Acircumflex Ugrave -50 '
+                   'Acircumflex Uhungarumlaut -50 Acircumflex Umacron -50 '
+                   'Acircumflex Uogonek -50 Acircumflex Uring -50 Acircumflex '
+                   'V -80 Acircumflex W -60 Acircumflex Y -110 Acircumflex '
+                   'Yacute -110 Acircumflex Ydieresis -110 Acircumflex u -30 '
+                   'Acircumflex uacute -30 Acircumflex ucircumflex -30 '
+                   'Acircumflex udieresis -30 Acircumflex ugrave -30 '
+                   'Acircumflex uhungarumlaut -30 Acircumflex umacron -30 '
+                   'Acircumflex uogonek -30 Acircumflex uring -30 Acircumflex '
+                   'v -40 Acircumflex w -30 Acircumflex y -30 Acircumflex '
+                   'yacute -30 Acircumflex ydieresis -30 Adieresis C -40 '
+                   'Adieresis Cacute -40 Adieresis Ccaron -40 Adieresis '
+                   'Ccedilla -40 Adieresis G -50 Adieresis Gbreve -50 '
+                   'Adieresis Gcommaaccent -50 Adieresis O -40 Adieresis '
+                   'Oacute -40 Adieresis Ocircumflex -40 Adieresis Odieresis '
+                   '-40 Adieresis Ograve -40 Adieresis Ohungarumlaut -40 '
+                   'Adieresis Omacron -40 Adieresis Oslash -40 Adieresis '
+                   'Otilde -40 Adieresis Q -40 Adieresis T -90 Adieresis '
+                   'Tcaron -90 Adieresis Tcommaaccent -90 Adieresis U -50 '
+                   'Adieresis Uacute -50 Adieresis Ucircumflex -50 Adieresis '
+                   'Udieresis -50 Adieresis Ugrave -50 Adieresis '
+                   'Uhungarumlaut -50 Adieresis Umacron -50 Adieresis Uogonek '
+                   '-50 Adieresis Uring -50 Adieresis V -80 Adieresis W -60 '
+                   'Adieresis Y -110 Adieresis Yacute -110 Adieresis '
+                   'Ydieresis -110 Adieresis u -30 Adieresis uacute -30 '
+                   'Adieresis ucircumflex -30 Adieresis udieresis -30 '
+                   'Adieresis ugrave -30 Adieresis uhungarumlaut -30 '
+                   'Adieresis umacron -30 Adieresis uogonek -30 Adieresis '
+                   'uring -30 Adieresis v -40 Adieresis w -30 Adieresis y -30 '
+                   'Adieresis yacute -30 Adieresis ydieresis -30 Agrave C -40 '
+                   'Agrave Cacute -40 Agrave Ccaron -40 Agrave Ccedilla -40 '
+                   'Agrave G -50 Agrave Gbreve -50 Agrave Gcommaaccent -50 '
+                   'Agrave O -40 Agrave Oacute -40 Agrave Ocircumflex -40 '
+                   'Agrave Odieresis -40 Agrave Ograve -40 Agrave '
+                   'Ohungarumlaut -40 Agrave Omacron -40 Agrave Oslash -40 '
+                   'Agrave Otilde -40 Agrave Q -40 Agrave T -90 Agrave Tcaron '
+                   '-90 Agrave Tcommaaccent -90 Agrave U -50 Agrave Uacute '
+                   '-50 Agrave Ucircumflex -50 Agrave Udieresis -50 Agrave '
+                   'Ugrave -50 Agrave Uhungarumlaut -50 Agrave Umacron -50 '
+                   'Agrave Uogonek -50 Agrave Uring -50 Agrave V -80 Agrave W '
+                   '-60 Agrave Y -110 Agrave Yacute -110 Agrave Ydieresis '
+                   '-110 Agrave u -30 Agrave uacute -30 Agrave ucircumflex '
+                   '-30 Agrave udieresis -30 Agrave ugrave -30 Agrave '
+                   'uhungarumlaut -30 Agrave umacron -30 Agrave uogonek -30 '
+                   'Agrave uring -30 Agrave v -40 Agrave w -30 Agrave y -30 '
+                   'Agrave yacute -30 Agrave ydieresis -30 Amacron C -40 '
+                   'Amacron Cacute -40 Amacron Ccaron -40 Amacron Ccedilla '
+                   '-40 Amacron G -50 Amacron Gbreve -50 Amacron Gcommaaccent '
+                   '-50 Amacron O -40 Amacron Oacute -40 Amacron Ocircumflex '
+                   '-40 Amacron Odieresis -40 Amacron Ograve -40 Amacron '
+                   'Ohungarumlaut -40 Amacron Omacron -40 Amacron Oslash -40 '
+                   'Amacron Otilde -40 Amacron Q -40 Amacron T -90 Amacron '
+                   'Tcaron -90 Amacron Tcommaaccent -90 Amacron U -50 Amacron '
+                   'Uacute -50 Amacron Ucircumflex -50 Amacron Udieresis -50 '
+                   'Amacron Ugrave -50 Amacron Uhungarumlaut -50 Amacron '
+                   'Umacron -50 Amacron Uogonek -50 Amacron Uring -50 Amacron '
+                   'V -80 Amacron W -60 Amacron Y -110 Amacron Yacute -110 '
+                   'Amacron Ydieresis -110 Amacron u -30 Amacron uacute -30 '
+                   'Amacron ucircumflex -30 Amacron udieresis -30 Amacron '
+                   'ugrave -30 Amacron uhungarumlaut -30 Amacron umacron -30 '
+                   'Amacron uogonek -30 Amacron uring -30 Amacron v -40 '
+                   'Amacron w -30 Amacron y -30 Amacron yacute -30 Amacron '
+                   'ydieresis -30 Aogonek C -40 Aogonek Cacute -40 Aogonek '
+                   'Ccaron -40 Aogonek Ccedilla -40 Aogonek G -50 Aogonek '
+                   'Gbreve -50 Aogonek Gcommaaccent -50 Aogonek O -40 Aogonek '
+                   'Oacute -40 Aogonek Ocircumflex -40 Aogonek Odieresis -40 '
+                   'Aogonek Ograve -40 Aogonek Ohungarumlaut -40 Aogonek '
+                   'Omacron -40 Aogonek Oslash -40 Aogonek Otilde -40 Aogonek '
+                   'Q -40 Aogonek T -90 Aogonek Tcaron -90 Aogonek '
+                   'Tcommaaccent -90 Aogonek U -50 Aogonek Uacute -50 Aogonek '
+                   'Ucircumflex -50 Aogonek Udieresis -50 Aogonek Ugrave -50 '
+                   'Aogonek Uhungarumlaut -50 Aogonek Umacron -50 Aogonek '
+                   'Uogonek -50 Aogonek Uring -50 Aogonek V -80 Aogonek W -60 '
+                   'Aogonek Y -110 Aogonek Yacute -110 Aogonek Ydieresis -110 '
+                   'Aogonek u -30 Aogonek uacute -30 Aogonek ucircumflex -30 '
+                   'Aogonek udieresis -30 Aogonek ugrave -30 Aogonek '
+                   'uhungarumlaut -30 Aogonek umacron -30 Aogonek uogonek -30 '
+                   'Aogonek uring -30 Aogonek v -40 Aogonek w -30 Aogonek y '
+                   '-30 Aogonek yacute -30 Aogonek ydieresis -30 Aring C -40 '
+                   'Aring Cacute -40 Aring Ccaron -40 Aring Ccedilla -40 '
+                   'Aring G -50 Aring Gbreve -50 Aring Gcommaaccent -50 Aring '
+                   'O -40 Aring Oacute -40 Aring Ocircumflex -40 Aring '
+                   'Odieresis -40 Aring Ograve -40 Aring Ohungarumlaut -40 '
+                   'Aring Omacron -40 Aring Oslash -40 Aring Otilde -40 Aring '
+                   'Q -40 Aring T -90 Aring Tcaron -90 Aring Tcommaaccent -90 '
+                   'Aring U -50 Aring Uacute -50 Aring Ucircumflex -50 Aring '
+                   'Udieresis -50 Aring Ugrave -50 Aring Uhungarumlaut -50 '
+                   'Aring Umacron -50 Aring Uogonek -50 Aring Uring -50 Aring '
+                   'V -80 Aring W -60 Aring Y -110 Aring Yacute -110 Aring '
+                   'Ydieresis -110 Aring u -30 Aring uacute -30 Aring '
+                   'ucircumflex -30 Aring udieresis -30 Aring ugrave -30 '
+                   'Aring uhungarumlaut -30 Aring umacron -30 Aring uogonek '
+                   '-30 Aring uring -30 Aring v -40 Aring w -30 Aring y -30 '
+                   'Aring yacute -30 Aring ydieresis -30 Atilde C -40 Atilde '
+                   'Cacute -40 Atilde Ccaron -40 Atilde Ccedilla -40 Atilde G '
+                   '-50 Atilde Gbreve -50 Atilde Gcommaaccent -50 Atilde O '
+                   '-40 Atilde Oacute -40 Atilde Ocircumflex -40 Atilde '
+                   'Odieresis -40 Atilde Ograve -40 Atilde Ohungarumlaut -40 '
+                   'Atilde Omacron -40 Atilde Oslash -40 Atilde Otilde -40 '
+                   'Atilde Q -40 Atilde T -90 Atilde Tcaron -90 Atilde '
+                   'Tcommaaccent -90 Atilde U -50 Atilde Uacute -50 Atilde '
+                   'Ucircumflex -50 Atilde Udieresis -50 Atilde Ugrave -50 '
+                   'Atilde Uhungarumlaut -50 Atilde Umacron -50 Atilde '
+                   'Uogonek -50 Atilde Uring -50 Atilde V -80 Atilde W -60 '
+                   'Atilde Y -110 Atilde Yacute -110 Atilde Ydieresis -110 '
+                   'Atilde u -30 Atilde uacute -30 Atilde ucircumflex -30 '
+                   'Atilde udieresis -30 Atilde ugrave -30 Atilde '
+                   'uhungarumlaut -30 Atilde umacron -30 Atilde uogonek -30 '
+                   'Atilde uring -30 Atilde v -40 Atilde w -30 Atilde y -30 '
+                   'Atilde yacute -30 Atilde ydieresis -30 B A -30 B Aacute '
+                   '-30 B Abreve -30 B Acircumflex -30 B Adieresis -30 B '
+                   'Agrave -30 B Amacron -30 B Aogonek -30 B Aring -30 B '
+                   'Atilde -30 B U -10 B Uacute -10 B Ucircumflex -10 B '
+                   'Udieresis -10 B Ugrave -10 B Uhungarumlaut -10 B Umacron '
+                   '-10 B Uogonek -10 B Uring -10 D A -40 D Aacute -40 D '
+                   'Abreve -40 D Acircumflex -40 D Adieresis -40 D Agrave -40 '
+                   'D Amacron -40 D Aogonek -40 D Aring -40 D Atilde -40 D V '
+                   '-40 D W -40 D Y -70 D Yacute -70 D Ydieresis -70 D comma '
+                   '-30 D period -30 Dcaron A -40 Dcaron Aacute -40 Dcaron '
+                   'Abreve -40 Dcaron Acircumflex -40 Dcaron Adieresis -40 '
+                   'Dcaron Agrave -40 Dcaron Amacron -40 Dcaron Aogonek -40 '
+                   'Dcaron Aring -40 Dcaron Atilde -40 Dcaron V -40 Dcaron W '
+                   '-40 Dcaron Y -70 Dcaron Yacute -70 Dcaron Ydieresis -70 '
+                   'Dcaron comma -30 Dcaron period -30 Dcroat A -40 Dcroat '
+                   'Aacute -40 Dcroat Abreve -40 Dcroat Acircumflex -40 '
+                   'Dcroat Adieresis -40 Dcroat Agrave -40 Dcroat Amacron -40 '
+                   'Dcroat Aogonek -40 Dcroat Aring -40 Dcroat Atilde -40 '
+                   'Dcroat V -40 Dcroat W -40 Dcroat Y -70 Dcroat Yacute -70 '
+                   'Dcroat Ydieresis -70 Dcroat comma -30 Dcroat period -30 F '
+                   'A -80 F Aacute -80 F Abreve -80 F Acircumflex -80 F '
+                   'Adieresis -80 F Agrave -80 F Amacron -80 F Aogonek -80 F '
+                   'Aring -80 F Atilde -80 F a -20 F aacute -20 F abreve -20 '
+                   'F acircumflex -20 F adieresis -20 F agrave -20 F amacron '
+                   '-20 F aogonek -20 F aring -20 F atilde -20 F comma -100 F '
+                   'period -100 J A -20 J Aacute -20 J Abreve -20 J '
+                   'Acircumflex -20 J Adieresis -20 J Agrave -20 J Amacron '
+                   '-20 J Aogonek -20 J Aring -20 J Atilde -20 J comma -20 J '
+                   'period -20 J u -20 J uacute -20 J ucircumflex -20 J '
+                   'udieresis -20 J ugrave -20 J uhungarumlaut -20 J umacron '
+                   '-20 J uogonek -20 J uring -20 K O -30 K Oacute -30 K '
+                   'Ocircumflex -30 K Odieresis -30 K Ograve -30 K '
+                   'Ohungarumlaut -30 K Omacron -30 K Oslash -30 K Otilde -30 '
+                   'K e -15 K eacute -15 K ecaron -15 K ecircumflex -15 K '
+                   'edieresis -15 K edotaccent -15 K egrave -15 K emacron -15 '
+                   'K eogonek -15 K o -35 K oacute -35 K ocircumflex -35 K '
+                   'odieresis -35 K ograve -35 K ohungarumlaut -35 K omacron '
+                   '-35 K oslash -35 K otilde -35 K u -30 K uacute -30 K '
+                   'ucircumflex -30 K udieresis -30 K ugrave -30 K '
+                   'uhungarumlaut -30 K umacron -30 K uogonek -30 K uring -30 '
+                   'K y -40 K yacute -40 K ydieresis -40 Kcommaaccent O -30 '
+                   'Kcommaaccent Oacute -30 Kcommaaccent Ocircumflex -30 '
+                   'Kcommaaccent Odieresis -30 Kcommaaccent Ograve -30 '
+                   'Kcommaaccent Ohungarumlaut -30 Kcommaaccent Omacron -30 '
+                   'Kcommaaccent Oslash -30 Kcommaaccent Otilde -30 '
+                   'Kcommaaccent e -15 Kcommaaccent eacute -15 Kcommaaccent '
+                   'ecaron -15 Kcommaaccent ecircumflex -15 Kcommaaccent '
+                   'edieresis -15 Kcommaaccent edotaccent -15 Kcommaaccent '
+                   'egrave -15 Kcommaaccent emacron -15 Kcommaaccent eogonek '
+                   '-15 Kcommaaccent o -35 Kcommaaccent oacute -35 '
+                   'Kcommaaccent ocircumflex -35 Kcommaaccent odieresis -35 '
+                   'Kcommaaccent ograve -35 Kcommaaccent ohungarumlaut -35 '
+                   'Kcommaaccent omacron -35 Kcommaaccent oslash -35 '
+                   'Kcommaaccent otilde -35 Kcommaaccent u -30 Kcommaaccent '
+                   'uacute -30 Kcommaaccent ucircumflex -30 Kcommaaccent '
+                   'udieresis -30 Kcommaaccent ugrave -30 Kcommaaccent '
+                   'uhungarumlaut -30 Kcommaaccent umacron -30 Kcommaaccent '
+                   'uogonek -30 Kcommaaccent uring -30 Kcommaaccent y -40 '
+                   'Kcommaaccent yacute -40 Kcommaaccent ydieresis -40 L T '
+                   '-90 L Tcaron -90 L Tcommaaccent -90 L V -110 L W -80 L Y '
+                   '-120 L Yacute -120 L Ydieresis -120 L quotedblright -140 '
+                   'L quoteright -140 L y -30 L yacute -30 L ydieresis -30 '
+                   'Lacute T -90 Lacute Tcaron -90 Lacute Tcommaaccent -90 '
+                   'Lacute V -110 Lacute W -80 Lacute Y -120 Lacute Yacute '
+                   '-120 Lacute Ydieresis -120 Lacute quotedblright -140 '
+                   'Lacute quoteright -140 Lacute y -30 Lacute yacute -30 '
+                   'Lacute ydieresis -30 Lcommaaccent T -90 Lcommaaccent '
+                   'Tcaron -90 Lcommaaccent Tcommaaccent -90 Lcommaaccent V '
+                   '-110 Lcommaaccent W -80 Lcommaaccent Y -120 Lcommaaccent '
+                   'Yacute -120 Lcommaaccent Ydieresis -120 Lcommaaccent '
+                   'quotedblright -140 Lcommaaccent quoteright -140 '
+                   'Lcommaaccent y -30 Lcommaaccent yacute -30 Lcommaaccent '
+                   'ydieresis -30 Lslash T -90 Lslash Tcaron -90 Lslash '
+                   'Tcommaaccent -90 Lslash V -110 Lslash W -80 Lslash Y -120 '
+                   'Lslash Yacute -120 Lslash Ydieresis -120 Lslash '
+                   'quotedblright -140 Lslash quoteright -140 Lslash y -30 '
+                   'Lslash yacute -30 Lslash ydieresis -30 O A -50 O Aacute '
+                   '-50 O Abreve -50 O Acircumflex -50 O Adieresis -50 O '
+                   'Agrave -50 O Amacron -50 O Aogonek -50 O Aring -50 O '
+                   'Atilde -50 O T -40 O Tcaron -40 O Tcommaaccent -40 O V '
+                   '-50 O W -50 O X -50 O Y -70 O Yacute -70 O Ydieresis -70 '
+                   'O comma -40 O period -40 Oacute A -50 Oacute Aacute -50 '
+                   'Oacute Abreve -50 Oacute Acircumflex -50 Oacute Adieresis '
+                   '-50 Oacute Agrave -50 Oacute Amacron -50 Oacute Aogonek '
+                   '-50 Oacute Aring -50 Oacute Atilde -50 Oacute T -40 '
+                   'Oacute Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 '
+                   'Oacute W -50 Oacute X -50 Oacute Y -70 Oacute Yacute -70 '
+                   'Oacute Ydieresis -70 Oacute comma -40 Oacute period -40 '
+                   'Ocircumflex A -50 Ocircumflex Aacute -50 Ocircumflex '
+                   'Abreve -50 Ocircumflex Acircumflex -50 Ocircumflex '
+                   'Adieresis -50 Ocircumflex Agrave -50 Ocircumflex Amacron '
+                   '-50 Ocircumflex Aogonek -50 Ocircumflex Aring -50 '
+                   'Ocircumflex Atilde -50 Ocircumflex T -40 Ocircumflex '
+                   'Tcaron -40 Ocircumflex Tcommaaccent -40 Ocircumflex V -50 '
+                   'Ocircumflex W -50 Ocircumflex X -50 Ocircumflex Y -70 '
+                   'Ocircumflex Yacute -70 Ocircumflex Ydieresis -70 '
+                   'Ocircumflex comma -40 Ocircumflex period -40 Odieresis A '
+                   '-50 Odieresis Aacute -50 Odieresis Abreve -50 Odieresis '
+                   'Acircumflex -50 Odieresis Adieresis -50 Odieresis Agrave '
+                   '-50 Odieresis Amacron -50 Odieresis Aogonek -50 Odieresis '
+                   'Aring -50 Odieresis Atilde -50 Odieresis T -40 Odieresis '
+                   'Tcaron -40 Odieresis Tcommaaccent -40 Odieresis V -50 '
+                   'Odieresis W -50 Odieresis X -50 Odieresis Y -70 Odieresis '
+                   'Yacute -70 Odieresis Ydieresis -70 Odieresis comma -40 '
+                   'Odieresis period -40 Ograve A -50 Ograve Aacute -50 '
+                   'Ograve Abreve -50 Ograve Acircumflex -50 Ograve Adieresis '
+                   '-50 Ograve Agrave -50 Ograve Amacron -50 Ograve Aogonek '
+                   '-50 Ograve Aring -50 Ograve Atilde -50 Ograve T -40 '
+                   'Ograve Tcaron -40 Ograve Tcommaaccent -40 Ograve V -50 '
+                   'Ograve W -50 Ograve X -50 Ograve Y -70 Ograve Yacute -70 '
+                   'Ograve Ydieresis -70 Ograve comma -40 Ograve period -40 '
+                   'Ohungarumlaut A -50 Ohungarumlaut Aacute -50 '
+                   'Ohungarumlaut Abreve -50 Ohungarumlaut Acircumflex -50 '
+                   'Ohungarumlaut Adieresis -50 Ohungarumlaut Agrave -50 '
+                   'Ohungarumlaut Amacron -50 Ohungarumlaut Aogonek -50 '
+                   'Ohungarumlaut Aring -50 Ohungarumlaut Atilde -50 '
+                   'Ohungarumlaut T -40 Ohungarumlaut Tcaron -40 '
+                   'Ohungarumlaut Tcommaaccent -40 Ohungarumlaut V -50 '
+                   'Ohungarumlaut W -50 Ohungarumlaut X -50 Ohungarumlaut Y '
+                   '-70 Ohungarumlaut Yacute -70 Ohungarumlaut Ydieresis -70 '
+                   'Ohungarumlaut comma -40 Ohungarumlaut period -40 Omacron '
+                   'A -50 Omacron Aacute -50 Omacron Abreve -50 Omacron '
+                   'Acircumflex -50 Omacron Adieresis -50 Omacron Agrave -50 '
+                   'Omacron Amacron -50 Omacron Aogonek -50 Omacron Aring -50 '
+                   'Omacron Atilde -50 Omacron T -40 Omacron Tcaron -40 '
+                   'Omacron Tcommaaccent -40 Omacron V -50 Omacron W -50 '
+                   'Omacron X -50 Omacron Y -70 Omacron Yacute -70 Omacron '
+                   'Ydieresis -70 Omacron comma -40 Omacron period -40 Oslash '
+                   'A -50 Oslash Aacute -50 Oslash Abreve -50 Oslash '
+                   'Acircumflex -50 Oslash Adieresis -50 Oslash Agrave -50 '
+                   'Oslash Amacron -50 Oslash Aogonek -50 Oslash Aring -50 '
+                   'Oslash Atilde -50 Oslash T -40 Oslash Tcaron -40 Oslash '
+                   'Tcommaaccent -40 Oslash V -50 Oslash W -50 Oslash X -50 '
+                   'Oslash Y -70 Oslash Yacute -70 Oslash Ydieresis -70 '
+                   'Oslash comma -40 Oslash period -40 Otilde A -50 Otilde '
+                   'Aacute -50 Otilde Abreve -50 Otilde Acircumflex -50 '
+                   'Otilde Adieresis -50 Otilde Agrave -50 Otilde Amacron -50 '
+                   'Otilde Aogonek -50 Otilde Aring -50 Otilde Atilde -50 '
+                   'Otilde T -40 Otilde Tcaron -40 Otilde Tcommaaccent -40 '
+                   'Otilde V -50 Otilde W -50 Otilde X -50 Otilde Y -70 '
+                   'Otilde Yacute -70 Otilde Ydieresis -70 Otilde comma -40 '
+                   'Otilde period -40 P A -100 P Aacute -100 P Abreve -100 P '
+                   'Acircumflex -100 P Adieresis -100 P Agrave -100 P Amacron '
+                   '-100 P Aogonek -100 P Aring -100 P Atilde -100 P a -30 P '
+                   'aacute -30 P abreve -30 P acircumflex -30 P adieresis -30 '
+                   'P agrave -30 P amacron -30 P aogonek -30 P aring -30 P '
+                   'atilde -30 P comma -120 P e -30 P eacute -30 P ecaron -30 '
+                   'P ecircumflex -30 P edieresis -30 P edotaccent -30 P '
+                   'egrave -30 P emacron -30 P eogonek -30 P o -40 P oacute '
+                   '-40 P ocircumflex -40 P odieresis -40 P ograve -40 P '
+                   'ohungarumlaut -40 P omacron -40 P oslash -40 P otilde -40 '
+                   'P period -120 Q U -10 Q Uacute -10 Q Ucircumflex -10 Q '
+                   'Udieresis -10 Q Ugrave -10 Q Uhungarumlaut -10 Q Umacron '
+                   '-10 Q Uogonek -10 Q Uring -10 Q comma 20 Q period 20 R O '
+                   '-20 R Oacute -20 R Ocircumflex -20 R Odieresis -20 R '
+                   'Ograve -20 R Ohungarumlaut -20 R Omacron -20 R Oslash -20 '
+                   'R Otilde -20 R T -20 R Tcaron -20 R Tcommaaccent -20 R U '
+                   '-20 R Uacute -20 R Ucircumflex -20 R Udieresis -20 R '
+                   'Ugrave -20 R Uhungarumlaut -20 R Umacron -20 R Uogonek '
+                   '-20 R Uring -20 R V -50 R W -40 R Y -50 R Yacute -50 R '
+                   'Ydieresis -50 Racute O -20 Racute Oacute -20 Racute '
+                   'Ocircumflex -20 Racute Odieresis -20 Racute Ograve -20 '
+                   'Racute Ohungarumlaut -20 Racute Omacron -20 Racute Oslash '
+                   '-20 Racute Otilde -20 Racute T -20 Racute Tcaron -20 '
+                   'Racute Tcommaaccent -20 Racute U -20 Racute Uacute -20 '
+                   'Racute Ucircumflex -20 Racute Udieresis -20 Racute Ugrave '
+                   '-20 Racute Uhungarumlaut -20 Racute Umacron -20 Racute '
+                   'Uogonek -20 Racute Uring -20 Racute V -50 Racute W -40 '
+                   'Racute Y -50 Racute Yacute -50 Racute Ydieresis -50 '
+                   'Rcaron O -20 Rcaron Oacute -20 Rcaron Ocircumflex -20 '
+                   'Rcaron Odieresis -20 Rcaron Ograve -20 Rcaron '
+                   'Ohungarumlaut -20 Rcaron Omacron -20 Rcaron Oslash -20 '
+                   'Rcaron Otilde -20 Rcaron T -20 Rcaron Tcaron -20 Rcaron '
+                   'Tcommaaccent -20 Rcaron U -20 Rcaron Uacute -20 Rcaron '
+                   'Ucircumflex -20 Rcaron Udieresis -20 Rcaron Ugrave -20 '
+                   'Rcaron Uhungarumlaut -20 Rcaron Umacron -20 Rcaron '
+                   'Uogonek -20 Rcaron Uring -20 Rcaron V -50 Rcaron W -40 '
+                   'Rcaron Y -50 Rcaron Yacute -50 Rcaron Ydieresis -50 '
+                   'Rcommaaccent O -20 Rcommaaccent Oacute -20 Rcommaaccent '
+                   'Ocircumflex -20 Rcommaaccent Odieresis -20 Rcommaaccent '
+                   'Ograve -20 Rcommaaccent Ohungarumlaut -20 Rcommaaccent '
+                   'Omacron -20 Rcommaaccent Oslash -20 Rcommaaccent Otilde '
+                   '-20 Rcommaaccent T -20 Rcommaaccent Tcaron -20 '
+                   'Rcommaaccent Tcommaaccent -20 Rcommaaccent U -20 '
+                   'Rcommaaccent Uacute -20 Rcommaaccent Ucircumflex -20 '
+                   'Rcommaaccent Udieresis -20 Rcommaaccent Ugrave -20 '
+                   'Rcommaaccent Uhungarumlaut -20 Rcommaaccent Umacron -20 '
+                   'Rcommaaccent Uogonek -20 Rcommaaccent Uring -20 '
+                   'Rcommaaccent V -50 Rcommaaccent W -40 Rcommaaccent Y -50 '
+                   'Rcommaaccent Yacute -50 Rcommaaccent Ydieresis -50 T A '
+                   '-90 T Aacute -90 T Abreve -90 T Acircumflex -90 T '
+                   'Adieresis -90 T Agrave -90 T Amacron -90 T Aogonek -90 T '
+                   'Aring -90 T Atilde -90 T O -40 T Oacute -40 T Ocircumflex '
+                   '-40 T Odieresis -40 T Ograve -40 T Ohungarumlaut -40 T '
+                   'Omacron -40 T Oslash -40 T Otilde -40 T a -80 T aacute '
+                   '-80 T abreve -80 T acircumflex -80 T adieresis -80 T '
+                   'agrave -80 T amacron -80 T aogonek -80 T aring -80 T '
+                   'atilde -80 T colon -40 T comma -80 T e -60 T eacute -60 T '
+                   'ecaron -60 T ecircumflex -60 T edieresis -60 T edotaccent '
+                   '-60 T egrave -60 T emacron -60 T eogonek -60 T hyphen '
+                   '-120 T o -80 T oacute -80 T ocircumflex -80 T odieresis '
+                   '-80 T ograve -80 T ohungarumlaut -80 T omacron -80 T '
+                   'oslash -80 T otilde -80 T period -80 T r -80 T racute -80 '
+                   'T rcommaaccent -80 T semicolon -40 T u -90 T uacute -90 T '
+                   'ucircumflex -90 T udieresis -90 T ugrave -90 T '
+                   'uhungarumlaut -90 T umacron -90 T uogonek -90 T uring -90 '
+                   'T w -60 T y -60 T yacute -60 T ydieresis -60 Tcaron A -90 '
+                   'Tcaron Aacute -90 Tcaron Abreve -90 Tcaron Acircumflex '
+                   '-90 Tcaron Adieresis -90 Tcaron Agrave -90 Tcaron Amacron '
+                   '-90 Tcaron Aogonek -90 Tcaron Aring -90 Tcaron Atilde -90 '
+                   'Tcaron O -40 Tcaron Oacute -40 Tcaron Ocircumflex -40 '
+                   'Tcaron Odieresis -40 Tcaron Ograve -40 Tcaron '
+                   'Ohungarumlaut -40 Tcaron Omacron -40 Tcaron Oslash -40 '
+                   'Tcaron Otilde -40 Tcaron a -80 Tcaron aacute -80 Tcaron '
+                   'abreve -80 Tcaron acircumflex -80 Tcaron adieresis -80 '
+                   'Tcaron agrave -80 Tcaron amacron -80 Tcaron aogonek -80 '
+                   'Tcaron aring -80 Tcaron atilde -80 Tcaron colon -40 '
+                   'Tcaron comma -80 Tcaron e -60 Tcaron eacute -60 Tcaron '
+                   'ecaron -60 Tcaron ecircumflex -60 Tcaron edieresis -60 '
+                   'Tcaron edotaccent -60 Tcaron egrave -60 Tcaron emacron '
+                   '-60 Tcaron eogonek -60 Tcaron hyphen -120 Tcaron o -80 '
+                   'Tcaron oacute -80 Tcaron ocircumflex -80 Tcaron odieresis '
+                   '-80 Tcaron ograve -80 Tcaron ohungarumlaut -80 Tcaron '
+                   'omacron -80 Tcaron oslash -80 Tcaron otilde -80 Tcaron '
+                   'period -80 Tcaron r -80 Tcaron racute -80 Tcaron '
+                   'rcommaaccent -80 Tcaron semicolon -40 Tcaron u -90 Tcaron '
+                   'uacute -90 Tcaron ucircumflex -90 Tcaron udieresis -90 '
+                   'Tcaron ugrave -90 Tcaron uhungarumlaut -90 Tcaron umacron '
+                   '-90 Tcaron uogonek -90 Tcaron uring -90 Tcaron w -60 '
+                   'Tcaron y -60 Tcaron yacute -60 Tcaron ydieresis -60 '
+                   'Tcommaaccent A -90 Tcommaaccent Aacute -90 Tcommaaccent '
+                   'Abreve -90 Tcommaaccent Acircumflex -90 Tcommaaccent '
+                   'Adieresis -90 Tcommaaccent Agrave -90 Tcommaaccent '
+                   'Amacron -90 Tcommaaccent Aogonek -90 Tcommaaccent Aring '
+                   '-90 Tcommaaccent Atilde -90 Tcommaaccent O -40 '
+                   'Tcommaaccent Oacute -40 Tcommaaccent Ocircumflex -40 '
+                   'Tcommaaccent Odieresis -40 Tcommaaccent Ograve -40 '
+                   'Tcommaaccent Ohungarumlaut -40 Tcommaaccent Omacron -40 '
+                   'Tcommaaccent Oslash -40 Tcommaaccent Otilde -40 '
+                   'Tcommaaccent a -80 Tcommaaccent aacute -80 Tcommaaccent '
+                   'abreve -80 Tcommaaccent acircumflex -80 Tcommaaccent '
+                   'adieresis -80 Tcommaaccent agrave -80 Tcommaaccent '
+                   'amacron -80 Tcommaaccent aogonek -80 Tcommaaccent aring '
+                   '-80 Tcommaaccent atilde -80 Tcommaaccent colon -40 '
+                   'Tcommaaccent comma -80 Tcommaaccent e -60 Tcommaaccent '
+                   'eacute -60 Tcommaaccent ecaron -60 Tcommaaccent '
+                   'ecircumflex -60 Tcommaaccent edieresis -60 Tcommaaccent '
+                   'edotaccent -60 Tcommaaccent egrave -60 Tcommaaccent '
+                   'emacron -60 Tcommaaccent eogonek -60 Tcommaaccent hyphen '
+                   '-120 Tcommaaccent o -80 Tcommaaccent oacute -80 '
+                   'Tcommaaccent ocircumflex -80 Tcommaaccent odieresis -80 '
+                   'Tcommaaccent ograve -80 Tcommaaccent ohungarumlaut -80 '
+                   'Tcommaaccent omacron -80 Tcommaaccent oslash -80 '
+                   'Tcommaaccent otilde -80 Tcommaaccent period -80 '
+                   'Tcommaaccent r -80 Tcommaaccent racute -80 Tcommaaccent '
+                   'rcommaaccent -80 Tcommaaccent semicolon -40 Tcommaaccent '
+                   'u -90 Tcommaaccent uacute -90 Tcommaaccent ucircumflex '
+                   '-90 Tcommaaccent udieresis -90 Tcommaaccent ugrave -90 '
+                   'Tcommaaccent uhungarumlaut -90 Tcommaaccent umacron -90 '
+                   'Tcommaaccent uogonek -90 Tcommaaccent uring -90 '
+                   'Tcommaaccent w -60 Tcommaaccent y -60 Tcommaaccent yacute '
+                   '-60 Tcommaaccent ydieresis -60 U A -50 U Aacute -50 U '
+                   'Abreve -50 U Acircumflex -50 U Adieresis -50 U Agrave -50 '
+                   'U Amacron -50 U Aogonek -50 U Aring -50 U Atilde -50 U '
+                   'comma -30 U period -30 Uacute A -50 Uacute Aacute -50 '
+                   'Uacute Abreve -50 Uacute Acircumflex -50 Uacute Adieresis '
+                   '-50 Uacute Agrave -50 Uacute Amacron -50 Uacute Aogonek '
+                   '-50 Uacute Aring -50 Uacute Atilde -50 Uacute comma -30 '
+                   'Uacute period -30 Ucircumflex A -50 Ucircumflex Aacute '
+                   '-50 Ucircumflex Abreve -50 Ucircumflex Acircumflex -50 '
+                   'Ucircumflex Adieresis -50 Ucircumflex Agrave -50 '
+                   'Ucircumflex Amacron -50 Ucircumflex Aogonek -50 '
+                   'Ucircumflex Aring -50 Ucircumflex Atilde -50 Ucircumflex '
+                   'comma -30 Ucircumflex period -30 Udieresis A -50 '
+                   'Udieresis Aacute -50 Udieresis Abreve -50 Udieresis '
+                   'Acircumflex -50 Udieresis Adieresis -50 Udieresis Agrave '
+                   '-50 Udieresis Amacron -50 Udieresis Aogonek -50 Udieresis '
+                   'Aring -50 Udieresis Atilde -50 Udieresis comma -30 '
+                   'Udieresis period -30 Ugrave A -50 Ugrave Aacute -50 '
+                   'Ugrave Abreve -50 Ugrave Acircumflex -50 Ugrave Adieresis '
+                   '-50 Ugrave Agrave -50 Ugrave Amacron -50 Ugrave Aogonek '
+                   '-50 Ugrave Aring -50 Ugrave Atilde -50 Ugrave comma -30 '
+                   'Ugrave period -30 Uhungarumlaut A -50 Uhungarumlaut '
+                   'Aacute -50 Uhungarumlaut Abreve -50 Uhungarumlaut '
+                   'Acircumflex -50 Uhungarumlaut Adieresis -50 Uhungarumlaut '
+                   'Agrave -50 Uhungarumlaut Amacron -50 Uhungarumlaut '
+                   'Aogonek -50 Uhungarumlaut Aring -50 Uhungarumlaut Atilde '
+                   '-50 Uhungarumlaut comma -30 Uhungarumlaut period -30 '
+                   'Umacron A -50 Umacron Aacute -50 Umacron Abreve -50 '
+                   'Umacron Acircumflex -50 Umacron Adieresis -50 Umacron '
+                   'Agrave -50 Umacron Amacron -50 Umacron Aogonek -50 '
+                   'Umacron Aring -50 Umacron Atilde -50 Umacron comma -30 '
+                   'Umacron period -30 Uogonek A -50 Uogonek Aacute -50 '
+                   'Uogonek Abreve -50 Uogonek Acircumflex -50 Uogonek '
+                   'Adieresis -50 Uogonek Agrave -50 Uogonek Amacron -50 '
+                   'Uogonek Aogonek -50 Uogonek Aring -50 Uogonek Atilde -50 '
+                   'Uogonek comma -30 Uogonek period -30 Uring A -50 Uring '
+                   'Aacute -50 Uring Abreve -50 Uring Acircumflex -50 Uring '
+                   'Adieresis -50 Uring Agrave -50 Uring Amacron -50 Uring '
+                   'Aogonek -50 Uring Aring -50 Uring Atilde -50 Uring comma '
+                   '-30 Uring period -30 V A -80 V Aacute -80 V Abreve -80 V '
+                   'Acircumflex -80 V Adieresis -80 V Agrave -80 V Amacron '
+                   '-80 V Aogonek -80 V Aring -80 V Atilde -80 V G -50 V '
+                   'Gbreve -50 V Gcommaaccent -50 V O -50 V Oacute -50 V '
+                   'Ocircumflex -50 V Odieresis -50 V Ograve -50 V '
+                   'Ohungarumlaut -50 V Omacron -50 V Oslash -50 V Otilde -50 '
+                   'V a -60 V aacute -60 V abreve -60 V acircumflex -60 V '
+                   'adieresis -60 V agrave -60 V amacron -60 V aogonek -60 V '
+                   'aring -60 V atilde -60 V colon -40 V comma -120 V e -50 V '
+                   'eacute -50 V ecaron -50 V ecircumflex -50 V edieresis -50 '
+                   'V edotaccent -50 V egrave -50 V emacron -50 V eogonek -50 '
+                   'V hyphen -80 V o -90 V oacute -90 V ocircumflex -90 V '
+                   'odieresis -90 V ograve -90 V ohungarumlaut -90 V omacron '
+                   '-90 V oslash -90 V otilde -90 V period -120 V semicolon '
+                   '-40 V u -60 V uacute -60 V ucircumflex -60 V udieresis '
+                   '-60 V ugrave -60 V uhungarumlaut -60 V umacron -60 V '
+                   'uogonek -60 V uring -60 W A -60 W Aacute -60 W Abreve -60 '
+                   'W Acircumflex -60 W Adieresis -60 W Agrave -60 W Amacron '
+                   '-60 W Aogonek -60 W Aring -60 W Atilde -60 W O -20 W '
+                   'Oacute -20 W Ocircumflex -20 W Odieresis -20 W Ograve -20 '
+                   'W Ohungarumlaut -20 W Omacron -20 W Oslash -20 W Otilde '
+                   '-20 W a -40 W aacute -40 W abreve -40 W acircumflex -40 W '
+                   'adieresis -40 W agrave -40 W amacron -40 W aogonek -40 W '
+                   'aring -40 W atilde -40 W colon -10 W comma -80 W e -35 W '
+                   'eacute -35 W ecaron -35 W ecircumflex -35 W edieresis -35 '
+                   'W edotaccent -35 W egrave -35 W emacron -35 W eogonek -35 '
+                   'W hyphen -40 W o -60 W oacute -60 W ocircumflex -60 W '
+                   'odieresis -60 W ograve -60 W ohungarumlaut -60 W omacron '
+                   '-60 W oslash -60 W otilde -60 W period -80 W semicolon '
+                   '-10 W u -45 W uacute -45 W ucircumflex -45 W udieresis '
+                   '-45 W ugrave -45 W uhungarumlaut -45 W umacron -45 W '
+                   'uogonek -45 W uring -45 W y -20 W yacute -20 W ydieresis '
+                   '-20 Y A -110 Y Aacute -110 Y Abreve -110 Y Acircumflex '
+                   '-110 Y Adieresis -110 Y Agrave -110 Y Amacron -110 Y '
+                   'Aogonek -110 Y Aring -110 Y Atilde -110 Y O -70 Y Oacute '
+                   '-70 Y Ocircumflex -70 Y Odieresis -70 Y Ograve -70 Y '
+                   'Ohungarumlaut -70 Y Omacron -70 Y Oslash -70 Y Otilde -70 '
+                   'Y a -90 Y aacute -90 Y abreve -90 Y acircumflex -90 Y '
+                   'adieresis -90 Y agrave -90 Y amacron -90 Y aogonek -90 Y '
+                   'aring -90 Y atilde -90 Y colon -50 Y comma -100 Y e -80 Y '
+                   'eacute -80 Y ecaron -80 Y ecircumflex -80 Y edieresis -80 '
+                   'Y edotaccent -80 Y egrave -80 Y emacron -80 Y eogonek -80 '
+                   'Y o -100 Y oacute -100 Y ocircumflex -100 Y odieresis '
+                   '-100 Y ograve -100 Y ohungarumlaut -100 Y omacron -100 Y '
+                   'oslash -100 Y otilde -100 Y period -100 Y semicolon -50 Y '
+                   'u -100 Y uacute -100 Y ucircumflex -100 Y udieresis -100 '
+                   'Y ugrave -100 Y uhungarumlaut -100 Y umacron -100 Y '
+                   'uogonek -100 Y uring -100 Yacute A -110 Yacute Aacute '
+                   '-110 Yacute Abreve -110 Yacute Acircumflex -110 Yacute '
+                   'Adieresis -110 Yacute Agrave -110 Yacute Amacron -110 '
+                   'Yacute Aogonek -110 Yacute Aring -110 Yacute Atilde -110 '
+                   'Yacute O -70 Yacute Oacute -70 Yacute Ocircumflex -70 '
+                   'Yacute Odieresis -70 Yacute Ograve -70 Yacute '
+                   'Ohungarumlaut -70 Yacute Omacron -70 Yacute Oslash -70 '
+                   'Yacute Otilde -70 Yacute a -90 Yacute aacute -90 Yacute '
+                   'abreve -90 Yacute acircumflex -90 Yacute adieresis -90 '
+                   'Yacute agrave -90 Yacute amacron -90 Yacute aogonek -90 '
+                   'Yacute aring -90 Yacute atilde -90 Yacute colon -50 '
+                   'Yacute comma -100 Yacute e -80 Yacute eacute -80 Yacute '
+                   'ecaron -80 Yacute ecircumflex -80 Yacute edieresis -80 '
+                   'Yacute edotaccent -80 Yacute egrave -80 Yacute emacron '
+                   '-80 Yacute eogonek -80 Yacute o -100 Yacute oacute -100 '
+                   'Yacute ocircumflex -100 Yacute odieresis -100 Yacute '
+                   'ograve -100 Yacute ohungarumlaut -100 Yacute omacron -100 '
+                   'Yacute oslash -100 Yacute otilde -100 Yacute period -100 '
+                   'Yacute semicolon -50 Yacute u -100 Yacute uacute -100 '
+                   'Yacute ucircumflex -100 Yacute udieresis -100 Yacute '
+                   'ugrave -100 Yacute uhungarumlaut -100 Yacute umacron -100 '
+                   'Yacute uogonek -100 Yacute uring -100 Ydieresis A -110 '
+                   'Ydieresis Aacute -110 Ydieresis Abreve -110 Ydieresis '
+                   'Acircumflex -110 Ydieresis Adieresis -110 Ydieresis '
+                   'Agrave -110 Ydieresis Amacron -110 Ydieresis Aogonek -110 '
+                   'Ydieresis Aring -110 Ydieresis Atilde -110 Ydieresis O '
+                   '-70 Ydieresis Oacute -70 Ydieresis Ocircumflex -70 '
+                   'Ydieresis Odieresis -70 Ydieresis Ograve -70 Ydieresis '
+                   'Ohungarumlaut -70 Ydieresis Omacron -70 Ydieresis Oslash '
+                   '-70 Ydieresis Otilde -70 Ydieresis a -90 Ydieresis aacute '
+                   '-90 Ydieresis abreve -90 Ydieresis acircumflex -90 '
+                   'Ydieresis adieresis -90 Ydieresis agrave -90 Ydieresis '
+                   'amacron -90 Ydieresis aogonek -90 Ydieresis aring -90 '
+                   'Ydieresis atilde -90 Ydieresis colon -50 Ydieresis comma '
+                   '-100 Ydieresis e -80 Ydieresis eacute -80 Ydieresis '
+                   'ecaron -80 Ydieresis ecircumflex -80 Ydieresis edieresis '
+                   '-80 Ydieresis edotaccent -80 Ydieresis egrave -80 '
+                   'Ydieresis emacron -80 Ydieresis eogonek -80 Ydieresis o '
+                   '-100 Ydieresis oacute -100 Ydieresis ocircumflex -100 '
+                   'Ydieresis odieresis -100 Ydieresis ograve -100 Ydieresis '
+                   'ohungarumlaut -100 Ydieresis omacron -100 Ydieresis '
+                   'oslash -100 Ydieresis otilde -100 Ydieresis period -100 '
+                   'Ydieresis semicolon -50 Ydieresis u -100 Ydieresis uacute '
+                   '-100 Ydieresis ucircumflex -100 Ydieresis udieresis -100 '
+                   'Ydieresis ugrave -100 Ydieresis uhungarumlaut -100 '
+                   'Ydieresis umacron -100 Ydieresis uogonek -100 Ydieresis '
+                   'uring -100 a g -10 a gbreve -10 a gcommaaccent -10 a v '
+                   '-15 a w -15 a y -20 a yacute -20 a ydieresis -20 aacute g '
+                   '-10 aacute gbreve -10 aacute gcommaaccent -10 aacute v '
+                   '-15 aacute w -15 aacute y -20 aacute yacute -20 aacute '
+                   'ydieresis -20 abreve g -10 abreve gbreve -10 abreve '
+                   'gcommaaccent -10 abreve v -15 abreve w -15 abreve y -20 '
+                   'abreve yacute -20 abreve ydieresis -20 acircumflex g -10 '
+                   'acircumflex gbreve -10 acircumflex gcommaaccent -10 '
+                   'acircumflex v -15 acircumflex w -15 acircumflex y -20 '
+                   'acircumflex yacute -20 acircumflex ydieresis -20 '
+                   'adieresis g -10 adieresis gbreve -10 adieresis '
+                   'gcommaaccent -10 adieresis v -15 adieresis w -15 '
+                   'adieresis y -20 adieresis yacute -20 adieresis ydieresis '
+                   '-20 agrave g -10 agrave gbreve -10 agrave gcommaaccent '
+                   '-10 agrave v -15 agrave w -15 agrave y -20 agrave yacute '
+                   '-20 agrave ydieresis -20 amacron g -10 amacron gbreve -10 '
+                   'amacron gcommaaccent -10 amacron v -15 amacron w -15 '
+                   'amacron y -20 amacron yacute -20 amacron ydieresis -20 '
+                   'aogonek g -10 aogonek gbreve -10 aogonek gcommaaccent -10 '
+                   'aogonek v -15 aogonek w -15 aogonek y -20 aogonek yacute '
+                   '-20 aogonek ydieresis -20 aring g -10 aring gbreve -10 '
+                   'aring gcommaaccent -10 aring v -15 aring w -15 aring y '
+                   '-20 aring yacute -20 aring ydieresis -20 atilde g -10 '
+                   'atilde gbreve -10 atilde gcommaaccent -10 atilde v -15 '
+                   'atilde w -15 atilde y -20 atilde yacute -20 atilde '
+                   'ydieresis -20 b l -10 b lacute -10 b lcommaaccent -10 b '
+                   'lslash -10 b u -20 b uacute -20 b ucircumflex -20 b '
+                   'udieresis -20 b ugrave -20 b uhungarumlaut -20 b umacron '
+                   '-20 b uogonek -20 b uring -20 b v -20 b y -20 b yacute '
+                   '-20 b ydieresis -20 c h -10 c k -20 c kcommaaccent -20 c '
+                   'l -20 c lacute -20 c lcommaaccent -20 c lslash -20 c y '
+                   '-10 c yacute -10 c ydieresis -10 cacute h -10 cacute k '
+                   '-20 cacute kcommaaccent -20 cacute l -20 cacute lacute '
+                   '-20 cacute lcommaaccent -20 cacute lslash -20 cacute y '
+                   '-10 cacute yacute -10 cacute ydieresis -10 ccaron h -10 '
+                   'ccaron k -20 ccaron kcommaaccent -20 ccaron l -20 ccaron '
+                   'lacute -20 ccaron lcommaaccent -20 ccaron lslash -20 '
+                   'ccaron y -10 ccaron yacute -10 ccaron ydieresis -10 '
+                   'ccedilla h -10 ccedilla k -20 ccedilla kcommaaccent -20 '
+                   'ccedilla l -20 ccedilla lacute -20 ccedilla lcommaaccent '
+                   '-20 ccedilla lslash -20 ccedilla y -10 ccedilla yacute '
+                   '-10 ccedilla ydieresis -10 colon space -40 comma '
+                   'quotedblright -120 comma quoteright -120 comma space -40 '
+                   'd d -10 d dcroat -10 d v -15 d w -15 d y -15 d yacute -15 '
+                   'd ydieresis -15 dcroat d -10 dcroat dcroat -10 dcroat v '
+                   '-15 dcroat w -15 dcroat y -15 dcroat yacute -15 dcroat '
+                   'ydieresis -15 e comma 10 e period 20 e v -15 e w -15 e x '
+                   '-15 e y -15 e yacute -15 e ydieresis -15 eacute comma 10 '
+                   'eacute period 20 eacute v -15 eacute w -15 eacute x -15 '
+                   'eacute y -15 eacute yacute -15 eacute ydieresis -15 '
+                   'ecaron comma 10 ecaron period 20 ecaron v -15 ecaron w '
+                   '-15 ecaron x -15 ecaron y -15 ecaron yacute -15 ecaron '
+                   'ydieresis -15 ecircumflex comma 10 ecircumflex period 20 '
+                   'ecircumflex v -15 ecircumflex w -15 ecircumflex x -15 '
+                   'ecircumflex y -15 ecircumflex yacute -15 ecircumflex '
+                   'ydieresis -15 edieresis comma 10 edieresis period 20 '
+                   'edieresis v -15 edieresis w -15 edieresis x -15 edieresis '
+                   'y -15 edieresis yacute -15 edieresis ydieresis -15 '
+                   'edotaccent comma 10 edotaccent period 20 edotaccent v -15 '
+                   'edotaccent w -15 edotaccent x -15 edotaccent y -15 '
+                   'edotaccent yacute -15 edotaccent ydieresis -15 egrave '
+                   'comma 10 egrave period 20 egrave v -15 egrave w -15 '
+                   'egrave x -15 egrave y -15 egrave yacute -15 egrave '
+                   'ydieresis -15 emacron comma 10 emacron period 20 emacron '
+                   'v -15 emacron w -15 emacron x -15 emacron y -15 emacron '
+                   'yacute -15 emacron ydieresis -15 eogonek comma 10 eogonek '
+                   'period 20 eogonek v -15 eogonek w -15 eogonek x -15 '
+                   'eogonek y -15 eogonek yacute -15 eogonek ydieresis -15 f '
+                   'comma -10 f e -10 f eacute -10 f ecaron -10 f ecircumflex '
+                   '-10 f edieresis -10 f edotaccent -10 f egrave -10 f '
+                   'emacron -10 f eogonek -10 f o -20 f oacute -20 f '
+                   'ocircumflex -20 f odieresis -20 f ograve -20 f '
+                   'ohungarumlaut -20 f omacron -20 f oslash -20 f otilde -20 '
+                   'f period -10 f quotedblright 30 f quoteright 30 g e 10 g '
+                   'eacute 10 g ecaron 10 g ecircumflex 10 g edieresis 10 g '
+                   'edotaccent 10 g egrave 10 g emacron 10 g eogonek 10 g g '
+                   '-10 g gbreve -10 g gcommaaccent -10 gbreve e 10 gbreve '
+                   'eacute 10 gbreve ecaron 10 gbreve ecircumflex 10 gbreve '
+                   'edieresis 10 gbreve edotaccent 10 gbreve egrave 10 gbreve '
+                   'emacron 10 gbreve eogonek 10 gbreve g -10 gbreve gbreve '
+                   '-10 gbreve gcommaaccent -10 gcommaaccent e 10 '
+                   'gcommaaccent eacute 10 gcommaaccent ecaron 10 '
+                   'gcommaaccent ecircumflex 10 gcommaaccent edieresis 10 '
+                   'gcommaaccent edotaccent 10 gcommaaccent egrave 10 '
+                   'gcommaaccent emacron 10 gcommaaccent eogonek 10 '
+                   'gcommaaccent g -10 gcommaaccent gbreve -10 gcommaaccent '
+                   'gcommaaccent -10 h y -20 h yacute -20 h ydieresis -20 k o '
+                   '-15 k oacute -15 k ocircumflex -15 k odieresis -15 k '
+                   'ograve -15 k ohungarumlaut -15 k omacron -15 k oslash -15 '
+                   'k otilde -15 kcommaaccent o -15 kcommaaccent oacute -15 '
+                   'kcommaaccent ocircumflex -15 kcommaaccent odieresis -15 '
+                   'kcommaaccent ograve -15 kcommaaccent ohungarumlaut -15 '
+                   'kcommaaccent omacron -15 kcommaaccent oslash -15 '
+                   'kcommaaccent otilde -15 l w -15 l y -15 l yacute -15 l '
+                   'ydieresis -15 lacute w -15 lacute y -15 lacute yacute -15 '
+                   'lacute ydieresis -15 lcommaaccent w -15 lcommaaccent y '
+                   '-15 lcommaaccent yacute -15 lcommaaccent ydieresis -15 '
+                   'lslash w -15 lslash y -15 lslash yacute -15 lslash '
+                   'ydieresis -15 m u -20 m uacute -20 m ucircumflex -20 m '
+                   'udieresis -20 m ugrave -20 m uhungarumlaut -20 m umacron '
+                   '-20 m uogonek -20 m uring -20 m y -30 m yacute -30 m '
+                   'ydieresis -30 n u -10 n uacute -10 n ucircumflex -10 n '
+                   'udieresis -10 n ugrave -10 n uhungarumlaut -10 n umacron '
+                   '-10 n uogonek -10 n uring -10 n v -40 n y -20 n yacute '
+                   '-20 n ydieresis -20 nacute u -10 nacute uacute -10 nacute '
+                   'ucircumflex -10 nacute udieresis -10 nacute ugrave -10 '
+                   'nacute uhungarumlaut -10 nacute umacron -10 nacute '
+                   'uogonek -10 nacute uring -10 nacute v -40 nacute y -20 '
+                   'nacute yacute -20 nacute ydieresis -20 ncaron u -10 '
+                   'ncaron uacute -10 ncaron ucircumflex -10 ncaron udieresis '
+                   '-10 ncaron ugrave -10 ncaron uhungarumlaut -10 ncaron '
+                   'umacron -10 ncaron uogonek -10 ncaron uring -10 ncaron v '
+                   '-40 ncaron y -20 ncaron yacute -20 ncaron ydieresis -20 '
+                   'ncommaaccent u -10 ncommaaccent uacute -10 ncommaaccent '
+                   'ucircumflex -10 ncommaaccent udieresis -10 ncommaaccent '
+                   'ugrave -10 ncommaaccent uhungarumlaut -10 ncommaaccent '
+                   'umacron -10 ncommaaccent uogonek -10 ncommaaccent uring '
+                   '-10 ncommaaccent v -40 ncommaaccent y -20 ncommaaccent '
+                   'yacute -20 ncommaaccent ydieresis -20 ntilde u -10 ntilde '
+                   'uacute -10 ntilde ucircumflex -10 ntilde udieresis -10 '
+                   'ntilde ugrave -10 ntilde uhungarumlaut -10 ntilde umacron '
+                   '-10 ntilde uogonek -10 ntilde uring -10 ntilde v -40 '
+                   'ntilde y -20 ntilde yacute -20 ntilde ydieresis -20 o v '
+                   '-20 o w -15 o x -30 o y -20 o yacute -20 o ydieresis -20 '
+                   'oacute v -20 oacute w -15 oacute x -30 oacute y -20 '
+                   'oacute yacute -20 oacute ydieresis -20 ocircumflex v -20 '
+                   'ocircumflex w -15 ocircumflex x -30 ocircumflex y -20 '
+                   'ocircumflex yacute -20 ocircumflex ydieresis -20 '
+                   'odieresis v -20 odieresis w -15 odieresis x -30 odieresis '
+                   'y -20 odieresis yacute -20 odieresis ydieresis -20 ograve '
+                   'v -20 ograve w -15 ograve x -30 ograve y -20 ograve '
+                   'yacute -20 ograve ydieresis -20 ohungarumlaut v -20 '
+                   'ohungarumlaut w -15 ohungarumlaut x -30 ohungarumlaut y '
+                   '-20 ohungarumlaut yacute -20 ohungarumlaut ydieresis -20 '
+                   'omacron v -20 omacron w -15 omacron x -30 omacron y -20 '
+                   'omacron yacute -20 omacron ydieresis -20 oslash v -20 '
+                   'oslash w -15 oslash x -30 oslash y -20 oslash yacute -20 '
+                   'oslash ydieresis -20 otilde v -20 otilde w -15 otilde x '
+                   '-30 otilde y -20 otilde yacute -20 otilde ydieresis -20 p '
+                   'y -15 p yacute -15 p ydieresis -15 period quotedblright '
+                   '-120 period quoteright -120 period space -40 '
+                   'quotedblright space -80 quoteleft quoteleft -46 '
+                   'quoteright d -80 quoteright dcroat -80 quoteright l -20 '
+                   'quoteright lacute -20 quoteright lcommaaccent -20 '
+                   'quoteright lslash -20 quoteright quoteright -46 '
+                   'quoteright r -40 quoteright racute -40 quoteright rcaron '
+                   '-40 quoteright rcommaaccent -40 quoteright s -60 '
+                   'quoteright sacute -60 quoteright scaron -60 quoteright '
+                   'scedilla -60 quoteright scommaaccent -60 quoteright space '
+                   '-80 quoteright v -20 r c -20 r cacute -20 r ccaron -20 r '
+                   'ccedilla -20 r comma -60 r d -20 r dcroat -20 r g -15 r '
+                   'gbreve -15 r gcommaaccent -15 r hyphen -20 r o -20 r '
+                   'oacute -20 r ocircumflex -20 r odieresis -20 r ograve -20 '
+                   'r ohungarumlaut -20 r omacron -20 r oslash -20 r otilde '
+                   '-20 r period -60 r q -20 r s -15 r sacute -15 r scaron '
+                   '-15 r scedilla -15 r scommaaccent -15 r t 20 r '
+                   'tcommaaccent 20 r v 10 r y 10 r yacute 10 r ydieresis 10 '
+                   'racute c -20 racute cacute -20 racute ccaron -20 racute '
+                   'ccedilla -20 racute comma -60 racute d -20 racute dcroat '
+                   '-20 racute g -15 racute gbreve -15 racute gcommaaccent '
+                   '-15 racute hyphen -20 racute o -20 racute oacute -20 '
+                   'racute ocircumflex -20 racute odieresis -20 racute ograve '
+                   '-20 racute ohungarumlaut -20 racute omacron -20 racute '
+                   'oslash -20 racute otilde -20 racute period -60 racute q '
+                   '-20 racute s -15 racute sacute -15 racute scaron -15 '
+                   'racute scedilla -15 racute scommaaccent -15 racute t 20 '
+                   'racute tcommaaccent 20 racute v 10 racute y 10 racute '
+                   'yacute 10 racute ydieresis 10 rcaron c -20 rcaron cacute '
+                   '-20 rcaron ccaron -20 rcaron ccedilla -20 rcaron comma '
+                   '-60 rcaron d -20 rcaron dcroat -20 rcaron g -15 rcaron '
+                   'gbreve -15 rcaron gcommaaccent -15 rcaron hyphen -20 '
+                   'rcaron o -20 rcaron oacute -20 rcaron ocircumflex -20 '
+                   'rcaron odieresis -20 rcaron ograve -20 rcaron '
+                   'ohungarumlaut -20 rcaron omacron -20 rcaron oslash -20 '
+                   'rcaron otilde -20 rcaron period -60 rcaron q -20 rcaron s '
+                   '-15 rcaron sacute -15 rcaron scaron -15 rcaron scedilla '
+                   '-15 rcaron scommaaccent -15 rcaron t 20 rcaron '
+                   'tcommaaccent 20 rcaron v 10 rcaron y 10 rcaron yacute 10 '
+                   'rcaron ydieresis 10 rcommaaccent c -20 rcommaaccent '
+                   'cacute -20 rcommaaccent ccaron -20 rcommaaccent ccedilla '
+                   '-20 rcommaaccent comma -60 rcommaaccent d -20 '
+                   'rcommaaccent dcroat -20 rcommaaccent g -15 rcommaaccent '
+                   'gbreve -15 rcommaaccent gcommaaccent -15 rcommaaccent '
+                   'hyphen -20 rcommaaccent o -20 rcommaaccent oacute -20 '
+                   'rcommaaccent ocircumflex -20 rcommaaccent odieresis -20 '
+                   'rcommaaccent ograve -20 rcommaaccent ohungarumlaut -20 '
+                   'rcommaaccent omacron -20 rcommaaccent oslash -20 '
+                   'rcommaaccent otilde -20 rcommaaccent period -60 '
+                   'rcommaaccent q -20 rcommaaccent s -15 rcommaaccent sacute '
+                   '-15 rcommaaccent scaron -15 rcommaaccent scedilla -15 '
+                   'rcommaaccent scommaaccent -15 rcommaaccent t 20 '
+                   'rcommaaccent tcommaaccent 20 rcommaaccent v 10 '
+                   'rcommaaccent y 10 rcommaaccent yacute 10 rcommaaccent '
+                   'ydieresis 10 s w -15 sacute w -15 scaron w -15 scedilla w '
+                   '-15 scommaaccent w -15 semicolon space -40 space T -100 '
+                   'space Tcaron -100 space Tcommaaccent -100 space V -80 '
+                   'space W -80 space Y -120 space Yacute -120 space '
+                   'Ydieresis -120 space quotedblleft -80 space quoteleft -60 '
+                   'v a -20 v aacute -20 v abreve -20 v acircumflex -20 v '
+                   'adieresis -20 v agrave -20 v amacron -20 v aogonek -20 v '
+                   'aring -20 v atilde -20 v comma -80 v o -30 v oacute -30 v '
+                   'ocircumflex -30 v odieresis -30 v ograve -30 v '
+                   'ohungarumlaut -30 v omacron -30 v oslash -30 v otilde -30 '
+                   'v period -80 w comma -40 w o -20 w oacute -20 w '
+                   'ocircumflex -20 w odieresis -20 w ograve -20 w '
+                   'ohungarumlaut -20 w omacron -20 w oslash -20 w otilde -20 '
+                   'w period -40 x e -10 x eacute -10 x ecaron -10 x '
+                   'ecircumflex -10 x edieresis -10 x edotaccent -10 x egrave '
+                   '-10 x emacron -10 x eogonek -10 y a -30 y aacute -30 y '
+                   'abreve -30 y acircumflex -30 y adieresis -30 y agrave -30 '
+                   'y amacron -30 y aogonek -30 y aring -30 y atilde -30 y '
+                   'comma -80 y e -10 y eacute -10 y ecaron -10 y ecircumflex '
+                   '-10 y edieresis -10 y edotaccent -10 y egrave -10 y '
+                   'emacron -10 y eogonek -10 y o -25 y oacute -25 y '
+                   'ocircumflex -25 y odieresis -25 y ograve -25 y '
+                   'ohungarumlaut -25 y omacron -25 y oslash -25 y otilde -25 '
+                   'y period -80 yacute a -30 yacute aacute -30 yacute abreve '
+                   '-30 yacute acircumflex -30 yacute adieresis -30 yacute '
+                   'agrave -30 yacute amacron -30 yacute aogonek -30 yacute '
+                   'aring -30 yacute atilde -30 yacute comma -80 yacute e -10 '
+                   'yacute eacute -10 yacute ecaron -10 yacute ecircumflex '
+                   '-10 yacute edieresis -10 yacute edotaccent -10 yacute '
+                   'egrave -10 yacute emacron -10 yacute eogonek -10 yacute o '
+                   '-25 yacute oacute -25 yacute ocircumflex -25 yacute '
+                   'odieresis -25 yacute ograve -25 yacute ohungarumlaut -25 '
+                   'yacute omacron -25 yacute oslash -25 yacute otilde -25 '
+                   'yacute period -80 ydieresis a -30 ydieresis aacute -30 '
+                   'ydieresis abreve -30 ydieresis acircumflex -30 ydieresis '
+                   'adieresis -30 ydieresis agrave -30 ydieresis amacron -30 '
+                   'ydieresis aogonek -30 ydieresis aring -30 ydieresis '
+                   'atilde -30 ydieresis comma -80 ydieresis e -10 ydieresis '
+                   'eacute -10 ydieresis ecaron -10 ydieresis ecircumflex -10 '
+                   'ydieresis edieresis -10 ydieresis edotaccent -10 '
+                   'ydieresis egrave -10 ydieresis emacron -10 ydieresis '
+                   'eogonek -10 ydieresis o -25 ydieresis oacute -25 '
+                   'ydieresis ocircumflex -25 ydieresis odieresis -25 '
+                   'ydieresis ograve -25 ydieresis ohungarumlaut -25 '
+                   'ydieresis omacron -25 ydieresis oslash -25 ydieresis '
+                   'otilde -25 ydieresis period -80 z e 10 z eacute 10 z '
+                   'ecaron 10 z ecircumflex 10 z edieresis 10 z edotaccent 10 '
+                   'z egrave 10 z emacron 10 z eogonek 10 zacute e 10 zacute '
+                   'eacute 10 zacute ecaron 10 zacute ecircumflex 10 zacute '
+                   'edieresis 10 zacute edotaccent 10 zacute egrave 10 zacute '
+                   'emacron 10 zacute eogonek 10 zcaron e 10 zcaron eacute 10 '
+                   'zcaron ecaron 10 zcaron ecircumflex 10 zcaron edieresis '
+                   '10 zcaron edotaccent 10 zcaron egrave 10 zcaron emacron '
+                   '10 zcaron eogonek 10 zdotaccent e 10 zdotaccent eacute 10 '
+                   'zdotaccent ecaron 10 zdotaccent ecircumflex 10 zdotaccent '
+                   'edieresis 10 zdotaccent edotaccent 10 zdotaccent egrave '
+                   '10 zdotaccent emacron 10 zdotaccent eogonek 10',
+ 'Helvetica-BoldOblique': 'A C -40 A Cacute -40 A Ccaron -40 A Ccedilla -40 A '
+                          'G -50 A Gbreve -50 A Gcommaaccent -50 A O -40 A '
+                          'Oacute -40 A Ocircumflex -40 A Odieresis -40 A '
+                          'Ograve -40 A Ohungarumlaut -40 A Omacron -40 A '
+                          'Oslash -40 A Otilde -40 A Q -40 A T -90 A Tcaron '
+                          '-90 A Tcommaaccent -90 A U -50 A Uacute -50 A '
+                          'Ucircumflex -50 A Udieresis -50 A Ugrave -50 A '
+                          'Uhungarumlaut -50 A Umacron -50 A Uogonek -50 A '
+                          'Uring -50 A V -80 A W -60 A Y -110 A Yacute -110 A '
+                          'Ydieresis -110 A u -30 A uacute -30 A ucircumflex '
+                          '-30 A udieresis -30 A ugrave -30 A uhungarumlaut '
+                          '-30 A umacron -30 A uogonek -30 A uring -30 A v '
+                          '-40 A w -30 A y -30 A yacute -30 A ydieresis -30 '
+                          'Aacute C -40 Aacute Cacute -40 Aacute Ccaron -40 '
+                          'Aacute Ccedilla -40 Aacute G -50 Aacute Gbreve -50 '
+                          'Aacute Gcommaaccent -50 Aacute O -40 Aacute Oacute '
+                          '-40 Aacute Ocircumflex -40 Aacute Odieresis -40 '
+                          'Aacute Ograve -40 Aacute Ohungarumlaut -40 Aacute '
+                          'Omacron -40 Aacute Oslash -40 Aacute Otilde -40 '
+                          'Aacute Q -40 Aacute T -90 Aacute Tcaron -90 Aacute '
+                          'Tcommaaccent -90 Aacute U -50 Aacute Uacute -50 '
+                          'Aacute Ucircumflex -50 Aacute Udieresis -50 Aacute '
+                          'Ugrave -50 Aacute Uhungarumlaut -50 Aacute Umacron '
+                          '-50 Aacute Uogonek -50 Aacute Uring -50 Aacute V '
+                          '-80 Aacute W -60 Aacute Y -110 Aacute Yacute -110 '
+                          'Aacute Ydieresis -110 Aacute u -30 Aacute uacute '
+                          '-30 Aacute ucircumflex -30 Aacute udieresis -30 '
+                          'Aacute ugrave -30 Aacute uhungarumlaut -30 Aacute '
+                          'umacron -30 Aacute uogonek -30 Aacute uring -30 '
+                          'Aacute v -40 Aacute w -30 Aacute y -30 Aacute '
+                          'yacute -30 Aacute ydieresis -30 Abreve C -40 '
+                          'Abreve Cacute -40 Abreve Ccaron -40 Abreve '
+                          'Ccedilla -40 Abreve G -50 Abreve Gbreve -50 Abreve '
+                          'Gcommaaccent -50 Abreve O -40 Abreve Oacute -40 '
+                          'Abreve Ocircumflex -40 Abreve Odieresis -40 Abreve '
+                          'Ograve -40 Abreve Ohungarumlaut -40 Abreve Omacron '
+                          '-40 Abreve Oslash -40 Abreve Otilde -40 Abreve Q '
+                          '-40 Abreve T -90 Abreve Tcaron -90 Abreve '
+                          'Tcommaaccent -90 Abreve U -50 Abreve Uacute -50 '
+                          'Abreve Ucircumflex -50 Abreve Udieresis -50 Abreve '
+                          'Ugrave -50 Abreve Uhungarumlaut -50 Abreve Umacron '
+                          '-50 Abreve Uogonek -50 Abreve Uring -50 Abreve V '
+                          '-80 Abreve W -60 Abreve Y -110 Abreve Yacute -110 '
+                          'Abreve Ydieresis -110 Abreve u -30 Abreve uacute '
+                          '-30 Abreve ucircumflex -30 Abreve udieresis -30 '
+                          'Abreve ugrave -30 Abreve uhungarumlaut -30 Abreve '
+                          'umacron -30 Abreve uogonek -30 Abreve uring -30 '
+                          'Abreve v -40 Abreve w -30 Abreve y -30 Abreve '
+                          'yacute -30 Abreve ydieresis -30 Acircumflex C -40 '
+                          'Acircumflex Cacute -40 Acircumflex Ccaron -40 '
+                          'Acircumflex Ccedilla -40 Acircumflex G -50 '
+                          'Acircumflex Gbreve -50 Acircumflex Gcommaaccent '
+                          '-50 Acircumflex O -40 Acircumflex Oacute -40 '
+                          'Acircumflex Ocircumflex -40 Acircumflex Odieresis '
+                          '-40 Acircumflex Ograve -40 Acircumflex '
+                          'Ohungarumlaut -40 Acircumflex Omacron -40 '
+                          'Acircumflex Oslash -40 Acircumflex Otilde -40 '
+                          'Acircumflex Q -40 Acircumflex T -90 Acircumflex '
+                          'Tcaron -90 Acircumflex Tcommaaccent -90 '
+                          'Acircumflex U -50 Acircumflex Uacute -50 '
+                          'Acircumflex Ucircumflex -50 Acircumflex Udieresis '
+                          '-50 Acircumflex Ugrave -50 Acircumflex '
+                          'Uhungarumlaut -50 Acircumflex Umacron -50 '
+                          'Acircumflex Uogonek -50 Acircumflex Uring -50 '
+                          'Acircumflex V -80 Acircumflex W -60 Acircumflex Y '
+                          '-110 Acircumflex Yacute -110 Acircumflex Ydieresis '
+                          '-110 Acircumflex u -30 Acircumflex uacute -30 '
+                          'Acircumflex ucircumflex -30 Acircumflex udieresis '
+                          '-30 Acircumflex ugrave -30 Acircumflex '
+                          'uhungarumlaut -30 Acircumflex umacron -30 '
+                          'Acircumflex uogonek -30 Acircumflex uring -30 '
+                          'Acircumflex v -40 Acircumflex w -30 Acircumflex y '
+                          '-30 Acircumflex yacute -30 Acircumflex ydieresis '
+                          '-30 Adieresis C -40 Adieresis Cacute -40 Adieresis '
+                          'Ccaron -40 Adieresis Ccedilla -40 Adieresis G -50 '
+                          'Adieresis Gbreve -50 Adieresis Gcommaaccent -50 '
+                          'Adieresis O -40 Adieresis Oacute -40 Adieresis '
+                          'Ocircumflex -40 Adieresis Odieresis -40 Adieresis '
+                          'Ograve -40 Adieresis Ohungarumlaut -40 Adieresis '
+                          'Omacron -40 Adieresis Oslash -40 Adieresis Otilde '
+                          '-40 Adieresis Q -40 Adieresis T -90 Adieresis '
+                          'Tcaron -90 Adieresis Tcommaaccent -90 Adieresis U '
+                          '-50 Adieresis Uacute -50 Adieresis Ucircumflex -50 '
+                          'Adieresis Udieresis -50 Adieresis Ugrave -50 '
+                          'Adieresis Uhungarumlaut -50 Adieresis Umacron -50 '
+                          'Adieresis Uogonek -50 Adieresis Uring -50 '
+                          'Adieresis V -80 Adieresis W -60 Adieresis Y -110 '
+                          'Adieresis Yacute -110 Adieresis Ydieresis -110 '
+                          'Adieresis u -30 Adieresis uacute -30 Adieresis '
+                          'ucircumflex -30 Adieresis udieresis -30 Adieresis '
+                          'ugrave -30 Adieresis uhungarumlaut -30 Adieresis '
+                          'umacron -30 Adieresis uogonek -30 Adieresis uring '
+                          '-30 Adieresis v -40 Adieresis w -30 Adieresis y '
+                          '-30 Adieresis yacute -30 Adieresis ydieresis -30 '
+                          'Agrave C -40 Agrave Cacute -40 Agrave Ccaron -40 '
+                          'Agrave Ccedilla -40 Agrave G -50 Agrave Gbreve -50 '
+                          'Agrave Gcommaaccent -50 Agrave O -40 Agrave Oacute '
+                          '-40 Agrave Ocircumflex -40 Agrave Odieresis -40 '
+                          'Agrave Ograve -40 Agrave Ohungarumlaut -40 Agrave '
+                          'Omacron -40 Agrave Oslash -40 Agrave Otilde -40 '
+                          'Agrave Q -40 Agrave T -90 Agrave Tcaron -90 Agrave '
+                          'Tcommaaccent -90 Agrave U -50 Agrave Uacute -50 '
+                          'Agrave Ucircumflex -50 Agrave Udieresis -50 Agrave '
+                          'Ugrave -50 Agrave Uhungarumlaut -50 Agrave Umacron '
+                          '-50 Agrave Uogonek -50 Agrave Uring -50 Agrave V '
+                          '-80 Agrave W -60 Agrave Y -110 Agrave Yacute -110 '
+                          'Agrave Ydieresis -110 Agrave u -30 Agrave uacute '
+                          '-30 Agrave ucircumflex -30 Agrave udieresis -30 '
+                          'Agrave ugrave -30 Agrave uhungarumlaut -30 Agrave '
+                          'umacron -30 Agrave uogonek -30 Agrave uring -30 '
+                          'Agrave v -40 Agrave w -30 Agrave y -30 Agrave '
+                          'yacute -30 Agrave ydieresis -30 Amacron C -40 '
+                          'Amacron Cacute -40 Amacron Ccaron -40 Amacron '
+                          'Ccedilla -40 Amacron G -50 Amacron Gbreve -50 '
+                          'Amacron Gcommaaccent -50 Amacron O -40 Amacron '
+                          'Oacute -40 Amacron Ocircumflex -40 Amacron '
+                          'Odieresis -40 Amacron Ograve -40 Amacron '
+                          'Ohungarumlaut -40 Amacron Omacron -40 Amacron '
+                          'Oslash -40 Amacron Otilde -40 Amacron Q -40 '
+                          'Amacron T -90 Amacron Tcaron -90 Amacron '
+                          'Tcommaaccent -90 Amacron U -50 Amacron Uacute -50 '
+                          'Amacron Ucircumflex -50 Amacron Udieresis -50 '
+                          'Amacron Ugrave -50 Amacron Uhungarumlaut -50 '
+                          'Amacron Umacron -50 Amacron Uogonek -50 Amacron '
+                          'Uring -50 Amacron V -80 Amacron W -60 Amacron Y '
+                          '-110 Amacron Yacute -110 Amacron Ydieresis -110 '
+                          'Amacron u -30 Amacron uacute -30 Amacron '
+                          'ucircumflex -30 Amacron udieresis -30 Amacron '
+                          'ugrave -30 Amacron uhungarumlaut -30 Amacron '
+                          'umacron -30 Amacron uogonek -30 Amacron uring -30 '
+                          'Amacron v -40 Amacron w -30 Amacron y -30 Amacron '
+                          'yacute -30 Amacron ydieresis -30 Aogonek C -40 '
+                          'Aogonek Cacute -40 Aogonek Ccaron -40 Aogonek '
+                          'Ccedilla -40 Aogonek G -50 Aogonek Gbreve -50 '
+                          'Aogonek Gcommaaccent -50 Aogonek O -40 Aogonek '
+                          'Oacute -40 Aogonek Ocircumflex -40 Aogonek '
+                          'Odieresis -40 Aogonek Ograve -40 Aogonek '
+                          'Ohungarumlaut -40 Aogonek Omacron -40 Aogonek '
+                          'Oslash -40 Aogonek Otilde -40 Aogonek Q -40 '
+                          'Aogonek T -90 Aogonek Tcaron -90 Aogonek '
+                          'Tcommaaccent -90 Aogonek U -50 Aogonek Uacute -50 '
+                          'Aogonek Ucircumflex -50 Aogonek Udieresis -50 '
+                          'Aogonek Ugrave -50 Aogonek Uhungarumlaut -50 '
+                          'Aogonek Umacron -50 Aogonek Uogonek -50 Aogonek '
+                          'Uring -50 Aogonek V -80 Aogonek W -60 Aogonek Y '
+                          '-110 Aogonek Yacute -110 Aogonek Ydieresis -110 '
+                          'Aogonek u -30 Aogonek uacute -30 Aogonek '
+                          'ucircumflex -30 Aogonek udieresis -30 Aogonek '
+                          'ugrave -30 Aogonek uhungarumlaut -30 Aogonek '
+                          'umacron -30 Aogonek uogonek -30 Aogonek uring -30 '
+                          'Aogonek v -40 Aogonek w -30 Aogonek y -30 Aogonek '
+                          'yacute -30 Aogonek ydieresis -30 Aring C -40 Aring '
+                          'Cacute -40 Aring Ccaron -40 Aring Ccedilla -40 '
+                          'Aring G -50 Aring Gbreve -50 Aring Gcommaaccent '
+                          '-50 Aring O -40 Aring Oacute -40 Aring Ocircumflex '
+                          '-40 Aring Odieresis -40 Aring Ograve -40 Aring '
+                          'Ohungarumlaut -40 Aring Omacron -40 Aring Oslash '
+                          '-40 Aring Otilde -40 Aring Q -40 Aring T -90 Aring '
+                          'Tcaron -90 Aring Tcommaaccent -90 Aring U -50 '
+                          'Aring Uacute -50 Aring Ucircumflex -50 Aring '
+                          'Udieresis -50 Aring Ugrave -50 Aring Uhungarumlaut '
+                          '-50 Aring Umacron -50 Aring Uogonek -50 Aring '
+                          'Uring -50 Aring V -80 Aring W -60 Aring Y -110 '
+                          'Aring Yacute -110 Aring Ydieresis -110 Aring u -30 '
+                          'Aring uacute -30 Aring ucircumflex -30 Aring '
+                          'udieresis -30 Aring ugrave -30 Aring uhungarumlaut '
+                          '-30 Aring umacron -30 Aring uogonek -30 Aring '
+                          'uring -30 Aring v -40 Aring w -30 Aring y -30 '
+                          'Aring yacute -30 Aring ydieresis -30 Atilde C -40 '
+                          'Atilde Cacute -40 Atilde Ccaron -40 Atilde '
+                          'Ccedilla -40 Atilde G -50 Atilde Gbreve -50 Atilde '
+                          'Gcommaaccent -50 Atilde O -40 Atilde Oacute -40 '
+                          'Atilde Ocircumflex -40 Atilde Odieresis -40 Atilde '
+                          'Ograve -40 Atilde Ohungarumlaut -40 Atilde Omacron '
+                          '-40 Atilde Oslash -40 Atilde Otilde -40 Atilde Q '
+                          '-40 Atilde T -90 Atilde Tcaron -90 Atilde '
+                          'Tcommaaccent -90 Atilde U -50 Atilde Uacute -50 '
+                          'Atilde Ucircumflex -50 Atilde Udieresis -50 Atilde '
+                          'Ugrave -50 Atilde Uhungarumlaut -50 Atilde Umacron '
+                          '-50 Atilde Uogonek -50 Atilde Uring -50 Atilde V '
+                          '-80 Atilde W -60 Atilde Y -110 Atilde Yacute -110 '
+                          'Atilde Ydieresis -110 Atilde u -30 Atilde uacute '
+                          '-30 Atilde ucircumflex -30 Atilde udieresis -30 '
+                          'Atilde ugrave -30 Atilde uhungarumlaut -30 Atilde '
+                          'umacron -30 Atilde uogonek -30 Atilde uring -30 '
+                          'Atilde v -40 Atilde w -30 Atilde y -30 Atilde '
+                          'yacute -30 Atilde ydieresis -30 B A -30 B Aacute '
+                          '-30 B Abreve -30 B Acircumflex -30 B Adieresis -30 '
+                          'B Agrave -30 B Amacron -30 B Aogonek -30 B Aring '
+                          '-30 B Atilde -30 B U -10 B Uacute -10 B '
+                          'Ucircumflex -10 B Udieresis -10 B Ugrave -10 B '
+                          'Uhungarumlaut -10 B Umacron -10 B Uogonek -10 B '
+                          'Uring -10 D A -40 D Aacute -40 D Abreve -40 D '
+                          'Acircumflex -40 D Adieresis -40 D Agrave -40 D '
+                          'Amacron -40 D Aogonek -40 D Aring -40 D Atilde -40 '
+                          'D V -40 D W -40 D Y -70 D Yacute -70 D Ydieresis '
+                          '-70 D comma -30 D period -30 Dcaron A -40 Dcaron '
+                          'Aacute -40 Dcaron Abreve -40 Dcaron Acircumflex '
+                          '-40 Dcaron Adieresis -40 Dcaron Agrave -40 Dcaron '
+                          'Amacron -40 Dcaron Aogonek -40 Dcaron Aring -40 '
+                          'Dcaron Atilde -40 Dcaron V -40 Dcaron W -40 Dcaron '
+                          'Y -70 Dcaron Yacute -70 Dcaron Ydieresis -70 '
+                          'Dcaron comma -30 Dcaron period -30 Dcroat A -40 '
+                          'Dcroat Aacute -40 Dcroat Abreve -40 Dcroat '
+                          'Acircumflex -40 Dcroat Adieresis -40 Dcroat Agrave '
+                          '-40 Dcroat Amacron -40 Dcroat Aogonek -40 Dcroat '
+                          'Aring -40 Dcroat Atilde -40 Dcroat V -40 Dcroat W '
+                          '-40 Dcroat Y -70 Dcroat Yacute -70 Dcroat '
+                          'Ydieresis -70 Dcroat comma -30 Dcroat period -30 F '
+                          'A -80 F Aacute -80 F Abreve -80 F Acircumflex -80 '
+                          'F Adieresis -80 F Agrave -80 F Amacron -80 F '
+                          'Aogonek -80 F Aring -80 F Atilde -80 F a -20 F '
+                          'aacute -20 F abreve -20 F acircumflex -20 F '
+                          'adieresis -20 F agrave -20 F amacron -20 F aogonek '
+                          '-20 F aring -20 F atilde -20 F comma -100 F period '
+                          '-100 J A -20 J Aacute -20 J Abreve -20 J '
+                          'Acircumflex -20 J Adieresis -20 J Agrave -20 J '
+                          'Amacron -20 J Aogonek -20 J Aring -20 J Atilde -20 '
+                          'J comma -20 J period -20 J u -20 J uacute -20 J '
+                          'ucircumflex -20 J udieresis -20 J ugrave -20 J '
+                          'uhungarumlaut -20 J umacron -20 J uogonek -20 J '
+                          'uring -20 K O -30 K Oacute -30 K Ocircumflex -30 K '
+                          'Odieresis -30 K Ograve -30 K Ohungarumlaut -30 K '
+                          'Omacron -30 K Oslash -30 K Otilde -30 K e -15 K '
+                          'eacute -15 K ecaron -15 K ecircumflex -15 K '
+                          'edieresis -15 K edotaccent -15 K egrave -15 K '
+                          'emacron -15 K eogonek -15 K o -35 K oacute -35 K '
+                          'ocircumflex -35 K odieresis -35 K ograve -35 K '
+                          'ohungarumlaut -35 K omacron -35 K oslash -35 K '
+                          'otilde -35 K u -30 K uacute -30 K ucircumflex -30 '
+                          'K udieresis -30 K ugrave -30 K uhungarumlaut -30 K '
+                          'umacron -30 K uogonek -30 K uring -30 K y -40 K '
+                          'yacute -40 K ydieresis -40 Kcommaaccent O -30 '
+                          'Kcommaaccent Oacute -30 Kcommaaccent Ocircumflex '
+                          '-30 Kcommaaccent Odieresis -30 Kcommaaccent Ograve '
+                          '-30 Kcommaaccent Ohungarumlaut -30 Kcommaaccent '
+                          'Omacron -30 Kcommaaccent Oslash -30 Kcommaaccent '
+                          'Otilde -30 Kcommaaccent e -15 Kcommaaccent eacute '
+                          '-15 Kcommaaccent ecaron -15 Kcommaaccent '
+                          'ecircumflex -15 Kcommaaccent edieresis -15 '
+                          'Kcommaaccent edotaccent -15 Kcommaaccent egrave '
+                          '-15 Kcommaaccent emacron -15 Kcommaaccent eogonek '
+                          '-15 Kcommaaccent o -35 Kcommaaccent oacute -35 '
+                          'Kcommaaccent ocircumflex -35 Kcommaaccent '
+                          'odieresis -35 Kcommaaccent ograve -35 Kcommaaccent '
+                          'ohungarumlaut -35 Kcommaaccent omacron -35 '
+                          'Kcommaaccent oslash -35 Kcommaaccent otilde -35 '
+                          'Kcommaaccent u -30 Kcommaaccent uacute -30 '
+                          'Kcommaaccent ucircumflex -30 Kcommaaccent '
+                          'udieresis -30 Kcommaaccent ugrave -30 Kcommaaccent '
+                          'uhungarumlaut -30 Kcommaaccent umacron -30 '
+                          'Kcommaaccent uogonek -30 Kcommaaccent uring -30 '
+                          'Kcommaaccent y -40 Kcommaaccent yacute -40 '
+                          'Kcommaaccent ydieresis -40 L T -90 L Tcaron -90 L '
+                          'Tcommaaccent -90 L V -110 L W -80 L Y -120 L '
+                          'Yacute -120 L Ydieresis -120 L quotedblright -140 '
+                          'L quoteright -140 L y -30 L yacute -30 L ydieresis '
+                          '-30 Lacute T -90 Lacute Tcaron -90 Lacute '
+                          'Tcommaaccent -90 Lacute V -110 Lacute W -80 Lacute '
+                          'Y -120 Lacute Yacute -120 Lacute Ydieresis -120 '
+                          'Lacute quotedblright -140 Lacute quoteright -140 '
+                          'Lacute y -30 Lacute yacute -30 Lacute ydieresis '
+                          '-30 Lcommaaccent T -90 Lcommaaccent Tcaron -90 '
+                          'Lcommaaccent Tcommaaccent -90 Lcommaaccent V -110 '
+                          'Lcommaaccent W -80 Lcommaaccent Y -120 '
+                          'Lcommaaccent Yacute -120 Lcommaaccent Ydieresis '
+                          '-120 Lcommaaccent quotedblright -140 Lcommaaccent '
+                          'quoteright -140 Lcommaaccent y -30 Lcommaaccent '
+                          'yacute -30 Lcommaaccent ydieresis -30 Lslash T -90 '
+                          'Lslash Tcaron -90 Lslash Tcommaaccent -90 Lslash V '
+                          '-110 Lslash W -80 Lslash Y -120 Lslash Yacute -120 '
+                          'Lslash Ydieresis -120 Lslash quotedblright -140 '
+                          'Lslash quoteright -140 Lslash y -30 Lslash yacute '
+                          '-30 Lslash ydieresis -30 O A -50 O Aacute -50 O '
+                          'Abreve -50 O Acircumflex -50 O Adieresis -50 O '
+                          'Agrave -50 O Amacron -50 O Aogonek -50 O Aring -50 '
+                          'O Atilde -50 O T -40 O Tcaron -40 O Tcommaaccent '
+                          '-40 O V -50 O W -50 O X -50 O Y -70 O Yacute -70 O '
+                          'Ydieresis -70 O comma -40 O period -40 Oacute A '
+                          '-50 Oacute Aacute -50 Oacute Abreve -50 Oacute '
+                          'Acircumflex -50 Oacute Adieresis -50 Oacute Agrave '
+                          '-50 Oacute Amacron -50 Oacute Aogonek -50 Oacute '
+                          'Aring -50 Oacute Atilde -50 Oacute T -40 Oacute '
+                          'Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 '
+                          'Oacute W -50 Oacute X -50 Oacute Y -70 Oacute '
+                          'Yacute -70 Oacute Ydieresis -70 Oacute comma -40 '
+                          'Oacute period -40 Ocircumflex A -50 Ocircumflex '
+                          'Aacute -50 Ocircumflex Abreve -50 Ocircumflex '
+                          'Acircumflex -50 Ocircumflex Adieresis -50 '
+                          'Ocircumflex Agrave -50 Ocircumflex Amacron -50 '
+                          'Ocircumflex Aogonek -50 Ocircumflex Aring -50 '
+                          'Ocircumflex Atilde -50 Ocircumflex T -40 '
+                          'Ocircumflex Tcaron -40 Ocircumflex Tcommaaccent '
+                          '-40 Ocircumflex V -50 Ocircumflex W -50 '
+                          'Ocircumflex X -50 Ocircumflex Y -70 Ocircumflex '
+                          'Yacute -70 Ocircumflex Ydieresis -70 Ocircumflex '
+                          'comma -40 Ocircumflex period -40 Odieresis A -50 '
+                          'Odieresis Aacute -50 Odieresis Abreve -50 '
+                          'Odieresis Acircumflex -50 Odieresis Adieresis -50 '
+                          'Odieresis Agrave -50 Odieresis Amacron -50 '
+                          'Odieresis Aogonek -50 Odieresis Aring -50 '
+                          'Odieresis Atilde -50 Odieresis T -40 Odieresis '
+                          'Tcaron -40 Odieresis Tcommaaccent -40 Odieresis V '
+                          '-50 Odieresis W -50 Odieresis X -50 Odieresis Y '
+                          '-70 Odieresis Yacute -70 Odieresis Ydieresis -70 '
+                          'Odieresis comma -40 Odieresis period -40 Ograve A '
+                          '-50 Ograve Aacute -50 Ograve Abreve -50 Ograve '
+                          'Acircumflex -50 Ograve Adieresis -50 Ograve Agrave '
+                          '-50 Ograve Amacron -50 Ograve Aogonek -50 Ograve '
+                          'Aring -50 Ograve Atilde -50 Ograve T -40 Ograve '
+                          'Tcaron -40 Ograve Tcommaaccent -40 Ograve V -50 '
+                          'Ograve W -50 Ograve X -50 Ograve Y -70 Ograve '
+                          'Yacute -70 Ograve Ydieresis -70 Ograve comma -40 '
+                          'Ograve period -40 Ohungarumlaut A -50 '
+                          'Ohungarumlaut Aacute -50 Ohungarumlaut Abreve -50 '
+                          'Ohungarumlaut Acircumflex -50 Ohungarumlaut '
+                          'Adieresis -50 Ohungarumlaut Agrave -50 '
+                          'Ohungarumlaut Amacron -50 Ohungarumlaut Aogonek '
+                          '-50 Ohungarumlaut Aring -50 Ohungarumlaut Atilde '
+                          '-50 Ohungarumlaut T -40 Ohungarumlaut Tcaron -40 '
+                          'Ohungarumlaut Tcommaaccent -40 Ohungarumlaut V -50 '
+                          'Ohungarumlaut W -50 Ohungarumlaut X -50 '
+                          'Ohungarumlaut Y -70 Ohungarumlaut Yacute -70 '
+                          'Ohungarumlaut Ydieresis -70 Ohungarumlaut comma '
+                          '-40 Ohungarumlaut period -40 Omacron A -50 Omacron '
+                          'Aacute -50 Omacron Abreve -50 Omacron Acircumflex '
+                          '-50 Omacron Adieresis -50 Omacron Agrave -50 '
+                          'Omacron Amacron -50 Omacron Aogonek -50 Omacron '
+                          'Aring -50 Omacron Atilde -50 Omacron T -40 Omacron '
+                          'Tcaron -40 Omacron Tcommaaccent -40 Omacron V -50 '
+                          'Omacron W -50 Omacron X -50 Omacron Y -70 Omacron '
+                          'Yacute -70 Omacron Ydieresis -70 Omacron comma -40 '
+                          'Omacron period -40 Oslash A -50 Oslash Aacute -50 '
+                          'Oslash Abreve -50 Oslash Acircumflex -50 Oslash '
+                          'Adieresis -50 Oslash Agrave -50 Oslash Amacron -50 '
+                          'Oslash Aogonek -50 Oslash Aring -50 Oslash Atilde '
+                          '-50 Oslash T -40 Oslash Tcaron -40 Oslash '
+                          'Tcommaaccent -40 Oslash V -50 Oslash W -50 Oslash '
+                          'X -50 Oslash Y -70 Oslash Yacute -70 Oslash '
+                          'Ydieresis -70 Oslash comma -40 Oslash period -40 '
+                          'Otilde A -50 Otilde Aacute -50 Otilde Abreve -50 '
+                          'Otilde Acircumflex -50 Otilde Adieresis -50 Otilde '
+                          'Agrave -50 Otilde Amacron -50 Otilde Aogonek -50 '
+                          'Otilde Aring -50 Otilde Atilde -50 Otilde T -40 '
+                          'Otilde Tcaron -40 Otilde Tcommaaccent -40 Otilde V '
+                          '-50 Otilde W -50 Otilde X -50 Otilde Y -70 Otilde '
+                          'Yacute -70 Otilde Ydieresis -70 Otilde comma -40 '
+                          'Otilde period -40 P A -100 P Aacute -100 P Abreve '
+                          '-100 P Acircumflex -100 P Adieresis -100 P Agrave '
+                          '-100 P Amacron -100 P Aogonek -100 P Aring -100 P '
+                          'Atilde -100 P a -30 P aacute -30 P abreve -30 P '
+                          'acircumflex -30 P adieresis -30 P agrave -30 P '
+                          'amacron -30 P aogonek -30 P aring -30 P atilde -30 '
+                          'P comma -120 P e -30 P eacute -30 P ecaron -30 P '
+                          'ecircumflex -30 P edieresis -30 P edotaccent -30 P '
+                          'egrave -30 P emacron -30 P eogonek -30 P o -40 P '
+                          'oacute -40 P ocircumflex -40 P odieresis -40 P '
+                          'ograve -40 P ohungarumlaut -40 P omacron -40 P '
+                          'oslash -40 P otilde -40 P period -120 Q U -10 Q '
+                          'Uacute -10 Q Ucircumflex -10 Q Udieresis -10 Q '
+                          'Ugrave -10 Q Uhungarumlaut -10 Q Umacron -10 Q '
+                          'Uogonek -10 Q Uring -10 Q comma 20 Q period 20 R O '
+                          '-20 R Oacute -20 R Ocircumflex -20 R Odieresis -20 '
+                          'R Ograve -20 R Ohungarumlaut -20 R Omacron -20 R '
+                          'Oslash -20 R Otilde -20 R T -20 R Tcaron -20 R '
+                          'Tcommaaccent -20 R U -20 R Uacute -20 R '
+                          'Ucircumflex -20 R Udieresis -20 R Ugrave -20 R '
+                          'Uhungarumlaut -20 R Umacron -20 R Uogonek -20 R '
+                          'Uring -20 R V -50 R W -40 R Y -50 R Yacute -50 R '
+                          'Ydieresis -50 Racute O -20 Racute Oacute -20 '
+                          'Racute Ocircumflex -20 Racute Odieresis -20 Racute '
+                          'Ograve -20 Racute Ohungarumlaut -20 Racute Omacron '
+                          '-20 Racute Oslash -20 Racute Otilde -20 Racute T '
+                          '-20 Racute Tcaron -20 Racute Tcommaaccent -20 '
+                          'Racute U -20 Racute Uacute -20 Racute Ucircumflex '
+                          '-20 Racute Udieresis -20 Racute Ugrave -20 Racute '
+                          'Uhungarumlaut -20 Racute Umacron -20 Racute '
+                          'Uogonek -20 Racute Uring -20 Racute V -50 Racute W '
+                          '-40 Racute Y -50 Racute Yacute -50 Racute '
+                          'Ydieresis -50 Rcaron O -20 Rcaron Oacute -20 '
+                          'Rcaron Ocircumflex -20 Rcaron Odieresis -20 Rcaron '
+                          'Ograve -20 Rcaron Ohungarumlaut -20 Rcaron Omacron '
+                          '-20 Rcaron Oslash -20 Rcaron Otilde -20 Rcaron T '
+                          '-20 Rcaron Tcaron -20 Rcaron Tcommaaccent -20 '
+                          'Rcaron U -20 Rcaron Uacute -20 Rcaron Ucircumflex '
+                          '-20 Rcaron Udieresis -20 Rcaron Ugrave -20 Rcaron '
+                          'Uhungarumlaut -20 Rcaron Umacron -20 Rcaron '
+                          'Uogonek -20 Rcaron Uring -20 Rcaron V -50 Rcaron W '
+                          '-40 Rcaron Y -50 Rcaron Yacute -50 Rcaron '
+                          'Ydieresis -50 Rcommaaccent O -20 Rcommaaccent '
+                          'Oacute -20 Rcommaaccent Ocircumflex -20 '
+                          'Rcommaaccent Odieresis -20 Rcommaaccent Ograve -20 '
+                          'Rcommaaccent Ohungarumlaut -20 Rcommaaccent '
+                          'Omacron -20 Rcommaaccent Oslash -20 Rcommaaccent '
+                          'Otilde -20 Rcommaaccent T -20 Rcommaaccent Tcaron '
+                          '-20 Rcommaaccent Tcommaaccent -20 Rcommaaccent U '
+                          '-20 Rcommaaccent Uacute -20 Rcommaaccent '
+                          'Ucircumflex -20 Rcommaaccent Udieresis -20 '
+                          'Rcommaaccent Ugrave -20 Rcommaaccent Uhungarumlaut '
+                          '-20 Rcommaaccent Umacron -20 Rcommaaccent Uogonek '
+                          '-20 Rcommaaccent Uring -20 Rcommaaccent V -50 '
+                          'Rcommaaccent W -40 Rcommaaccent Y -50 Rcommaaccent '
+                          'Yacute -50 Rcommaaccent Ydieresis -50 T A -90 T '
+                          'Aacute -90 T Abreve -90 T Acircumflex -90 T '
+                          'Adieresis -90 T Agrave -90 T Amacron -90 T Aogonek '
+                          '-90 T Aring -90 T Atilde -90 T O -40 T Oacute -40 '
+                          'T Ocircumflex -40 T Odieresis -40 T Ograve -40 T '
+                          'Ohungarumlaut -40 T Omacron -40 T Oslash -40 T '
+                          'Otilde -40 T a -80 T aacute -80 T abreve -80 T '
+                          'acircumflex -80 T adieresis -80 T agrave -80 T '
+                          'amacron -80 T aogonek -80 T aring -80 T atilde -80 '
+                          'T colon -40 T comma -80 T e -60 T eacute -60 T '
+                          'ecaron -60 T ecircumflex -60 T edieresis -60 T '
+                          'edotaccent -60 T egrave -60 T emacron -60 T '
+                          'eogonek -60 T hyphen -120 T o -80 T oacute -80 T '
+                          'ocircumflex -80 T odieresis -80 T ograve -80 T '
+                          'ohungarumlaut -80 T omacron -80 T oslash -80 T '
+                          'otilde -80 T period -80 T r -80 T racute -80 T '
+                          'rcommaaccent -80 T semicolon -40 T u -90 T uacute '
+                          '-90 T ucircumflex -90 T udieresis -90 T ugrave -90 '
+                          'T uhungarumlaut -90 T umacron -90 T uogonek -90 T '
+                          'uring -90 T w -60 T y -60 T yacute -60 T ydieresis '
+                          '-60 Tcaron A -90 Tcaron Aacute -90 Tcaron Abreve '
+                          '-90 Tcaron Acircumflex -90 Tcaron Adieresis -90 '
+                          'Tcaron Agrave -90 Tcaron Amacron -90 Tcaron '
+                          'Aogonek -90 Tcaron Aring -90 Tcaron Atilde -90 '
+                          'Tcaron O -40 Tcaron Oacute -40 Tcaron Ocircumflex '
+                          '-40 Tcaron Odieresis -40 Tcaron Ograve -40 Tcaron '
+                          'Ohungarumlaut -40 Tcaron Omacron -40 Tcaron Oslash '
+                          '-40 Tcaron Otilde -40 Tcaron a -80 Tcaron aacute '
+                          '-80 Tcaron abreve -80 Tcaron acircumflex -80 '
+                          'Tcaron adieresis -80 Tcaron agrave -80 Tcaron '
+                          'amacron -80 Tcaron aogonek -80 Tcaron aring -80 '
+                          'Tcaron atilde -80 Tcaron colon -40 Tcaron comma '
+                          '-80 Tcaron e -60 Tcaron eacute -60 Tcaron ecaron '
+                          '-60 Tcaron ecircumflex -60 Tcaron edieresis -60 '
+                          'Tcaron edotaccent -60 Tcaron egrave -60 Tcaron '
+                          'emacron -60 Tcaron eogonek -60 Tcaron hyphen -120 '
+                          'Tcaron o -80 Tcaron oacute -80 Tcaron ocircumflex '
+                          '-80 Tcaron odieresis -80 Tcaron ograve -80 Tcaron '
+                          'ohungarumlaut -80 Tcaron omacron -80 Tcaron oslash '
+                          '-80 Tcaron otilde -80 Tcaron period -80 Tcaron r '
+                          '-80 Tcaron racute -80 Tcaron rcommaaccent -80 '
+                          'Tcaron semicolon -40 Tcaron u -90 Tcaron uacute '
+                          '-90 Tcaron ucircumflex -90 Tcaron udieresis -90 '
+                          'Tcaron ugrave -90 Tcaron uhungarumlaut -90 Tcaron '
+                          'umacron -90 Tcaron uogonek -90 Tcaron uring -90 '
+                          'Tcaron w -60 Tcaron y -60 Tcaron yacute -60 Tcaron '
+                          'ydieresis -60 Tcommaaccent A -90 Tcommaaccent '
+                          'Aacute -90 Tcommaaccent Abreve -90 Tcommaaccent '
+                          'Acircumflex -90 Tcommaaccent Adieresis -90 '
+                          'Tcommaaccent Agrave -90 Tcommaaccent Amacron -90 '
+                          'Tcommaaccent Aogonek -90 Tcommaaccent Aring -90 '
+                          'Tcommaaccent Atilde -90 Tcommaaccent O -40 '
+                          'Tcommaaccent Oacute -40 Tcommaaccent Ocircumflex '
+                          '-40 Tcommaaccent Odieresis -40 Tcommaaccent Ograve '
+                          '-40 Tcommaaccent Ohungarumlaut -40 Tcommaaccent '
+                          'Omacron -40 Tcommaaccent Oslash -40 Tcommaaccent '
+                          'Otilde -40 Tcommaaccent a -80 Tcommaaccent aacute '
+                          '-80 Tcommaaccent abreve -80 Tcommaaccent '
+                          'acircumflex -80 Tcommaaccent adieresis -80 '
+                          'Tcommaaccent agrave -80 Tcommaaccent amacron -80 '
+                          'Tcommaaccent aogonek -80 Tcommaaccent aring -80 '
+                          'Tcommaaccent atilde -80 Tcommaaccent colon -40 '
+                          'Tcommaaccent comma -80 Tcommaaccent e -60 '
+                          'Tcommaaccent eacute -60 Tcommaaccent ecaron -60 '
+                          'Tcommaaccent ecircumflex -60 Tcommaaccent '
+                          'edieresis -60 Tcommaaccent edotaccent -60 '
+                          'Tcommaaccent egrave -60 Tcommaaccent emacron -60 '
+                          'Tcommaaccent eogonek -60 Tcommaaccent hyphen -120 '
+                          'Tcommaaccent o -80 Tcommaaccent oacute -80 '
+                          'Tcommaaccent ocircumflex -80 Tcommaaccent '
+                          'odieresis -80 Tcommaaccent ograve -80 Tcommaaccent '
+                          'ohungarumlaut -80 Tcommaaccent omacron -80 '
+                          'Tcommaaccent oslash -80 Tcommaaccent otilde -80 '
+                          'Tcommaaccent period -80 Tcommaaccent r -80 '
+                          'Tcommaaccent racute -80 Tcommaaccent rcommaaccent '
+                          '-80 Tcommaaccent semicolon -40 Tcommaaccent u -90 '
+                          'Tcommaaccent uacute -90 Tcommaaccent ucircumflex '
+                          '-90 Tcommaaccent udieresis -90 Tcommaaccent ugrave '
+                          '-90 Tcommaaccent uhungarumlaut -90 Tcommaaccent '
+                          'umacron -90 Tcommaaccent uogonek -90 Tcommaaccent '
+                          'uring -90 Tcommaaccent w -60 Tcommaaccent y -60 '
+                          'Tcommaaccent yacute -60 Tcommaaccent ydieresis -60 '
+                          'U A -50 U Aacute -50 U Abreve -50 U Acircumflex '
+                          '-50 U Adieresis -50 U Agrave -50 U Amacron -50 U '
+                          'Aogonek -50 U Aring -50 U Atilde -50 U comma -30 U '
+                          'period -30 Uacute A -50 Uacute Aacute -50 Uacute '
+                          'Abreve -50 Uacute Acircumflex -50 Uacute Adieresis '
+                          '-50 Uacute Agrave -50 Uacute Amacron -50 Uacute '
+                          'Aogonek -50 Uacute Aring -50 Uacute Atilde -50 '
+                          'Uacute comma -30 Uacute period -30 Ucircumflex A '
+                          '-50 Ucircumflex Aacute -50 Ucircumflex Abreve -50 '
+                          'Ucircumflex Acircumflex -50 Ucircumflex Adieresis '
+                          '-50 Ucircumflex Agrave -50 Ucircumflex Amacron -50 '
+                          'Ucircumflex Aogonek -50 Ucircumflex Aring -50 '
+                          'Ucircumflex Atilde -50 Ucircumflex comma -30 '
+                          'Ucircumflex period -30 Udieresis A -50 Udieresis '
+                          'Aacute -50 Udieresis Abreve -50 Udieresis '
+                          'Acircumflex -50 Udieresis Adieresis -50 Udieresis '
+                          'Agrave -50 Udieresis Amacron -50 Udieresis Aogonek '
+                          '-50 Udieresis Aring -50 Udieresis Atilde -50 '
+                          'Udieresis comma -30 Udieresis period -30 Ugrave A '
+                          '-50 Ugrave Aacute -50 Ugrave Abreve -50 Ugrave '
+                          'Acircumflex -50 Ugrave Adieresis -50 Ugrave Agrave '
+                          '-50 Ugrave Amacron -50 Ugrave Aogonek -50 Ugrave '
+                          'Aring -50 Ugrave Atilde -50 Ugrave comma -30 '
+                          'Ugrave period -30 Uhungarumlaut A -50 '
+                          'Uhungarumlaut Aacute -50 Uhungarumlaut Abreve -50 '
+                          'Uhungarumlaut Acircumflex -50 Uhungarumlaut '
+                          'Adieresis -50 Uhungarumlaut Agrave -50 '
+                          'Uhungarumlaut Amacron -50 Uhungarumlaut Aogonek '
+                          '-50 Uhungarumlaut Aring -50 Uhungarumlaut Atilde '
+                          '-50 Uhungarumlaut comma -30 Uhungarumlaut period '
+                          '-30 Umacron A -50 Umacron Aacute -50 Umacron '
+                          'Abreve -50 Umacron Acircumflex -50 Umacron '
+                          'Adieresis -50 Umacron Agrave -50 Umacron Amacron '
+                          '-50 Umacron Aogonek -50 Umacron Aring -50 Umacron '
+                          'Atilde -50 Umacron comma -30 Umacron period -30 '
+                          'Uogonek A -50 Uogonek Aacute -50 Uogonek Abreve '
+                          '-50 Uogonek Acircumflex -50 Uogonek Adieresis -50 '
+                          'Uogonek Agrave -50 Uogonek Amacron -50 Uogonek '
+                          'Aogonek -50 Uogonek Aring -50 Uogonek Atilde -50 '
+                          'Uogonek comma -30 Uogonek period -30 Uring A -50 '
+                          'Uring Aacute -50 Uring Abreve -50 Uring '
+                          'Acircumflex -50 Uring Adieresis -50 Uring Agrave '
+                          '-50 Uring Amacron -50 Uring Aogonek -50 Uring '
+                          'Aring -50 Uring Atilde -50 Uring comma -30 Uring '
+                          'period -30 V A -80 V Aacute -80 V Abreve -80 V '
+                          'Acircumflex -80 V Adieresis -80 V Agrave -80 V '
+                          'Amacron -80 V Aogonek -80 V Aring -80 V Atilde -80 '
+                          'V G -50 V Gbreve -50 V Gcommaaccent -50 V O -50 V '
+                          'Oacute -50 V Ocircumflex -50 V Odieresis -50 V '
+                          'Ograve -50 V Ohungarumlaut -50 V Omacron -50 V '
+                          'Oslash -50 V Otilde -50 V a -60 V aacute -60 V '
+                          'abreve -60 V acircumflex -60 V adieresis -60 V '
+                          'agrave -60 V amacron -60 V aogonek -60 V aring -60 '
+                          'V atilde -60 V colon -40 V comma -120 V e -50 V '
+                          'eacute -50 V ecaron -50 V ecircumflex -50 V '
+                          'edieresis -50 V edotaccent -50 V egrave -50 V '
+                          'emacron -50 V eogonek -50 V hyphen -80 V o -90 V '
+                          'oacute -90 V ocircumflex -90 V odieresis -90 V '
+                          'ograve -90 V ohungarumlaut -90 V omacron -90 V '
+                          'oslash -90 V otilde -90 V period -120 V semicolon '
+                          '-40 V u -60 V uacute -60 V ucircumflex -60 V '
+                          'udieresis -60 V ugrave -60 V uhungarumlaut -60 V '
+                          'umacron -60 V uogonek -60 V uring -60 W A -60 W '
+                          'Aacute -60 W Abreve -60 W Acircumflex -60 W '
+                          'Adieresis -60 W Agrave -60 W Amacron -60 W Aogonek '
+                          '-60 W Aring -60 W Atilde -60 W O -20 W Oacute -20 '
+                          'W Ocircumflex -20 W Odieresis -20 W Ograve -20 W '
+                          'Ohungarumlaut -20 W Omacron -20 W Oslash -20 W '
+                          'Otilde -20 W a -40 W aacute -40 W abreve -40 W '
+                          'acircumflex -40 W adieresis -40 W agrave -40 W '
+                          'amacron -40 W aogonek -40 W aring -40 W atilde -40 '
+                          'W colon -10 W comma -80 W e -35 W eacute -35 W '
+                          'ecaron -35 W ecircumflex -35 W edieresis -35 W '
+                          'edotaccent -35 W egrave -35 W emacron -35 W '
+                          'eogonek -35 W hyphen -40 W o -60 W oacute -60 W '
+                          'ocircumflex -60 W odieresis -60 W ograve -60 W '
+                          'ohungarumlaut -60 W omacron -60 W oslash -60 W '
+                          'otilde -60 W period -80 W semicolon -10 W u -45 W '
+                          'uacute -45 W ucircumflex -45 W udieresis -45 W '
+                          'ugrave -45 W uhungarumlaut -45 W umacron -45 W '
+                          'uogonek -45 W uring -45 W y -20 W yacute -20 W '
+                          'ydieresis -20 Y A -110 Y Aacute -110 Y Abreve -110 '
+                          'Y Acircumflex -110 Y Adieresis -110 Y Agrave -110 '
+                          'Y Amacron -110 Y Aogonek -110 Y Aring -110 Y '
+                          'Atilde -110 Y O -70 Y Oacute -70 Y Ocircumflex -70 '
+                          'Y Odieresis -70 Y Ograve -70 Y Ohungarumlaut -70 Y '
+                          'Omacron -70 Y Oslash -70 Y Otilde -70 Y a -90 Y '
+                          'aacute -90 Y abreve -90 Y acircumflex -90 Y '
+                          'adieresis -90 Y agrave -90 Y amacron -90 Y aogonek '
+                          '-90 Y aring -90 Y atilde -90 Y colon -50 Y comma '
+                          '-100 Y e -80 Y eacute -80 Y ecaron -80 Y '
+                          'ecircumflex -80 Y edieresis -80 Y edotaccent -80 Y '
+                          'egrave -80 Y emacron -80 Y eogonek -80 Y o -100 Y '
+                          'oacute -100 Y ocircumflex -100 Y odieresis -100 Y '
+                          'ograve -100 Y ohungarumlaut -100 Y omacron -100 Y '
+                          'oslash -100 Y otilde -100 Y period -100 Y '
+                          'semicolon -50 Y u -100 Y uacute -100 Y ucircumflex '
+                          '-100 Y udieresis -100 Y ugrave -100 Y '
+                          'uhungarumlaut -100 Y umacron -100 Y uogonek -100 Y '
+                          'uring -100 Yacute A -110 Yacute Aacute -110 Yacute '
+                          'Abreve -110 Yacute Acircumflex -110 Yacute '
+                          'Adieresis -110 Yacute Agrave -110 Yacute Amacron '
+                          '-110 Yacute Aogonek -110 Yacute Aring -110 Yacute '
+                          'Atilde -110 Yacute O -70 Yacute Oacute -70 Yacute '
+                          'Ocircumflex -70 Yacute Odieresis -70 Yacute Ograve '
+                          '-70 Yacute Ohungarumlaut -70 Yacute Omacron -70 '
+                          'Yacute Oslash -70 Yacute Otilde -70 Yacute a -90 '
+                          'Yacute aacute -90 Yacute abreve -90 Yacute '
+                          'acircumflex -90 Yacute adieresis -90 Yacute agrave '
+                          '-90 Yacute amacron -90 Yacute aogonek -90 Yacute '
+                          'aring -90 Yacute atilde -90 Yacute colon -50 '
+                          'Yacute comma -100 Yacute e -80 Yacute eacute -80 '
+                          'Yacute ecaron -80 Yacute ecircumflex -80 Yacute '
+                          'edieresis -80 Yacute edotaccent -80 Yacute egrave '
+                          '-80 Yacute emacron -80 Yacute eogonek -80 Yacute o '
+                          '-100 Yacute oacute -100 Yacute ocircumflex -100 '
+                          'Yacute odieresis -100 Yacute ograve -100 Yacute '
+                          'ohungarumlaut -100 Yacute omacron -100 Yacute '
+                          'oslash -100 Yacute otilde -100 Yacute period -100 '
+                          'Yacute semicolon -50 Yacute u -100 Yacute uacute '
+                          '-100 Yacute ucircumflex -100 Yacute udieresis -100 '
+                          'Yacute ugrave -100 Yacute uhungarumlaut -100 '
+                          'Yacute umacron -100 Yacute uogonek -100 Yacute '
+                          'uring -100 Ydieresis A -110 Ydieresis Aacute -110 '
+                          'Ydieresis Abreve -110 Ydieresis Acircumflex -110 '
+                          'Ydieresis Adieresis -110 Ydieresis Agrave -110 '
+                          'Ydieresis Amacron -110 Ydieresis Aogonek -110 '
+                          'Ydieresis Aring -110 Ydieresis Atilde -110 '
+                          'Ydieresis O -70 Ydieresis Oacute -70 Ydieresis '
+                          'Ocircumflex -70 Ydieresis Odieresis -70 Ydieresis '
+                          'Ograve -70 Ydieresis Ohungarumlaut -70 Ydieresis '
+                          'Omacron -70 Ydieresis Oslash -70 Ydieresis Otilde '
+                          '-70 Ydieresis a -90 Ydieresis aacute -90 Ydieresis '
+                          'abreve -90 Ydieresis acircumflex -90 Ydieresis '
+                          'adieresis -90 Ydieresis agrave -90 Ydieresis '
+                          'amacron -90 Ydieresis aogonek -90 Ydieresis aring '
+                          '-90 Ydieresis atilde -90 Ydieresis colon -50 '
+                          'Ydieresis comma -100 Ydieresis e -80 Ydieresis '
+                          'eacute -80 Ydieresis ecaron -80 Ydieresis '
+                          'ecircumflex -80 Ydieresis edieresis -80 Ydieresis '
+                          'edotaccent -80 Ydieresis egrave -80 Ydieresis '
+                          'emacron -80 Ydieresis eogonek -80 Ydieresis o -100 '
+                          'Ydieresis oacute -100 Ydieresis ocircumflex -100 '
+                          'Ydieresis odieresis -100 Ydieresis ograve -100 '
+                          'Ydieresis ohungarumlaut -100 Ydieresis omacron '
+                          '-100 Ydieresis oslash -100 Ydieresis otilde -100 '
+                          'Ydieresis period -100 Ydieresis semicolon -50 '
+                          'Ydieresis u -100 Ydieresis uacute -100 Ydieresis '
+                          'ucircumflex -100 Ydieresis udieresis -100 '
+                          'Ydieresis ugrave -100 Ydieresis uhungarumlaut -100 '
+                          'Ydieresis umacron -100 Ydieresis uogonek -100 '
+                          'Ydieresis uring -100 a g -10 a gbreve -10 a '
+                          'gcommaaccent -10 a v -15 a w -15 a y -20 a yacute '
+                          '-20 a ydieresis -20 aacute g -10 aacute gbreve -10 '
+                          'aacute gcommaaccent -10 aacute v -15 aacute w -15 '
+                          'aacute y -20 aacute yacute -20 aacute ydieresis '
+                          '-20 abreve g -10 abreve gbreve -10 abreve '
+                          'gcommaaccent -10 abreve v -15 abreve w -15 abreve '
+                          'y -20 abreve yacute -20 abreve ydieresis -20 '
+                          'acircumflex g -10 acircumflex gbreve -10 '
+                          'acircumflex gcommaaccent -10 acircumflex v -15 '
+                          'acircumflex w -15 acircumflex y -20 acircumflex '
+                          'yacute -20 acircumflex ydieresis -20 adieresis g '
+                          '-10 adieresis gbreve -10 adieresis gcommaaccent '
+                          '-10 adieresis v -15 adieresis w -15 adieresis y '
+                          '-20 adieresis yacute -20 adieresis ydieresis -20 '
+                          'agrave g -10 agrave gbreve -10 agrave gcommaaccent '
+                          '-10 agrave v -15 agrave w -15 agrave y -20 agrave '
+                          'yacute -20 agrave ydieresis -20 amacron g -10 '
+                          'amacron gbreve -10 amacron gcommaaccent -10 '
+                          'amacron v -15 amacron w -15 amacron y -20 amacron '
+                          'yacute -20 amacron ydieresis -20 aogonek g -10 '
+                          'aogonek gbreve -10 aogonek gcommaaccent -10 '
+                          'aogonek v -15 aogonek w -15 aogonek y -20 aogonek '
+                          'yacute -20 aogonek ydieresis -20 aring g -10 aring '
+                          'gbreve -10 aring gcommaaccent -10 aring v -15 '
+                          'aring w -15 aring y -20 aring yacute -20 aring '
+                          'ydieresis -20 atilde g -10 atilde gbreve -10 '
+                          'atilde gcommaaccent -10 atilde v -15 atilde w -15 '
+                          'atilde y -20 atilde yacute -20 atilde ydieresis '
+                          '-20 b l -10 b lacute -10 b lcommaaccent -10 b '
+                          'lslash -10 b u -20 b uacute -20 b ucircumflex -20 '
+                          'b udieresis -20 b ugrave -20 b uhungarumlaut -20 b '
+                          'umacron -20 b uogonek -20 b uring -20 b v -20 b y '
+                          '-20 b yacute -20 b ydieresis -20 c h -10 c k -20 c '
+                          'kcommaaccent -20 c l -20 c lacute -20 c '
+                          'lcommaaccent -20 c lslash -20 c y -10 c yacute -10 '
+                          'c ydieresis -10 cacute h -10 cacute k -20 cacute '
+                          'kcommaaccent -20 cacute l -20 cacute lacute -20 '
+                          'cacute lcommaaccent -20 cacute lslash -20 cacute y '
+                          '-10 cacute yacute -10 cacute ydieresis -10 ccaron '
+                          'h -10 ccaron k -20 ccaron kcommaaccent -20 ccaron '
+                          'l -20 ccaron lacute -20 ccaron lcommaaccent -20 '
+                          'ccaron lslash -20 ccaron y -10 ccaron yacute -10 '
+                          'ccaron ydieresis -10 ccedilla h -10 ccedilla k -20 '
+                          'ccedilla kcommaaccent -20 ccedilla l -20 ccedilla '
+                          'lacute -20 ccedilla lcommaaccent -20 ccedilla '
+                          'lslash -20 ccedilla y -10 ccedilla yacute -10 '
+                          'ccedilla ydieresis -10 colon space -40 comma '
+                          'quotedblright -120 comma quoteright -120 comma '
+                          'space -40 d d -10 d dcroat -10 d v -15 d w -15 d y '
+                          '-15 d yacute -15 d ydieresis -15 dcroat d -10 '
+                          'dcroat dcroat -10 dcroat v -15 dcroat w -15 dcroat '
+                          'y -15 dcroat yacute -15 dcroat ydieresis -15 e '
+                          'comma 10 e period 20 e v -15 e w -15 e x -15 e y '
+                          '-15 e yacute -15 e ydieresis -15 eacute comma 10 '
+                          'eacute period 20 eacute v -15 eacute w -15 eacute '
+                          'x -15 eacute y -15 eacute yacute -15 eacute '
+                          'ydieresis -15 ecaron comma 10 ecaron period 20 '
+                          'ecaron v -15 ecaron w -15 ecaron x -15 ecaron y '
+                          '-15 ecaron yacute -15 ecaron ydieresis -15 '
+                          'ecircumflex comma 10 ecircumflex period 20 '
+                          'ecircumflex v -15 ecircumflex w -15 ecircumflex x '
+                          '-15 ecircumflex y -15 ecircumflex yacute -15 '
+                          'ecircumflex ydieresis -15 edieresis comma 10 '
+                          'edieresis period 20 edieresis v -15 edieresis w '
+                          '-15 edieresis x -15 edieresis y -15 edieresis '
+                          'yacute -15 edieresis ydieresis -15 edotaccent '
+                          'comma 10 edotaccent period 20 edotaccent v -15 '
+                          'edotaccent w -15 edotaccent x -15 edotaccent y -15 '
+                          'edotaccent yacute -15 edotaccent ydieresis -15 '
+                          'egrave comma 10 egrave period 20 egrave v -15 '
+                          'egrave w -15 egrave x -15 egrave y -15 egrave '
+                          'yacute -15 egrave ydieresis -15 emacron comma 10 '
+                          'emacron period 20 emacron v -15 emacron w -15 '
+                          'emacron x -15 emacron y -15 emacron yacute -15 '
+                          'emacron ydieresis -15 eogonek comma 10 eogonek '
+                          'period 20 eogonek v -15 eogonek w -15 eogonek x '
+                          '-15 eogonek y -15 eogonek yacute -15 eogonek '
+                          'ydieresis -15 f comma -10 f e -10 f eacute -10 f '
+                          'ecaron -10 f ecircumflex -10 f edieresis -10 f '
+                          'edotaccent -10 f egrave -10 f emacron -10 f '
+                          'eogonek -10 f o -20 f oacute -20 f ocircumflex -20 '
+                          'f odieresis -20 f ograve -20 f ohungarumlaut -20 f '
+                          'omacron -20 f oslash -20 f otilde -20 f period -10 '
+                          'f quotedblright 30 f quoteright 30 g e 10 g eacute '
+                          '10 g ecaron 10 g ecircumflex 10 g edieresis 10 g '
+                          'edotaccent 10 g egrave 10 g emacron 10 g eogonek '
+                          '10 g g -10 g gbreve -10 g gcommaaccent -10 gbreve '
+                          'e 10 gbreve eacute 10 gbreve ecaron 10 gbreve '
+                          'ecircumflex 10 gbreve edieresis 10 gbreve '
+                          'edotaccent 10 gbreve egrave 10 gbreve emacron 10 '
+                          'gbreve eogonek 10 gbreve g -10 gbreve gbreve -10 '
+                          'gbreve gcommaaccent -10 gcommaaccent e 10 '
+                          'gcommaaccent eacute 10 gcommaaccent ecaron 10 '
+                          'gcommaaccent ecircumflex 10 gcommaaccent edieresis '
+                          '10 gcommaaccent edotaccent 10 gcommaaccent egrave '
+                          '10 gcommaaccent emacron 10 gcommaaccent eogonek 10 '
+                          'gcommaaccent g -10 gcommaaccent gbreve -10 '
+                          'gcommaaccent gcommaaccent -10 h y -20 h yacute -20 '
+                          'h ydieresis -20 k o -15 k oacute -15 k ocircumflex '
+                          '-15 k odieresis -15 k ograve -15 k ohungarumlaut '
+                          '-15 k omacron -15 k oslash -15 k otilde -15 '
+                          'kcommaaccent o -15 kcommaaccent oacute -15 '
+                          'kcommaaccent ocircumflex -15 kcommaaccent '
+                          'odieresis -15 kcommaaccent ograve -15 kcommaaccent '
+                          'ohungarumlaut -15 kcommaaccent omacron -15 '
+                          'kcommaaccent oslash -15 kcommaaccent otilde -15 l '
+                          'w -15 l y -15 l yacute -15 l ydieresis -15 lacute '
+                          'w -15 lacute y -15 lacute yacute -15 lacute '
+                          'ydieresis -15 lcommaaccent w -15 lcommaaccent y '
+                          '-15 lcommaaccent yacute -15 lcommaaccent ydieresis '
+                          '-15 lslash w -15 lslash y -15 lslash yacute -15 '
+                          'lslash ydieresis -15 m u -20 m uacute -20 m '
+                          'ucircumflex -20 m udieresis -20 m ugrave -20 m '
+                          'uhungarumlaut -20 m umacron -20 m uogonek -20 m '
+                          'uring -20 m y -30 m yacute -30 m ydieresis -30 n u '
+                          '-10 n uacute -10 n ucircumflex -10 n udieresis -10 '
+                          'n ugrave -10 n uhungarumlaut -10 n umacron -10 n '
+                          'uogonek -10 n uring -10 n v -40 n y -20 n yacute '
+                          '-20 n ydieresis -20 nacute u -10 nacute uacute -10 '
+                          'nacute ucircumflex -10 nacute udieresis -10 nacute '
+                          'ugrave -10 nacute uhungarumlaut -10 nacute umacron '
+                          '-10 nacute uogonek -10 nacute uring -10 nacute v '
+                          '-40 nacute y -20 nacute yacute -20 nacute '
+                          'ydieresis -20 ncaron u -10 ncaron uacute -10 '
+                          'ncaron ucircumflex -10 ncaron udieresis -10 ncaron '
+                          'ugrave -10 ncaron uhungarumlaut -10 ncaron umacron '
+                          '-10 ncaron uogonek -10 ncaron uring -10 ncaron v '
+                          '-40 ncaron y -20 ncaron yacute -20 ncaron '
+                          'ydieresis -20 ncommaaccent u -10 ncommaaccent '
+                          'uacute -10 ncommaaccent ucircumflex -10 '
+                          'ncommaaccent udieresis -10 ncommaaccent ugrave -10 '
+                          'ncommaaccent uhungarumlaut -10 ncommaaccent '
+                          'umacron -10 ncommaaccent uogonek -10 ncommaaccent '
+                          'uring -10 ncommaaccent v -40 ncommaaccent y -20 '
+                          'ncommaaccent yacute -20 ncommaaccent ydieresis -20 '
+                          'ntilde u -10 ntilde uacute -10 ntilde ucircumflex '
+                          '-10 ntilde udieresis -10 ntilde ugrave -10 ntilde '
+                          'uhungarumlaut -10 ntilde umacron -10 ntilde '
+                          'uogonek -10 ntilde uring -10 ntilde v -40 ntilde y '
+                          '-20 ntilde yacute -20 ntilde ydieresis -20 o v -20 '
+                          'o w -15 o x -30 o y -20 o yacute -20 o ydieresis '
+                          '-20 oacute v -20 oacute w -15 oacute x -30 oacute '
+                          'y -20 oacute yacute -20 oacute ydieresis -20 '
+                          'ocircumflex v -20 ocircumflex w -15 ocircumflex x '
+                          '-30 ocircumflex y -20 ocircumflex yacute -20 '
+                          'ocircumflex ydieresis -20 odieresis v -20 '
+                          'odieresis w -15 odieresis x -30 odieresis y -20 '
+                          'odieresis yacute -20 odieresis ydieresis -20 '
+                          'ograve v -20 ograve w -15 ograve x -30 ograve y '
+                          '-20 ograve yacute -20 ograve ydieresis -20 '
+                          'ohungarumlaut v -20 ohungarumlaut w -15 '
+                          'ohungarumlaut x -30 ohungarumlaut y -20 '
+                          'ohungarumlaut yacute -20 ohungarumlaut ydieresis '
+                          '-20 omacron v -20 omacron w -15 omacron x -30 '
+                          'omacron y -20 omacron yacute -20 omacron ydieresis '
+                          '-20 oslash v -20 oslash w -15 oslash x -30 oslash '
+                          'y -20 oslash yacute -20 oslash ydieresis -20 '
+                          'otilde v -20 otilde w -15 otilde x -30 otilde y '
+                          '-20 otilde yacute -20 otilde ydieresis -20 p y -15 '
+                          'p yacute -15 p ydieresis -15 period quotedblright '
+                          '-120 period quoteright -120 period space -40 '
+                          'quotedblright space -80 quoteleft quoteleft -46 '
+                          'quoteright d -80 quoteright dcroat -80 quoteright '
+                          'l -20 quoteright lacute -20 quoteright '
+                          'lcommaaccent -20 quoteright lslash -20 quoteright '
+                          'quoteright -46 quoteright r -40 quoteright racute '
+                          '-40 quoteright rcaron -40 quoteright rcommaaccent '
+                          '-40 quoteright s -60 quoteright sacute -60 '
+                          'quoteright scaron -60 quoteright scedilla -60 '
+                          'quoteright scommaaccent -60 quoteright space -80 '
+                          'quoteright v -20 r c -20 r cacute -20 r ccaron -20 '
+                          'r ccedilla -20 r comma -60 r d -20 r dcroat -20 r '
+                          'g -15 r gbreve -15 r gcommaaccent -15 r hyphen -20 '
+                          'r o -20 r oacute -20 r ocircumflex -20 r odieresis '
+                          '-20 r ograve -20 r ohungarumlaut -20 r omacron -20 '
+                          'r oslash -20 r otilde -20 r period -60 r q -20 r s '
+                          '-15 r sacute -15 r scaron -15 r scedilla -15 r '
+                          'scommaaccent -15 r t 20 r tcommaaccent 20 r v 10 r '
+                          'y 10 r yacute 10 r ydieresis 10 racute c -20 '
+                          'racute cacute -20 racute ccaron -20 racute '
+                          'ccedilla -20 racute comma -60 racute d -20 racute '
+                          'dcroat -20 racute g -15 racute gbreve -15 racute '
+                          'gcommaaccent -15 racute hyphen -20 racute o -20 '
+                          'racute oacute -20 racute ocircumflex -20 racute '
+                          'odieresis -20 racute ograve -20 racute '
+                          'ohungarumlaut -20 racute omacron -20 racute oslash '
+                          '-20 racute otilde -20 racute period -60 racute q '
+                          '-20 racute s -15 racute sacute -15 racute scaron '
+                          '-15 racute scedilla -15 racute scommaaccent -15 '
+                          'racute t 20 racute tcommaaccent 20 racute v 10 '
+                          'racute y 10 racute yacute 10 racute ydieresis 10 '
+                          'rcaron c -20 rcaron cacute -20 rcaron ccaron -20 '
+                          'rcaron ccedilla -20 rcaron comma -60 rcaron d -20 '
+                          'rcaron dcroat -20 rcaron g -15 rcaron gbreve -15 '
+                          'rcaron gcommaaccent -15 rcaron hyphen -20 rcaron o '
+                          '-20 rcaron oacute -20 rcaron ocircumflex -20 '
+                          'rcaron odieresis -20 rcaron ograve -20 rcaron '
+                          'ohungarumlaut -20 rcaron omacron -20 rcaron oslash '
+                          '-20 rcaron otilde -20 rcaron period -60 rcaron q '
+                          '-20 rcaron s -15 rcaron sacute -15 rcaron scaron '
+                          '-15 rcaron scedilla -15 rcaron scommaaccent -15 '
+                          'rcaron t 20 rcaron tcommaaccent 20 rcaron v 10 '
+                          'rcaron y 10 rcaron yacute 10 rcaron ydieresis 10 '
+                          'rcommaaccent c -20 rcommaaccent cacute -20 '
+                          'rcommaaccent ccaron -20 rcommaaccent ccedilla -20 '
+                          'rcommaaccent comma -60 rcommaaccent d -20 '
+                          'rcommaaccent dcroat -20 rcommaaccent g -15 '
+                          'rcommaaccent gbreve -15 rcommaaccent gcommaaccent '
+                          '-15 rcommaaccent hyphen -20 rcommaaccent o -20 '
+                          'rcommaaccent oacute -20 rcommaaccent ocircumflex '
+                          '-20 rcommaaccent odieresis -20 rcommaaccent ograve '
+                          '-20 rcommaaccent ohungarumlaut -20 rcommaaccent '
+                          'omacron -20 rcommaaccent oslash -20 rcommaaccent '
+                          'otilde -20 rcommaaccent period -60 rcommaaccent q '
+                          '-20 rcommaaccent s -15 rcommaaccent sacute -15 '
+                          'rcommaaccent scaron -15 rcommaaccent scedilla -15 '
+                          'rcommaaccent scommaaccent -15 rcommaaccent t 20 '
+                          'rcommaaccent tcommaaccent 20 rcommaaccent v 10 '
+                          'rcommaaccent y 10 rcommaaccent yacute 10 '
+                          'rcommaaccent ydieresis 10 s w -15 sacute w -15 '
+                          'scaron w -15 scedilla w -15 scommaaccent w -15 '
+                          'semicolon space -40 space T -100 space Tcaron -100 '
+                          'space Tcommaaccent -100 space V -80 space W -80 '
+                          'space Y -120 space Yacute -120 space Ydieresis '
+                          '-120 space quotedblleft -80 space quoteleft -60 v '
+                          'a -20 v aacute -20 v abreve -20 v acircumflex -20 '
+                          'v adieresis -20 v agrave -20 v amacron -20 v '
+                          'aogonek -20 v aring -20 v atilde -20 v comma -80 v '
+                          'o -30 v oacute -30 v ocircumflex -30 v odieresis '
+                          '-30 v ograve -30 v ohungarumlaut -30 v omacron -30 '
+                          'v oslash -30 v otilde -30 v period -80 w comma -40 '
+                          'w o -20 w oacute -20 w ocircumflex -20 w odieresis '
+                          '-20 w ograve -20 w ohungarumlaut -20 w omacron -20 '
+                          'w oslash -20 w otilde -20 w period -40 x e -10 x '
+                          'eacute -10 x ecaron -10 x ecircumflex -10 x '
+                          'edieresis -10 x edotaccent -10 x egrave -10 x '
+                          'emacron -10 x eogonek -10 y a -30 y aacute -30 y '
+                          'abreve -30 y acircumflex -30 y adieresis -30 y '
+                          'agrave -30 y amacron -30 y aogonek -30 y aring -30 '
+                          'y atilde -30 y comma -80 y e -10 y eacute -10 y '
+                          'ecaron -10 y ecircumflex -10 y edieresis -10 y '
+                          'edotaccent -10 y egrave -10 y emacron -10 y '
+                          'eogonek -10 y o -25 y oacute -25 y ocircumflex -25 '
+                          'y odieresis -25 y ograve -25 y ohungarumlaut -25 y '
+                          'omacron -25 y oslash -25 y otilde -25 y period -80 '
+                          'yacute a -30 yacute aacute -30 yacute abreve -30 '
+                          'yacute acircumflex -30 yacute adieresis -30 yacute '
+                          'agrave -30 yacute amacron -30 yacute aogonek -30 '
+                          'yacute aring -30 yacute atilde -30 yacute comma '
+                          '-80 yacute e -10 yacute eacute -10 yacute ecaron '
+                          '-10 yacute ecircumflex -10 yacute edieresis -10 '
+                          'yacute edotaccent -10 yacute egrave -10 yacute '
+                          'emacron -10 yacute eogonek -10 yacute o -25 yacute '
+                          'oacute -25 yacute ocircumflex -25 yacute odieresis '
+                          '-25 yacute ograve -25 yacute ohungarumlaut -25 '
+                          'yacute omacron -25 yacute oslash -25 yacute otilde '
+                          '-25 yacute period -80 ydieresis a -30 ydieresis '
+                          'aacute -30 ydieresis abreve -30 ydieresis '
+                          'acircumflex -30 ydieresis adieresis -30 ydieresis '
+                          'agrave -30 ydieresis amacron -30 ydieresis aogonek '
+                          '-30 ydieresis aring -30 ydieresis atilde -30 '
+                          'ydieresis comma -80 ydieresis e -10 ydieresis '
+                          'eacute -10 ydieresis ecaron -10 ydieresis '
+                          'ecircumflex -10 ydieresis edieresis -10 ydieresis '
+                          'edotaccent -10 ydieresis egrave -10 ydieresis '
+                          'emacron -10 ydieresis eogonek -10 ydieresis o -25 '
+                          'ydieresis oacute -25 ydieresis ocircumflex -25 '
+                          'ydieresis odieresis -25 ydieresis ograve -25 '
+                          'ydieresis ohungarumlaut -25 ydieresis omacron -25 '
+                          'ydieresis oslash -25 ydieresis otilde -25 '
+                          'ydieresis period -80 z e 10 z eacute 10 z ecaron '
+                          '10 z ecircumflex 10 z edieresis 10 z edotaccent 10 '
+                          'z egrave 10 z emacron 10 z eogonek 10 zacute e 10 '
+                          'zacute eacute 10 zacute ecaron 10 zacute '
+                          'ecircumflex 10 zacute edieresis 10 zacute '
+                          'edotaccent 10 zacute egrave 10 zacute emacron 10 '
+                          'zacute eogonek 10 zcaron e 10 zcaron eacute 10 '
+                          'zcaron ecaron 10 zcaron ecircumflex 10 zcaron '
+                          'edieresis 10 zcaron edotaccent 10 zcaron egrave 10 '
+                          'zcaron emacron 10 zcaron eogonek 10 zdotaccent e '
+                          '10 zdotaccent eacute 10 zdotaccent ecaron 10 '
+                          'zdotaccent ecircumflex 10 zdotaccent edieresis 10 '
+                          'zdotaccent edotaccent 10 zdotaccent egrave 10 '
+                          'zdotaccent emacron 10 zdotaccent eogonek 10',
+ 'Helvetica-Oblique': 'A C -30 A Cacute -30 A Ccaron -30 A Ccedilla -30 A G '
+                      '-30 A Gbreve -30 A Gcommaaccent -30 A O -30 A Oacute '
+                      '-30 A Ocircumflex -30 A Odieresis -30 A Ograve -30 A '
+                      'Ohungarumlaut -30 A Omacron -30 A Oslash -30 A Otilde '
+                      '-30 A Q -30 A T -120 A Tcaron -120 A Tcommaaccent -120 '
+                      'A U -50 A Uacute -50 A Ucircumflex -50 A Udieresis -50 '
+                      'A Ugrave -50 A Uhungarumlaut -50 A Umacron -50 A '
+                      'Uogonek -50 A Uring -50 A V -70 A W -50 A Y -100 A '
+                      'Yacute -100 A Ydieresis -100 A u -30 A uacute -30 A '
+                      'ucircumflex -30 A udieresis -30 A ugrave -30 A '
+                      'uhungarumlaut -30 A umacron -30 A uogonek -30 A uring '
+                      '-30 A v -40 A w -40 A y -40 A yacute -40 A ydieresis '
+                      '-40 Aacute C -30 Aacute Cacute -30 Aacute Ccaron -30 '
+                      'Aacute Ccedilla -30 Aacute G -30 Aacute Gbreve -30 '
+                      'Aacute Gcommaaccent -30 Aacute O -30 Aacute Oacute -30 '
+                      'Aacute Ocircumflex -30 Aacute Odieresis -30 Aacute '
+                      'Ograve -30 Aacute Ohungarumlaut -30 Aacute Omacron -30 '
+                      'Aacute Oslash -30 Aacute Otilde -30 Aacute Q -30 '
+                      'Aacute T -120 Aacute Tcaron -120 Aacute Tcommaaccent '
+                      '-120 Aacute U -50 Aacute Uacute -50 Aacute Ucircumflex '
+                      '-50 Aacute Udieresis -50 Aacute Ugrave -50 Aacute '
+                      'Uhungarumlaut -50 Aacute Umacron -50 Aacute Uogonek '
+                      '-50 Aacute Uring -50 Aacute V -70 Aacute W -50 Aacute '
+                      'Y -100 Aacute Yacute -100 Aacute Ydieresis -100 Aacute '
+                      'u -30 Aacute uacute -30 Aacute ucircumflex -30 Aacute '
+                      'udieresis -30 Aacute ugrave -30 Aacute uhungarumlaut '
+                      '-30 Aacute umacron -30 Aacute uogonek -30 Aacute uring '
+                      '-30 Aacute v -40 Aacute w -40 Aacute y -40 Aacute '
+                      'yacute -40 Aacute ydieresis -40 Abreve C -30 Abreve '
+                      'Cacute -30 Abreve Ccaron -30 Abreve Ccedilla -30 '
+                      'Abreve G -30 Abreve Gbreve -30 Abreve Gcommaaccent -30 '
+                      'Abreve O -30 Abreve Oacute -30 Abreve Ocircumflex -30 '
+                      'Abreve Odieresis -30 Abreve Ograve -30 Abreve '
+                      'Ohungarumlaut -30 Abreve Omacron -30 Abreve Oslash -30 '
+                      'Abreve Otilde -30 Abreve Q -30 Abreve T -120 Abreve '
+                      'Tcaron -120 Abreve Tcommaaccent -120 Abreve U -50 '
+                      'Abreve Uacute -50 Abreve Ucircumflex -50 Abreve '
+                      'Udieresis -50 Abreve Ugrave -50 Abreve Uhungarumlaut '
+                      '-50 Abreve Umacron -50 Abreve Uogonek -50 Abreve Uring '
+                      '-50 Abreve V -70 Abreve W -50 Abreve Y -100 Abreve '
+                      'Yacute -100 Abreve Ydieresis -100 Abreve u -30 Abreve '
+                      'uacute -30 Abreve ucircumflex -30 Abreve udieresis -30 '
+                      'Abreve ugrave -30 Abreve uhungarumlaut -30 Abreve '
+                      'umacron -30 Abreve uogonek -30 Abreve uring -30 Abreve '
+                      'v -40 Abreve w -40 Abreve y -40 Abreve yacute -40 '
+                      'Abreve ydieresis -40 Acircumflex C -30 Acircumflex '
+                      'Cacute -30 Acircumflex Ccaron -30 Acircumflex Ccedilla '
+                      '-30 Acircumflex G -30 Acircumflex Gbreve -30 '
+                      'Acircumflex Gcommaaccent -30 Acircumflex O -30 '
+                      'Acircumflex Oacute -30 Acircumflex Ocircumflex -30 '
+                      'Acircumflex Odieresis -30 Acircumflex Ograve -30 '
+                      'Acircumflex Ohungarumlaut -30 Acircumflex Omacron -30 '
+                      'Acircumflex Oslash -30 Acircumflex Otilde -30 '
+                      'Acircumflex Q -30 Acircumflex T -120 Acircumflex '
+                      'Tcaron -120 Acircumflex Tcommaaccent -120 Acircumflex '
+                      'U -50 Acircumflex Uacute -50 Acircumflex Ucircumflex '
+                      '-50 Acircumflex Udieresis -50 Acircumflex Ugrave -50 '
+                      'Acircumflex Uhungarumlaut -50 Acircumflex Umacron -50 '
+                      'Acircumflex Uogonek -50 Acircumflex Uring -50 '
+                      'Acircumflex V -70 Acircumflex W -50 Acircumflex Y -100 '
+                      'Acircumflex Yacute -100 Acircumflex Ydieresis -100 '
+                      'Acircumflex u -30 Acircumflex uacute -30 Acircumflex '
+                      'ucircumflex -30 Acircumflex udieresis -30 Acircumflex '
+                      'ugrave -30 Acircumflex uhungarumlaut -30 Acircumflex '
+                      'umacron -30 Acircumflex uogonek -30 Acircumflex uring '
+                      '-30 Acircumflex v -40 Acircumflex w -40 Acircumflex y '
+                      '-40 Acircumflex yacute -40 Acircumflex ydieresis -40 '
+                      'Adieresis C -30 Adieresis Cacute -30 Adieresis Ccaron '
+                      '-30 Adieresis Ccedilla -30 Adieresis G -30 Adieresis '
+                      'Gbreve -30 Adieresis Gcommaaccent -30 Adieresis O -30 '
+                      'Adieresis Oacute -30 Adieresis Ocircumflex -30 '
+                      'Adieresis Odieresis -30 Adieresis Ograve -30 Adieresis '
+                      'Ohungarumlaut -30 Adieresis Omacron -30 Adieresis '
+                      'Oslash -30 Adieresis Otilde -30 Adieresis Q -30 '
+                      'Adieresis T -120 Adieresis Tcaron -120 Adieresis '
+                      'Tcommaaccent -120 Adieresis U -50 Adieresis Uacute -50 '
+                      'Adieresis Ucircumflex -50 Adieresis Udieresis -50 '
+                      'Adieresis Ugrave -50 Adieresis Uhungarumlaut -50 '
+                      'Adieresis Umacron -50 Adieresis Uogonek -50 Adieresis '
+                      'Uring -50 Adieresis V -70 Adieresis W -50 Adieresis Y '
+                      '-100 Adieresis Yacute -100 Adieresis Ydieresis -100 '
+                      'Adieresis u -30 Adieresis uacute -30 Adieresis '
+                      'ucircumflex -30 Adieresis udieresis -30 Adieresis '
+                      'ugrave -30 Adieresis uhungarumlaut -30 Adieresis '
+                      'umacron -30 Adieresis uogonek -30 Adieresis uring -30 '
+                      'Adieresis v -40 Adieresis w -40 Adieresis y -40 '
+                      'Adieresis yacute -40 Adieresis ydieresis -40 Agrave C '
+                      '-30 Agrave Cacute -30 Agrave Ccaron -30 Agrave '
+                      'Ccedilla -30 Agrave G -30 Agrave Gbreve -30 Agrave '
+                      'Gcommaaccent -30 Agrave O -30 Agrave Oacute -30 Agrave '
+                      'Ocircumflex -30 Agrave Odieresis -30 Agrave Ograve -30 '
+                      'Agrave Ohungarumlaut -30 Agrave Omacron -30 Agrave '
+                      'Oslash -30 Agrave Otilde -30 Agrave Q -30 Agrave T '
+                      '-120 Agrave Tcaron -120 Agrave Tcommaaccent -120 '
+                      'Agrave U -50 Agrave Uacute -50 Agrave Ucircumflex -50 '
+                      'Agrave Udieresis -50 Agrave Ugrave -50 Agrave '
+                      'Uhungarumlaut -50 Agrave Umacron -50 Agrave Uogonek '
+                      '-50 Agrave Uring -50 Agrave V -70 Agrave W -50 Agrave '
+                      'Y -100 Agrave Yacute -100 Agrave Ydieresis -100 Agrave '
+                      'u -30 Agrave uacute -30 Agrave ucircumflex -30 Agrave '
+                      'udieresis -30 Agrave ugrave -30 Agrave uhungarumlaut '
+                      '-30 Agrave umacron -30 Agrave uogonek -30 Agrave uring '
+                      '-30 Agrave v -40 Agrave w -40 Agrave y -40 Agrave '
+                      'yacute -40 Agrave ydieresis -40 Amacron C -30 Amacron '
+                      'Cacute -30 Amacron Ccaron -30 Amacron Ccedilla -30 '
+                      'Amacron G -30 Amacron Gbreve -30 Amacron Gcommaaccent '
+                      '-30 Amacron O -30 Amacron Oacute -30 Amacron '
+                      'Ocircumflex -30 Amacron Odieresis -30 Amacron Ograve '
+                      '-30 Amacron Ohungarumlaut -30 Amacron Omacron -30 '
+                      'Amacron Oslash -30 Amacron Otilde -30 Amacron Q -30 '
+                      'Amacron T -120 Amacron Tcaron -120 Amacron '
+                      'Tcommaaccent -120 Amacron U -50 Amacron Uacute -50 '
+                      'Amacron Ucircumflex -50 Amacron Udieresis -50 Amacron '
+                      'Ugrave -50 Amacron Uhungarumlaut -50 Amacron Umacron '
+                      '-50 Amacron Uogonek -50 Amacron Uring -50 Amacron V '
+                      '-70 Amacron W -50 Amacron Y -100 Amacron Yacute -100 '
+                      'Amacron Ydieresis -100 Amacron u -30 Amacron uacute '
+                      '-30 Amacron ucircumflex -30 Amacron udieresis -30 '
+                      'Amacron ugrave -30 Amacron uhungarumlaut -30 Amacron '
+                      'umacron -30 Amacron uogonek -30 Amacron uring -30 '
+                      'Amacron v -40 Amacron w -40 Amacron y -40 Amacron '
+                      'yacute -40 Amacron ydieresis -40 Aogonek C -30 Aogonek '
+                      'Cacute -30 Aogonek Ccaron -30 Aogonek Ccedilla -30 '
+                      'Aogonek G -30 Aogonek Gbreve -30 Aogonek Gcommaaccent '
+                      '-30 Aogonek O -30 Aogonek Oacute -30 Aogonek '
+                      'Ocircumflex -30 Aogonek Odieresis -30 Aogonek Ograve '
+                      '-30 Aogonek Ohungarumlaut -30 Aogonek Omacron -30 '
+                      'Aogonek Oslash -30 Aogonek Otilde -30 Aogonek Q -30 '
+                      'Aogonek T -120 Aogonek Tcaron -120 Aogonek '
+                      'Tcommaaccent -120 Aogonek U -50 Aogonek Uacute -50 '
+                      'Aogonek Ucircumflex -50 Aogonek Udieresis -50 Aogonek '
+                      'Ugrave -50 Aogonek Uhungarumlaut -50 Aogonek Umacron '
+                      '-50 Aogonek Uogonek -50 Aogonek Uring -50 Aogonek V '
+                      '-70 Aogonek W -50 Aogonek Y -100 Aogonek Yacute -100 '
+                      'Aogonek Ydieresis -100 Aogonek u -30 Aogonek uacute '
+                      '-30 Aogonek ucircumflex -30 Aogonek udieresis -30 '
+                      'Aogonek ugrave -30 Aogonek uhungarumlaut -30 Aogonek '
+                      'umacron -30 Aogonek uogonek -30 Aogonek uring -30 '
+                      'Aogonek v -40 Aogonek w -40 Aogonek y -40 Aogonek '
+                      'yacute -40 Aogonek ydieresis -40 Aring C -30 Aring '
+                      'Cacute -30 Aring Ccaron -30 Aring Ccedilla -30 Aring G '
+                      '-30 Aring Gbreve -30 Aring Gcommaaccent -30 Aring O '
+                      '-30 Aring Oacute -30 Aring Ocircumflex -30 Aring '
+                      'Odieresis -30 Aring Ograve -30 Aring Ohungarumlaut -30 '
+                      'Aring Omacron -30 Aring Oslash -30 Aring Otilde -30 '
+                      'Aring Q -30 Aring T -120 Aring Tcaron -120 Aring '
+                      'Tcommaaccent -120 Aring U -50 Aring Uacute -50 Aring '
+                      'Ucircumflex -50 Aring Udieresis -50 Aring Ugrave -50 '
+                      'Aring Uhungarumlaut -50 Aring Umacron -50 Aring '
+                      'Uogonek -50 Aring Uring -50 Aring V -70 Aring W -50 '
+                      'Aring Y -100 Aring Yacute -100 Aring Ydieresis -100 '
+                      'Aring u -30 Aring uacute -30 Aring ucircumflex -30 '
+                      'Aring udieresis -30 Aring ugrave -30 Aring '
+                      'uhungarumlaut -30 Aring umacron -30 Aring uogonek -30 '
+                      'Aring uring -30 Aring v -40 Aring w -40 Aring y -40 '
+                      'Aring yacute -40 Aring ydieresis -40 Atilde C -30 '
+                      'Atilde Cacute -30 Atilde Ccaron -30 Atilde Ccedilla '
+                      '-30 Atilde G -30 Atilde Gbreve -30 Atilde Gcommaaccent '
+                      '-30 Atilde O -30 Atilde Oacute -30 Atilde Ocircumflex '
+                      '-30 Atilde Odieresis -30 Atilde Ograve -30 Atilde '
+                      'Ohungarumlaut -30 Atilde Omacron -30 Atilde Oslash -30 '
+                      'Atilde Otilde -30 Atilde Q -30 Atilde T -120 Atilde '
+                      'Tcaron -120 Atilde Tcommaaccent -120 Atilde U -50 '
+                      'Atilde Uacute -50 Atilde Ucircumflex -50 Atilde '
+                      'Udieresis -50 Atilde Ugrave -50 Atilde Uhungarumlaut '
+                      '-50 Atilde Umacron -50 Atilde Uogonek -50 Atilde Uring '
+                      '-50 Atilde V -70 Atilde W -50 Atilde Y -100 Atilde '
+                      'Yacute -100 Atilde Ydieresis -100 Atilde u -30 Atilde '
+                      'uacute -30 Atilde ucircumflex -30 Atilde udieresis -30 '
+                      'Atilde ugrave -30 Atilde uhungarumlaut -30 Atilde '
+                      'umacron -30 Atilde uogonek -30 Atilde uring -30 Atilde '
+                      'v -40 Atilde w -40 Atilde y -40 Atilde yacute -40 '
+                      'Atilde ydieresis -40 B U -10 B Uacute -10 B '
+                      'Ucircumflex -10 B Udieresis -10 B Ugrave -10 B '
+                      'Uhungarumlaut -10 B Umacron -10 B Uogonek -10 B Uring '
+                      '-10 B comma -20 B period -20 C comma -30 C period -30 '
+                      'Cacute comma -30 Cacute period -30 Ccaron comma -30 '
+                      'Ccaron period -30 Ccedilla comma -30 Ccedilla period '
+                      '-30 D A -40 D Aacute -40 D Abreve -40 D Acircumflex '
+                      '-40 D Adieresis -40 D Agrave -40 D Amacron -40 D '
+                      'Aogonek -40 D Aring -40 D Atilde -40 D V -70 D W -40 D '
+                      'Y -90 D Yacute -90 D Ydieresis -90 D comma -70 D '
+                      'period -70 Dcaron A -40 Dcaron Aacute -40 Dcaron '
+                      'Abreve -40 Dcaron Acircumflex -40 Dcaron Adieresis -40 '
+                      'Dcaron Agrave -40 Dcaron Amacron -40 Dcaron Aogonek '
+                      '-40 Dcaron Aring -40 Dcaron Atilde -40 Dcaron V -70 '
+                      'Dcaron W -40 Dcaron Y -90 Dcaron Yacute -90 Dcaron '
+                      'Ydieresis -90 Dcaron comma -70 Dcaron period -70 '
+                      'Dcroat A -40 Dcroat Aacute -40 Dcroat Abreve -40 '
+                      'Dcroat Acircumflex -40 Dcroat Adieresis -40 Dcroat '
+                      'Agrave -40 Dcroat Amacron -40 Dcroat Aogonek -40 '
+                      'Dcroat Aring -40 Dcroat Atilde -40 Dcroat V -70 Dcroat '
+                      'W -40 Dcroat Y -90 Dcroat Yacute -90 Dcroat Ydieresis '
+                      '-90 Dcroat comma -70 Dcroat period -70 F A -80 F '
+                      'Aacute -80 F Abreve -80 F Acircumflex -80 F Adieresis '
+                      '-80 F Agrave -80 F Amacron -80 F Aogonek -80 F Aring '
+                      '-80 F Atilde -80 F a -50 F aacute -50 F abreve -50 F '
+                      'acircumflex -50 F adieresis -50 F agrave -50 F amacron '
+                      '-50 F aogonek -50 F aring -50 F atilde -50 F comma '
+                      '-150 F e -30 F eacute -30 F ecaron -30 F ecircumflex '
+                      '-30 F edieresis -30 F edotaccent -30 F egrave -30 F '
+                      'emacron -30 F eogonek -30 F o -30 F oacute -30 F '
+                      'ocircumflex -30 F odieresis -30 F ograve -30 F '
+                      'ohungarumlaut -30 F omacron -30 F oslash -30 F otilde '
+                      '-30 F period -150 F r -45 F racute -45 F rcaron -45 F '
+                      'rcommaaccent -45 J A -20 J Aacute -20 J Abreve -20 J '
+                      'Acircumflex -20 J Adieresis -20 J Agrave -20 J Amacron '
+                      '-20 J Aogonek -20 J Aring -20 J Atilde -20 J a -20 J '
+                      'aacute -20 J abreve -20 J acircumflex -20 J adieresis '
+                      '-20 J agrave -20 J amacron -20 J aogonek -20 J aring '
+                      '-20 J atilde -20 J comma -30 J period -30 J u -20 J '
+                      'uacute -20 J ucircumflex -20 J udieresis -20 J ugrave '
+                      '-20 J uhungarumlaut -20 J umacron -20 J uogonek -20 J '
+                      'uring -20 K O -50 K Oacute -50 K Ocircumflex -50 K '
+                      'Odieresis -50 K Ograve -50 K Ohungarumlaut -50 K '
+                      'Omacron -50 K Oslash -50 K Otilde -50 K e -40 K eacute '
+                      '-40 K ecaron -40 K ecircumflex -40 K edieresis -40 K '
+                      'edotaccent -40 K egrave -40 K emacron -40 K eogonek '
+                      '-40 K o -40 K oacute -40 K ocircumflex -40 K odieresis '
+                      '-40 K ograve -40 K ohungarumlaut -40 K omacron -40 K '
+                      'oslash -40 K otilde -40 K u -30 K uacute -30 K '
+                      'ucircumflex -30 K udieresis -30 K ugrave -30 K '
+                      'uhungarumlaut -30 K umacron -30 K uogonek -30 K uring '
+                      '-30 K y -50 K yacute -50 K ydieresis -50 Kcommaaccent '
+                      'O -50 Kcommaaccent Oacute -50 Kcommaaccent Ocircumflex '
+                      '-50 Kcommaaccent Odieresis -50 Kcommaaccent Ograve -50 '
+                      'Kcommaaccent Ohungarumlaut -50 Kcommaaccent Omacron '
+                      '-50 Kcommaaccent Oslash -50 Kcommaaccent Otilde -50 '
+                      'Kcommaaccent e -40 Kcommaaccent eacute -40 '
+                      'Kcommaaccent ecaron -40 Kcommaaccent ecircumflex -40 '
+                      'Kcommaaccent edieresis -40 Kcommaaccent edotaccent -40 '
+                      'Kcommaaccent egrave -40 Kcommaaccent emacron -40 '
+                      'Kcommaaccent eogonek -40 Kcommaaccent o -40 '
+                      'Kcommaaccent oacute -40 Kcommaaccent ocircumflex -40 '
+                      'Kcommaaccent odieresis -40 Kcommaaccent ograve -40 '
+                      'Kcommaaccent ohungarumlaut -40 Kcommaaccent omacron '
+                      '-40 Kcommaaccent oslash -40 Kcommaaccent otilde -40 '
+                      'Kcommaaccent u -30 Kcommaaccent uacute -30 '
+                      'Kcommaaccent ucircumflex -30 Kcommaaccent udieresis '
+                      '-30 Kcommaaccent ugrave -30 Kcommaaccent uhungarumlaut '
+                      '-30 Kcommaaccent umacron -30 Kcommaaccent uogonek -30 '
+                      'Kcommaaccent uring -30 Kcommaaccent y -50 Kcommaaccent '
+                      'yacute -50 Kcommaaccent ydieresis -50 L T -110 L '
+                      'Tcaron -110 L Tcommaaccent -110 L V -110 L W -70 L Y '
+                      '-140 L Yacute -140 L Ydieresis -140 L quotedblright '
+                      '-140 L quoteright -160 L y -30 L yacute -30 L '
+                      'ydieresis -30 Lacute T -110 Lacute Tcaron -110 Lacute '
+                      'Tcommaaccent -110 Lacute V -110 Lacute W -70 Lacute Y '
+                      '-140 Lacute Yacute -140 Lacute Ydieresis -140 Lacute '
+                      'quotedblright -140 Lacute quoteright -160 Lacute y -30 '
+                      'Lacute yacute -30 Lacute ydieresis -30 Lcaron T -110 '
+                      'Lcaron Tcaron -110 Lcaron Tcommaaccent -110 Lcaron V '
+                      '-110 Lcaron W -70 Lcaron Y -140 Lcaron Yacute -140 '
+                      'Lcaron Ydieresis -140 Lcaron quotedblright -140 Lcaron '
+                      'quoteright -160 Lcaron y -30 Lcaron yacute -30 Lcaron '
+                      'ydieresis -30 Lcommaaccent T -110 Lcommaaccent Tcaron '
+                      '-110 Lcommaaccent Tcommaaccent -110 Lcommaaccent V '
+                      '-110 Lcommaaccent W -70 Lcommaaccent Y -140 '
+                      'Lcommaaccent Yacute -140 Lcommaaccent Ydieresis -140 '
+                      'Lcommaaccent quotedblright -140 Lcommaaccent '
+                      'quoteright -160 Lcommaaccent y -30 Lcommaaccent yacute '
+                      '-30 Lcommaaccent ydieresis -30 Lslash T -110 Lslash '
+                      'Tcaron -110 Lslash Tcommaaccent -110 Lslash V -110 '
+                      'Lslash W -70 Lslash Y -140 Lslash Yacute -140 Lslash '
+                      'Ydieresis -140 Lslash quotedblright -140 Lslash '
+                      'quoteright -160 Lslash y -30 Lslash yacute -30 Lslash '
+                      'ydieresis -30 O A -20 O Aacute -20 O Abreve -20 O '
+                      'Acircumflex -20 O Adieresis -20 O Agrave -20 O Amacron '
+                      '-20 O Aogonek -20 O Aring -20 O Atilde -20 O T -40 O '
+                      'Tcaron -40 O Tcommaaccent -40 O V -50 O W -30 O X -60 '
+                      'O Y -70 O Yacute -70 O Ydieresis -70 O comma -40 O '
+                      'period -40 Oacute A -20 Oacute Aacute -20 Oacute '
+                      'Abreve -20 Oacute Acircumflex -20 Oacute Adieresis -20 '
+                      'Oacute Agrave -20 Oacute Amacron -20 Oacute Aogonek '
+                      '-20 Oacute Aring -20 Oacute Atilde -20 Oacute T -40 '
+                      'Oacute Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 '
+                      'Oacute W -30 Oacute X -60 Oacute Y -70 Oacute Yacute '
+                      '-70 Oacute Ydieresis -70 Oacute comma -40 Oacute '
+                      'period -40 Ocircumflex A -20 Ocircumflex Aacute -20 '
+                      'Ocircumflex Abreve -20 Ocircumflex Acircumflex -20 '
+                      'Ocircumflex Adieresis -20 Ocircumflex Agrave -20 '
+                      'Ocircumflex Amacron -20 Ocircumflex Aogonek -20 '
+                      'Ocircumflex Aring -20 Ocircumflex Atilde -20 '
+                      'Ocircumflex T -40 Ocircumflex Tcaron -40 Ocircumflex '
+                      'Tcommaaccent -40 Ocircumflex V -50 Ocircumflex W -30 '
+                      'Ocircumflex X -60 Ocircumflex Y -70 Ocircumflex Yacute '
+                      '-70 Ocircumflex Ydieresis -70 Ocircumflex comma -40 '
+                      'Ocircumflex period -40 Odieresis A -20 Odieresis '
+                      'Aacute -20 Odieresis Abreve -20 Odieresis Acircumflex '
+                      '-20 Odieresis Adieresis -20 Odieresis Agrave -20 '
+                      'Odieresis Amacron -20 Odieresis Aogonek -20 Odieresis '
+                      'Aring -20 Odieresis Atilde -20 Odieresis T -40 '
+                      'Odieresis Tcaron -40 Odieresis Tcommaaccent -40 '
+                      'Odieresis V -50 Odieresis W -30 Odieresis X -60 '
+                      'Odieresis Y -70 Odieresis Yacute -70 Odieresis '
+                      'Ydieresis -70 Odieresis comma -40 Odieresis period -40 '
+                      'Ograve A -20 Ograve Aacute -20 Ograve Abreve -20 '
+                      'Ograve Acircumflex -20 Ograve Adieresis -20 Ograve '
+                      'Agrave -20 Ograve Amacron -20 Ograve Aogonek -20 '
+                      'Ograve Aring -20 Ograve Atilde -20 Ograve T -40 Ograve '
+                      'Tcaron -40 Ograve Tcommaaccent -40 Ograve V -50 Ograve '
+                      'W -30 Ograve X -60 Ograve Y -70 Ograve Yacute -70 '
+                      'Ograve Ydieresis -70 Ograve comma -40 Ograve period '
+                      '-40 Ohungarumlaut A -20 Ohungarumlaut Aacute -20 '
+                      'Ohungarumlaut Abreve -20 Ohungarumlaut Acircumflex -20 '
+                      'Ohungarumlaut Adieresis -20 Ohungarumlaut Agrave -20 '
+                      'Ohungarumlaut Amacron -20 Ohungarumlaut Aogonek -20 '
+                      'Ohungarumlaut Aring -20 Ohungarumlaut Atilde -20 '
+                      'Ohungarumlaut T -40 Ohungarumlaut Tcaron -40 '
+                      'Ohungarumlaut Tcommaaccent -40 Ohungarumlaut V -50 '
+                      'Ohungarumlaut W -30 Ohungarumlaut X -60 Ohungarumlaut '
+                      'Y -70 Ohungarumlaut Yacute -70 Ohungarumlaut Ydieresis '
+                      '-70 Ohungarumlaut comma -40 Ohungarumlaut period -40 '
+                      'Omacron A -20 Omacron Aacute -20 Omacron Abreve -20 '
+                      'Omacron Acircumflex -20 Omacron Adieresis -20 Omacron '
+                      'Agrave -20 Omacron Amacron -20 Omacron Aogonek -20 '
+                      'Omacron Aring -20 Omacron Atilde -20 Omacron T -40 '
+                      'Omacron Tcaron -40 Omacron Tcommaaccent -40 Omacron V '
+                      '-50 Omacron W -30 Omacron X -60 Omacron Y -70 Omacron '
+                      'Yacute -70 Omacron Ydieresis -70 Omacron comma -40 '
+                      'Omacron period -40 Oslash A -20 Oslash Aacute -20 '
+                      'Oslash Abreve -20 Oslash Acircumflex -20 Oslash '
+                      'Adieresis -20 Oslash Agrave -20 Oslash Amacron -20 '
+                      'Oslash Aogonek -20 Oslash Aring -20 Oslash Atilde -20 '
+                      'Oslash T -40 Oslash Tcaron -40 Oslash Tcommaaccent -40 '
+                      'Oslash V -50 Oslash W -30 Oslash X -60 Oslash Y -70 '
+                      'Oslash Yacute -70 Oslash Ydieresis -70 Oslash comma '
+                      '-40 Oslash period -40 Otilde A -20 Otilde Aacute -20 '
+                      'Otilde Abreve -20 Otilde Acircumflex -20 Otilde '
+                      'Adieresis -20 Otilde Agrave -20 Otilde Amacron -20 '
+                      'Otilde Aogonek -20 Otilde Aring -20 Otilde Atilde -20 '
+                      'Otilde T -40 Otilde Tcaron -40 Otilde Tcommaaccent -40 '
+                      'Otilde V -50 Otilde W -30 Otilde X -60 Otilde Y -70 '
+                      'Otilde Yacute -70 Otilde Ydieresis -70 Otilde comma '
+                      '-40 Otilde period -40 P A -120 P Aacute -120 P Abreve '
+                      '-120 P Acircumflex -120 P Adieresis -120 P Agrave -120 '
+                      'P Amacron -120 P Aogonek -120 P Aring -120 P Atilde '
+                      '-120 P a -40 P aacute -40 P abreve -40 P acircumflex '
+                      '-40 P adieresis -40 P agrave -40 P amacron -40 P '
+                      'aogonek -40 P aring -40 P atilde -40 P comma -180 P e '
+                      '-50 P eacute -50 P ecaron -50 P ecircumflex -50 P '
+                      'edieresis -50 P edotaccent -50 P egrave -50 P emacron '
+                      '-50 P eogonek -50 P o -50 P oacute -50 P ocircumflex '
+                      '-50 P odieresis -50 P ograve -50 P ohungarumlaut -50 P '
+                      'omacron -50 P oslash -50 P otilde -50 P period -180 Q '
+                      'U -10 Q Uacute -10 Q Ucircumflex -10 Q Udieresis -10 Q '
+                      'Ugrave -10 Q Uhungarumlaut -10 Q Umacron -10 Q Uogonek '
+                      '-10 Q Uring -10 R O -20 R Oacute -20 R Ocircumflex -20 '
+                      'R Odieresis -20 R Ograve -20 R Ohungarumlaut -20 R '
+                      'Omacron -20 R Oslash -20 R Otilde -20 R T -30 R Tcaron '
+                      '-30 R Tcommaaccent -30 R U -40 R Uacute -40 R '
+                      'Ucircumflex -40 R Udieresis -40 R Ugrave -40 R '
+                      'Uhungarumlaut -40 R Umacron -40 R Uogonek -40 R Uring '
+                      '-40 R V -50 R W -30 R Y -50 R Yacute -50 R Ydieresis '
+                      '-50 Racute O -20 Racute Oacute -20 Racute Ocircumflex '
+                      '-20 Racute Odieresis -20 Racute Ograve -20 Racute '
+                      'Ohungarumlaut -20 Racute Omacron -20 Racute Oslash -20 '
+                      'Racute Otilde -20 Racute T -30 Racute Tcaron -30 '
+                      'Racute Tcommaaccent -30 Racute U -40 Racute Uacute -40 '
+                      'Racute Ucircumflex -40 Racute Udieresis -40 Racute '
+                      'Ugrave -40 Racute Uhungarumlaut -40 Racute Umacron -40 '
+                      'Racute Uogonek -40 Racute Uring -40 Racute V -50 '
+                      'Racute W -30 Racute Y -50 Racute Yacute -50 Racute '
+                      'Ydieresis -50 Rcaron O -20 Rcaron Oacute -20 Rcaron '
+                      'Ocircumflex -20 Rcaron Odieresis -20 Rcaron Ograve -20 '
+                      'Rcaron Ohungarumlaut -20 Rcaron Omacron -20 Rcaron '
+                      'Oslash -20 Rcaron Otilde -20 Rcaron T -30 Rcaron '
+                      'Tcaron -30 Rcaron Tcommaaccent -30 Rcaron U -40 Rcaron '
+                      'Uacute -40 Rcaron Ucircumflex -40 Rcaron Udieresis -40 '
+                      'Rcaron Ugrave -40 Rcaron Uhungarumlaut -40 Rcaron '
+                      'Umacron -40 Rcaron Uogonek -40 Rcaron Uring -40 Rcaron '
+                      'V -50 Rcaron W -30 Rcaron Y -50 Rcaron Yacute -50 '
+                      'Rcaron Ydieresis -50 Rcommaaccent O -20 Rcommaaccent '
+                      'Oacute -20 Rcommaaccent Ocircumflex -20 Rcommaaccent '
+                      'Odieresis -20 Rcommaaccent Ograve -20 Rcommaaccent '
+                      'Ohungarumlaut -20 Rcommaaccent Omacron -20 '
+                      'Rcommaaccent Oslash -20 Rcommaaccent Otilde -20 '
+                      'Rcommaaccent T -30 Rcommaaccent Tcaron -30 '
+                      'Rcommaaccent Tcommaaccent -30 Rcommaaccent U -40 '
+                      'Rcommaaccent Uacute -40 Rcommaaccent Ucircumflex -40 '
+                      'Rcommaaccent Udieresis -40 Rcommaaccent Ugrave -40 '
+                      'Rcommaaccent Uhungarumlaut -40 Rcommaaccent Umacron '
+                      '-40 Rcommaaccent Uogonek -40 Rcommaaccent Uring -40 '
+                      'Rcommaaccent V -50 Rcommaaccent W -30 Rcommaaccent Y '
+                      '-50 Rcommaaccent Yacute -50 Rcommaaccent Ydieresis -50 '
+                      'S comma -20 S period -20 Sacute comma -20 Sacute '
+                      'period -20 Scaron comma -20 Scaron period -20 Scedilla '
+                      'comma -20 Scedilla period -20 Scommaaccent comma -20 '
+                      'Scommaaccent period -20 T A -120 T Aacute -120 T '
+                      'Abreve -120 T Acircumflex -120 T Adieresis -120 T '
+                      'Agrave -120 T Amacron -120 T Aogonek -120 T Aring -120 '
+                      'T Atilde -120 T O -40 T Oacute -40 T Ocircumflex -40 T '
+                      'Odieresis -40 T Ograve -40 T Ohungarumlaut -40 T '
+                      'Omacron -40 T Oslash -40 T Otilde -40 T a -120 T '
+                      'aacute -120 T abreve -60 T acircumflex -120 T '
+                      'adieresis -120 T agrave -120 T amacron -60 T aogonek '
+                      '-120 T aring -120 T atilde -60 T colon -20 T comma '
+                      '-120 T e -120 T eacute -120 T ecaron -120 T '
+                      'ecircumflex -120 T edieresis -120 T edotaccent -120 T '
+                      'egrave -60 T emacron -60 T eogonek -120 T hyphen -140 '
+                      'T o -120 T oacute -120 T ocircumflex -120 T odieresis '
+                      '-120 T ograve -120 T ohungarumlaut -120 T omacron -60 '
+                      'T oslash -120 T otilde -60 T period -120 T r -120 T '
+                      'racute -120 T rcaron -120 T rcommaaccent -120 T '
+                      'semicolon -20 T u -120 T uacute -120 T ucircumflex '
+                      '-120 T udieresis -120 T ugrave -120 T uhungarumlaut '
+                      '-120 T umacron -60 T uogonek -120 T uring -120 T w '
+                      '-120 T y -120 T yacute -120 T ydieresis -60 Tcaron A '
+                      '-120 Tcaron Aacute -120 Tcaron Abreve -120 Tcaron '
+                      'Acircumflex -120 Tcaron Adieresis -120 Tcaron Agrave '
+                      '-120 Tcaron Amacron -120 Tcaron Aogonek -120 Tcaron '
+                      'Aring -120 Tcaron Atilde -120 Tcaron O -40 Tcaron '
+                      'Oacute -40 Tcaron Ocircumflex -40 Tcaron Odieresis -40 '
+                      'Tcaron Ograve -40 Tcaron Ohungarumlaut -40 Tcaron '
+                      'Omacron -40 Tcaron Oslash -40 Tcaron Otilde -40 Tcaron '
+                      'a -120 Tcaron aacute -120 Tcaron abreve -60 Tcaron '
+                      'acircumflex -120 Tcaron adieresis -120 Tcaron agrave '
+                      '-120 Tcaron amacron -60 Tcaron aogonek -120 Tcaron '
+                      'aring -120 Tcaron atilde -60 Tcaron colon -20 Tcaron '
+                      'comma -120 Tcaron e -120 Tcaron eacute -120 Tcaron '
+                      'ecaron -120 Tcaron ecircumflex -120 Tcaron edieresis '
+                      '-120 Tcaron edotaccent -120 Tcaron egrave -60 Tcaron '
+                      'emacron -60 Tcaron eogonek -120 Tcaron hyphen -140 '
+                      'Tcaron o -120 Tcaron oacute -120 Tcaron ocircumflex '
+                      '-120 Tcaron odieresis -120 Tcaron ograve -120 Tcaron '
+                      'ohungarumlaut -120 Tcaron omacron -60 Tcaron oslash '
+                      '-120 Tcaron otilde -60 Tcaron period -120 Tcaron r '
+                      '-120 Tcaron racute -120 Tcaron rcaron -120 Tcaron '
+                      'rcommaaccent -120 Tcaron semicolon -20 Tcaron u -120 '
+                      'Tcaron uacute -120 Tcaron ucircumflex -120 Tcaron '
+                      'udieresis -120 Tcaron ugrave -120 Tcaron uhungarumlaut '
+                      '-120 Tcaron umacron -60 Tcaron uogonek -120 Tcaron '
+                      'uring -120 Tcaron w -120 Tcaron y -120 Tcaron yacute '
+                      '-120 Tcaron ydieresis -60 Tcommaaccent A -120 '
+                      'Tcommaaccent Aacute -120 Tcommaaccent Abreve -120 '
+                      'Tcommaaccent Acircumflex -120 Tcommaaccent Adieresis '
+                      '-120 Tcommaaccent Agrave -120 Tcommaaccent Amacron '
+                      '-120 Tcommaaccent Aogonek -120 Tcommaaccent Aring -120 '
+                      'Tcommaaccent Atilde -120 Tcommaaccent O -40 '
+                      'Tcommaaccent Oacute -40 Tcommaaccent Ocircumflex -40 '
+                      'Tcommaaccent Odieresis -40 Tcommaaccent Ograve -40 '
+                      'Tcommaaccent Ohungarumlaut -40 Tcommaaccent Omacron '
+                      '-40 Tcommaaccent Oslash -40 Tcommaaccent Otilde -40 '
+                      'Tcommaaccent a -120 Tcommaaccent aacute -120 '
+                      'Tcommaaccent abreve -60 Tcommaaccent acircumflex -120 '
+                      'Tcommaaccent adieresis -120 Tcommaaccent agrave -120 '
+                      'Tcommaaccent amacron -60 Tcommaaccent aogonek -120 '
+                      'Tcommaaccent aring -120 Tcommaaccent atilde -60 '
+                      'Tcommaaccent colon -20 Tcommaaccent comma -120 '
+                      'Tcommaaccent e -120 Tcommaaccent eacute -120 '
+                      'Tcommaaccent ecaron -120 Tcommaaccent ecircumflex -120 '
+                      'Tcommaaccent edieresis -120 Tcommaaccent edotaccent '
+                      '-120 Tcommaaccent egrave -60 Tcommaaccent emacron -60 '
+                      'Tcommaaccent eogonek -120 Tcommaaccent hyphen -140 '
+                      'Tcommaaccent o -120 Tcommaaccent oacute -120 '
+                      'Tcommaaccent ocircumflex -120 Tcommaaccent odieresis '
+                      '-120 Tcommaaccent ograve -120 Tcommaaccent '
+                      'ohungarumlaut -120 Tcommaaccent omacron -60 '
+                      'Tcommaaccent oslash -120 Tcommaaccent otilde -60 '
+                      'Tcommaaccent period -120 Tcommaaccent r -120 '
+                      'Tcommaaccent racute -120 Tcommaaccent rcaron -120 '
+                      'Tcommaaccent rcommaaccent -120 Tcommaaccent semicolon '
+                      '-20 Tcommaaccent u -120 Tcommaaccent uacute -120 '
+                      'Tcommaaccent ucircumflex -120 Tcommaaccent udieresis '
+                      '-120 Tcommaaccent ugrave -120 Tcommaaccent '
+                      'uhungarumlaut -120 Tcommaaccent umacron -60 '
+                      'Tcommaaccent uogonek -120 Tcommaaccent uring -120 '
+                      'Tcommaaccent w -120 Tcommaaccent y -120 Tcommaaccent '
+                      'yacute -120 Tcommaaccent ydieresis -60 U A -40 U '
+                      'Aacute -40 U Abreve -40 U Acircumflex -40 U Adieresis '
+                      '-40 U Agrave -40 U Amacron -40 U Aogonek -40 U Aring '
+                      '-40 U Atilde -40 U comma -40 U period -40 Uacute A -40 '
+                      'Uacute Aacute -40 Uacute Abreve -40 Uacute Acircumflex '
+                      '-40 Uacute Adieresis -40 Uacute Agrave -40 Uacute '
+                      'Amacron -40 Uacute Aogonek -40 Uacute Aring -40 Uacute '
+                      'Atilde -40 Uacute comma -40 Uacute period -40 '
+                      'Ucircumflex A -40 Ucircumflex Aacute -40 Ucircumflex '
+                      'Abreve -40 Ucircumflex Acircumflex -40 Ucircumflex '
+                      'Adieresis -40 Ucircumflex Agrave -40 Ucircumflex '
+                      'Amacron -40 Ucircumflex Aogonek -40 Ucircumflex Aring '
+                      '-40 Ucircumflex Atilde -40 Ucircumflex comma -40 '
+                      'Ucircumflex period -40 Udieresis A -40 Udieresis '
+                      'Aacute -40 Udieresis Abreve -40 Udieresis Acircumflex '
+                      '-40 Udieresis Adieresis -40 Udieresis Agrave -40 '
+                      'Udieresis Amacron -40 Udieresis Aogonek -40 Udieresis '
+                      'Aring -40 Udieresis Atilde -40 Udieresis comma -40 '
+                      'Udieresis period -40 Ugrave A -40 Ugrave Aacute -40 '
+                      'Ugrave Abreve -40 Ugrave Acircumflex -40 Ugrave '
+                      'Adieresis -40 Ugrave Agrave -40 Ugrave Amacron -40 '
+                      'Ugrave Aogonek -40 Ugrave Aring -40 Ugrave Atilde -40 '
+                      'Ugrave comma -40 Ugrave period -40 Uhungarumlaut A -40 '
+                      'Uhungarumlaut Aacute -40 Uhungarumlaut Abreve -40 '
+                      'Uhungarumlaut Acircumflex -40 Uhungarumlaut Adieresis '
+                      '-40 Uhungarumlaut Agrave -40 Uhungarumlaut Amacron -40 '
+                      'Uhungarumlaut Aogonek -40 Uhungarumlaut Aring -40 '
+                      'Uhungarumlaut Atilde -40 Uhungarumlaut comma -40 '
+                      'Uhungarumlaut period -40 Umacron A -40 Umacron Aacute '
+                      '-40 Umacron Abreve -40 Umacron Acircumflex -40 Umacron '
+                      'Adieresis -40 Umacron Agrave -40 Umacron Amacron -40 '
+                      'Umacron Aogonek -40 Umacron Aring -40 Umacron Atilde '
+                      '-40 Umacron comma -40 Umacron period -40 Uogonek A -40 '
+                      'Uogonek Aacute -40 Uogonek Abreve -40 Uogonek '
+                      'Acircumflex -40 Uogonek Adieresis -40 Uogonek Agrave '
+                      '-40 Uogonek Amacron -40 Uogonek Aogonek -40 Uogonek '
+                      'Aring -40 Uogonek Atilde -40 Uogonek comma -40 Uogonek '
+                      'period -40 Uring A -40 Uring Aacute -40 Uring Abreve '
+                      '-40 Uring Acircumflex -40 Uring Adieresis -40 Uring '
+                      'Agrave -40 Uring Amacron -40 Uring Aogonek -40 Uring '
+                      'Aring -40 Uring Atilde -40 Uring comma -40 Uring '
+                      'period -40 V A -80 V Aacute -80 V Abreve -80 V '
+                      'Acircumflex -80 V Adieresis -80 V Agrave -80 V Amacron '
+                      '-80 V Aogonek -80 V Aring -80 V Atilde -80 V G -40 V '
+                      'Gbreve -40 V Gcommaaccent -40 V O -40 V Oacute -40 V '
+                      'Ocircumflex -40 V Odieresis -40 V Ograve -40 V '
+                      'Ohungarumlaut -40 V Omacron -40 V Oslash -40 V Otilde '
+                      '-40 V a -70 V aacute -70 V abreve -70 V acircumflex '
+                      '-70 V adieresis -70 V agrave -70 V amacron -70 V '
+                      'aogonek -70 V aring -70 V atilde -70 V colon -40 V '
+                      'comma -125 V e -80 V eacute -80 V ecaron -80 V '
+                      'ecircumflex -80 V edieresis -80 V edotaccent -80 V '
+                      'egrave -80 V emacron -80 V eogonek -80 V hyphen -80 V '
+                      'o -80 V oacute -80 V ocircumflex -80 V odieresis -80 V '
+                      'ograve -80 V ohungarumlaut -80 V omacron -80 V oslash '
+                      '-80 V otilde -80 V period -125 V semicolon -40 V u -70 '
+                      'V uacute -70 V ucircumflex -70 V udieresis -70 V '
+                      'ugrave -70 V uhungarumlaut -70 V umacron -70 V uogonek '
+                      '-70 V uring -70 W A -50 W Aacute -50 W Abreve -50 W '
+                      'Acircumflex -50 W Adieresis -50 W Agrave -50 W Amacron '
+                      '-50 W Aogonek -50 W Aring -50 W Atilde -50 W O -20 W '
+                      'Oacute -20 W Ocircumflex -20 W Odieresis -20 W Ograve '
+                      '-20 W Ohungarumlaut -20 W Omacron -20 W Oslash -20 W '
+                      'Otilde -20 W a -40 W aacute -40 W abreve -40 W '
+                      'acircumflex -40 W adieresis -40 W agrave -40 W amacron '
+                      '-40 W aogonek -40 W aring -40 W atilde -40 W comma -80 '
+                      'W e -30 W eacute -30 W ecaron -30 W ecircumflex -30 W '
+                      'edieresis -30 W edotaccent -30 W egrave -30 W emacron '
+                      '-30 W eogonek -30 W hyphen -40 W o -30 W oacute -30 W '
+                      'ocircumflex -30 W odieresis -30 W ograve -30 W '
+                      'ohungarumlaut -30 W omacron -30 W oslash -30 W otilde '
+                      '-30 W period -80 W u -30 W uacute -30 W ucircumflex '
+                      '-30 W udieresis -30 W ugrave -30 W uhungarumlaut -30 W '
+                      'umacron -30 W uogonek -30 W uring -30 W y -20 W yacute '
+                      '-20 W ydieresis -20 Y A -110 Y Aacute -110 Y Abreve '
+                      '-110 Y Acircumflex -110 Y Adieresis -110 Y Agrave -110 '
+                      'Y Amacron -110 Y Aogonek -110 Y Aring -110 Y Atilde '
+                      '-110 Y O -85 Y Oacute -85 Y Ocircumflex -85 Y '
+                      'Odieresis -85 Y Ograve -85 Y Ohungarumlaut -85 Y '
+                      'Omacron -85 Y Oslash -85 Y Otilde -85 Y a -140 Y '
+                      'aacute -140 Y abreve -70 Y acircumflex -140 Y '
+                      'adieresis -140 Y agrave -140 Y amacron -70 Y aogonek '
+                      '-140 Y aring -140 Y atilde -140 Y colon -60 Y comma '
+                      '-140 Y e -140 Y eacute -140 Y ecaron -140 Y '
+                      'ecircumflex -140 Y edieresis -140 Y edotaccent -140 Y '
+                      'egrave -140 Y emacron -70 Y eogonek -140 Y hyphen -140 '
+                      'Y i -20 Y iacute -20 Y iogonek -20 Y o -140 Y oacute '
+                      '-140 Y ocircumflex -140 Y odieresis -140 Y ograve -140 '
+                      'Y ohungarumlaut -140 Y omacron -140 Y oslash -140 Y '
+                      'otilde -140 Y period -140 Y semicolon -60 Y u -110 Y '
+                      'uacute -110 Y ucircumflex -110 Y udieresis -110 Y '
+                      'ugrave -110 Y uhungarumlaut -110 Y umacron -110 Y '
+                      'uogonek -110 Y uring -110 Yacute A -110 Yacute Aacute '
+                      '-110 Yacute Abreve -110 Yacute Acircumflex -110 Yacute '
+                      'Adieresis -110 Yacute Agrave -110 Yacute Amacron -110 '
+                      'Yacute Aogonek -110 Yacute Aring -110 Yacute Atilde '
+                      '-110 Yacute O -85 Yacute Oacute -85 Yacute Ocircumflex '
+                      '-85 Yacute Odieresis -85 Yacute Ograve -85 Yacute '
+                      'Ohungarumlaut -85 Yacute Omacron -85 Yacute Oslash -85 '
+                      'Yacute Otilde -85 Yacute a -140 Yacute aacute -140 '
+                      'Yacute abreve -70 Yacute acircumflex -140 Yacute '
+                      'adieresis -140 Yacute agrave -140 Yacute amacron -70 '
+                      'Yacute aogonek -140 Yacute aring -140 Yacute atilde '
+                      '-70 Yacute colon -60 Yacute comma -140 Yacute e -140 '
+                      'Yacute eacute -140 Yacute ecaron -140 Yacute '
+                      'ecircumflex -140 Yacute edieresis -140 Yacute '
+                      'edotaccent -140 Yacute egrave -140 Yacute emacron -70 '
+                      'Yacute eogonek -140 Yacute hyphen -140 Yacute i -20 '
+                      'Yacute iacute -20 Yacute iogonek -20 Yacute o -140 '
+                      'Yacute oacute -140 Yacute ocircumflex -140 Yacute '
+                      'odieresis -140 Yacute ograve -140 Yacute ohungarumlaut '
+                      '-140 Yacute omacron -70 Yacute oslash -140 Yacute '
+                      'otilde -140 Yacute period -140 Yacute semicolon -60 '
+                      'Yacute u -110 Yacute uacute -110 Yacute ucircumflex '
+                      '-110 Yacute udieresis -110 Yacute ugrave -110 Yacute '
+                      'uhungarumlaut -110 Yacute umacron -110 Yacute uogonek '
+                      '-110 Yacute uring -110 Ydieresis A -110 Ydieresis '
+                      'Aacute -110 Ydieresis Abreve -110 Ydieresis '
+                      'Acircumflex -110 Ydieresis Adieresis -110 Ydieresis '
+                      'Agrave -110 Ydieresis Amacron -110 Ydieresis Aogonek '
+                      '-110 Ydieresis Aring -110 Ydieresis Atilde -110 '
+                      'Ydieresis O -85 Ydieresis Oacute -85 Ydieresis '
+                      'Ocircumflex -85 Ydieresis Odieresis -85 Ydieresis '
+                      'Ograve -85 Ydieresis Ohungarumlaut -85 Ydieresis '
+                      'Omacron -85 Ydieresis Oslash -85 Ydieresis Otilde -85 '
+                      'Ydieresis a -140 Ydieresis aacute -140 Ydieresis '
+                      'abreve -70 Ydieresis acircumflex -140 Ydieresis '
+                      'adieresis -140 Ydieresis agrave -140 Ydieresis amacron '
+                      '-70 Ydieresis aogonek -140 Ydieresis aring -140 '
+                      'Ydieresis atilde -70 Ydieresis colon -60 Ydieresis '
+                      'comma -140 Ydieresis e -140 Ydieresis eacute -140 '
+                      'Ydieresis ecaron -140 Ydieresis ecircumflex -140 '
+                      'Ydieresis edieresis -140 Ydieresis edotaccent -140 '
+                      'Ydieresis egrave -140 Ydieresis emacron -70 Ydieresis '
+                      'eogonek -140 Ydieresis hyphen -140 Ydieresis i -20 '
+                      'Ydieresis iacute -20 Ydieresis iogonek -20 Ydieresis o '
+                      '-140 Ydieresis oacute -140 Ydieresis ocircumflex -140 '
+                      'Ydieresis odieresis -140 Ydieresis ograve -140 '
+                      'Ydieresis ohungarumlaut -140 Ydieresis omacron -140 '
+                      'Ydieresis oslash -140 Ydieresis otilde -140 Ydieresis '
+                      'period -140 Ydieresis semicolon -60 Ydieresis u -110 '
+                      'Ydieresis uacute -110 Ydieresis ucircumflex -110 '
+                      'Ydieresis udieresis -110 Ydieresis ugrave -110 '
+                      'Ydieresis uhungarumlaut -110 Ydieresis umacron -110 '
+                      'Ydieresis uogonek -110 Ydieresis uring -110 a v -20 a '
+                      'w -20 a y -30 a yacute -30 a ydieresis -30 aacute v '
+                      '-20 aacute w -20 aacute y -30 aacute yacute -30 aacute '
+                      'ydieresis -30 abreve v -20 abreve w -20 abreve y -30 '
+                      'abreve yacute -30 abreve ydieresis -30 acircumflex v '
+                      '-20 acircumflex w -20 acircumflex y -30 acircumflex '
+                      'yacute -30 acircumflex ydieresis -30 adieresis v -20 '
+                      'adieresis w -20 adieresis y -30 adieresis yacute -30 '
+                      'adieresis ydieresis -30 agrave v -20 agrave w -20 '
+                      'agrave y -30 agrave yacute -30 agrave ydieresis -30 '
+                      'amacron v -20 amacron w -20 amacron y -30 amacron '
+                      'yacute -30 amacron ydieresis -30 aogonek v -20 aogonek '
+                      'w -20 aogonek y -30 aogonek yacute -30 aogonek '
+                      'ydieresis -30 aring v -20 aring w -20 aring y -30 '
+                      'aring yacute -30 aring ydieresis -30 atilde v -20 '
+                      'atilde w -20 atilde y -30 atilde yacute -30 atilde '
+                      'ydieresis -30 b b -10 b comma -40 b l -20 b lacute -20 '
+                      'b lcommaaccent -20 b lslash -20 b period -40 b u -20 b '
+                      'uacute -20 b ucircumflex -20 b udieresis -20 b ugrave '
+                      '-20 b uhungarumlaut -20 b umacron -20 b uogonek -20 b '
+                      'uring -20 b v -20 b y -20 b yacute -20 b ydieresis -20 '
+                      'c comma -15 c k -20 c kcommaaccent -20 cacute comma '
+                      '-15 cacute k -20 cacute kcommaaccent -20 ccaron comma '
+                      '-15 ccaron k -20 ccaron kcommaaccent -20 ccedilla '
+                      'comma -15 ccedilla k -20 ccedilla kcommaaccent -20 '
+                      'colon space -50 comma quotedblright -100 comma '
+                      'quoteright -100 e comma -15 e period -15 e v -30 e w '
+                      '-20 e x -30 e y -20 e yacute -20 e ydieresis -20 '
+                      'eacute comma -15 eacute period -15 eacute v -30 eacute '
+                      'w -20 eacute x -30 eacute y -20 eacute yacute -20 '
+                      'eacute ydieresis -20 ecaron comma -15 ecaron period '
+                      '-15 ecaron v -30 ecaron w -20 ecaron x -30 ecaron y '
+                      '-20 ecaron yacute -20 ecaron ydieresis -20 ecircumflex '
+                      'comma -15 ecircumflex period -15 ecircumflex v -30 '
+                      'ecircumflex w -20 ecircumflex x -30 ecircumflex y -20 '
+                      'ecircumflex yacute -20 ecircumflex ydieresis -20 '
+                      'edieresis comma -15 edieresis period -15 edieresis v '
+                      '-30 edieresis w -20 edieresis x -30 edieresis y -20 '
+                      'edieresis yacute -20 edieresis ydieresis -20 '
+                      'edotaccent comma -15 edotaccent period -15 edotaccent '
+                      'v -30 edotaccent w -20 edotaccent x -30 edotaccent y '
+                      '-20 edotaccent yacute -20 edotaccent ydieresis -20 '
+                      'egrave comma -15 egrave period -15 egrave v -30 egrave '
+                      'w -20 egrave x -30 egrave y -20 egrave yacute -20 '
+                      'egrave ydieresis -20 emacron comma -15 emacron period '
+                      '-15 emacron v -30 emacron w -20 emacron x -30 emacron '
+                      'y -20 emacron yacute -20 emacron ydieresis -20 eogonek '
+                      'comma -15 eogonek period -15 eogonek v -30 eogonek w '
+                      '-20 eogonek x -30 eogonek y -20 eogonek yacute -20 '
+                      'eogonek ydieresis -20 f a -30 f aacute -30 f abreve '
+                      '-30 f acircumflex -30 f adieresis -30 f agrave -30 f '
+                      'amacron -30 f aogonek -30 f aring -30 f atilde -30 f '
+                      'comma -30 f dotlessi -28 f e -30 f eacute -30 f ecaron '
+                      '-30 f ecircumflex -30 f edieresis -30 f edotaccent -30 '
+                      'f egrave -30 f emacron -30 f eogonek -30 f o -30 f '
+                      'oacute -30 f ocircumflex -30 f odieresis -30 f ograve '
+                      '-30 f ohungarumlaut -30 f omacron -30 f oslash -30 f '
+                      'otilde -30 f period -30 f quotedblright 60 f '
+                      'quoteright 50 g r -10 g racute -10 g rcaron -10 g '
+                      'rcommaaccent -10 gbreve r -10 gbreve racute -10 gbreve '
+                      'rcaron -10 gbreve rcommaaccent -10 gcommaaccent r -10 '
+                      'gcommaaccent racute -10 gcommaaccent rcaron -10 '
+                      'gcommaaccent rcommaaccent -10 h y -30 h yacute -30 h '
+                      'ydieresis -30 k e -20 k eacute -20 k ecaron -20 k '
+                      'ecircumflex -20 k edieresis -20 k edotaccent -20 k '
+                      'egrave -20 k emacron -20 k eogonek -20 k o -20 k '
+                      'oacute -20 k ocircumflex -20 k odieresis -20 k ograve '
+                      '-20 k ohungarumlaut -20 k omacron -20 k oslash -20 k '
+                      'otilde -20 kcommaaccent e -20 kcommaaccent eacute -20 '
+                      'kcommaaccent ecaron -20 kcommaaccent ecircumflex -20 '
+                      'kcommaaccent edieresis -20 kcommaaccent edotaccent -20 '
+                      'kcommaaccent egrave -20 kcommaaccent emacron -20 '
+                      'kcommaaccent eogonek -20 kcommaaccent o -20 '
+                      'kcommaaccent oacute -20 kcommaaccent ocircumflex -20 '
+                      'kcommaaccent odieresis -20 kcommaaccent ograve -20 '
+                      'kcommaaccent ohungarumlaut -20 kcommaaccent omacron '
+                      '-20 kcommaaccent oslash -20 kcommaaccent otilde -20 m '
+                      'u -10 m uacute -10 m ucircumflex -10 m udieresis -10 m '
+                      'ugrave -10 m uhungarumlaut -10 m umacron -10 m uogonek '
+                      '-10 m uring -10 m y -15 m yacute -15 m ydieresis -15 n '
+                      'u -10 n uacute -10 n ucircumflex -10 n udieresis -10 n '
+                      'ugrave -10 n uhungarumlaut -10 n umacron -10 n uogonek '
+                      '-10 n uring -10 n v -20 n y -15 n yacute -15 n '
+                      'ydieresis -15 nacute u -10 nacute uacute -10 nacute '
+                      'ucircumflex -10 nacute udieresis -10 nacute ugrave -10 '
+                      'nacute uhungarumlaut -10 nacute umacron -10 nacute '
+                      'uogonek -10 nacute uring -10 nacute v -20 nacute y -15 '
+                      'nacute yacute -15 nacute ydieresis -15 ncaron u -10 '
+                      'ncaron uacute -10 ncaron ucircumflex -10 ncaron '
+                      'udieresis -10 ncaron ugrave -10 ncaron uhungarumlaut '
+                      '-10 ncaron umacron -10 ncaron uogonek -10 ncaron uring '
+                      '-10 ncaron v -20 ncaron y -15 ncaron yacute -15 ncaron '
+                      'ydieresis -15 ncommaaccent u -10 ncommaaccent uacute '
+                      '-10 ncommaaccent ucircumflex -10 ncommaaccent '
+                      'udieresis -10 ncommaaccent ugrave -10 ncommaaccent '
+                      'uhungarumlaut -10 ncommaaccent umacron -10 '
+                      'ncommaaccent uogonek -10 ncommaaccent uring -10 '
+                      'ncommaaccent v -20 ncommaaccent y -15 ncommaaccent '
+                      'yacute -15 ncommaaccent ydieresis -15 ntilde u -10 '
+                      'ntilde uacute -10 ntilde ucircumflex -10 ntilde '
+                      'udieresis -10 ntilde ugrave -10 ntilde uhungarumlaut '
+                      '-10 ntilde umacron -10 ntilde uogonek -10 ntilde uring '
+                      '-10 ntilde v -20 ntilde y -15 ntilde yacute -15 ntilde '
+                      'ydieresis -15 o comma -40 o period -40 o v -15 o w -15 '
+                      'o x -30 o y -30 o yacute -30 o ydieresis -30 oacute '
+                      'comma -40 oacute period -40 oacute v -15 oacute w -15 '
+                      'oacute x -30 oacute y -30 oacute yacute -30 oacute '
+                      'ydieresis -30 ocircumflex comma -40 ocircumflex period '
+                      '-40 ocircumflex v -15 ocircumflex w -15 ocircumflex x '
+                      '-30 ocircumflex y -30 ocircumflex yacute -30 '
+                      'ocircumflex ydieresis -30 odieresis comma -40 '
+                      'odieresis period -40 odieresis v -15 odieresis w -15 '
+                      'odieresis x -30 odieresis y -30 odieresis yacute -30 '
+                      'odieresis ydieresis -30 ograve comma -40 ograve period '
+                      '-40 ograve v -15 ograve w -15 ograve x -30 ograve y '
+                      '-30 ograve yacute -30 ograve ydieresis -30 '
+                      'ohungarumlaut comma -40 ohungarumlaut period -40 '
+                      'ohungarumlaut v -15 ohungarumlaut w -15 ohungarumlaut '
+                      'x -30 ohungarumlaut y -30 ohungarumlaut yacute -30 '
+                      'ohungarumlaut ydieresis -30 omacron comma -40 omacron '
+                      'period -40 omacron v -15 omacron w -15 omacron x -30 '
+                      'omacron y -30 omacron yacute -30 omacron ydieresis -30 '
+                      'oslash a -55 oslash aacute -55 oslash abreve -55 '
+                      'oslash acircumflex -55 oslash adieresis -55 oslash '
+                      'agrave -55 oslash amacron -55 oslash aogonek -55 '
+                      'oslash aring -55 oslash atilde -55 oslash b -55 oslash '
+                      'c -55 oslash cacute -55 oslash ccaron -55 oslash '
+                      'ccedilla -55 oslash comma -95 oslash d -55 oslash '
+                      'dcroat -55 oslash e -55 oslash eacute -55 oslash '
+                      'ecaron -55 oslash ecircumflex -55 oslash edieresis -55 '
+                      'oslash edotaccent -55 oslash egrave -55 oslash emacron '
+                      '-55 oslash eogonek -55 oslash f -55 oslash g -55 '
+                      'oslash gbreve -55 oslash gcommaaccent -55 oslash h -55 '
+                      'oslash i -55 oslash iacute -55 oslash icircumflex -55 '
+                      'oslash idieresis -55 oslash igrave -55 oslash imacron '
+                      '-55 oslash iogonek -55 oslash j -55 oslash k -55 '
+                      'oslash kcommaaccent -55 oslash l -55 oslash lacute -55 '
+                      'oslash lcommaaccent -55 oslash lslash -55 oslash m -55 '
+                      'oslash n -55 oslash nacute -55 oslash ncaron -55 '
+                      'oslash ncommaaccent -55 oslash ntilde -55 oslash o -55 '
+                      'oslash oacute -55 oslash ocircumflex -55 oslash '
+                      'odieresis -55 oslash ograve -55 oslash ohungarumlaut '
+                      '-55 oslash omacron -55 oslash oslash -55 oslash otilde '
+                      '-55 oslash p -55 oslash period -95 oslash q -55 oslash '
+                      'r -55 oslash racute -55 oslash rcaron -55 oslash '
+                      'rcommaaccent -55 oslash s -55 oslash sacute -55 oslash '
+                      'scaron -55 oslash scedilla -55 oslash scommaaccent -55 '
+                      'oslash t -55 oslash tcommaaccent -55 oslash u -55 '
+                      'oslash uacute -55 oslash ucircumflex -55 oslash '
+                      'udieresis -55 oslash ugrave -55 oslash uhungarumlaut '
+                      '-55 oslash umacron -55 oslash uogonek -55 oslash uring '
+                      '-55 oslash v -70 oslash w -70 oslash x -85 oslash y '
+                      '-70 oslash yacute -70 oslash ydieresis -70 oslash z '
+                      '-55 oslash zacute -55 oslash zcaron -55 oslash '
+                      'zdotaccent -55 otilde comma -40 otilde period -40 '
+                      'otilde v -15 otilde w -15 otilde x -30 otilde y -30 '
+                      'otilde yacute -30 otilde ydieresis -30 p comma -35 p '
+                      'period -35 p y -30 p yacute -30 p ydieresis -30 period '
+                      'quotedblright -100 period quoteright -100 period space '
+                      '-60 quotedblright space -40 quoteleft quoteleft -57 '
+                      'quoteright d -50 quoteright dcroat -50 quoteright '
+                      'quoteright -57 quoteright r -50 quoteright racute -50 '
+                      'quoteright rcaron -50 quoteright rcommaaccent -50 '
+                      'quoteright s -50 quoteright sacute -50 quoteright '
+                      'scaron -50 quoteright scedilla -50 quoteright '
+                      'scommaaccent -50 quoteright space -70 r a -10 r aacute '
+                      '-10 r abreve -10 r acircumflex -10 r adieresis -10 r '
+                      'agrave -10 r amacron -10 r aogonek -10 r aring -10 r '
+                      'atilde -10 r colon 30 r comma -50 r i 15 r iacute 15 r '
+                      'icircumflex 15 r idieresis 15 r igrave 15 r imacron 15 '
+                      'r iogonek 15 r k 15 r kcommaaccent 15 r l 15 r lacute '
+                      '15 r lcommaaccent 15 r lslash 15 r m 25 r n 25 r '
+                      'nacute 25 r ncaron 25 r ncommaaccent 25 r ntilde 25 r '
+                      'p 30 r period -50 r semicolon 30 r t 40 r tcommaaccent '
+                      '40 r u 15 r uacute 15 r ucircumflex 15 r udieresis 15 '
+                      'r ugrave 15 r uhungarumlaut 15 r umacron 15 r uogonek '
+                      '15 r uring 15 r v 30 r y 30 r yacute 30 r ydieresis 30 '
+                      'racute a -10 racute aacute -10 racute abreve -10 '
+                      'racute acircumflex -10 racute adieresis -10 racute '
+                      'agrave -10 racute amacron -10 racute aogonek -10 '
+                      'racute aring -10 racute atilde -10 racute colon 30 '
+                      'racute comma -50 racute i 15 racute iacute 15 racute '
+                      'icircumflex 15 racute idieresis 15 racute igrave 15 '
+                      'racute imacron 15 racute iogonek 15 racute k 15 racute '
+                      'kcommaaccent 15 racute l 15 racute lacute 15 racute '
+                      'lcommaaccent 15 racute lslash 15 racute m 25 racute n '
+                      '25 racute nacute 25 racute ncaron 25 racute '
+                      'ncommaaccent 25 racute ntilde 25 racute p 30 racute '
+                      'period -50 racute semicolon 30 racute t 40 racute '
+                      'tcommaaccent 40 racute u 15 racute uacute 15 racute '
+                      'ucircumflex 15 racute udieresis 15 racute ugrave 15 '
+                      'racute uhungarumlaut 15 racute umacron 15 racute '
+                      'uogonek 15 racute uring 15 racute v 30 racute y 30 '
+                      'racute yacute 30 racute ydieresis 30 rcaron a -10 '
+                      'rcaron aacute -10 rcaron abreve -10 rcaron acircumflex '
+                      '-10 rcaron adieresis -10 rcaron agrave -10 rcaron '
+                      'amacron -10 rcaron aogonek -10 rcaron aring -10 rcaron '
+                      'atilde -10 rcaron colon 30 rcaron comma -50 rcaron i '
+                      '15 rcaron iacute 15 rcaron icircumflex 15 rcaron '
+                      'idieresis 15 rcaron igrave 15 rcaron imacron 15 rcaron '
+                      'iogonek 15 rcaron k 15 rcaron kcommaaccent 15 rcaron l '
+                      '15 rcaron lacute 15 rcaron lcommaaccent 15 rcaron '
+                      'lslash 15 rcaron m 25 rcaron n 25 rcaron nacute 25 '
+                      'rcaron ncaron 25 rcaron ncommaaccent 25 rcaron ntilde '
+                      '25 rcaron p 30 rcaron period -50 rcaron semicolon 30 '
+                      'rcaron t 40 rcaron tcommaaccent 40 rcaron u 15 rcaron '
+                      'uacute 15 rcaron ucircumflex 15 rcaron udieresis 15 '
+                      'rcaron ugrave 15 rcaron uhungarumlaut 15 rcaron '
+                      'umacron 15 rcaron uogonek 15 rcaron uring 15 rcaron v '
+                      '30 rcaron y 30 rcaron yacute 30 rcaron ydieresis 30 '
+                      'rcommaaccent a -10 rcommaaccent aacute -10 '
+                      'rcommaaccent abreve -10 rcommaaccent acircumflex -10 '
+                      'rcommaaccent adieresis -10 rcommaaccent agrave -10 '
+                      'rcommaaccent amacron -10 rcommaaccent aogonek -10 '
+                      'rcommaaccent aring -10 rcommaaccent atilde -10 '
+                      'rcommaaccent colon 30 rcommaaccent comma -50 '
+                      'rcommaaccent i 15 rcommaaccent iacute 15 rcommaaccent '
+                      'icircumflex 15 rcommaaccent idieresis 15 rcommaaccent '
+                      'igrave 15 rcommaaccent imacron 15 rcommaaccent iogonek '
+                      '15 rcommaaccent k 15 rcommaaccent kcommaaccent 15 '
+                      'rcommaaccent l 15 rcommaaccent lacute 15 rcommaaccent '
+                      'lcommaaccent 15 rcommaaccent lslash 15 rcommaaccent m '
+                      '25 rcommaaccent n 25 rcommaaccent nacute 25 '
+                      'rcommaaccent ncaron 25 rcommaaccent ncommaaccent 25 '
+                      'rcommaaccent ntilde 25 rcommaaccent p 30 rcommaaccent '
+                      'period -50 rcommaaccent semicolon 30 rcommaaccent t 40 '
+                      'rcommaaccent tcommaaccent 40 rcommaaccent u 15 '
+                      'rcommaaccent uacute 15 rcommaaccent ucircumflex 15 '
+                      'rcommaaccent udieresis 15 rcommaaccent ugrave 15 '
+                      'rcommaaccent uhungarumlaut 15 rcommaaccent umacron 15 '
+                      'rcommaaccent uogonek 15 rcommaaccent uring 15 '
+                      'rcommaaccent v 30 rcommaaccent y 30 rcommaaccent '
+                      'yacute 30 rcommaaccent ydieresis 30 s comma -15 s '
+                      'period -15 s w -30 sacute comma -15 sacute period -15 '
+                      'sacute w -30 scaron comma -15 scaron period -15 scaron '
+                      'w -30 scedilla comma -15 scedilla period -15 scedilla '
+                      'w -30 scommaaccent comma -15 scommaaccent period -15 '
+                      'scommaaccent w -30 semicolon space -50 space T -50 '
+                      'space Tcaron -50 space Tcommaaccent -50 space V -50 '
+                      'space W -40 space Y -90 space Yacute -90 space '
+                      'Ydieresis -90 space quotedblleft -30 space quoteleft '
+                      '-60 v a -25 v aacute -25 v abreve -25 v acircumflex '
+                      '-25 v adieresis -25 v agrave -25 v amacron -25 v '
+                      'aogonek -25 v aring -25 v atilde -25 v comma -80 v e '
+                      '-25 v eacute -25 v ecaron -25 v ecircumflex -25 v '
+                      'edieresis -25 v edotaccent -25 v egrave -25 v emacron '
+                      '-25 v eogonek -25 v o -25 v oacute -25 v ocircumflex '
+                      '-25 v odieresis -25 v ograve -25 v ohungarumlaut -25 v '
+                      'omacron -25 v oslash -25 v otilde -25 v period -80 w a '
+                      '-15 w aacute -15 w abreve -15 w acircumflex -15 w '
+                      'adieresis -15 w agrave -15 w amacron -15 w aogonek -15 '
+                      'w aring -15 w atilde -15 w comma -60 w e -10 w eacute '
+                      '-10 w ecaron -10 w ecircumflex -10 w edieresis -10 w '
+                      'edotaccent -10 w egrave -10 w emacron -10 w eogonek '
+                      '-10 w o -10 w oacute -10 w ocircumflex -10 w odieresis '
+                      '-10 w ograve -10 w ohungarumlaut -10 w omacron -10 w '
+                      'oslash -10 w otilde -10 w period -60 x e -30 x eacute '
+                      '-30 x ecaron -30 x ecircumflex -30 x edieresis -30 x '
+                      'edotaccent -30 x egrave -30 x emacron -30 x eogonek '
+                      '-30 y a -20 y aacute -20 y abreve -20 y acircumflex '
+                      '-20 y adieresis -20 y agrave -20 y amacron -20 y '
+                      'aogonek -20 y aring -20 y atilde -20 y comma -100 y e '
+                      '-20 y eacute -20 y ecaron -20 y ecircumflex -20 y '
+                      'edieresis -20 y edotaccent -20 y egrave -20 y emacron '
+                      '-20 y eogonek -20 y o -20 y oacute -20 y ocircumflex '
+                      '-20 y odieresis -20 y ograve -20 y ohungarumlaut -20 y '
+                      'omacron -20 y oslash -20 y otilde -20 y period -100 '
+                      'yacute a -20 yacute aacute -20 yacute abreve -20 '
+                      'yacute acircumflex -20 yacute adieresis -20 yacute '
+                      'agrave -20 yacute amacron -20 yacute aogonek -20 '
+                      'yacute aring -20 yacute atilde -20 yacute comma -100 '
+                      'yacute e -20 yacute eacute -20 yacute ecaron -20 '
+                      'yacute ecircumflex -20 yacute edieresis -20 yacute '
+                      'edotaccent -20 yacute egrave -20 yacute emacron -20 '
+                      'yacute eogonek -20 yacute o -20 yacute oacute -20 '
+                      'yacute ocircumflex -20 yacute odieresis -20 yacute '
+                      'ograve -20 yacute ohungarumlaut -20 yacute omacron -20 '
+                      'yacute oslash -20 yacute otilde -20 yacute period -100 '
+                      'ydieresis a -20 ydieresis aacute -20 ydieresis abreve '
+                      '-20 ydieresis acircumflex -20 ydieresis adieresis -20 '
+                      'ydieresis agrave -20 ydieresis amacron -20 ydieresis '
+                      'aogonek -20 ydieresis aring -20 ydieresis atilde -20 '
+                      'ydieresis comma -100 ydieresis e -20 ydieresis eacute '
+                      '-20 ydieresis ecaron -20 ydieresis ecircumflex -20 '
+                      'ydieresis edieresis -20 ydieresis edotaccent -20 '
+                      'ydieresis egrave -20 ydieresis emacron -20 ydieresis '
+                      'eogonek -20 ydieresis o -20 ydieresis oacute -20 '
+                      'ydieresis ocircumflex -20 ydieresis odieresis -20 '
+                      'ydieresis ograve -20 ydieresis ohungarumlaut -20 '
+                      'ydieresis omacron -20 ydieresis oslash -20 ydieresis '
+                      'otilde -20 ydieresis period -100 z e -15 z eacute -15 '
+                      'z ecaron -15 z ecircumflex -15 z edieresis -15 z '
+                      'edotaccent -15 z egrave -15 z emacron -15 z eogonek '
+                      '-15 z o -15 z oacute -15 z ocircumflex -15 z odieresis '
+                      '-15 z ograve -15 z ohungarumlaut -15 z omacron -15 z '
+                      'oslash -15 z otilde -15 zacute e -15 zacute eacute -15 '
+                      'zacute ecaron -15 zacute ecircumflex -15 zacute '
+                      'edieresis -15 zacute edotaccent -15 zacute egrave -15 '
+                      'zacute emacron -15 zacute eogonek -15 zacute o -15 '
+                      'zacute oacute -15 zacute ocircumflex -15 zacute '
+                      'odieresis -15 zacute ograve -15 zacute ohungarumlaut '
+                      '-15 zacute omacron -15 zacute oslash -15 zacute otilde '
+                      '-15 zcaron e -15 zcaron eacute -15 zcaron ecaron -15 '
+                      'zcaron ecircumflex -15 zcaron edieresis -15 zcaron '
+                      'edotaccent -15 zcaron egrave -15 zcaron emacron -15 '
+                      'zcaron eogonek -15 zcaron o -15 zcaron oacute -15 '
+                      'zcaron ocircumflex -15 zcaron odieresis -15 zcaron '
+                      'ograve -15 zcaron ohungarumlaut -15 zcaron omacron -15 '
+                      'zcaron oslash -15 zcaron otilde -15 zdotaccent e -15 '
+                      'zdotaccent eacute -15 zdotaccent ecaron -15 zdotaccent '
+                      'ecircumflex -15 zdotaccent edieresis -15 zdotaccent '
+                      'edotaccent -15 zdotaccent egrave -15 zdotaccent '
+                      'emacron -15 zdotaccent eogonek -15 zdotaccent o -15 '
+                      'zdotaccent oacute -15 zdotaccent ocircumflex -15 '
+                      'zdotaccent odieresis -15 zdotaccent ograve -15 '
+                      'zdotaccent ohungarumlaut -15 zdotaccent omacron -15 '
+                      'zdotaccent oslash -15 zdotaccent otilde -15',
+ 'Times-Bold': 'A C -55 A Cacute -55 A Ccaron -55 A Ccedilla -55 A G -55 A '
+               'Gbreve -55 A Gcommaaccent -55 A O -45 A Oacute -45 A '
+               'Ocircumflex -45 A Odieresis -45 A Ograve -45 A Ohungarumlaut '
+               '-45 A Omacron -45 A Oslash -45 A Otilde -45 A Q -45 A T -95 A '
+               'Tcaron -95 A Tcommaaccent -95 A U -50 A Uacute -50 A '
+               'Ucircumflex -50 A Udieresis -50 A Ugrave -50 A Uhungarumlaut '
+               '-50 A Umacron -50 A Uogonek -50 A Uring -50 A V -145 A W -130 '
+               'A Y -100 A Yacute -100 A Ydieresis -100 A p -25 A quoteright '
+               '-74 A u -50 A uacute -50 A ucircumflex -50 A udieresis -50 A '
+               'ugrave -50 A uhungarumlaut -50 A umacron -50 A uogonek -50 A '
+               'uring -50 A v -100 A w -90 A y -74 A yacute -74 A ydieresis '
+               '-74 Aacute C -55 Aacute Cacute -55 Aacute Ccaron -55 Aacute '
+               'Ccedilla -55 Aacute G -55 Aacute Gbreve -55 Aacute '
+               'Gcommaaccent -55 Aacute O -45 Aacute Oacute -45 Aacute '
+               'Ocircumflex -45 Aacute Odieresis -45 Aacute Ograve -45 Aacute '
+               'Ohungarumlaut -45 Aacute Omacron -45 Aacute Oslash -45 Aacute '
+               'Otilde -45 Aacute Q -45 Aacute T -95 Aacute Tcaron -95 Aacute '
+               'Tcommaaccent -95 Aacute U -50 Aacute Uacute -50 Aacute '
+               'Ucircumflex -50 Aacute Udieresis -50 Aacute Ugrave -50 Aacute '
+               'Uhungarumlaut -50 Aacute Umacron -50 Aacute Uogonek -50 '
+               'Aacute Uring -50 Aacute V -145 Aacute W -130 Aacute Y -100 '
+               'Aacute Yacute -100 Aacute Ydieresis -100 Aacute p -25 Aacute '
+               'quoteright -74 Aacute u -50 Aacute uacute -50 Aacute '
+               'ucircumflex -50 Aacute udieresis -50 Aacute ugrave -50 Aacute '
+               'uhungarumlaut -50 Aacute umacron -50 Aacute uogonek -50 '
+               'Aacute uring -50 Aacute v -100 Aacute w -90 Aacute y -74 '
+               'Aacute yacute -74 Aacute ydieresis -74 Abreve C -55 Abreve '
+               'Cacute -55 Abreve Ccaron -55 Abreve Ccedilla -55 Abreve G -55 '
+               'Abreve Gbreve -55 Abreve Gcommaaccent -55 Abreve O -45 Abreve '
+               'Oacute -45 Abreve Ocircumflex -45 Abreve Odieresis -45 Abreve '
+               'Ograve -45 Abreve Ohungarumlaut -45 Abreve Omacron -45 Abreve '
+               'Oslash -45 Abreve Otilde -45 Abreve Q -45 Abreve T -95 Abreve '
+               'Tcaron -95 Abreve Tcommaaccent -95 Abreve U -50 Abreve Uacute '
+               '-50 Abreve Ucircumflex -50 Abreve Udieresis -50 Abreve Ugrave '
+               '-50 Abreve Uhungarumlaut -50 Abreve Umacron -50 Abreve '
+               'Uogonek -50 Abreve Uring -50 Abreve V -145 Abreve W -130 '
+               'Abreve Y -100 Abreve Yacute -100 Abreve Ydieresis -100 Abreve '
+               'p -25 Abreve quoteright -74 Abreve u -50 Abreve uacute -50 '
+               'Abreve ucircumflex -50 Abreve udieresis -50 Abreve ugrave -50 '
+               'Abreve uhungarumlaut -50 Abreve umacron -50 Abreve uogonek '
+               '-50 Abreve uring -50 Abreve v -100 Abreve w -90 Abreve y -74 '
+               'Abreve yacute -74 Abreve ydieresis -74 Acircumflex C -55 '
+               'Acircumflex Cacute -55 Acircumflex Ccaron -55 Acircumflex '
+               'Ccedilla -55 Acircumflex G -55 Acircumflex Gbreve -55 '
+               'Acircumflex Gcommaaccent -55 Acircumflex O -45 Acircumflex '
+               'Oacute -45 Acircumflex Ocircumflex -45 Acircumflex Odieresis '
+               '-45 Acircumflex Ograve -45 Acircumflex Ohungarumlaut -45 '
+               'Acircumflex Omacron -45 Acircumflex Oslash -45 Acircumflex '
+               'Otilde -45 Acircumflex Q -45 Acircumflex T -95 Acircumflex '
+               'Tcaron -95 Acircumflex Tcommaaccent -95 Acircumflex U -50 '
+               'Acircumflex Uacute -50 Acircumflex Ucircumflex -50 '
+               'Acircumflex Udieresis -50 Acircumflex Ugrave -50 Acircumflex '
+               'Uhungarumlaut -50 Acircumflex Umacron -50 Acircumflex Uogonek '
+               '-50 Acircumflex Uring -50 Acircumflex V -145 Acircumflex W '
+               '-130 Acircumflex Y -100 Acircumflex Yacute -100 Acircumflex '
+               'Ydieresis -100 Acircumflex p -25 Acircumflex quoteright -74 '
+               'Acircumflex u -50 Acircumflex uacute -50 Acircumflex '
+               'ucircumflex -50 Acircumflex udieresis -50 Acircumflex ugrave '
+               '-50 Acircumflex uhungarumlaut -50 Acircumflex umacron -50 '
+               'Acircumflex uogonek -50 Acircumflex uring -50 Acircumflex v '
+               '-100 Acircumflex w -90 Acircumflex y -74 Acircumflex yacute '
+               '-74 Acircumflex ydieresis -74 Adieresis C -55 Adieresis '
+               'Cacute -55 Adieresis Ccaron -55 Adieresis Ccedilla -55 '
+               'Adieresis G -55 Adieresis Gbreve -55 Adieresis Gcommaaccent '
+               '-55 Adieresis O -45 Adieresis Oacute -45 Adieresis '
+               'Ocircumflex -45 Adieresis Odieresis -45 Adieresis Ograve -45 '
+               'Adieresis Ohungarumlaut -45 Adieresis Omacron -45 Adieresis '
+               'Oslash -45 Adieresis Otilde -45 Adieresis Q -45 Adieresis T '
+               '-95 Adieresis Tcaron -95 Adieresis Tcommaaccent -95 Adieresis '
+               'U -50 Adieresis Uacute -50 Adieresis Ucircumflex -50 '
+               'Adieresis Udieresis -50 Adieresis Ugrave -50 Adieresis '
+               'Uhungarumlaut -50 Adieresis Umacron -50 Adieresis Uogonek -50 '
+               'Adieresis Uring -50 Adieresis V -145 Adieresis W -130 '
+               'Adieresis Y -100 Adieresis Yacute -100 Adieresis Ydieresis '
+               '-100 Adieresis p -25 Adieresis quoteright -74 Adieresis u -50 '
+               'Adieresis uacute -50 Adieresis ucircumflex -50 Adieresis '
+               'udieresis -50 Adieresis ugrave -50 Adieresis uhungarumlaut '
+               '-50 Adieresis umacron -50 Adieresis uogonek -50 Adieresis '
+               'uring -50 Adieresis v -100 Adieresis w -90 Adieresis y -74 '
+               'Adieresis yacute -74 Adieresis ydieresis -74 Agrave C -55 '
+               'Agrave Cacute -55 Agrave Ccaron -55 Agrave Ccedilla -55 '
+               'Agrave G -55 Agrave Gbreve -55 Agrave Gcommaaccent -55 Agrave '
+               'O -45 Agrave Oacute -45 Agrave Ocircumflex -45 Agrave '
+               'Odieresis -45 Agrave Ograve -45 Agrave Ohungarumlaut -45 '
+               'Agrave Omacron -45 Agrave Oslash -45 Agrave Otilde -45 Agrave '
+               'Q -45 Agrave T -95 Agrave Tcaron -95 Agrave Tcommaaccent -95 '
+               'Agrave U -50 Agrave Uacute -50 Agrave Ucircumflex -50 Agrave '
+               'Udieresis -50 Agrave Ugrave -50 Agrave Uhungarumlaut -50 '
+               'Agrave Umacron -50 Agrave Uogonek -50 Agrave Uring -50 Agrave '
+               'V -145 Agrave W -130 Agrave Y -100 Agrave Yacute -100 Agrave '
+               'Ydieresis -100 Agrave p -25 Agrave quoteright -74 Agrave u '
+               '-50 Agrave uacute -50 Agrave ucircumflex -50 Agrave udieresis '
+               '-50 Agrave ugrave -50 Agrave uhungarumlaut -50 Agrave umacron '
+               '-50 Agrave uogonek -50 Agrave uring -50 Agrave v -100 Agrave '
+               'w -90 Agrave y -74 Agrave yacute -74 Agrave ydieresis -74 '
+               'Amacron C -55 Amacron Cacute -55 Amacron Ccaron -55 Amacron '
+               'Ccedilla -55 Amacron G -55 Amacron Gbreve -55 Amacron '
+               'Gcommaaccent -55 Amacron O -45 Amacron Oacute -45 Amacron '
+               'Ocircumflex -45 Amacron Odieresis -45 Amacron Ograve -45 '
+               'Amacron Ohungarumlaut -45 Amacron Omacron -45 Amacron Oslash '
+               '-45 Amacron Otilde -45 Amacron Q -45 Amacron T -95 Amacron '
+               'Tcaron -95 Amacron Tcommaaccent -95 Amacron U -50 Amacron '
+               'Uacute -50 Amacron Ucircumflex -50 Amacron Udieresis -50 '
+               'Amacron Ugrave -50 Amacron Uhungarumlaut -50 Amacron Umacron '
+               '-50 Amacron Uogonek -50 Amacron Uring -50 Amacron V -145 '
+               'Amacron W -130 Amacron Y -100 Amacron Yacute -100 Amacron '
+               'Ydieresis -100 Amacron p -25 Amacron quoteright -74 Amacron u '
+               '-50 Amacron uacute -50 Amacron ucircumflex -50 Amacron '
+               'udieresis -50 Amacron ugrave -50 Amacron uhungarumlaut -50 '
+               'Amacron umacron -50 Amacron uogonek -50 Amacron uring -50 '
+               'Amacron v -100 Amacron w -90 Amacron y -74 Amacron yacute -74 '
+               'Amacron ydieresis -74 Aogonek C -55 Aogonek Cacute -55 '
+               'Aogonek Ccaron -55 Aogonek Ccedilla -55 Aogonek G -55 Aogonek '
+               'Gbreve -55 Aogonek Gcommaaccent -55 Aogonek O -45 Aogonek '
+               'Oacute -45 Aogonek Ocircumflex -45 Aogonek Odieresis -45 '
+               'Aogonek Ograve -45 Aogonek Ohungarumlaut -45 Aogonek Omacron '
+               '-45 Aogonek Oslash -45 Aogonek Otilde -45 Aogonek Q -45 '
+               'Aogonek T -95 Aogonek Tcaron -95 Aogonek Tcommaaccent -95 '
+               'Aogonek U -50 Aogonek Uacute -50 Aogonek Ucircumflex -50 '
+               'Aogonek Udieresis -50 Aogonek Ugrave -50 Aogonek '
+               'Uhungarumlaut -50 Aogonek Umacron -50 Aogonek Uogonek -50 '
+               'Aogonek Uring -50 Aogonek V -145 Aogonek W -130 Aogonek Y '
+               '-100 Aogonek Yacute -100 Aogonek Ydieresis -100 Aogonek p -25 '
+               'Aogonek quoteright -74 Aogonek u -50 Aogonek uacute -50 '
+               'Aogonek ucircumflex -50 Aogonek udieresis -50 Aogonek ugrave '
+               '-50 Aogonek uhungarumlaut -50 Aogonek umacron -50 Aogonek '
+               'uogonek -50 Aogonek uring -50 Aogonek v -100 Aogonek w -90 '
+               'Aogonek y -34 Aogonek yacute -34 Aogonek ydieresis -34 Aring '
+               'C -55 Aring Cacute -55 Aring Ccaron -55 Aring Ccedilla -55 '
+               'Aring G -55 Aring Gbreve -55 Aring Gcommaaccent -55 Aring O '
+               '-45 Aring Oacute -45 Aring Ocircumflex -45 Aring Odieresis '
+               '-45 Aring Ograve -45 Aring Ohungarumlaut -45 Aring Omacron '
+               '-45 Aring Oslash -45 Aring Otilde -45 Aring Q -45 Aring T -95 '
+               'Aring Tcaron -95 Aring Tcommaaccent -95 Aring U -50 Aring '
+               'Uacute -50 Aring Ucircumflex -50 Aring Udieresis -50 Aring '
+               'Ugrave -50 Aring Uhungarumlaut -50 Aring Umacron -50 Aring '
+               'Uogonek -50 Aring Uring -50 Aring V -145 Aring W -130 Aring Y '
+               '-100 Aring Yacute -100 Aring Ydieresis -100 Aring p -25 Aring '
+               'quoteright -74 Aring u -50 Aring uacute -50 Aring ucircumflex '
+               '-50 Aring udieresis -50 Aring ugrave -50 Aring uhungarumlaut '
+               '-50 Aring umacron -50 Aring uogonek -50 Aring uring -50 Aring '
+               'v -100 Aring w -90 Aring y -74 Aring yacute -74 Aring '
+               'ydieresis -74 Atilde C -55 Atilde Cacute -55 Atilde Ccaron '
+               '-55 Atilde Ccedilla -55 Atilde G -55 Atilde Gbreve -55 Atilde '
+               'Gcommaaccent -55 Atilde O -45 Atilde Oacute -45 Atilde '
+               'Ocircumflex -45 Atilde Odieresis -45 Atilde Ograve -45 Atilde '
+               'Ohungarumlaut -45 Atilde Omacron -45 Atilde Oslash -45 Atilde '
+               'Otilde -45 Atilde Q -45 Atilde T -95 Atilde Tcaron -95 Atilde '
+               'Tcommaaccent -95 Atilde U -50 Atilde Uacute -50 Atilde '
+               'Ucircumflex -50 Atilde Udieresis -50 Atilde Ugrave -50 Atilde '
+               'Uhungarumlaut -50 Atilde Umacron -50 Atilde Uogonek -50 '
+               'Atilde Uring -50 Atilde V -145 Atilde W -130 Atilde Y -100 '
+               'Atilde Yacute -100 Atilde Ydieresis -100 Atilde p -25 Atilde '
+               'quoteright -74 Atilde u -50 Atilde uacute -50 Atilde '
+               'ucircumflex -50 Atilde udieresis -50 Atilde ugrave -50 Atilde '
+               'uhungarumlaut -50 Atilde umacron -50 Atilde uogonek -50 '
+               'Atilde uring -50 Atilde v -100 Atilde w -90 Atilde y -74 '
+               'Atilde yacute -74 Atilde ydieresis -74 B A -30 B Aacute -30 B '
+               'Abreve -30 B Acircumflex -30 B Adieresis -30 B Agrave -30 B '
+               'Amacron -30 B Aogonek -30 B Aring -30 B Atilde -30 B U -10 B '
+               'Uacute -10 B Ucircumflex -10 B Udieresis -10 B Ugrave -10 B '
+               'Uhungarumlaut -10 B Umacron -10 B Uogonek -10 B Uring -10 D A '
+               '-35 D Aacute -35 D Abreve -35 D Acircumflex -35 D Adieresis '
+               '-35 D Agrave -35 D Amacron -35 D Aogonek -35 D Aring -35 D '
+               'Atilde -35 D V -40 D W -40 D Y -40 D Yacute -40 D Ydieresis '
+               '-40 D period -20 Dcaron A -35 Dcaron Aacute -35 Dcaron Abreve '
+               '-35 Dcaron Acircumflex -35 Dcaron Adieresis -35 Dcaron Agrave '
+               '-35 Dcaron Amacron -35 Dcaron Aogonek -35 Dcaron Aring -35 '
+               'Dcaron Atilde -35 Dcaron V -40 Dcaron W -40 Dcaron Y -40 '
+               'Dcaron Yacute -40 Dcaron Ydieresis -40 Dcaron period -20 '
+               'Dcroat A -35 Dcroat Aacute -35 Dcroat Abreve -35 Dcroat '
+               'Acircumflex -35 Dcroat Adieresis -35 Dcroat Agrave -35 Dcroat '
+               'Amacron -35 Dcroat Aogonek -35 Dcroat Aring -35 Dcroat Atilde '
+               '-35 Dcroat V -40 Dcroat W -40 Dcroat Y -40 Dcroat Yacute -40 '
+               'Dcroat Ydieresis -40 Dcroat period -20 F A -90 F Aacute -90 F '
+               'Abreve -90 F Acircumflex -90 F Adieresis -90 F Agrave -90 F '
+               'Amacron -90 F Aogonek -90 F Aring -90 F Atilde -90 F a -25 F '
+               'aacute -25 F abreve -25 F acircumflex -25 F adieresis -25 F '
+               'agrave -25 F amacron -25 F aogonek -25 F aring -25 F atilde '
+               '-25 F comma -92 F e -25 F eacute -25 F ecaron -25 F '
+               'ecircumflex -25 F edieresis -25 F edotaccent -25 F egrave -25 '
+               'F emacron -25 F eogonek -25 F o -25 F oacute -25 F '
+               'ocircumflex -25 F odieresis -25 F ograve -25 F ohungarumlaut '
+               '-25 F omacron -25 F oslash -25 F otilde -25 F period -110 J A '
+               '-30 J Aacute -30 J Abreve -30 J Acircumflex -30 J Adieresis '
+               '-30 J Agrave -30 J Amacron -30 J Aogonek -30 J Aring -30 J '
+               'Atilde -30 J a -15 J aacute -15 J abreve -15 J acircumflex '
+               '-15 J adieresis -15 J agrave -15 J amacron -15 J aogonek -15 '
+               'J aring -15 J atilde -15 J e -15 J eacute -15 J ecaron -15 J '
+               'ecircumflex -15 J edieresis -15 J edotaccent -15 J egrave -15 '
+               'J emacron -15 J eogonek -15 J o -15 J oacute -15 J '
+               'ocircumflex -15 J odieresis -15 J ograve -15 J ohungarumlaut '
+               '-15 J omacron -15 J oslash -15 J otilde -15 J period -20 J u '
+               '-15 J uacute -15 J ucircumflex -15 J udieresis -15 J ugrave '
+               '-15 J uhungarumlaut -15 J umacron -15 J uogonek -15 J uring '
+               '-15 K O -30 K Oacute -30 K Ocircumflex -30 K Odieresis -30 K '
+               'Ograve -30 K Ohungarumlaut -30 K Omacron -30 K Oslash -30 K '
+               'Otilde -30 K e -25 K eacute -25 K ecaron -25 K ecircumflex '
+               '-25 K edieresis -25 K edotaccent -25 K egrave -25 K emacron '
+               '-25 K eogonek -25 K o -25 K oacute -25 K ocircumflex -25 K '
+               'odieresis -25 K ograve -25 K ohungarumlaut -25 K omacron -25 '
+               'K oslash -25 K otilde -25 K u -15 K uacute -15 K ucircumflex '
+               '-15 K udieresis -15 K ugrave -15 K uhungarumlaut -15 K '
+               'umacron -15 K uogonek -15 K uring -15 K y -45 K yacute -45 K '
+               'ydieresis -45 Kcommaaccent O -30 Kcommaaccent Oacute -30 '
+               'Kcommaaccent Ocircumflex -30 Kcommaaccent Odieresis -30 '
+               'Kcommaaccent Ograve -30 Kcommaaccent Ohungarumlaut -30 '
+               'Kcommaaccent Omacron -30 Kcommaaccent Oslash -30 Kcommaaccent '
+               'Otilde -30 Kcommaaccent e -25 Kcommaaccent eacute -25 '
+               'Kcommaaccent ecaron -25 Kcommaaccent ecircumflex -25 '
+               'Kcommaaccent edieresis -25 Kcommaaccent edotaccent -25 '
+               'Kcommaaccent egrave -25 Kcommaaccent emacron -25 Kcommaaccent '
+               'eogonek -25 Kcommaaccent o -25 Kcommaaccent oacute -25 '
+               'Kcommaaccent ocircumflex -25 Kcommaaccent odieresis -25 '
+               'Kcommaaccent ograve -25 Kcommaaccent ohungarumlaut -25 '
+               'Kcommaaccent omacron -25 Kcommaaccent oslash -25 Kcommaaccent '
+               'otilde -25 Kcommaaccent u -15 Kcommaaccent uacute -15 '
+               'Kcommaaccent ucircumflex -15 Kcommaaccent udieresis -15 '
+               'Kcommaaccent ugrave -15 Kcommaaccent uhungarumlaut -15 '
+               'Kcommaaccent umacron -15 Kcommaaccent uogonek -15 '
+               'Kcommaaccent uring -15 Kcommaaccent y -45 Kcommaaccent yacute '
+               '-45 Kcommaaccent ydieresis -45 L T -92 L Tcaron -92 L '
+               'Tcommaaccent -92 L V -92 L W -92 L Y -92 L Yacute -92 L '
+               'Ydieresis -92 L quotedblright -20 L quoteright -110 L y -55 L '
+               'yacute -55 L ydieresis -55 Lacute T -92 Lacute Tcaron -92 '
+               'Lacute Tcommaaccent -92 Lacute V -92 Lacute W -92 Lacute Y '
+               '-92 Lacute Yacute -92 Lacute Ydieresis -92 Lacute '
+               'quotedblright -20 Lacute quoteright -110 Lacute y -55 Lacute '
+               'yacute -55 Lacute ydieresis -55 Lcommaaccent T -92 '
+               'Lcommaaccent Tcaron -92 Lcommaaccent Tcommaaccent -92 '
+               'Lcommaaccent V -92 Lcommaaccent W -92 Lcommaaccent Y -92 '
+               'Lcommaaccent Yacute -92 Lcommaaccent Ydieresis -92 '
+               'Lcommaaccent quotedblright -20 Lcommaaccent quoteright -110 '
+               'Lcommaaccent y -55 Lcommaaccent yacute -55 Lcommaaccent '
+               'ydieresis -55 Lslash T -92 Lslash Tcaron -92 Lslash '
+               'Tcommaaccent -92 Lslash V -92 Lslash W -92 Lslash Y -92 '
+               'Lslash Yacute -92 Lslash Ydieresis -92 Lslash quotedblright '
+               '-20 Lslash quoteright -110 Lslash y -55 Lslash yacute -55 '
+               'Lslash ydieresis -55 N A -20 N Aacute -20 N Abreve -20 N '
+               'Acircumflex -20 N Adieresis -20 N Agrave -20 N Amacron -20 N '
+               'Aogonek -20 N Aring -20 N Atilde -20 Nacute A -20 Nacute '
+               'Aacute -20 Nacute Abreve -20 Nacute Acircumflex -20 Nacute '
+               'Adieresis -20 Nacute Agrave -20 Nacute Amacron -20 Nacute '
+               'Aogonek -20 Nacute Aring -20 Nacute Atilde -20 Ncaron A -20 '
+               'Ncaron Aacute -20 Ncaron Abreve -20 Ncaron Acircumflex -20 '
+               'Ncaron Adieresis -20 Ncaron Agrave -20 Ncaron Amacron -20 '
+               'Ncaron Aogonek -20 Ncaron Aring -20 Ncaron Atilde -20 '
+               'Ncommaaccent A -20 Ncommaaccent Aacute -20 Ncommaaccent '
+               'Abreve -20 Ncommaaccent Acircumflex -20 Ncommaaccent '
+               'Adieresis -20 Ncommaaccent Agrave -20 Ncommaaccent Amacron '
+               '-20 Ncommaaccent Aogonek -20 Ncommaaccent Aring -20 '
+               'Ncommaaccent Atilde -20 Ntilde A -20 Ntilde Aacute -20 Ntilde '
+               'Abreve -20 Ntilde Acircumflex -20 Ntilde Adieresis -20 Ntilde '
+               'Agrave -20 Ntilde Amacron -20 Ntilde Aogonek -20 Ntilde Aring '
+               '-20 Ntilde Atilde -20 O A -40 O Aacute -40 O Abreve -40 O '
+               'Acircumflex -40 O Adieresis -40 O Agrave -40 O Amacron -40 O '
+               'Aogonek -40 O Aring -40 O Atilde -40 O T -40 O Tcaron -40 O '
+               'Tcommaaccent -40 O V -50 O W -50 O X -40 O Y -50 O Yacute -50 '
+               'O Ydieresis -50 Oacute A -40 Oacute Aacute -40 Oacute Abreve '
+               '-40 Oacute Acircumflex -40 Oacute Adieresis -40 Oacute Agrave '
+               '-40 Oacute Amacron -40 Oacute Aogonek -40 Oacute Aring -40 '
+               'Oacute Atilde -40 Oacute T -40 Oacute Tcaron -40 Oacute '
+               'Tcommaaccent -40 Oacute V -50 Oacute W -50 Oacute X -40 '
+               'Oacute Y -50 Oacute Yacute -50 Oacute Ydieresis -50 '
+               'Ocircumflex A -40 Ocircumflex Aacute -40 Ocircumflex Abreve '
+               '-40 Ocircumflex Acircumflex -40 Ocircumflex Adieresis -40 '
+               'Ocircumflex Agrave -40 Ocircumflex Amacron -40 Ocircumflex '
+               'Aogonek -40 Ocircumflex Aring -40 Ocircumflex Atilde -40 '
+               'Ocircumflex T -40 Ocircumflex Tcaron -40 Ocircumflex '
+               'Tcommaaccent -40 Ocircumflex V -50 Ocircumflex W -50 '
+               'Ocircumflex X -40 Ocircumflex Y -50 Ocircumflex Yacute -50 '
+               'Ocircumflex Ydieresis -50 Odieresis A -40 Odieresis Aacute '
+               '-40 Odieresis Abreve -40 Odieresis Acircumflex -40 Odieresis '
+               'Adieresis -40 Odieresis Agrave -40 Odieresis Amacron -40 '
+               'Odieresis Aogonek -40 Odieresis Aring -40 Odieresis Atilde '
+               '-40 Odieresis T -40 Odieresis Tcaron -40 Odieresis '
+               'Tcommaaccent -40 Odieresis V -50 Odieresis W -50 Odieresis X '
+               '-40 Odieresis Y -50 Odieresis Yacute -50 Odieresis Ydieresis '
+               '-50 Ograve A -40 Ograve Aacute -40 Ograve Abreve -40 Ograve '
+               'Acircumflex -40 Ograve Adieresis -40 Ograve Agrave -40 Ograve '
+               'Amacron -40 Ograve Aogonek -40 Ograve Aring -40 Ograve Atilde '
+               '-40 Ograve T -40 Ograve Tcaron -40 Ograve Tcommaaccent -40 '
+               'Ograve V -50 Ograve W -50 Ograve X -40 Ograve Y -50 Ograve '
+               'Yacute -50 Ograve Ydieresis -50 Ohungarumlaut A -40 '
+               'Ohungarumlaut Aacute -40 Ohungarumlaut Abreve -40 '
+               'Ohungarumlaut Acircumflex -40 Ohungarumlaut Adieresis -40 '
+               'Ohungarumlaut Agrave -40 Ohungarumlaut Amacron -40 '
+               'Ohungarumlaut Aogonek -40 Ohungarumlaut Aring -40 '
+               'Ohungarumlaut Atilde -40 Ohungarumlaut T -40 Ohungarumlaut '
+               'Tcaron -40 Ohungarumlaut Tcommaaccent -40 Ohungarumlaut V -50 '
+               'Ohungarumlaut W -50 Ohungarumlaut X -40 Ohungarumlaut Y -50 '
+               'Ohungarumlaut Yacute -50 Ohungarumlaut Ydieresis -50 Omacron '
+               'A -40 Omacron Aacute -40 Omacron Abreve -40 Omacron '
+               'Acircumflex -40 Omacron Adieresis -40 Omacron Agrave -40 '
+               'Omacron Amacron -40 Omacron Aogonek -40 Omacron Aring -40 '
+               'Omacron Atilde -40 Omacron T -40 Omacron Tcaron -40 Omacron '
+               'Tcommaaccent -40 Omacron V -50 Omacron W -50 Omacron X -40 '
+               'Omacron Y -50 Omacron Yacute -50 Omacron Ydieresis -50 Oslash '
+               'A -40 Oslash Aacute -40 Oslash Abreve -40 Oslash Acircumflex '
+               '-40 Oslash Adieresis -40 Oslash Agrave -40 Oslash Amacron -40 '
+               'Oslash Aogonek -40 Oslash Aring -40 Oslash Atilde -40 Oslash '
+               'T -40 Oslash Tcaron -40 Oslash Tcommaaccent -40 Oslash V -50 '
+               'Oslash W -50 Oslash X -40 Oslash Y -50 Oslash Yacute -50 '
+               'Oslash Ydieresis -50 Otilde A -40 Otilde Aacute -40 Otilde '
+               'Abreve -40 Otilde Acircumflex -40 Otilde Adieresis -40 Otilde '
+               'Agrave -40 Otilde Amacron -40 Otilde Aogonek -40 Otilde Aring '
+               '-40 Otilde Atilde -40 Otilde T -40 Otilde Tcaron -40 Otilde '
+               'Tcommaaccent -40 Otilde V -50 Otilde W -50 Otilde X -40 '
+               'Otilde Y -50 Otilde Yacute -50 Otilde Ydieresis -50 P A -74 P '
+               'Aacute -74 P Abreve -74 P Acircumflex -74 P Adieresis -74 P '
+               'Agrave -74 P Amacron -74 P Aogonek -74 P Aring -74 P Atilde '
+               '-74 P a -10 P aacute -10 P abreve -10 P acircumflex -10 P '
+               'adieresis -10 P agrave -10 P amacron -10 P aogonek -10 P '
+               'aring -10 P atilde -10 P comma -92 P e -20 P eacute -20 P '
+               'ecaron -20 P ecircumflex -20 P edieresis -20 P edotaccent -20 '
+               'P egrave -20 P emacron -20 P eogonek -20 P o -20 P oacute -20 '
+               'P ocircumflex -20 P odieresis -20 P ograve -20 P '
+               'ohungarumlaut -20 P omacron -20 P oslash -20 P otilde -20 P '
+               'period -110 Q U -10 Q Uacute -10 Q Ucircumflex -10 Q '
+               'Udieresis -10 Q Ugrave -10 Q Uhungarumlaut -10 Q Umacron -10 '
+               'Q Uogonek -10 Q Uring -10 Q period -20 R O -30 R Oacute -30 R '
+               'Ocircumflex -30 R Odieresis -30 R Ograve -30 R Ohungarumlaut '
+               '-30 R Omacron -30 R Oslash -30 R Otilde -30 R T -40 R Tcaron '
+               '-40 R Tcommaaccent -40 R U -30 R Uacute -30 R Ucircumflex -30 '
+               'R Udieresis -30 R Ugrave -30 R Uhungarumlaut -30 R Umacron '
+               '-30 R Uogonek -30 R Uring -30 R V -55 R W -35 R Y -35 R '
+               'Yacute -35 R Ydieresis -35 Racute O -30 Racute Oacute -30 '
+               'Racute Ocircumflex -30 Racute Odieresis -30 Racute Ograve -30 '
+               'Racute Ohungarumlaut -30 Racute Omacron -30 Racute Oslash -30 '
+               'Racute Otilde -30 Racute T -40 Racute Tcaron -40 Racute '
+               'Tcommaaccent -40 Racute U -30 Racute Uacute -30 Racute '
+               'Ucircumflex -30 Racute Udieresis -30 Racute Ugrave -30 Racute '
+               'Uhungarumlaut -30 Racute Umacron -30 Racute Uogonek -30 '
+               'Racute Uring -30 Racute V -55 Racute W -35 Racute Y -35 '
+               'Racute Yacute -35 Racute Ydieresis -35 Rcaron O -30 Rcaron '
+               'Oacute -30 Rcaron Ocircumflex -30 Rcaron Odieresis -30 Rcaron '
+               'Ograve -30 Rcaron Ohungarumlaut -30 Rcaron Omacron -30 Rcaron '
+               'Oslash -30 Rcaron Otilde -30 Rcaron T -40 Rcaron Tcaron -40 '
+               'Rcaron Tcommaaccent -40 Rcaron U -30 Rcaron Uacute -30 Rcaron '
+               'Ucircumflex -30 Rcaron Udieresis -30 Rcaron Ugrave -30 Rcaron '
+               'Uhungarumlaut -30 Rcaron Umacron -30 Rcaron Uogonek -30 '
+               'Rcaron Uring -30 Rcaron V -55 Rcaron W -35 Rcaron Y -35 '
+               'Rcaron Yacute -35 Rcaron Ydieresis -35 Rcommaaccent O -30 '
+               'Rcommaaccent Oacute -30 Rcommaaccent Ocircumflex -30 '
+               'Rcommaaccent Odieresis -30 Rcommaaccent Ograve -30 '
+               'Rcommaaccent Ohungarumlaut -30 Rcommaaccent Omacron -30 '
+               'Rcommaaccent Oslash -30 Rcommaaccent Otilde -30 Rcommaaccent '
+               'T -40 Rcommaaccent Tcaron -40 Rcommaaccent Tcommaaccent -40 '
+               'Rcommaaccent U -30 Rcommaaccent Uacute -30 Rcommaaccent '
+               'Ucircumflex -30 Rcommaaccent Udieresis -30 Rcommaaccent '
+               'Ugrave -30 Rcommaaccent Uhungarumlaut -30 Rcommaaccent '
+               'Umacron -30 Rcommaaccent Uogonek -30 Rcommaaccent Uring -30 '
+               'Rcommaaccent V -55 Rcommaaccent W -35 Rcommaaccent Y -35 '
+               'Rcommaaccent Yacute -35 Rcommaaccent Ydieresis -35 T A -90 T '
+               'Aacute -90 T Abreve -90 T Acircumflex -90 T Adieresis -90 T '
+               'Agrave -90 T Amacron -90 T Aogonek -90 T Aring -90 T Atilde '
+               '-90 T O -18 T Oacute -18 T Ocircumflex -18 T Odieresis -18 T '
+               'Ograve -18 T Ohungarumlaut -18 T Omacron -18 T Oslash -18 T '
+               'Otilde -18 T a -92 T aacute -92 T abreve -52 T acircumflex '
+               '-52 T adieresis -52 T agrave -52 T amacron -52 T aogonek -92 '
+               'T aring -92 T atilde -52 T colon -74 T comma -74 T e -92 T '
+               'eacute -92 T ecaron -92 T ecircumflex -92 T edieresis -52 T '
+               'edotaccent -92 T egrave -52 T emacron -52 T eogonek -92 T '
+               'hyphen -92 T i -18 T iacute -18 T iogonek -18 T o -92 T '
+               'oacute -92 T ocircumflex -92 T odieresis -92 T ograve -92 T '
+               'ohungarumlaut -92 T omacron -92 T oslash -92 T otilde -92 T '
+               'period -90 T r -74 T racute -74 T rcaron -74 T rcommaaccent '
+               '-74 T semicolon -74 T u -92 T uacute -92 T ucircumflex -92 T '
+               'udieresis -92 T ugrave -92 T uhungarumlaut -92 T umacron -92 '
+               'T uogonek -92 T uring -92 T w -74 T y -34 T yacute -34 T '
+               'ydieresis -34 Tcaron A -90 Tcaron Aacute -90 Tcaron Abreve '
+               '-90 Tcaron Acircumflex -90 Tcaron Adieresis -90 Tcaron Agrave '
+               '-90 Tcaron Amacron -90 Tcaron Aogonek -90 Tcaron Aring -90 '
+               'Tcaron Atilde -90 Tcaron O -18 Tcaron Oacute -18 Tcaron '
+               'Ocircumflex -18 Tcaron Odieresis -18 Tcaron Ograve -18 Tcaron '
+               'Ohungarumlaut -18 Tcaron Omacron -18 Tcaron Oslash -18 Tcaron '
+               'Otilde -18 Tcaron a -92 Tcaron aacute -92 Tcaron abreve -52 '
+               'Tcaron acircumflex -52 Tcaron adieresis -52 Tcaron agrave -52 '
+               'Tcaron amacron -52 Tcaron aogonek -92 Tcaron aring -92 Tcaron '
+               'atilde -52 Tcaron colon -74 Tcaron comma -74 Tcaron e -92 '
+               'Tcaron eacute -92 Tcaron ecaron -92 Tcaron ecircumflex -92 '
+               'Tcaron edieresis -52 Tcaron edotaccent -92 Tcaron egrave -52 '
+               'Tcaron emacron -52 Tcaron eogonek -92 Tcaron hyphen -92 '
+               'Tcaron i -18 Tcaron iacute -18 Tcaron iogonek -18 Tcaron o '
+               '-92 Tcaron oacute -92 Tcaron ocircumflex -92 Tcaron odieresis '
+               '-92 Tcaron ograve -92 Tcaron ohungarumlaut -92 Tcaron omacron '
+               '-92 Tcaron oslash -92 Tcaron otilde -92 Tcaron period -90 '
+               'Tcaron r -74 Tcaron racute -74 Tcaron rcaron -74 Tcaron '
+               'rcommaaccent -74 Tcaron semicolon -74 Tcaron u -92 Tcaron '
+               'uacute -92 Tcaron ucircumflex -92 Tcaron udieresis -92 Tcaron '
+               'ugrave -92 Tcaron uhungarumlaut -92 Tcaron umacron -92 Tcaron '
+               'uogonek -92 Tcaron uring -92 Tcaron w -74 Tcaron y -34 Tcaron '
+               'yacute -34 Tcaron ydieresis -34 Tcommaaccent A -90 '
+               'Tcommaaccent Aacute -90 Tcommaaccent Abreve -90 Tcommaaccent '
+               'Acircumflex -90 Tcommaaccent Adieresis -90 Tcommaaccent '
+               'Agrave -90 Tcommaaccent Amacron -90 Tcommaaccent Aogonek -90 '
+               'Tcommaaccent Aring -90 Tcommaaccent Atilde -90 Tcommaaccent O '
+               '-18 Tcommaaccent Oacute -18 Tcommaaccent Ocircumflex -18 '
+               'Tcommaaccent Odieresis -18 Tcommaaccent Ograve -18 '
+               'Tcommaaccent Ohungarumlaut -18 Tcommaaccent Omacron -18 '
+               'Tcommaaccent Oslash -18 Tcommaaccent Otilde -18 Tcommaaccent '
+               'a -92 Tcommaaccent aacute -92 Tcommaaccent abreve -52 '
+               'Tcommaaccent acircumflex -52 Tcommaaccent adieresis -52 '
+               'Tcommaaccent agrave -52 Tcommaaccent amacron -52 Tcommaaccent '
+               'aogonek -92 Tcommaaccent aring -92 Tcommaaccent atilde -52 '
+               'Tcommaaccent colon -74 Tcommaaccent comma -74 Tcommaaccent e '
+               '-92 Tcommaaccent eacute -92 Tcommaaccent ecaron -92 '
+               'Tcommaaccent ecircumflex -92 Tcommaaccent edieresis -52 '
+               'Tcommaaccent edotaccent -92 Tcommaaccent egrave -52 '
+               'Tcommaaccent emacron -52 Tcommaaccent eogonek -92 '
+               'Tcommaaccent hyphen -92 Tcommaaccent i -18 Tcommaaccent '
+               'iacute -18 Tcommaaccent iogonek -18 Tcommaaccent o -92 '
+               'Tcommaaccent oacute -92 Tcommaaccent ocircumflex -92 '
+               'Tcommaaccent odieresis -92 Tcommaaccent ograve -92 '
+               'Tcommaaccent ohungarumlaut -92 Tcommaaccent omacron -92 '
+               'Tcommaaccent oslash -92 Tcommaaccent otilde -92 Tcommaaccent '
+               'period -90 Tcommaaccent r -74 Tcommaaccent racute -74 '
+               'Tcommaaccent rcaron -74 Tcommaaccent rcommaaccent -74 '
+               'Tcommaaccent semicolon -74 Tcommaaccent u -92 Tcommaaccent '
+               'uacute -92 Tcommaaccent ucircumflex -92 Tcommaaccent '
+               'udieresis -92 Tcommaaccent ugrave -92 Tcommaaccent '
+               'uhungarumlaut -92 Tcommaaccent umacron -92 Tcommaaccent '
+               'uogonek -92 Tcommaaccent uring -92 Tcommaaccent w -74 '
+               'Tcommaaccent y -34 Tcommaaccent yacute -34 Tcommaaccent '
+               'ydieresis -34 U A -60 U Aacute -60 U Abreve -60 U Acircumflex '
+               '-60 U Adieresis -60 U Agrave -60 U Amacron -60 U Aogonek -60 '
+               'U Aring -60 U Atilde -60 U comma -50 U period -50 Uacute A '
+               '-60 Uacute Aacute -60 Uacute Abreve -60 Uacute Acircumflex '
+               '-60 Uacute Adieresis -60 Uacute Agrave -60 Uacute Amacron -60 '
+               'Uacute Aogonek -60 Uacute Aring -60 Uacute Atilde -60 Uacute '
+               'comma -50 Uacute period -50 Ucircumflex A -60 Ucircumflex '
+               'Aacute -60 Ucircumflex Abreve -60 Ucircumflex Acircumflex -60 '
+               'Ucircumflex Adieresis -60 Ucircumflex Agrave -60 Ucircumflex '
+               'Amacron -60 Ucircumflex Aogonek -60 Ucircumflex Aring -60 '
+               'Ucircumflex Atilde -60 Ucircumflex comma -50 Ucircumflex '
+               'period -50 Udieresis A -60 Udieresis Aacute -60 Udieresis '
+               'Abreve -60 Udieresis Acircumflex -60 Udieresis Adieresis -60 '
+               'Udieresis Agrave -60 Udieresis Amacron -60 Udieresis Aogonek '
+               '-60 Udieresis Aring -60 Udieresis Atilde -60 Udieresis comma '
+               '-50 Udieresis period -50 Ugrave A -60 Ugrave Aacute -60 '
+               'Ugrave Abreve -60 Ugrave Acircumflex -60 Ugrave Adieresis -60 '
+               'Ugrave Agrave -60 Ugrave Amacron -60 Ugrave Aogonek -60 '
+               'Ugrave Aring -60 Ugrave Atilde -60 Ugrave comma -50 Ugrave '
+               'period -50 Uhungarumlaut A -60 Uhungarumlaut Aacute -60 '
+               'Uhungarumlaut Abreve -60 Uhungarumlaut Acircumflex -60 '
+               'Uhungarumlaut Adieresis -60 Uhungarumlaut Agrave -60 '
+               'Uhungarumlaut Amacron -60 Uhungarumlaut Aogonek -60 '
+               'Uhungarumlaut Aring -60 Uhungarumlaut Atilde -60 '
+               'Uhungarumlaut comma -50 Uhungarumlaut period -50 Umacron A '
+               '-60 Umacron Aacute -60 Umacron Abreve -60 Umacron Acircumflex '
+               '-60 Umacron Adieresis -60 Umacron Agrave -60 Umacron Amacron '
+               '-60 Umacron Aogonek -60 Umacron Aring -60 Umacron Atilde -60 '
+               'Umacron comma -50 Umacron period -50 Uogonek A -60 Uogonek '
+               'Aacute -60 Uogonek Abreve -60 Uogonek Acircumflex -60 Uogonek '
+               'Adieresis -60 Uogonek Agrave -60 Uogonek Amacron -60 Uogonek '
+               'Aogonek -60 Uogonek Aring -60 Uogonek Atilde -60 Uogonek '
+               'comma -50 Uogonek period -50 Uring A -60 Uring Aacute -60 '
+               'Uring Abreve -60 Uring Acircumflex -60 Uring Adieresis -60 '
+               'Uring Agrave -60 Uring Amacron -60 Uring Aogonek -60 Uring '
+               'Aring -60 Uring Atilde -60 Uring comma -50 Uring period -50 V '
+               'A -135 V Aacute -135 V Abreve -135 V Acircumflex -135 V '
+               'Adieresis -135 V Agrave -135 V Amacron -135 V Aogonek -135 V '
+               'Aring -135 V Atilde -135 V G -30 V Gbreve -30 V Gcommaaccent '
+               '-30 V O -45 V Oacute -45 V Ocircumflex -45 V Odieresis -45 V '
+               'Ograve -45 V Ohungarumlaut -45 V Omacron -45 V Oslash -45 V '
+               'Otilde -45 V a -92 V aacute -92 V abreve -92 V acircumflex '
+               '-92 V adieresis -92 V agrave -92 V amacron -92 V aogonek -92 '
+               'V aring -92 V atilde -92 V colon -92 V comma -129 V e -100 V '
+               'eacute -100 V ecaron -100 V ecircumflex -100 V edieresis -100 '
+               'V edotaccent -100 V egrave -100 V emacron -100 V eogonek -100 '
+               'V hyphen -74 V i -37 V iacute -37 V icircumflex -37 V '
+               'idieresis -37 V igrave -37 V imacron -37 V iogonek -37 V o '
+               '-100 V oacute -100 V ocircumflex -100 V odieresis -100 V '
+               'ograve -100 V ohungarumlaut -100 V omacron -100 V oslash -100 '
+               'V otilde -100 V period -145 V semicolon -92 V u -92 V uacute '
+               '-92 V ucircumflex -92 V udieresis -92 V ugrave -92 V '
+               'uhungarumlaut -92 V umacron -92 V uogonek -92 V uring -92 W A '
+               '-120 W Aacute -120 W Abreve -120 W Acircumflex -120 W '
+               'Adieresis -120 W Agrave -120 W Amacron -120 W Aogonek -120 W '
+               'Aring -120 W Atilde -120 W O -10 W Oacute -10 W Ocircumflex '
+               '-10 W Odieresis -10 W Ograve -10 W Ohungarumlaut -10 W '
+               'Omacron -10 W Oslash -10 W Otilde -10 W a -65 W aacute -65 W '
+               'abreve -65 W acircumflex -65 W adieresis -65 W agrave -65 W '
+               'amacron -65 W aogonek -65 W aring -65 W atilde -65 W colon '
+               '-55 W comma -92 W e -65 W eacute -65 W ecaron -65 W '
+               'ecircumflex -65 W edieresis -65 W edotaccent -65 W egrave -65 '
+               'W emacron -65 W eogonek -65 W hyphen -37 W i -18 W iacute -18 '
+               'W iogonek -18 W o -75 W oacute -75 W ocircumflex -75 W '
+               'odieresis -75 W ograve -75 W ohungarumlaut -75 W omacron -75 '
+               'W oslash -75 W otilde -75 W period -92 W semicolon -55 W u '
+               '-50 W uacute -50 W ucircumflex -50 W udieresis -50 W ugrave '
+               '-50 W uhungarumlaut -50 W umacron -50 W uogonek -50 W uring '
+               '-50 W y -60 W yacute -60 W ydieresis -60 Y A -110 Y Aacute '
+               '-110 Y Abreve -110 Y Acircumflex -110 Y Adieresis -110 Y '
+               'Agrave -110 Y Amacron -110 Y Aogonek -110 Y Aring -110 Y '
+               'Atilde -110 Y O -35 Y Oacute -35 Y Ocircumflex -35 Y '
+               'Odieresis -35 Y Ograve -35 Y Ohungarumlaut -35 Y Omacron -35 '
+               'Y Oslash -35 Y Otilde -35 Y a -85 Y aacute -85 Y abreve -85 Y '
+               'acircumflex -85 Y adieresis -85 Y agrave -85 Y amacron -85 Y '
+               'aogonek -85 Y aring -85 Y atilde -85 Y colon -92 Y comma -92 '
+               'Y e -111 Y eacute -111 Y ecaron -111 Y ecircumflex -111 Y '
+               'edieresis -71 Y edotaccent -111 Y egrave -71 Y emacron -71 Y '
+               'eogonek -111 Y hyphen -92 Y i -37 Y iacute -37 Y iogonek -37 '
+               'Y o -111 Y oacute -111 Y ocircumflex -111 Y odieresis -111 Y '
+               'ograve -111 Y ohungarumlaut -111 Y omacron -111 Y oslash -111 '
+               'Y otilde -111 Y period -92 Y semicolon -92 Y u -92 Y uacute '
+               '-92 Y ucircumflex -92 Y udieresis -92 Y ugrave -92 Y '
+               'uhungarumlaut -92 Y umacron -92 Y uogonek -92 Y uring -92 '
+               'Yacute A -110 Yacute Aacute -110 Yacute Abreve -110 Yacute '
+               'Acircumflex -110 Yacute Adieresis -110 Yacute Agrave -110 '
+               'Yacute Amacron -110 Yacute Aogonek -110 Yacute Aring -110 '
+               'Yacute Atilde -110 Yacute O -35 Yacute Oacute -35 Yacute '
+               'Ocircumflex -35 Yacute Odieresis -35 Yacute Ograve -35 Yacute '
+               'Ohungarumlaut -35 Yacute Omacron -35 Yacute Oslash -35 Yacute '
+               'Otilde -35 Yacute a -85 Yacute aacute -85 Yacute abreve -85 '
+               'Yacute acircumflex -85 Yacute adieresis -85 Yacute agrave -85 '
+               'Yacute amacron -85 Yacute aogonek -85 Yacute aring -85 Yacute '
+               'atilde -85 Yacute colon -92 Yacute comma -92 Yacute e -111 '
+               'Yacute eacute -111 Yacute ecaron -111 Yacute ecircumflex -111 '
+               'Yacute edieresis -71 Yacute edotaccent -111 Yacute egrave -71 '
+               'Yacute emacron -71 Yacute eogonek -111 Yacute hyphen -92 '
+               'Yacute i -37 Yacute iacute -37 Yacute iogonek -37 Yacute o '
+               '-111 Yacute oacute -111 Yacute ocircumflex -111 Yacute '
+               'odieresis -111 Yacute ograve -111 Yacute ohungarumlaut -111 '
+               'Yacute omacron -111 Yacute oslash -111 Yacute otilde -111 '
+               'Yacute period -92 Yacute semicolon -92 Yacute u -92 Yacute '
+               'uacute -92 Yacute ucircumflex -92 Yacute udieresis -92 Yacute '
+               'ugrave -92 Yacute uhungarumlaut -92 Yacute umacron -92 Yacute '
+               'uogonek -92 Yacute uring -92 Ydieresis A -110 Ydieresis '
+               'Aacute -110 Ydieresis Abreve -110 Ydieresis Acircumflex -110 '
+               'Ydieresis Adieresis -110 Ydieresis Agrave -110 Ydieresis '
+               'Amacron -110 Ydieresis Aogonek -110 Ydieresis Aring -110 '
+               'Ydieresis Atilde -110 Ydieresis O -35 Ydieresis Oacute -35 '
+               'Ydieresis Ocircumflex -35 Ydieresis Odieresis -35 Ydieresis '
+               'Ograve -35 Ydieresis Ohungarumlaut -35 Ydieresis Omacron -35 '
+               'Ydieresis Oslash -35 Ydieresis Otilde -35 Ydieresis a -85 '
+               'Ydieresis aacute -85 Ydieresis abreve -85 Ydieresis '
+               'acircumflex -85 Ydieresis adieresis -85 Ydieresis agrave -85 '
+               'Ydieresis amacron -85 Ydieresis aogonek -85 Ydieresis aring '
+               '-85 Ydieresis atilde -85 Ydieresis colon -92 Ydieresis comma '
+               '-92 Ydieresis e -111 Ydieresis eacute -111 Ydieresis ecaron '
+               '-111 Ydieresis ecircumflex -111 Ydieresis edieresis -71 '
+               'Ydieresis edotaccent -111 Ydieresis egrave -71 Ydieresis '
+               'emacron -71 Ydieresis eogonek -111 Ydieresis hyphen -92 '
+               'Ydieresis i -37 Ydieresis iacute -37 Ydieresis iogonek -37 '
+               'Ydieresis o -111 Ydieresis oacute -111 Ydieresis ocircumflex '
+               '-111 Ydieresis odieresis -111 Ydieresis ograve -111 Ydieresis '
+               'ohungarumlaut -111 Ydieresis omacron -111 Ydieresis oslash '
+               '-111 Ydieresis otilde -111 Ydieresis period -92 Ydieresis '
+               'semicolon -92 Ydieresis u -92 Ydieresis uacute -92 Ydieresis '
+               'ucircumflex -92 Ydieresis udieresis -92 Ydieresis ugrave -92 '
+               'Ydieresis uhungarumlaut -92 Ydieresis umacron -92 Ydieresis '
+               'uogonek -92 Ydieresis uring -92 a v -25 aacute v -25 abreve v '
+               '-25 acircumflex v -25 adieresis v -25 agrave v -25 amacron v '
+               '-25 aogonek v -25 aring v -25 atilde v -25 b b -10 b period '
+               '-40 b u -20 b uacute -20 b ucircumflex -20 b udieresis -20 b '
+               'ugrave -20 b uhungarumlaut -20 b umacron -20 b uogonek -20 b '
+               'uring -20 b v -15 comma quotedblright -45 comma quoteright '
+               '-55 d w -15 dcroat w -15 e v -15 eacute v -15 ecaron v -15 '
+               'ecircumflex v -15 edieresis v -15 edotaccent v -15 egrave v '
+               '-15 emacron v -15 eogonek v -15 f comma -15 f dotlessi -35 f '
+               'i -25 f o -25 f oacute -25 f ocircumflex -25 f odieresis -25 '
+               'f ograve -25 f ohungarumlaut -25 f omacron -25 f oslash -25 f '
+               'otilde -25 f period -15 f quotedblright 50 f quoteright 55 g '
+               'period -15 gbreve period -15 gcommaaccent period -15 h y -15 '
+               'h yacute -15 h ydieresis -15 i v -10 iacute v -10 icircumflex '
+               'v -10 idieresis v -10 igrave v -10 imacron v -10 iogonek v '
+               '-10 k e -10 k eacute -10 k ecaron -10 k ecircumflex -10 k '
+               'edieresis -10 k edotaccent -10 k egrave -10 k emacron -10 k '
+               'eogonek -10 k o -15 k oacute -15 k ocircumflex -15 k '
+               'odieresis -15 k ograve -15 k ohungarumlaut -15 k omacron -15 '
+               'k oslash -15 k otilde -15 k y -15 k yacute -15 k ydieresis '
+               '-15 kcommaaccent e -10 kcommaaccent eacute -10 kcommaaccent '
+               'ecaron -10 kcommaaccent ecircumflex -10 kcommaaccent '
+               'edieresis -10 kcommaaccent edotaccent -10 kcommaaccent egrave '
+               '-10 kcommaaccent emacron -10 kcommaaccent eogonek -10 '
+               'kcommaaccent o -15 kcommaaccent oacute -15 kcommaaccent '
+               'ocircumflex -15 kcommaaccent odieresis -15 kcommaaccent '
+               'ograve -15 kcommaaccent ohungarumlaut -15 kcommaaccent '
+               'omacron -15 kcommaaccent oslash -15 kcommaaccent otilde -15 '
+               'kcommaaccent y -15 kcommaaccent yacute -15 kcommaaccent '
+               'ydieresis -15 n v -40 nacute v -40 ncaron v -40 ncommaaccent '
+               'v -40 ntilde v -40 o v -10 o w -10 oacute v -10 oacute w -10 '
+               'ocircumflex v -10 ocircumflex w -10 odieresis v -10 odieresis '
+               'w -10 ograve v -10 ograve w -10 ohungarumlaut v -10 '
+               'ohungarumlaut w -10 omacron v -10 omacron w -10 oslash v -10 '
+               'oslash w -10 otilde v -10 otilde w -10 period quotedblright '
+               '-55 period quoteright -55 quotedblleft A -10 quotedblleft '
+               'Aacute -10 quotedblleft Abreve -10 quotedblleft Acircumflex '
+               '-10 quotedblleft Adieresis -10 quotedblleft Agrave -10 '
+               'quotedblleft Amacron -10 quotedblleft Aogonek -10 '
+               'quotedblleft Aring -10 quotedblleft Atilde -10 quoteleft A '
+               '-10 quoteleft Aacute -10 quoteleft Abreve -10 quoteleft '
+               'Acircumflex -10 quoteleft Adieresis -10 quoteleft Agrave -10 '
+               'quoteleft Amacron -10 quoteleft Aogonek -10 quoteleft Aring '
+               '-10 quoteleft Atilde -10 quoteleft quoteleft -63 quoteright d '
+               '-20 quoteright dcroat -20 quoteright quoteright -63 '
+               'quoteright r -20 quoteright racute -20 quoteright rcaron -20 '
+               'quoteright rcommaaccent -20 quoteright s -37 quoteright '
+               'sacute -37 quoteright scaron -37 quoteright scedilla -37 '
+               'quoteright scommaaccent -37 quoteright space -74 quoteright v '
+               '-20 r c -18 r cacute -18 r ccaron -18 r ccedilla -18 r comma '
+               '-92 r e -18 r eacute -18 r ecaron -18 r ecircumflex -18 r '
+               'edieresis -18 r edotaccent -18 r egrave -18 r emacron -18 r '
+               'eogonek -18 r g -10 r gbreve -10 r gcommaaccent -10 r hyphen '
+               '-37 r n -15 r nacute -15 r ncaron -15 r ncommaaccent -15 r '
+               'ntilde -15 r o -18 r oacute -18 r ocircumflex -18 r odieresis '
+               '-18 r ograve -18 r ohungarumlaut -18 r omacron -18 r oslash '
+               '-18 r otilde -18 r p -10 r period -100 r q -18 r v -10 racute '
+               'c -18 racute cacute -18 racute ccaron -18 racute ccedilla -18 '
+               'racute comma -92 racute e -18 racute eacute -18 racute ecaron '
+               '-18 racute ecircumflex -18 racute edieresis -18 racute '
+               'edotaccent -18 racute egrave -18 racute emacron -18 racute '
+               'eogonek -18 racute g -10 racute gbreve -10 racute '
+               'gcommaaccent -10 racute hyphen -37 racute n -15 racute nacute '
+               '-15 racute ncaron -15 racute ncommaaccent -15 racute ntilde '
+               '-15 racute o -18 racute oacute -18 racute ocircumflex -18 '
+               'racute odieresis -18 racute ograve -18 racute ohungarumlaut '
+               '-18 racute omacron -18 racute oslash -18 racute otilde -18 '
+               'racute p -10 racute period -100 racute q -18 racute v -10 '
+               'rcaron c -18 rcaron cacute -18 rcaron ccaron -18 rcaron '
+               'ccedilla -18 rcaron comma -92 rcaron e -18 rcaron eacute -18 '
+               'rcaron ecaron -18 rcaron ecircumflex -18 rcaron edieresis -18 '
+               'rcaron edotaccent -18 rcaron egrave -18 rcaron emacron -18 '
+               'rcaron eogonek -18 rcaron g -10 rcaron gbreve -10 rcaron '
+               'gcommaaccent -10 rcaron hyphen -37 rcaron n -15 rcaron nacute '
+               '-15 rcaron ncaron -15 rcaron ncommaaccent -15 rcaron ntilde '
+               '-15 rcaron o -18 rcaron oacute -18 rcaron ocircumflex -18 '
+               'rcaron odieresis -18 rcaron ograve -18 rcaron ohungarumlaut '
+               '-18 rcaron omacron -18 rcaron oslash -18 rcaron otilde -18 '
+               'rcaron p -10 rcaron period -100 rcaron q -18 rcaron v -10 '
+               'rcommaaccent c -18 rcommaaccent cacute -18 rcommaaccent '
+               'ccaron -18 rcommaaccent ccedilla -18 rcommaaccent comma -92 '
+               'rcommaaccent e -18 rcommaaccent eacute -18 rcommaaccent '
+               'ecaron -18 rcommaaccent ecircumflex -18 rcommaaccent '
+               'edieresis -18 rcommaaccent edotaccent -18 rcommaaccent egrave '
+               '-18 rcommaaccent emacron -18 rcommaaccent eogonek -18 '
+               'rcommaaccent g -10 rcommaaccent gbreve -10 rcommaaccent '
+               'gcommaaccent -10 rcommaaccent hyphen -37 rcommaaccent n -15 '
+               'rcommaaccent nacute -15 rcommaaccent ncaron -15 rcommaaccent '
+               'ncommaaccent -15 rcommaaccent ntilde -15 rcommaaccent o -18 '
+               'rcommaaccent oacute -18 rcommaaccent ocircumflex -18 '
+               'rcommaaccent odieresis -18 rcommaaccent ograve -18 '
+               'rcommaaccent ohungarumlaut -18 rcommaaccent omacron -18 '
+               'rcommaaccent oslash -18 rcommaaccent otilde -18 rcommaaccent '
+               'p -10 rcommaaccent period -100 rcommaaccent q -18 '
+               'rcommaaccent v -10 space A -55 space Aacute -55 space Abreve '
+               '-55 space Acircumflex -55 space Adieresis -55 space Agrave '
+               '-55 space Amacron -55 space Aogonek -55 space Aring -55 space '
+               'Atilde -55 space T -30 space Tcaron -30 space Tcommaaccent '
+               '-30 space V -45 space W -30 space Y -55 space Yacute -55 '
+               'space Ydieresis -55 v a -10 v aacute -10 v abreve -10 v '
+               'acircumflex -10 v adieresis -10 v agrave -10 v amacron -10 v '
+               'aogonek -10 v aring -10 v atilde -10 v comma -55 v e -10 v '
+               'eacute -10 v ecaron -10 v ecircumflex -10 v edieresis -10 v '
+               'edotaccent -10 v egrave -10 v emacron -10 v eogonek -10 v o '
+               '-10 v oacute -10 v ocircumflex -10 v odieresis -10 v ograve '
+               '-10 v ohungarumlaut -10 v omacron -10 v oslash -10 v otilde '
+               '-10 v period -70 w comma -55 w o -10 w oacute -10 w '
+               'ocircumflex -10 w odieresis -10 w ograve -10 w ohungarumlaut '
+               '-10 w omacron -10 w oslash -10 w otilde -10 w period -70 y '
+               'comma -55 y e -10 y eacute -10 y ecaron -10 y ecircumflex -10 '
+               'y edieresis -10 y edotaccent -10 y egrave -10 y emacron -10 y '
+               'eogonek -10 y o -25 y oacute -25 y ocircumflex -25 y '
+               'odieresis -25 y ograve -25 y ohungarumlaut -25 y omacron -25 '
+               'y oslash -25 y otilde -25 y period -70 yacute comma -55 '
+               'yacute e -10 yacute eacute -10 yacute ecaron -10 yacute '
+               'ecircumflex -10 yacute edieresis -10 yacute edotaccent -10 '
+               'yacute egrave -10 yacute emacron -10 yacute eogonek -10 '
+               'yacute o -25 yacute oacute -25 yacute ocircumflex -25 yacute '
+               'odieresis -25 yacute ograve -25 yacute ohungarumlaut -25 '
+               'yacute omacron -25 yacute oslash -25 yacute otilde -25 yacute '
+               'period -70 ydieresis comma -55 ydieresis e -10 ydieresis '
+               'eacute -10 ydieresis ecaron -10 ydieresis ecircumflex -10 '
+               'ydieresis edieresis -10 ydieresis edotaccent -10 ydieresis '
+               'egrave -10 ydieresis emacron -10 ydieresis eogonek -10 '
+               'ydieresis o -25 ydieresis oacute -25 ydieresis ocircumflex '
+               '-25 ydieresis odieresis -25 ydieresis ograve -25 ydieresis '
+               'ohungarumlaut -25 ydieresis omacron -25 ydieresis oslash -25 '
+               'ydieresis otilde -25 ydieresis period -70',
+ 'Times-BoldItalic': 'A C -65 A Cacute -65 A Ccaron -65 A Ccedilla -65 A G '
+                     '-60 A Gbreve -60 A Gcommaaccent -60 A O -50 A Oacute '
+                     '-50 A Ocircumflex -50 A Odieresis -50 A Ograve -50 A '
+                     'Ohungarumlaut -50 A Omacron -50 A Oslash -50 A Otilde '
+                     '-50 A Q -55 A T -55 A Tcaron -55 A Tcommaaccent -55 A U '
+                     '-50 A Uacute -50 A Ucircumflex -50 A Udieresis -50 A '
+                     'Ugrave -50 A Uhungarumlaut -50 A Umacron -50 A Uogonek '
+                     '-50 A Uring -50 A V -95 A W -100 A Y -70 A Yacute -70 A '
+                     'Ydieresis -70 A quoteright -74 A u -30 A uacute -30 A '
+                     'ucircumflex -30 A udieresis -30 A ugrave -30 A '
+                     'uhungarumlaut -30 A umacron -30 A uogonek -30 A uring '
+                     '-30 A v -74 A w -74 A y -74 A yacute -74 A ydieresis '
+                     '-74 Aacute C -65 Aacute Cacute -65 Aacute Ccaron -65 '
+                     'Aacute Ccedilla -65 Aacute G -60 Aacute Gbreve -60 '
+                     'Aacute Gcommaaccent -60 Aacute O -50 Aacute Oacute -50 '
+                     'Aacute Ocircumflex -50 Aacute Odieresis -50 Aacute '
+                     'Ograve -50 Aacute Ohungarumlaut -50 Aacute Omacron -50 '
+                     'Aacute Oslash -50 Aacute Otilde -50 Aacute Q -55 Aacute '
+                     'T -55 Aacute Tcaron -55 Aacute Tcommaaccent -55 Aacute '
+                     'U -50 Aacute Uacute -50 Aacute Ucircumflex -50 Aacute '
+                     'Udieresis -50 Aacute Ugrave -50 Aacute Uhungarumlaut '
+                     '-50 Aacute Umacron -50 Aacute Uogonek -50 Aacute Uring '
+                     '-50 Aacute V -95 Aacute W -100 Aacute Y -70 Aacute '
+                     'Yacute -70 Aacute Ydieresis -70 Aacute quoteright -74 '
+                     'Aacute u -30 Aacute uacute -30 Aacute ucircumflex -30 '
+                     'Aacute udieresis -30 Aacute ugrave -30 Aacute '
+                     'uhungarumlaut -30 Aacute umacron -30 Aacute uogonek -30 '
+                     'Aacute uring -30 Aacute v -74 Aacute w -74 Aacute y -74 '
+                     'Aacute yacute -74 Aacute ydieresis -74 Abreve C -65 '
+                     'Abreve Cacute -65 Abreve Ccaron -65 Abreve Ccedilla -65 '
+                     'Abreve G -60 Abreve Gbreve -60 Abreve Gcommaaccent -60 '
+                     'Abreve O -50 Abreve Oacute -50 Abreve Ocircumflex -50 '
+                     'Abreve Odieresis -50 Abreve Ograve -50 Abreve '
+                     'Ohungarumlaut -50 Abreve Omacron -50 Abreve Oslash -50 '
+                     'Abreve Otilde -50 Abreve Q -55 Abreve T -55 Abreve '
+                     'Tcaron -55 Abreve Tcommaaccent -55 Abreve U -50 Abreve '
+                     'Uacute -50 Abreve Ucircumflex -50 Abreve Udieresis -50 '
+                     'Abreve Ugrave -50 Abreve Uhungarumlaut -50 Abreve '
+                     'Umacron -50 Abreve Uogonek -50 Abreve Uring -50 Abreve '
+                     'V -95 Abreve W -100 Abreve Y -70 Abreve Yacute -70 '
+                     'Abreve Ydieresis -70 Abreve quoteright -74 Abreve u -30 '
+                     'Abreve uacute -30 Abreve ucircumflex -30 Abreve '
+                     'udieresis -30 Abreve ugrave -30 Abreve uhungarumlaut '
+                     '-30 Abreve umacron -30 Abreve uogonek -30 Abreve uring '
+                     '-30 Abreve v -74 Abreve w -74 Abreve y -74 Abreve '
+                     'yacute -74 Abreve ydieresis -74 Acircumflex C -65 '
+                     'Acircumflex Cacute -65 Acircumflex Ccaron -65 '
+                     'Acircumflex Ccedilla -65 Acircumflex G -60 Acircumflex '
+                     'Gbreve -60 Acircumflex Gcommaaccent -60 Acircumflex O '
+                     '-50 Acircumflex Oacute -50 Acircumflex Ocircumflex -50 '
+                     'Acircumflex Odieresis -50 Acircumflex Ograve -50 '
+                     'Acircumflex Ohungarumlaut -50 Acircumflex Omacron -50 '
+                     'Acircumflex Oslash -50 Acircumflex Otilde -50 '
+                     'Acircumflex Q -55 Acircumflex T -55 Acircumflex Tcaron '
+                     '-55 Acircumflex Tcommaaccent -55 Acircumflex U -50 '
+                     'Acircumflex Uacute -50 Acircumflex Ucircumflex -50 '
+                     'Acircumflex Udieresis -50 Acircumflex Ugrave -50 '
+                     'Acircumflex Uhungarumlaut -50 Acircumflex Umacron -50 '
+                     'Acircumflex Uogonek -50 Acircumflex Uring -50 '
+                     'Acircumflex V -95 Acircumflex W -100 Acircumflex Y -70 '
+                     'Acircumflex Yacute -70 Acircumflex Ydieresis -70 '
+                     'Acircumflex quoteright -74 Acircumflex u -30 '
+                     'Acircumflex uacute -30 Acircumflex ucircumflex -30 '
+                     'Acircumflex udieresis -30 Acircumflex ugrave -30 '
+                     'Acircumflex uhungarumlaut -30 Acircumflex umacron -30 '
+                     'Acircumflex uogonek -30 Acircumflex uring -30 '
+                     'Acircumflex v -74 Acircumflex w -74 Acircumflex y -74 '
+                     'Acircumflex yacute -74 Acircumflex ydieresis -74 '
+                     'Adieresis C -65 Adieresis Cacute -65 Adieresis Ccaron '
+                     '-65 Adieresis Ccedilla -65 Adieresis G -60 Adieresis '
+                     'Gbreve -60 Adieresis Gcommaaccent -60 Adieresis O -50 '
+                     'Adieresis Oacute -50 Adieresis Ocircumflex -50 '
+                     'Adieresis Odieresis -50 Adieresis Ograve -50 Adieresis '
+                     'Ohungarumlaut -50 Adieresis Omacron -50 Adieresis '
+                     'Oslash -50 Adieresis Otilde -50 Adieresis Q -55 '
+                     'Adieresis T -55 Adieresis Tcaron -55 Adieresis '
+                     'Tcommaaccent -55 Adieresis U -50 Adieresis Uacute -50 '
+                     'Adieresis Ucircumflex -50 Adieresis Udieresis -50 '
+                     'Adieresis Ugrave -50 Adieresis Uhungarumlaut -50 '
+                     'Adieresis Umacron -50 Adieresis Uogonek -50 Adieresis '
+                     'Uring -50 Adieresis V -95 Adieresis W -100 Adieresis Y '
+                     '-70 Adieresis Yacute -70 Adieresis Ydieresis -70 '
+                     'Adieresis quoteright -74 Adieresis u -30 Adieresis '
+                     'uacute -30 Adieresis ucircumflex -30 Adieresis '
+                     'udieresis -30 Adieresis ugrave -30 Adieresis '
+                     'uhungarumlaut -30 Adieresis umacron -30 Adieresis '
+                     'uogonek -30 Adieresis uring -30 Adieresis v -74 '
+                     'Adieresis w -74 Adieresis y -74 Adieresis yacute -74 '
+                     'Adieresis ydieresis -74 Agrave C -65 Agrave Cacute -65 '
+                     'Agrave Ccaron -65 Agrave Ccedilla -65 Agrave G -60 '
+                     'Agrave Gbreve -60 Agrave Gcommaaccent -60 Agrave O -50 '
+                     'Agrave Oacute -50 Agrave Ocircumflex -50 Agrave '
+                     'Odieresis -50 Agrave Ograve -50 Agrave Ohungarumlaut '
+                     '-50 Agrave Omacron -50 Agrave Oslash -50 Agrave Otilde '
+                     '-50 Agrave Q -55 Agrave T -55 Agrave Tcaron -55 Agrave '
+                     'Tcommaaccent -55 Agrave U -50 Agrave Uacute -50 Agrave '
+                     'Ucircumflex -50 Agrave Udieresis -50 Agrave Ugrave -50 '
+                     'Agrave Uhungarumlaut -50 Agrave Umacron -50 Agrave '
+                     'Uogonek -50 Agrave Uring -50 Agrave V -95 Agrave W -100 '
+                     'Agrave Y -70 Agrave Yacute -70 Agrave Ydieresis -70 '
+                     'Agrave quoteright -74 Agrave u -30 Agrave uacute -30 '
+                     'Agrave ucircumflex -30 Agrave udieresis -30 Agrave '
+                     'ugrave -30 Agrave uhungarumlaut -30 Agrave umacron -30 '
+                     'Agrave uogonek -30 Agrave uring -30 Agrave v -74 Agrave '
+                     'w -74 Agrave y -74 Agrave yacute -74 Agrave ydieresis '
+                     '-74 Amacron C -65 Amacron Cacute -65 Amacron Ccaron -65 '
+                     'Amacron Ccedilla -65 Amacron G -60 Amacron Gbreve -60 '
+                     'Amacron Gcommaaccent -60 Amacron O -50 Amacron Oacute '
+                     '-50 Amacron Ocircumflex -50 Amacron Odieresis -50 '
+                     'Amacron Ograve -50 Amacron Ohungarumlaut -50 Amacron '
+                     'Omacron -50 Amacron Oslash -50 Amacron Otilde -50 '
+                     'Amacron Q -55 Amacron T -55 Amacron Tcaron -55 Amacron '
+                     'Tcommaaccent -55 Amacron U -50 Amacron Uacute -50 '
+                     'Amacron Ucircumflex -50 Amacron Udieresis -50 Amacron '
+                     'Ugrave -50 Amacron Uhungarumlaut -50 Amacron Umacron '
+                     '-50 Amacron Uogonek -50 Amacron Uring -50 Amacron V -95 '
+                     'Amacron W -100 Amacron Y -70 Amacron Yacute -70 Amacron '
+                     'Ydieresis -70 Amacron quoteright -74 Amacron u -30 '
+                     'Amacron uacute -30 Amacron ucircumflex -30 Amacron '
+                     'udieresis -30 Amacron ugrave -30 Amacron uhungarumlaut '
+                     '-30 Amacron umacron -30 Amacron uogonek -30 Amacron '
+                     'uring -30 Amacron v -74 Amacron w -74 Amacron y -74 '
+                     'Amacron yacute -74 Amacron ydieresis -74 Aogonek C -65 '
+                     'Aogonek Cacute -65 Aogonek Ccaron -65 Aogonek Ccedilla '
+                     '-65 Aogonek G -60 Aogonek Gbreve -60 Aogonek '
+                     'Gcommaaccent -60 Aogonek O -50 Aogonek Oacute -50 '
+                     'Aogonek Ocircumflex -50 Aogonek Odieresis -50 Aogonek '
+                     'Ograve -50 Aogonek Ohungarumlaut -50 Aogonek Omacron '
+                     '-50 Aogonek Oslash -50 Aogonek Otilde -50 Aogonek Q -55 '
+                     'Aogonek T -55 Aogonek Tcaron -55 Aogonek Tcommaaccent '
+                     '-55 Aogonek U -50 Aogonek Uacute -50 Aogonek '
+                     'Ucircumflex -50 Aogonek Udieresis -50 Aogonek Ugrave '
+                     '-50 Aogonek Uhungarumlaut -50 Aogonek Umacron -50 '
+                     'Aogonek Uogonek -50 Aogonek Uring -50 Aogonek V -95 '
+                     'Aogonek W -100 Aogonek Y -70 Aogonek Yacute -70 Aogonek '
+                     'Ydieresis -70 Aogonek quoteright -74 Aogonek u -30 '
+                     'Aogonek uacute -30 Aogonek ucircumflex -30 Aogonek '
+                     'udieresis -30 Aogonek ugrave -30 Aogonek uhungarumlaut '
+                     '-30 Aogonek umacron -30 Aogonek uogonek -30 Aogonek '
+                     'uring -30 Aogonek v -74 Aogonek w -74 Aogonek y -34 '
+                     'Aogonek yacute -34 Aogonek ydieresis -34 Aring C -65 '
+                     'Aring Cacute -65 Aring Ccaron -65 Aring Ccedilla -65 '
+                     'Aring G -60 Aring Gbreve -60 Aring Gcommaaccent -60 '
+                     'Aring O -50 Aring Oacute -50 Aring Ocircumflex -50 '
+                     'Aring Odieresis -50 Aring Ograve -50 Aring '
+                     'Ohungarumlaut -50 Aring Omacron -50 Aring Oslash -50 '
+                     'Aring Otilde -50 Aring Q -55 Aring T -55 Aring Tcaron '
+                     '-55 Aring Tcommaaccent -55 Aring U -50 Aring Uacute -50 '
+                     'Aring Ucircumflex -50 Aring Udieresis -50 Aring Ugrave '
+                     '-50 Aring Uhungarumlaut -50 Aring Umacron -50 Aring '
+                     'Uogonek -50 Aring Uring -50 Aring V -95 Aring W -100 '
+                     'Aring Y -70 Aring Yacute -70 Aring Ydieresis -70 Aring '
+                     'quoteright -74 Aring u -30 Aring uacute -30 Aring '
+                     'ucircumflex -30 Aring udieresis -30 Aring ugrave -30 '
+                     'Aring uhungarumlaut -30 Aring umacron -30 Aring uogonek '
+                     '-30 Aring uring -30 Aring v -74 Aring w -74 Aring y -74 '
+                     'Aring yacute -74 Aring ydieresis -74 Atilde C -65 '
+                     'Atilde Cacute -65 Atilde Ccaron -65 Atilde Ccedilla -65 '
+                     'Atilde G -60 Atilde Gbreve -60 Atilde Gcommaaccent -60 '
+                     'Atilde O -50 Atilde Oacute -50 Atilde Ocircumflex -50 '
+                     'Atilde Odieresis -50 Atilde Ograve -50 Atilde '
+                     'Ohungarumlaut -50 Atilde Omacron -50 Atilde Oslash -50 '
+                     'Atilde Otilde -50 Atilde Q -55 Atilde T -55 Atilde '
+                     'Tcaron -55 Atilde Tcommaaccent -55 Atilde U -50 Atilde '
+                     'Uacute -50 Atilde Ucircumflex -50 Atilde Udieresis -50 '
+                     'Atilde Ugrave -50 Atilde Uhungarumlaut -50 Atilde '
+                     'Umacron -50 Atilde Uogonek -50 Atilde Uring -50 Atilde '
+                     'V -95 Atilde W -100 Atilde Y -70 Atilde Yacute -70 '
+                     'Atilde Ydieresis -70 Atilde quoteright -74 Atilde u -30 '
+                     'Atilde uacute -30 Atilde ucircumflex -30 Atilde '
+                     'udieresis -30 Atilde ugrave -30 Atilde uhungarumlaut '
+                     '-30 Atilde umacron -30 Atilde uogonek -30 Atilde uring '
+                     '-30 Atilde v -74 Atilde w -74 Atilde y -74 Atilde '
+                     'yacute -74 Atilde ydieresis -74 B A -25 B Aacute -25 B '
+                     'Abreve -25 B Acircumflex -25 B Adieresis -25 B Agrave '
+                     '-25 B Amacron -25 B Aogonek -25 B Aring -25 B Atilde '
+                     '-25 B U -10 B Uacute -10 B Ucircumflex -10 B Udieresis '
+                     '-10 B Ugrave -10 B Uhungarumlaut -10 B Umacron -10 B '
+                     'Uogonek -10 B Uring -10 D A -25 D Aacute -25 D Abreve '
+                     '-25 D Acircumflex -25 D Adieresis -25 D Agrave -25 D '
+                     'Amacron -25 D Aogonek -25 D Aring -25 D Atilde -25 D V '
+                     '-50 D W -40 D Y -50 D Yacute -50 D Ydieresis -50 Dcaron '
+                     'A -25 Dcaron Aacute -25 Dcaron Abreve -25 Dcaron '
+                     'Acircumflex -25 Dcaron Adieresis -25 Dcaron Agrave -25 '
+                     'Dcaron Amacron -25 Dcaron Aogonek -25 Dcaron Aring -25 '
+                     'Dcaron Atilde -25 Dcaron V -50 Dcaron W -40 Dcaron Y '
+                     '-50 Dcaron Yacute -50 Dcaron Ydieresis -50 Dcroat A -25 '
+                     'Dcroat Aacute -25 Dcroat Abreve -25 Dcroat Acircumflex '
+                     '-25 Dcroat Adieresis -25 Dcroat Agrave -25 Dcroat '
+                     'Amacron -25 Dcroat Aogonek -25 Dcroat Aring -25 Dcroat '
+                     'Atilde -25 Dcroat V -50 Dcroat W -40 Dcroat Y -50 '
+                     'Dcroat Yacute -50 Dcroat Ydieresis -50 F A -100 F '
+                     'Aacute -100 F Abreve -100 F Acircumflex -100 F '
+                     'Adieresis -100 F Agrave -100 F Amacron -100 F Aogonek '
+                     '-100 F Aring -100 F Atilde -100 F a -95 F aacute -95 F '
+                     'abreve -95 F acircumflex -95 F adieresis -95 F agrave '
+                     '-95 F amacron -95 F aogonek -95 F aring -95 F atilde '
+                     '-95 F comma -129 F e -100 F eacute -100 F ecaron -100 F '
+                     'ecircumflex -100 F edieresis -100 F edotaccent -100 F '
+                     'egrave -100 F emacron -100 F eogonek -100 F i -40 F '
+                     'iacute -40 F icircumflex -40 F idieresis -40 F igrave '
+                     '-40 F imacron -40 F iogonek -40 F o -70 F oacute -70 F '
+                     'ocircumflex -70 F odieresis -70 F ograve -70 F '
+                     'ohungarumlaut -70 F omacron -70 F oslash -70 F otilde '
+                     '-70 F period -129 F r -50 F racute -50 F rcaron -50 F '
+                     'rcommaaccent -50 J A -25 J Aacute -25 J Abreve -25 J '
+                     'Acircumflex -25 J Adieresis -25 J Agrave -25 J Amacron '
+                     '-25 J Aogonek -25 J Aring -25 J Atilde -25 J a -40 J '
+                     'aacute -40 J abreve -40 J acircumflex -40 J adieresis '
+                     '-40 J agrave -40 J amacron -40 J aogonek -40 J aring '
+                     '-40 J atilde -40 J comma -10 J e -40 J eacute -40 J '
+                     'ecaron -40 J ecircumflex -40 J edieresis -40 J '
+                     'edotaccent -40 J egrave -40 J emacron -40 J eogonek -40 '
+                     'J o -40 J oacute -40 J ocircumflex -40 J odieresis -40 '
+                     'J ograve -40 J ohungarumlaut -40 J omacron -40 J oslash '
+                     '-40 J otilde -40 J period -10 J u -40 J uacute -40 J '
+                     'ucircumflex -40 J udieresis -40 J ugrave -40 J '
+                     'uhungarumlaut -40 J umacron -40 J uogonek -40 J uring '
+                     '-40 K O -30 K Oacute -30 K Ocircumflex -30 K Odieresis '
+                     '-30 K Ograve -30 K Ohungarumlaut -30 K Omacron -30 K '
+                     'Oslash -30 K Otilde -30 K e -25 K eacute -25 K ecaron '
+                     '-25 K ecircumflex -25 K edieresis -25 K edotaccent -25 '
+                     'K egrave -25 K emacron -25 K eogonek -25 K o -25 K '
+                     'oacute -25 K ocircumflex -25 K odieresis -25 K ograve '
+                     '-25 K ohungarumlaut -25 K omacron -25 K oslash -25 K '
+                     'otilde -25 K u -20 K uacute -20 K ucircumflex -20 K '
+                     'udieresis -20 K ugrave -20 K uhungarumlaut -20 K '
+                     'umacron -20 K uogonek -20 K uring -20 K y -20 K yacute '
+                     '-20 K ydieresis -20 Kcommaaccent O -30 Kcommaaccent '
+                     'Oacute -30 Kcommaaccent Ocircumflex -30 Kcommaaccent '
+                     'Odieresis -30 Kcommaaccent Ograve -30 Kcommaaccent '
+                     'Ohungarumlaut -30 Kcommaaccent Omacron -30 Kcommaaccent '
+                     'Oslash -30 Kcommaaccent Otilde -30 Kcommaaccent e -25 '
+                     'Kcommaaccent eacute -25 Kcommaaccent ecaron -25 '
+                     'Kcommaaccent ecircumflex -25 Kcommaaccent edieresis -25 '
+                     'Kcommaaccent edotaccent -25 Kcommaaccent egrave -25 '
+                     'Kcommaaccent emacron -25 Kcommaaccent eogonek -25 '
+                     'Kcommaaccent o -25 Kcommaaccent oacute -25 Kcommaaccent '
+                     'ocircumflex -25 Kcommaaccent odieresis -25 Kcommaaccent '
+                     'ograve -25 Kcommaaccent ohungarumlaut -25 Kcommaaccent '
+                     'omacron -25 Kcommaaccent oslash -25 Kcommaaccent otilde '
+                     '-25 Kcommaaccent u -20 Kcommaaccent uacute -20 '
+                     'Kcommaaccent ucircumflex -20 Kcommaaccent udieresis -20 '
+                     'Kcommaaccent ugrave -20 Kcommaaccent uhungarumlaut -20 '
+                     'Kcommaaccent umacron -20 Kcommaaccent uogonek -20 '
+                     'Kcommaaccent uring -20 Kcommaaccent y -20 Kcommaaccent '
+                     'yacute -20 Kcommaaccent ydieresis -20 L T -18 L Tcaron '
+                     '-18 L Tcommaaccent -18 L V -37 L W -37 L Y -37 L Yacute '
+                     '-37 L Ydieresis -37 L quoteright -55 L y -37 L yacute '
+                     '-37 L ydieresis -37 Lacute T -18 Lacute Tcaron -18 '
+                     'Lacute Tcommaaccent -18 Lacute V -37 Lacute W -37 '
+                     'Lacute Y -37 Lacute Yacute -37 Lacute Ydieresis -37 '
+                     'Lacute quoteright -55 Lacute y -37 Lacute yacute -37 '
+                     'Lacute ydieresis -37 Lcommaaccent T -18 Lcommaaccent '
+                     'Tcaron -18 Lcommaaccent Tcommaaccent -18 Lcommaaccent V '
+                     '-37 Lcommaaccent W -37 Lcommaaccent Y -37 Lcommaaccent '
+                     'Yacute -37 Lcommaaccent Ydieresis -37 Lcommaaccent '
+                     'quoteright -55 Lcommaaccent y -37 Lcommaaccent yacute '
+                     '-37 Lcommaaccent ydieresis -37 Lslash T -18 Lslash '
+                     'Tcaron -18 Lslash Tcommaaccent -18 Lslash V -37 Lslash '
+                     'W -37 Lslash Y -37 Lslash Yacute -37 Lslash Ydieresis '
+                     '-37 Lslash quoteright -55 Lslash y -37 Lslash yacute '
+                     '-37 Lslash ydieresis -37 N A -30 N Aacute -30 N Abreve '
+                     '-30 N Acircumflex -30 N Adieresis -30 N Agrave -30 N '
+                     'Amacron -30 N Aogonek -30 N Aring -30 N Atilde -30 '
+                     'Nacute A -30 Nacute Aacute -30 Nacute Abreve -30 Nacute '
+                     'Acircumflex -30 Nacute Adieresis -30 Nacute Agrave -30 '
+                     'Nacute Amacron -30 Nacute Aogonek -30 Nacute Aring -30 '
+                     'Nacute Atilde -30 Ncaron A -30 Ncaron Aacute -30 Ncaron '
+                     'Abreve -30 Ncaron Acircumflex -30 Ncaron Adieresis -30 '
+                     'Ncaron Agrave -30 Ncaron Amacron -30 Ncaron Aogonek -30 '
+                     'Ncaron Aring -30 Ncaron Atilde -30 Ncommaaccent A -30 '
+                     'Ncommaaccent Aacute -30 Ncommaaccent Abreve -30 '
+                     'Ncommaaccent Acircumflex -30 Ncommaaccent Adieresis -30 '
+                     'Ncommaaccent Agrave -30 Ncommaaccent Amacron -30 '
+                     'Ncommaaccent Aogonek -30 Ncommaaccent Aring -30 '
+                     'Ncommaaccent Atilde -30 Ntilde A -30 Ntilde Aacute -30 '
+                     'Ntilde Abreve -30 Ntilde Acircumflex -30 Ntilde '
+                     'Adieresis -30 Ntilde Agrave -30 Ntilde Amacron -30 '
+                     'Ntilde Aogonek -30 Ntilde Aring -30 Ntilde Atilde -30 O '
+                     'A -40 O Aacute -40 O Abreve -40 O Acircumflex -40 O '
+                     'Adieresis -40 O Agrave -40 O Amacron -40 O Aogonek -40 '
+                     'O Aring -40 O Atilde -40 O T -40 O Tcaron -40 O '
+                     'Tcommaaccent -40 O V -50 O W -50 O X -40 O Y -50 O '
+                     'Yacute -50 O Ydieresis -50 Oacute A -40 Oacute Aacute '
+                     '-40 Oacute Abreve -40 Oacute Acircumflex -40 Oacute '
+                     'Adieresis -40 Oacute Agrave -40 Oacute Amacron -40 '
+                     'Oacute Aogonek -40 Oacute Aring -40 Oacute Atilde -40 '
+                     'Oacute T -40 Oacute Tcaron -40 Oacute Tcommaaccent -40 '
+                     'Oacute V -50 Oacute W -50 Oacute X -40 Oacute Y -50 '
+                     'Oacute Yacute -50 Oacute Ydieresis -50 Ocircumflex A '
+                     '-40 Ocircumflex Aacute -40 Ocircumflex Abreve -40 '
+                     'Ocircumflex Acircumflex -40 Ocircumflex Adieresis -40 '
+                     'Ocircumflex Agrave -40 Ocircumflex Amacron -40 '
+                     'Ocircumflex Aogonek -40 Ocircumflex Aring -40 '
+                     'Ocircumflex Atilde -40 Ocircumflex T -40 Ocircumflex '
+                     'Tcaron -40 Ocircumflex Tcommaaccent -40 Ocircumflex V '
+                     '-50 Ocircumflex W -50 Ocircumflex X -40 Ocircumflex Y '
+                     '-50 Ocircumflex Yacute -50 Ocircumflex Ydieresis -50 '
+                     'Odieresis A -40 Odieresis Aacute -40 Odieresis Abreve '
+                     '-40 Odieresis Acircumflex -40 Odieresis Adieresis -40 '
+                     'Odieresis Agrave -40 Odieresis Amacron -40 Odieresis '
+                     'Aogonek -40 Odieresis Aring -40 Odieresis Atilde -40 '
+                     'Odieresis T -40 Odieresis Tcaron -40 Odieresis '
+                     'Tcommaaccent -40 Odieresis V -50 Odieresis W -50 '
+                     'Odieresis X -40 Odieresis Y -50 Odieresis Yacute -50 '
+                     'Odieresis Ydieresis -50 Ograve A -40 Ograve Aacute -40 '
+                     'Ograve Abreve -40 Ograve Acircumflex -40 Ograve '
+                     'Adieresis -40 Ograve Agrave -40 Ograve Amacron -40 '
+                     'Ograve Aogonek -40 Ograve Aring -40 Ograve Atilde -40 '
+                     'Ograve T -40 Ograve Tcaron -40 Ograve Tcommaaccent -40 '
+                     'Ograve V -50 Ograve W -50 Ograve X -40 Ograve Y -50 '
+                     'Ograve Yacute -50 Ograve Ydieresis -50 Ohungarumlaut A '
+                     '-40 Ohungarumlaut Aacute -40 Ohungarumlaut Abreve -40 '
+                     'Ohungarumlaut Acircumflex -40 Ohungarumlaut Adieresis '
+                     '-40 Ohungarumlaut Agrave -40 Ohungarumlaut Amacron -40 '
+                     'Ohungarumlaut Aogonek -40 Ohungarumlaut Aring -40 '
+                     'Ohungarumlaut Atilde -40 Ohungarumlaut T -40 '
+                     'Ohungarumlaut Tcaron -40 Ohungarumlaut Tcommaaccent -40 '
+                     'Ohungarumlaut V -50 Ohungarumlaut W -50 Ohungarumlaut X '
+                     '-40 Ohungarumlaut Y -50 Ohungarumlaut Yacute -50 '
+                     'Ohungarumlaut Ydieresis -50 Omacron A -40 Omacron '
+                     'Aacute -40 Omacron Abreve -40 Omacron Acircumflex -40 '
+                     'Omacron Adieresis -40 Omacron Agrave -40 Omacron '
+                     'Amacron -40 Omacron Aogonek -40 Omacron Aring -40 '
+                     'Omacron Atilde -40 Omacron T -40 Omacron Tcaron -40 '
+                     'Omacron Tcommaaccent -40 Omacron V -50 Omacron W -50 '
+                     'Omacron X -40 Omacron Y -50 Omacron Yacute -50 Omacron '
+                     'Ydieresis -50 Oslash A -40 Oslash Aacute -40 Oslash '
+                     'Abreve -40 Oslash Acircumflex -40 Oslash Adieresis -40 '
+                     'Oslash Agrave -40 Oslash Amacron -40 Oslash Aogonek -40 '
+                     'Oslash Aring -40 Oslash Atilde -40 Oslash T -40 Oslash '
+                     'Tcaron -40 Oslash Tcommaaccent -40 Oslash V -50 Oslash '
+                     'W -50 Oslash X -40 Oslash Y -50 Oslash Yacute -50 '
+                     'Oslash Ydieresis -50 Otilde A -40 Otilde Aacute -40 '
+                     'Otilde Abreve -40 Otilde Acircumflex -40 Otilde '
+                     'Adieresis -40 Otilde Agrave -40 Otilde Amacron -40 '
+                     'Otilde Aogonek -40 Otilde Aring -40 Otilde Atilde -40 '
+                     'Otilde T -40 Otilde Tcaron -40 Otilde Tcommaaccent -40 '
+                     'Otilde V -50 Otilde W -50 Otilde X -40 Otilde Y -50 '
+                     'Otilde Yacute -50 Otilde Ydieresis -50 P A -85 P Aacute '
+                     '-85 P Abreve -85 P Acircumflex -85 P Adieresis -85 P '
+                     'Agrave -85 P Amacron -85 P Aogonek -85 P Aring -85 P '
+                     'Atilde -85 P a -40 P aacute -40 P abreve -40 P '
+                     'acircumflex -40 P adieresis -40 P agrave -40 P amacron '
+                     '-40 P aogonek -40 P aring -40 P atilde -40 P comma -129 '
+                     'P e -50 P eacute -50 P ecaron -50 P ecircumflex -50 P '
+                     'edieresis -50 P edotaccent -50 P egrave -50 P emacron '
+                     '-50 P eogonek -50 P o -55 P oacute -55 P ocircumflex '
+                     '-55 P odieresis -55 P ograve -55 P ohungarumlaut -55 P '
+                     'omacron -55 P oslash -55 P otilde -55 P period -129 Q U '
+                     '-10 Q Uacute -10 Q Ucircumflex -10 Q Udieresis -10 Q '
+                     'Ugrave -10 Q Uhungarumlaut -10 Q Umacron -10 Q Uogonek '
+                     '-10 Q Uring -10 R O -40 R Oacute -40 R Ocircumflex -40 '
+                     'R Odieresis -40 R Ograve -40 R Ohungarumlaut -40 R '
+                     'Omacron -40 R Oslash -40 R Otilde -40 R T -30 R Tcaron '
+                     '-30 R Tcommaaccent -30 R U -40 R Uacute -40 R '
+                     'Ucircumflex -40 R Udieresis -40 R Ugrave -40 R '
+                     'Uhungarumlaut -40 R Umacron -40 R Uogonek -40 R Uring '
+                     '-40 R V -18 R W -18 R Y -18 R Yacute -18 R Ydieresis '
+                     '-18 Racute O -40 Racute Oacute -40 Racute Ocircumflex '
+                     '-40 Racute Odieresis -40 Racute Ograve -40 Racute '
+                     'Ohungarumlaut -40 Racute Omacron -40 Racute Oslash -40 '
+                     'Racute Otilde -40 Racute T -30 Racute Tcaron -30 Racute '
+                     'Tcommaaccent -30 Racute U -40 Racute Uacute -40 Racute '
+                     'Ucircumflex -40 Racute Udieresis -40 Racute Ugrave -40 '
+                     'Racute Uhungarumlaut -40 Racute Umacron -40 Racute '
+                     'Uogonek -40 Racute Uring -40 Racute V -18 Racute W -18 '
+                     'Racute Y -18 Racute Yacute -18 Racute Ydieresis -18 '
+                     'Rcaron O -40 Rcaron Oacute -40 Rcaron Ocircumflex -40 '
+                     'Rcaron Odieresis -40 Rcaron Ograve -40 Rcaron '
+                     'Ohungarumlaut -40 Rcaron Omacron -40 Rcaron Oslash -40 '
+                     'Rcaron Otilde -40 Rcaron T -30 Rcaron Tcaron -30 Rcaron '
+                     'Tcommaaccent -30 Rcaron U -40 Rcaron Uacute -40 Rcaron '
+                     'Ucircumflex -40 Rcaron Udieresis -40 Rcaron Ugrave -40 '
+                     'Rcaron Uhungarumlaut -40 Rcaron Umacron -40 Rcaron '
+                     'Uogonek -40 Rcaron Uring -40 Rcaron V -18 Rcaron W -18 '
+                     'Rcaron Y -18 Rcaron Yacute -18 Rcaron Ydieresis -18 '
+                     'Rcommaaccent O -40 Rcommaaccent Oacute -40 Rcommaaccent '
+                     'Ocircumflex -40 Rcommaaccent Odieresis -40 Rcommaaccent '
+                     'Ograve -40 Rcommaaccent Ohungarumlaut -40 Rcommaaccent '
+                     'Omacron -40 Rcommaaccent Oslash -40 Rcommaaccent Otilde '
+                     '-40 Rcommaaccent T -30 Rcommaaccent Tcaron -30 '
+                     'Rcommaaccent Tcommaaccent -30 Rcommaaccent U -40 '
+                     'Rcommaaccent Uacute -40 Rcommaaccent Ucircumflex -40 '
+                     'Rcommaaccent Udieresis -40 Rcommaaccent Ugrave -40 '
+                     'Rcommaaccent Uhungarumlaut -40 Rcommaaccent Umacron -40 '
+                     'Rcommaaccent Uogonek -40 Rcommaaccent Uring -40 '
+                     'Rcommaaccent V -18 Rcommaaccent W -18 Rcommaaccent Y '
+                     '-18 Rcommaaccent Yacute -18 Rcommaaccent Ydieresis -18 '
+                     'T A -55 T Aacute -55 T Abreve -55 T Acircumflex -55 T '
+                     'Adieresis -55 T Agrave -55 T Amacron -55 T Aogonek -55 '
+                     'T Aring -55 T Atilde -55 T O -18 T Oacute -18 T '
+                     'Ocircumflex -18 T Odieresis -18 T Ograve -18 T '
+                     'Ohungarumlaut -18 T Omacron -18 T Oslash -18 T Otilde '
+                     '-18 T a -92 T aacute -92 T abreve -92 T acircumflex -92 '
+                     'T adieresis -92 T agrave -92 T amacron -92 T aogonek '
+                     '-92 T aring -92 T atilde -92 T colon -74 T comma -92 T '
+                     'e -92 T eacute -92 T ecaron -92 T ecircumflex -92 T '
+                     'edieresis -52 T edotaccent -92 T egrave -52 T emacron '
+                     '-52 T eogonek -92 T hyphen -92 T i -37 T iacute -37 T '
+                     'iogonek -37 T o -95 T oacute -95 T ocircumflex -95 T '
+                     'odieresis -95 T ograve -95 T ohungarumlaut -95 T '
+                     'omacron -95 T oslash -95 T otilde -95 T period -92 T r '
+                     '-37 T racute -37 T rcaron -37 T rcommaaccent -37 T '
+                     'semicolon -74 T u -37 T uacute -37 T ucircumflex -37 T '
+                     'udieresis -37 T ugrave -37 T uhungarumlaut -37 T '
+                     'umacron -37 T uogonek -37 T uring -37 T w -37 T y -37 T '
+                     'yacute -37 T ydieresis -37 Tcaron A -55 Tcaron Aacute '
+                     '-55 Tcaron Abreve -55 Tcaron Acircumflex -55 Tcaron '
+                     'Adieresis -55 Tcaron Agrave -55 Tcaron Amacron -55 '
+                     'Tcaron Aogonek -55 Tcaron Aring -55 Tcaron Atilde -55 '
+                     'Tcaron O -18 Tcaron Oacute -18 Tcaron Ocircumflex -18 '
+                     'Tcaron Odieresis -18 Tcaron Ograve -18 Tcaron '
+                     'Ohungarumlaut -18 Tcaron Omacron -18 Tcaron Oslash -18 '
+                     'Tcaron Otilde -18 Tcaron a -92 Tcaron aacute -92 Tcaron '
+                     'abreve -92 Tcaron acircumflex -92 Tcaron adieresis -92 '
+                     'Tcaron agrave -92 Tcaron amacron -92 Tcaron aogonek -92 '
+                     'Tcaron aring -92 Tcaron atilde -92 Tcaron colon -74 '
+                     'Tcaron comma -92 Tcaron e -92 Tcaron eacute -92 Tcaron '
+                     'ecaron -92 Tcaron ecircumflex -92 Tcaron edieresis -52 '
+                     'Tcaron edotaccent -92 Tcaron egrave -52 Tcaron emacron '
+                     '-52 Tcaron eogonek -92 Tcaron hyphen -92 Tcaron i -37 '
+                     'Tcaron iacute -37 Tcaron iogonek -37 Tcaron o -95 '
+                     'Tcaron oacute -95 Tcaron ocircumflex -95 Tcaron '
+                     'odieresis -95 Tcaron ograve -95 Tcaron ohungarumlaut '
+                     '-95 Tcaron omacron -95 Tcaron oslash -95 Tcaron otilde '
+                     '-95 Tcaron period -92 Tcaron r -37 Tcaron racute -37 '
+                     'Tcaron rcaron -37 Tcaron rcommaaccent -37 Tcaron '
+                     'semicolon -74 Tcaron u -37 Tcaron uacute -37 Tcaron '
+                     'ucircumflex -37 Tcaron udieresis -37 Tcaron ugrave -37 '
+                     'Tcaron uhungarumlaut -37 Tcaron umacron -37 Tcaron '
+                     'uogonek -37 Tcaron uring -37 Tcaron w -37 Tcaron y -37 '
+                     'Tcaron yacute -37 Tcaron ydieresis -37 Tcommaaccent A '
+                     '-55 Tcommaaccent Aacute -55 Tcommaaccent Abreve -55 '
+                     'Tcommaaccent Acircumflex -55 Tcommaaccent Adieresis -55 '
+                     'Tcommaaccent Agrave -55 Tcommaaccent Amacron -55 '
+                     'Tcommaaccent Aogonek -55 Tcommaaccent Aring -55 '
+                     'Tcommaaccent Atilde -55 Tcommaaccent O -18 Tcommaaccent '
+                     'Oacute -18 Tcommaaccent Ocircumflex -18 Tcommaaccent '
+                     'Odieresis -18 Tcommaaccent Ograve -18 Tcommaaccent '
+                     'Ohungarumlaut -18 Tcommaaccent Omacron -18 Tcommaaccent '
+                     'Oslash -18 Tcommaaccent Otilde -18 Tcommaaccent a -92 '
+                     'Tcommaaccent aacute -92 Tcommaaccent abreve -92 '
+                     'Tcommaaccent acircumflex -92 Tcommaaccent adieresis -92 '
+                     'Tcommaaccent agrave -92 Tcommaaccent amacron -92 '
+                     'Tcommaaccent aogonek -92 Tcommaaccent aring -92 '
+                     'Tcommaaccent atilde -92 Tcommaaccent colon -74 '
+                     'Tcommaaccent comma -92 Tcommaaccent e -92 Tcommaaccent '
+                     'eacute -92 Tcommaaccent ecaron -92 Tcommaaccent '
+                     'ecircumflex -92 Tcommaaccent edieresis -52 Tcommaaccent '
+                     'edotaccent -92 Tcommaaccent egrave -52 Tcommaaccent '
+                     'emacron -52 Tcommaaccent eogonek -92 Tcommaaccent '
+                     'hyphen -92 Tcommaaccent i -37 Tcommaaccent iacute -37 '
+                     'Tcommaaccent iogonek -37 Tcommaaccent o -95 '
+                     'Tcommaaccent oacute -95 Tcommaaccent ocircumflex -95 '
+                     'Tcommaaccent odieresis -95 Tcommaaccent ograve -95 '
+                     'Tcommaaccent ohungarumlaut -95 Tcommaaccent omacron -95 '
+                     'Tcommaaccent oslash -95 Tcommaaccent otilde -95 '
+                     'Tcommaaccent period -92 Tcommaaccent r -37 Tcommaaccent '
+                     'racute -37 Tcommaaccent rcaron -37 Tcommaaccent '
+                     'rcommaaccent -37 Tcommaaccent semicolon -74 '
+                     'Tcommaaccent u -37 Tcommaaccent uacute -37 Tcommaaccent '
+                     'ucircumflex -37 Tcommaaccent udieresis -37 Tcommaaccent '
+                     'ugrave -37 Tcommaaccent uhungarumlaut -37 Tcommaaccent '
+                     'umacron -37 Tcommaaccent uogonek -37 Tcommaaccent uring '
+                     '-37 Tcommaaccent w -37 Tcommaaccent y -37 Tcommaaccent '
+                     'yacute -37 Tcommaaccent ydieresis -37 U A -45 U Aacute '
+                     '-45 U Abreve -45 U Acircumflex -45 U Adieresis -45 U '
+                     'Agrave -45 U Amacron -45 U Aogonek -45 U Aring -45 U '
+                     'Atilde -45 Uacute A -45 Uacute Aacute -45 Uacute Abreve '
+                     '-45 Uacute Acircumflex -45 Uacute Adieresis -45 Uacute '
+                     'Agrave -45 Uacute Amacron -45 Uacute Aogonek -45 Uacute '
+                     'Aring -45 Uacute Atilde -45 Ucircumflex A -45 '
+                     'Ucircumflex Aacute -45 Ucircumflex Abreve -45 '
+                     'Ucircumflex Acircumflex -45 Ucircumflex Adieresis -45 '
+                     'Ucircumflex Agrave -45 Ucircumflex Amacron -45 '
+                     'Ucircumflex Aogonek -45 Ucircumflex Aring -45 '
+                     'Ucircumflex Atilde -45 Udieresis A -45 Udieresis Aacute '
+                     '-45 Udieresis Abreve -45 Udieresis Acircumflex -45 '
+                     'Udieresis Adieresis -45 Udieresis Agrave -45 Udieresis '
+                     'Amacron -45 Udieresis Aogonek -45 Udieresis Aring -45 '
+                     'Udieresis Atilde -45 Ugrave A -45 Ugrave Aacute -45 '
+                     'Ugrave Abreve -45 Ugrave Acircumflex -45 Ugrave '
+                     'Adieresis -45 Ugrave Agrave -45 Ugrave Amacron -45 '
+                     'Ugrave Aogonek -45 Ugrave Aring -45 Ugrave Atilde -45 '
+                     'Uhungarumlaut A -45 Uhungarumlaut Aacute -45 '
+                     'Uhungarumlaut Abreve -45 Uhungarumlaut Acircumflex -45 '
+                     'Uhungarumlaut Adieresis -45 Uhungarumlaut Agrave -45 '
+                     'Uhungarumlaut Amacron -45 Uhungarumlaut Aogonek -45 '
+                     'Uhungarumlaut Aring -45 Uhungarumlaut Atilde -45 '
+                     'Umacron A -45 Umacron Aacute -45 Umacron Abreve -45 '
+                     'Umacron Acircumflex -45 Umacron Adieresis -45 Umacron '
+                     'Agrave -45 Umacron Amacron -45 Umacron Aogonek -45 '
+                     'Umacron Aring -45 Umacron Atilde -45 Uogonek A -45 '
+                     'Uogonek Aacute -45 Uogonek Abreve -45 Uogonek '
+                     'Acircumflex -45 Uogonek Adieresis -45 Uogonek Agrave '
+                     '-45 Uogonek Amacron -45 Uogonek Aogonek -45 Uogonek '
+                     'Aring -45 Uogonek Atilde -45 Uring A -45 Uring Aacute '
+                     '-45 Uring Abreve -45 Uring Acircumflex -45 Uring '
+                     'Adieresis -45 Uring Agrave -45 Uring Amacron -45 Uring '
+                     'Aogonek -45 Uring Aring -45 Uring Atilde -45 V A -85 V '
+                     'Aacute -85 V Abreve -85 V Acircumflex -85 V Adieresis '
+                     '-85 V Agrave -85 V Amacron -85 V Aogonek -85 V Aring '
+                     '-85 V Atilde -85 V G -10 V Gbreve -10 V Gcommaaccent '
+                     '-10 V O -30 V Oacute -30 V Ocircumflex -30 V Odieresis '
+                     '-30 V Ograve -30 V Ohungarumlaut -30 V Omacron -30 V '
+                     'Oslash -30 V Otilde -30 V a -111 V aacute -111 V abreve '
+                     '-111 V acircumflex -111 V adieresis -111 V agrave -111 '
+                     'V amacron -111 V aogonek -111 V aring -111 V atilde '
+                     '-111 V colon -74 V comma -129 V e -111 V eacute -111 V '
+                     'ecaron -111 V ecircumflex -111 V edieresis -71 V '
+                     'edotaccent -111 V egrave -71 V emacron -71 V eogonek '
+                     '-111 V hyphen -70 V i -55 V iacute -55 V iogonek -55 V '
+                     'o -111 V oacute -111 V ocircumflex -111 V odieresis '
+                     '-111 V ograve -111 V ohungarumlaut -111 V omacron -111 '
+                     'V oslash -111 V otilde -111 V period -129 V semicolon '
+                     '-74 V u -55 V uacute -55 V ucircumflex -55 V udieresis '
+                     '-55 V ugrave -55 V uhungarumlaut -55 V umacron -55 V '
+                     'uogonek -55 V uring -55 W A -74 W Aacute -74 W Abreve '
+                     '-74 W Acircumflex -74 W Adieresis -74 W Agrave -74 W '
+                     'Amacron -74 W Aogonek -74 W Aring -74 W Atilde -74 W O '
+                     '-15 W Oacute -15 W Ocircumflex -15 W Odieresis -15 W '
+                     'Ograve -15 W Ohungarumlaut -15 W Omacron -15 W Oslash '
+                     '-15 W Otilde -15 W a -85 W aacute -85 W abreve -85 W '
+                     'acircumflex -85 W adieresis -85 W agrave -85 W amacron '
+                     '-85 W aogonek -85 W aring -85 W atilde -85 W colon -55 '
+                     'W comma -74 W e -90 W eacute -90 W ecaron -90 W '
+                     'ecircumflex -90 W edieresis -50 W edotaccent -90 W '
+                     'egrave -50 W emacron -50 W eogonek -90 W hyphen -50 W i '
+                     '-37 W iacute -37 W iogonek -37 W o -80 W oacute -80 W '
+                     'ocircumflex -80 W odieresis -80 W ograve -80 W '
+                     'ohungarumlaut -80 W omacron -80 W oslash -80 W otilde '
+                     '-80 W period -74 W semicolon -55 W u -55 W uacute -55 W '
+                     'ucircumflex -55 W udieresis -55 W ugrave -55 W '
+                     'uhungarumlaut -55 W umacron -55 W uogonek -55 W uring '
+                     '-55 W y -55 W yacute -55 W ydieresis -55 Y A -74 Y '
+                     'Aacute -74 Y Abreve -74 Y Acircumflex -74 Y Adieresis '
+                     '-74 Y Agrave -74 Y Amacron -74 Y Aogonek -74 Y Aring '
+                     '-74 Y Atilde -74 Y O -25 Y Oacute -25 Y Ocircumflex -25 '
+                     'Y Odieresis -25 Y Ograve -25 Y Ohungarumlaut -25 Y '
+                     'Omacron -25 Y Oslash -25 Y Otilde -25 Y a -92 Y aacute '
+                     '-92 Y abreve -92 Y acircumflex -92 Y adieresis -92 Y '
+                     'agrave -92 Y amacron -92 Y aogonek -92 Y aring -92 Y '
+                     'atilde -92 Y colon -92 Y comma -92 Y e -111 Y eacute '
+                     '-111 Y ecaron -111 Y ecircumflex -71 Y edieresis -71 Y '
+                     'edotaccent -111 Y egrave -71 Y emacron -71 Y eogonek '
+                     '-111 Y hyphen -92 Y i -55 Y iacute -55 Y iogonek -55 Y '
+                     'o -111 Y oacute -111 Y ocircumflex -111 Y odieresis '
+                     '-111 Y ograve -111 Y ohungarumlaut -111 Y omacron -111 '
+                     'Y oslash -111 Y otilde -111 Y period -74 Y semicolon '
+                     '-92 Y u -92 Y uacute -92 Y ucircumflex -92 Y udieresis '
+                     '-92 Y ugrave -92 Y uhungarumlaut -92 Y umacron -92 Y '
+                     'uogonek -92 Y uring -92 Yacute A -74 Yacute Aacute -74 '
+                     'Yacute Abreve -74 Yacute Acircumflex -74 Yacute '
+                     'Adieresis -74 Yacute Agrave -74 Yacute Amacron -74 '
+                     'Yacute Aogonek -74 Yacute Aring -74 Yacute Atilde -74 '
+                     'Yacute O -25 Yacute Oacute -25 Yacute Ocircumflex -25 '
+                     'Yacute Odieresis -25 Yacute Ograve -25 Yacute '
+                     'Ohungarumlaut -25 Yacute Omacron -25 Yacute Oslash -25 '
+                     'Yacute Otilde -25 Yacute a -92 Yacute aacute -92 Yacute '
+                     'abreve -92 Yacute acircumflex -92 Yacute adieresis -92 '
+                     'Yacute agrave -92 Yacute amacron -92 Yacute aogonek -92 '
+                     'Yacute aring -92 Yacute atilde -92 Yacute colon -92 '
+                     'Yacute comma -92 Yacute e -111 Yacute eacute -111 '
+                     'Yacute ecaron -111 Yacute ecircumflex -71 Yacute '
+                     'edieresis -71 Yacute edotaccent -111 Yacute egrave -71 '
+                     'Yacute emacron -71 Yacute eogonek -111 Yacute hyphen '
+                     '-92 Yacute i -55 Yacute iacute -55 Yacute iogonek -55 '
+                     'Yacute o -111 Yacute oacute -111 Yacute ocircumflex '
+                     '-111 Yacute odieresis -111 Yacute ograve -111 Yacute '
+                     'ohungarumlaut -111 Yacute omacron -111 Yacute oslash '
+                     '-111 Yacute otilde -111 Yacute period -74 Yacute '
+                     'semicolon -92 Yacute u -92 Yacute uacute -92 Yacute '
+                     'ucircumflex -92 Yacute udieresis -92 Yacute ugrave -92 '
+                     'Yacute uhungarumlaut -92 Yacute umacron -92 Yacute '
+                     'uogonek -92 Yacute uring -92 Ydieresis A -74 Ydieresis '
+                     'Aacute -74 Ydieresis Abreve -74 Ydieresis Acircumflex '
+                     '-74 Ydieresis Adieresis -74 Ydieresis Agrave -74 '
+                     'Ydieresis Amacron -74 Ydieresis Aogonek -74 Ydieresis '
+                     'Aring -74 Ydieresis Atilde -74 Ydieresis O -25 '
+                     'Ydieresis Oacute -25 Ydieresis Ocircumflex -25 '
+                     'Ydieresis Odieresis -25 Ydieresis Ograve -25 Ydieresis '
+                     'Ohungarumlaut -25 Ydieresis Omacron -25 Ydieresis '
+                     'Oslash -25 Ydieresis Otilde -25 Ydieresis a -92 '
+                     'Ydieresis aacute -92 Ydieresis abreve -92 Ydieresis '
+                     'acircumflex -92 Ydieresis adieresis -92 Ydieresis '
+                     'agrave -92 Ydieresis amacron -92 Ydieresis aogonek -92 '
+                     'Ydieresis aring -92 Ydieresis atilde -92 Ydieresis '
+                     'colon -92 Ydieresis comma -92 Ydieresis e -111 '
+                     'Ydieresis eacute -111 Ydieresis ecaron -111 Ydieresis '
+                     'ecircumflex -71 Ydieresis edieresis -71 Ydieresis '
+                     'edotaccent -111 Ydieresis egrave -71 Ydieresis emacron '
+                     '-71 Ydieresis eogonek -111 Ydieresis hyphen -92 '
+                     'Ydieresis i -55 Ydieresis iacute -55 Ydieresis iogonek '
+                     '-55 Ydieresis o -111 Ydieresis oacute -111 Ydieresis '
+                     'ocircumflex -111 Ydieresis odieresis -111 Ydieresis '
+                     'ograve -111 Ydieresis ohungarumlaut -111 Ydieresis '
+                     'omacron -111 Ydieresis oslash -111 Ydieresis otilde '
+                     '-111 Ydieresis period -74 Ydieresis semicolon -92 '
+                     'Ydieresis u -92 Ydieresis uacute -92 Ydieresis '
+                     'ucircumflex -92 Ydieresis udieresis -92 Ydieresis '
+                     'ugrave -92 Ydieresis uhungarumlaut -92 Ydieresis '
+                     'umacron -92 Ydieresis uogonek -92 Ydieresis uring -92 b '
+                     'b -10 b period -40 b u -20 b uacute -20 b ucircumflex '
+                     '-20 b udieresis -20 b ugrave -20 b uhungarumlaut -20 b '
+                     'umacron -20 b uogonek -20 b uring -20 c h -10 c k -10 c '
+                     'kcommaaccent -10 cacute h -10 cacute k -10 cacute '
+                     'kcommaaccent -10 ccaron h -10 ccaron k -10 ccaron '
+                     'kcommaaccent -10 ccedilla h -10 ccedilla k -10 ccedilla '
+                     'kcommaaccent -10 comma quotedblright -95 comma '
+                     'quoteright -95 e b -10 eacute b -10 ecaron b -10 '
+                     'ecircumflex b -10 edieresis b -10 edotaccent b -10 '
+                     'egrave b -10 emacron b -10 eogonek b -10 f comma -10 f '
+                     'dotlessi -30 f e -10 f eacute -10 f edotaccent -10 f '
+                     'eogonek -10 f f -18 f o -10 f oacute -10 f ocircumflex '
+                     '-10 f ograve -10 f ohungarumlaut -10 f oslash -10 f '
+                     'otilde -10 f period -10 f quoteright 55 k e -30 k '
+                     'eacute -30 k ecaron -30 k ecircumflex -30 k edieresis '
+                     '-30 k edotaccent -30 k egrave -30 k emacron -30 k '
+                     'eogonek -30 k o -10 k oacute -10 k ocircumflex -10 k '
+                     'odieresis -10 k ograve -10 k ohungarumlaut -10 k '
+                     'omacron -10 k oslash -10 k otilde -10 kcommaaccent e '
+                     '-30 kcommaaccent eacute -30 kcommaaccent ecaron -30 '
+                     'kcommaaccent ecircumflex -30 kcommaaccent edieresis -30 '
+                     'kcommaaccent edotaccent -30 kcommaaccent egrave -30 '
+                     'kcommaaccent emacron -30 kcommaaccent eogonek -30 '
+                     'kcommaaccent o -10 kcommaaccent oacute -10 kcommaaccent '
+                     'ocircumflex -10 kcommaaccent odieresis -10 kcommaaccent '
+                     'ograve -10 kcommaaccent ohungarumlaut -10 kcommaaccent '
+                     'omacron -10 kcommaaccent oslash -10 kcommaaccent otilde '
+                     '-10 n v -40 nacute v -40 ncaron v -40 ncommaaccent v '
+                     '-40 ntilde v -40 o v -15 o w -25 o x -10 o y -10 o '
+                     'yacute -10 o ydieresis -10 oacute v -15 oacute w -25 '
+                     'oacute x -10 oacute y -10 oacute yacute -10 oacute '
+                     'ydieresis -10 ocircumflex v -15 ocircumflex w -25 '
+                     'ocircumflex x -10 ocircumflex y -10 ocircumflex yacute '
+                     '-10 ocircumflex ydieresis -10 odieresis v -15 odieresis '
+                     'w -25 odieresis x -10 odieresis y -10 odieresis yacute '
+                     '-10 odieresis ydieresis -10 ograve v -15 ograve w -25 '
+                     'ograve x -10 ograve y -10 ograve yacute -10 ograve '
+                     'ydieresis -10 ohungarumlaut v -15 ohungarumlaut w -25 '
+                     'ohungarumlaut x -10 ohungarumlaut y -10 ohungarumlaut '
+                     'yacute -10 ohungarumlaut ydieresis -10 omacron v -15 '
+                     'omacron w -25 omacron x -10 omacron y -10 omacron '
+                     'yacute -10 omacron ydieresis -10 oslash v -15 oslash w '
+                     '-25 oslash x -10 oslash y -10 oslash yacute -10 oslash '
+                     'ydieresis -10 otilde v -15 otilde w -25 otilde x -10 '
+                     'otilde y -10 otilde yacute -10 otilde ydieresis -10 '
+                     'period quotedblright -95 period quoteright -95 '
+                     'quoteleft quoteleft -74 quoteright d -15 quoteright '
+                     'dcroat -15 quoteright quoteright -74 quoteright r -15 '
+                     'quoteright racute -15 quoteright rcaron -15 quoteright '
+                     'rcommaaccent -15 quoteright s -74 quoteright sacute -74 '
+                     'quoteright scaron -74 quoteright scedilla -74 '
+                     'quoteright scommaaccent -74 quoteright space -74 '
+                     'quoteright t -37 quoteright tcommaaccent -37 quoteright '
+                     'v -15 r comma -65 r period -65 racute comma -65 racute '
+                     'period -65 rcaron comma -65 rcaron period -65 '
+                     'rcommaaccent comma -65 rcommaaccent period -65 space A '
+                     '-37 space Aacute -37 space Abreve -37 space Acircumflex '
+                     '-37 space Adieresis -37 space Agrave -37 space Amacron '
+                     '-37 space Aogonek -37 space Aring -37 space Atilde -37 '
+                     'space V -70 space W -70 space Y -70 space Yacute -70 '
+                     'space Ydieresis -70 v comma -37 v e -15 v eacute -15 v '
+                     'ecaron -15 v ecircumflex -15 v edieresis -15 v '
+                     'edotaccent -15 v egrave -15 v emacron -15 v eogonek -15 '
+                     'v o -15 v oacute -15 v ocircumflex -15 v odieresis -15 '
+                     'v ograve -15 v ohungarumlaut -15 v omacron -15 v oslash '
+                     '-15 v otilde -15 v period -37 w a -10 w aacute -10 w '
+                     'abreve -10 w acircumflex -10 w adieresis -10 w agrave '
+                     '-10 w amacron -10 w aogonek -10 w aring -10 w atilde '
+                     '-10 w comma -37 w e -10 w eacute -10 w ecaron -10 w '
+                     'ecircumflex -10 w edieresis -10 w edotaccent -10 w '
+                     'egrave -10 w emacron -10 w eogonek -10 w o -15 w oacute '
+                     '-15 w ocircumflex -15 w odieresis -15 w ograve -15 w '
+                     'ohungarumlaut -15 w omacron -15 w oslash -15 w otilde '
+                     '-15 w period -37 x e -10 x eacute -10 x ecaron -10 x '
+                     'ecircumflex -10 x edieresis -10 x edotaccent -10 x '
+                     'egrave -10 x emacron -10 x eogonek -10 y comma -37 y '
+                     'period -37 yacute comma -37 yacute period -37 ydieresis '
+                     'comma -37 ydieresis period -37',
+ 'Times-Italic': 'A C -30 A Cacute -30 A Ccaron -30 A Ccedilla -30 A G -35 A '
+                 'Gbreve -35 A Gcommaaccent -35 A O -40 A Oacute -40 A '
+                 'Ocircumflex -40 A Odieresis -40 A Ograve -40 A '
+                 'Ohungarumlaut -40 A Omacron -40 A Oslash -40 A Otilde -40 A '
+                 'Q -40 A T -37 A Tcaron -37 A Tcommaaccent -37 A U -50 A '
+                 'Uacute -50 A Ucircumflex -50 A Udieresis -50 A Ugrave -50 A '
+                 'Uhungarumlaut -50 A Umacron -50 A Uogonek -50 A Uring -50 A '
+                 'V -105 A W -95 A Y -55 A Yacute -55 A Ydieresis -55 A '
+                 'quoteright -37 A u -20 A uacute -20 A ucircumflex -20 A '
+                 'udieresis -20 A ugrave -20 A uhungarumlaut -20 A umacron '
+                 '-20 A uogonek -20 A uring -20 A v -55 A w -55 A y -55 A '
+                 'yacute -55 A ydieresis -55 Aacute C -30 Aacute Cacute -30 '
+                 'Aacute Ccaron -30 Aacute Ccedilla -30 Aacute G -35 Aacute '
+                 'Gbreve -35 Aacute Gcommaaccent -35 Aacute O -40 Aacute '
+                 'Oacute -40 Aacute Ocircumflex -40 Aacute Odieresis -40 '
+                 'Aacute Ograve -40 Aacute Ohungarumlaut -40 Aacute Omacron '
+                 '-40 Aacute Oslash -40 Aacute Otilde -40 Aacute Q -40 Aacute '
+                 'T -37 Aacute Tcaron -37 Aacute Tcommaaccent -37 Aacute U '
+                 '-50 Aacute Uacute -50 Aacute Ucircumflex -50 Aacute '
+                 'Udieresis -50 Aacute Ugrave -50 Aacute Uhungarumlaut -50 '
+                 'Aacute Umacron -50 Aacute Uogonek -50 Aacute Uring -50 '
+                 'Aacute V -105 Aacute W -95 Aacute Y -55 Aacute Yacute -55 '
+                 'Aacute Ydieresis -55 Aacute quoteright -37 Aacute u -20 '
+                 'Aacute uacute -20 Aacute ucircumflex -20 Aacute udieresis '
+                 '-20 Aacute ugrave -20 Aacute uhungarumlaut -20 Aacute '
+                 'umacron -20 Aacute uogonek -20 Aacute uring -20 Aacute v '
+                 '-55 Aacute w -55 Aacute y -55 Aacute yacute -55 Aacute '
+                 'ydieresis -55 Abreve C -30 Abreve Cacute -30 Abreve Ccaron '
+                 '-30 Abreve Ccedilla -30 Abreve G -35 Abreve Gbreve -35 '
+                 'Abreve Gcommaaccent -35 Abreve O -40 Abreve Oacute -40 '
+                 'Abreve Ocircumflex -40 Abreve Odieresis -40 Abreve Ograve '
+                 '-40 Abreve Ohungarumlaut -40 Abreve Omacron -40 Abreve '
+                 'Oslash -40 Abreve Otilde -40 Abreve Q -40 Abreve T -37 '
+                 'Abreve Tcaron -37 Abreve Tcommaaccent -37 Abreve U -50 '
+                 'Abreve Uacute -50 Abreve Ucircumflex -50 Abreve Udieresis '
+                 '-50 Abreve Ugrave -50 Abreve Uhungarumlaut -50 Abreve '
+                 'Umacron -50 Abreve Uogonek -50 Abreve Uring -50 Abreve V '
+                 '-105 Abreve W -95 Abreve Y -55 Abreve Yacute -55 Abreve '
+                 'Ydieresis -55 Abreve quoteright -37 Abreve u -20 Abreve '
+                 'uacute -20 Abreve ucircumflex -20 Abreve udieresis -20 '
+                 'Abreve ugrave -20 Abreve uhungarumlaut -20 Abreve umacron '
+                 '-20 Abreve uogonek -20 Abreve uring -20 Abreve v -55 Abreve '
+                 'w -55 Abreve y -55 Abreve yacute -55 Abreve ydieresis -55 '
+                 'Acircumflex C -30 Acircumflex Cacute -30 Acircumflex Ccaron '
+                 '-30 Acircumflex Ccedilla -30 Acircumflex G -35 Acircumflex '
+                 'Gbreve -35 Acircumflex Gcommaaccent -35 Acircumflex O -40 '
+                 'Acircumflex Oacute -40 Acircumflex Ocircumflex -40 '
+                 'Acircumflex Odieresis -40 Acircumflex Ograve -40 '
+                 'Acircumflex Ohungarumlaut -40 Acircumflex Omacron -40 '
+                 'Acircumflex Oslash -40 Acircumflex Otilde -40 Acircumflex Q '
+                 '-40 Acircumflex T -37 Acircumflex Tcaron -37 Acircumflex '
+                 'Tcommaaccent -37 Acircumflex U -50 Acircumflex Uacute -50 '
+                 'Acircumflex Ucircumflex -50 Acircumflex Udieresis -50 '
+                 'Acircumflex Ugrave -50 Acircumflex Uhungarumlaut -50 '
+                 'Acircumflex Umacron -50 Acircumflex Uogonek -50 Acircumflex '
+                 'Uring -50 Acircumflex V -105 Acircumflex W -95 Acircumflex '
+                 'Y -55 Acircumflex Yacute -55 Acircumflex Ydieresis -55 '
+                 'Acircumflex quoteright -37 Acircumflex u -20 Acircumflex '
+                 'uacute -20 Acircumflex ucircumflex -20 Acircumflex '
+                 'udieresis -20 Acircumflex ugrave -20 Acircumflex '
+                 'uhungarumlaut -20 Acircumflex umacron -20 Acircumflex '
+                 'uogonek -20 Acircumflex uring -20 Acircumflex v -55 '
+                 'Acircumflex w -55 Acircumflex y -55 Acircumflex yacute -55 '
+                 'Acircumflex ydieresis -55 Adieresis C -30 Adieresis Cacute '
+                 '-30 Adieresis Ccaron -30 Adieresis Ccedilla -30 Adieresis G '
+                 '-35 Adieresis Gbreve -35 Adieresis Gcommaaccent -35 '
+                 'Adieresis O -40 Adieresis Oacute -40 Adieresis Ocircumflex '
+                 '-40 Adieresis Odieresis -40 Adieresis Ograve -40 Adieresis '
+                 'Ohungarumlaut -40 Adieresis Omacron -40 Adieresis Oslash '
+                 '-40 Adieresis Otilde -40 Adieresis Q -40 Adieresis T -37 '
+                 'Adieresis Tcaron -37 Adieresis Tcommaaccent -37 Adieresis U '
+                 '-50 Adieresis Uacute -50 Adieresis Ucircumflex -50 '
+                 'Adieresis Udieresis -50 Adieresis Ugrave -50 Adieresis '
+                 'Uhungarumlaut -50 Adieresis Umacron -50 Adieresis Uogonek '
+                 '-50 Adieresis Uring -50 Adieresis V -105 Adieresis W -95 '
+                 'Adieresis Y -55 Adieresis Yacute -55 Adieresis Ydieresis '
+                 '-55 Adieresis quoteright -37 Adieresis u -20 Adieresis '
+                 'uacute -20 Adieresis ucircumflex -20 Adieresis udieresis '
+                 '-20 Adieresis ugrave -20 Adieresis uhungarumlaut -20 '
+                 'Adieresis umacron -20 Adieresis uogonek -20 Adieresis uring '
+                 '-20 Adieresis v -55 Adieresis w -55 Adieresis y -55 '
+                 'Adieresis yacute -55 Adieresis ydieresis -55 Agrave C -30 '
+                 'Agrave Cacute -30 Agrave Ccaron -30 Agrave Ccedilla -30 '
+                 'Agrave G -35 Agrave Gbreve -35 Agrave Gcommaaccent -35 '
+                 'Agrave O -40 Agrave Oacute -40 Agrave Ocircumflex -40 '
+                 'Agrave Odieresis -40 Agrave Ograve -40 Agrave Ohungarumlaut '
+                 '-40 Agrave Omacron -40 Agrave Oslash -40 Agrave Otilde -40 '
+                 'Agrave Q -40 Agrave T -37 Agrave Tcaron -37 Agrave '
+                 'Tcommaaccent -37 Agrave U -50 Agrave Uacute -50 Agrave '
+                 'Ucircumflex -50 Agrave Udieresis -50 Agrave Ugrave -50 '
+                 'Agrave Uhungarumlaut -50 Agrave Umacron -50 Agrave Uogonek '
+                 '-50 Agrave Uring -50 Agrave V -105 Agrave W -95 Agrave Y '
+                 '-55 Agrave Yacute -55 Agrave Ydieresis -55 Agrave '
+                 'quoteright -37 Agrave u -20 Agrave uacute -20 Agrave '
+                 'ucircumflex -20 Agrave udieresis -20 Agrave ugrave -20 '
+                 'Agrave uhungarumlaut -20 Agrave umacron -20 Agrave uogonek '
+                 '-20 Agrave uring -20 Agrave v -55 Agrave w -55 Agrave y -55 '
+                 'Agrave yacute -55 Agrave ydieresis -55 Amacron C -30 '
+                 'Amacron Cacute -30 Amacron Ccaron -30 Amacron Ccedilla -30 '
+                 'Amacron G -35 Amacron Gbreve -35 Amacron Gcommaaccent -35 '
+                 'Amacron O -40 Amacron Oacute -40 Amacron Ocircumflex -40 '
+                 'Amacron Odieresis -40 Amacron Ograve -40 Amacron '
+                 'Ohungarumlaut -40 Amacron Omacron -40 Amacron Oslash -40 '
+                 'Amacron Otilde -40 Amacron Q -40 Amacron T -37 Amacron '
+                 'Tcaron -37 Amacron Tcommaaccent -37 Amacron U -50 Amacron '
+                 'Uacute -50 Amacron Ucircumflex -50 Amacron Udieresis -50 '
+                 'Amacron Ugrave -50 Amacron Uhungarumlaut -50 Amacron '
+                 'Umacron -50 Amacron Uogonek -50 Amacron Uring -50 Amacron V '
+                 '-105 Amacron W -95 Amacron Y -55 Amacron Yacute -55 Amacron '
+                 'Ydieresis -55 Amacron quoteright -37 Amacron u -20 Amacron '
+                 'uacute -20 Amacron ucircumflex -20 Amacron udieresis -20 '
+                 'Amacron ugrave -20 Amacron uhungarumlaut -20 Amacron '
+                 'umacron -20 Amacron uogonek -20 Amacron uring -20 Amacron v '
+                 '-55 Amacron w -55 Amacron y -55 Amacron yacute -55 Amacron '
+                 'ydieresis -55 Aogonek C -30 Aogonek Cacute -30 Aogonek '
+                 'Ccaron -30 Aogonek Ccedilla -30 Aogonek G -35 Aogonek '
+                 'Gbreve -35 Aogonek Gcommaaccent -35 Aogonek O -40 Aogonek '
+                 'Oacute -40 Aogonek Ocircumflex -40 Aogonek Odieresis -40 '
+                 'Aogonek Ograve -40 Aogonek Ohungarumlaut -40 Aogonek '
+                 'Omacron -40 Aogonek Oslash -40 Aogonek Otilde -40 Aogonek Q '
+                 '-40 Aogonek T -37 Aogonek Tcaron -37 Aogonek Tcommaaccent '
+                 '-37 Aogonek U -50 Aogonek Uacute -50 Aogonek Ucircumflex '
+                 '-50 Aogonek Udieresis -50 Aogonek Ugrave -50 Aogonek '
+                 'Uhungarumlaut -50 Aogonek Umacron -50 Aogonek Uogonek -50 '
+                 'Aogonek Uring -50 Aogonek V -105 Aogonek W -95 Aogonek Y '
+                 '-55 Aogonek Yacute -55 Aogonek Ydieresis -55 Aogonek '
+                 'quoteright -37 Aogonek u -20 Aogonek uacute -20 Aogonek '
+                 'ucircumflex -20 Aogonek udieresis -20 Aogonek ugrave -20 '
+                 'Aogonek uhungarumlaut -20 Aogonek umacron -20 Aogonek '
+                 'uogonek -20 Aogonek uring -20 Aogonek v -55 Aogonek w -55 '
+                 'Aogonek y -55 Aogonek yacute -55 Aogonek ydieresis -55 '
+                 'Aring C -30 Aring Cacute -30 Aring Ccaron -30 Aring '
+                 'Ccedilla -30 Aring G -35 Aring Gbreve -35 Aring '
+                 'Gcommaaccent -35 Aring O -40 Aring Oacute -40 Aring '
+                 'Ocircumflex -40 Aring Odieresis -40 Aring Ograve -40 Aring '
+                 'Ohungarumlaut -40 Aring Omacron -40 Aring Oslash -40 Aring '
+                 'Otilde -40 Aring Q -40 Aring T -37 Aring Tcaron -37 Aring '
+                 'Tcommaaccent -37 Aring U -50 Aring Uacute -50 Aring '
+                 'Ucircumflex -50 Aring Udieresis -50 Aring Ugrave -50 Aring '
+                 'Uhungarumlaut -50 Aring Umacron -50 Aring Uogonek -50 Aring '
+                 'Uring -50 Aring V -105 Aring W -95 Aring Y -55 Aring Yacute '
+                 '-55 Aring Ydieresis -55 Aring quoteright -37 Aring u -20 '
+                 'Aring uacute -20 Aring ucircumflex -20 Aring udieresis -20 '
+                 'Aring ugrave -20 Aring uhungarumlaut -20 Aring umacron -20 '
+                 'Aring uogonek -20 Aring uring -20 Aring v -55 Aring w -55 '
+                 'Aring y -55 Aring yacute -55 Aring ydieresis -55 Atilde C '
+                 '-30 Atilde Cacute -30 Atilde Ccaron -30 Atilde Ccedilla -30 '
+                 'Atilde G -35 Atilde Gbreve -35 Atilde Gcommaaccent -35 '
+                 'Atilde O -40 Atilde Oacute -40 Atilde Ocircumflex -40 '
+                 'Atilde Odieresis -40 Atilde Ograve -40 Atilde Ohungarumlaut '
+                 '-40 Atilde Omacron -40 Atilde Oslash -40 Atilde Otilde -40 '
+                 'Atilde Q -40 Atilde T -37 Atilde Tcaron -37 Atilde '
+                 'Tcommaaccent -37 Atilde U -50 Atilde Uacute -50 Atilde '
+                 'Ucircumflex -50 Atilde Udieresis -50 Atilde Ugrave -50 '
+                 'Atilde Uhungarumlaut -50 Atilde Umacron -50 Atilde Uogonek '
+                 '-50 Atilde Uring -50 Atilde V -105 Atilde W -95 Atilde Y '
+                 '-55 Atilde Yacute -55 Atilde Ydieresis -55 Atilde '
+                 'quoteright -37 Atilde u -20 Atilde uacute -20 Atilde '
+                 'ucircumflex -20 Atilde udieresis -20 Atilde ugrave -20 '
+                 'Atilde uhungarumlaut -20 Atilde umacron -20 Atilde uogonek '
+                 '-20 Atilde uring -20 Atilde v -55 Atilde w -55 Atilde y -55 '
+                 'Atilde yacute -55 Atilde ydieresis -55 B A -25 B Aacute -25 '
+                 'B Abreve -25 B Acircumflex -25 B Adieresis -25 B Agrave -25 '
+                 'B Amacron -25 B Aogonek -25 B Aring -25 B Atilde -25 B U '
+                 '-10 B Uacute -10 B Ucircumflex -10 B Udieresis -10 B Ugrave '
+                 '-10 B Uhungarumlaut -10 B Umacron -10 B Uogonek -10 B Uring '
+                 '-10 D A -35 D Aacute -35 D Abreve -35 D Acircumflex -35 D '
+                 'Adieresis -35 D Agrave -35 D Amacron -35 D Aogonek -35 D '
+                 'Aring -35 D Atilde -35 D V -40 D W -40 D Y -40 D Yacute -40 '
+                 'D Ydieresis -40 Dcaron A -35 Dcaron Aacute -35 Dcaron '
+                 'Abreve -35 Dcaron Acircumflex -35 Dcaron Adieresis -35 '
+                 'Dcaron Agrave -35 Dcaron Amacron -35 Dcaron Aogonek -35 '
+                 'Dcaron Aring -35 Dcaron Atilde -35 Dcaron V -40 Dcaron W '
+                 '-40 Dcaron Y -40 Dcaron Yacute -40 Dcaron Ydieresis -40 '
+                 'Dcroat A -35 Dcroat Aacute -35 Dcroat Abreve -35 Dcroat '
+                 'Acircumflex -35 Dcroat Adieresis -35 Dcroat Agrave -35 '
+                 'Dcroat Amacron -35 Dcroat Aogonek -35 Dcroat Aring -35 '
+                 'Dcroat Atilde -35 Dcroat V -40 Dcroat W -40 Dcroat Y -40 '
+                 'Dcroat Yacute -40 Dcroat Ydieresis -40 F A -115 F Aacute '
+                 '-115 F Abreve -115 F Acircumflex -115 F Adieresis -115 F '
+                 'Agrave -115 F Amacron -115 F Aogonek -115 F Aring -115 F '
+                 'Atilde -115 F a -75 F aacute -75 F abreve -75 F acircumflex '
+                 '-75 F adieresis -75 F agrave -75 F amacron -75 F aogonek '
+                 '-75 F aring -75 F atilde -75 F comma -135 F e -75 F eacute '
+                 '-75 F ecaron -75 F ecircumflex -75 F edieresis -75 F '
+                 'edotaccent -75 F egrave -75 F emacron -75 F eogonek -75 F i '
+                 '-45 F iacute -45 F icircumflex -45 F idieresis -45 F igrave '
+                 '-45 F imacron -45 F iogonek -45 F o -105 F oacute -105 F '
+                 'ocircumflex -105 F odieresis -105 F ograve -105 F '
+                 'ohungarumlaut -105 F omacron -105 F oslash -105 F otilde '
+                 '-105 F period -135 F r -55 F racute -55 F rcaron -55 F '
+                 'rcommaaccent -55 J A -40 J Aacute -40 J Abreve -40 J '
+                 'Acircumflex -40 J Adieresis -40 J Agrave -40 J Amacron -40 '
+                 'J Aogonek -40 J Aring -40 J Atilde -40 J a -35 J aacute -35 '
+                 'J abreve -35 J acircumflex -35 J adieresis -35 J agrave -35 '
+                 'J amacron -35 J aogonek -35 J aring -35 J atilde -35 J '
+                 'comma -25 J e -25 J eacute -25 J ecaron -25 J ecircumflex '
+                 '-25 J edieresis -25 J edotaccent -25 J egrave -25 J emacron '
+                 '-25 J eogonek -25 J o -25 J oacute -25 J ocircumflex -25 J '
+                 'odieresis -25 J ograve -25 J ohungarumlaut -25 J omacron '
+                 '-25 J oslash -25 J otilde -25 J period -25 J u -35 J uacute '
+                 '-35 J ucircumflex -35 J udieresis -35 J ugrave -35 J '
+                 'uhungarumlaut -35 J umacron -35 J uogonek -35 J uring -35 K '
+                 'O -50 K Oacute -50 K Ocircumflex -50 K Odieresis -50 K '
+                 'Ograve -50 K Ohungarumlaut -50 K Omacron -50 K Oslash -50 K '
+                 'Otilde -50 K e -35 K eacute -35 K ecaron -35 K ecircumflex '
+                 '-35 K edieresis -35 K edotaccent -35 K egrave -35 K emacron '
+                 '-35 K eogonek -35 K o -40 K oacute -40 K ocircumflex -40 K '
+                 'odieresis -40 K ograve -40 K ohungarumlaut -40 K omacron '
+                 '-40 K oslash -40 K otilde -40 K u -40 K uacute -40 K '
+                 'ucircumflex -40 K udieresis -40 K ugrave -40 K '
+                 'uhungarumlaut -40 K umacron -40 K uogonek -40 K uring -40 K '
+                 'y -40 K yacute -40 K ydieresis -40 Kcommaaccent O -50 '
+                 'Kcommaaccent Oacute -50 Kcommaaccent Ocircumflex -50 '
+                 'Kcommaaccent Odieresis -50 Kcommaaccent Ograve -50 '
+                 'Kcommaaccent Ohungarumlaut -50 Kcommaaccent Omacron -50 '
+                 'Kcommaaccent Oslash -50 Kcommaaccent Otilde -50 '
+                 'Kcommaaccent e -35 Kcommaaccent eacute -35 Kcommaaccent '
+                 'ecaron -35 Kcommaaccent ecircumflex -35 Kcommaaccent '
+                 'edieresis -35 Kcommaaccent edotaccent -35 Kcommaaccent '
+                 'egrave -35 Kcommaaccent emacron -35 Kcommaaccent eogonek '
+                 '-35 Kcommaaccent o -40 Kcommaaccent oacute -40 Kcommaaccent '
+                 'ocircumflex -40 Kcommaaccent odieresis -40 Kcommaaccent '
+                 'ograve -40 Kcommaaccent ohungarumlaut -40 Kcommaaccent '
+                 'omacron -40 Kcommaaccent oslash -40 Kcommaaccent otilde -40 '
+                 'Kcommaaccent u -40 Kcommaaccent uacute -40 Kcommaaccent '
+                 'ucircumflex -40 Kcommaaccent udieresis -40 Kcommaaccent '
+                 'ugrave -40 Kcommaaccent uhungarumlaut -40 Kcommaaccent '
+                 'umacron -40 Kcommaaccent uogonek -40 Kcommaaccent uring -40 '
+                 'Kcommaaccent y -40 Kcommaaccent yacute -40 Kcommaaccent '
+                 'ydieresis -40 L T -20 L Tcaron -20 L Tcommaaccent -20 L V '
+                 '-55 L W -55 L Y -20 L Yacute -20 L Ydieresis -20 L '
+                 'quoteright -37 L y -30 L yacute -30 L ydieresis -30 Lacute '
+                 'T -20 Lacute Tcaron -20 Lacute Tcommaaccent -20 Lacute V '
+                 '-55 Lacute W -55 Lacute Y -20 Lacute Yacute -20 Lacute '
+                 'Ydieresis -20 Lacute quoteright -37 Lacute y -30 Lacute '
+                 'yacute -30 Lacute ydieresis -30 Lcommaaccent T -20 '
+                 'Lcommaaccent Tcaron -20 Lcommaaccent Tcommaaccent -20 '
+                 'Lcommaaccent V -55 Lcommaaccent W -55 Lcommaaccent Y -20 '
+                 'Lcommaaccent Yacute -20 Lcommaaccent Ydieresis -20 '
+                 'Lcommaaccent quoteright -37 Lcommaaccent y -30 Lcommaaccent '
+                 'yacute -30 Lcommaaccent ydieresis -30 Lslash T -20 Lslash '
+                 'Tcaron -20 Lslash Tcommaaccent -20 Lslash V -55 Lslash W '
+                 '-55 Lslash Y -20 Lslash Yacute -20 Lslash Ydieresis -20 '
+                 'Lslash quoteright -37 Lslash y -30 Lslash yacute -30 Lslash '
+                 'ydieresis -30 N A -27 N Aacute -27 N Abreve -27 N '
+                 'Acircumflex -27 N Adieresis -27 N Agrave -27 N Amacron -27 '
+                 'N Aogonek -27 N Aring -27 N Atilde -27 Nacute A -27 Nacute '
+                 'Aacute -27 Nacute Abreve -27 Nacute Acircumflex -27 Nacute '
+                 'Adieresis -27 Nacute Agrave -27 Nacute Amacron -27 Nacute '
+                 'Aogonek -27 Nacute Aring -27 Nacute Atilde -27 Ncaron A -27 '
+                 'Ncaron Aacute -27 Ncaron Abreve -27 Ncaron Acircumflex -27 '
+                 'Ncaron Adieresis -27 Ncaron Agrave -27 Ncaron Amacron -27 '
+                 'Ncaron Aogonek -27 Ncaron Aring -27 Ncaron Atilde -27 '
+                 'Ncommaaccent A -27 Ncommaaccent Aacute -27 Ncommaaccent '
+                 'Abreve -27 Ncommaaccent Acircumflex -27 Ncommaaccent '
+                 'Adieresis -27 Ncommaaccent Agrave -27 Ncommaaccent Amacron '
+                 '-27 Ncommaaccent Aogonek -27 Ncommaaccent Aring -27 '
+                 'Ncommaaccent Atilde -27 Ntilde A -27 Ntilde Aacute -27 '
+                 'Ntilde Abreve -27 Ntilde Acircumflex -27 Ntilde Adieresis '
+                 '-27 Ntilde Agrave -27 Ntilde Amacron -27 Ntilde Aogonek -27 '
+                 'Ntilde Aring -27 Ntilde Atilde -27 O A -55 O Aacute -55 O '
+                 'Abreve -55 O Acircumflex -55 O Adieresis -55 O Agrave -55 O '
+                 'Amacron -55 O Aogonek -55 O Aring -55 O Atilde -55 O T -40 '
+                 'O Tcaron -40 O Tcommaaccent -40 O V -50 O W -50 O X -40 O Y '
+                 '-50 O Yacute -50 O Ydieresis -50 Oacute A -55 Oacute Aacute '
+                 '-55 Oacute Abreve -55 Oacute Acircumflex -55 Oacute '
+                 'Adieresis -55 Oacute Agrave -55 Oacute Amacron -55 Oacute '
+                 'Aogonek -55 Oacute Aring -55 Oacute Atilde -55 Oacute T -40 '
+                 'Oacute Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 '
+                 'Oacute W -50 Oacute X -40 Oacute Y -50 Oacute Yacute -50 '
+                 'Oacute Ydieresis -50 Ocircumflex A -55 Ocircumflex Aacute '
+                 '-55 Ocircumflex Abreve -55 Ocircumflex Acircumflex -55 '
+                 'Ocircumflex Adieresis -55 Ocircumflex Agrave -55 '
+                 'Ocircumflex Amacron -55 Ocircumflex Aogonek -55 Ocircumflex '
+                 'Aring -55 Ocircumflex Atilde -55 Ocircumflex T -40 '
+                 'Ocircumflex Tcaron -40 Ocircumflex Tcommaaccent -40 '
+                 'Ocircumflex V -50 Ocircumflex W -50 Ocircumflex X -40 '
+                 'Ocircumflex Y -50 Ocircumflex Yacute -50 Ocircumflex '
+                 'Ydieresis -50 Odieresis A -55 Odieresis Aacute -55 '
+                 'Odieresis Abreve -55 Odieresis Acircumflex -55 Odieresis '
+                 'Adieresis -55 Odieresis Agrave -55 Odieresis Amacron -55 '
+                 'Odieresis Aogonek -55 Odieresis Aring -55 Odieresis Atilde '
+                 '-55 Odieresis T -40 Odieresis Tcaron -40 Odieresis '
+                 'Tcommaaccent -40 Odieresis V -50 Odieresis W -50 Odieresis '
+                 'X -40 Odieresis Y -50 Odieresis Yacute -50 Odieresis '
+                 'Ydieresis -50 Ograve A -55 Ograve Aacute -55 Ograve Abreve '
+                 '-55 Ograve Acircumflex -55 Ograve Adieresis -55 Ograve '
+                 'Agrave -55 Ograve Amacron -55 Ograve Aogonek -55 Ograve '
+                 'Aring -55 Ograve Atilde -55 Ograve T -40 Ograve Tcaron -40 '
+                 'Ograve Tcommaaccent -40 Ograve V -50 Ograve W -50 Ograve X '
+                 '-40 Ograve Y -50 Ograve Yacute -50 Ograve Ydieresis -50 '
+                 'Ohungarumlaut A -55 Ohungarumlaut Aacute -55 Ohungarumlaut '
+                 'Abreve -55 Ohungarumlaut Acircumflex -55 Ohungarumlaut '
+                 'Adieresis -55 Ohungarumlaut Agrave -55 Ohungarumlaut '
+                 'Amacron -55 Ohungarumlaut Aogonek -55 Ohungarumlaut Aring '
+                 '-55 Ohungarumlaut Atilde -55 Ohungarumlaut T -40 '
+                 'Ohungarumlaut Tcaron -40 Ohungarumlaut Tcommaaccent -40 '
+                 'Ohungarumlaut V -50 Ohungarumlaut W -50 Ohungarumlaut X -40 '
+                 'Ohungarumlaut Y -50 Ohungarumlaut Yacute -50 Ohungarumlaut '
+                 'Ydieresis -50 Omacron A -55 Omacron Aacute -55 Omacron '
+                 'Abreve -55 Omacron Acircumflex -55 Omacron Adieresis -55 '
+                 'Omacron Agrave -55 Omacron Amacron -55 Omacron Aogonek -55 '
+                 'Omacron Aring -55 Omacron Atilde -55 Omacron T -40 Omacron '
+                 'Tcaron -40 Omacron Tcommaaccent -40 Omacron V -50 Omacron W '
+                 '-50 Omacron X -40 Omacron Y -50 Omacron Yacute -50 Omacron '
+                 'Ydieresis -50 Oslash A -55 Oslash Aacute -55 Oslash Abreve '
+                 '-55 Oslash Acircumflex -55 Oslash Adieresis -55 Oslash '
+                 'Agrave -55 Oslash Amacron -55 Oslash Aogonek -55 Oslash '
+                 'Aring -55 Oslash Atilde -55 Oslash T -40 Oslash Tcaron -40 '
+                 'Oslash Tcommaaccent -40 Oslash V -50 Oslash W -50 Oslash X '
+                 '-40 Oslash Y -50 Oslash Yacute -50 Oslash Ydieresis -50 '
+                 'Otilde A -55 Otilde Aacute -55 Otilde Abreve -55 Otilde '
+                 'Acircumflex -55 Otilde Adieresis -55 Otilde Agrave -55 '
+                 'Otilde Amacron -55 Otilde Aogonek -55 Otilde Aring -55 '
+                 'Otilde Atilde -55 Otilde T -40 Otilde Tcaron -40 Otilde '
+                 'Tcommaaccent -40 Otilde V -50 Otilde W -50 Otilde X -40 '
+                 'Otilde Y -50 Otilde Yacute -50 Otilde Ydieresis -50 P A -90 '
+                 'P Aacute -90 P Abreve -90 P Acircumflex -90 P Adieresis -90 '
+                 'P Agrave -90 P Amacron -90 P Aogonek -90 P Aring -90 P '
+                 'Atilde -90 P a -80 P aacute -80 P abreve -80 P acircumflex '
+                 '-80 P adieresis -80 P agrave -80 P amacron -80 P aogonek '
+                 '-80 P aring -80 P atilde -80 P comma -135 P e -80 P eacute '
+                 '-80 P ecaron -80 P ecircumflex -80 P edieresis -80 P '
+                 'edotaccent -80 P egrave -80 P emacron -80 P eogonek -80 P o '
+                 '-80 P oacute -80 P ocircumflex -80 P odieresis -80 P ograve '
+                 '-80 P ohungarumlaut -80 P omacron -80 P oslash -80 P otilde '
+                 '-80 P period -135 Q U -10 Q Uacute -10 Q Ucircumflex -10 Q '
+                 'Udieresis -10 Q Ugrave -10 Q Uhungarumlaut -10 Q Umacron '
+                 '-10 Q Uogonek -10 Q Uring -10 R O -40 R Oacute -40 R '
+                 'Ocircumflex -40 R Odieresis -40 R Ograve -40 R '
+                 'Ohungarumlaut -40 R Omacron -40 R Oslash -40 R Otilde -40 R '
+                 'U -40 R Uacute -40 R Ucircumflex -40 R Udieresis -40 R '
+                 'Ugrave -40 R Uhungarumlaut -40 R Umacron -40 R Uogonek -40 '
+                 'R Uring -40 R V -18 R W -18 R Y -18 R Yacute -18 R '
+                 'Ydieresis -18 Racute O -40 Racute Oacute -40 Racute '
+                 'Ocircumflex -40 Racute Odieresis -40 Racute Ograve -40 '
+                 'Racute Ohungarumlaut -40 Racute Omacron -40 Racute Oslash '
+                 '-40 Racute Otilde -40 Racute U -40 Racute Uacute -40 Racute '
+                 'Ucircumflex -40 Racute Udieresis -40 Racute Ugrave -40 '
+                 'Racute Uhungarumlaut -40 Racute Umacron -40 Racute Uogonek '
+                 '-40 Racute Uring -40 Racute V -18 Racute W -18 Racute Y -18 '
+                 'Racute Yacute -18 Racute Ydieresis -18 Rcaron O -40 Rcaron '
+                 'Oacute -40 Rcaron Ocircumflex -40 Rcaron Odieresis -40 '
+                 'Rcaron Ograve -40 Rcaron Ohungarumlaut -40 Rcaron Omacron '
+                 '-40 Rcaron Oslash -40 Rcaron Otilde -40 Rcaron U -40 Rcaron '
+                 'Uacute -40 Rcaron Ucircumflex -40 Rcaron Udieresis -40 '
+                 'Rcaron Ugrave -40 Rcaron Uhungarumlaut -40 Rcaron Umacron '
+                 '-40 Rcaron Uogonek -40 Rcaron Uring -40 Rcaron V -18 Rcaron '
+                 'W -18 Rcaron Y -18 Rcaron Yacute -18 Rcaron Ydieresis -18 '
+                 'Rcommaaccent O -40 Rcommaaccent Oacute -40 Rcommaaccent '
+                 'Ocircumflex -40 Rcommaaccent Odieresis -40 Rcommaaccent '
+                 'Ograve -40 Rcommaaccent Ohungarumlaut -40 Rcommaaccent '
+                 'Omacron -40 Rcommaaccent Oslash -40 Rcommaaccent Otilde -40 '
+                 'Rcommaaccent U -40 Rcommaaccent Uacute -40 Rcommaaccent '
+                 'Ucircumflex -40 Rcommaaccent Udieresis -40 Rcommaaccent '
+                 'Ugrave -40 Rcommaaccent Uhungarumlaut -40 Rcommaaccent '
+                 'Umacron -40 Rcommaaccent Uogonek -40 Rcommaaccent Uring -40 '
+                 'Rcommaaccent V -18 Rcommaaccent W -18 Rcommaaccent Y -18 '
+                 'Rcommaaccent Yacute -18 Rcommaaccent Ydieresis -18 T A -50 '
+                 'T Aacute -50 T Abreve -50 T Acircumflex -50 T Adieresis -50 '
+                 'T Agrave -50 T Amacron -50 T Aogonek -50 T Aring -50 T '
+                 'Atilde -50 T O -18 T Oacute -18 T Ocircumflex -18 T '
+                 'Odieresis -18 T Ograve -18 T Ohungarumlaut -18 T Omacron '
+                 '-18 T Oslash -18 T Otilde -18 T a -92 T aacute -92 T abreve '
+                 '-92 T acircumflex -92 T adieresis -92 T agrave -92 T '
+                 'amacron -92 T aogonek -92 T aring -92 T atilde -92 T colon '
+                 '-55 T comma -74 T e -92 T eacute -92 T ecaron -92 T '
+                 'ecircumflex -52 T edieresis -52 T edotaccent -92 T egrave '
+                 '-52 T emacron -52 T eogonek -92 T hyphen -74 T i -55 T '
+                 'iacute -55 T iogonek -55 T o -92 T oacute -92 T ocircumflex '
+                 '-92 T odieresis -92 T ograve -92 T ohungarumlaut -92 T '
+                 'omacron -92 T oslash -92 T otilde -92 T period -74 T r -55 '
+                 'T racute -55 T rcaron -55 T rcommaaccent -55 T semicolon '
+                 '-65 T u -55 T uacute -55 T ucircumflex -55 T udieresis -55 '
+                 'T ugrave -55 T uhungarumlaut -55 T umacron -55 T uogonek '
+                 '-55 T uring -55 T w -74 T y -74 T yacute -74 T ydieresis '
+                 '-34 Tcaron A -50 Tcaron Aacute -50 Tcaron Abreve -50 Tcaron '
+                 'Acircumflex -50 Tcaron Adieresis -50 Tcaron Agrave -50 '
+                 'Tcaron Amacron -50 Tcaron Aogonek -50 Tcaron Aring -50 '
+                 'Tcaron Atilde -50 Tcaron O -18 Tcaron Oacute -18 Tcaron '
+                 'Ocircumflex -18 Tcaron Odieresis -18 Tcaron Ograve -18 '
+                 'Tcaron Ohungarumlaut -18 Tcaron Omacron -18 Tcaron Oslash '
+                 '-18 Tcaron Otilde -18 Tcaron a -92 Tcaron aacute -92 Tcaron '
+                 'abreve -92 Tcaron acircumflex -92 Tcaron adieresis -92 '
+                 'Tcaron agrave -92 Tcaron amacron -92 Tcaron aogonek -92 '
+                 'Tcaron aring -92 Tcaron atilde -92 Tcaron colon -55 Tcaron '
+                 'comma -74 Tcaron e -92 Tcaron eacute -92 Tcaron ecaron -92 '
+                 'Tcaron ecircumflex -52 Tcaron edieresis -52 Tcaron '
+                 'edotaccent -92 Tcaron egrave -52 Tcaron emacron -52 Tcaron '
+                 'eogonek -92 Tcaron hyphen -74 Tcaron i -55 Tcaron iacute '
+                 '-55 Tcaron iogonek -55 Tcaron o -92 Tcaron oacute -92 '
+                 'Tcaron ocircumflex -92 Tcaron odieresis -92 Tcaron ograve '
+                 '-92 Tcaron ohungarumlaut -92 Tcaron omacron -92 Tcaron '
+                 'oslash -92 Tcaron otilde -92 Tcaron period -74 Tcaron r -55 '
+                 'Tcaron racute -55 Tcaron rcaron -55 Tcaron rcommaaccent -55 '
+                 'Tcaron semicolon -65 Tcaron u -55 Tcaron uacute -55 Tcaron '
+                 'ucircumflex -55 Tcaron udieresis -55 Tcaron ugrave -55 '
+                 'Tcaron uhungarumlaut -55 Tcaron umacron -55 Tcaron uogonek '
+                 '-55 Tcaron uring -55 Tcaron w -74 Tcaron y -74 Tcaron '
+                 'yacute -74 Tcaron ydieresis -34 Tcommaaccent A -50 '
+                 'Tcommaaccent Aacute -50 Tcommaaccent Abreve -50 '
+                 'Tcommaaccent Acircumflex -50 Tcommaaccent Adieresis -50 '
+                 'Tcommaaccent Agrave -50 Tcommaaccent Amacron -50 '
+                 'Tcommaaccent Aogonek -50 Tcommaaccent Aring -50 '
+                 'Tcommaaccent Atilde -50 Tcommaaccent O -18 Tcommaaccent '
+                 'Oacute -18 Tcommaaccent Ocircumflex -18 Tcommaaccent '
+                 'Odieresis -18 Tcommaaccent Ograve -18 Tcommaaccent '
+                 'Ohungarumlaut -18 Tcommaaccent Omacron -18 Tcommaaccent '
+                 'Oslash -18 Tcommaaccent Otilde -18 Tcommaaccent a -92 '
+                 'Tcommaaccent aacute -92 Tcommaaccent abreve -92 '
+                 'Tcommaaccent acircumflex -92 Tcommaaccent adieresis -92 '
+                 'Tcommaaccent agrave -92 Tcommaaccent amacron -92 '
+                 'Tcommaaccent aogonek -92 Tcommaaccent aring -92 '
+                 'Tcommaaccent atilde -92 Tcommaaccent colon -55 Tcommaaccent '
+                 'comma -74 Tcommaaccent e -92 Tcommaaccent eacute -92 '
+                 'Tcommaaccent ecaron -92 Tcommaaccent ecircumflex -52 '
+                 'Tcommaaccent edieresis -52 Tcommaaccent edotaccent -92 '
+                 'Tcommaaccent egrave -52 Tcommaaccent emacron -52 '
+                 'Tcommaaccent eogonek -92 Tcommaaccent hyphen -74 '
+                 'Tcommaaccent i -55 Tcommaaccent iacute -55 Tcommaaccent '
+                 'iogonek -55 Tcommaaccent o -92 Tcommaaccent oacute -92 '
+                 'Tcommaaccent ocircumflex -92 Tcommaaccent odieresis -92 '
+                 'Tcommaaccent ograve -92 Tcommaaccent ohungarumlaut -92 '
+                 'Tcommaaccent omacron -92 Tcommaaccent oslash -92 '
+                 'Tcommaaccent otilde -92 Tcommaaccent period -74 '
+                 'Tcommaaccent r -55 Tcommaaccent racute -55 Tcommaaccent '
+                 'rcaron -55 Tcommaaccent rcommaaccent -55 Tcommaaccent '
+                 'semicolon -65 Tcommaaccent u -55 Tcommaaccent uacute -55 '
+                 'Tcommaaccent ucircumflex -55 Tcommaaccent udieresis -55 '
+                 'Tcommaaccent ugrave -55 Tcommaaccent uhungarumlaut -55 '
+                 'Tcommaaccent umacron -55 Tcommaaccent uogonek -55 '
+                 'Tcommaaccent uring -55 Tcommaaccent w -74 Tcommaaccent y '
+                 '-74 Tcommaaccent yacute -74 Tcommaaccent ydieresis -34 U A '
+                 '-40 U Aacute -40 U Abreve -40 U Acircumflex -40 U Adieresis '
+                 '-40 U Agrave -40 U Amacron -40 U Aogonek -40 U Aring -40 U '
+                 'Atilde -40 U comma -25 U period -25 Uacute A -40 Uacute '
+                 'Aacute -40 Uacute Abreve -40 Uacute Acircumflex -40 Uacute '
+                 'Adieresis -40 Uacute Agrave -40 Uacute Amacron -40 Uacute '
+                 'Aogonek -40 Uacute Aring -40 Uacute Atilde -40 Uacute comma '
+                 '-25 Uacute period -25 Ucircumflex A -40 Ucircumflex Aacute '
+                 '-40 Ucircumflex Abreve -40 Ucircumflex Acircumflex -40 '
+                 'Ucircumflex Adieresis -40 Ucircumflex Agrave -40 '
+                 'Ucircumflex Amacron -40 Ucircumflex Aogonek -40 Ucircumflex '
+                 'Aring -40 Ucircumflex Atilde -40 Ucircumflex comma -25 '
+                 'Ucircumflex period -25 Udieresis A -40 Udieresis Aacute -40 '
+                 'Udieresis Abreve -40 Udieresis Acircumflex -40 Udieresis '
+                 'Adieresis -40 Udieresis Agrave -40 Udieresis Amacron -40 '
+                 'Udieresis Aogonek -40 Udieresis Aring -40 Udieresis Atilde '
+                 '-40 Udieresis comma -25 Udieresis period -25 Ugrave A -40 '
+                 'Ugrave Aacute -40 Ugrave Abreve -40 Ugrave Acircumflex -40 '
+                 'Ugrave Adieresis -40 Ugrave Agrave -40 Ugrave Amacron -40 '
+                 'Ugrave Aogonek -40 Ugrave Aring -40 Ugrave Atilde -40 '
+                 'Ugrave comma -25 Ugrave period -25 Uhungarumlaut A -40 '
+                 'Uhungarumlaut Aacute -40 Uhungarumlaut Abreve -40 '
+                 'Uhungarumlaut Acircumflex -40 Uhungarumlaut Adieresis -40 '
+                 'Uhungarumlaut Agrave -40 Uhungarumlaut Amacron -40 '
+                 'Uhungarumlaut Aogonek -40 Uhungarumlaut Aring -40 '
+                 'Uhungarumlaut Atilde -40 Uhungarumlaut comma -25 '
+                 'Uhungarumlaut period -25 Umacron A -40 Umacron Aacute -40 '
+                 'Umacron Abreve -40 Umacron Acircumflex -40 Umacron '
+                 'Adieresis -40 Umacron Agrave -40 Umacron Amacron -40 '
+                 'Umacron Aogonek -40 Umacron Aring -40 Umacron Atilde -40 '
+                 'Umacron comma -25 Umacron period -25 Uogonek A -40 Uogonek '
+                 'Aacute -40 Uogonek Abreve -40 Uogonek Acircumflex -40 '
+                 'Uogonek Adieresis -40 Uogonek Agrave -40 Uogonek Amacron '
+                 '-40 Uogonek Aogonek -40 Uogonek Aring -40 Uogonek Atilde '
+                 '-40 Uogonek comma -25 Uogonek period -25 Uring A -40 Uring '
+                 'Aacute -40 Uring Abreve -40 Uring Acircumflex -40 Uring '
+                 'Adieresis -40 Uring Agrave -40 Uring Amacron -40 Uring '
+                 'Aogonek -40 Uring Aring -40 Uring Atilde -40 Uring comma '
+                 '-25 Uring period -25 V A -60 V Aacute -60 V Abreve -60 V '
+                 'Acircumflex -60 V Adieresis -60 V Agrave -60 V Amacron -60 '
+                 'V Aogonek -60 V Aring -60 V Atilde -60 V O -30 V Oacute -30 '
+                 'V Ocircumflex -30 V Odieresis -30 V Ograve -30 V '
+                 'Ohungarumlaut -30 V Omacron -30 V Oslash -30 V Otilde -30 V '
+                 'a -111 V aacute -111 V abreve -111 V acircumflex -111 V '
+                 'adieresis -111 V agrave -111 V amacron -111 V aogonek -111 '
+                 'V aring -111 V atilde -111 V colon -65 V comma -129 V e '
+                 '-111 V eacute -111 V ecaron -111 V ecircumflex -111 V '
+                 'edieresis -71 V edotaccent -111 V egrave -71 V emacron -71 '
+                 'V eogonek -111 V hyphen -55 V i -74 V iacute -74 V '
+                 'icircumflex -34 V idieresis -34 V igrave -34 V imacron -34 '
+                 'V iogonek -74 V o -111 V oacute -111 V ocircumflex -111 V '
+                 'odieresis -111 V ograve -111 V ohungarumlaut -111 V omacron '
+                 '-111 V oslash -111 V otilde -111 V period -129 V semicolon '
+                 '-74 V u -74 V uacute -74 V ucircumflex -74 V udieresis -74 '
+                 'V ugrave -74 V uhungarumlaut -74 V umacron -74 V uogonek '
+                 '-74 V uring -74 W A -60 W Aacute -60 W Abreve -60 W '
+                 'Acircumflex -60 W Adieresis -60 W Agrave -60 W Amacron -60 '
+                 'W Aogonek -60 W Aring -60 W Atilde -60 W O -25 W Oacute -25 '
+                 'W Ocircumflex -25 W Odieresis -25 W Ograve -25 W '
+                 'Ohungarumlaut -25 W Omacron -25 W Oslash -25 W Otilde -25 W '
+                 'a -92 W aacute -92 W abreve -92 W acircumflex -92 W '
+                 'adieresis -92 W agrave -92 W amacron -92 W aogonek -92 W '
+                 'aring -92 W atilde -92 W colon -65 W comma -92 W e -92 W '
+                 'eacute -92 W ecaron -92 W ecircumflex -92 W edieresis -52 W '
+                 'edotaccent -92 W egrave -52 W emacron -52 W eogonek -92 W '
+                 'hyphen -37 W i -55 W iacute -55 W iogonek -55 W o -92 W '
+                 'oacute -92 W ocircumflex -92 W odieresis -92 W ograve -92 W '
+                 'ohungarumlaut -92 W omacron -92 W oslash -92 W otilde -92 W '
+                 'period -92 W semicolon -65 W u -55 W uacute -55 W '
+                 'ucircumflex -55 W udieresis -55 W ugrave -55 W '
+                 'uhungarumlaut -55 W umacron -55 W uogonek -55 W uring -55 W '
+                 'y -70 W yacute -70 W ydieresis -70 Y A -50 Y Aacute -50 Y '
+                 'Abreve -50 Y Acircumflex -50 Y Adieresis -50 Y Agrave -50 Y '
+                 'Amacron -50 Y Aogonek -50 Y Aring -50 Y Atilde -50 Y O -15 '
+                 'Y Oacute -15 Y Ocircumflex -15 Y Odieresis -15 Y Ograve -15 '
+                 'Y Ohungarumlaut -15 Y Omacron -15 Y Oslash -15 Y Otilde -15 '
+                 'Y a -92 Y aacute -92 Y abreve -92 Y acircumflex -92 Y '
+                 'adieresis -92 Y agrave -92 Y amacron -92 Y aogonek -92 Y '
+                 'aring -92 Y atilde -92 Y colon -65 Y comma -92 Y e -92 Y '
+                 'eacute -92 Y ecaron -92 Y ecircumflex -92 Y edieresis -52 Y '
+                 'edotaccent -92 Y egrave -52 Y emacron -52 Y eogonek -92 Y '
+                 'hyphen -74 Y i -74 Y iacute -74 Y icircumflex -34 Y '
+                 'idieresis -34 Y igrave -34 Y imacron -34 Y iogonek -74 Y o '
+                 '-92 Y oacute -92 Y ocircumflex -92 Y odieresis -92 Y ograve '
+                 '-92 Y ohungarumlaut -92 Y omacron -92 Y oslash -92 Y otilde '
+                 '-92 Y period -92 Y semicolon -65 Y u -92 Y uacute -92 Y '
+                 'ucircumflex -92 Y udieresis -92 Y ugrave -92 Y '
+                 'uhungarumlaut -92 Y umacron -92 Y uogonek -92 Y uring -92 '
+                 'Yacute A -50 Yacute Aacute -50 Yacute Abreve -50 Yacute '
+                 'Acircumflex -50 Yacute Adieresis -50 Yacute Agrave -50 '
+                 'Yacute Amacron -50 Yacute Aogonek -50 Yacute Aring -50 '
+                 'Yacute Atilde -50 Yacute O -15 Yacute Oacute -15 Yacute '
+                 'Ocircumflex -15 Yacute Odieresis -15 Yacute Ograve -15 '
+                 'Yacute Ohungarumlaut -15 Yacute Omacron -15 Yacute Oslash '
+                 '-15 Yacute Otilde -15 Yacute a -92 Yacute aacute -92 Yacute '
+                 'abreve -92 Yacute acircumflex -92 Yacute adieresis -92 '
+                 'Yacute agrave -92 Yacute amacron -92 Yacute aogonek -92 '
+                 'Yacute aring -92 Yacute atilde -92 Yacute colon -65 Yacute '
+                 'comma -92 Yacute e -92 Yacute eacute -92 Yacute ecaron -92 '
+                 'Yacute ecircumflex -92 Yacute edieresis -52 Yacute '
+                 'edotaccent -92 Yacute egrave -52 Yacute emacron -52 Yacute '
+                 'eogonek -92 Yacute hyphen -74 Yacute i -74 Yacute iacute '
+                 '-74 Yacute icircumflex -34 Yacute idieresis -34 Yacute '
+                 'igrave -34 Yacute imacron -34 Yacute iogonek -74 Yacute o '
+                 '-92 Yacute oacute -92 Yacute ocircumflex -92 Yacute '
+                 'odieresis -92 Yacute ograve -92 Yacute ohungarumlaut -92 '
+                 'Yacute omacron -92 Yacute oslash -92 Yacute otilde -92 '
+                 'Yacute period -92 Yacute semicolon -65 Yacute u -92 Yacute '
+                 'uacute -92 Yacute ucircumflex -92 Yacute udieresis -92 '
+                 'Yacute ugrave -92 Yacute uhungarumlaut -92 Yacute umacron '
+                 '-92 Yacute uogonek -92 Yacute uring -92 Ydieresis A -50 '
+                 'Ydieresis Aacute -50 Ydieresis Abreve -50 Ydieresis '
+                 'Acircumflex -50 Ydieresis Adieresis -50 Ydieresis Agrave '
+                 '-50 Ydieresis Amacron -50 Ydieresis Aogonek -50 Ydieresis '
+                 'Aring -50 Ydieresis Atilde -50 Ydieresis O -15 Ydieresis '
+                 'Oacute -15 Ydieresis Ocircumflex -15 Ydieresis Odieresis '
+                 '-15 Ydieresis Ograve -15 Ydieresis Ohungarumlaut -15 '
+                 'Ydieresis Omacron -15 Ydieresis Oslash -15 Ydieresis Otilde '
+                 '-15 Ydieresis a -92 Ydieresis aacute -92 Ydieresis abreve '
+                 '-92 Ydieresis acircumflex -92 Ydieresis adieresis -92 '
+                 'Ydieresis agrave -92 Ydieresis amacron -92 Ydieresis '
+                 'aogonek -92 Ydieresis aring -92 Ydieresis atilde -92 '
+                 'Ydieresis colon -65 Ydieresis comma -92 Ydieresis e -92 '
+                 'Ydieresis eacute -92 Ydieresis ecaron -92 Ydieresis '
+                 'ecircumflex -92 Ydieresis edieresis -52 Ydieresis '
+                 'edotaccent -92 Ydieresis egrave -52 Ydieresis emacron -52 '
+                 'Ydieresis eogonek -92 Ydieresis hyphen -74 Ydieresis i -74 '
+                 'Ydieresis iacute -74 Ydieresis icircumflex -34 Ydieresis '
+                 'idieresis -34 Ydieresis igrave -34 Ydieresis imacron -34 '
+                 'Ydieresis iogonek -74 Ydieresis o -92 Ydieresis oacute -92 '
+                 'Ydieresis ocircumflex -92 Ydieresis odieresis -92 Ydieresis '
+                 'ograve -92 Ydieresis ohungarumlaut -92 Ydieresis omacron '
+                 '-92 Ydieresis oslash -92 Ydieresis otilde -92 Ydieresis '
+                 'period -92 Ydieresis semicolon -65 Ydieresis u -92 '
+                 'Ydieresis uacute -92 Ydieresis ucircumflex -92 Ydieresis '
+                 'udieresis -92 Ydieresis ugrave -92 Ydieresis uhungarumlaut '
+                 '-92 Ydieresis umacron -92 Ydieresis uogonek -92 Ydieresis '
+                 'uring -92 a g -10 a gbreve -10 a gcommaaccent -10 aacute g '
+                 '-10 aacute gbreve -10 aacute gcommaaccent -10 abreve g -10 '
+                 'abreve gbreve -10 abreve gcommaaccent -10 acircumflex g -10 '
+                 'acircumflex gbreve -10 acircumflex gcommaaccent -10 '
+                 'adieresis g -10 adieresis gbreve -10 adieresis gcommaaccent '
+                 '-10 agrave g -10 agrave gbreve -10 agrave gcommaaccent -10 '
+                 'amacron g -10 amacron gbreve -10 amacron gcommaaccent -10 '
+                 'aogonek g -10 aogonek gbreve -10 aogonek gcommaaccent -10 '
+                 'aring g -10 aring gbreve -10 aring gcommaaccent -10 atilde '
+                 'g -10 atilde gbreve -10 atilde gcommaaccent -10 b period '
+                 '-40 b u -20 b uacute -20 b ucircumflex -20 b udieresis -20 '
+                 'b ugrave -20 b uhungarumlaut -20 b umacron -20 b uogonek '
+                 '-20 b uring -20 c h -15 c k -20 c kcommaaccent -20 cacute h '
+                 '-15 cacute k -20 cacute kcommaaccent -20 ccaron h -15 '
+                 'ccaron k -20 ccaron kcommaaccent -20 ccedilla h -15 '
+                 'ccedilla k -20 ccedilla kcommaaccent -20 comma '
+                 'quotedblright -140 comma quoteright -140 e comma -10 e g '
+                 '-40 e gbreve -40 e gcommaaccent -40 e period -15 e v -15 e '
+                 'w -15 e x -20 e y -30 e yacute -30 e ydieresis -30 eacute '
+                 'comma -10 eacute g -40 eacute gbreve -40 eacute '
+                 'gcommaaccent -40 eacute period -15 eacute v -15 eacute w '
+                 '-15 eacute x -20 eacute y -30 eacute yacute -30 eacute '
+                 'ydieresis -30 ecaron comma -10 ecaron g -40 ecaron gbreve '
+                 '-40 ecaron gcommaaccent -40 ecaron period -15 ecaron v -15 '
+                 'ecaron w -15 ecaron x -20 ecaron y -30 ecaron yacute -30 '
+                 'ecaron ydieresis -30 ecircumflex comma -10 ecircumflex g '
+                 '-40 ecircumflex gbreve -40 ecircumflex gcommaaccent -40 '
+                 'ecircumflex period -15 ecircumflex v -15 ecircumflex w -15 '
+                 'ecircumflex x -20 ecircumflex y -30 ecircumflex yacute -30 '
+                 'ecircumflex ydieresis -30 edieresis comma -10 edieresis g '
+                 '-40 edieresis gbreve -40 edieresis gcommaaccent -40 '
+                 'edieresis period -15 edieresis v -15 edieresis w -15 '
+                 'edieresis x -20 edieresis y -30 edieresis yacute -30 '
+                 'edieresis ydieresis -30 edotaccent comma -10 edotaccent g '
+                 '-40 edotaccent gbreve -40 edotaccent gcommaaccent -40 '
+                 'edotaccent period -15 edotaccent v -15 edotaccent w -15 '
+                 'edotaccent x -20 edotaccent y -30 edotaccent yacute -30 '
+                 'edotaccent ydieresis -30 egrave comma -10 egrave g -40 '
+                 'egrave gbreve -40 egrave gcommaaccent -40 egrave period -15 '
+                 'egrave v -15 egrave w -15 egrave x -20 egrave y -30 egrave '
+                 'yacute -30 egrave ydieresis -30 emacron comma -10 emacron g '
+                 '-40 emacron gbreve -40 emacron gcommaaccent -40 emacron '
+                 'period -15 emacron v -15 emacron w -15 emacron x -20 '
+                 'emacron y -30 emacron yacute -30 emacron ydieresis -30 '
+                 'eogonek comma -10 eogonek g -40 eogonek gbreve -40 eogonek '
+                 'gcommaaccent -40 eogonek period -15 eogonek v -15 eogonek w '
+                 '-15 eogonek x -20 eogonek y -30 eogonek yacute -30 eogonek '
+                 'ydieresis -30 f comma -10 f dotlessi -60 f f -18 f i -20 f '
+                 'iogonek -20 f period -15 f quoteright 92 g comma -10 g e '
+                 '-10 g eacute -10 g ecaron -10 g ecircumflex -10 g edieresis '
+                 '-10 g edotaccent -10 g egrave -10 g emacron -10 g eogonek '
+                 '-10 g g -10 g gbreve -10 g gcommaaccent -10 g period -15 '
+                 'gbreve comma -10 gbreve e -10 gbreve eacute -10 gbreve '
+                 'ecaron -10 gbreve ecircumflex -10 gbreve edieresis -10 '
+                 'gbreve edotaccent -10 gbreve egrave -10 gbreve emacron -10 '
+                 'gbreve eogonek -10 gbreve g -10 gbreve gbreve -10 gbreve '
+                 'gcommaaccent -10 gbreve period -15 gcommaaccent comma -10 '
+                 'gcommaaccent e -10 gcommaaccent eacute -10 gcommaaccent '
+                 'ecaron -10 gcommaaccent ecircumflex -10 gcommaaccent '
+                 'edieresis -10 gcommaaccent edotaccent -10 gcommaaccent '
+                 'egrave -10 gcommaaccent emacron -10 gcommaaccent eogonek '
+                 '-10 gcommaaccent g -10 gcommaaccent gbreve -10 gcommaaccent '
+                 'gcommaaccent -10 gcommaaccent period -15 k e -10 k eacute '
+                 '-10 k ecaron -10 k ecircumflex -10 k edieresis -10 k '
+                 'edotaccent -10 k egrave -10 k emacron -10 k eogonek -10 k o '
+                 '-10 k oacute -10 k ocircumflex -10 k odieresis -10 k ograve '
+                 '-10 k ohungarumlaut -10 k omacron -10 k oslash -10 k otilde '
+                 '-10 k y -10 k yacute -10 k ydieresis -10 kcommaaccent e -10 '
+                 'kcommaaccent eacute -10 kcommaaccent ecaron -10 '
+                 'kcommaaccent ecircumflex -10 kcommaaccent edieresis -10 '
+                 'kcommaaccent edotaccent -10 kcommaaccent egrave -10 '
+                 'kcommaaccent emacron -10 kcommaaccent eogonek -10 '
+                 'kcommaaccent o -10 kcommaaccent oacute -10 kcommaaccent '
+                 'ocircumflex -10 kcommaaccent odieresis -10 kcommaaccent '
+                 'ograve -10 kcommaaccent ohungarumlaut -10 kcommaaccent '
+                 'omacron -10 kcommaaccent oslash -10 kcommaaccent otilde -10 '
+                 'kcommaaccent y -10 kcommaaccent yacute -10 kcommaaccent '
+                 'ydieresis -10 n v -40 nacute v -40 ncaron v -40 '
+                 'ncommaaccent v -40 ntilde v -40 o g -10 o gbreve -10 o '
+                 'gcommaaccent -10 o v -10 oacute g -10 oacute gbreve -10 '
+                 'oacute gcommaaccent -10 oacute v -10 ocircumflex g -10 '
+                 'ocircumflex gbreve -10 ocircumflex gcommaaccent -10 '
+                 'ocircumflex v -10 odieresis g -10 odieresis gbreve -10 '
+                 'odieresis gcommaaccent -10 odieresis v -10 ograve g -10 '
+                 'ograve gbreve -10 ograve gcommaaccent -10 ograve v -10 '
+                 'ohungarumlaut g -10 ohungarumlaut gbreve -10 ohungarumlaut '
+                 'gcommaaccent -10 ohungarumlaut v -10 omacron g -10 omacron '
+                 'gbreve -10 omacron gcommaaccent -10 omacron v -10 oslash g '
+                 '-10 oslash gbreve -10 oslash gcommaaccent -10 oslash v -10 '
+                 'otilde g -10 otilde gbreve -10 otilde gcommaaccent -10 '
+                 'otilde v -10 period quotedblright -140 period quoteright '
+                 '-140 quoteleft quoteleft -111 quoteright d -25 quoteright '
+                 'dcroat -25 quoteright quoteright -111 quoteright r -25 '
+                 'quoteright racute -25 quoteright rcaron -25 quoteright '
+                 'rcommaaccent -25 quoteright s -40 quoteright sacute -40 '
+                 'quoteright scaron -40 quoteright scedilla -40 quoteright '
+                 'scommaaccent -40 quoteright space -111 quoteright t -30 '
+                 'quoteright tcommaaccent -30 quoteright v -10 r a -15 r '
+                 'aacute -15 r abreve -15 r acircumflex -15 r adieresis -15 r '
+                 'agrave -15 r amacron -15 r aogonek -15 r aring -15 r atilde '
+                 '-15 r c -37 r cacute -37 r ccaron -37 r ccedilla -37 r '
+                 'comma -111 r d -37 r dcroat -37 r e -37 r eacute -37 r '
+                 'ecaron -37 r ecircumflex -37 r edieresis -37 r edotaccent '
+                 '-37 r egrave -37 r emacron -37 r eogonek -37 r g -37 r '
+                 'gbreve -37 r gcommaaccent -37 r hyphen -20 r o -45 r oacute '
+                 '-45 r ocircumflex -45 r odieresis -45 r ograve -45 r '
+                 'ohungarumlaut -45 r omacron -45 r oslash -45 r otilde -45 r '
+                 'period -111 r q -37 r s -10 r sacute -10 r scaron -10 r '
+                 'scedilla -10 r scommaaccent -10 racute a -15 racute aacute '
+                 '-15 racute abreve -15 racute acircumflex -15 racute '
+                 'adieresis -15 racute agrave -15 racute amacron -15 racute '
+                 'aogonek -15 racute aring -15 racute atilde -15 racute c -37 '
+                 'racute cacute -37 racute ccaron -37 racute ccedilla -37 '
+                 'racute comma -111 racute d -37 racute dcroat -37 racute e '
+                 '-37 racute eacute -37 racute ecaron -37 racute ecircumflex '
+                 '-37 racute edieresis -37 racute edotaccent -37 racute '
+                 'egrave -37 racute emacron -37 racute eogonek -37 racute g '
+                 '-37 racute gbreve -37 racute gcommaaccent -37 racute hyphen '
+                 '-20 racute o -45 racute oacute -45 racute ocircumflex -45 '
+                 'racute odieresis -45 racute ograve -45 racute ohungarumlaut '
+                 '-45 racute omacron -45 racute oslash -45 racute otilde -45 '
+                 'racute period -111 racute q -37 racute s -10 racute sacute '
+                 '-10 racute scaron -10 racute scedilla -10 racute '
+                 'scommaaccent -10 rcaron a -15 rcaron aacute -15 rcaron '
+                 'abreve -15 rcaron acircumflex -15 rcaron adieresis -15 '
+                 'rcaron agrave -15 rcaron amacron -15 rcaron aogonek -15 '
+                 'rcaron aring -15 rcaron atilde -15 rcaron c -37 rcaron '
+                 'cacute -37 rcaron ccaron -37 rcaron ccedilla -37 rcaron '
+                 'comma -111 rcaron d -37 rcaron dcroat -37 rcaron e -37 '
+                 'rcaron eacute -37 rcaron ecaron -37 rcaron ecircumflex -37 '
+                 'rcaron edieresis -37 rcaron edotaccent -37 rcaron egrave '
+                 '-37 rcaron emacron -37 rcaron eogonek -37 rcaron g -37 '
+                 'rcaron gbreve -37 rcaron gcommaaccent -37 rcaron hyphen -20 '
+                 'rcaron o -45 rcaron oacute -45 rcaron ocircumflex -45 '
+                 'rcaron odieresis -45 rcaron ograve -45 rcaron ohungarumlaut '
+                 '-45 rcaron omacron -45 rcaron oslash -45 rcaron otilde -45 '
+                 'rcaron period -111 rcaron q -37 rcaron s -10 rcaron sacute '
+                 '-10 rcaron scaron -10 rcaron scedilla -10 rcaron '
+                 'scommaaccent -10 rcommaaccent a -15 rcommaaccent aacute -15 '
+                 'rcommaaccent abreve -15 rcommaaccent acircumflex -15 '
+                 'rcommaaccent adieresis -15 rcommaaccent agrave -15 '
+                 'rcommaaccent amacron -15 rcommaaccent aogonek -15 '
+                 'rcommaaccent aring -15 rcommaaccent atilde -15 rcommaaccent '
+                 'c -37 rcommaaccent cacute -37 rcommaaccent ccaron -37 '
+                 'rcommaaccent ccedilla -37 rcommaaccent comma -111 '
+                 'rcommaaccent d -37 rcommaaccent dcroat -37 rcommaaccent e '
+                 '-37 rcommaaccent eacute -37 rcommaaccent ecaron -37 '
+                 'rcommaaccent ecircumflex -37 rcommaaccent edieresis -37 '
+                 'rcommaaccent edotaccent -37 rcommaaccent egrave -37 '
+                 'rcommaaccent emacron -37 rcommaaccent eogonek -37 '
+                 'rcommaaccent g -37 rcommaaccent gbreve -37 rcommaaccent '
+                 'gcommaaccent -37 rcommaaccent hyphen -20 rcommaaccent o -45 '
+                 'rcommaaccent oacute -45 rcommaaccent ocircumflex -45 '
+                 'rcommaaccent odieresis -45 rcommaaccent ograve -45 '
+                 'rcommaaccent ohungarumlaut -45 rcommaaccent omacron -45 '
+                 'rcommaaccent oslash -45 rcommaaccent otilde -45 '
+                 'rcommaaccent period -111 rcommaaccent q -37 rcommaaccent s '
+                 '-10 rcommaaccent sacute -10 rcommaaccent scaron -10 '
+                 'rcommaaccent scedilla -10 rcommaaccent scommaaccent -10 '
+                 'space A -18 space Aacute -18 space Abreve -18 space '
+                 'Acircumflex -18 space Adieresis -18 space Agrave -18 space '
+                 'Amacron -18 space Aogonek -18 space Aring -18 space Atilde '
+                 '-18 space T -18 space Tcaron -18 space Tcommaaccent -18 '
+                 'space V -35 space W -40 space Y -75 space Yacute -75 space '
+                 'Ydieresis -75 v comma -74 v period -74 w comma -74 w period '
+                 '-74 y comma -55 y period -55 yacute comma -55 yacute period '
+                 '-55 ydieresis comma -55 ydieresis period -55',
+ 'Times-Roman': 'A C -40 A Cacute -40 A Ccaron -40 A Ccedilla -40 A G -40 A '
+                'Gbreve -40 A Gcommaaccent -40 A O -55 A Oacute -55 A '
+                'Ocircumflex -55 A Odieresis -55 A Ograve -55 A Ohungarumlaut '
+                '-55 A Omacron -55 A Oslash -55 A Otilde -55 A Q -55 A T -111 '
+                'A Tcaron -111 A Tcommaaccent -111 A U -55 A Uacute -55 A '
+                'Ucircumflex -55 A Udieresis -55 A Ugrave -55 A Uhungarumlaut '
+                '-55 A Umacron -55 A Uogonek -55 A Uring -55 A V -135 A W -90 '
+                'A Y -105 A Yacute -105 A Ydieresis -105 A quoteright -111 A '
+                'v -74 A w -92 A y -92 A yacute -92 A ydieresis -92 Aacute C '
+                '-40 Aacute Cacute -40 Aacute Ccaron -40 Aacute Ccedilla -40 '
+                'Aacute G -40 Aacute Gbreve -40 Aacute Gcommaaccent -40 '
+                'Aacute O -55 Aacute Oacute -55 Aacute Ocircumflex -55 Aacute '
+                'Odieresis -55 Aacute Ograve -55 Aacute Ohungarumlaut -55 '
+                'Aacute Omacron -55 Aacute Oslash -55 Aacute Otilde -55 '
+                'Aacute Q -55 Aacute T -111 Aacute Tcaron -111 Aacute '
+                'Tcommaaccent -111 Aacute U -55 Aacute Uacute -55 Aacute '
+                'Ucircumflex -55 Aacute Udieresis -55 Aacute Ugrave -55 '
+                'Aacute Uhungarumlaut -55 Aacute Umacron -55 Aacute Uogonek '
+                '-55 Aacute Uring -55 Aacute V -135 Aacute W -90 Aacute Y '
+                '-105 Aacute Yacute -105 Aacute Ydieresis -105 Aacute '
+                'quoteright -111 Aacute v -74 Aacute w -92 Aacute y -92 '
+                'Aacute yacute -92 Aacute ydieresis -92 Abreve C -40 Abreve '
+                'Cacute -40 Abreve Ccaron -40 Abreve Ccedilla -40 Abreve G '
+                '-40 Abreve Gbreve -40 Abreve Gcommaaccent -40 Abreve O -55 '
+                'Abreve Oacute -55 Abreve Ocircumflex -55 Abreve Odieresis '
+                '-55 Abreve Ograve -55 Abreve Ohungarumlaut -55 Abreve '
+                'Omacron -55 Abreve Oslash -55 Abreve Otilde -55 Abreve Q -55 '
+                'Abreve T -111 Abreve Tcaron -111 Abreve Tcommaaccent -111 '
+                'Abreve U -55 Abreve Uacute -55 Abreve Ucircumflex -55 Abreve '
+                'Udieresis -55 Abreve Ugrave -55 Abreve Uhungarumlaut -55 '
+                'Abreve Umacron -55 Abreve Uogonek -55 Abreve Uring -55 '
+                'Abreve V -135 Abreve W -90 Abreve Y -105 Abreve Yacute -105 '
+                'Abreve Ydieresis -105 Abreve quoteright -111 Abreve v -74 '
+                'Abreve w -92 Abreve y -92 Abreve yacute -92 Abreve ydieresis '
+                '-92 Acircumflex C -40 Acircumflex Cacute -40 Acircumflex '
+                'Ccaron -40 Acircumflex Ccedilla -40 Acircumflex G -40 '
+                'Acircumflex Gbreve -40 Acircumflex Gcommaaccent -40 '
+                'Acircumflex O -55 Acircumflex Oacute -55 Acircumflex '
+                'Ocircumflex -55 Acircumflex Odieresis -55 Acircumflex Ograve '
+                '-55 Acircumflex Ohungarumlaut -55 Acircumflex Omacron -55 '
+                'Acircumflex Oslash -55 Acircumflex Otilde -55 Acircumflex Q '
+                '-55 Acircumflex T -111 Acircumflex Tcaron -111 Acircumflex '
+                'Tcommaaccent -111 Acircumflex U -55 Acircumflex Uacute -55 '
+                'Acircumflex Ucircumflex -55 Acircumflex Udieresis -55 '
+                'Acircumflex Ugrave -55 Acircumflex Uhungarumlaut -55 '
+                'Acircumflex Umacron -55 Acircumflex Uogonek -55 Acircumflex '
+                'Uring -55 Acircumflex V -135 Acircumflex W -90 Acircumflex Y '
+                '-105 Acircumflex Yacute -105 Acircumflex Ydieresis -105 '
+                'Acircumflex quoteright -111 Acircumflex v -74 Acircumflex w '
+                '-92 Acircumflex y -92 Acircumflex yacute -92 Acircumflex '
+                'ydieresis -92 Adieresis C -40 Adieresis Cacute -40 Adieresis '
+                'Ccaron -40 Adieresis Ccedilla -40 Adieresis G -40 Adieresis '
+                'Gbreve -40 Adieresis Gcommaaccent -40 Adieresis O -55 '
+                'Adieresis Oacute -55 Adieresis Ocircumflex -55 Adieresis '
+                'Odieresis -55 Adieresis Ograve -55 Adieresis Ohungarumlaut '
+                '-55 Adieresis Omacron -55 Adieresis Oslash -55 Adieresis '
+                'Otilde -55 Adieresis Q -55 Adieresis T -111 Adieresis Tcaron '
+                '-111 Adieresis Tcommaaccent -111 Adieresis U -55 Adieresis '
+                'Uacute -55 Adieresis Ucircumflex -55 Adieresis Udieresis -55 '
+                'Adieresis Ugrave -55 Adieresis Uhungarumlaut -55 Adieresis '
+                'Umacron -55 Adieresis Uogonek -55 Adieresis Uring -55 '
+                'Adieresis V -135 Adieresis W -90 Adieresis Y -105 Adieresis '
+                'Yacute -105 Adieresis Ydieresis -105 Adieresis quoteright '
+                '-111 Adieresis v -74 Adieresis w -92 Adieresis y -92 '
+                'Adieresis yacute -92 Adieresis ydieresis -92 Agrave C -40 '
+                'Agrave Cacute -40 Agrave Ccaron -40 Agrave Ccedilla -40 '
+                'Agrave G -40 Agrave Gbreve -40 Agrave Gcommaaccent -40 '
+                'Agrave O -55 Agrave Oacute -55 Agrave Ocircumflex -55 Agrave '
+                'Odieresis -55 Agrave Ograve -55 Agrave Ohungarumlaut -55 '
+                'Agrave Omacron -55 Agrave Oslash -55 Agrave Otilde -55 '
+                'Agrave Q -55 Agrave T -111 Agrave Tcaron -111 Agrave '
+                'Tcommaaccent -111 Agrave U -55 Agrave Uacute -55 Agrave '
+                'Ucircumflex -55 Agrave Udieresis -55 Agrave Ugrave -55 '
+                'Agrave Uhungarumlaut -55 Agrave Umacron -55 Agrave Uogonek '
+                '-55 Agrave Uring -55 Agrave V -135 Agrave W -90 Agrave Y '
+                '-105 Agrave Yacute -105 Agrave Ydieresis -105 Agrave '
+                'quoteright -111 Agrave v -74 Agrave w -92 Agrave y -92 '
+                'Agrave yacute -92 Agrave ydieresis -92 Amacron C -40 Amacron '
+                'Cacute -40 Amacron Ccaron -40 Amacron Ccedilla -40 Amacron G '
+                '-40 Amacron Gbreve -40 Amacron Gcommaaccent -40 Amacron O '
+                '-55 Amacron Oacute -55 Amacron Ocircumflex -55 Amacron '
+                'Odieresis -55 Amacron Ograve -55 Amacron Ohungarumlaut -55 '
+                'Amacron Omacron -55 Amacron Oslash -55 Amacron Otilde -55 '
+                'Amacron Q -55 Amacron T -111 Amacron Tcaron -111 Amacron '
+                'Tcommaaccent -111 Amacron U -55 Amacron Uacute -55 Amacron '
+                'Ucircumflex -55 Amacron Udieresis -55 Amacron Ugrave -55 '
+                'Amacron Uhungarumlaut -55 Amacron Umacron -55 Amacron '
+                'Uogonek -55 Amacron Uring -55 Amacron V -135 Amacron W -90 '
+                'Amacron Y -105 Amacron Yacute -105 Amacron Ydieresis -105 '
+                'Amacron quoteright -111 Amacron v -74 Amacron w -92 Amacron '
+                'y -92 Amacron yacute -92 Amacron ydieresis -92 Aogonek C -40 '
+                'Aogonek Cacute -40 Aogonek Ccaron -40 Aogonek Ccedilla -40 '
+                'Aogonek G -40 Aogonek Gbreve -40 Aogonek Gcommaaccent -40 '
+                'Aogonek O -55 Aogonek Oacute -55 Aogonek Ocircumflex -55 '
+                'Aogonek Odieresis -55 Aogonek Ograve -55 Aogonek '
+                'Ohungarumlaut -55 Aogonek Omacron -55 Aogonek Oslash -55 '
+                'Aogonek Otilde -55 Aogonek Q -55 Aogonek T -111 Aogonek '
+                'Tcaron -111 Aogonek Tcommaaccent -111 Aogonek U -55 Aogonek '
+                'Uacute -55 Aogonek Ucircumflex -55 Aogonek Udieresis -55 '
+                'Aogonek Ugrave -55 Aogonek Uhungarumlaut -55 Aogonek Umacron '
+                '-55 Aogonek Uogonek -55 Aogonek Uring -55 Aogonek V -135 '
+                'Aogonek W -90 Aogonek Y -105 Aogonek Yacute -105 Aogonek '
+                'Ydieresis -105 Aogonek quoteright -111 Aogonek v -74 Aogonek '
+                'w -52 Aogonek y -52 Aogonek yacute -52 Aogonek ydieresis -52 '
+                'Aring C -40 Aring Cacute -40 Aring Ccaron -40 Aring Ccedilla '
+                '-40 Aring G -40 Aring Gbreve -40 Aring Gcommaaccent -40 '
+                'Aring O -55 Aring Oacute -55 Aring Ocircumflex -55 Aring '
+                'Odieresis -55 Aring Ograve -55 Aring Ohungarumlaut -55 Aring '
+                'Omacron -55 Aring Oslash -55 Aring Otilde -55 Aring Q -55 '
+                'Aring T -111 Aring Tcaron -111 Aring Tcommaaccent -111 Aring '
+                'U -55 Aring Uacute -55 Aring Ucircumflex -55 Aring Udieresis '
+                '-55 Aring Ugrave -55 Aring Uhungarumlaut -55 Aring Umacron '
+                '-55 Aring Uogonek -55 Aring Uring -55 Aring V -135 Aring W '
+                '-90 Aring Y -105 Aring Yacute -105 Aring Ydieresis -105 '
+                'Aring quoteright -111 Aring v -74 Aring w -92 Aring y -92 '
+                'Aring yacute -92 Aring ydieresis -92 Atilde C -40 Atilde '
+                'Cacute -40 Atilde Ccaron -40 Atilde Ccedilla -40 Atilde G '
+                '-40 Atilde Gbreve -40 Atilde Gcommaaccent -40 Atilde O -55 '
+                'Atilde Oacute -55 Atilde Ocircumflex -55 Atilde Odieresis '
+                '-55 Atilde Ograve -55 Atilde Ohungarumlaut -55 Atilde '
+                'Omacron -55 Atilde Oslash -55 Atilde Otilde -55 Atilde Q -55 '
+                'Atilde T -111 Atilde Tcaron -111 Atilde Tcommaaccent -111 '
+                'Atilde U -55 Atilde Uacute -55 Atilde Ucircumflex -55 Atilde '
+                'Udieresis -55 Atilde Ugrave -55 Atilde Uhungarumlaut -55 '
+                'Atilde Umacron -55 Atilde Uogonek -55 Atilde Uring -55 '
+                'Atilde V -135 Atilde W -90 Atilde Y -105 Atilde Yacute -105 '
+                'Atilde Ydieresis -105 Atilde quoteright -111 Atilde v -74 '
+                'Atilde w -92 Atilde y -92 Atilde yacute -92 Atilde ydieresis '
+                '-92 B A -35 B Aacute -35 B Abreve -35 B Acircumflex -35 B '
+                'Adieresis -35 B Agrave -35 B Amacron -35 B Aogonek -35 B '
+                'Aring -35 B Atilde -35 B U -10 B Uacute -10 B Ucircumflex '
+                '-10 B Udieresis -10 B Ugrave -10 B Uhungarumlaut -10 B '
+                'Umacron -10 B Uogonek -10 B Uring -10 D A -40 D Aacute -40 D '
+                'Abreve -40 D Acircumflex -40 D Adieresis -40 D Agrave -40 D '
+                'Amacron -40 D Aogonek -40 D Aring -40 D Atilde -40 D V -40 D '
+                'W -30 D Y -55 D Yacute -55 D Ydieresis -55 Dcaron A -40 '
+                'Dcaron Aacute -40 Dcaron Abreve -40 Dcaron Acircumflex -40 '
+                'Dcaron Adieresis -40 Dcaron Agrave -40 Dcaron Amacron -40 '
+                'Dcaron Aogonek -40 Dcaron Aring -40 Dcaron Atilde -40 Dcaron '
+                'V -40 Dcaron W -30 Dcaron Y -55 Dcaron Yacute -55 Dcaron '
+                'Ydieresis -55 Dcroat A -40 Dcroat Aacute -40 Dcroat Abreve '
+                '-40 Dcroat Acircumflex -40 Dcroat Adieresis -40 Dcroat '
+                'Agrave -40 Dcroat Amacron -40 Dcroat Aogonek -40 Dcroat '
+                'Aring -40 Dcroat Atilde -40 Dcroat V -40 Dcroat W -30 Dcroat '
+                'Y -55 Dcroat Yacute -55 Dcroat Ydieresis -55 F A -74 F '
+                'Aacute -74 F Abreve -74 F Acircumflex -74 F Adieresis -74 F '
+                'Agrave -74 F Amacron -74 F Aogonek -74 F Aring -74 F Atilde '
+                '-74 F a -15 F aacute -15 F abreve -15 F acircumflex -15 F '
+                'adieresis -15 F agrave -15 F amacron -15 F aogonek -15 F '
+                'aring -15 F atilde -15 F comma -80 F o -15 F oacute -15 F '
+                'ocircumflex -15 F odieresis -15 F ograve -15 F ohungarumlaut '
+                '-15 F omacron -15 F oslash -15 F otilde -15 F period -80 J A '
+                '-60 J Aacute -60 J Abreve -60 J Acircumflex -60 J Adieresis '
+                '-60 J Agrave -60 J Amacron -60 J Aogonek -60 J Aring -60 J '
+                'Atilde -60 K O -30 K Oacute -30 K Ocircumflex -30 K '
+                'Odieresis -30 K Ograve -30 K Ohungarumlaut -30 K Omacron -30 '
+                'K Oslash -30 K Otilde -30 K e -25 K eacute -25 K ecaron -25 '
+                'K ecircumflex -25 K edieresis -25 K edotaccent -25 K egrave '
+                '-25 K emacron -25 K eogonek -25 K o -35 K oacute -35 K '
+                'ocircumflex -35 K odieresis -35 K ograve -35 K ohungarumlaut '
+                '-35 K omacron -35 K oslash -35 K otilde -35 K u -15 K uacute '
+                '-15 K ucircumflex -15 K udieresis -15 K ugrave -15 K '
+                'uhungarumlaut -15 K umacron -15 K uogonek -15 K uring -15 K '
+                'y -25 K yacute -25 K ydieresis -25 Kcommaaccent O -30 '
+                'Kcommaaccent Oacute -30 Kcommaaccent Ocircumflex -30 '
+                'Kcommaaccent Odieresis -30 Kcommaaccent Ograve -30 '
+                'Kcommaaccent Ohungarumlaut -30 Kcommaaccent Omacron -30 '
+                'Kcommaaccent Oslash -30 Kcommaaccent Otilde -30 Kcommaaccent '
+                'e -25 Kcommaaccent eacute -25 Kcommaaccent ecaron -25 '
+                'Kcommaaccent ecircumflex -25 Kcommaaccent edieresis -25 '
+                'Kcommaaccent edotaccent -25 Kcommaaccent egrave -25 '
+                'Kcommaaccent emacron -25 Kcommaaccent eogonek -25 '
+                'Kcommaaccent o -35 Kcommaaccent oacute -35 Kcommaaccent '
+                'ocircumflex -35 Kcommaaccent odieresis -35 Kcommaaccent '
+                'ograve -35 Kcommaaccent ohungarumlaut -35 Kcommaaccent '
+                'omacron -35 Kcommaaccent oslash -35 Kcommaaccent otilde -35 '
+                'Kcommaaccent u -15 Kcommaaccent uacute -15 Kcommaaccent '
+                'ucircumflex -15 Kcommaaccent udieresis -15 Kcommaaccent '
+                'ugrave -15 Kcommaaccent uhungarumlaut -15 Kcommaaccent '
+                'umacron -15 Kcommaaccent uogonek -15 Kcommaaccent uring -15 '
+                'Kcommaaccent y -25 Kcommaaccent yacute -25 Kcommaaccent '
+                'ydieresis -25 L T -92 L Tcaron -92 L Tcommaaccent -92 L V '
+                '-100 L W -74 L Y -100 L Yacute -100 L Ydieresis -100 L '
+                'quoteright -92 L y -55 L yacute -55 L ydieresis -55 Lacute T '
+                '-92 Lacute Tcaron -92 Lacute Tcommaaccent -92 Lacute V -100 '
+                'Lacute W -74 Lacute Y -100 Lacute Yacute -100 Lacute '
+                'Ydieresis -100 Lacute quoteright -92 Lacute y -55 Lacute '
+                'yacute -55 Lacute ydieresis -55 Lcaron quoteright -92 Lcaron '
+                'y -55 Lcaron yacute -55 Lcaron ydieresis -55 Lcommaaccent T '
+                '-92 Lcommaaccent Tcaron -92 Lcommaaccent Tcommaaccent -92 '
+                'Lcommaaccent V -100 Lcommaaccent W -74 Lcommaaccent Y -100 '
+                'Lcommaaccent Yacute -100 Lcommaaccent Ydieresis -100 '
+                'Lcommaaccent quoteright -92 Lcommaaccent y -55 Lcommaaccent '
+                'yacute -55 Lcommaaccent ydieresis -55 Lslash T -92 Lslash '
+                'Tcaron -92 Lslash Tcommaaccent -92 Lslash V -100 Lslash W '
+                '-74 Lslash Y -100 Lslash Yacute -100 Lslash Ydieresis -100 '
+                'Lslash quoteright -92 Lslash y -55 Lslash yacute -55 Lslash '
+                'ydieresis -55 N A -35 N Aacute -35 N Abreve -35 N '
+                'Acircumflex -35 N Adieresis -35 N Agrave -35 N Amacron -35 N '
+                'Aogonek -35 N Aring -35 N Atilde -35 Nacute A -35 Nacute '
+                'Aacute -35 Nacute Abreve -35 Nacute Acircumflex -35 Nacute '
+                'Adieresis -35 Nacute Agrave -35 Nacute Amacron -35 Nacute '
+                'Aogonek -35 Nacute Aring -35 Nacute Atilde -35 Ncaron A -35 '
+                'Ncaron Aacute -35 Ncaron Abreve -35 Ncaron Acircumflex -35 '
+                'Ncaron Adieresis -35 Ncaron Agrave -35 Ncaron Amacron -35 '
+                'Ncaron Aogonek -35 Ncaron Aring -35 Ncaron Atilde -35 '
+                'Ncommaaccent A -35 Ncommaaccent Aacute -35 Ncommaaccent '
+                'Abreve -35 Ncommaaccent Acircumflex -35 Ncommaaccent '
+                'Adieresis -35 Ncommaaccent Agrave -35 Ncommaaccent Amacron '
+                '-35 Ncommaaccent Aogonek -35 Ncommaaccent Aring -35 '
+                'Ncommaaccent Atilde -35 Ntilde A -35 Ntilde Aacute -35 '
+                'Ntilde Abreve -35 Ntilde Acircumflex -35 Ntilde Adieresis '
+                '-35 Ntilde Agrave -35 Ntilde Amacron -35 Ntilde Aogonek -35 '
+                'Ntilde Aring -35 Ntilde Atilde -35 O A -35 O Aacute -35 O '
+                'Abreve -35 O Acircumflex -35 O Adieresis -35 O Agrave -35 O '
+                'Amacron -35 O Aogonek -35 O Aring -35 O Atilde -35 O T -40 O '
+                'Tcaron -40 O Tcommaaccent -40 O V -50 O W -35 O X -40 O Y '
+                '-50 O Yacute -50 O Ydieresis -50 Oacute A -35 Oacute Aacute '
+                '-35 Oacute Abreve -35 Oacute Acircumflex -35 Oacute '
+                'Adieresis -35 Oacute Agrave -35 Oacute Amacron -35 Oacute '
+                'Aogonek -35 Oacute Aring -35 Oacute Atilde -35 Oacute T -40 '
+                'Oacute Tcaron -40 Oacute Tcommaaccent -40 Oacute V -50 '
+                'Oacute W -35 Oacute X -40 Oacute Y -50 Oacute Yacute -50 '
+                'Oacute Ydieresis -50 Ocircumflex A -35 Ocircumflex Aacute '
+                '-35 Ocircumflex Abreve -35 Ocircumflex Acircumflex -35 '
+                'Ocircumflex Adieresis -35 Ocircumflex Agrave -35 Ocircumflex '
+                'Amacron -35 Ocircumflex Aogonek -35 Ocircumflex Aring -35 '
+                'Ocircumflex Atilde -35 Ocircumflex T -40 Ocircumflex Tcaron '
+                '-40 Ocircumflex Tcommaaccent -40 Ocircumflex V -50 '
+                'Ocircumflex W -35 Ocircumflex X -40 Ocircumflex Y -50 '
+                'Ocircumflex Yacute -50 Ocircumflex Ydieresis -50 Odieresis A '
+                '-35 Odieresis Aacute -35 Odieresis Abreve -35 Odieresis '
+                'Acircumflex -35 Odieresis Adieresis -35 Odieresis Agrave -35 '
+                'Odieresis Amacron -35 Odieresis Aogonek -35 Odieresis Aring '
+                '-35 Odieresis Atilde -35 Odieresis T -40 Odieresis Tcaron '
+                '-40 Odieresis Tcommaaccent -40 Odieresis V -50 Odieresis W '
+                '-35 Odieresis X -40 Odieresis Y -50 Odieresis Yacute -50 '
+                'Odieresis Ydieresis -50 Ograve A -35 Ograve Aacute -35 '
+                'Ograve Abreve -35 Ograve Acircumflex -35 Ograve Adieresis '
+                '-35 Ograve Agrave -35 Ograve Amacron -35 Ograve Aogonek -35 '
+                'Ograve Aring -35 Ograve Atilde -35 Ograve T -40 Ograve '
+                'Tcaron -40 Ograve Tcommaaccent -40 Ograve V -50 Ograve W -35 '
+                'Ograve X -40 Ograve Y -50 Ograve Yacute -50 Ograve Ydieresis '
+                '-50 Ohungarumlaut A -35 Ohungarumlaut Aacute -35 '
+                'Ohungarumlaut Abreve -35 Ohungarumlaut Acircumflex -35 '
+                'Ohungarumlaut Adieresis -35 Ohungarumlaut Agrave -35 '
+                'Ohungarumlaut Amacron -35 Ohungarumlaut Aogonek -35 '
+                'Ohungarumlaut Aring -35 Ohungarumlaut Atilde -35 '
+                'Ohungarumlaut T -40 Ohungarumlaut Tcaron -40 Ohungarumlaut '
+                'Tcommaaccent -40 Ohungarumlaut V -50 Ohungarumlaut W -35 '
+                'Ohungarumlaut X -40 Ohungarumlaut Y -50 Ohungarumlaut Yacute '
+                '-50 Ohungarumlaut Ydieresis -50 Omacron A -35 Omacron Aacute '
+                '-35 Omacron Abreve -35 Omacron Acircumflex -35 Omacron '
+                'Adieresis -35 Omacron Agrave -35 Omacron Amacron -35 Omacron '
+                'Aogonek -35 Omacron Aring -35 Omacron Atilde -35 Omacron T '
+                '-40 Omacron Tcaron -40 Omacron Tcommaaccent -40 Omacron V '
+                '-50 Omacron W -35 Omacron X -40 Omacron Y -50 Omacron Yacute '
+                '-50 Omacron Ydieresis -50 Oslash A -35 Oslash Aacute -35 '
+                'Oslash Abreve -35 Oslash Acircumflex -35 Oslash Adieresis '
+                '-35 Oslash Agrave -35 Oslash Amacron -35 Oslash Aogonek -35 '
+                'Oslash Aring -35 Oslash Atilde -35 Oslash T -40 Oslash '
+                'Tcaron -40 Oslash Tcommaaccent -40 Oslash V -50 Oslash W -35 '
+                'Oslash X -40 Oslash Y -50 Oslash Yacute -50 Oslash Ydieresis '
+                '-50 Otilde A -35 Otilde Aacute -35 Otilde Abreve -35 Otilde '
+                'Acircumflex -35 Otilde Adieresis -35 Otilde Agrave -35 '
+                'Otilde Amacron -35 Otilde Aogonek -35 Otilde Aring -35 '
+                'Otilde Atilde -35 Otilde T -40 Otilde Tcaron -40 Otilde '
+                'Tcommaaccent -40 Otilde V -50 Otilde W -35 Otilde X -40 '
+                'Otilde Y -50 Otilde Yacute -50 Otilde Ydieresis -50 P A -92 '
+                'P Aacute -92 P Abreve -92 P Acircumflex -92 P Adieresis -92 '
+                'P Agrave -92 P Amacron -92 P Aogonek -92 P Aring -92 P '
+                'Atilde -92 P a -15 P aacute -15 P abreve -15 P acircumflex '
+                '-15 P adieresis -15 P agrave -15 P amacron -15 P aogonek -15 '
+                'P aring -15 P atilde -15 P comma -111 P period -111 Q U -10 '
+                'Q Uacute -10 Q Ucircumflex -10 Q Udieresis -10 Q Ugrave -10 '
+                'Q Uhungarumlaut -10 Q Umacron -10 Q Uogonek -10 Q Uring -10 '
+                'R O -40 R Oacute -40 R Ocircumflex -40 R Odieresis -40 R '
+                'Ograve -40 R Ohungarumlaut -40 R Omacron -40 R Oslash -40 R '
+                'Otilde -40 R T -60 R Tcaron -60 R Tcommaaccent -60 R U -40 R '
+                'Uacute -40 R Ucircumflex -40 R Udieresis -40 R Ugrave -40 R '
+                'Uhungarumlaut -40 R Umacron -40 R Uogonek -40 R Uring -40 R '
+                'V -80 R W -55 R Y -65 R Yacute -65 R Ydieresis -65 Racute O '
+                '-40 Racute Oacute -40 Racute Ocircumflex -40 Racute '
+                'Odieresis -40 Racute Ograve -40 Racute Ohungarumlaut -40 '
+                'Racute Omacron -40 Racute Oslash -40 Racute Otilde -40 '
+                'Racute T -60 Racute Tcaron -60 Racute Tcommaaccent -60 '
+                'Racute U -40 Racute Uacute -40 Racute Ucircumflex -40 Racute '
+                'Udieresis -40 Racute Ugrave -40 Racute Uhungarumlaut -40 '
+                'Racute Umacron -40 Racute Uogonek -40 Racute Uring -40 '
+                'Racute V -80 Racute W -55 Racute Y -65 Racute Yacute -65 '
+                'Racute Ydieresis -65 Rcaron O -40 Rcaron Oacute -40 Rcaron '
+                'Ocircumflex -40 Rcaron Odieresis -40 Rcaron Ograve -40 '
+                'Rcaron Ohungarumlaut -40 Rcaron Omacron -40 Rcaron Oslash '
+                '-40 Rcaron Otilde -40 Rcaron T -60 Rcaron Tcaron -60 Rcaron '
+                'Tcommaaccent -60 Rcaron U -40 Rcaron Uacute -40 Rcaron '
+                'Ucircumflex -40 Rcaron Udieresis -40 Rcaron Ugrave -40 '
+                'Rcaron Uhungarumlaut -40 Rcaron Umacron -40 Rcaron Uogonek '
+                '-40 Rcaron Uring -40 Rcaron V -80 Rcaron W -55 Rcaron Y -65 '
+                'Rcaron Yacute -65 Rcaron Ydieresis -65 Rcommaaccent O -40 '
+                'Rcommaaccent Oacute -40 Rcommaaccent Ocircumflex -40 '
+                'Rcommaaccent Odieresis -40 Rcommaaccent Ograve -40 '
+                'Rcommaaccent Ohungarumlaut -40 Rcommaaccent Omacron -40 '
+                'Rcommaaccent Oslash -40 Rcommaaccent Otilde -40 Rcommaaccent '
+                'T -60 Rcommaaccent Tcaron -60 Rcommaaccent Tcommaaccent -60 '
+                'Rcommaaccent U -40 Rcommaaccent Uacute -40 Rcommaaccent '
+                'Ucircumflex -40 Rcommaaccent Udieresis -40 Rcommaaccent '
+                'Ugrave -40 Rcommaaccent Uhungarumlaut -40 Rcommaaccent '
+                'Umacron -40 Rcommaaccent Uogonek -40 Rcommaaccent Uring -40 '
+                'Rcommaaccent V -80 Rcommaaccent W -55 Rcommaaccent Y -65 '
+                'Rcommaaccent Yacute -65 Rcommaaccent Ydieresis -65 T A -93 T '
+                'Aacute -93 T Abreve -93 T Acircumflex -93 T Adieresis -93 T '
+                'Agrave -93 T Amacron -93 T Aogonek -93 T Aring -93 T Atilde '
+                '-93 T O -18 T Oacute -18 T Ocircumflex -18 T Odieresis -18 T '
+                'Ograve -18 T Ohungarumlaut -18 T Omacron -18 T Oslash -18 T '
+                'Otilde -18 T a -80 T aacute -80 T abreve -80 T acircumflex '
+                '-80 T adieresis -40 T agrave -40 T amacron -40 T aogonek -80 '
+                'T aring -80 T atilde -40 T colon -50 T comma -74 T e -70 T '
+                'eacute -70 T ecaron -70 T ecircumflex -70 T edieresis -30 T '
+                'edotaccent -70 T egrave -70 T emacron -30 T eogonek -70 T '
+                'hyphen -92 T i -35 T iacute -35 T iogonek -35 T o -80 T '
+                'oacute -80 T ocircumflex -80 T odieresis -80 T ograve -80 T '
+                'ohungarumlaut -80 T omacron -80 T oslash -80 T otilde -80 T '
+                'period -74 T r -35 T racute -35 T rcaron -35 T rcommaaccent '
+                '-35 T semicolon -55 T u -45 T uacute -45 T ucircumflex -45 T '
+                'udieresis -45 T ugrave -45 T uhungarumlaut -45 T umacron -45 '
+                'T uogonek -45 T uring -45 T w -80 T y -80 T yacute -80 T '
+                'ydieresis -80 Tcaron A -93 Tcaron Aacute -93 Tcaron Abreve '
+                '-93 Tcaron Acircumflex -93 Tcaron Adieresis -93 Tcaron '
+                'Agrave -93 Tcaron Amacron -93 Tcaron Aogonek -93 Tcaron '
+                'Aring -93 Tcaron Atilde -93 Tcaron O -18 Tcaron Oacute -18 '
+                'Tcaron Ocircumflex -18 Tcaron Odieresis -18 Tcaron Ograve '
+                '-18 Tcaron Ohungarumlaut -18 Tcaron Omacron -18 Tcaron '
+                'Oslash -18 Tcaron Otilde -18 Tcaron a -80 Tcaron aacute -80 '
+                'Tcaron abreve -80 Tcaron acircumflex -80 Tcaron adieresis '
+                '-40 Tcaron agrave -40 Tcaron amacron -40 Tcaron aogonek -80 '
+                'Tcaron aring -80 Tcaron atilde -40 Tcaron colon -50 Tcaron '
+                'comma -74 Tcaron e -70 Tcaron eacute -70 Tcaron ecaron -70 '
+                'Tcaron ecircumflex -30 Tcaron edieresis -30 Tcaron '
+                'edotaccent -70 Tcaron egrave -70 Tcaron emacron -30 Tcaron '
+                'eogonek -70 Tcaron hyphen -92 Tcaron i -35 Tcaron iacute -35 '
+                'Tcaron iogonek -35 Tcaron o -80 Tcaron oacute -80 Tcaron '
+                'ocircumflex -80 Tcaron odieresis -80 Tcaron ograve -80 '
+                'Tcaron ohungarumlaut -80 Tcaron omacron -80 Tcaron oslash '
+                '-80 Tcaron otilde -80 Tcaron period -74 Tcaron r -35 Tcaron '
+                'racute -35 Tcaron rcaron -35 Tcaron rcommaaccent -35 Tcaron '
+                'semicolon -55 Tcaron u -45 Tcaron uacute -45 Tcaron '
+                'ucircumflex -45 Tcaron udieresis -45 Tcaron ugrave -45 '
+                'Tcaron uhungarumlaut -45 Tcaron umacron -45 Tcaron uogonek '
+                '-45 Tcaron uring -45 Tcaron w -80 Tcaron y -80 Tcaron yacute '
+                '-80 Tcaron ydieresis -80 Tcommaaccent A -93 Tcommaaccent '
+                'Aacute -93 Tcommaaccent Abreve -93 Tcommaaccent Acircumflex '
+                '-93 Tcommaaccent Adieresis -93 Tcommaaccent Agrave -93 '
+                'Tcommaaccent Amacron -93 Tcommaaccent Aogonek -93 '
+                'Tcommaaccent Aring -93 Tcommaaccent Atilde -93 Tcommaaccent '
+                'O -18 Tcommaaccent Oacute -18 Tcommaaccent Ocircumflex -18 '
+                'Tcommaaccent Odieresis -18 Tcommaaccent Ograve -18 '
+                'Tcommaaccent Ohungarumlaut -18 Tcommaaccent Omacron -18 '
+                'Tcommaaccent Oslash -18 Tcommaaccent Otilde -18 Tcommaaccent '
+                'a -80 Tcommaaccent aacute -80 Tcommaaccent abreve -80 '
+                'Tcommaaccent acircumflex -80 Tcommaaccent adieresis -40 '
+                'Tcommaaccent agrave -40 Tcommaaccent amacron -40 '
+                'Tcommaaccent aogonek -80 Tcommaaccent aring -80 Tcommaaccent '
+                'atilde -40 Tcommaaccent colon -50 Tcommaaccent comma -74 '
+                'Tcommaaccent e -70 Tcommaaccent eacute -70 Tcommaaccent '
+                'ecaron -70 Tcommaaccent ecircumflex -30 Tcommaaccent '
+                'edieresis -30 Tcommaaccent edotaccent -70 Tcommaaccent '
+                'egrave -30 Tcommaaccent emacron -70 Tcommaaccent eogonek -70 '
+                'Tcommaaccent hyphen -92 Tcommaaccent i -35 Tcommaaccent '
+                'iacute -35 Tcommaaccent iogonek -35 Tcommaaccent o -80 '
+                'Tcommaaccent oacute -80 Tcommaaccent ocircumflex -80 '
+                'Tcommaaccent odieresis -80 Tcommaaccent ograve -80 '
+                'Tcommaaccent ohungarumlaut -80 Tcommaaccent omacron -80 '
+                'Tcommaaccent oslash -80 Tcommaaccent otilde -80 Tcommaaccent '
+                'period -74 Tcommaaccent r -35 Tcommaaccent racute -35 '
+                'Tcommaaccent rcaron -35 Tcommaaccent rcommaaccent -35 '
+                'Tcommaaccent semicolon -55 Tcommaaccent u -45 Tcommaaccent '
+                'uacute -45 Tcommaaccent ucircumflex -45 Tcommaaccent '
+                'udieresis -45 Tcommaaccent ugrave -45 Tcommaaccent '
+                'uhungarumlaut -45 Tcommaaccent umacron -45 Tcommaaccent '
+                'uogonek -45 Tcommaaccent uring -45 Tcommaaccent w -80 '
+                'Tcommaaccent y -80 Tcommaaccent yacute -80 Tcommaaccent '
+                'ydieresis -80 U A -40 U Aacute -40 U Abreve -40 U '
+                'Acircumflex -40 U Adieresis -40 U Agrave -40 U Amacron -40 U '
+                'Aogonek -40 U Aring -40 U Atilde -40 Uacute A -40 Uacute '
+                'Aacute -40 Uacute Abreve -40 Uacute Acircumflex -40 Uacute '
+                'Adieresis -40 Uacute Agrave -40 Uacute Amacron -40 Uacute '
+                'Aogonek -40 Uacute Aring -40 Uacute Atilde -40 Ucircumflex A '
+                '-40 Ucircumflex Aacute -40 Ucircumflex Abreve -40 '
+                'Ucircumflex Acircumflex -40 Ucircumflex Adieresis -40 '
+                'Ucircumflex Agrave -40 Ucircumflex Amacron -40 Ucircumflex '
+                'Aogonek -40 Ucircumflex Aring -40 Ucircumflex Atilde -40 '
+                'Udieresis A -40 Udieresis Aacute -40 Udieresis Abreve -40 '
+                'Udieresis Acircumflex -40 Udieresis Adieresis -40 Udieresis '
+                'Agrave -40 Udieresis Amacron -40 Udieresis Aogonek -40 '
+                'Udieresis Aring -40 Udieresis Atilde -40 Ugrave A -40 Ugrave '
+                'Aacute -40 Ugrave Abreve -40 Ugrave Acircumflex -40 Ugrave '
+                'Adieresis -40 Ugrave Agrave -40 Ugrave Amacron -40 Ugrave '
+                'Aogonek -40 Ugrave Aring -40 Ugrave Atilde -40 Uhungarumlaut '
+                'A -40 Uhungarumlaut Aacute -40 Uhungarumlaut Abreve -40 '
+                'Uhungarumlaut Acircumflex -40 Uhungarumlaut Adieresis -40 '
+                'Uhungarumlaut Agrave -40 Uhungarumlaut Amacron -40 '
+                'Uhungarumlaut Aogonek -40 Uhungarumlaut Aring -40 '
+                'Uhungarumlaut Atilde -40 Umacron A -40 Umacron Aacute -40 '
+                'Umacron Abreve -40 Umacron Acircumflex -40 Umacron Adieresis '
+                '-40 Umacron Agrave -40 Umacron Amacron -40 Umacron Aogonek '
+                '-40 Umacron Aring -40 Umacron Atilde -40 Uogonek A -40 '
+                'Uogonek Aacute -40 Uogonek Abreve -40 Uogonek Acircumflex '
+                '-40 Uogonek Adieresis -40 Uogonek Agrave -40 Uogonek Amacron '
+                '-40 Uogonek Aogonek -40 Uogonek Aring -40 Uogonek Atilde -40 '
+                'Uring A -40 Uring Aacute -40 Uring Abreve -40 Uring '
+                'Acircumflex -40 Uring Adieresis -40 Uring Agrave -40 Uring '
+                'Amacron -40 Uring Aogonek -40 Uring Aring -40 Uring Atilde '
+                '-40 V A -135 V Aacute -135 V Abreve -135 V Acircumflex -135 '
+                'V Adieresis -135 V Agrave -135 V Amacron -135 V Aogonek -135 '
+                'V Aring -135 V Atilde -135 V G -15 V Gbreve -15 V '
+                'Gcommaaccent -15 V O -40 V Oacute -40 V Ocircumflex -40 V '
+                'Odieresis -40 V Ograve -40 V Ohungarumlaut -40 V Omacron -40 '
+                'V Oslash -40 V Otilde -40 V a -111 V aacute -111 V abreve '
+                '-111 V acircumflex -71 V adieresis -71 V agrave -71 V '
+                'amacron -71 V aogonek -111 V aring -111 V atilde -71 V colon '
+                '-74 V comma -129 V e -111 V eacute -111 V ecaron -71 V '
+                'ecircumflex -71 V edieresis -71 V edotaccent -111 V egrave '
+                '-71 V emacron -71 V eogonek -111 V hyphen -100 V i -60 V '
+                'iacute -60 V icircumflex -20 V idieresis -20 V igrave -20 V '
+                'imacron -20 V iogonek -60 V o -129 V oacute -129 V '
+                'ocircumflex -129 V odieresis -89 V ograve -89 V '
+                'ohungarumlaut -129 V omacron -89 V oslash -129 V otilde -89 '
+                'V period -129 V semicolon -74 V u -75 V uacute -75 V '
+                'ucircumflex -75 V udieresis -75 V ugrave -75 V uhungarumlaut '
+                '-75 V umacron -75 V uogonek -75 V uring -75 W A -120 W '
+                'Aacute -120 W Abreve -120 W Acircumflex -120 W Adieresis '
+                '-120 W Agrave -120 W Amacron -120 W Aogonek -120 W Aring '
+                '-120 W Atilde -120 W O -10 W Oacute -10 W Ocircumflex -10 W '
+                'Odieresis -10 W Ograve -10 W Ohungarumlaut -10 W Omacron -10 '
+                'W Oslash -10 W Otilde -10 W a -80 W aacute -80 W abreve -80 '
+                'W acircumflex -80 W adieresis -80 W agrave -80 W amacron -80 '
+                'W aogonek -80 W aring -80 W atilde -80 W colon -37 W comma '
+                '-92 W e -80 W eacute -80 W ecaron -80 W ecircumflex -80 W '
+                'edieresis -40 W edotaccent -80 W egrave -40 W emacron -40 W '
+                'eogonek -80 W hyphen -65 W i -40 W iacute -40 W iogonek -40 '
+                'W o -80 W oacute -80 W ocircumflex -80 W odieresis -80 W '
+                'ograve -80 W ohungarumlaut -80 W omacron -80 W oslash -80 W '
+                'otilde -80 W period -92 W semicolon -37 W u -50 W uacute -50 '
+                'W ucircumflex -50 W udieresis -50 W ugrave -50 W '
+                'uhungarumlaut -50 W umacron -50 W uogonek -50 W uring -50 W '
+                'y -73 W yacute -73 W ydieresis -73 Y A -120 Y Aacute -120 Y '
+                'Abreve -120 Y Acircumflex -120 Y Adieresis -120 Y Agrave '
+                '-120 Y Amacron -120 Y Aogonek -120 Y Aring -120 Y Atilde '
+                '-120 Y O -30 Y Oacute -30 Y Ocircumflex -30 Y Odieresis -30 '
+                'Y Ograve -30 Y Ohungarumlaut -30 Y Omacron -30 Y Oslash -30 '
+                'Y Otilde -30 Y a -100 Y aacute -100 Y abreve -100 Y '
+                'acircumflex -100 Y adieresis -60 Y agrave -60 Y amacron -60 '
+                'Y aogonek -100 Y aring -100 Y atilde -60 Y colon -92 Y comma '
+                '-129 Y e -100 Y eacute -100 Y ecaron -100 Y ecircumflex -100 '
+                'Y edieresis -60 Y edotaccent -100 Y egrave -60 Y emacron -60 '
+                'Y eogonek -100 Y hyphen -111 Y i -55 Y iacute -55 Y iogonek '
+                '-55 Y o -110 Y oacute -110 Y ocircumflex -110 Y odieresis '
+                '-70 Y ograve -70 Y ohungarumlaut -110 Y omacron -70 Y oslash '
+                '-110 Y otilde -70 Y period -129 Y semicolon -92 Y u -111 Y '
+                'uacute -111 Y ucircumflex -111 Y udieresis -71 Y ugrave -71 '
+                'Y uhungarumlaut -111 Y umacron -71 Y uogonek -111 Y uring '
+                '-111 Yacute A -120 Yacute Aacute -120 Yacute Abreve -120 '
+                'Yacute Acircumflex -120 Yacute Adieresis -120 Yacute Agrave '
+                '-120 Yacute Amacron -120 Yacute Aogonek -120 Yacute Aring '
+                '-120 Yacute Atilde -120 Yacute O -30 Yacute Oacute -30 '
+                'Yacute Ocircumflex -30 Yacute Odieresis -30 Yacute Ograve '
+                '-30 Yacute Ohungarumlaut -30 Yacute Omacron -30 Yacute '
+                'Oslash -30 Yacute Otilde -30 Yacute a -100 Yacute aacute '
+                '-100 Yacute abreve -100 Yacute acircumflex -100 Yacute '
+                'adieresis -60 Yacute agrave -60 Yacute amacron -60 Yacute '
+                'aogonek -100 Yacute aring -100 Yacute atilde -60 Yacute '
+                'colon -92 Yacute comma -129 Yacute e -100 Yacute eacute -100 '
+                'Yacute ecaron -100 Yacute ecircumflex -100 Yacute edieresis '
+                '-60 Yacute edotaccent -100 Yacute egrave -60 Yacute emacron '
+                '-60 Yacute eogonek -100 Yacute hyphen -111 Yacute i -55 '
+                'Yacute iacute -55 Yacute iogonek -55 Yacute o -110 Yacute '
+                'oacute -110 Yacute ocircumflex -110 Yacute odieresis -70 '
+                'Yacute ograve -70 Yacute ohungarumlaut -110 Yacute omacron '
+                '-70 Yacute oslash -110 Yacute otilde -70 Yacute period -129 '
+                'Yacute semicolon -92 Yacute u -111 Yacute uacute -111 Yacute '
+                'ucircumflex -111 Yacute udieresis -71 Yacute ugrave -71 '
+                'Yacute uhungarumlaut -111 Yacute umacron -71 Yacute uogonek '
+                '-111 Yacute uring -111 Ydieresis A -120 Ydieresis Aacute '
+                '-120 Ydieresis Abreve -120 Ydieresis Acircumflex -120 '
+                'Ydieresis Adieresis -120 Ydieresis Agrave -120 Ydieresis '
+                'Amacron -120 Ydieresis Aogonek -120 Ydieresis Aring -120 '
+                'Ydieresis Atilde -120 Ydieresis O -30 Ydieresis Oacute -30 '
+                'Ydieresis Ocircumflex -30 Ydieresis Odieresis -30 Ydieresis '
+                'Ograve -30 Ydieresis Ohungarumlaut -30 Ydieresis Omacron -30 '
+                'Ydieresis Oslash -30 Ydieresis Otilde -30 Ydieresis a -100 '
+                'Ydieresis aacute -100 Ydieresis abreve -100 Ydieresis '
+                'acircumflex -100 Ydieresis adieresis -60 Ydieresis agrave '
+                '-60 Ydieresis amacron -60 Ydieresis aogonek -100 Ydieresis '
+                'aring -100 Ydieresis atilde -100 Ydieresis colon -92 '
+                'Ydieresis comma -129 Ydieresis e -100 Ydieresis eacute -100 '
+                'Ydieresis ecaron -100 Ydieresis ecircumflex -100 Ydieresis '
+                'edieresis -60 Ydieresis edotaccent -100 Ydieresis egrave -60 '
+                'Ydieresis emacron -60 Ydieresis eogonek -100 Ydieresis '
+                'hyphen -111 Ydieresis i -55 Ydieresis iacute -55 Ydieresis '
+                'iogonek -55 Ydieresis o -110 Ydieresis oacute -110 Ydieresis '
+                'ocircumflex -110 Ydieresis odieresis -70 Ydieresis ograve '
+                '-70 Ydieresis ohungarumlaut -110 Ydieresis omacron -70 '
+                'Ydieresis oslash -110 Ydieresis otilde -70 Ydieresis period '
+                '-129 Ydieresis semicolon -92 Ydieresis u -111 Ydieresis '
+                'uacute -111 Ydieresis ucircumflex -111 Ydieresis udieresis '
+                '-71 Ydieresis ugrave -71 Ydieresis uhungarumlaut -111 '
+                'Ydieresis umacron -71 Ydieresis uogonek -111 Ydieresis uring '
+                '-111 a v -20 a w -15 aacute v -20 aacute w -15 abreve v -20 '
+                'abreve w -15 acircumflex v -20 acircumflex w -15 adieresis v '
+                '-20 adieresis w -15 agrave v -20 agrave w -15 amacron v -20 '
+                'amacron w -15 aogonek v -20 aogonek w -15 aring v -20 aring '
+                'w -15 atilde v -20 atilde w -15 b period -40 b u -20 b '
+                'uacute -20 b ucircumflex -20 b udieresis -20 b ugrave -20 b '
+                'uhungarumlaut -20 b umacron -20 b uogonek -20 b uring -20 b '
+                'v -15 c y -15 c yacute -15 c ydieresis -15 cacute y -15 '
+                'cacute yacute -15 cacute ydieresis -15 ccaron y -15 ccaron '
+                'yacute -15 ccaron ydieresis -15 ccedilla y -15 ccedilla '
+                'yacute -15 ccedilla ydieresis -15 comma quotedblright -70 '
+                'comma quoteright -70 e g -15 e gbreve -15 e gcommaaccent -15 '
+                'e v -25 e w -25 e x -15 e y -15 e yacute -15 e ydieresis -15 '
+                'eacute g -15 eacute gbreve -15 eacute gcommaaccent -15 '
+                'eacute v -25 eacute w -25 eacute x -15 eacute y -15 eacute '
+                'yacute -15 eacute ydieresis -15 ecaron g -15 ecaron gbreve '
+                '-15 ecaron gcommaaccent -15 ecaron v -25 ecaron w -25 ecaron '
+                'x -15 ecaron y -15 ecaron yacute -15 ecaron ydieresis -15 '
+                'ecircumflex g -15 ecircumflex gbreve -15 ecircumflex '
+                'gcommaaccent -15 ecircumflex v -25 ecircumflex w -25 '
+                'ecircumflex x -15 ecircumflex y -15 ecircumflex yacute -15 '
+                'ecircumflex ydieresis -15 edieresis g -15 edieresis gbreve '
+                '-15 edieresis gcommaaccent -15 edieresis v -25 edieresis w '
+                '-25 edieresis x -15 edieresis y -15 edieresis yacute -15 '
+                'edieresis ydieresis -15 edotaccent g -15 edotaccent gbreve '
+                '-15 edotaccent gcommaaccent -15 edotaccent v -25 edotaccent '
+                'w -25 edotaccent x -15 edotaccent y -15 edotaccent yacute '
+                '-15 edotaccent ydieresis -15 egrave g -15 egrave gbreve -15 '
+                'egrave gcommaaccent -15 egrave v -25 egrave w -25 egrave x '
+                '-15 egrave y -15 egrave yacute -15 egrave ydieresis -15 '
+                'emacron g -15 emacron gbreve -15 emacron gcommaaccent -15 '
+                'emacron v -25 emacron w -25 emacron x -15 emacron y -15 '
+                'emacron yacute -15 emacron ydieresis -15 eogonek g -15 '
+                'eogonek gbreve -15 eogonek gcommaaccent -15 eogonek v -25 '
+                'eogonek w -25 eogonek x -15 eogonek y -15 eogonek yacute -15 '
+                'eogonek ydieresis -15 f a -10 f aacute -10 f abreve -10 f '
+                'acircumflex -10 f adieresis -10 f agrave -10 f amacron -10 f '
+                'aogonek -10 f aring -10 f atilde -10 f dotlessi -50 f f -25 '
+                'f i -20 f iacute -20 f quoteright 55 g a -5 g aacute -5 g '
+                'abreve -5 g acircumflex -5 g adieresis -5 g agrave -5 g '
+                'amacron -5 g aogonek -5 g aring -5 g atilde -5 gbreve a -5 '
+                'gbreve aacute -5 gbreve abreve -5 gbreve acircumflex -5 '
+                'gbreve adieresis -5 gbreve agrave -5 gbreve amacron -5 '
+                'gbreve aogonek -5 gbreve aring -5 gbreve atilde -5 '
+                'gcommaaccent a -5 gcommaaccent aacute -5 gcommaaccent abreve '
+                '-5 gcommaaccent acircumflex -5 gcommaaccent adieresis -5 '
+                'gcommaaccent agrave -5 gcommaaccent amacron -5 gcommaaccent '
+                'aogonek -5 gcommaaccent aring -5 gcommaaccent atilde -5 h y '
+                '-5 h yacute -5 h ydieresis -5 i v -25 iacute v -25 '
+                'icircumflex v -25 idieresis v -25 igrave v -25 imacron v -25 '
+                'iogonek v -25 k e -10 k eacute -10 k ecaron -10 k '
+                'ecircumflex -10 k edieresis -10 k edotaccent -10 k egrave '
+                '-10 k emacron -10 k eogonek -10 k o -10 k oacute -10 k '
+                'ocircumflex -10 k odieresis -10 k ograve -10 k ohungarumlaut '
+                '-10 k omacron -10 k oslash -10 k otilde -10 k y -15 k yacute '
+                '-15 k ydieresis -15 kcommaaccent e -10 kcommaaccent eacute '
+                '-10 kcommaaccent ecaron -10 kcommaaccent ecircumflex -10 '
+                'kcommaaccent edieresis -10 kcommaaccent edotaccent -10 '
+                'kcommaaccent egrave -10 kcommaaccent emacron -10 '
+                'kcommaaccent eogonek -10 kcommaaccent o -10 kcommaaccent '
+                'oacute -10 kcommaaccent ocircumflex -10 kcommaaccent '
+                'odieresis -10 kcommaaccent ograve -10 kcommaaccent '
+                'ohungarumlaut -10 kcommaaccent omacron -10 kcommaaccent '
+                'oslash -10 kcommaaccent otilde -10 kcommaaccent y -15 '
+                'kcommaaccent yacute -15 kcommaaccent ydieresis -15 l w -10 '
+                'lacute w -10 lcommaaccent w -10 lslash w -10 n v -40 n y -15 '
+                'n yacute -15 n ydieresis -15 nacute v -40 nacute y -15 '
+                'nacute yacute -15 nacute ydieresis -15 ncaron v -40 ncaron y '
+                '-15 ncaron yacute -15 ncaron ydieresis -15 ncommaaccent v '
+                '-40 ncommaaccent y -15 ncommaaccent yacute -15 ncommaaccent '
+                'ydieresis -15 ntilde v -40 ntilde y -15 ntilde yacute -15 '
+                'ntilde ydieresis -15 o v -15 o w -25 o y -10 o yacute -10 o '
+                'ydieresis -10 oacute v -15 oacute w -25 oacute y -10 oacute '
+                'yacute -10 oacute ydieresis -10 ocircumflex v -15 '
+                'ocircumflex w -25 ocircumflex y -10 ocircumflex yacute -10 '
+                'ocircumflex ydieresis -10 odieresis v -15 odieresis w -25 '
+                'odieresis y -10 odieresis yacute -10 odieresis ydieresis -10 '
+                'ograve v -15 ograve w -25 ograve y -10 ograve yacute -10 '
+                'ograve ydieresis -10 ohungarumlaut v -15 ohungarumlaut w -25 '
+                'ohungarumlaut y -10 ohungarumlaut yacute -10 ohungarumlaut '
+                'ydieresis -10 omacron v -15 omacron w -25 omacron y -10 '
+                'omacron yacute -10 omacron ydieresis -10 oslash v -15 oslash '
+                'w -25 oslash y -10 oslash yacute -10 oslash ydieresis -10 '
+                'otilde v -15 otilde w -25 otilde y -10 otilde yacute -10 '
+                'otilde ydieresis -10 p y -10 p yacute -10 p ydieresis -10 '
+                'period quotedblright -70 period quoteright -70 quotedblleft '
+                'A -80 quotedblleft Aacute -80 quotedblleft Abreve -80 '
+                'quotedblleft Acircumflex -80 quotedblleft Adieresis -80 '
+                'quotedblleft Agrave -80 quotedblleft Amacron -80 '
+                'quotedblleft Aogonek -80 quotedblleft Aring -80 quotedblleft '
+                'Atilde -80 quoteleft A -80 quoteleft Aacute -80 quoteleft '
+                'Abreve -80 quoteleft Acircumflex -80 quoteleft Adieresis -80 '
+                'quoteleft Agrave -80 quoteleft Amacron -80 quoteleft Aogonek '
+                '-80 quoteleft Aring -80 quoteleft Atilde -80 quoteleft '
+                'quoteleft -74 quoteright d -50 quoteright dcroat -50 '
+                'quoteright l -10 quoteright lacute -10 quoteright '
+                'lcommaaccent -10 quoteright lslash -10 quoteright quoteright '
+                '-74 quoteright r -50 quoteright racute -50 quoteright rcaron '
+                '-50 quoteright rcommaaccent -50 quoteright s -55 quoteright '
+                'sacute -55 quoteright scaron -55 quoteright scedilla -55 '
+                'quoteright scommaaccent -55 quoteright space -74 quoteright '
+                't -18 quoteright tcommaaccent -18 quoteright v -50 r comma '
+                '-40 r g -18 r gbreve -18 r gcommaaccent -18 r hyphen -20 r '
+                'period -55 racute comma -40 racute g -18 racute gbreve -18 '
+                'racute gcommaaccent -18 racute hyphen -20 racute period -55 '
+                'rcaron comma -40 rcaron g -18 rcaron gbreve -18 rcaron '
+                'gcommaaccent -18 rcaron hyphen -20 rcaron period -55 '
+                'rcommaaccent comma -40 rcommaaccent g -18 rcommaaccent '
+                'gbreve -18 rcommaaccent gcommaaccent -18 rcommaaccent hyphen '
+                '-20 rcommaaccent period -55 space A -55 space Aacute -55 '
+                'space Abreve -55 space Acircumflex -55 space Adieresis -55 '
+                'space Agrave -55 space Amacron -55 space Aogonek -55 space '
+                'Aring -55 space Atilde -55 space T -18 space Tcaron -18 '
+                'space Tcommaaccent -18 space V -50 space W -30 space Y -90 '
+                'space Yacute -90 space Ydieresis -90 v a -25 v aacute -25 v '
+                'abreve -25 v acircumflex -25 v adieresis -25 v agrave -25 v '
+                'amacron -25 v aogonek -25 v aring -25 v atilde -25 v comma '
+                '-65 v e -15 v eacute -15 v ecaron -15 v ecircumflex -15 v '
+                'edieresis -15 v edotaccent -15 v egrave -15 v emacron -15 v '
+                'eogonek -15 v o -20 v oacute -20 v ocircumflex -20 v '
+                'odieresis -20 v ograve -20 v ohungarumlaut -20 v omacron -20 '
+                'v oslash -20 v otilde -20 v period -65 w a -10 w aacute -10 '
+                'w abreve -10 w acircumflex -10 w adieresis -10 w agrave -10 '
+                'w amacron -10 w aogonek -10 w aring -10 w atilde -10 w comma '
+                '-65 w o -10 w oacute -10 w ocircumflex -10 w odieresis -10 w '
+                'ograve -10 w ohungarumlaut -10 w omacron -10 w oslash -10 w '
+                'otilde -10 w period -65 x e -15 x eacute -15 x ecaron -15 x '
+                'ecircumflex -15 x edieresis -15 x edotaccent -15 x egrave '
+                '-15 x emacron -15 x eogonek -15 y comma -65 y period -65 '
+                'yacute comma -65 yacute period -65 ydieresis comma -65 '
+                'ydieresis period -65'}
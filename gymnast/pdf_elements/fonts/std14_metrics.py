@@ -0,0 +1,1541 @@
+"""
+Metrics for the standard 14 fonts, compiled from the AFM files in data/afm.
+Generated by gymnast.pdf_elements.fonts.afm - do not edit.
+
+FONTS maps each font name to a dict of its global metrics plus Chars, a string
+of whitespace separated (character code, glyph name, width) triples in the
+font's built-in encoding (code -1 for unencoded glyphs).  It's only split up
+when the font is first used (see type1.get_std_metrics).
+"""
+
+FONTS = {'Courier': {'Ascender': 629,
+             'CapHeight': 562,
+             'CharacterSet': 'ExtendedRoman',
+             'Chars': '32 space 600 33 exclam 600 34 quotedbl 600 35 '
+                      'numbersign 600 36 dollar 600 37 percent 600 38 '
+                      'ampersand 600 39 quoteright 600 40 parenleft 600 41 '
+                      'parenright 600 42 asterisk 600 43 plus 600 44 comma '
+                      '600 45 hyphen 600 46 period 600 47 slash 600 48 zero '
+                      '600 49 one 600 50 two 600 51 three 600 52 four 600 53 '
+                      'five 600 54 six 600 55 seven 600 56 eight 600 57 nine '
+                      '600 58 colon 600 59 semicolon 600 60 less 600 61 equal '
+                      '600 62 greater 600 63 question 600 64 at 600 65 A 600 '
+                      '66 B 600 67 C 600 68 D 600 69 E 600 70 F 600 71 G 600 '
+                      '72 H 600 73 I 600 74 J 600 75 K 600 76 L 600 77 M 600 '
+                      '78 N 600 79 O 600 80 P 600 81 Q 600 82 R 600 83 S 600 '
+                      '84 T 600 85 U 600 86 V 600 87 W 600 88 X 600 89 Y 600 '
+                      '90 Z 600 91 bracketleft 600 92 backslash 600 93 '
+                      'bracketright 600 94 asciicircum 600 95 underscore 600 '
+                      '96 quoteleft 600 97 a 600 98 b 600 99 c 600 100 d 600 '
+                      '101 e 600 102 f 600 103 g 600 104 h 600 105 i 600 106 '
+                      'j 600 107 k 600 108 l 600 109 m 600 110 n 600 111 o '
+                      '600 112 p 600 113 q 600 114 r 600 115 s 600 116 t 600 '
+                      '117 u 600 118 v 600 119 w 600 120 x 600 121 y 600 122 '
+                      'z 600 123 braceleft 600 124 bar 600 125 braceright 600 '
+                      '126 asciitilde 600 161 exclamdown 600 162 cent 600 163 '
+                      'sterling 600 164 fraction 600 165 yen 600 166 florin '
+                      '600 167 section 600 168 currency 600 169 quotesingle '
+                      '600 170 quotedblleft 600 171 guillemotleft 600 172 '
+                      'guilsinglleft 600 173 guilsinglright 600 174 fi 600 '
+                      '175 fl 600 177 endash 600 178 dagger 600 179 daggerdbl '
+                      '600 180 periodcentered 600 182 paragraph 600 183 '
+                      'bullet 600 184 quotesinglbase 600 185 quotedblbase 600 '
+                      '186 quotedblright 600 187 guillemotright 600 188 '
+                      'ellipsis 600 189 perthousand 600 191 questiondown 600 '
+                      '193 grave 600 194 acute 600 195 circumflex 600 196 '
+                      'tilde 600 197 macron 600 198 breve 600 199 dotaccent '
+                      '600 200 dieresis 600 202 ring 600 203 cedilla 600 205 '
+                      'hungarumlaut 600 206 ogonek 600 207 caron 600 208 '
+                      'emdash 600 225 AE 600 227 ordfeminine 600 232 Lslash '
+                      '600 233 Oslash 600 234 OE 600 235 ordmasculine 600 241 '
+                      'ae 600 245 dotlessi 600 248 lslash 600 249 oslash 600 '
+                      '250 oe 600 251 germandbls 600 -1 Idieresis 600 -1 '
+                      'eacute 600 -1 abreve 600 -1 uhungarumlaut 600 -1 '
+                      'ecaron 600 -1 Ydieresis 600 -1 divide 600 -1 Yacute '
+                      '600 -1 Acircumflex 600 -1 aacute 600 -1 Ucircumflex '
+                      '600 -1 yacute 600 -1 scommaaccent 600 -1 ecircumflex '
+                      '600 -1 Uring 600 -1 Udieresis 600 -1 aogonek 600 -1 '
+                      'Uacute 600 -1 uogonek 600 -1 Edieresis 600 -1 Dcroat '
+                      '600 -1 commaaccent 600 -1 copyright 600 -1 Emacron 600 '
+                      '-1 ccaron 600 -1 aring 600 -1 Ncommaaccent 600 -1 '
+                      'lacute 600 -1 agrave 600 -1 Tcommaaccent 600 -1 Cacute '
+                      '600 -1 atilde 600 -1 Edotaccent 600 -1 scaron 600 -1 '
+                      'scedilla 600 -1 iacute 600 -1 lozenge 600 -1 Rcaron '
+                      '600 -1 Gcommaaccent 600 -1 ucircumflex 600 -1 '
+                      'acircumflex 600 -1 Amacron 600 -1 rcaron 600 -1 '
+                      'ccedilla 600 -1 Zdotaccent 600 -1 Thorn 600 -1 Omacron '
+                      '600 -1 Racute 600 -1 Sacute 600 -1 dcaron 600 -1 '
+                      'Umacron 600 -1 uring 600 -1 threesuperior 600 -1 '
+                      'Ograve 600 -1 Agrave 600 -1 Abreve 600 -1 multiply 600 '
+                      '-1 uacute 600 -1 Tcaron 600 -1 partialdiff 600 -1 '
+                      'ydieresis 600 -1 Nacute 600 -1 icircumflex 600 -1 '
+                      'Ecircumflex 600 -1 adieresis 600 -1 edieresis 600 -1 '
+                      'cacute 600 -1 nacute 600 -1 umacron 600 -1 Ncaron 600 '
+                      '-1 Iacute 600 -1 plusminus 600 -1 brokenbar 600 -1 '
+                      'registered 600 -1 Gbreve 600 -1 Idotaccent 600 -1 '
+                      'summation 600 -1 Egrave 600 -1 racute 600 -1 omacron '
+                      '600 -1 Zacute 600 -1 Zcaron 600 -1 greaterequal 600 -1 '
+                      'Eth 600 -1 Ccedilla 600 -1 lcommaaccent 600 -1 tcaron '
+                      '600 -1 eogonek 600 -1 Uogonek 600 -1 Aacute 600 -1 '
+                      'Adieresis 600 -1 egrave 600 -1 zacute 600 -1 iogonek '
+                      '600 -1 Oacute 600 -1 oacute 600 -1 amacron 600 -1 '
+                      'sacute 600 -1 idieresis 600 -1 Ocircumflex 600 -1 '
+                      'Ugrave 600 -1 Delta 600 -1 thorn 600 -1 twosuperior '
+                      '600 -1 Odieresis 600 -1 mu 600 -1 igrave 600 -1 '
+                      'ohungarumlaut 600 -1 Eogonek 600 -1 dcroat 600 -1 '
+                      'threequarters 600 -1 Scedilla 600 -1 lcaron 600 -1 '
+                      'Kcommaaccent 600 -1 Lacute 600 -1 trademark 600 -1 '
+                      'edotaccent 600 -1 Igrave 600 -1 Imacron 600 -1 Lcaron '
+                      '600 -1 onehalf 600 -1 lessequal 600 -1 ocircumflex 600 '
+                      '-1 ntilde 600 -1 Uhungarumlaut 600 -1 Eacute 600 -1 '
+                      'emacron 600 -1 gbreve 600 -1 onequarter 600 -1 Scaron '
+                      '600 -1 Scommaaccent 600 -1 Ohungarumlaut 600 -1 degree '
+                      '600 -1 ograve 600 -1 Ccaron 600 -1 ugrave 600 -1 '
+                      'radical 600 -1 Dcaron 600 -1 rcommaaccent 600 -1 '
+                      'Ntilde 600 -1 otilde 600 -1 Rcommaaccent 600 -1 '
+                      'Lcommaaccent 600 -1 Atilde 600 -1 Aogonek 600 -1 Aring '
+                      '600 -1 Otilde 600 -1 zdotaccent 600 -1 Ecaron 600 -1 '
+                      'Iogonek 600 -1 kcommaaccent 600 -1 minus 600 -1 '
+                      'Icircumflex 600 -1 ncaron 600 -1 tcommaaccent 600 -1 '
+                      'logicalnot 600 -1 odieresis 600 -1 udieresis 600 -1 '
+                      'notequal 600 -1 gcommaaccent 600 -1 eth 600 -1 zcaron '
+                      '600 -1 ncommaaccent 600 -1 onesuperior 600 -1 imacron '
+                      '600 -1 Euro 600',
+             'Descender': -157,
+             'FamilyName': 'Courier',
+             'FontBBox': (-23, -250, 715, 805),
+             'FontName': 'Courier',
+             'IsFixedPitch': True,
+             'ItalicAngle': 0,
+             'StdHW': 51,
+             'StdVW': 51,
+             'Weight': 'Medium',
+             'XHeight': 426},
+ 'Courier-Bold': {'Ascender': 629,
+                  'CapHeight': 562,
+                  'CharacterSet': 'ExtendedRoman',
+                  'Chars': '32 space 600 33 exclam 600 34 quotedbl 600 35 '
+                           'numbersign 600 36 dollar 600 37 percent 600 38 '
+                           'ampersand 600 39 quoteright 600 40 parenleft 600 '
+                           '41 parenright 600 42 asterisk 600 43 plus 600 44 '
+                           'comma 600 45 hyphen 600 46 period 600 47 slash '
+                           '600 48 zero 600 49 one 600 50 two 600 51 three '
+                           '600 52 four 600 53 five 600 54 six 600 55 seven '
+                           '600 56 eight 600 57 nine 600 58 colon 600 59 '
+                           'semicolon 600 60 less 600 61 equal 600 62 greater '
+                           '600 63 question 600 64 at 600 65 A 600 66 B 600 '
+                           '67 C 600 68 D 600 69 E 600 70 F 600 71 G 600 72 H '
+                           '600 73 I 600 74 J 600 75 K 600 76 L 600 77 M 600 '
+                           '78 N 600 79 O 600 80 P 600 81 Q 600 82 R 600 83 S '
+                           '600 84 T 600 85 U 600 86 V 600 87 W 600 88 X 600 '
+                           '89 Y 600 90 Z 600 91 bracketleft 600 92 backslash '
+                           '600 93 bracketright 600 94 asciicircum 600 95 '
+                           'underscore 600 96 quoteleft 600 97 a 600 98 b 600 '
+                           '99 c 600 100 d 600 101 e 600 102 f 600 103 g 600 '
+                           '104 h 600 105 i 600 106 j 600 107 k 600 108 l 600 '
+                           '109 m 600 110 n 600 111 o 600 112 p 600 113 q 600 '
+                           '114 r 600 115 s 600 116 t 600 117 u 600 118 v 600 '
+                           '119 w 600 120 x 600 121 y 600 122 z 600 123 '
+                           'braceleft 600 124 bar 600 125 braceright 600 126 '
+                           'asciitilde 600 161 exclamdown 600 162 cent 600 '
+                           '163 sterling 600 164 fraction 600 165 yen 600 166 '
+                           'florin 600 167 section 600 168 currency 600 169 '
+                           'quotesingle 600 170 quotedblleft 600 171 '
+                           'guillemotleft 600 172 guilsinglleft 600 173 '
+                           'guilsinglright 600 174 fi 600 175 fl 600 177 '
+                           'endash 600 178 dagger 600 179 daggerdbl 600 180 '
+                           'periodcentered 600 182 paragraph 600 183 bullet '
+                           '600 184 quotesinglbase 600 185 quotedblbase 600 '
+                           '186 quotedblright 600 187 guillemotright 600 188 '
+                           'ellipsis 600 189 perthousand 600 191 questiondown '
+                           '600 193 grave 600 194 acute 600 195 circumflex '
+                           '600 196 tilde 600 197 macron 600 198 breve 600 '
+                           '199 dotaccent 600 200 dieresis 600 202 ring 600 '
+                           '203 cedilla 600 205 hungarumlaut 600 206 ogonek '
+                           '600 207 caron 600 208 emdash 600 225 AE 600 227 '
+                           'ordfeminine 600 232 Lslash 600 233 Oslash 600 234 '
+                           'OE 600 235 ordmasculine 600 241 ae 600 245 '
+                           'dotlessi 600 248 lslash 600 249 oslash 600 250 oe '
+                           '600 251 germandbls 600 -1 Idieresis 600 -1 eacute '
+                           '600 -1 abreve 600 -1 uhungarumlaut 600 -1 ecaron '
+                           '600 -1 Ydieresis 600 -1 divide 600 -1 Yacute 600 '
+                           '-1 Acircumflex 600 -1 aacute 600 -1 Ucircumflex '
+                           '600 -1 yacute 600 -1 scommaaccent 600 -1 '
+                           'ecircumflex 600 -1 Uring 600 -1 Udieresis 600 -1 '
+                           'aogonek 600 -1 Uacute 600 -1 uogonek 600 -1 '
+                           'Edieresis 600 -1 Dcroat 600 -1 commaaccent 600 -1 '
+                           'copyright 600 -1 Emacron 600 -1 ccaron 600 -1 '
+                           'aring 600 -1 Ncommaaccent 600 -1 lacute 600 -1 '
+                           'agrave 600 -1 Tcommaaccent 600 -1 Cacute 600 -1 '
+                           'atilde 600 -1 Edotaccent 600 -1 scaron 600 -1 '
+                           'scedilla 600 -1 iacute 600 -1 lozenge 600 -1 '
+                           'Rcaron 600 -1 Gcommaaccent 600 -1 ucircumflex 600 '
+                           '-1 acircumflex 600 -1 Amacron 600 -1 rcaron 600 '
+                           '-1 ccedilla 600 -1 Zdotaccent 600 -1 Thorn 600 -1 '
+                           'Omacron 600 -1 Racute 600 -1 Sacute 600 -1 dcaron '
+                           '600 -1 Umacron 600 -1 uring 600 -1 threesuperior '
+                           '600 -1 Ograve 600 -1 Agrave 600 -1 Abreve 600 -1 '
+                           'multiply 600 -1 uacute 600 -1 Tcaron 600 -1 '
+                           'partialdiff 600 -1 ydieresis 600 -1 Nacute 600 -1 '
+                           'icircumflex 600 -1 Ecircumflex 600 -1 adieresis '
+                           '600 -1 edieresis 600 -1 cacute 600 -1 nacute 600 '
+                           '-1 umacron 600 -1 Ncaron 600 -1 Iacute 600 -1 '
+                           'plusminus 600 -1 brokenbar 600 -1 registered 600 '
+                           '-1 Gbreve 600 -1 Idotaccent 600 -1 summation 600 '
+                           '-1 Egrave 600 -1 racute 600 -1 omacron 600 -1 '
+                           'Zacute 600 -1 Zcaron 600 -1 greaterequal 600 -1 '
+                           'Eth 600 -1 Ccedilla 600 -1 lcommaaccent 600 -1 '
+                           'tcaron 600 -1 eogonek 600 -1 Uogonek 600 -1 '
+                           'Aacute 600 -1 Adieresis 600 -1 egrave 600 -1 '
+                           'zacute 600 -1 iogonek 600 -1 Oacute 600 -1 oacute '
+                           '600 -1 amacron 600 -1 sacute 600 -1 idieresis 600 '
+                           '-1 Ocircumflex 600 -1 Ugrave 600 -1 Delta 600 -1 '
+                           'thorn 600 -1 twosuperior 600 -1 Odieresis 600 -1 '
+                           'mu 600 -1 igrave 600 -1 ohungarumlaut 600 -1 '
+                           'Eogonek 600 -1 dcroat 600 -1 threequarters 600 -1 '
+                           'Scedilla 600 -1 lcaron 600 -1 Kcommaaccent 600 -1 '
+                           'Lacute 600 -1 trademark 600 -1 edotaccent 600 -1 '
+                           'Igrave 600 -1 Imacron 600 -1 Lcaron 600 -1 '
+                           'onehalf 600 -1 lessequal 600 -1 ocircumflex 600 '
+                           '-1 ntilde 600 -1 Uhungarumlaut 600 -1 Eacute 600 '
+                           '-1 emacron 600 -1 gbreve 600 -1 onequarter 600 -1 '
+                           'Scaron 600 -1 Scommaaccent 600 -1 Ohungarumlaut '
+                           '600 -1 degree 600 -1 ograve 600 -1 Ccaron 600 -1 '
+                           'ugrave 600 -1 radical 600 -1 Dcaron 600 -1 '
+                           'rcommaaccent 600 -1 Ntilde 600 -1 otilde 600 -1 '
+                           'Rcommaaccent 600 -1 Lcommaaccent 600 -1 Atilde '
+                           '600 -1 Aogonek 600 -1 Aring 600 -1 Otilde 600 -1 '
+                           'zdotaccent 600 -1 Ecaron 600 -1 Iogonek 600 -1 '
+                           'kcommaaccent 600 -1 minus 600 -1 Icircumflex 600 '
+                           '-1 ncaron 600 -1 tcommaaccent 600 -1 logicalnot '
+                           '600 -1 odieresis 600 -1 udieresis 600 -1 notequal '
+                           '600 -1 gcommaaccent 600 -1 eth 600 -1 zcaron 600 '
+                           '-1 ncommaaccent 600 -1 onesuperior 600 -1 imacron '
+                           '600 -1 Euro 600',
+                  'Descender': -157,
+                  'FamilyName': 'Courier',
+                  'FontBBox': (-113, -250, 749, 801),
+                  'FontName': 'Courier-Bold',
+                  'IsFixedPitch': True,
+                  'ItalicAngle': 0,
+                  'StdHW': 84,
+                  'StdVW': 106,
+                  'Weight': 'Bold',
+                  'XHeight': 439},
+ 'Courier-BoldOblique': {'Ascender': 629,
+                         'CapHeight': 562,
+                         'CharacterSet': 'ExtendedRoman',
+                         'Chars': '32 space 600 33 exclam 600 34 quotedbl 600 '
+                                  '35 numbersign 600 36 dollar 600 37 percent '
+                                  '600 38 ampersand 600 39 quoteright 600 40 '
+                                  'parenleft 600 41 parenright 600 42 '
+                                  'asterisk 600 43 plus 600 44 comma 600 45 '
+                                  'hyphen 600 46 period 600 47 slash 600 48 '
+                                  'zero 600 49 one 600 50 two 600 51 three '
+                                  '600 52 four 600 53 five 600 54 six 600 55 '
+                                  'seven 600 56 eight 600 57 nine 600 58 '
+                                  'colon 600 59 semicolon 600 60 less 600 61 '
+                                  'equal 600 62 greater 600 63 question 600 '
+                                  '64 at 600 65 A 600 66 B 600 67 C 600 68 D '
+                                  '600 69 E 600 70 F 600 71 G 600 72 H 600 73 '
+                                  'I 600 74 J 600 75 K 600 76 L 600 77 M 600 '
+                                  '78 N 600 79 O 600 80 P 600 81 Q 600 82 R '
+                                  '600 83 S 600 84 T 600 85 U 600 86 V 600 87 '
+                                  'W 600 88 X 600 89 Y 600 90 Z 600 91 '
+                                  'bracketleft 600 92 backslash 600 93 '
+                                  'bracketright 600 94 asciicircum 600 95 '
+                                  'underscore 600 96 quoteleft 600 97 a 600 '
+                                  '98 b 600 99 c 600 100 d 600 101 e 600 102 '
+                                  'f 600 103 g 600 104 h 600 105 i 600 106 j '
+                                  '600 107 k 600 108 l 600 109 m 600 110 n '
+                                  '600 111 o 600 112 p 600 113 q 600 114 r '
+                                  '600 115 s 600 116 t 600 117 u 600 118 v '
+                                  '600 119 w 600 120 x 600 121 y 600 122 z '
+                                  '600 123 braceleft 600 124 bar 600 125 '
+                                  'braceright 600 126 asciitilde 600 161 '
+                                  'exclamdown 600 162 cent 600 163 sterling '
+                                  '600 164 fraction 600 165 yen 600 166 '
+                                  'florin 600 167 section 600 168 currency '
+                                  '600 169 quotesingle 600 170 quotedblleft '
+                                  '600 171 guillemotleft 600 172 '
+                                  'guilsinglleft 600 173 guilsinglright 600 '
+                                  '174 fi 600 175 fl 600 177 endash 600 178 '
+                                  'dagger 600 179 daggerdbl 600 180 '
+                                  'periodcentered 600 182 paragraph 600 183 '
+                                  'bullet 600 184 quotesinglbase 600 185 '
+                                  'quotedblbase 600 186 quotedblright 600 187 '
+                                  'guillemotright 600 188 ellipsis 600 189 '
+                                  'perthousand 600 191 questiondown 600 193 '
+                                  'grave 600 194 acute 600 195 circumflex 600 '
+                                  '196 tilde 600 197 macron 600 198 breve 600 '
+                                  '199 dotaccent 600 200 dieresis 600 202 '
+                                  'ring 600 203 cedilla 600 205 hungarumlaut '
+                                  '600 206 ogonek 600 207 caron 600 208 '
+                                  'emdash 600 225 AE 600 227 ordfeminine 600 '
+                                  '232 Lslash 600 233 Oslash 600 234 OE 600 '
+                                  '235 ordmasculine 600 241 ae 600 245 '
+                                  'dotlessi 600 248 lslash 600 249 oslash 600 '
+                                  '250 oe 600 251 germandbls 600 -1 Idieresis '
+                                  '600 -1 eacute 600 -1 abreve 600 -1 '
+                                  'uhungarumlaut 600 -1 ecaron 600 -1 '
+                                  'Ydieresis 600 -1 divide 600 -1 Yacute 600 '
+                                  '-1 Acircumflex 600 -1 aacute 600 -1 '
+                                  'Ucircumflex 600 -1 yacute 600 -1 '
+                                  'scommaaccent 600 -1 ecircumflex 600 -1 '
+                                  'Uring 600 -1 Udieresis 600 -1 aogonek 600 '
+                                  '-1 Uacute 600 -1 uogonek 600 -1 Edieresis '
+                                  '600 -1 Dcroat 600 -1 commaaccent 600 -1 '
+                                  'copyright 600 -1 Emacron 600 -1 ccaron 600 '
+                                  '-1 aring 600 -1 Ncommaaccent 600 -1 lacute '
+                                  '600 -1 agrave 600 -1 Tcommaaccent 600 -1 '
+                                  'Cacute 600 -1 atilde 600 -1 Edotaccent 600 '
+                                  '-1 scaron 600 -1 scedilla 600 -1 iacute '
+                                  '600 -1 lozenge 600 -1 Rcaron 600 -1 '
+                                  'Gcommaaccent 600 -1 ucircumflex 600 -1 '
+                                  'acircumflex 600 -1 Amacron 600 -1 rcaron '
+                                  '600 -1 ccedilla 600 -1 Zdotaccent 600 -1 '
+                                  'Thorn 600 -1 Omacron 600 -1 Racute 600 -1 '
+                                  'Sacute 600 -1 dcaron 600 -1 Umacron 600 -1 '
+                                  'uring 600 -1 threesuperior 600 -1 Ograve '
+                                  '600 -1 Agrave 600 -1 Abreve 600 -1 '
+                                  'multiply 600 -1 uacute 600 -1 Tcaron 600 '
+                                  '-1 partialdiff 600 -1 ydieresis 600 -1 '
+                                  'Nacute 600 -1 icircumflex 600 -1 '
+                                  'Ecircumflex 600 -1 adieresis 600 -1 '
+                                  'edieresis 600 -1 cacute 600 -1 nacute 600 '
+                                  '-1 umacron 600 -1 Ncaron 600 -1 Iacute 600 '
+                                  '-1 plusminus 600 -1 brokenbar 600 -1 '
+                                  'registered 600 -1 Gbreve 600 -1 Idotaccent '
+                                  '600 -1 summation 600 -1 Egrave 600 -1 '
+                                  'racute 600 -1 omacron 600 -1 Zacute 600 -1 '
+                                  'Zcaron 600 -1 greaterequal 600 -1 Eth 600 '
+                                  '-1 Ccedilla 600 -1 lcommaaccent 600 -1 '
+                                  'tcaron 600 -1 eogonek 600 -1 Uogonek 600 '
+                                  '-1 Aacute 600 -1 Adieresis 600 -1 egrave '
+                                  '600 -1 zacute 600 -1 iogonek 600 -1 Oacute '
+                                  '600 -1 oacute 600 -1 amacron 600 -1 sacute '
+                                  '600 -1 idieresis 600 -1 Ocircumflex 600 -1 '
+                                  'Ugrave 600 -1 Delta 600 -1 thorn 600 -1 '
+                                  'twosuperior 600 -1 Odieresis 600 -1 mu 600 '
+                                  '-1 igrave 600 -1 ohungarumlaut 600 -1 '
+                                  'Eogonek 600 -1 dcroat 600 -1 threequarters '
+                                  '600 -1 Scedilla 600 -1 lcaron 600 -1 '
+                                  'Kcommaaccent 600 -1 Lacute 600 -1 '
+                                  'trademark 600 -1 edotaccent 600 -1 Igrave '
+                                  '600 -1 Imacron 600 -1 Lcaron 600 -1 '
+                                  'onehalf 600 -1 lessequal 600 -1 '
+                                  'ocircumflex 600 -1 ntilde 600 -1 '
+                                  'Uhungarumlaut 600 -1 Eacute 600 -1 emacron '
+                                  '600 -1 gbreve 600 -1 onequarter 600 -1 '
+                                  'Scaron 600 -1 Scommaaccent 600 -1 '
+                                  'Ohungarumlaut 600 -1 degree 600 -1 ograve '
+                                  '600 -1 Ccaron 600 -1 ugrave 600 -1 radical '
+                                  '600 -1 Dcaron 600 -1 rcommaaccent 600 -1 '
+                                  'Ntilde 600 -1 otilde 600 -1 Rcommaaccent '
+                                  '600 -1 Lcommaaccent 600 -1 Atilde 600 -1 '
+                                  'Aogonek 600 -1 Aring 600 -1 Otilde 600 -1 '
+                                  'zdotaccent 600 -1 Ecaron 600 -1 Iogonek '
+                                  '600 -1 kcommaaccent 600 -1 minus 600 -1 '
+                                  'Icircumflex 600 -1 ncaron 600 -1 '
+                                  'tcommaaccent 600 -1 logicalnot 600 -1 '
+                                  'odieresis 600 -1 udieresis 600 -1 notequal '
+                                  '600 -1 gcommaaccent 600 -1 eth 600 -1 '
+                                  'zcaron 600 -1 ncommaaccent 600 -1 '
+                                  'onesuperior 600 -1 imacron 600 -1 Euro 600',
+                         'Descender': -157,
+                         'FamilyName': 'Courier',
+                         'FontBBox': (-57, -250, 869, 801),
+                         'FontName': 'Courier-BoldOblique',
+                         'IsFixedPitch': True,
+                         'ItalicAngle': -12,
+                         'StdHW': 84,
+                         'StdVW': 106,
+                         'Weight': 'Bold',
+                         'XHeight': 439},
+ 'Courier-Oblique': {'Ascender': 629,
+                     'CapHeight': 562,
+                     'CharacterSet': 'ExtendedRoman',
+                     'Chars': '32 space 600 33 exclam 600 34 quotedbl 600 35 '
+                              'numbersign 600 36 dollar 600 37 percent 600 38 '
+                              'ampersand 600 39 quoteright 600 40 parenleft '
+                              '600 41 parenright 600 42 asterisk 600 43 plus '
+                              '600 44 comma 600 45 hyphen 600 46 period 600 '
+                              '47 slash 600 48 zero 600 49 one 600 50 two 600 '
+                              '51 three 600 52 four 600 53 five 600 54 six '
+                              '600 55 seven 600 56 eight 600 57 nine 600 58 '
+                              'colon 600 59 semicolon 600 60 less 600 61 '
+                              'equal 600 62 greater 600 63 question 600 64 at '
+                              '600 65 A 600 66 B 600 67 C 600 68 D 600 69 E '
+                              '600 70 F 600 71 G 600 72 H 600 73 I 600 74 J '
+                              '600 75 K 600 76 L 600 77 M 600 78 N 600 79 O '
+                              '600 80 P 600 81 Q 600 82 R 600 83 S 600 84 T '
+                              '600 85 U 600 86 V 600 87 W 600 88 X 600 89 Y '
+                              '600 90 Z 600 91 bracketleft 600 92 backslash '
+                              '600 93 bracketright 600 94 asciicircum 600 95 '
+                              'underscore 600 96 quoteleft 600 97 a 600 98 b '
+                              '600 99 c 600 100 d 600 101 e 600 102 f 600 103 '
+                              'g 600 104 h 600 105 i 600 106 j 600 107 k 600 '
+                              '108 l 600 109 m 600 110 n 600 111 o 600 112 p '
+                              '600 113 q 600 114 r 600 115 s 600 116 t 600 '
+                              '117 u 600 118 v 600 119 w 600 120 x 600 121 y '
+                              '600 122 z 600 123 braceleft 600 124 bar 600 '
+                              '125 braceright 600 126 asciitilde 600 161 '
+                              'exclamdown 600 162 cent 600 163 sterling 600 '
+                              '164 fraction 600 165 yen 600 166 florin 600 '
+                              '167 section 600 168 currency 600 169 '
+                              'quotesingle 600 170 quotedblleft 600 171 '
+                              'guillemotleft 600 172 guilsinglleft 600 173 '
+                              'guilsinglright 600 174 fi 600 175 fl 600 177 '
+                              'endash 600 178 dagger 600 179 daggerdbl 600 '
+                              '180 periodcentered 600 182 paragraph 600 183 '
+                              'bullet 600 184 quotesinglbase 600 185 '
+                              'quotedblbase 600 186 quotedblright 600 187 '
+                              'guillemotright 600 188 ellipsis 600 189 '
+                              'perthousand 600 191 questiondown 600 193 grave '
+                              '600 194 acute 600 195 circumflex 600 196 tilde '
+                              '600 197 macron 600 198 breve 600 199 dotaccent '
+                              '600 200 dieresis 600 202 ring 600 203 cedilla '
+                              '600 205 hungarumlaut 600 206 ogonek 600 207 '
+                              'caron 600 208 emdash 600 225 AE 600 227 '
+                              'ordfeminine 600 232 Lslash 600 233 Oslash 600 '
+                              '234 OE 600 235 ordmasculine 600 241 ae 600 245 '
+                              'dotlessi 600 248 lslash 600 249 oslash 600 250 '
+                              'oe 600 251 germandbls 600 -1 Idieresis 600 -1 '
+                              'eacute 600 -1 abreve 600 -1 uhungarumlaut 600 '
+                              '-1 ecaron 600 -1 Ydieresis 600 -1 divide 600 '
+                              '-1 Yacute 600 -1 Acircumflex 600 -1 aacute 600 '
+                              '-1 Ucircumflex 600 -1 yacute 600 -1 '
+                              'scommaaccent 600 -1 ecircumflex 600 -1 Uring '
+                              '600 -1 Udieresis 600 -1 aogonek 600 -1 Uacute '
+                              '600 -1 uogonek 600 -1 Edieresis 600 -1 Dcroat '
+                              '600 -1 commaaccent 600 -1 copyright 600 -1 '
+                              'Emacron 600 -1 ccaron 600 -1 aring 600 -1 '
+                              'Ncommaaccent 600 -1 lacute 600 -1 agrave 600 '
+                              '-1 Tcommaaccent 600 -1 Cacute 600 -1 atilde '
+                              '600 -1 Edotaccent 600 -1 scaron 600 -1 '
+                              'scedilla 600 -1 iacute 600 -1 lozenge 600 -1 '
+                              'Rcaron 600 -1 Gcommaaccent 600 -1 ucircumflex '
+                              '600 -1 acircumflex 600 -1 Amacron 600 -1 '
+                              'rcaron 600 -1 ccedilla 600 -1 Zdotaccent 600 '
+                              '-1 Thorn 600 -1 Omacron 600 -1 Racute 600 -1 '
+                              'Sacute 600 -1 dcaron 600 -1 Umacron 600 -1 '
+                              'uring 600 -1 threesuperior 600 -1 Ograve 600 '
+                              '-1 Agrave 600 -1 Abreve 600 -1 multiply 600 -1 '
+                              'uacute 600 -1 Tcaron 600 -1 partialdiff 600 -1 '
+                              'ydieresis 600 -1 Nacute 600 -1 icircumflex 600 '
+                              '-1 Ecircumflex 600 -1 adieresis 600 -1 '
+                              'edieresis 600 -1 cacute 600 -1 nacute 600 -1 '
+                              'umacron 600 -1 Ncaron 600 -1 Iacute 600 -1 '
+                              'plusminus 600 -1 brokenbar 600 -1 registered '
+                              '600 -1 Gbreve 600 -1 Idotaccent 600 -1 '
+                              'summation 600 -1 Egrave 600 -1 racute 600 -1 '
+                              'omacron 600 -1 Zacute 600 -1 Zcaron 600 -1 '
+                              'greaterequal 600 -1 Eth 600 -1 Ccedilla 600 -1 '
+                              'lcommaaccent 600 -1 tcaron 600 -1 eogonek 600 '
+                              '-1 Uogonek 600 -1 Aacute 600 -1 Adieresis 600 '
+                              '-1 egrave 600 -1 zacute 600 -1 iogonek 600 -1 '
+                              'Oacute 600 -1 oacute 600 -1 amacron 600 -1 '
+                              'sacute 600 -1 idieresis 600 -1 Ocircumflex 600 '
+                              '-1 Ugrave 600 -1 Delta 600 -1 thorn 600 -1 '
+                              'twosuperior 600 -1 Odieresis 600 -1 mu 600 -1 '
+                              'igrave 600 -1 ohungarumlaut 600 -1 Eogonek 600 '
+                              '-1 dcroat 600 -1 threequarters 600 -1 Scedilla '
+                              '600 -1 lcaron 600 -1 Kcommaaccent 600 -1 '
+                              'Lacute 600 -1 trademark 600 -1 edotaccent 600 '
+                              '-1 Igrave 600 -1 Imacron 600 -1 Lcaron 600 -1 '
+                              'onehalf 600 -1 lessequal 600 -1 ocircumflex '
+                              '600 -1 ntilde 600 -1 Uhungarumlaut 600 -1 '
+                              'Eacute 600 -1 emacron 600 -1 gbreve 600 -1 '
+                              'onequarter 600 -1 Scaron 600 -1 Scommaaccent '
+                              '600 -1 Ohungarumlaut 600 -1 degree 600 -1 '
+                              'ograve 600 -1 Ccaron 600 -1 ugrave 600 -1 '
+                              'radical 600 -1 Dcaron 600 -1 rcommaaccent 600 '
+                              '-1 Ntilde 600 -1 otilde 600 -1 Rcommaaccent '
+                              '600 -1 Lcommaaccent 600 -1 Atilde 600 -1 '
+                              'Aogonek 600 -1 Aring 600 -1 Otilde 600 -1 '
+                              'zdotaccent 600 -1 Ecaron 600 -1 Iogonek 600 -1 '
+                              'kcommaaccent 600 -1 minus 600 -1 Icircumflex '
+                              '600 -1 ncaron 600 -1 tcommaaccent 600 -1 '
+                              'logicalnot 600 -1 odieresis 600 -1 udieresis '
+                              '600 -1 notequal 600 -1 gcommaaccent 600 -1 eth '
+                              '600 -1 zcaron 600 -1 ncommaaccent 600 -1 '
+                              'onesuperior 600 -1 imacron 600 -1 Euro 600',
+                     'Descender': -157,
+                     'FamilyName': 'Courier',
+                     'FontBBox': (-27, -250, 849, 805),
+                     'FontName': 'Courier-Oblique',
+                     'IsFixedPitch': True,
+                     'ItalicAngle': -12,
+                     'StdHW': 51,
+                     'StdVW': 51,
+                     'Weight': 'Medium',
+                     'XHeight': 426},
+ 'Helvetica': {'Ascender': 718,
+               'CapHeight': 718,
+               'CharacterSet': 'ExtendedRoman',
+               'Chars': '32 space 278 33 exclam 278 34 quotedbl 355 35 '
+                        'numbersign 556 36 dollar 556 37 percent 889 38 '
+                        'ampersand 667 39 quoteright 222 40 parenleft 333 41 '
+                        'parenright 333 42 asterisk 389 43 plus 584 44 comma '
+                        '278 45 hyphen 333 46 period 278 47 slash 278 48 zero '
+                        '556 49 one 556 50 two 556 51 three 556 52 four 556 '
+                        '53 five 556 54 six 556 55 seven 556 56 eight 556 57 '
+                        'nine 556 58 colon 278 59 semicolon 278 60 less 584 '
+                        '61 equal 584 62 greater 584 63 question 556 64 at '
+                        '1015 65 A 667 66 B 667 67 C 722 68 D 722 69 E 667 70 '
+                        'F 611 71 G 778 72 H 722 73 I 278 74 J 500 75 K 667 '
+                        '76 L 556 77 M 833 78 N 722 79 O 778 80 P 667 81 Q '
+                        '778 82 R 722 83 S 667 84 T 611 85 U 722 86 V 667 87 '
+                        'W 944 88 X 667 89 Y 667 90 Z 611 91 bracketleft 278 '
+                        '92 backslash 278 93 bracketright 278 94 asciicircum '
+                        '469 95 underscore 556 96 quoteleft 222 97 a 556 98 b '
+                        '556 99 c 500 100 d 556 101 e 556 102 f 278 103 g 556 '
+                        '104 h 556 105 i 222 106 j 222 107 k 500 108 l 222 '
+                        '109 m 833 110 n 556 111 o 556 112 p 556 113 q 556 '
+                        '114 r 333 115 s 500 116 t 278 117 u 556 118 v 500 '
+                        '119 w 722 120 x 500 121 y 500 122 z 500 123 '
+                        'braceleft 334 124 bar 260 125 braceright 334 126 '
+                        'asciitilde 584 161 exclamdown 333 162 cent 556 163 '
+                        'sterling 556 164 fraction 167 165 yen 556 166 florin '
+                        '556 167 section 556 168 currency 556 169 quotesingle '
+                        '191 170 quotedblleft 333 171 guillemotleft 556 172 '
+                        'guilsinglleft 333 173 guilsinglright 333 174 fi 500 '
+                        '175 fl 500 177 endash 556 178 dagger 556 179 '
+                        'daggerdbl 556 180 periodcentered 278 182 paragraph '
+                        '537 183 bullet 350 184 quotesinglbase 222 185 '
+                        'quotedblbase 333 186 quotedblright 333 187 '
+                        'guillemotright 556 188 ellipsis 1000 189 perthousand '
+                        '1000 191 questiondown 611 193 grave 333 194 acute '
+                        '333 195 circumflex 333 196 tilde 333 197 macron 333 '
+                        '198 breve 333 199 dotaccent 333 200 dieresis 333 202 '
+                        'ring 333 203 cedilla 333 205 hungarumlaut 333 206 '
+                        'ogonek 333 207 caron 333 208 emdash 1000 225 AE 1000 '
+                        '227 ordfeminine 370 232 Lslash 556 233 Oslash 778 '
+                        '234 OE 1000 235 ordmasculine 365 241 ae 889 245 '
+                        'dotlessi 278 248 lslash 222 249 oslash 611 250 oe '
+                        '944 251 germandbls 611 -1 Idieresis 278 -1 eacute '
+                        '556 -1 abreve 556 -1 uhungarumlaut 556 -1 ecaron 556 '
+                        '-1 Ydieresis 667 -1 divide 584 -1 Yacute 667 -1 '
+                        'Acircumflex 667 -1 aacute 556 -1 Ucircumflex 722 -1 '
+                        'yacute 500 -1 scommaaccent 500 -1 ecircumflex 556 -1 '
+                        'Uring 722 -1 Udieresis 722 -1 aogonek 556 -1 Uacute '
+                        '722 -1 uogonek 556 -1 Edieresis 667 -1 Dcroat 722 -1 '
+                        'commaaccent 250 -1 copyright 737 -1 Emacron 667 -1 '
+                        'ccaron 500 -1 aring 556 -1 Ncommaaccent 722 -1 '
+                        'lacute 222 -1 agrave 556 -1 Tcommaaccent 611 -1 '
+                        'Cacute 722 -1 atilde 556 -1 Edotaccent 667 -1 scaron '
+                        '500 -1 scedilla 500 -1 iacute 278 -1 lozenge 471 -1 '
+                        'Rcaron 722 -1 Gcommaaccent 778 -1 ucircumflex 556 -1 '
+                        'acircumflex 556 -1 Amacron 667 -1 rcaron 333 -1 '
+                        'ccedilla 500 -1 Zdotaccent 611 -1 Thorn 667 -1 '
+                        'Omacron 778 -1 Racute 722 -1 Sacute 667 -1 dcaron '
+                        '643 -1 Umacron 722 -1 uring 556 -1 threesuperior 333 '
+                        '-1 Ograve 778 -1 Agrave 667 -1 Abreve 667 -1 '
+                        'multiply 584 -1 uacute 556 -1 Tcaron 611 -1 '
+                        'partialdiff 476 -1 ydieresis 500 -1 Nacute 722 -1 '
+                        'icircumflex 278 -1 Ecircumflex 667 -1 adieresis 556 '
+                        '-1 edieresis 556 -1 cacute 500 -1 nacute 556 -1 '
+                        'umacron 556 -1 Ncaron 722 -1 Iacute 278 -1 plusminus '
+                        '584 -1 brokenbar 260 -1 registered 737 -1 Gbreve 778 '
+                        '-1 Idotaccent 278 -1 summation 600 -1 Egrave 667 -1 '
+                        'racute 333 -1 omacron 556 -1 Zacute 611 -1 Zcaron '
+                        '611 -1 greaterequal 549 -1 Eth 722 -1 Ccedilla 722 '
+                        '-1 lcommaaccent 222 -1 tcaron 317 -1 eogonek 556 -1 '
+                        'Uogonek 722 -1 Aacute 667 -1 Adieresis 667 -1 egrave '
+                        '556 -1 zacute 500 -1 iogonek 222 -1 Oacute 778 -1 '
+                        'oacute 556 -1 amacron 556 -1 sacute 500 -1 idieresis '
+                        '278 -1 Ocircumflex 778 -1 Ugrave 722 -1 Delta 612 -1 '
+                        'thorn 556 -1 twosuperior 333 -1 Odieresis 778 -1 mu '
+                        '556 -1 igrave 278 -1 ohungarumlaut 556 -1 Eogonek '
+                        '667 -1 dcroat 556 -1 threequarters 834 -1 Scedilla '
+                        '667 -1 lcaron 299 -1 Kcommaaccent 667 -1 Lacute 556 '
+                        '-1 trademark 1000 -1 edotaccent 556 -1 Igrave 278 -1 '
+                        'Imacron 278 -1 Lcaron 556 -1 onehalf 834 -1 '
+                        'lessequal 549 -1 ocircumflex 556 -1 ntilde 556 -1 '
+                        'Uhungarumlaut 722 -1 Eacute 667 -1 emacron 556 -1 '
+                        'gbreve 556 -1 onequarter 834 -1 Scaron 667 -1 '
+                        'Scommaaccent 667 -1 Ohungarumlaut 778 -1 degree 400 '
+                        '-1 ograve 556 -1 Ccaron 722 -1 ugrave 556 -1 radical '
+                        '453 -1 Dcaron 722 -1 rcommaaccent 333 -1 Ntilde 722 '
+                        '-1 otilde 556 -1 Rcommaaccent 722 -1 Lcommaaccent '
+                        '556 -1 Atilde 667 -1 Aogonek 667 -1 Aring 667 -1 '
+                        'Otilde 778 -1 zdotaccent 500 -1 Ecaron 667 -1 '
+                        'Iogonek 278 -1 kcommaaccent 500 -1 minus 584 -1 '
+                        'Icircumflex 278 -1 ncaron 556 -1 tcommaaccent 278 -1 '
+                        'logicalnot 584 -1 odieresis 556 -1 udieresis 556 -1 '
+                        'notequal 549 -1 gcommaaccent 556 -1 eth 556 -1 '
+                        'zcaron 500 -1 ncommaaccent 556 -1 onesuperior 333 -1 '
+                        'imacron 278 -1 Euro 556',
+               'Descender': -207,
+               'FamilyName': 'Helvetica',
+               'FontBBox': (-166, -225, 1000, 931),
+               'FontName': 'Helvetica',
+               'IsFixedPitch': False,
+               'ItalicAngle': 0,
+               'StdHW': 76,
+               'StdVW': 88,
+               'Weight': 'Medium',
+               'XHeight': 523},
+ 'Helvetica-Bold': {'Ascender': 718,
+                    'CapHeight': 718,
+                    'CharacterSet': 'ExtendedRoman',
+                    'Chars': '32 space 278 33 exclam 333 34 quotedbl 474 35 '
+                             'numbersign 556 36 dollar 556 37 percent 889 38 '
+                             'ampersand 722 39 quoteright 278 40 parenleft '
+                             '333 41 parenright 333 42 asterisk 389 43 plus '
+                             '584 44 comma 278 45 hyphen 333 46 period 278 47 '
+                             'slash 278 48 zero 556 49 one 556 50 two 556 51 '
+                             'three 556 52 four 556 53 five 556 54 six 556 55 '
+                             'seven 556 56 eight 556 57 nine 556 58 colon 333 '
+                             '59 semicolon 333 60 less 584 61 equal 584 62 '
+                             'greater 584 63 question 611 64 at 975 65 A 722 '
+                             '66 B 722 67 C 722 68 D 722 69 E 667 70 F 611 71 '
+                             'G 778 72 H 722 73 I 278 74 J 556 75 K 722 76 L '
+                             '611 77 M 833 78 N 722 79 O 778 80 P 667 81 Q '
+                             '778 82 R 722 83 S 667 84 T 611 85 U 722 86 V '
+                             '667 87 W 944 88 X 667 89 Y 667 90 Z 611 91 '
+                             'bracketleft 333 92 backslash 278 93 '
+                             'bracketright 333 94 asciicircum 584 95 '
+                             'underscore 556 96 quoteleft 278 97 a 556 98 b '
+                             '611 99 c 556 100 d 611 101 e 556 102 f 333 103 '
+                             'g 611 104 h 611 105 i 278 106 j 278 107 k 556 '
+                             '108 l 278 109 m 889 110 n 611 111 o 611 112 p '
+                             '611 113 q 611 114 r 389 115 s 556 116 t 333 117 '
+                             'u 611 118 v 556 119 w 778 120 x 556 121 y 556 '
+                             '122 z 500 123 braceleft 389 124 bar 280 125 '
+                             'braceright 389 126 asciitilde 584 161 '
+                             'exclamdown 333 162 cent 556 163 sterling 556 '
+                             '164 fraction 167 165 yen 556 166 florin 556 167 '
+                             'section 556 168 currency 556 169 quotesingle '
+                             '238 170 quotedblleft 500 171 guillemotleft 556 '
+                             '172 guilsinglleft 333 173 guilsinglright 333 '
+                             '174 fi 611 175 fl 611 177 endash 556 178 dagger '
+                             '556 179 daggerdbl 556 180 periodcentered 278 '
+                             '182 paragraph 556 183 bullet 350 184 '
+                             'quotesinglbase 278 185 quotedblbase 500 186 '
+                             'quotedblright 500 187 guillemotright 556 188 '
+                             'ellipsis 1000 189 perthousand 1000 191 '
+                             'questiondown 611 193 grave 333 194 acute 333 '
+                             '195 circumflex 333 196 tilde 333 197 macron 333 '
+                             '198 breve 333 199 dotaccent 333 200 dieresis '
+                             '333 202 ring 333 203 cedilla 333 205 '
+                             'hungarumlaut 333 206 ogonek 333 207 caron 333 '
+                             '208 emdash 1000 225 AE 1000 227 ordfeminine 370 '
+                             '232 Lslash 611 233 Oslash 778 234 OE 1000 235 '
+                             'ordmasculine 365 241 ae 889 245 dotlessi 278 '
+                             '248 lslash 278 249 oslash 611 250 oe 944 251 '
+                             'germandbls 611 -1 Idieresis 278 -1 eacute 556 '
+                             '-1 abreve 556 -1 uhungarumlaut 611 -1 ecaron '
+                             '556 -1 Ydieresis 667 -1 divide 584 -1 Yacute '
+                             '667 -1 Acircumflex 722 -1 aacute 556 -1 '
+                             'Ucircumflex 722 -1 yacute 556 -1 scommaaccent '
+                             '556 -1 ecircumflex 556 -1 Uring 722 -1 '
+                             'Udieresis 722 -1 aogonek 556 -1 Uacute 722 -1 '
+                             'uogonek 611 -1 Edieresis 667 -1 Dcroat 722 -1 '
+                             'commaaccent 250 -1 copyright 737 -1 Emacron 667 '
+                             '-1 ccaron 556 -1 aring 556 -1 Ncommaaccent 722 '
+                             '-1 lacute 278 -1 agrave 556 -1 Tcommaaccent 611 '
+                             '-1 Cacute 722 -1 atilde 556 -1 Edotaccent 667 '
+                             '-1 scaron 556 -1 scedilla 556 -1 iacute 278 -1 '
+                             'lozenge 494 -1 Rcaron 722 -1 Gcommaaccent 778 '
+                             '-1 ucircumflex 611 -1 acircumflex 556 -1 '
+                             'Amacron 722 -1 rcaron 389 -1 ccedilla 556 -1 '
+                             'Zdotaccent 611 -1 Thorn 667 -1 Omacron 778 -1 '
+                             'Racute 722 -1 Sacute 667 -1 dcaron 743 -1 '
+                             'Umacron 722 -1 uring 611 -1 threesuperior 333 '
+                             '-1 Ograve 778 -1 Agrave 722 -1 Abreve 722 -1 '
+                             'multiply 584 -1 uacute 611 -1 Tcaron 611 -1 '
+                             'partialdiff 494 -1 ydieresis 556 -1 Nacute 722 '
+                             '-1 icircumflex 278 -1 Ecircumflex 667 -1 '
+                             'adieresis 556 -1 edieresis 556 -1 cacute 556 -1 '
+                             'nacute 611 -1 umacron 611 -1 Ncaron 722 -1 '
+                             'Iacute 278 -1 plusminus 584 -1 brokenbar 280 -1 '
+                             'registered 737 -1 Gbreve 778 -1 Idotaccent 278 '
+                             '-1 summation 600 -1 Egrave 667 -1 racute 389 -1 '
+                             'omacron 611 -1 Zacute 611 -1 Zcaron 611 -1 '
+                             'greaterequal 549 -1 Eth 722 -1 Ccedilla 722 -1 '
+                             'lcommaaccent 278 -1 tcaron 389 -1 eogonek 556 '
+                             '-1 Uogonek 722 -1 Aacute 722 -1 Adieresis 722 '
+                             '-1 egrave 556 -1 zacute 500 -1 iogonek 278 -1 '
+                             'Oacute 778 -1 oacute 611 -1 amacron 556 -1 '
+                             'sacute 556 -1 idieresis 278 -1 Ocircumflex 778 '
+                             '-1 Ugrave 722 -1 Delta 612 -1 thorn 611 -1 '
+                             'twosuperior 333 -1 Odieresis 778 -1 mu 611 -1 '
+                             'igrave 278 -1 ohungarumlaut 611 -1 Eogonek 667 '
+                             '-1 dcroat 611 -1 threequarters 834 -1 Scedilla '
+                             '667 -1 lcaron 400 -1 Kcommaaccent 722 -1 Lacute '
+                             '611 -1 trademark 1000 -1 edotaccent 556 -1 '
+                             'Igrave 278 -1 Imacron 278 -1 Lcaron 611 -1 '
+                             'onehalf 834 -1 lessequal 549 -1 ocircumflex 611 '
+                             '-1 ntilde 611 -1 Uhungarumlaut 722 -1 Eacute '
+                             '667 -1 emacron 556 -1 gbreve 611 -1 onequarter '
+                             '834 -1 Scaron 667 -1 Scommaaccent 667 -1 '
+                             'Ohungarumlaut 778 -1 degree 400 -1 ograve 611 '
+                             '-1 Ccaron 722 -1 ugrave 611 -1 radical 549 -1 '
+                             'Dcaron 722 -1 rcommaaccent 389 -1 Ntilde 722 -1 '
+                             'otilde 611 -1 Rcommaaccent 722 -1 Lcommaaccent '
+                             '611 -1 Atilde 722 -1 Aogonek 722 -1 Aring 722 '
+                             '-1 Otilde 778 -1 zdotaccent 500 -1 Ecaron 667 '
+                             '-1 Iogonek 278 -1 kcommaaccent 556 -1 minus 584 '
+                             '-1 Icircumflex 278 -1 ncaron 611 -1 '
+                             'tcommaaccent 333 -1 logicalnot 584 -1 odieresis '
+                             '611 -1 udieresis 611 -1 notequal 549 -1 '
+                             'gcommaaccent 611 -1 eth 611 -1 zcaron 500 -1 '
+                             'ncommaaccent 611 -1 onesuperior 333 -1 imacron '
+                             '278 -1 Euro 556',
+                    'Descender': -207,
+                    'FamilyName': 'Helvetica',
+                    'FontBBox': (-170, -228, 1003, 962),
+                    'FontName': 'Helvetica-Bold',
+                    'IsFixedPitch': False,
+                    'ItalicAngle': 0,
+                    'StdHW': 118,
+                    'StdVW': 140,
+                    'Weight': 'Bold',
+                    'XHeight': 532},
+ 'Helvetica-BoldOblique': {'Ascender': 718,
+                           'CapHeight': 718,
+                           'CharacterSet': 'ExtendedRoman',
+                           'Chars': '32 space 278 33 exclam 333 34 quotedbl '
+                                    '474 35 numbersign 556 36 dollar 556 37 '
+                                    'percent 889 38 ampersand 722 39 '
+                                    'quoteright 278 40 parenleft 333 41 '
+                                    'parenright 333 42 asterisk 389 43 plus '
+                                    '584 44 comma 278 45 hyphen 333 46 period '
+                                    '278 47 slash 278 48 zero 556 49 one 556 '
+                                    '50 two 556 51 three 556 52 four 556 53 '
+                                    'five 556 54 six 556 55 seven 556 56 '
+                                    'eight 556 57 nine 556 58 colon 333 59 '
+                                    'semicolon 333 60 less 584 61 equal 584 '
+                                    '62 greater 584 63 question 611 64 at 975 '
+                                    '65 A 722 66 B 722 67 C 722 68 D 722 69 E '
+                                    '667 70 F 611 71 G 778 72 H 722 73 I 278 '
+                                    '74 J 556 75 K 722 76 L 611 77 M 833 78 N '
+                                    '722 79 O 778 80 P 667 81 Q 778 82 R 722 '
+                                    '83 S 667 84 T 611 85 U 722 86 V 667 87 W '
+                                    '944 88 X 667 89 Y 667 90 Z 611 91 '
+                                    'bracketleft 333 92 backslash 278 93 '
+                                    'bracketright 333 94 asciicircum 584 95 '
+                                    'underscore 556 96 quoteleft 278 97 a 556 '
+                                    '98 b 611 99 c 556 100 d 611 101 e 556 '
+                                    '102 f 333 103 g 611 104 h 611 105 i 278 '
+                                    '106 j 278 107 k 556 108 l 278 109 m 889 '
+                                    '110 n 611 111 o 611 112 p 611 113 q 611 '
+                                    '114 r 389 115 s 556 116 t 333 117 u 611 '
+                                    '118 v 556 119 w 778 120 x 556 121 y 556 '
+                                    '122 z 500 123 braceleft 389 124 bar 280 '
+                                    '125 braceright 389 126 asciitilde 584 '
+                                    '161 exclamdown 333 162 cent 556 163 '
+                                    'sterling 556 164 fraction 167 165 yen '
+                                    '556 166 florin 556 167 section 556 168 '
+                                    'currency 556 169 quotesingle 238 170 '
+                                    'quotedblleft 500 171 guillemotleft 556 '
+                                    '172 guilsinglleft 333 173 guilsinglright '
+                                    '333 174 fi 611 175 fl 611 177 endash 556 '
+                                    '178 dagger 556 179 daggerdbl 556 180 '
+                                    'periodcentered 278 182 paragraph 556 183 '
+                                    'bullet 350 184 quotesinglbase 278 185 '
+                                    'quotedblbase 500 186 quotedblright 500 '
+                                    '187 guillemotright 556 188 ellipsis 1000 '
+                                    '189 perthousand 1000 191 questiondown '
+                                    '611 193 grave 333 194 acute 333 195 '
+                                    'circumflex 333 196 tilde 333 197 macron '
+                                    '333 198 breve 333 199 dotaccent 333 200 '
+                                    'dieresis 333 202 ring 333 203 cedilla '
+                                    '333 205 hungarumlaut 333 206 ogonek 333 '
+                                    '207 caron 333 208 emdash 1000 225 AE '
+                                    '1000 227 ordfeminine 370 232 Lslash 611 '
+                                    '233 Oslash 778 234 OE 1000 235 '
+                                    'ordmasculine 365 241 ae 889 245 dotlessi '
+                                    '278 248 lslash 278 249 oslash 611 250 oe '
+                                    '944 251 germandbls 611 -1 Idieresis 278 '
+                                    '-1 eacute 556 -1 abreve 556 -1 '
+                                    'uhungarumlaut 611 -1 ecaron 556 -1 '
+                                    'Ydieresis 667 -1 divide 584 -1 Yacute '
+                                    '667 -1 Acircumflex 722 -1 aacute 556 -1 '
+                                    'Ucircumflex 722 -1 yacute 556 -1 '
+                                    'scommaaccent 556 -1 ecircumflex 556 -1 '
+                                    'Uring 722 -1 Udieresis 722 -1 aogonek '
+                                    '556 -1 Uacute 722 -1 uogonek 611 -1 '
+                                    'Edieresis 667 -1 Dcroat 722 -1 '
+                                    'commaaccent 250 -1 copyright 737 -1 '
+                                    'Emacron 667 -1 ccaron 556 -1 aring 556 '
+                                    '-1 Ncommaaccent 722 -1 lacute 278 -1 '
+                                    'agrave 556 -1 Tcommaaccent 611 -1 Cacute '
+                                    '722 -1 atilde 556 -1 Edotaccent 667 -1 '
+                                    'scaron 556 -1 scedilla 556 -1 iacute 278 '
+                                    '-1 lozenge 494 -1 Rcaron 722 -1 '
+                                    'Gcommaaccent 778 -1 ucircumflex 611 -1 '
+                                    'acircumflex 556 -1 Amacron 722 -1 rcaron '
+                                    '389 -1 ccedilla 556 -1 Zdotaccent 611 -1 '
+                                    'Thorn 667 -1 Omacron 778 -1 Racute 722 '
+                                    '-1 Sacute 667 -1 dcaron 743 -1 Umacron '
+                                    '722 -1 uring 611 -1 threesuperior 333 -1 '
+                                    'Ograve 778 -1 Agrave 722 -1 Abreve 722 '
+                                    '-1 multiply 584 -1 uacute 611 -1 Tcaron '
+                                    '611 -1 partialdiff 494 -1 ydieresis 556 '
+                                    '-1 Nacute 722 -1 icircumflex 278 -1 '
+                                    'Ecircumflex 667 -1 adieresis 556 -1 '
+                                    'edieresis 556 -1 cacute 556 -1 nacute '
+                                    '611 -1 umacron 611 -1 Ncaron 722 -1 '
+                                    'Iacute 278 -1 plusminus 584 -1 brokenbar '
+                                    '280 -1 registered 737 -1 Gbreve 778 -1 '
+                                    'Idotaccent 278 -1 summation 600 -1 '
+                                    'Egrave 667 -1 racute 389 -1 omacron 611 '
+                                    '-1 Zacute 611 -1 Zcaron 611 -1 '
+                                    'greaterequal 549 -1 Eth 722 -1 Ccedilla '
+                                    '722 -1 lcommaaccent 278 -1 tcaron 389 -1 '
+                                    'eogonek 556 -1 Uogonek 722 -1 Aacute 722 '
+                                    '-1 Adieresis 722 -1 egrave 556 -1 zacute '
+                                    '500 -1 iogonek 278 -1 Oacute 778 -1 '
+                                    'oacute 611 -1 amacron 556 -1 sacute 556 '
+                                    '-1 idieresis 278 -1 Ocircumflex 778 -1 '
+                                    'Ugrave 722 -1 Delta 612 -1 thorn 611 -1 '
+                                    'twosuperior 333 -1 Odieresis 778 -1 mu '
+                                    '611 -1 igrave 278 -1 ohungarumlaut 611 '
+                                    '-1 Eogonek 667 -1 dcroat 611 -1 '
+                                    'threequarters 834 -1 Scedilla 667 -1 '
+                                    'lcaron 400 -1 Kcommaaccent 722 -1 Lacute '
+                                    '611 -1 trademark 1000 -1 edotaccent 556 '
+                                    '-1 Igrave 278 -1 Imacron 278 -1 Lcaron '
+                                    '611 -1 onehalf 834 -1 lessequal 549 -1 '
+                                    'ocircumflex 611 -1 ntilde 611 -1 '
+                                    'Uhungarumlaut 722 -1 Eacute 667 -1 '
+                                    'emacron 556 -1 gbreve 611 -1 onequarter '
+                                    '834 -1 Scaron 667 -1 Scommaaccent 667 -1 '
+                                    'Ohungarumlaut 778 -1 degree 400 -1 '
+                                    'ograve 611 -1 Ccaron 722 -1 ugrave 611 '
+                                    '-1 radical 549 -1 Dcaron 722 -1 '
+                                    'rcommaaccent 389 -1 Ntilde 722 -1 otilde '
+                                    '611 -1 Rcommaaccent 722 -1 Lcommaaccent '
+                                    '611 -1 Atilde 722 -1 Aogonek 722 -1 '
+                                    'Aring 722 -1 Otilde 778 -1 zdotaccent '
+                                    '500 -1 Ecaron 667 -1 Iogonek 278 -1 '
+                                    'kcommaaccent 556 -1 minus 584 -1 '
+                                    'Icircumflex 278 -1 ncaron 611 -1 '
+                                    'tcommaaccent 333 -1 logicalnot 584 -1 '
+                                    'odieresis 611 -1 udieresis 611 -1 '
+                                    'notequal 549 -1 gcommaaccent 611 -1 eth '
+                                    '611 -1 zcaron 500 -1 ncommaaccent 611 -1 '
+                                    'onesuperior 333 -1 imacron 278 -1 Euro '
+                                    '556',
+                           'Descender': -207,
+                           'FamilyName': 'Helvetica',
+                           'FontBBox': (-174, -228, 1114, 962),
+                           'FontName': 'Helvetica-BoldOblique',
+                           'IsFixedPitch': False,
+                           'ItalicAngle': -12,
+                           'StdHW': 118,
+                           'StdVW': 140,
+                           'Weight': 'Bold',
+                           'XHeight': 532},
+ 'Helvetica-Oblique': {'Ascender': 718,
+                       'CapHeight': 718,
+                       'CharacterSet': 'ExtendedRoman',
+                       'Chars': '32 space 278 33 exclam 278 34 quotedbl 355 '
+                                '35 numbersign 556 36 dollar 556 37 percent '
+                                '889 38 ampersand 667 39 quoteright 222 40 '
+                                'parenleft 333 41 parenright 333 42 asterisk '
+                                '389 43 plus 584 44 comma 278 45 hyphen 333 '
+                                '46 period 278 47 slash 278 48 zero 556 49 '
+                                'one 556 50 two 556 51 three 556 52 four 556 '
+                                '53 five 556 54 six 556 55 seven 556 56 eight '
+                                '556 57 nine 556 58 colon 278 59 semicolon '
+                                '278 60 less 584 61 equal 584 62 greater 584 '
+                                '63 question 556 64 at 1015 65 A 667 66 B 667 '
+                                '67 C 722 68 D 722 69 E 667 70 F 611 71 G 778 '
+                                '72 H 722 73 I 278 74 J 500 75 K 667 76 L 556 '
+                                '77 M 833 78 N 722 79 O 778 80 P 667 81 Q 778 '
+                                '82 R 722 83 S 667 84 T 611 85 U 722 86 V 667 '
+                                '87 W 944 88 X 667 89 Y 667 90 Z 611 91 '
+                                'bracketleft 278 92 backslash 278 93 '
+                                'bracketright 278 94 asciicircum 469 95 '
+                                'underscore 556 96 quoteleft 222 97 a 556 98 '
+                                'b 556 99 c 500 100 d 556 101 e 556 102 f 278 '
+                                '103 g 556 104 h 556 105 i 222 106 j 222 107 '
+                                'k 500 108 l 222 109 m 833 110 n 556 111 o '
+                                '556 112 p 556 113 q 556 114 r 333 115 s 500 '
+                                '116 t 278 117 u 556 118 v 500 119 w 722 120 '
+                                'x 500 121 y 500 122 z 500 123 braceleft 334 '
+                                '124 bar 260 125 braceright 334 126 '
+                                'asciitilde 584 161 exclamdown 333 162 cent '
+                                '556 163 sterling 556 164 fraction 167 165 '
+                                'yen 556 166 florin 556 167 section 556 168 '
+                                'currency 556 169 quotesingle 191 170 '
+                                'quotedblleft 333 171 guillemotleft 556 172 '
+                                'guilsinglleft 333 173 guilsinglright 333 174 '
+                                'fi 500 175 fl 500 177 endash 556 178 dagger '
+                                '556 179 daggerdbl 556 180 periodcentered 278 '
+                                '182 paragraph 537 183 bullet 350 184 '
+                                'quotesinglbase 222 185 quotedblbase 333 186 '
+                                'quotedblright 333 187 guillemotright 556 188 '
+                                'ellipsis 1000 189 perthousand 1000 191 '
+                                'questiondown 611 193 grave 333 194 acute 333 '
+                                '195 circumflex 333 196 tilde 333 197 macron '
+                                '333 198 breve 333 199 dotaccent 333 200 '
+                                'dieresis 333 202 ring 333 203 cedilla 333 '
+                                '205 hungarumlaut 333 206 ogonek 333 207 '
+                                'caron 333 208 emdash 1000 225 AE 1000 227 '
+                                'ordfeminine 370 232 Lslash 556 233 Oslash '
+                                '778 234 OE 1000 235 ordmasculine 365 241 ae '
+                                '889 245 dotlessi 278 248 lslash 222 249 '
+                                'oslash 611 250 oe 944 251 germandbls 611 -1 '
+                                'Idieresis 278 -1 eacute 556 -1 abreve 556 -1 '
+                                'uhungarumlaut 556 -1 ecaron 556 -1 Ydieresis '
+                                '667 -1 divide 584 -1 Yacute 667 -1 '
+                                'Acircumflex 667 -1 aacute 556 -1 Ucircumflex '
+                                '722 -1 yacute 500 -1 scommaaccent 500 -1 '
+                                'ecircumflex 556 -1 Uring 722 -1 Udieresis '
+                                '722 -1 aogonek 556 -1 Uacute 722 -1 uogonek '
+                                '556 -1 Edieresis 667 -1 Dcroat 722 -1 '
+                                'commaaccent 250 -1 copyright 737 -1 Emacron '
+                                '667 -1 ccaron 500 -1 aring 556 -1 '
+                                'Ncommaaccent 722 -1 lacute 222 -1 agrave 556 '
+                                '-1 Tcommaaccent 611 -1 Cacute 722 -1 atilde '
+                                '556 -1 Edotaccent 667 -1 scaron 500 -1 '
+                                'scedilla 500 -1 iacute 278 -1 lozenge 471 -1 '
+                                'Rcaron 722 -1 Gcommaaccent 778 -1 '
+                                'ucircumflex 556 -1 acircumflex 556 -1 '
+                                'Amacron 667 -1 rcaron 333 -1 ccedilla 500 -1 '
+                                'Zdotaccent 611 -1 Thorn 667 -1 Omacron 778 '
+                                '-1 Racute 722 -1 Sacute 667 -1 dcaron 643 -1 '
+                                'Umacron 722 -1 uring 556 -1 threesuperior '
+                                '333 -1 Ograve 778 -1 Agrave 667 -1 Abreve '
+                                '667 -1 multiply 584 -1 uacute 556 -1 Tcaron '
+                                '611 -1 partialdiff 476 -1 ydieresis 500 -1 '
+                                'Nacute 722 -1 icircumflex 278 -1 Ecircumflex '
+                                '667 -1 adieresis 556 -1 edieresis 556 -1 '
+                                'cacute 500 -1 nacute 556 -1 umacron 556 -1 '
+                                'Ncaron 722 -1 Iacute 278 -1 plusminus 584 -1 '
+                                'brokenbar 260 -1 registered 737 -1 Gbreve '
+                                '778 -1 Idotaccent 278 -1 summation 600 -1 '
+                                'Egrave 667 -1 racute 333 -1 omacron 556 -1 '
+                                'Zacute 611 -1 Zcaron 611 -1 greaterequal 549 '
+                                '-1 Eth 722 -1 Ccedilla 722 -1 lcommaaccent '
+                                '222 -1 tcaron 317 -1 eogonek 556 -1 Uogonek '
+                                '722 -1 Aacute 667 -1 Adieresis 667 -1 egrave '
+                                '556 -1 zacute 500 -1 iogonek 222 -1 Oacute '
+                                '778 -1 oacute 556 -1 amacron 556 -1 sacute '
+                                '500 -1 idieresis 278 -1 Ocircumflex 778 -1 '
+                                'Ugrave 722 -1 Delta 612 -1 thorn 556 -1 '
+                                'twosuperior 333 -1 Odieresis 778 -1 mu 556 '
+                                '-1 igrave 278 -1 ohungarumlaut 556 -1 '
+                                'Eogonek 667 -1 dcroat 556 -1 threequarters '
+                                '834 -1 Scedilla 667 -1 lcaron 299 -1 '
+                                'Kcommaaccent 667 -1 Lacute 556 -1 trademark '
+                                '1000 -1 edotaccent 556 -1 Igrave 278 -1 '
+                                'Imacron 278 -1 Lcaron 556 -1 onehalf 834 -1 '
+                                'lessequal 549 -1 ocircumflex 556 -1 ntilde '
+                                '556 -1 Uhungarumlaut 722 -1 Eacute 667 -1 '
+                                'emacron 556 -1 gbreve 556 -1 onequarter 834 '
+                                '-1 Scaron 667 -1 Scommaaccent 667 -1 '
+                                'Ohungarumlaut 778 -1 degree 400 -1 ograve '
+                                '556 -1 Ccaron 722 -1 ugrave 556 -1 radical '
+                                '453 -1 Dcaron 722 -1 rcommaaccent 333 -1 '
+                                'Ntilde 722 -1 otilde 556 -1 Rcommaaccent 722 '
+                                '-1 Lcommaaccent 556 -1 Atilde 667 -1 Aogonek '
+                                '667 -1 Aring 667 -1 Otilde 778 -1 zdotaccent '
+                                '500 -1 Ecaron 667 -1 Iogonek 278 -1 '
+                                'kcommaaccent 500 -1 minus 584 -1 Icircumflex '
+                                '278 -1 ncaron 556 -1 tcommaaccent 278 -1 '
+                                'logicalnot 584 -1 odieresis 556 -1 udieresis '
+                                '556 -1 notequal 549 -1 gcommaaccent 556 -1 '
+                                'eth 556 -1 zcaron 500 -1 ncommaaccent 556 -1 '
+                                'onesuperior 333 -1 imacron 278 -1 Euro 556',
+                       'Descender': -207,
+                       'FamilyName': 'Helvetica',
+                       'FontBBox': (-170, -225, 1116, 931),
+                       'FontName': 'Helvetica-Oblique',
+                       'IsFixedPitch': False,
+                       'ItalicAngle': -12,
+                       'StdHW': 76,
+                       'StdVW': 88,
+                       'Weight': 'Medium',
+                       'XHeight': 523},
+ 'Symbol': {'Ascender': None,
+            'CapHeight': None,
+            'CharacterSet': 'Special',
+            'Chars': '32 space 250 33 exclam 333 34 universal 713 35 '
+                     'numbersign 500 36 existential 549 37 percent 833 38 '
+                     'ampersand 778 39 suchthat 439 40 parenleft 333 41 '
+                     'parenright 333 42 asteriskmath 500 43 plus 549 44 comma '
+                     '250 45 minus 549 46 period 250 47 slash 278 48 zero 500 '
+                     '49 one 500 50 two 500 51 three 500 52 four 500 53 five '
+                     '500 54 six 500 55 seven 500 56 eight 500 57 nine 500 58 '
+                     'colon 278 59 semicolon 278 60 less 549 61 equal 549 62 '
+                     'greater 549 63 question 444 64 congruent 549 65 Alpha '
+                     '722 66 Beta 667 67 Chi 722 68 Delta 612 69 Epsilon 611 '
+                     '70 Phi 763 71 Gamma 603 72 Eta 722 73 Iota 333 74 '
+                     'theta1 631 75 Kappa 722 76 Lambda 686 77 Mu 889 78 Nu '
+                     '722 79 Omicron 722 80 Pi 768 81 Theta 741 82 Rho 556 83 '
+                     'Sigma 592 84 Tau 611 85 Upsilon 690 86 sigma1 439 87 '
+                     'Omega 768 88 Xi 645 89 Psi 795 90 Zeta 611 91 '
+                     'bracketleft 333 92 therefore 863 93 bracketright 333 94 '
+                     'perpendicular 658 95 underscore 500 96 radicalex 500 97 '
+                     'alpha 631 98 beta 549 99 chi 549 100 delta 494 101 '
+                     'epsilon 439 102 phi 521 103 gamma 411 104 eta 603 105 '
+                     'iota 329 106 phi1 603 107 kappa 549 108 lambda 549 109 '
+                     'mu 576 110 nu 521 111 omicron 549 112 pi 549 113 theta '
+                     '521 114 rho 549 115 sigma 603 116 tau 439 117 upsilon '
+                     '576 118 omega1 713 119 omega 686 120 xi 493 121 psi 686 '
+                     '122 zeta 494 123 braceleft 480 124 bar 200 125 '
+                     'braceright 480 126 similar 549 160 Euro 750 161 '
+                     'Upsilon1 620 162 minute 247 163 lessequal 549 164 '
+                     'fraction 167 165 infinity 713 166 florin 500 167 club '
+                     '753 168 diamond 753 169 heart 753 170 spade 753 171 '
+                     'arrowboth 1042 172 arrowleft 987 173 arrowup 603 174 '
+                     'arrowright 987 175 arrowdown 603 176 degree 400 177 '
+                     'plusminus 549 178 second 411 179 greaterequal 549 180 '
+                     'multiply 549 181 proportional 713 182 partialdiff 494 '
+                     '183 bullet 460 184 divide 549 185 notequal 549 186 '
+                     'equivalence 549 187 approxequal 549 188 ellipsis 1000 '
+                     '189 arrowvertex 603 190 arrowhorizex 1000 191 '
+                     'carriagereturn 658 192 aleph 823 193 Ifraktur 686 194 '
+                     'Rfraktur 795 195 weierstrass 987 196 circlemultiply 768 '
+                     '197 circleplus 768 198 emptyset 823 199 intersection '
+                     '768 200 union 768 201 propersuperset 713 202 '
+                     'reflexsuperset 713 203 notsubset 713 204 propersubset '
+                     '713 205 reflexsubset 713 206 element 713 207 notelement '
+                     '713 208 angle 768 209 gradient 713 210 registerserif '
+                     '790 211 copyrightserif 790 212 trademarkserif 890 213 '
+                     'product 823 214 radical 549 215 dotmath 250 216 '
+                     'logicalnot 713 217 logicaland 603 218 logicalor 603 219 '
+                     'arrowdblboth 1042 220 arrowdblleft 987 221 arrowdblup '
+                     '603 222 arrowdblright 987 223 arrowdbldown 603 224 '
+                     'lozenge 494 225 angleleft 329 226 registersans 790 227 '
+                     'copyrightsans 790 228 trademarksans 786 229 summation '
+                     '713 230 parenlefttp 384 231 parenleftex 384 232 '
+                     'parenleftbt 384 233 bracketlefttp 384 234 bracketleftex '
+                     '384 235 bracketleftbt 384 236 bracelefttp 494 237 '
+                     'braceleftmid 494 238 braceleftbt 494 239 braceex 494 '
+                     '241 angleright 329 242 integral 274 243 integraltp 686 '
+                     '244 integralex 686 245 integralbt 686 246 parenrighttp '
+                     '384 247 parenrightex 384 248 parenrightbt 384 249 '
+                     'bracketrighttp 384 250 bracketrightex 384 251 '
+                     'bracketrightbt 384 252 bracerighttp 494 253 '
+                     'bracerightmid 494 254 bracerightbt 494 -1 apple 790',
+            'Descender': None,
+            'FamilyName': 'Symbol',
+            'FontBBox': (-180, -293, 1090, 1010),
+            'FontName': 'Symbol',
+            'IsFixedPitch': False,
+            'ItalicAngle': 0,
+            'StdHW': 92,
+            'StdVW': 85,
+            'Weight': 'Medium',
+            'XHeight': None},
+ 'Times-Bold': {'Ascender': 683,
+                'CapHeight': 676,
+                'CharacterSet': 'ExtendedRoman',
+                'Chars': '32 space 250 33 exclam 333 34 quotedbl 555 35 '
+                         'numbersign 500 36 dollar 500 37 percent 1000 38 '
+                         'ampersand 833 39 quoteright 333 40 parenleft 333 41 '
+                         'parenright 333 42 asterisk 500 43 plus 570 44 comma '
+                         '250 45 hyphen 333 46 period 250 47 slash 278 48 '
+                         'zero 500 49 one 500 50 two 500 51 three 500 52 four '
+                         '500 53 five 500 54 six 500 55 seven 500 56 eight '
+                         '500 57 nine 500 58 colon 333 59 semicolon 333 60 '
+                         'less 570 61 equal 570 62 greater 570 63 question '
+                         '500 64 at 930 65 A 722 66 B 667 67 C 722 68 D 722 '
+                         '69 E 667 70 F 611 71 G 778 72 H 778 73 I 389 74 J '
+                         '500 75 K 778 76 L 667 77 M 944 78 N 722 79 O 778 80 '
+                         'P 611 81 Q 778 82 R 722 83 S 556 84 T 667 85 U 722 '
+                         '86 V 722 87 W 1000 88 X 722 89 Y 722 90 Z 667 91 '
+                         'bracketleft 333 92 backslash 278 93 bracketright '
+                         '333 94 asciicircum 581 95 underscore 500 96 '
+                         'quoteleft 333 97 a 500 98 b 556 99 c 444 100 d 556 '
+                         '101 e 444 102 f 333 103 g 500 104 h 556 105 i 278 '
+                         '106 j 333 107 k 556 108 l 278 109 m 833 110 n 556 '
+                         '111 o 500 112 p 556 113 q 556 114 r 444 115 s 389 '
+                         '116 t 333 117 u 556 118 v 500 119 w 722 120 x 500 '
+                         '121 y 500 122 z 444 123 braceleft 394 124 bar 220 '
+                         '125 braceright 394 126 asciitilde 520 161 '
+                         'exclamdown 333 162 cent 500 163 sterling 500 164 '
+                         'fraction 167 165 yen 500 166 florin 500 167 section '
+                         '500 168 currency 500 169 quotesingle 278 170 '
+                         'quotedblleft 500 171 guillemotleft 500 172 '
+                         'guilsinglleft 333 173 guilsinglright 333 174 fi 556 '
+                         '175 fl 556 177 endash 500 178 dagger 500 179 '
+                         'daggerdbl 500 180 periodcentered 250 182 paragraph '
+                         '540 183 bullet 350 184 quotesinglbase 333 185 '
+                         'quotedblbase 500 186 quotedblright 500 187 '
+                         'guillemotright 500 188 ellipsis 1000 189 '
+                         'perthousand 1000 191 questiondown 500 193 grave 333 '
+                         '194 acute 333 195 circumflex 333 196 tilde 333 197 '
+                         'macron 333 198 breve 333 199 dotaccent 333 200 '
+                         'dieresis 333 202 ring 333 203 cedilla 333 205 '
+                         'hungarumlaut 333 206 ogonek 333 207 caron 333 208 '
+                         'emdash 1000 225 AE 1000 227 ordfeminine 300 232 '
+                         'Lslash 667 233 Oslash 778 234 OE 1000 235 '
+                         'ordmasculine 330 241 ae 722 245 dotlessi 278 248 '
+                         'lslash 278 249 oslash 500 250 oe 722 251 germandbls '
+                         '556 -1 Idieresis 389 -1 eacute 444 -1 abreve 500 -1 '
+                         'uhungarumlaut 556 -1 ecaron 444 -1 Ydieresis 722 -1 '
+                         'divide 570 -1 Yacute 722 -1 Acircumflex 722 -1 '
+                         'aacute 500 -1 Ucircumflex 722 -1 yacute 500 -1 '
+                         'scommaaccent 389 -1 ecircumflex 444 -1 Uring 722 -1 '
+                         'Udieresis 722 -1 aogonek 500 -1 Uacute 722 -1 '
+                         'uogonek 556 -1 Edieresis 667 -1 Dcroat 722 -1 '
+                         'commaaccent 250 -1 copyright 747 -1 Emacron 667 -1 '
+                         'ccaron 444 -1 aring 500 -1 Ncommaaccent 722 -1 '
+                         'lacute 278 -1 agrave 500 -1 Tcommaaccent 667 -1 '
+                         'Cacute 722 -1 atilde 500 -1 Edotaccent 667 -1 '
+                         'scaron 389 -1 scedilla 389 -1 iacute 278 -1 lozenge '
+                         '494 -1 Rcaron 722 -1 Gcommaaccent 778 -1 '
+                         'ucircumflex 556 -1 acircumflex 500 -1 Amacron 722 '
+                         '-1 rcaron 444 -1 ccedilla 444 -1 Zdotaccent 667 -1 '
+                         'Thorn 611 -1 Omacron 778 -1 Racute 722 -1 Sacute '
+                         '556 -1 dcaron 672 -1 Umacron 722 -1 uring 556 -1 '
+                         'threesuperior 300 -1 Ograve 778 -1 Agrave 722 -1 '
+                         'Abreve 722 -1 multiply 570 -1 uacute 556 -1 Tcaron '
+                         '667 -1 partialdiff 494 -1 ydieresis 500 -1 Nacute '
+                         '722 -1 icircumflex 278 -1 Ecircumflex 667 -1 '
+                         'adieresis 500 -1 edieresis 444 -1 cacute 444 -1 '
+                         'nacute 556 -1 umacron 556 -1 Ncaron 722 -1 Iacute '
+                         '389 -1 plusminus 570 -1 brokenbar 220 -1 registered '
+                         '747 -1 Gbreve 778 -1 Idotaccent 389 -1 summation '
+                         '600 -1 Egrave 667 -1 racute 444 -1 omacron 500 -1 '
+                         'Zacute 667 -1 Zcaron 667 -1 greaterequal 549 -1 Eth '
+                         '722 -1 Ccedilla 722 -1 lcommaaccent 278 -1 tcaron '
+                         '416 -1 eogonek 444 -1 Uogonek 722 -1 Aacute 722 -1 '
+                         'Adieresis 722 -1 egrave 444 -1 zacute 444 -1 '
+                         'iogonek 278 -1 Oacute 778 -1 oacute 500 -1 amacron '
+                         '500 -1 sacute 389 -1 idieresis 278 -1 Ocircumflex '
+                         '778 -1 Ugrave 722 -1 Delta 612 -1 thorn 556 -1 '
+                         'twosuperior 300 -1 Odieresis 778 -1 mu 556 -1 '
+                         'igrave 278 -1 ohungarumlaut 500 -1 Eogonek 667 -1 '
+                         'dcroat 556 -1 threequarters 750 -1 Scedilla 556 -1 '
+                         'lcaron 394 -1 Kcommaaccent 778 -1 Lacute 667 -1 '
+                         'trademark 1000 -1 edotaccent 444 -1 Igrave 389 -1 '
+                         'Imacron 389 -1 Lcaron 667 -1 onehalf 750 -1 '
+                         'lessequal 549 -1 ocircumflex 500 -1 ntilde 556 -1 '
+                         'Uhungarumlaut 722 -1 Eacute 667 -1 emacron 444 -1 '
+                         'gbreve 500 -1 onequarter 750 -1 Scaron 556 -1 '
+                         'Scommaaccent 556 -1 Ohungarumlaut 778 -1 degree 400 '
+                         '-1 ograve 500 -1 Ccaron 722 -1 ugrave 556 -1 '
+                         'radical 549 -1 Dcaron 722 -1 rcommaaccent 444 -1 '
+                         'Ntilde 722 -1 otilde 500 -1 Rcommaaccent 722 -1 '
+                         'Lcommaaccent 667 -1 Atilde 722 -1 Aogonek 722 -1 '
+                         'Aring 722 -1 Otilde 778 -1 zdotaccent 444 -1 Ecaron '
+                         '667 -1 Iogonek 389 -1 kcommaaccent 556 -1 minus 570 '
+                         '-1 Icircumflex 389 -1 ncaron 556 -1 tcommaaccent '
+                         '333 -1 logicalnot 570 -1 odieresis 500 -1 udieresis '
+                         '556 -1 notequal 549 -1 gcommaaccent 500 -1 eth 500 '
+                         '-1 zcaron 444 -1 ncommaaccent 556 -1 onesuperior '
+                         '300 -1 imacron 278 -1 Euro 500',
+                'Descender': -217,
+                'FamilyName': 'Times',
+                'FontBBox': (-168, -218, 1000, 935),
+                'FontName': 'Times-Bold',
+                'IsFixedPitch': False,
+                'ItalicAngle': 0,
+                'StdHW': 44,
+                'StdVW': 139,
+                'Weight': 'Bold',
+                'XHeight': 461},
+ 'Times-BoldItalic': {'Ascender': 683,
+                      'CapHeight': 669,
+                      'CharacterSet': 'ExtendedRoman',
+                      'Chars': '32 space 250 33 exclam 389 34 quotedbl 555 35 '
+                               'numbersign 500 36 dollar 500 37 percent 833 '
+                               '38 ampersand 778 39 quoteright 333 40 '
+                               'parenleft 333 41 parenright 333 42 asterisk '
+                               '500 43 plus 570 44 comma 250 45 hyphen 333 46 '
+                               'period 250 47 slash 278 48 zero 500 49 one '
+                               '500 50 two 500 51 three 500 52 four 500 53 '
+                               'five 500 54 six 500 55 seven 500 56 eight 500 '
+                               '57 nine 500 58 colon 333 59 semicolon 333 60 '
+                               'less 570 61 equal 570 62 greater 570 63 '
+                               'question 500 64 at 832 65 A 667 66 B 667 67 C '
+                               '667 68 D 722 69 E 667 70 F 667 71 G 722 72 H '
+                               '778 73 I 389 74 J 500 75 K 667 76 L 611 77 M '
+                               '889 78 N 722 79 O 722 80 P 611 81 Q 722 82 R '
+                               '667 83 S 556 84 T 611 85 U 722 86 V 667 87 W '
+                               '889 88 X 667 89 Y 611 90 Z 611 91 bracketleft '
+                               '333 92 backslash 278 93 bracketright 333 94 '
+                               'asciicircum 570 95 underscore 500 96 '
+                               'quoteleft 333 97 a 500 98 b 500 99 c 444 100 '
+                               'd 500 101 e 444 102 f 333 103 g 500 104 h 556 '
+                               '105 i 278 106 j 278 107 k 500 108 l 278 109 m '
+                               '778 110 n 556 111 o 500 112 p 500 113 q 500 '
+                               '114 r 389 115 s 389 116 t 278 117 u 556 118 v '
+                               '444 119 w 667 120 x 500 121 y 444 122 z 389 '
+                               '123 braceleft 348 124 bar 220 125 braceright '
+                               '348 126 asciitilde 570 161 exclamdown 389 162 '
+                               'cent 500 163 sterling 500 164 fraction 167 '
+                               '165 yen 500 166 florin 500 167 section 500 '
+                               '168 currency 500 169 quotesingle 278 170 '
+                               'quotedblleft 500 171 guillemotleft 500 172 '
+                               'guilsinglleft 333 173 guilsinglright 333 174 '
+                               'fi 556 175 fl 556 177 endash 500 178 dagger '
+                               '500 179 daggerdbl 500 180 periodcentered 250 '
+                               '182 paragraph 500 183 bullet 350 184 '
+                               'quotesinglbase 333 185 quotedblbase 500 186 '
+                               'quotedblright 500 187 guillemotright 500 188 '
+                               'ellipsis 1000 189 perthousand 1000 191 '
+                               'questiondown 500 193 grave 333 194 acute 333 '
+                               '195 circumflex 333 196 tilde 333 197 macron '
+                               '333 198 breve 333 199 dotaccent 333 200 '
+                               'dieresis 333 202 ring 333 203 cedilla 333 205 '
+                               'hungarumlaut 333 206 ogonek 333 207 caron 333 '
+                               '208 emdash 1000 225 AE 944 227 ordfeminine '
+                               '266 232 Lslash 611 233 Oslash 722 234 OE 944 '
+                               '235 ordmasculine 300 241 ae 722 245 dotlessi '
+                               '278 248 lslash 278 249 oslash 500 250 oe 722 '
+                               '251 germandbls 500 -1 Idieresis 389 -1 eacute '
+                               '444 -1 abreve 500 -1 uhungarumlaut 556 -1 '
+                               'ecaron 444 -1 Ydieresis 611 -1 divide 570 -1 '
+                               'Yacute 611 -1 Acircumflex 667 -1 aacute 500 '
+                               '-1 Ucircumflex 722 -1 yacute 444 -1 '
+                               'scommaaccent 389 -1 ecircumflex 444 -1 Uring '
+                               '722 -1 Udieresis 722 -1 aogonek 500 -1 Uacute '
+                               '722 -1 uogonek 556 -1 Edieresis 667 -1 Dcroat '
+                               '722 -1 commaaccent 250 -1 copyright 747 -1 '
+                               'Emacron 667 -1 ccaron 444 -1 aring 500 -1 '
+                               'Ncommaaccent 722 -1 lacute 278 -1 agrave 500 '
+                               '-1 Tcommaaccent 611 -1 Cacute 667 -1 atilde '
+                               '500 -1 Edotaccent 667 -1 scaron 389 -1 '
+                               'scedilla 389 -1 iacute 278 -1 lozenge 494 -1 '
+                               'Rcaron 667 -1 Gcommaaccent 722 -1 ucircumflex '
+                               '556 -1 acircumflex 500 -1 Amacron 667 -1 '
+                               'rcaron 389 -1 ccedilla 444 -1 Zdotaccent 611 '
+                               '-1 Thorn 611 -1 Omacron 722 -1 Racute 667 -1 '
+                               'Sacute 556 -1 dcaron 608 -1 Umacron 722 -1 '
+                               'uring 556 -1 threesuperior 300 -1 Ograve 722 '
+                               '-1 Agrave 667 -1 Abreve 667 -1 multiply 570 '
+                               '-1 uacute 556 -1 Tcaron 611 -1 partialdiff '
+                               '494 -1 ydieresis 444 -1 Nacute 722 -1 '
+                               'icircumflex 278 -1 Ecircumflex 667 -1 '
+                               'adieresis 500 -1 edieresis 444 -1 cacute 444 '
+                               '-1 nacute 556 -1 umacron 556 -1 Ncaron 722 -1 '
+                               'Iacute 389 -1 plusminus 570 -1 brokenbar 220 '
+                               '-1 registered 747 -1 Gbreve 722 -1 Idotaccent '
+                               '389 -1 summation 600 -1 Egrave 667 -1 racute '
+                               '389 -1 omacron 500 -1 Zacute 611 -1 Zcaron '
+                               '611 -1 greaterequal 549 -1 Eth 722 -1 '
+                               'Ccedilla 667 -1 lcommaaccent 278 -1 tcaron '
+                               '366 -1 eogonek 444 -1 Uogonek 722 -1 Aacute '
+                               '667 -1 Adieresis 667 -1 egrave 444 -1 zacute '
+                               '389 -1 iogonek 278 -1 Oacute 722 -1 oacute '
+                               '500 -1 amacron 500 -1 sacute 389 -1 idieresis '
+                               '278 -1 Ocircumflex 722 -1 Ugrave 722 -1 Delta '
+                               '612 -1 thorn 500 -1 twosuperior 300 -1 '
+                               'Odieresis 722 -1 mu 576 -1 igrave 278 -1 '
+                               'ohungarumlaut 500 -1 Eogonek 667 -1 dcroat '
+                               '500 -1 threequarters 750 -1 Scedilla 556 -1 '
+                               'lcaron 382 -1 Kcommaaccent 667 -1 Lacute 611 '
+                               '-1 trademark 1000 -1 edotaccent 444 -1 Igrave '
+                               '389 -1 Imacron 389 -1 Lcaron 611 -1 onehalf '
+                               '750 -1 lessequal 549 -1 ocircumflex 500 -1 '
+                               'ntilde 556 -1 Uhungarumlaut 722 -1 Eacute 667 '
+                               '-1 emacron 444 -1 gbreve 500 -1 onequarter '
+                               '750 -1 Scaron 556 -1 Scommaaccent 556 -1 '
+                               'Ohungarumlaut 722 -1 degree 400 -1 ograve 500 '
+                               '-1 Ccaron 667 -1 ugrave 556 -1 radical 549 -1 '
+                               'Dcaron 722 -1 rcommaaccent 389 -1 Ntilde 722 '
+                               '-1 otilde 500 -1 Rcommaaccent 667 -1 '
+                               'Lcommaaccent 611 -1 Atilde 667 -1 Aogonek 667 '
+                               '-1 Aring 667 -1 Otilde 722 -1 zdotaccent 389 '
+                               '-1 Ecaron 667 -1 Iogonek 389 -1 kcommaaccent '
+                               '500 -1 minus 606 -1 Icircumflex 389 -1 ncaron '
+                               '556 -1 tcommaaccent 278 -1 logicalnot 606 -1 '
+                               'odieresis 500 -1 udieresis 556 -1 notequal '
+                               '549 -1 gcommaaccent 500 -1 eth 500 -1 zcaron '
+                               '389 -1 ncommaaccent 556 -1 onesuperior 300 -1 '
+                               'imacron 278 -1 Euro 500',
+                      'Descender': -217,
+                      'FamilyName': 'Times',
+                      'FontBBox': (-200, -218, 996, 921),
+                      'FontName': 'Times-BoldItalic',
+                      'IsFixedPitch': False,
+                      'ItalicAngle': -15,
+                      'StdHW': 42,
+                      'StdVW': 121,
+                      'Weight': 'Bold',
+                      'XHeight': 462},
+ 'Times-Italic': {'Ascender': 683,
+                  'CapHeight': 653,
+                  'CharacterSet': 'ExtendedRoman',
+                  'Chars': '32 space 250 33 exclam 333 34 quotedbl 420 35 '
+                           'numbersign 500 36 dollar 500 37 percent 833 38 '
+                           'ampersand 778 39 quoteright 333 40 parenleft 333 '
+                           '41 parenright 333 42 asterisk 500 43 plus 675 44 '
+                           'comma 250 45 hyphen 333 46 period 250 47 slash '
+                           '278 48 zero 500 49 one 500 50 two 500 51 three '
+                           '500 52 four 500 53 five 500 54 six 500 55 seven '
+                           '500 56 eight 500 57 nine 500 58 colon 333 59 '
+                           'semicolon 333 60 less 675 61 equal 675 62 greater '
+                           '675 63 question 500 64 at 920 65 A 611 66 B 611 '
+                           '67 C 667 68 D 722 69 E 611 70 F 611 71 G 722 72 H '
+                           '722 73 I 333 74 J 444 75 K 667 76 L 556 77 M 833 '
+                           '78 N 667 79 O 722 80 P 611 81 Q 722 82 R 611 83 S '
+                           '500 84 T 556 85 U 722 86 V 611 87 W 833 88 X 611 '
+                           '89 Y 556 90 Z 556 91 bracketleft 389 92 backslash '
+                           '278 93 bracketright 389 94 asciicircum 422 95 '
+                           'underscore 500 96 quoteleft 333 97 a 500 98 b 500 '
+                           '99 c 444 100 d 500 101 e 444 102 f 278 103 g 500 '
+                           '104 h 500 105 i 278 106 j 278 107 k 444 108 l 278 '
+                           '109 m 722 110 n 500 111 o 500 112 p 500 113 q 500 '
+                           '114 r 389 115 s 389 116 t 278 117 u 500 118 v 444 '
+                           '119 w 667 120 x 444 121 y 444 122 z 389 123 '
+                           'braceleft 400 124 bar 275 125 braceright 400 126 '
+                           'asciitilde 541 161 exclamdown 389 162 cent 500 '
+                           '163 sterling 500 164 fraction 167 165 yen 500 166 '
+                           'florin 500 167 section 500 168 currency 500 169 '
+                           'quotesingle 214 170 quotedblleft 556 171 '
+                           'guillemotleft 500 172 guilsinglleft 333 173 '
+                           'guilsinglright 333 174 fi 500 175 fl 500 177 '
+                           'endash 500 178 dagger 500 179 daggerdbl 500 180 '
+                           'periodcentered 250 182 paragraph 523 183 bullet '
+                           '350 184 quotesinglbase 333 185 quotedblbase 556 '
+                           '186 quotedblright 556 187 guillemotright 500 188 '
+                           'ellipsis 889 189 perthousand 1000 191 '
+                           'questiondown 500 193 grave 333 194 acute 333 195 '
+                           'circumflex 333 196 tilde 333 197 macron 333 198 '
+                           'breve 333 199 dotaccent 333 200 dieresis 333 202 '
+                           'ring 333 203 cedilla 333 205 hungarumlaut 333 206 '
+                           'ogonek 333 207 caron 333 208 emdash 889 225 AE '
+                           '889 227 ordfeminine 276 232 Lslash 556 233 Oslash '
+                           '722 234 OE 944 235 ordmasculine 310 241 ae 667 '
+                           '245 dotlessi 278 248 lslash 278 249 oslash 500 '
+                           '250 oe 667 251 germandbls 500 -1 Idieresis 333 -1 '
+                           'eacute 444 -1 abreve 500 -1 uhungarumlaut 500 -1 '
+                           'ecaron 444 -1 Ydieresis 556 -1 divide 675 -1 '
+                           'Yacute 556 -1 Acircumflex 611 -1 aacute 500 -1 '
+                           'Ucircumflex 722 -1 yacute 444 -1 scommaaccent 389 '
+                           '-1 ecircumflex 444 -1 Uring 722 -1 Udieresis 722 '
+                           '-1 aogonek 500 -1 Uacute 722 -1 uogonek 500 -1 '
+                           'Edieresis 611 -1 Dcroat 722 -1 commaaccent 250 -1 '
+                           'copyright 760 -1 Emacron 611 -1 ccaron 444 -1 '
+                           'aring 500 -1 Ncommaaccent 667 -1 lacute 278 -1 '
+                           'agrave 500 -1 Tcommaaccent 556 -1 Cacute 667 -1 '
+                           'atilde 500 -1 Edotaccent 611 -1 scaron 389 -1 '
+                           'scedilla 389 -1 iacute 278 -1 lozenge 471 -1 '
+                           'Rcaron 611 -1 Gcommaaccent 722 -1 ucircumflex 500 '
+                           '-1 acircumflex 500 -1 Amacron 611 -1 rcaron 389 '
+                           '-1 ccedilla 444 -1 Zdotaccent 556 -1 Thorn 611 -1 '
+                           'Omacron 722 -1 Racute 611 -1 Sacute 500 -1 dcaron '
+                           '544 -1 Umacron 722 -1 uring 500 -1 threesuperior '
+                           '300 -1 Ograve 722 -1 Agrave 611 -1 Abreve 611 -1 '
+                           'multiply 675 -1 uacute 500 -1 Tcaron 556 -1 '
+                           'partialdiff 476 -1 ydieresis 444 -1 Nacute 667 -1 '
+                           'icircumflex 278 -1 Ecircumflex 611 -1 adieresis '
+                           '500 -1 edieresis 444 -1 cacute 444 -1 nacute 500 '
+                           '-1 umacron 500 -1 Ncaron 667 -1 Iacute 333 -1 '
+                           'plusminus 675 -1 brokenbar 275 -1 registered 760 '
+                           '-1 Gbreve 722 -1 Idotaccent 333 -1 summation 600 '
+                           '-1 Egrave 611 -1 racute 389 -1 omacron 500 -1 '
+                           'Zacute 556 -1 Zcaron 556 -1 greaterequal 549 -1 '
+                           'Eth 722 -1 Ccedilla 667 -1 lcommaaccent 278 -1 '
+                           'tcaron 300 -1 eogonek 444 -1 Uogonek 722 -1 '
+                           'Aacute 611 -1 Adieresis 611 -1 egrave 444 -1 '
+                           'zacute 389 -1 iogonek 278 -1 Oacute 722 -1 oacute '
+                           '500 -1 amacron 500 -1 sacute 389 -1 idieresis 278 '
+                           '-1 Ocircumflex 722 -1 Ugrave 722 -1 Delta 612 -1 '
+                           'thorn 500 -1 twosuperior 300 -1 Odieresis 722 -1 '
+                           'mu 500 -1 igrave 278 -1 ohungarumlaut 500 -1 '
+                           'Eogonek 611 -1 dcroat 500 -1 threequarters 750 -1 '
+                           'Scedilla 500 -1 lcaron 300 -1 Kcommaaccent 667 -1 '
+                           'Lacute 556 -1 trademark 980 -1 edotaccent 444 -1 '
+                           'Igrave 333 -1 Imacron 333 -1 Lcaron 611 -1 '
+                           'onehalf 750 -1 lessequal 549 -1 ocircumflex 500 '
+                           '-1 ntilde 500 -1 Uhungarumlaut 722 -1 Eacute 611 '
+                           '-1 emacron 444 -1 gbreve 500 -1 onequarter 750 -1 '
+                           'Scaron 500 -1 Scommaaccent 500 -1 Ohungarumlaut '
+                           '722 -1 degree 400 -1 ograve 500 -1 Ccaron 667 -1 '
+                           'ugrave 500 -1 radical 453 -1 Dcaron 722 -1 '
+                           'rcommaaccent 389 -1 Ntilde 667 -1 otilde 500 -1 '
+                           'Rcommaaccent 611 -1 Lcommaaccent 556 -1 Atilde '
+                           '611 -1 Aogonek 611 -1 Aring 611 -1 Otilde 722 -1 '
+                           'zdotaccent 389 -1 Ecaron 611 -1 Iogonek 333 -1 '
+                           'kcommaaccent 444 -1 minus 675 -1 Icircumflex 333 '
+                           '-1 ncaron 500 -1 tcommaaccent 278 -1 logicalnot '
+                           '675 -1 odieresis 500 -1 udieresis 500 -1 notequal '
+                           '549 -1 gcommaaccent 500 -1 eth 500 -1 zcaron 389 '
+                           '-1 ncommaaccent 500 -1 onesuperior 300 -1 imacron '
+                           '278 -1 Euro 500',
+                  'Descender': -217,
+                  'FamilyName': 'Times',
+                  'FontBBox': (-169, -217, 1010, 883),
+                  'FontName': 'Times-Italic',
+                  'IsFixedPitch': False,
+                  'ItalicAngle': -15.5,
+                  'StdHW': 32,
+                  'StdVW': 76,
+                  'Weight': 'Medium',
+                  'XHeight': 441},
+ 'Times-Roman': {'Ascender': 683,
+                 'CapHeight': 662,
+                 'CharacterSet': 'ExtendedRoman',
+                 'Chars': '32 space 250 33 exclam 333 34 quotedbl 408 35 '
+                          'numbersign 500 36 dollar 500 37 percent 833 38 '
+                          'ampersand 778 39 quoteright 333 40 parenleft 333 '
+                          '41 parenright 333 42 asterisk 500 43 plus 564 44 '
+                          'comma 250 45 hyphen 333 46 period 250 47 slash 278 '
+                          '48 zero 500 49 one 500 50 two 500 51 three 500 52 '
+                          'four 500 53 five 500 54 six 500 55 seven 500 56 '
+                          'eight 500 57 nine 500 58 colon 278 59 semicolon '
+                          '278 60 less 564 61 equal 564 62 greater 564 63 '
+                          'question 444 64 at 921 65 A 722 66 B 667 67 C 667 '
+                          '68 D 722 69 E 611 70 F 556 71 G 722 72 H 722 73 I '
+                          '333 74 J 389 75 K 722 76 L 611 77 M 889 78 N 722 '
+                          '79 O 722 80 P 556 81 Q 722 82 R 667 83 S 556 84 T '
+                          '611 85 U 722 86 V 722 87 W 944 88 X 722 89 Y 722 '
+                          '90 Z 611 91 bracketleft 333 92 backslash 278 93 '
+                          'bracketright 333 94 asciicircum 469 95 underscore '
+                          '500 96 quoteleft 333 97 a 444 98 b 500 99 c 444 '
+                          '100 d 500 101 e 444 102 f 333 103 g 500 104 h 500 '
+                          '105 i 278 106 j 278 107 k 500 108 l 278 109 m 778 '
+                          '110 n 500 111 o 500 112 p 500 113 q 500 114 r 333 '
+                          '115 s 389 116 t 278 117 u 500 118 v 500 119 w 722 '
+                          '120 x 500 121 y 500 122 z 444 123 braceleft 480 '
+                          '124 bar 200 125 braceright 480 126 asciitilde 541 '
+                          '161 exclamdown 333 162 cent 500 163 sterling 500 '
+                          '164 fraction 167 165 yen 500 166 florin 500 167 '
+                          'section 500 168 currency 500 169 quotesingle 180 '
+                          '170 quotedblleft 444 171 guillemotleft 500 172 '
+                          'guilsinglleft 333 173 guilsinglright 333 174 fi '
+                          '556 175 fl 556 177 endash 500 178 dagger 500 179 '
+                          'daggerdbl 500 180 periodcentered 250 182 paragraph '
+                          '453 183 bullet 350 184 quotesinglbase 333 185 '
+                          'quotedblbase 444 186 quotedblright 444 187 '
+                          'guillemotright 500 188 ellipsis 1000 189 '
+                          'perthousand 1000 191 questiondown 444 193 grave '
+                          '333 194 acute 333 195 circumflex 333 196 tilde 333 '
+                          '197 macron 333 198 breve 333 199 dotaccent 333 200 '
+                          'dieresis 333 202 ring 333 203 cedilla 333 205 '
+                          'hungarumlaut 333 206 ogonek 333 207 caron 333 208 '
+                          'emdash 1000 225 AE 889 227 ordfeminine 276 232 '
+                          'Lslash 611 233 Oslash 722 234 OE 889 235 '
+                          'ordmasculine 310 241 ae 667 245 dotlessi 278 248 '
+                          'lslash 278 249 oslash 500 250 oe 722 251 '
+                          'germandbls 500 -1 Idieresis 333 -1 eacute 444 -1 '
+                          'abreve 444 -1 uhungarumlaut 500 -1 ecaron 444 -1 '
+                          'Ydieresis 722 -1 divide 564 -1 Yacute 722 -1 '
+                          'Acircumflex 722 -1 aacute 444 -1 Ucircumflex 722 '
+                          '-1 yacute 500 -1 scommaaccent 389 -1 ecircumflex '
+                          '444 -1 Uring 722 -1 Udieresis 722 -1 aogonek 444 '
+                          '-1 Uacute 722 -1 uogonek 500 -1 Edieresis 611 -1 '
+                          'Dcroat 722 -1 commaaccent 250 -1 copyright 760 -1 '
+                          'Emacron 611 -1 ccaron 444 -1 aring 444 -1 '
+                          'Ncommaaccent 722 -1 lacute 278 -1 agrave 444 -1 '
+                          'Tcommaaccent 611 -1 Cacute 667 -1 atilde 444 -1 '
+                          'Edotaccent 611 -1 scaron 389 -1 scedilla 389 -1 '
+                          'iacute 278 -1 lozenge 471 -1 Rcaron 667 -1 '
+                          'Gcommaaccent 722 -1 ucircumflex 500 -1 acircumflex '
+                          '444 -1 Amacron 722 -1 rcaron 333 -1 ccedilla 444 '
+                          '-1 Zdotaccent 611 -1 Thorn 556 -1 Omacron 722 -1 '
+                          'Racute 667 -1 Sacute 556 -1 dcaron 588 -1 Umacron '
+                          '722 -1 uring 500 -1 threesuperior 300 -1 Ograve '
+                          '722 -1 Agrave 722 -1 Abreve 722 -1 multiply 564 -1 '
+                          'uacute 500 -1 Tcaron 611 -1 partialdiff 476 -1 '
+                          'ydieresis 500 -1 Nacute 722 -1 icircumflex 278 -1 '
+                          'Ecircumflex 611 -1 adieresis 444 -1 edieresis 444 '
+                          '-1 cacute 444 -1 nacute 500 -1 umacron 500 -1 '
+                          'Ncaron 722 -1 Iacute 333 -1 plusminus 564 -1 '
+                          'brokenbar 200 -1 registered 760 -1 Gbreve 722 -1 '
+                          'Idotaccent 333 -1 summation 600 -1 Egrave 611 -1 '
+                          'racute 333 -1 omacron 500 -1 Zacute 611 -1 Zcaron '
+                          '611 -1 greaterequal 549 -1 Eth 722 -1 Ccedilla 667 '
+                          '-1 lcommaaccent 278 -1 tcaron 326 -1 eogonek 444 '
+                          '-1 Uogonek 722 -1 Aacute 722 -1 Adieresis 722 -1 '
+                          'egrave 444 -1 zacute 444 -1 iogonek 278 -1 Oacute '
+                          '722 -1 oacute 500 -1 amacron 444 -1 sacute 389 -1 '
+                          'idieresis 278 -1 Ocircumflex 722 -1 Ugrave 722 -1 '
+                          'Delta 612 -1 thorn 500 -1 twosuperior 300 -1 '
+                          'Odieresis 722 -1 mu 500 -1 igrave 278 -1 '
+                          'ohungarumlaut 500 -1 Eogonek 611 -1 dcroat 500 -1 '
+                          'threequarters 750 -1 Scedilla 556 -1 lcaron 344 -1 '
+                          'Kcommaaccent 722 -1 Lacute 611 -1 trademark 980 -1 '
+                          'edotaccent 444 -1 Igrave 333 -1 Imacron 333 -1 '
+                          'Lcaron 611 -1 onehalf 750 -1 lessequal 549 -1 '
+                          'ocircumflex 500 -1 ntilde 500 -1 Uhungarumlaut 722 '
+                          '-1 Eacute 611 -1 emacron 444 -1 gbreve 500 -1 '
+                          'onequarter 750 -1 Scaron 556 -1 Scommaaccent 556 '
+                          '-1 Ohungarumlaut 722 -1 degree 400 -1 ograve 500 '
+                          '-1 Ccaron 667 -1 ugrave 500 -1 radical 453 -1 '
+                          'Dcaron 722 -1 rcommaaccent 333 -1 Ntilde 722 -1 '
+                          'otilde 500 -1 Rcommaaccent 667 -1 Lcommaaccent 611 '
+                          '-1 Atilde 722 -1 Aogonek 722 -1 Aring 722 -1 '
+                          'Otilde 722 -1 zdotaccent 444 -1 Ecaron 611 -1 '
+                          'Iogonek 333 -1 kcommaaccent 500 -1 minus 564 -1 '
+                          'Icircumflex 333 -1 ncaron 500 -1 tcommaaccent 278 '
+                          '-1 logicalnot 564 -1 odieresis 500 -1 udieresis '
+                          '500 -1 notequal 549 -1 gcommaaccent 500 -1 eth 500 '
+                          '-1 zcaron 444 -1 ncommaaccent 500 -1 onesuperior '
+                          '300 -1 imacron 278 -1 Euro 500',
+                 'Descender': -217,
+                 'FamilyName': 'Times',
+                 'FontBBox': (-168, -218, 1000, 898),
+                 'FontName': 'Times-Roman',
+                 'IsFixedPitch': False,
+                 'ItalicAngle': 0,
+                 'StdHW': 28,
+                 'StdVW': 84,
+                 'Weight': 'Roman',
+                 'XHeight': 450},
+ 'ZapfDingbats': {'Ascender': None,
+                  'CapHeight': None,
+                  'CharacterSet': 'Special',
+                  'Chars': '32 space 278 33 a1 974 34 a2 961 35 a202 974 36 '
+                           'a3 980 37 a4 719 38 a5 789 39 a119 790 40 a118 '
+                           '791 41 a117 690 42 a11 960 43 a12 939 44 a13 549 '
+                           '45 a14 855 46 a15 911 47 a16 933 48 a105 911 49 '
+                           'a17 945 50 a18 974 51 a19 755 52 a20 846 53 a21 '
+                           '762 54 a22 761 55 a23 571 56 a24 677 57 a25 763 '
+                           '58 a26 760 59 a27 759 60 a28 754 61 a6 494 62 a7 '
+                           '552 63 a8 537 64 a9 577 65 a10 692 66 a29 786 67 '
+                           'a30 788 68 a31 788 69 a32 790 70 a33 793 71 a34 '
+                           '794 72 a35 816 73 a36 823 74 a37 789 75 a38 841 '
+                           '76 a39 823 77 a40 833 78 a41 816 79 a42 831 80 '
+                           'a43 923 81 a44 744 82 a45 723 83 a46 749 84 a47 '
+                           '790 85 a48 792 86 a49 695 87 a50 776 88 a51 768 '
+                           '89 a52 792 90 a53 759 91 a54 707 92 a55 708 93 '
+                           'a56 682 94 a57 701 95 a58 826 96 a59 815 97 a60 '
+                           '789 98 a61 789 99 a62 707 100 a63 687 101 a64 696 '
+                           '102 a65 689 103 a66 786 104 a67 787 105 a68 713 '
+                           '106 a69 791 107 a70 785 108 a71 791 109 a72 873 '
+                           '110 a73 761 111 a74 762 112 a203 762 113 a75 759 '
+                           '114 a204 759 115 a76 892 116 a77 892 117 a78 788 '
+                           '118 a79 784 119 a81 438 120 a82 138 121 a83 277 '
+                           '122 a84 415 123 a97 392 124 a98 392 125 a99 668 '
+                           '126 a100 668 128 a89 390 129 a90 390 130 a93 317 '
+                           '131 a94 317 132 a91 276 133 a92 276 134 a205 509 '
+                           '135 a85 509 136 a206 410 137 a86 410 138 a87 234 '
+                           '139 a88 234 140 a95 334 141 a96 334 161 a101 732 '
+                           '162 a102 544 163 a103 544 164 a104 910 165 a106 '
+                           '667 166 a107 760 167 a108 760 168 a112 776 169 '
+                           'a111 595 170 a110 694 171 a109 626 172 a120 788 '
+                           '173 a121 788 174 a122 788 175 a123 788 176 a124 '
+                           '788 177 a125 788 178 a126 788 179 a127 788 180 '
+                           'a128 788 181 a129 788 182 a130 788 183 a131 788 '
+                           '184 a132 788 185 a133 788 186 a134 788 187 a135 '
+                           '788 188 a136 788 189 a137 788 190 a138 788 191 '
+                           'a139 788 192 a140 788 193 a141 788 194 a142 788 '
+                           '195 a143 788 196 a144 788 197 a145 788 198 a146 '
+                           '788 199 a147 788 200 a148 788 201 a149 788 202 '
+                           'a150 788 203 a151 788 204 a152 788 205 a153 788 '
+                           '206 a154 788 207 a155 788 208 a156 788 209 a157 '
+                           '788 210 a158 788 211 a159 788 212 a160 894 213 '
+                           'a161 838 214 a163 1016 215 a164 458 216 a196 748 '
+                           '217 a165 924 218 a192 748 219 a166 918 220 a167 '
+                           '927 221 a168 928 222 a169 928 223 a170 834 224 '
+                           'a171 873 225 a172 828 226 a173 924 227 a162 924 '
+                           '228 a174 917 229 a175 930 230 a176 931 231 a177 '
+                           '463 232 a178 883 233 a179 836 234 a193 836 235 '
+                           'a180 867 236 a199 867 237 a181 696 238 a200 696 '
+                           '239 a182 874 241 a201 874 242 a183 760 243 a184 '
+                           '946 244 a197 771 245 a185 865 246 a194 771 247 '
+                           'a198 888 248 a186 967 249 a195 888 250 a187 831 '
+                           '251 a188 873 252 a189 927 253 a190 970 254 a191 '
+                           '918',
+                  'Descender': None,
+                  'FamilyName': 'ZapfDingbats',
+                  'FontBBox': (-1, -143, 981, 820),
+                  'FontName': 'ZapfDingbats',
+                  'IsFixedPitch': False,
+                  'ItalicAngle': 0,
+                  'StdHW': 28,
+                  'StdVW': 90,
+                  'Weight': 'Medium',
+                  'XHeight': None}}
@@ -0,0 +1,204 @@
+"""
+Type 0 (composite) fonts and their CIDFont descendants - Reference pp. 432-444
+"""
+
+from array  import array
+from bisect import bisect_right
+
+from .base_font    import PdfBaseFont, FontDescriptor, glyph_to_unicode
+from .cmap         import get_cmap, get_predefined_cmap
+from ..pdf_element import PdfElement
+from ...pdf_types  import PdfStream
+
+__all__ = ['Type0Font', 'CIDFont', 'CIDWidths']
+
+class CIDWidths(object):
+    """Glyph widths from a CIDFont's W array (Reference p. 441), stored as
+    sorted runs of CIDs with the same width instead of one entry per CID."""
+    def __init__(self, w_array=(), default=1000):
+        """Arguments:
+            w_array - The W array.  It's a mix of entries of the forms
+                      c [w1 w2 ... wn], giving widths for CIDs c through
+                      c+n-1, and c_first c_last w, giving all of the CIDs from
+                      c_first to c_last the same width.
+            default - Width of CIDs not in the array (DW)"""
+        self.default = float(default)
+        items = [getattr(i, 'value', i) for i in w_array]
+        runs  = []
+        pos   = 0
+        while pos < len(items) - 1:
+            first = int(items[pos])
+            if not isinstance(items[pos+1], (int, float)):
+                widths = [float(getattr(w, 'value', w)) for w in items[pos+1]]
+                # Consecutive CIDs often have the same width
+                for cid, width in enumerate(widths, first):
+                    last = runs[-1] if runs else None
+                    if last and last[1] == cid - 1 and last[2] == width:
+                        last[1] = cid
+                    else:
+                        runs.append([cid, cid, width])
+                pos += 2
+            else:
+                if pos + 2 >= len(items):
+                    break
+                runs.append([first, int(items[pos+1]), float(items[pos+2])])
+                pos += 3
+        runs.sort(key=lambda r: r[0])
+        self._starts = array('L', (r[0] for r in runs))
+        self._ends   = array('L', (r[1] for r in runs))
+        self._widths = array('d', (r[2] for r in runs))
+
+    def __len__(self):
+        """Number of runs"""
+        return len(self._starts)
+
+    def get(self, cid):
+        """The width of the glyph for cid"""
+        i = bisect_right(self._starts, cid) - 1
+        if i < 0 or cid > self._ends[i]:
+            return self.default
+        return self._widths[i]
+    __getitem__ = get
+
+    @property
+    def mean(self):
+        """Average width of the CIDs in the W array, or the default width if
+        it's empty"""
+        counts = [e - s + 1 for s, e in zip(self._starts, self._ends)]
+        if not counts:
+            return self.default
+        return sum(c*w for c, w in zip(counts, self._widths))/sum(counts)
+
+class CIDFont(PdfElement):
+    """A CIDFontType0 or CIDFontType2 font, the descendant of a Type 0 font
+    that holds its glyph metrics.  CIDs index the glyphs directly."""
+    def __init__(self, obj, obj_key=None, document=None):
+        super(CIDFont, self).__init__(obj, obj_key, document)
+        self._widths = None
+        self._fdesc  = None
+
+    @property
+    def DW(self):
+        """Default glyph width"""
+        return self._object.get('DW', 1000)
+    @property
+    def widths(self):
+        """CIDWidths for the font's W array"""
+        if self._widths is None:
+            w_array = self._object.get('W')
+            w_array = w_array.value if w_array is not None else []
+            self._widths = CIDWidths(w_array, self.DW)
+        return self._widths
+    @property
+    def FontDescriptor(self):
+        """The font's parsed FontDescriptor"""
+        if self._fdesc is None:
+            try:
+                obj = self._object['FontDescriptor']
+            except KeyError:
+                raise AttributeError('Object has no attribute "FontDescriptor"')
+            self._fdesc = self._get_element(obj, FontDescriptor)
+        return self._fdesc
+
+class Type0Font(PdfBaseFont):
+    """Type 0 font.  Character codes can be more than one byte long, and the
+    Encoding is a CMap that maps them to CIDs, which select glyphs in the
+    descendant CIDFont.
+
+    TODO: Vertical writing (W2)"""
+    def __init__(self, obj, obj_key=None, document=None):
+        super(Type0Font, self).__init__(obj, obj_key, document)
+        self._descendant  = None
+        self._space_width = None
+
+    def text_space_coords(self, x, y):
+        """CIDFonts use the same 1/1000 scale as Type1 fonts"""
+        return x/1000., y/1000.
+
+    @property
+    def Encoding(self):
+        """The CMap mapping character codes to CIDs.  Only the Identity
+        CMaps are available by name."""
+        if self._encoding is None:
+            obj = getattr(self._object.get('Encoding'), 'value', 'Identity-H')
+            if isinstance(obj, PdfStream):
+                self._encoding = get_cmap(obj)
+            else:
+                self._encoding = get_predefined_cmap(obj)
+        return self._encoding
+    @property
+    def DescendantFont(self):
+        """The CIDFont (the only entry of DescendantFonts)"""
+        if self._descendant is None:
+            obj = self._object['DescendantFonts'].value[0]
+            self._descendant = self._get_element(obj, CIDFont)
+        return self._descendant
+    @property
+    def FontDescriptor(self):
+        """The descendant font's FontDescriptor"""
+        return self.DescendantFont.FontDescriptor
+
+    def code_counts(self, codes):
+        """Number of character codes in codes and how many of them are the
+        single byte code 32, which is the only one word spacing applies to"""
+        cmap  = self.Encoding
+        split = cmap.split(codes)
+        if 1 not in cmap.code_lengths:
+            return len(split), 0
+        return len(split), split.count(32)
+
+    def string_width(self, codes):
+        """Total glyph space width of the character codes in codes"""
+        get_cid   = self.Encoding.get
+        get_width = self.DescendantFont.widths.get
+        return sum([get_width(get_cid(c, 0))
+                    for c in self.Encoding.split(codes)])
+
+    def decode_codes(self, codes):
+        """Translate the character codes in codes to unicode using the
+        ToUnicode CMap.  Without one there's no reliable way to get the text,
+        so each code is just taken as a unicode code point."""
+        split = self.Encoding.split(codes)
+        cmap  = self.ToUnicode
+        if cmap is None:
+            return ''.join([chr(c) for c in split])
+        get = cmap.get
+        return ''.join([get(c, '') for c in split])
+
+    def get_glyph_width(self, glyph, missing_width=0):
+        """Return the width of the glyph for a character code.  Note that
+        these widths are in _glyph_ space, not _text_ space."""
+        if not isinstance(glyph, int):
+            glyph = self.get_char_code(glyph)
+            if glyph is None:
+                return missing_width
+        return self.DescendantFont.widths.get(self.Encoding.get(glyph, 0))
+
+    def get_glyph_name(self, code):
+        raise KeyError('Type 0 fonts have no glyph names')
+
+    def get_char_code(self, name):
+        """Character code of the glyph name or one character string, found
+        through the ToUnicode CMap, or None"""
+        cmap = self.ToUnicode
+        if cmap is None:
+            return None
+        return cmap.find(glyph_to_unicode(name) if len(name) > 1 else name)
+
+    @property
+    def space_width(self):
+        """Width of the space character, or the default width if the font
+        doesn't say which code is the space"""
+        if self._space_width is None:
+            code = self.get_char_code(' ')
+            if code is None:
+                self._space_width = self.DescendantFont.widths.default
+            else:
+                self._space_width = self.get_glyph_width(code)
+        return self._space_width
+    @property
+    def avg_width(self):
+        """Average width of the glyphs in the W array"""
+        if self._avg_width is None:
+            self._avg_width = self.DescendantFont.widths.mean
+        return self._avg_width
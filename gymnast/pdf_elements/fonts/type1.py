@@ -1,14 +1,16 @@
 """
 Type1 Fonts
 """
-import os
 
-from .base_font       import PdfBaseFont
-from ...pdf_constants import DATA_DIR
-from ...pdf_types     import PdfName, PdfDict
+from .base_font       import PdfBaseFont, FontEncoding
+from ...pdf_types     import PdfName, PdfDict, PdfArray
 
-AFM_DIR   = DATA_DIR + '/afm/'
-STD_FONTS = {j[:-4] for j in os.listdir(AFM_DIR) if j[-4:] == '.afm'}
+# The standard 14 fonts, whose metrics are compiled into std14_metrics
+STD_FONTS = frozenset(('Courier', 'Courier-Bold', 'Courier-BoldOblique',
+                       'Courier-Oblique', 'Helvetica', 'Helvetica-Bold',
+                       'Helvetica-BoldOblique', 'Helvetica-Oblique', 'Symbol',
+                       'Times-Bold', 'Times-BoldItalic', 'Times-Italic',
+                       'Times-Roman', 'ZapfDingbats'))
 
 class Type1Font(PdfBaseFont):
     """Base PDF Font.  Right now this is exclusively Type 1."""
@@ -17,96 +19,176 @@ class Type1Font(PdfBaseFont):
         """If the font has a name in the Standard 14, load defaults from there
         and then apply the settings from the definition here."""
         obj = obj.value
+        std_widths = False
         if obj['BaseFont'] in STD_FONTS:
-            std_font = get_std_font_dict(obj['BaseFont'])
-            obj = std_font.update(obj)
+            font = get_std_font_dict(obj['BaseFont'])
+            std_widths = 'Widths' not in obj
+            font.update(obj)
+            obj = font
         super(Type1Font, self).__init__(obj, obj_key, document)
+        # The standard Widths are in the order of the built-in encoding's
+        # codes, so if they weren't overridden they're redone for the font's
+        # actual Encoding the first time they're needed
+        self._std_widths = std_widths
+
+    @property
+    def FirstChar(self):
+        self._encode_std_widths()
+        return super(Type1Font, self).__getattr__('FirstChar')
+    @property
+    def LastChar(self):
+        self._encode_std_widths()
+        return super(Type1Font, self).__getattr__('LastChar')
+    @property
+    def Widths(self):
+        self._encode_std_widths()
+        return super(Type1Font, self).Widths
+
+    def _encode_std_widths(self):
+        """Set a standard font's FirstChar, LastChar, and Widths to the
+        standard widths of the glyphs its Encoding gives each code"""
+        if not self._std_widths:
+            return
+        self._std_widths = False
+        widths = get_std_metrics(self._object['BaseFont']).widths
+        codes  = {}
+        for code in range(256):
+            try:
+                name = self.get_glyph_name(code)
+            except KeyError:
+                continue
+            if name in widths:
+                codes[code] = widths[name]
+        if not codes:
+            return
+        first_char = min(codes)
+        last_char  = max(codes)
+        self._object[PdfName('FirstChar')] = first_char
+        self._object[PdfName('LastChar')]  = last_char
+        self._object[PdfName('Widths')]    = \
+            PdfArray(codes.get(c, 0) for c in range(first_char, last_char + 1))
 
     def text_space_coords(self, x, y):
         """Type1 fonts just scale by 1/1000 to convert from glyph space"""
         return x/1000., y/1000.
 
-    @classmethod
-    def load_standard_font(cls, font_name):
-        """Super, super crude method to parse a afm font file into a Type1
-        PdfFont object"""
+    @property
+    def Encoding(self):
+        """The font's parsed Encoding object.  Symbolic standard fonts use
+        their own built-in encodings by default."""
+        if (self._encoding is None and 'Encoding' not in self._object
+                and self._object['BaseFont'] in STD_FONTS):
+            self._encoding = get_std_encoding(self._object['BaseFont'])
+        return super(Type1Font, self).Encoding
 
-def de_list(lst):
-    """Turn a list into a scalar if it's of length 1, respecting Nones."""
-    if not lst:
-        return None
-    else:
-        return (lst[0] if len(lst) == 1 else lst)
+class StdFontMetrics(object):
+    """A standard font's metrics, unpacked from std14_metrics"""
+    def __init__(self, metrics):
+        self.metrics = metrics
+        chars        = metrics['Chars'].split()
+        codes        = [int(c) for c in chars[0::3]]
+        names        = chars[1::3]
+        widths       = [int(w) for w in chars[2::3]]
+        #: glyph name: width
+        self.widths  = dict(zip(names, widths))
+        #: character code: glyph name in the built-in encoding
+        self.encoding = {c: n for c, n in zip(codes, names) if c >= 0}
 
-def int_or_none(val):
-    """Return an int if we can, otherwise None"""
+# Everything below is built at most once per font per process
+_std_metrics   = {}
+_std_fonts     = {}
+_std_encodings = {}
+_std_kerning   = {}
+
+def get_std_metrics(font_name):
+    """The StdFontMetrics for one of the standard 14 fonts.  The compiled
+    metrics are only imported the first time one is needed."""
     try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
+        return _std_metrics[font_name]
+    except KeyError:
+        pass
+    from .std14_metrics import FONTS
+    return _std_metrics.setdefault(font_name,
+                                   StdFontMetrics(FONTS[font_name]))
 
-def get_std_font_dict(font_name):
-    """Load a standard font and parse it into a PdfDict similar to how it would
-    be stored in a PDF file"""
-    FILE_PAT = AFM_DIR + '/{}.afm'
+def get_std_kerning(font_name):
+    """Dict mapping (left glyph, right glyph) pairs to kerning adjustments
+    for one of the standard 14 fonts"""
+    try:
+        return _std_kerning[font_name]
+    except KeyError:
+        pass
+    from .std14_kerning import KERN_PAIRS
+    pairs = KERN_PAIRS.get(font_name, '').split()
+    kerning = {(l, r): int(k)
+               for l, r, k in zip(pairs[0::3], pairs[1::3], pairs[2::3])}
+    return _std_kerning.setdefault(font_name, kerning)
 
-    parsed = load_afm_file(FILE_PAT.format(font_name))
-    charmets = [{i.split()[0]:de_list(i.split()[1:])
-                 for i in l.split(';') if i.strip()}
-                for l in parsed['CharMetrics']]
-    first_char = min(int(i['C']) for i in charmets if i['C'] != '-1')
-    last_char  = min(int(i['C']) for i in charmets)
-    widths     = [i['WX']
-                  for i in sorted(charmets, key=lambda x: int(x['C']))
-                  if i['C'] != '-1']
-    charset    = [PdfName(i['N'])  for i in charmets if i['C'] != '-1']
+def get_std_encoding(font_name):
+    """FontEncoding for the built-in encoding of one of the standard 14
+    fonts.  The Latin fonts all use StandardEncoding."""
+    try:
+        return _std_encodings[font_name]
+    except KeyError:
+        pass
+    metrics = get_std_metrics(font_name)
+    if metrics.metrics['CharacterSet'] != 'Special':
+        encoding = FontEncoding.from_name('StandardEncoding')
+    else:
+        diffs = []
+        for code in sorted(metrics.encoding):
+            diffs.extend((code, PdfName(metrics.encoding[code])))
+        encoding = FontEncoding(PdfDict({'BaseEncoding': 'StandardEncoding',
+                                         'Differences':  diffs}))
+    return _std_encodings.setdefault(font_name, encoding)
 
-    flags =     1*(parsed.get('IsFixedPitch') == 'true')\
-            +   8*(parsed['CharacterSet'] == 'Special') \
-            +  64*(parsed['CharacterSet'] != 'Special') \
-            + 128*(parsed['ItalicAngle']  != '0')
+def get_std_font_dict(font_name):
+    """Get a new PdfDict for one of the standard fonts as it would be stored
+    in a PDF file.  The entries (Widths, FontDescriptor, etc.) are shared
+    between all of the copies, so don't modify them."""
+    try:
+        return PdfDict(_std_fonts[font_name])
+    except KeyError:
+        pass
+    metrics    = get_std_metrics(font_name)
+    data       = metrics.metrics
+    codes      = metrics.encoding
+    first_char = min(codes)
+    last_char  = max(codes)
+    # Codes without a glyph get the MissingWidth of 0
+    widths     = PdfArray(metrics.widths[codes[c]] if c in codes else 0
+                          for c in range(first_char, last_char + 1))
+    charset    = ''.join('/'+n for n in metrics.widths).encode()
+    # Flags are bit positions (Reference p. 458): FixedPitch 1, Serif 2,
+    # Symbolic 3, Nonsymbolic 6, Italic 7
+    symbolic   = (data['CharacterSet'] == 'Special')
+    flags      =  1*data['IsFixedPitch'] \
+               +  2*(data['FamilyName'] in ('Times', 'Courier')) \
+               +  4*symbolic \
+               + 32*(not symbolic) \
+               + 64*(data['ItalicAngle'] != 0)
     fdesc = {PdfName('Type')       : 'FontDescriptor',
-             PdfName('FontName')   : parsed['FontName'],
-             PdfName('FontFamily') : parsed['FamilyName'],
-             PdfName('FontWeight') : parsed['Weight'],
+             PdfName('FontName')   : data['FontName'],
+             PdfName('FontFamily') : data['FamilyName'],
+             PdfName('FontWeight') : data['Weight'],
              PdfName('Flags')      : flags,
-             PdfName('FontBBox')   : [int(i) for i in parsed['FontBBox']],
-             PdfName('ItalicAngle'): int_or_none(parsed.get('ItalicAngle')),
-             PdfName('Ascent')     : int_or_none(parsed.get('Ascender')),
-             PdfName('Descent')    : int_or_none(parsed.get('Descender')),
-             PdfName('CapHeight')  : int_or_none(parsed.get('CapHeight')),
-             PdfName('XHeight')    : int_or_none(parsed.get('XHeight')),
-             PdfName('StemV')      : int_or_none(parsed.get('StdHW')),
-             PdfName('StemH')      : int_or_none(parsed.get('StdVW')),
-             PdfName('Charset')    : charset,
+             PdfName('FontBBox')   : PdfArray(data['FontBBox']),
+             PdfName('ItalicAngle'): data['ItalicAngle'],
+             PdfName('Ascent')     : data['Ascender'],
+             PdfName('Descent')    : data['Descender'],
+             PdfName('CapHeight')  : data['CapHeight'],
+             PdfName('XHeight')    : data['XHeight'],
+             PdfName('StemV')      : data['StdVW'],
+             PdfName('StemH')      : data['StdHW'],
+             PdfName('MissingWidth'): 0,
+             PdfName('CharSet')    : charset,
             }
     font  = {PdfName('Type')          : 'Font',
              PdfName('Subtype')       : 'Type1',
-             PdfName('BaseFont')      : parsed['FontName'],
+             PdfName('BaseFont')      : data['FontName'],
              PdfName('FirstChar')     : first_char,
              PdfName('LastChar')      : last_char,
              PdfName('Widths')        : widths,
              PdfName('FontDescriptor'): PdfDict(fdesc),
             }
-    return PdfDict(font)
-
-def load_afm_file(fname):
-    """Load an Adobe Font Metrics file.  This is somewhat crude, but sufficient
-    for these purposes"""
-    DO_NOTHINGS =  {'EndFontMetrics', 'StartFontMetrics',
-                    'EndKernData', 'StartKernData'}
-    SECTIONS = {'StartCharMetrics', 'StartKernPairs', 'StartTrackKern'}
-    with open(fname) as f:
-        lines =  [l for l in f.read().splitlines() if l[:8]!='Comment '][::-1]
-    data = {}
-    while lines:
-        line = lines.pop().split()
-        if   line[0] in DO_NOTHINGS:
-            continue
-        elif line[0] in SECTIONS:
-            data[line[0][5:]] = lines[-int(line[1]):][::-1]
-            del lines[-int(line[1])-1:]
-        else:
-            data[line[0]] = de_list(line[1:])
-    return data
-
+    return PdfDict(_std_fonts.setdefault(font_name, PdfDict(font)))
@@ -29,9 +29,9 @@ class PdfElement(MutableMapping):
 
     required_properties = set(('Type', ))
     @classmethod
-    def from_object(cls, obj, object_key=None):
+    def from_object(cls, obj, object_key=None, document=None):
         """Parse an object into a document element"""
-        return cls(obj.value, object_key)
+        return cls(obj.value, object_key, document)
 
     @property
     def parsed_object(self):
@@ -44,6 +44,22 @@ class PdfElement(MutableMapping):
         self._obj_key  = obj_key
         self._document = document
 
+    @property
+    def object_key(self):
+        """(object number, generation) of the indirect object this element
+        came from, if any"""
+        return self._obj_key
+
+    def _get_element(self, obj, element_type=None):
+        """Get the element for obj, a PdfType that this element refers to,
+        from the document's shared cache if we have a document (see
+        PdfDocument.get_element)"""
+        if self._document is not None:
+            return self._document.get_element(obj, element_type)
+        if element_type is None:
+            return obj.parsed_object
+        return element_type.from_object(obj, getattr(obj, 'object_key', None))
+
     @property
     def document(self):
         """The docuement to which this element belongs"""
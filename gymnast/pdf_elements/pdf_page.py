@@ -2,11 +2,16 @@
 PDF Document Page and Page Node elements
 """
 
-import six
+import warnings
+from itertools import chain
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections     import Mapping
 
 from .pdf_element    import PdfElement
-from ..exc           import PdfParseError, PdfError
-from ..pdf_types     import PdfType, PdfRaw, PdfArray
+from ..exc           import PdfParseError, PdfError, PdfOpWarning
+from ..pdf_types     import PdfType, PdfArray
 from ..pdf_parser    import PdfParser
 from ..pdf_operation import PdfOperation
 
@@ -21,7 +26,37 @@ def parse_page(obj):
 class PdfPageResources(PdfElement):
     """Resources dict on page objects.  Technically, it's not a PDF
     object type, but this lets us re-use a lot of code."""
-    pass
+    def __init__(self, obj, obj_key=None, document=None):
+        super(PdfPageResources, self).__init__(obj, obj_key, document)
+        self._fonts = None
+    @property
+    def Fonts(self):
+        """Mapping of the font resource names to fonts.  Each font is only
+        looked up the first time its name is used."""
+        if self._fonts is None:
+            self._fonts = PdfResourceMap(self, self._object.get('Font'))
+        return self._fonts
+
+class PdfResourceMap(Mapping):
+    """Read-only mapping of the names in one of a resource dict's sub-dicts
+    (e.g., /Font) to elements, which are resolved on demand through the
+    document's shared element cache"""
+    def __init__(self, resources, names):
+        self._resources = resources
+        self._names     = names.value if names is not None else {}
+        self._elements  = {}
+    def __getitem__(self, name):
+        try:
+            return self._elements[name]
+        except KeyError:
+            pass
+        element = self._resources._get_element(self._names[name])
+        self._elements[name] = element
+        return element
+    def __iter__(self):
+        return iter(self._names)
+    def __len__(self):
+        return len(self._names)
 
 class PdfAbstractPage(PdfElement):
     """Base class for PDF Pages and Page Nodes."""
@@ -30,18 +65,25 @@ class PdfAbstractPage(PdfElement):
         where applicable"""
         #Common and inheritable properties
         super(PdfAbstractPage, self).__init__(page, obj_key, document)
+        self._parent    = page.get('Parent')
         self._resources = page.get('Resources')
         self._mediabox  = page.get('MediaBox')
         self._cropbox   = page.get('CropBox')
         self._rotate    = page.get('Rotate')
-        self._fonts     = None
+        self._resources_element = None
 
     @property
     def Resources(self):
-        """Page resources, most notably fonts"""
-        if   self._resources: return PdfPageResources.from_object(self._resources)
-        elif self._parent:    return self.Parent.Resources
-        else: raise PdfError('Resource dictionary not found')
+        """Page resources, most notably fonts.  Resource dicts are shared
+        with any other pages that use the same one."""
+        if self._resources_element is None:
+            if   self._resources:
+                self._resources_element = self._get_element(self._resources,
+                                                             PdfPageResources)
+            elif self._parent:
+                self._resources_element = self.Parent.Resources
+            else: raise PdfError('Resource dictionary not found')
+        return self._resources_element
     @property
     def MediaBox(self):
         """Size of the media"""
@@ -67,12 +109,9 @@ class PdfAbstractPage(PdfElement):
         else: return 0
     @property
     def Fonts(self):
-        """Neatly processed dict of the page's fonts.  Serves as a shortcut
-        to .Resources.Font"""
-        if self._fonts is None:
-            self._fonts = {k: v.parsed_object
-                           for k,v in six.iteritems(self.Resources.Font)}
-        return self._fonts
+        """Mapping of the page's font names to fonts, which get loaded the
+        first time they're used.  Serves as a shortcut to .Resources.Fonts"""
+        return self.Resources.Fonts
     @property
     def unique_id(self):
         """Unique key to lookup page numbers and such in the document"""
@@ -96,6 +135,43 @@ class PdfPageNode(PdfAbstractPage):
     def Kids(self):
         """Child pages and nodes"""
         return [p.parsed_object for p in self._object['Kids'].value]
+    @property
+    def Count(self):
+        """Number of pages under this node"""
+        return self._object['Count']
+
+    def get_page(self, index):
+        """The index-th page under this node.  The kids' /Count entries let
+        us skip over whole subtrees, so only the nodes on the way down to the
+        page get turned into elements."""
+        node = self
+        while True:
+            for kid in node._object['Kids'].value:
+                count = self.kid_count(kid.value)
+                if index < count:
+                    break
+                index -= count
+            else:
+                raise IndexError('Page index out of range')
+            kid = kid.parsed_object
+            if not isinstance(kid, PdfPageNode):
+                return kid
+            node = kid
+
+    def iter_pages(self):
+        """Generator over the pages under this node, in order"""
+        for kid in self._object['Kids'].value:
+            kid = kid.parsed_object
+            if isinstance(kid, PdfPageNode):
+                for page in kid.iter_pages():
+                    yield page
+            else:
+                yield kid
+
+    @staticmethod
+    def kid_count(kid):
+        """Number of pages in kid, the object dict of a page or page node"""
+        return kid['Count'] if kid.get('Type') == 'Pages' else 1
     #def __getitem__(self, key):
     #    return self._kids[key]
     #def __contains__(self, item):
@@ -108,9 +184,6 @@ class PdfPageNode(PdfAbstractPage):
     #    return self._kids.__iter__()
     #def __reversed__(self):
     #    return self._kids.__reversed__()
-    #@property
-    #def Count(self):
-    #    return len(self._kids)
     #def __str__(self):
     #    return 'PdfPageNode - %d children'%self.Count
 
@@ -124,7 +197,6 @@ class PdfPage(PdfAbstractPage):
             raise PdfParseError('Page dicts must have Type = "Page"')
         super(PdfPage, self).__init__(page, obj_key, document)
         self._contents  = ContentStream(page.get('Contents', []))
-        self._fonts     = None # Load these when they're called
 
     @property
     def Contents(self):
@@ -152,22 +224,53 @@ class ContentStream(object):
         if not isinstance(contents, PdfArray):
             contents = [contents]
         self._contents = contents
+        self._programs = {}
     @property
     def operations(self):
         """Iterator over the various PDF operations in the content stream.
         Each element is an instance of a subclass of PdfOperation, which can
         then be rendered by the page by calling e.g. next(operations)(renderer)
-        where renderer is a PdfRenderer object."""
-        for stream in self._contents:
-            for oper in self._extract_stream_ops(stream):
-                yield oper
+        where renderer is a PdfRenderer object.  Operators that aren't
+        implemented give NOP operations."""
+        for _, operands, opclass in self.get_program(nops=True):
+            yield opclass(*operands)
 
-    @staticmethod
-    def _extract_stream_ops(stream):
-        operands = []
-        for op in PdfParser().iterparse(stream.value.data):
-            if isinstance(op, PdfRaw):
-                yield PdfOperation[op](*operands)
-                operands = []
-            else:
-                operands.append(op)
+    @property
+    def program(self):
+        """The compiled ContentProgram.  It's only built once, so rendering
+        the page again doesn't need to decode or parse anything."""
+        return self.get_program()
+    def get_program(self, mask=None, nops=False):
+        """The compiled ContentProgram with only the operations whose types
+        are in mask (PdfOperation type constants or'd together), or all of
+        them if mask is None.  If nops is True, unimplemented operators are
+        kept as NOP operations.  Each is only built once."""
+        try:
+            return self._programs[mask, nops]
+        except KeyError:
+            return self._programs.setdefault((mask, nops),
+                                             self.compile(mask, nops))
+    @property
+    def unknown_ops(self):
+        """Counter of the operators in the stream that aren't implemented"""
+        return self.program.unknown
+
+    def compile(self, mask=None, nops=False):
+        """Compile the content stream into a new ContentProgram (see
+        PdfOperation.compile).  If mask is given, the operations outside of
+        it aren't even parsed.  Any unimplemented operators get a single
+        warning listing them."""
+        skip = None if mask is None else PdfOperation.skipped_operators(mask)
+        # The streams are treated as one (Reference p. 152), and the decoded
+        # data isn't needed once it's compiled
+        objects = chain.from_iterable(
+                      PdfParser().iterparse(stream.value.decode(cache=False),
+                                            skip=skip)
+                      for stream in self._contents)
+        program = PdfOperation.compile(objects, mask, nops)
+        if program.unknown:
+            counts = ', '.join("'{}' ({})".format(op, n)
+                               for op, n in sorted(program.unknown.items()))
+            warnings.warn('Opcodes not implemented. NOP: ' + counts,
+                          PdfOpWarning)
+        return program
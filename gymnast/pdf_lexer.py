@@ -0,0 +1,297 @@
+"""
+Buffer-backed lexer for raw PDF data.
+
+PdfLexer wraps a bytes-like object (bytes, bytearray, memoryview, or mmap) and
+a cursor into it.  It quacks enough like a buffered binary stream (read(),
+peek(), seek(), and tell()) that the rest of the package can treat it as one,
+but it also knows how to pull whole tokens, strings, and comments out of the
+buffer with precompiled regexes instead of feeling its way along one byte at a
+time.
+"""
+
+import io
+import mmap
+import re
+
+from .exc           import PdfParseError
+from .pdf_constants import WHITESPACE, DELIMITERS
+
+__all__ = ['PdfLexer']
+
+def _char_class(chars):
+    """Build the body of a regex character class from a set of single bytes"""
+    return b''.join(re.escape(c) for c in sorted(chars))
+
+class PdfLexer(object):
+    """Tokenizer over an in-memory window of PDF data.  Several lexers can
+    share the same underlying buffer, each with its own position."""
+    WHITESPACE_RE = re.compile(b'[' + _char_class(WHITESPACE) + b']*')
+    # Run of regular (i.e., neither whitespace nor delimiter) characters
+    REGULAR_RE    = re.compile(b'[^' + _char_class(WHITESPACE | DELIMITERS)
+                               + b']*')
+    STRING_RE     = re.compile(br'[()\\]')
+
+    # Single character tokens (as ints, since that's what indexing gives us)
+    SINGLES  = frozenset(b'([{%')
+    # Keywords that end the token as soon as they're complete unless they're
+    # explicitly disallowed
+    KEYWORDS = (b'R', b'obj', b'stream')
+    KEYWORD_STARTS = frozenset(k[0] for k in KEYWORDS)
+
+    _patterns = {} # Cache of compiled search patterns for closers and such
+    _skip_patterns = {} # Cache of skip_operations() patterns
+
+    # Pieces of skip_operations() patterns: whitespace, the end of a token,
+    # and the operands (numbers and names) that are skipped over
+    _WS      = b'[' + _char_class(WHITESPACE) + b']*'
+    _END     = b'(?![^' + _char_class(WHITESPACE | DELIMITERS) + b'])'
+    _OPERAND = br'(?:[-+]?(?:\d+\.?\d*|\.\d+)' + _END + b'|/[^' \
+               + _char_class(WHITESPACE | DELIMITERS) + b']*)'
+
+    def __init__(self, data, position=0):
+        """Create a new lexer.
+
+        Arguments:
+            data     - bytes, bytearray, memoryview, or mmap to tokenize
+            position - Optional starting position (default 0)"""
+        if isinstance(data, memoryview) and data.format != 'B':
+            data = data.cast('B')
+        self._data = data
+        self._view = data if isinstance(data, memoryview) else None
+        self._len  = len(data)
+        self._pos  = position
+
+    @classmethod
+    def wrap(cls, data):
+        """Return data as a PdfLexer, wrapping it if we need to.  Buffers are
+        used as is; readable streams are read into memory and positioned
+        where the stream was."""
+        if isinstance(data, cls):
+            return data
+        elif isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            return cls(data)
+        elif hasattr(data, 'read'):
+            try:
+                position = data.tell()
+                data.seek(0)
+            except (AttributeError, IOError, ValueError):
+                position = 0
+            return cls(data.read(), position)
+        try:
+            return cls(memoryview(data))
+        except TypeError:
+            raise TypeError('Data to be parsed must be either bytes, '
+                            'bytesarray, or a read()able stream.')
+
+    @property
+    def buffer(self):
+        """The underlying buffer"""
+        return self._data
+    @property
+    def view(self):
+        """memoryview of the underlying buffer"""
+        if self._view is None:
+            self._view = memoryview(self._data)
+        return self._view
+
+    def __len__(self):
+        return self._len
+
+    # Stream-like interface
+    def tell(self):
+        return self._pos
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Move the cursor.  Unlike a real stream, the position is clamped to
+        the bounds of the buffer."""
+        if   whence == io.SEEK_CUR: offset += self._pos
+        elif whence == io.SEEK_END: offset += self._len
+        self._pos = min(max(offset, 0), self._len)
+        return self._pos
+    def read(self, n=-1):
+        """Read and return up to n bytes (everything left if n < 0)"""
+        start = self._pos
+        stop  = self._len if n is None or n < 0 else min(start+n, self._len)
+        self._pos = stop
+        return bytes(self._data[start:stop])
+    def read_view(self, n):
+        """Like read(), but returns a memoryview into the buffer instead of
+        copying the data out"""
+        start = self._pos
+        stop  = min(start+n, self._len)
+        self._pos = stop
+        return self.view[start:stop]
+    def peek(self, n=1):
+        """Return up to n bytes (at least 1 if available) without advancing"""
+        return bytes(self._data[self._pos:self._pos+max(n, 1)])
+    def readable(self):
+        return True
+    def seekable(self):
+        return True
+    def close(self):
+        """Release our view of the buffer.  The buffer itself belongs to
+        whoever created it."""
+        if self._view is not None and self._view is not self._data:
+            self._view.release()
+        self._view = None
+
+    # Tokenizing
+    def skip_whitespace(self):
+        """Advance the cursor past any whitespace"""
+        self._pos = self.WHITESPACE_RE.match(self._data, self._pos).end()
+
+    def next_token(self, closer=None, disallowed=frozenset()):
+        """Return the next token (as bytes), or b'' if we've hit the end.
+
+        Arguments:
+            closer     - Token ending the current structure (e.g., b'>>' for
+                         dicts).  The current token stops short of it.
+            disallowed - Keywords (e.g. b'R') that should not be treated as
+                         complete tokens in their own right."""
+        data = self._data
+        pos  = self.WHITESPACE_RE.match(data, self._pos).end()
+        if pos >= self._len:
+            self._pos = self._len
+            return b''
+        first = data[pos]
+        if first in self.SINGLES:
+            stop = pos + 1
+        elif first == 0x3C: # '<', which may be the start of '<<'
+            stop = pos + (2 if data[pos+1:pos+2] == b'<' else 1)
+        else:
+            stop = self.REGULAR_RE.match(data, pos+1).end()
+            if first in self.KEYWORD_STARTS:
+                for kwd in self.KEYWORDS:
+                    if data[pos:pos+len(kwd)] == kwd and kwd not in disallowed:
+                        stop = min(stop, pos+len(kwd))
+                        break
+            if closer:
+                stop = self._closer_stop(pos, stop, closer)
+        self._pos = stop
+        return bytes(data[pos:stop])
+
+    def skip_operations(self, operators):
+        """Advance the cursor past any operations at the current position
+        whose operators are in operators, as long as their operands are just
+        numbers and names.  Nothing is tokenized or converted along the way,
+        so this is much faster than parsing them.  Returns the number of
+        operations skipped.
+
+        Arguments:
+            operators - Collection of operators (as bytes) to skip"""
+        pattern = self._skip_pattern(operators)
+        data    = self._data
+        count   = 0
+        match   = pattern.match(data, self._pos)
+        while match and match.end() > self._pos:
+            self._pos = match.end()
+            count    += 1
+            match     = pattern.match(data, self._pos)
+        return count
+
+    @classmethod
+    def _skip_pattern(cls, operators):
+        """Compiled regex matching one operation with one of operators,
+        cached"""
+        operators = frozenset(operators)
+        try:
+            return cls._skip_patterns[operators]
+        except KeyError:
+            pass
+        # Longest first, so e.g. f* isn't taken for f
+        ops = b'|'.join(re.escape(op) for op in
+                        sorted(operators, key=lambda op: (-len(op), op)))
+        ws  = cls._WS
+        pattern = re.compile(ws + b'(?:' + cls._OPERAND + ws + b')*(?:' + ops
+                             + b')' + cls._END + ws)
+        return cls._skip_patterns.setdefault(operators, pattern)
+
+    def _closer_stop(self, pos, stop, closer):
+        """Position at which a token starting at pos has to end on account of
+        closer.  Either the token is the closer itself, or it ends where the
+        closer begins."""
+        clen = len(closer)
+        if self._data[pos:pos+clen] == closer:
+            return min(stop, pos+clen)
+        match = self._pattern(closer).search(self._data, pos+1, stop+clen-1)
+        return match.start() if match else stop
+
+    @classmethod
+    def _pattern(cls, literal):
+        """Compiled regex matching literal, cached"""
+        try:
+            return cls._patterns[literal]
+        except KeyError:
+            return cls._patterns.setdefault(literal,
+                                            re.compile(re.escape(literal)))
+
+    def read_literal_string(self):
+        """Read the body of a literal string, assuming the opening ( has
+        already been consumed.  The closing ) is consumed but not returned,
+        and escape sequences are left as is."""
+        data   = self._data
+        start  = self._pos
+        pos    = start
+        parens = 0
+        match  = self.STRING_RE.search(data, pos)
+        while match:
+            char = data[match.start()]
+            pos  = match.end()
+            if char == 0x5C:    # '\', so skip the escaped character
+                pos += 1
+            elif char == 0x28:  # '('
+                parens += 1
+            elif parens:
+                parens -= 1
+            else:
+                self._pos = pos
+                return bytes(data[start:pos-1])
+            match = self.STRING_RE.search(data, pos)
+        self._pos = self._len
+        raise PdfParseError('Unterminated string literal')
+
+    def read_hex_string(self):
+        """Read the body of a hex string, assuming the opening < has already
+        been consumed.  The closing > is consumed but not returned."""
+        data  = self._data
+        start = self._pos
+        match = self._pattern(b'>').search(data, start)
+        if match:
+            self._pos = match.end()
+            return bytes(data[start:match.start()])
+        # Unterminated.  Just drop the last character, which is what the
+        # closing > would have been.
+        self._pos = self._len
+        return bytes(data[start:self._len-1])
+
+    def read_until(self, chars):
+        """Read until one of the single-byte strings in chars, returning a
+        tuple of the data read and the terminating character, which is
+        consumed.  The terminator will be b'' if we hit the end first."""
+        chars = frozenset(chars)
+        try:
+            pattern = self._patterns[chars]
+        except KeyError:
+            body    = _char_class(c for c in chars if len(c) == 1)
+            pattern = self._patterns.setdefault(chars,
+                                                re.compile(b'['+body+b']'))
+        data  = self._data
+        start = self._pos
+        match = pattern.search(data, start)
+        if match:
+            self._pos = match.end()
+            return bytes(data[start:match.start()]), bytes(data[match.start():
+                                                                match.end()])
+        self._pos = self._len
+        return bytes(data[start:]), b''
+
+    def read_until_marker(self, marker):
+        """Read up to the next occurence of the byte string marker, consuming
+        the marker but not returning it."""
+        data  = self._data
+        start = self._pos
+        match = self._pattern(marker).search(data, start)
+        if not match:
+            self._pos = self._len
+            raise PdfParseError('{} not found'.format(marker))
+        self._pos = match.end()
+        return bytes(data[start:match.start()])
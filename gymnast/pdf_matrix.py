@@ -9,45 +9,89 @@ requiring) numpy for this seemed like massive overkill.
 
 In the interests of compatability, we're not going to rely on Python 3.5's
 matrix multiplication operator, though it does support it.
+
+The renderer makes a new matrix for just about every string it shows, so
+matrices are immutable tuples of (a, b, c, d, e, f).  The helpers for the
+common cases (translate and scale_translate) skip the general 3x3 product.
 """
 
+from operator import itemgetter
+
 __all__ = ['PdfMatrix']
 
-class PdfMatrix(object):
-    """Very limited matrix class representing PDF transformations"""
-    def __init__(self, a, b, c, d, e, f):
+class PdfMatrix(tuple):
+    """Very limited, immutable matrix class representing PDF transformations"""
+    __slots__ = ()
+
+    def __new__(cls, a, b, c, d, e, f):
         """Create a new PdfMatrix object.  Arguments real numbers and represent
         a matrix as described on p. 208 of the Reference:
                                       [ a b 0 ]
         PdfMatrix(a, b, c, d, e, f) = [ c d 0 ]
                                       [ e f 1 ]
         """
-        self.a = float(a)
-        self.b = float(b)
-        self.c = float(c)
-        self.d = float(d)
-        self.e = float(e)
-        self.f = float(f)
+        return tuple.__new__(cls, (float(a), float(b), float(c),
+                                   float(d), float(e), float(f)))
+
+    @classmethod
+    def _make(cls, values):
+        """Make a PdfMatrix from a tuple of six floats without checking them"""
+        return tuple.__new__(cls, values)
+
+    a = property(itemgetter(0))
+    b = property(itemgetter(1))
+    c = property(itemgetter(2))
+    d = property(itemgetter(3))
+    e = property(itemgetter(4))
+    f = property(itemgetter(5))
+
     def transform_coords(self, x, y):
-        return (self.a*x+self.c*y+self.e,
-                self.b*x+self.d*y+self.f)
+        a, b, c, d, e, f = self
+        return (a*x+c*y+e,
+                b*x+d*y+f)
     def __mul__(self, other):
         """Matrix multiplication.
         Given the type constraint below, this will be self*other"""
         if not isinstance(other, PdfMatrix):
             raise TypeError('Can only multiply PdfMatrices by PdfMatrice')
-        return PdfMatrix(self.a*other.a+self.b*other.c,
-                         self.a*other.b+self.b*other.d,
-                         self.c*other.a+self.d*other.c,
-                         self.c*other.b+self.d*other.d,
-                         self.e*other.a+self.f*other.c+other.e,
-                         self.e*other.b+self.f*other.d+other.f)
+        a, b, c, d, e, f       = self
+        oa, ob, oc, od, oe, of = other
+        return tuple.__new__(PdfMatrix, (a*oa+b*oc,   a*ob+b*od,
+                                         c*oa+d*oc,   c*ob+d*od,
+                                         e*oa+f*oc+oe, e*ob+f*od+of))
+    def __rmul__(self, other):
+        # Don't let tuple repeat us
+        return NotImplemented
+    def __add__(self, other):
+        # ...or concatenate us
+        return NotImplemented
+
+    def translate(self, t_x, t_y):
+        """PdfMatrix(1, 0, 0, 1, t_x, t_y)*self, e.g., moving the text matrix
+        along by a string's width"""
+        a, b, c, d, e, f = self
+        return tuple.__new__(PdfMatrix, (a, b, c, d,
+                                         t_x*a + t_y*c + e,
+                                         t_x*b + t_y*d + f))
+    def scale_translate(self, s_x, s_y, t_x, t_y):
+        """PdfMatrix(s_x, 0, 0, s_y, t_x, t_y)*self"""
+        a, b, c, d, e, f = self
+        return tuple.__new__(PdfMatrix, (s_x*a, s_x*b, s_y*c, s_y*d,
+                                         t_x*a + t_y*c + e,
+                                         t_x*b + t_y*d + f))
+
     @property
     def current_coords(self):
         """Current x, y offset in whatever space this matrix represents"""
-        return self.e, self.f
+        return self[4], self[5]
     def copy(self):
-        """Return a copy of this matrix"""
-        return PdfMatrix(self.a, self.b,
-                         self.c, self.d,
-                         self.e, self.f)
+        """PdfMatrices are immutable, so this is just the same matrix"""
+        return self
+    def __copy__(self):
+        return self
+    def __deepcopy__(self, memo):
+        return self
+    def __getnewargs__(self):
+        return tuple(self)
+    def __repr__(self):
+        return 'PdfMatrix({}, {}, {}, {}, {}, {})'.format(*self)
@@ -6,8 +6,9 @@ from ..pdf_operation import PdfOperation
 from ...pdf_matrix   import PdfMatrix
 
 def opcode_cm(renderer, a, b, c, d, e, f):
-    """Set the current transformation matrix (CTM)"""
-    renderer.gs.CTM = PdfMatrix(a, b, c, d, e, f)
+    """Modify the current transformation matrix (CTM) by concatenating the
+    specified matrix (see p. 208)"""
+    renderer.gs.CTM = PdfMatrix(a, b, c, d, e, f)*renderer.gs.CTM
 
 def opcode_q(renderer):
     """Store the current graphics state on top of the stack"""
@@ -44,7 +45,7 @@ def opcode_ri(renderer, intent):
 
 def opcode_i(renderer, flatness):
     """Set the flatness tolerance (see p. 260)"""
-    renderer.gs.intent = flatness
+    renderer.gs.flatness = flatness
 
 #TODO: gs
 
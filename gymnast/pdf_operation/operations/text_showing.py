@@ -1,10 +1,7 @@
 """
 Text Showing operations - Reference p. 407
 """
-import numbers
-
 from ..pdf_operation import PdfOperation
-from ...exc          import PdfError
 
 def opcode_Tj(renderer, string=b''):
     """Show a text string and move the position based on its length"""
@@ -12,13 +9,7 @@ def opcode_Tj(renderer, string=b''):
 
 def opcode_TJ(renderer, args=()):
     """Show one or more strings with individual positioning"""
-    for op in args:
-        if isinstance(op, str):
-            renderer.render_text(op)
-        elif isinstance(op, numbers.Real):
-            renderer.move_text_cursor(op)
-        else:
-            raise PdfError('Invalid TJ operand')
+    renderer.render_text_array(args)
 
 def opcode_tick(renderer, string):
     """Move to the next line and show a text string"""
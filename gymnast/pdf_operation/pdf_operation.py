@@ -5,10 +5,14 @@ PDF Operations base class
 import inspect
 import six
 import warnings
-from ..exc  import PdfOpWarning
-from ..misc import ensure_str, MetaGettable
+from array       import array
+from collections import Counter
 
-__all__ =['PdfOperation']
+from ..exc       import PdfOpWarning
+from ..misc      import ensure_str, MetaGettable
+from ..pdf_types import PdfRaw
+
+__all__ =['PdfOperation', 'ContentProgram']
 
 
 @six.add_metaclass(MetaGettable)
@@ -36,8 +40,49 @@ class PdfOperation(object):
     MARKED_CONTENT         = 16384
     COMPATIBILITY          = 32768
 
-    _opcodes = {}
-    _nops    = {} # As we spawn new NOP classes, we'll cache them here
+    # Everything text extraction needs.  Graphics state saves and restores
+    # (q/Q/cm) are always honored.
+    TEXT_EXTRACTION = TEXT_OBJECTS | TEXT_STATE | TEXT_POSITIONING \
+                    | TEXT_SHOWING | SPECIAL_GRAPHICS_STATE
+
+    # Type of every operator in the Reference (Table A.1, p. 985), whether or
+    # not it's implemented
+    OPERATOR_TYPES = {}
+    for _optype, _ops in (
+            (GENERAL_GRAPHICS_STATE, (b'w', b'J', b'j', b'M', b'd', b'ri',
+                                      b'i', b'gs')),
+            (SPECIAL_GRAPHICS_STATE, (b'q', b'Q', b'cm')),
+            (PATH_CONSTRUCTION,      (b'm', b'l', b'c', b'v', b'y', b'h',
+                                      b're')),
+            (PATH_PAINTING,          (b'S', b's', b'f', b'F', b'f*', b'B',
+                                      b'B*', b'b', b'b*', b'n')),
+            (CLIPPING_PATHS,         (b'W', b'W*')),
+            (TEXT_OBJECTS,           (b'BT', b'ET')),
+            (TEXT_STATE,             (b'Tc', b'Tw', b'Tz', b'TL', b'Tf',
+                                      b'Tr', b'Ts')),
+            (TEXT_POSITIONING,       (b'Td', b'TD', b'Tm', b'T*')),
+            (TEXT_SHOWING,           (b'Tj', b'TJ', b"'", b'"')),
+            (TYPE_3_FONTS,           (b'd0', b'd1')),
+            (COLOR,                  (b'CS', b'cs', b'SC', b'SCN', b'sc',
+                                      b'scn', b'G', b'g', b'RG', b'rg', b'K',
+                                      b'k')),
+            (SHADING_PATTERNS,       (b'sh', )),
+            (INLINE_IMAGES,          (b'BI', b'ID', b'EI')),
+            (XOBJECTS,               (b'Do', )),
+            (MARKED_CONTENT,         (b'MP', b'DP', b'BMC', b'BDC', b'EMC')),
+            (COMPATIBILITY,          (b'BX', b'EX'))):
+        OPERATOR_TYPES.update(dict.fromkeys(_ops, _optype))
+    del _optype, _ops
+
+    _opcodes  = {}
+    _nops     = {} # As we spawn new NOP classes, we'll cache them here
+    _handlers = {} # Operator token: index in _handler_table
+    # (function, operation class) for each operation, indexed by the ids
+    # ContentPrograms use.  Id 0 is shared by every unimplemented operator,
+    # whose NOP operation classes are kept by the programs themselves.
+    _handler_table = [(lambda *x: None, None)]
+    # How many times each unimplemented operator has been looked up
+    unknown_opcodes = Counter()
     @classmethod
     def register(cls, opcode, optype, opfunc):
         """Register a new PDF operation.  Arguments are the opcode, the type of
@@ -50,6 +95,15 @@ class PdfOperation(object):
             raise ValueError('opfunc must take at least one positional argument')
         opcode = ensure_str(opcode)
         cls._opcodes[opcode] = new_opcode(opcode, optype, opfunc)
+        handler = (opfunc, cls._opcodes[opcode])
+        # Re-registering an operation keeps its id, so compiled programs pick
+        # up the new function
+        op_id = cls._handlers.setdefault(opcode.encode(),
+                                         len(cls._handler_table))
+        if op_id == len(cls._handler_table):
+            cls._handler_table.append(handler)
+        else:
+            cls._handler_table[op_id] = handler
 
     @classmethod
     def __getitem__(cls, operator):
@@ -60,9 +114,12 @@ class PdfOperation(object):
             return cls._nop(operator)
     @classmethod
     def _nop(cls, operator):
-        """Get the corresponding NOP operation, creating it if necessary."""
-        warnings.warn("Opcode '{}' not implemented. NOP".format(operator),
-                      PdfOpWarning)
+        """Get the corresponding NOP operation, creating it if necessary.
+        Only warns the first time each operator comes up."""
+        cls.unknown_opcodes[operator] += 1
+        if cls.unknown_opcodes[operator] == 1:
+            warnings.warn("Opcode '{}' not implemented. NOP".format(operator),
+                          PdfOpWarning)
         try:
             return cls._nops[operator]
         except KeyError:
@@ -70,11 +127,135 @@ class PdfOperation(object):
             cls._nops[operator] = tpe
             return tpe
 
+    @classmethod
+    def skipped_operators(cls, mask):
+        """The operators outside of mask (operation types or'd together), which
+        don't need to be parsed at all.  Graphics state saves and restores are
+        never skipped, and neither are inline images, whose data has to be
+        read past."""
+        mask |= cls.SPECIAL_GRAPHICS_STATE | cls.INLINE_IMAGES
+        return frozenset(op for op, optype in cls.OPERATOR_TYPES.items()
+                         if not optype & mask)
+
+    @classmethod
+    def compile(cls, objects, mask=None, nops=False):
+        """Compile a content stream, given as the objects parsed from it, into
+        a ContentProgram.  Operators that aren't implemented would do nothing,
+        so they're counted in the program's unknown and, unless nops is True
+        (e.g., for renderers with _preop or _postop hooks), left out.  NOPs
+        all share handler id 0, with their operation classes in the program's
+        nops.  If mask is given, operations whose types aren't in it are left
+        out too (see skipped_operators)."""
+        handlers = cls._handlers
+        if mask is not None:
+            skipped  = cls.skipped_operators(mask)
+            handlers = {op: op_id for op, op_id in handlers.items()
+                        if op not in skipped}
+        op_ids   = array('H')
+        counts   = array('L')
+        flat     = []
+        unknown  = Counter()
+        nop_ops  = {} # Index in op_ids: NOP operation class
+        nop_classes = {}
+        operands = []
+        for obj in objects:
+            if not isinstance(obj, PdfRaw):
+                operands.append(obj)
+                continue
+            op_id = handlers.get(obj)
+            if op_id is None and (mask is None or obj not in skipped):
+                operator = obj.decode('latin-1')
+                unknown[operator] += 1
+                if nops:
+                    if operator not in nop_classes:
+                        nop_classes[operator] = new_opcode(operator, 0,
+                                                           lambda *x: None)
+                    nop_ops[len(op_ids)] = nop_classes[operator]
+                    op_id = 0
+            if op_id is not None:
+                op_ids.append(op_id)
+                counts.append(len(operands))
+                flat.extend(operands)
+            operands = []
+        return ContentProgram(op_ids, counts, flat, unknown, nop_ops)
+
+class ContentProgram(object):
+    """A compiled content stream: the ids of its operations' handlers, how
+    many operands each takes, and all of the operands in one flat list.  It
+    can be run by any number of renderers without parsing the stream again.
+    Iterating over it gives (function, operands, operation class) tuples."""
+    __slots__ = ('op_ids', 'counts', 'operands', 'unknown', 'nops')
+
+    def __init__(self, op_ids, counts, operands, unknown, nops=None):
+        self.op_ids   = op_ids
+        self.counts   = counts
+        self.operands = operands
+        self.unknown  = unknown
+        self.nops     = nops or {} # Index: operation class of each NOP
+
+    def __len__(self):
+        return len(self.op_ids)
+
+    def __iter__(self):
+        table    = PdfOperation._handler_table
+        operands = self.operands
+        nops     = self.nops
+        pos      = 0
+        for index, (op_id, count) in enumerate(zip(self.op_ids, self.counts)):
+            func, opclass = table[op_id]
+            if opclass is None:
+                opclass = nops[index]
+            yield func, tuple(operands[pos:pos+count]), opclass
+            pos += count
+
+    def run(self, renderer, preop=None, postop=None):
+        """Run the program on renderer, passing each operation to preop and
+        postop first and after if they're given"""
+        table    = PdfOperation._handler_table
+        operands = self.operands
+        pos      = 0
+        if preop is None and postop is None:
+            for op_id, count in zip(self.op_ids, self.counts):
+                if count:
+                    table[op_id][0](renderer, *operands[pos:pos+count])
+                    pos += count
+                else:
+                    table[op_id][0](renderer)
+            return
+        preop  = preop  or (lambda op: None)
+        postop = postop or (lambda op: None)
+        for func, args, opclass in self:
+            op = opclass(*args)
+            preop(op)
+            func(renderer, *args)
+            postop(op)
+
+    def run_many(self, renderers, hooks):
+        """Run the program on several renderers in one pass, each operation
+        going to every renderer before moving on to the next.
+
+        Arguments:
+            renderers - List of renderers
+            hooks     - List of (preop, postop) for each renderer, or None if
+                        it doesn't need them"""
+        plain  = [r for r, h in zip(renderers, hooks) if h is None]
+        hooked = [(r, h[0], h[1]) for r, h in zip(renderers, hooks) if h]
+        for func, args, opclass in self:
+            for renderer in plain:
+                func(renderer, *args)
+            if hooked:
+                op = opclass(*args)
+                for renderer, preop, postop in hooked:
+                    preop(op)
+                    func(renderer, *args)
+                    postop(op)
+
 class PdfBaseOp(object):
     """Base class for all pdf operations"""
     opcode = None
     optype = None
     opfunc = None
+    __slots__ = ('_operands',)
     def __init__(self, *operands):
         self._operands = operands
     def __call__(self, renderer):
@@ -85,5 +266,6 @@ class PdfBaseOp(object):
 
 def new_opcode(opcode, optype, opfunc):
     """Create a new PDF operation based on the arguments"""
-    class_data = {'opcode': opcode, 'optype':optype, 'opfunc':opfunc}
+    class_data = {'opcode': opcode, 'optype':optype, 'opfunc':opfunc,
+                  '__slots__': ()}
     return type(opcode, (PdfBaseOp, ), class_data)
@@ -2,20 +2,24 @@
 PDF Parser object
 """
 
-import io
 from .exc           import PdfParseError
 from .pdf_types     import PdfRaw, PdfRawData, PdfDict, PdfObjectReference,\
                            PdfLiteralString, PdfHexString, PdfComment, \
                            PdfIndirectObject, PdfArray, PdfName, PdfStream
-from .misc          import BlackHole, buffer_data, consume_whitespace
-from .pdf_constants import EOLS, WHITESPACE
+from .pdf_lexer     import PdfLexer
+from .misc          import BlackHole
+from .pdf_constants import EOLS, WHITESPACE, DELIMITERS
 
 __all__ = ['PdfParser']
 
 class PdfParser(object):
     """Parser for PDF files.  Takes raw PDF data and turns it into PDF _types_,
-    which can then be assembled into a document and document elements."""
-    DELIMITERS = set([b'/', b'<', b'(', b'{', b'[', b'%'])
+    which can then be assembled into a document and document elements.
+
+    All of the parsing methods accept bytes or a readable stream, but work on
+    a PdfLexer, so pass one in (e.g., PdfLexer(data)) if you want to keep track
+    of the position between calls."""
+    DELIMITERS = DELIMITERS
     ENDERS     = WHITESPACE.union(DELIMITERS)
 
     def __init__(self, document=None):
@@ -34,25 +38,38 @@ class PdfParser(object):
 
         This method should only be used in places where an indirect object
         reference is not valid."""
+        lexer = PdfLexer.wrap(data)
         if position is not None:
-            data.seek(position)
-        token = self._get_next_token(data)
-        return self._process_token(data, token, None)
+            lexer.seek(position)
+        token = self._get_next_token(lexer)
+        obj   = self._process_token(lexer, token, None)
+        self._sync_position(data, lexer)
+        return obj
 
     def parse_indirect_object(self, data, position=None):
         """Parse and return the indirect object described in the first argument
         located at either current stream position or the position specified by
         the optional argument.  The stream's position will be left at the end of the object."""
+        lexer = PdfLexer.wrap(data)
         if position is not None:
-            data.seek(position)
-        obj_no  = self._process_token(data, self._get_next_token(data), None)
-        obj_gen = self._process_token(data, self._get_next_token(data), None)
+            lexer.seek(position)
+        obj_no  = self._process_token(lexer, self._get_next_token(lexer), None)
+        obj_gen = self._process_token(lexer, self._get_next_token(lexer), None)
         if not isinstance(obj_no, int) or not isinstance(obj_gen, int):
             raise PdfParseError('Object identification not found')
-        token   =  self._get_next_token(data)
+        token   =  self._get_next_token(lexer)
         if token != b'obj':
             raise PdfParseError("Expected 'obj', got '{}'".format(token))
-        return self.parse_ind_object(data, [obj_no, obj_gen])
+        obj = self.parse_ind_object(lexer, [obj_no, obj_gen])
+        self._sync_position(data, lexer)
+        return obj
+
+    @staticmethod
+    def _sync_position(data, lexer):
+        """If we had to wrap a stream in a lexer, move the stream to where
+        the lexer left off"""
+        if data is not lexer and hasattr(data, 'seek'):
+            data.seek(lexer.tell())
 
     def _get_objects(self, data, closer=None):
         """Get all of the objects in data starting from the current position
@@ -72,13 +89,16 @@ class PdfParser(object):
 
     def parse_list(self, data, allow_invalid=False, disallowed=frozenset()):
         """Parse the data and return a list"""
-        data = buffer_data(data)
+        data = PdfLexer.wrap(data)
         return [i for i in self.iterparse(data, allow_invalid, disallowed)]
 
     def iterparse(self, data, allow_invalid=True,
-                  disallowed=frozenset({b'R', b'obj', b'stream'})):
-        """Generator-parser primarily for use in content streams."""
-        data = buffer_data(data)
+                  disallowed=frozenset({b'R', b'obj', b'stream'}), skip=None):
+        """Generator-parser primarily for use in content streams.  If skip is
+        given, it's a collection of operators whose operations are passed over
+        without being parsed (see PdfLexer.skip_operations()).  Operations
+        with operands other than numbers and names are still parsed."""
+        data = PdfLexer.wrap(data)
         while data.peek(1):
             token = self._get_next_token(data, disallowed=disallowed)
             if not token: continue
@@ -88,6 +108,10 @@ class PdfParser(object):
             if isinstance(element, PdfRaw) and element == b'BI':
                 for i in self._parse_inline_image(data, disallowed):
                     yield i
+            if skip and isinstance(element, PdfRaw):
+                # Only right after an operator, since the operands before
+                # one could be in the previous stream of the page
+                data.skip_operations(skip)
 
     def _parse_inline_image(self, data, disallowed):
         """Special method for handling inline images in content streams because
@@ -102,62 +126,15 @@ class PdfParser(object):
             attrs.append(self._process_token(data,token,BlackHole, True))
         yield PdfDict({attrs[i]:attrs[i+1] for i in range(0,len(attrs)-1,2)})
         data.read(1)
-        img = io.BytesIO()
-        buf = bytes(2)
-        while buf != b'EI':
-            buf = buf[1:]+data.read(1)
-            img.write(buf[1:])
-        yield PdfRawData(img.getvalue()[:-2]) # This is such an ugly hack
+        yield PdfRawData(data.read_until_marker(b'EI'))
         yield PdfRaw(b'EI')
 
     @staticmethod
-    def _peek(data, n=1):
-        """Peek ahead, returning the requested number of characters.  If peek()
-        doesn't yield enough data, read and backup."""
-        if n <= 0: return b''
-        res = data.peek(n)[:n]
-        if len(res) == n:
-            return res
-        res += data.read(n-len(res))
-        data.seek(-len(res), 1)
-        return res
-
-    @classmethod
-    def _get_next_token(cls, data, closer=None, disallowed=frozenset()):
+    def _get_next_token(data, closer=None, disallowed=frozenset()):
         """Get the next token in the stream, data.  Closer is an optional
         argument specifying the ending token of the current data structure,
         e.g., >> for dicts."""
-        clen  = len(closer) if closer is not None else None
-        token = io.BytesIO()
-        consume_whitespace(data, WHITESPACE)
-
-        while data.peek(1) and (token.getvalue() != closer) \
-           and not cls._is_token(data, token.getvalue(),
-                                 closer, clen, disallowed):
-            token.write(data.read(1))
-        return token.getvalue()
-
-    @classmethod
-    def _is_token(cls, data, value, closer=None, clen=None,
-                  disallowed=frozenset()):
-        """Is this a token?"""
-        if closer and not clen:
-            clen = len(closer)
-
-        if   not data.peek(1): return True
-        elif not value:        return False
-
-        next_char = cls._peek(data, 1)
-        not_obj   = (value+next_char) not in cls.obj_types
-
-        if value in cls.obj_types and not_obj and value not in disallowed:
-            return True
-        elif closer and cls._peek(data, clen) == closer \
-            and value+cls._peek(data, clen-len(value)) != closer: #Last clause covers an issue with
-            return True                                       #a dict as the last element of a dict
-        elif next_char in cls.ENDERS and not_obj:
-            return True
-        return False
+        return data.next_token(closer, disallowed)
 
     def _process_token(self, data, token, objects, allow_invalid=False):
         """Process the data at the current position in the stream data into the
@@ -192,32 +169,12 @@ class PdfParser(object):
 
     def parse_hex_string(self, data, objects):
         """Extract a PdfHexString from raw data"""
-        token = io.BytesIO(data.read(1))
-        token.seek(0, 2)
-        while data.peek(1) and token.getvalue()[-1:] != b'>':
-            token.write(data.read(1))
-        return PdfHexString(token.getvalue()[:-1])
+        return PdfHexString(data.read_hex_string())
 
     def parse_literal_string(self, data, objects):
         """Extract a PdfLiteralString from raw data"""
-        token   = io.BytesIO()
-        parens  = 0
-        escaped = False
-        while data.peek(1):
-            b = data.read(1)
-            if  escaped:
-                escaped = False
-            elif b == b'\\':
-                escaped = True
-            elif b == b'(':
-                parens += 1
-            elif b == b')':
-                if parens == 0:
-                    return PdfLiteralString(token.getvalue())
-                else:
-                    parens -= 1
-            token.write(b)
-        raise PdfParseError('Unterminated string literal')
+        return PdfLiteralString(data.read_literal_string())
+
     def parse_array(self, data, objects, closer=b']'):
         """Extract a PdfArray from the data stream"""
         elems = self._get_objects(data, closer)
@@ -225,13 +182,9 @@ class PdfParser(object):
 
     def parse_comment(self, data, objects):
         """Extract a PdfComment from the data stream"""
-        token = io.BytesIO()
-        while data.peek(1):
-            b = data.read(1)
-            if b in EOLS: break
-            token.write(b)
-        else:
-            return PdfComment(token.getvalue())
+        token, eol = data.read_until(EOLS)
+        if not eol:
+            return PdfComment(token)
 
     def parse_expression(self, data, objects):
         """TODO: This"""
@@ -253,7 +206,10 @@ class PdfParser(object):
             lngth = lngth.value
         if data.peek(1)[:1] == b'\r': data.read(1)
         if data.peek(1)[:1] == b'\n': data.read(1)
-        s_data = data.read(lngth)
+        # Just keep a view of the body.  It'll get read if and when someone
+        # actually wants it, and the view keeps the buffer from being closed
+        # out from under us (see PdfDocument.close()).
+        body = data.read_view(lngth)
         # Long peeks are not guaranteed to work, so we're going to do this
         # hackish read/seek for now
         close = data.read(11)
@@ -265,7 +221,7 @@ class PdfParser(object):
             data.seek(-2, 1)
         else:
             raise PdfParseError('endstream not found')
-        return PdfStream(header, s_data)
+        return PdfStream(header, body, 0, lngth)
 
     @staticmethod
     def parse_literal(token):
@@ -35,7 +35,6 @@ class PdfIndirectObject(PdfType):
                      #'XObject'       : PdfXObject,   #TODO
                      'FontDescriptor': pdf_elements.FontDescriptor,
                      'Encoding'      : pdf_elements.FontEncoding,
-                     #'ObjStm'        : ObjectStream, #TODO
                      #'XRef'          : XRef
                      'Catalog'       : pdf_elements.PdfCatalog
                     }
@@ -45,7 +44,8 @@ class PdfIndirectObject(PdfType):
         if isinstance(val, PdfDict):
             try:
                 self._parsed_obj = obj_types[val['Type']]\
-                                          .from_object(val, self.object_key)
+                                          .from_object(val, self.object_key,
+                                                       self._document)
                 return self._parsed_obj
             except KeyError:
                 return val
@@ -64,6 +64,9 @@ class PdfObjectReference(PdfType):
           or self._object_number <= 0 or self._generation < 0:
             raise ValueError('Invalid indirect object identifier')
 
+    @property
+    def object_key(self):
+        return (self._object_number, self._generation)
     def get_object(self, document=None):
         if not document and not self._document:
             raise PdfError('Evaluating indirect references requires a document')
@@ -2,36 +2,42 @@
 PDF stream objects - Reference p. 60
 """
 
-from functools import partial, reduce
+from collections.abc import Mapping
+from functools       import partial, reduce
 
 from .common   import PdfType
 from ..filters import StreamFilter
 from ..misc    import ensure_list
 
 class PdfStream(PdfType):
-    """PDF stream type"""
-    def __init__(self, header, data):
+    """PDF stream type.  The body can either be handed over directly or left
+    where it is in its source buffer and read the first time it's needed."""
+    def __init__(self, header, data, offset=None, length=None):
+        """Create a new stream.
+
+        Arguments:
+            header - The stream dictionary
+            data   - The stream's (still encoded) body or, if offset is given,
+                     the buffer or seekable binary stream it lives in
+            offset - Optional position of the body in data
+            length - Length of the body if offset is given (default
+                     header['Length'])"""
         super(PdfStream, self).__init__()
         self._header  = header
         self._objects = None
-
+        if offset is None:
+            self._data   = data
+            self._source = None
+        else:
+            self._data   = None
+            self._source = data
+            self._offset = offset
+            self._length = header['Length'] if length is None else length
         # This is obnoxious, but the PDF standard allows the stream header to
         # to specify another file with the data, ignoring the stream data.
         # Also, for some reason, some header keys change when that happens.
-        try:
-            with open(header['F'], 'rb') as f:
-                data = f.read()
-        except KeyError:
-            self._data     = data
-            self._filedata = False
-        else:
-            self._filedata = True
-
-        if self._filter_key in header:
-            self._decoded  = False
-        else:
-            self._decoded  = True
-            self._decoded_data = self._data
+        self._filedata = 'F' in header
+        self._decoded  = False
     @property
     def header(self):
         """Stream header"""
@@ -43,11 +49,8 @@ class PdfStream(PdfType):
     def _params_key(self):
         return 'FDecodeParms' if self._filedata else 'DecodeParms'
 
-    def decode(self):
-        """Decode the data in the stream by sequentially applying the
-        filters with their parameters"""
-        if self._decoded:
-            return self._decoded_data
+    def _filters(self):
+        """List of the stream's (filter name, decode parameters)"""
         # Need to use self._filter_key because, for some reason beyond my
         # grasp, the key changes when the stream data is external
         # Also, since these may be lists, let's make that happen
@@ -55,15 +58,86 @@ class PdfStream(PdfType):
         params  = ensure_list(self._header.get(self._params_key, []))
         if not params:
             params = [{} for f in filters]
+        # Filters without parameters get null in the DecodeParms array
+        return [(f, p if isinstance(p, Mapping) else {})
+                for f, p in zip(filters, params)]
+
+    def decode(self, cache=True):
+        """Decode the data in the stream by sequentially applying the
+        filters with their parameters.  Unless cache is False, the result is
+        kept for next time."""
+        if self._decoded:
+            return self._decoded_data
         composed_filters = chain_funcs((partial(StreamFilter[f].decode, **p)
-                                        for f, p in zip(filters, params)))
-        decoded_data = composed_filters(self._data)
-        self._decoded      = True
-        self._decoded_data = decoded_data
-        return self._decoded_data
+                                        for f, p in self._filters()))
+        # Unfiltered streams come back as they went in, which may be a view
+        decoded_data = bytes(composed_filters(self.raw_data))
+        if cache:
+            self._decoded      = True
+            self._decoded_data = decoded_data
+        return decoded_data
+    def iter_decode(self, chunk_size=None):
+        """Decode the data in the stream a chunk at a time, yielding the
+        decoded data in chunks, so that the whole stream never has to be in
+        memory at once (e.g., to read through a very large stream).  Filters
+        that can't be decoded in chunks are still decoded all at once.  The
+        result isn't cached.
+
+        Arguments:
+            chunk_size - Approximate size of the chunks to read (default
+                         StreamFilter.CHUNK_SIZE)"""
+        chunk_size = chunk_size or StreamFilter.CHUNK_SIZE
+        if self._decoded:
+            data = memoryview(self._decoded_data)
+            for i in range(0, len(data), chunk_size):
+                yield bytes(data[i:i+chunk_size])
+            return
+        chunks = self._iter_raw_data(chunk_size)
+        for f, p in self._filters():
+            chunks = StreamFilter[f].iter_decode(chunks, **p)
+        for chunk in chunks:
+            if chunk:
+                yield bytes(chunk)
     @property
     def data(self):
         return self.decode()
+    @property
+    def nbytes(self):
+        """Amount of stream data held in memory (or at least referenced)"""
+        size = len(self._data) if self._data is not None else 0
+        if self._decoded:
+            size += len(self._decoded_data)
+        return size
+    @property
+    def raw_data(self):
+        """The stream's body before any filters have been applied.  Deferred
+        bodies are read fresh each time rather than kept around."""
+        if self._filedata:
+            with open(self._header['F'], 'rb') as f:
+                return f.read()
+        elif self._source is None:
+            return self._data
+        elif hasattr(self._source, 'read'):
+            self._source.seek(self._offset)
+            return self._source.read(self._length)
+        else:
+            return memoryview(self._source)[self._offset:
+                                            self._offset+self._length]
+    def _iter_raw_data(self, chunk_size):
+        """raw_data in chunks of (at most) chunk_size bytes"""
+        if self._filedata:
+            with open(self._header['F'], 'rb') as f:
+                for chunk in iter(lambda: f.read(chunk_size), b''):
+                    yield chunk
+        elif self._source is not None and hasattr(self._source, 'read'):
+            for start in range(0, self._length, chunk_size):
+                self._source.seek(self._offset + start)
+                yield self._source.read(min(chunk_size, self._length - start))
+        else:
+            data = self.raw_data
+            data = data if isinstance(data, memoryview) else memoryview(data)
+            for start in range(0, len(data), chunk_size):
+                yield data[start:start+chunk_size]
 
 def chain_funcs(funcs):
     """Compose the functions in iterable funcs"""
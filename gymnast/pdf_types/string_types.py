@@ -4,7 +4,7 @@ PDF string-like objects
 
 import binascii
 import codecs
-import io
+import re
 
 from .common     import PdfType
 from ..exc       import PdfParseError, PdfError
@@ -41,24 +41,27 @@ class PdfString(PdfType):
 class PdfLiteralString(str, PdfString):
     """PDF Literal strings"""
     def __new__(cls, data):
+        parsed = cls.parse_bytes(data)
         try:
-            string = cls._decode_bytes(cls.parse_bytes(data))
+            string = cls._decode_bytes(parsed)
         except UnicodeDecodeError:
-            string = codecs.encode(cls.parse_bytes(data), 'hex_codec').decode()
+            string = codecs.encode(parsed, 'hex_codec').decode()
         obj = str.__new__(cls, string)
-        obj.__init__(data)
+        # Same as PdfString.__init__, but without parsing it all over again
+        obj.raw_bytes     = data
+        obj._parsed_bytes = parsed
         return obj
 
     def __init__(self, data):
-        PdfString.__init__(self, data)
-        str.__init__(self)
+        # Everything was taken care of in __new__
+        pass
 
     @staticmethod
     def _decode_bytes(data):
         """Detect the encoding method and return the decoded string"""
         # Are we UTF-16BE?  Good.
-        if data[:2] == '\xFE\xFF':
-            return data.decode('utf_16_be')
+        if data[:2] == b'\xFE\xFF':
+            return data[2:].decode('utf_16_be')
         # If the string isn't UTF-16BE, it follows PDF standard encoding
         # described in Appendix D of the reference.
         return data.decode('pdf_doc')
@@ -70,11 +73,17 @@ class PdfLiteralString(str, PdfString):
                b'f'   : b'\f',
                b'('   : b'(',
                b')'   : b')',
+               b'\\'  : b'\\',
                b'\n'  : b'',
-               b'\r'  : b''}
+               b'\r'  : b'',
+               b'\r\n': b''}
+
+    # A backslash and either a line end, an octal code of length at most 3,
+    # or a single character (or nothing, if it's at the very end)
+    ESCAPE_RE = re.compile(br'\\(\r\n|[0-7]{1,3}|.|$)', re.S)
 
     @staticmethod
-    def _parse_escape(data):
+    def _parse_escape(match):
         r"""Handle escape sequences in literal PDF strings.  This should be
         pretty straightforward except that there are line continuations, so
         \\n, \\r\n, and \\r are ignored. Moreover, actual newline characters
@@ -82,45 +91,25 @@ class PdfLiteralString(str, PdfString):
         you want to be annoyed.
 
         Arguments:
-            data - io.BytesIO-like object
+            match - ESCAPE_RE match object
 
         Returns the unescaped bytes"""
-        e_str = data.read(1)
+        e_str = match.group(1)
         try:
-            val = PdfLiteralString.ESCAPES[e_str]
+            return PdfLiteralString.ESCAPES[e_str]
         except KeyError:
-            # Not a normal escape, hopefully it's an octal
-            if not e_str.isdigit():
-                print(e_str)
-                raise PdfParseError('Invalid escape sequence in literal string')
-        else:
-            # Handle \\r\n by skipping the next character
-            if e_str == b'\r' and data.peek(1)[:1] == b'\n':
-                data.seek(1,1)
-            return val
-        # If it's not one of the above, it must be an octal of
-        # length at most 3
-        for i in range(2):
-            e_str += data.read(1)
-            if not e_str.isdigit():
-                data.seek(-1, 1)
-                return bytes((min(int(e_str[:-1], 8),255),))
-        return bytes((min(int(e_str, 8),255),))
+            pass
+        if not e_str.isdigit():
+            raise PdfParseError('Invalid escape sequence in literal string')
+        return bytes((min(int(e_str, 8), 255),))
 
     @staticmethod
     def parse_bytes(data):
         """Extract a PDF escaped string into a nice python bytes object."""
-
-        iodata  = io.BufferedReader(io.BytesIO(data))
-        result  = io.BytesIO()
-        char = iodata.read(1)
-        while char:
-            if char == b'\\':
-                result.write(PdfLiteralString._parse_escape(iodata))
-            else:
-                result.write(char)
-            char = iodata.read(1)
-        return bytes(result.getvalue())
+        if b'\\' not in data:
+            return bytes(data)
+        return PdfLiteralString.ESCAPE_RE.sub(PdfLiteralString._parse_escape,
+                                              data)
 
 class PdfHexString(PdfString):
     """Hex strings, mostly used for ID values"""
@@ -131,7 +120,8 @@ class PdfHexString(PdfString):
         return '0x'+binascii.hexlify(self._parsed_bytes).decode()
     @staticmethod
     def parse_bytes(token):
-        hstr = token.decode()
+        # Whitespace is allowed anywhere in hex strings
+        hstr = ''.join(token.decode().split())
         if len(hstr) % 2:
             hstr += '0'
         return codecs.decode(hstr, 'hex_codec')
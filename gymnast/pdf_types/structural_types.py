@@ -13,13 +13,18 @@ class PdfXref(PdfType):
     file, indicating where in the file each object is located."""
     LINE_PAT = re.compile(r'^(\d{10}) (\d{5}) (n|f)\s{0,2}$')
 
-    def __init__(self, document, obj_no, offset, generation, in_use):
+    def __init__(self, document, obj_no, offset, generation, in_use,
+                 stream_index=None):
+        """Create a new xref.  For objects stored in object streams, offset
+        is the object stream's object number and stream_index is the object's
+        index within it."""
         super(PdfXref, self).__init__()
-        self._obj_no     = obj_no
-        self._offset     = offset
-        self._generation = generation
-        self._in_use     = in_use
-        self._document   = document
+        self._obj_no       = obj_no
+        self._offset       = offset
+        self._generation   = generation
+        self._in_use       = in_use
+        self._document     = document
+        self._stream_index = stream_index
     @property
     def key(self):
         return (self._obj_no, self._generation)
@@ -36,8 +41,14 @@ class PdfXref(PdfType):
             try:
                 return objs[self.key]
             except KeyError:
-                self._document.parse_object(self._offset)
-                return objs[self.key]
+                pass
+            # Not parsed yet (or dropped from the cache since)
+            if self._stream_index is None:
+                return self._document.parse_object(self._offset)
+            else:
+                return self._document.parse_stream_object(self._offset,
+                                                          self._stream_index,
+                                                          self._obj_no)
         else:
             return None # TODO: implement free Xrefs
     def pdf_encode(self):
@@ -5,10 +5,11 @@ These render a PdfPage object into some other format, for example by extracting
 text.
 """
 
-from .base_renderer   import PdfBaseRenderer
+from .base_renderer   import PdfBaseRenderer, render_many
 from .simple_renderer import PdfSimpleRenderer
 from .text_renderer   import PdfTextRenderer
+from .fast_renderer   import PdfFastRenderer
 from .renderer_states import TextState, GraphicsState
 
 __all__ = ['PdfBaseRenderer', 'PdfSimpleRenderer', 'PdfTextRenderer',
-           'TextState', 'GraphicsState',]
+           'PdfFastRenderer', 'TextState', 'GraphicsState', 'render_many']
@@ -3,15 +3,22 @@ Base page renderer class
 """
 
 from .renderer_states import TextState, GraphicsState
-from ..pdf_matrix    import PdfMatrix
+from ..exc            import PdfError
+from ..misc           import get_numpy
+from ..pdf_matrix     import PdfMatrix
+from ..pdf_types      import PdfString
 
-import copy
 import io
+import numbers
+import operator
+from functools import reduce
 
 
 #Nonsense to make PTVS happy
 
 
+__all__ = ['PdfBaseRenderer', 'render_many']
+
 class PdfBaseRenderer(object):
     """PdfRenderer object.  PdfOperations act on this to produce a
     representation of the contents of the pdf document.  This class primarily
@@ -22,6 +29,16 @@ class PdfBaseRenderer(object):
 
     TODO: Vertical writing support
     TODO: Figure out graphics stuff"""
+    # TJ arrays at least this long have their glyph origins computed with
+    # numpy, if it's installed
+    BATCH_TJ_LENGTH = 64
+    # Types of the operations the renderer needs (PdfOperation type constants
+    # or'd together).  The rest aren't parsed at all.  None means everything.
+    # Subclasses inherit it, so one that handles other operations (e.g., gs,
+    # re, or Do) should set its own.  Hooks set on a renderer, or overriding
+    # _preop or _postop without setting it, get every operation (see
+    # _optype_mask).
+    OPTYPE_MASK = None
 
     def __init__(self, page):
         self.ts      = TextState()     # Text state
@@ -33,7 +50,8 @@ class PdfBaseRenderer(object):
         self._raw_glyphs = io.StringIO()
 
     def _preop(self, op):
-        """Method called before each operation is executed.
+        """Method called before each operation is executed, including NOPs
+        for operators that aren't implemented.
         TODO: Decide if I really want to keep these names."""
         pass
     def _postop(self, op):
@@ -41,8 +59,9 @@ class PdfBaseRenderer(object):
         pass
     def _render_text(self, text, new_state):
         """Method called when a new text string is written. Arguments are the
-        string to be written and the rendering matrix that would result based
-        on the glyph widths."""
+        string to be written (already decoded to unicode with the active
+        font) and the text matrix that would result based on the glyph
+        widths."""
         pass
     def _move_text_cursor(self, newT_m):
         """Called before a TJ operand moves the next cursor.  Arugment is the
@@ -59,12 +78,37 @@ class PdfBaseRenderer(object):
     def render(self, *args, **kwargs):
         """Render the page"""
         self._pre_render(*args, **kwargs)
-        for op in self._page.Contents.operations:
-            self._preop(op)
-            op(self)
-            self._postop(op)
+        # Hooks see every operation, so unimplemented ones are kept as NOPs
+        hooks   = self._has_hooks()
+        program = self._page.Contents.get_program(self._optype_mask(), hooks)
+        if hooks:
+            program.run(self, self._preop, self._postop)
+        else:
+            program.run(self)
         return self._return()
 
+    def _has_hooks(self):
+        """Whether _preop or _postop have been overridden, so the operations
+        need to be passed to them"""
+        return any(getattr(getattr(self, name), '__func__', None)
+                   is not getattr(PdfBaseRenderer, name)
+                   for name in ('_preop', '_postop'))
+
+    def _optype_mask(self):
+        """The OPTYPE_MASK to render with.  It's None (everything) if _preop
+        or _postop were set on the renderer itself or overridden by a
+        subclass of the class that set it, since the hooks may well want the
+        operations it leaves out."""
+        if '_preop' in vars(self) or '_postop' in vars(self):
+            return None
+        mro = type(self).__mro__
+        def defined_at(name):
+            return next(i for i, cls in enumerate(mro) if name in vars(cls))
+        mask_at = defined_at('OPTYPE_MASK')
+        if any(defined_at(name) < mask_at for name in ('_preop', '_postop')):
+            return None
+        return self.OPTYPE_MASK
+
     def bytes_to_glyphs(self, string):
         """Converts a bytestring into a series of glyphs based upon the active
         font's encoding"""
@@ -80,8 +124,10 @@ class PdfBaseRenderer(object):
         return self.ts.m.current_coords
 
     def push_state(self):
-        """Push the current graphics state onto the stack"""
-        self._state_stack.append(copy.deepcopy(self.gs))
+        """Push the current graphics state onto the stack.  The new current
+        state shares everything with the saved one until it's changed."""
+        self._state_stack.append(self.gs)
+        self.gs = self.gs.derive()
     def pop_state(self):
         """Pop the last graphics state off the stack"""
         self.gs = self._state_stack.pop()
@@ -94,9 +140,7 @@ class PdfBaseRenderer(object):
             m = ts.m
         if not CTM:
             CTM = self.gs.CTM
-        return PdfMatrix(ts.fs*ts.h,    0,
-                                0,    ts.fs,
-                                0,   ts.rise)*m*CTM
+        return m.scale_translate(ts.fs*ts.h, ts.fs, 0.0, ts.rise)*CTM
 
     def _get_glyph_width(self, glyph):
         """Get the glyph's width in _text_ space.
@@ -122,14 +166,10 @@ class PdfBaseRenderer(object):
         updates T_m.  See pp.409-10.
 
         TODO: Vertical writing"""
-        # This shortcut works.  Check the math.
-        ts = self.ts
-        widths = (self._get_glyph_width(glyph)*ts.fs + self._extra_space(glyph)
-                  for glyph in string)
-        t_x = sum(widths) * ts.h
-        t_y = 0.0 # <--- TODO: Vertical writing mode
-        T_m = PdfMatrix(1, 0, 0, 1, t_x, t_y) * ts.m
-        self._render_text(string, T_m)
+        font  = self.active_font
+        codes = font.string_codes(string)
+        T_m   = self.ts.m.translate(self._text_displacement(font, codes), 0.0)
+        self._render_text(font.decode_codes(codes), T_m)
         self.ts.m = T_m
 
     def move_text_cursor(self, t, last_glyph=b''):
@@ -137,7 +177,77 @@ class PdfBaseRenderer(object):
         in TJ operations (see Reference pp. 408-410"""
         ts  = self.ts
         t_x = -t/1000.0 * ts.fs * ts.h
-        t_y = 0.0 # <--- TODO: Vertical writing mode
-        T_m = PdfMatrix(1, 0, 0, 1, t_x, t_y)*ts.m
+        T_m = ts.m.translate(t_x, 0.0) # <--- TODO: Vertical writing mode
         self._move_text_cursor(T_m)
         self.ts.m = T_m
+
+    def render_text_array(self, args):
+        """Show the strings in a TJ array, moving the cursor by the numbers
+        between them.  Every move is along the x axis of text space, so when
+        numpy's available and the array is long, all of the new text
+        matrices are computed in one go from the running total of the
+        displacements."""
+        ts, font = self.ts, self.active_font
+        items    = []
+        for op in args:
+            if isinstance(op, (PdfString, str, bytes)):
+                codes = font.string_codes(op)
+                items.append((codes, self._text_displacement(font, codes)))
+            elif isinstance(op, numbers.Real):
+                items.append((None, -op/1000.0 * ts.fs * ts.h))
+            else:
+                raise PdfError('Invalid TJ operand')
+        numpy = get_numpy() if len(items) >= self.BATCH_TJ_LENGTH else None
+        if numpy is None:
+            for codes, t_x in items:
+                T_m = ts.m.translate(t_x, 0.0)
+                if codes is None:
+                    self._move_text_cursor(T_m)
+                else:
+                    self._render_text(font.decode_codes(codes), T_m)
+                ts.m = T_m
+            return
+        a, b, c, d, e, f = ts.m
+        offsets = numpy.cumsum([t_x for _, t_x in items])
+        for (codes, _), e_i, f_i in zip(items, (offsets*a + e).tolist(),
+                                        (offsets*b + f).tolist()):
+            T_m = PdfMatrix._make((a, b, c, d, e_i, f_i))
+            if codes is None:
+                self._move_text_cursor(T_m)
+            else:
+                self._render_text(font.decode_codes(codes), T_m)
+            ts.m = T_m
+
+    def _text_displacement(self, font, codes):
+        """How far showing the character codes moves the text cursor, in
+        unscaled text space units"""
+        # Since the conversion from glyph space is linear, we can add up the
+        # widths first and then add T_c for every glyph and T_w for every
+        # space: t_x = ((w0*T_fs + T_c + T_w) * T_h, summed over the glyphs
+        ts = self.ts
+        count, spaces = font.code_counts(codes)
+        width = font.text_space_coords(font.string_width(codes), 0)[0]
+        return (width*ts.fs + ts.c*count + ts.w*spaces) * ts.h
+
+def render_many(page, renderers):
+    """Render a page with several renderers at once, e.g., to get both the raw
+    and laid out text.  The content stream is only walked once, with each
+    operation going to every renderer in turn.
+
+    Arguments:
+        page      - The PdfPage to render
+        renderers - List of PdfBaseRenderer subclasses, which are created with
+                    just the page, or renderers already created for the page
+                    (e.g., with other arguments)
+
+    Returns a list of the results of each renderer, in the same order."""
+    renderers = [r(page) if isinstance(r, type) else r for r in renderers]
+    for renderer in renderers:
+        renderer._pre_render()
+    hooks = [(r._preop, r._postop) if r._has_hooks() else None
+             for r in renderers]
+    masks = [r._optype_mask() for r in renderers]
+    mask  = None if None in masks else reduce(operator.or_, masks, 0)
+    nops  = any(hooks)
+    page.Contents.get_program(mask, nops).run_many(renderers, hooks)
+    return [renderer._return() for renderer in renderers]
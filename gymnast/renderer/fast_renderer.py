@@ -0,0 +1,63 @@
+"""
+Fast renderer that just extracts the text in content stream order, for when
+all that's needed is the text itself (e.g., for search indexing).
+
+PdfSimpleRenderer gives the same output, but it goes through
+PdfBaseRenderer.render_text like every other renderer, computing the glyph
+widths and a new text matrix for each string only to throw them away.  This
+one skips the geometry altogether: only the text state operations are run
+(so Tf picks the font) and each string is decoded straight from the font's
+translation table.
+"""
+
+import io
+import numbers
+
+from .base_renderer  import PdfBaseRenderer
+from ..exc           import PdfError
+from ..pdf_operation import PdfOperation
+from ..pdf_types     import PdfString
+
+__all__ = ['PdfFastRenderer']
+
+class PdfFastRenderer(PdfBaseRenderer):
+    """Geometry-free renderer that collects the text in stream order.  Its
+    output is the same as PdfSimpleRenderer's."""
+    OPTYPE_MASK = PdfOperation.TEXT_STATE | PdfOperation.TEXT_SHOWING
+
+    def __init__(self, page):
+        super(PdfFastRenderer, self).__init__(page)
+        self._text     = io.StringIO()
+        self._decoders = {}
+
+    def _decoder(self):
+        """Function decoding a string shown in the active font to unicode.
+        Simple fonts do it with their charmap (see PdfBaseFont.charmap)."""
+        try:
+            return self._decoders[self.ts.f]
+        except KeyError:
+            return self._decoders.setdefault(self.ts.f,
+                                             self.active_font.decode_string)
+
+    def render_text(self, string):
+        """Write the decoded string to the text output"""
+        self._text.write(self._decoder()(string))
+
+    def render_text_array(self, args):
+        """Write the strings in a TJ array to the text output.  The positioning
+        adjustments between them don't matter here."""
+        decode = self._decoder()
+        write  = self._text.write
+        for op in args:
+            if isinstance(op, (PdfString, str, bytes)):
+                write(decode(op))
+            elif not isinstance(op, numbers.Real):
+                raise PdfError('Invalid TJ operand')
+
+    def move_text_cursor(self, t, last_glyph=b''):
+        """Nothing to do, since there's no cursor"""
+        pass
+
+    def _return(self):
+        """Return collected text"""
+        return self._text.getvalue()
@@ -2,13 +2,13 @@
 Parameter sets representing renderer states
 """
 
-import copy
 from ..pdf_matrix import PdfMatrix
 
 __all__ = ['TextState', 'GraphicsState']
 
 class RendererState(object):
     """Base class for renderer states"""
+    __slots__ = ()
     id_matrix = PdfMatrix(1, 0, 0, 1, 0, 0)
 
 class TextState(object):
@@ -60,21 +60,49 @@ class TextState(object):
 
     def reset_lm(self):
         """Reset the line matrix to the general text matrix"""
-        self.lm = copy.copy(self.m)
+        self.lm = self.m
 
 
 class GraphicsState(RendererState):
     """Renderer graphics state.  Has all of the various graphical state
-    parameters, including the current transformation matrix."""
-    def __init__(self):
+    parameters, including the current transformation matrix.
+
+    Saving the state (q) happens a lot, so instead of copying everything, the
+    new state is made with derive() and starts out empty.  Anything it hasn't
+    set itself is read from the state it was derived from, which can't change
+    until the new one is popped off (Q).  Values should be replaced rather than
+    modified in place (e.g., the dash array)."""
+    __slots__ = ('_parent', 'CTM', 'line_width', 'line_cap', 'line_join',
+                 'miter_limit', 'dash_array', 'dash_phase', 'intent',
+                 'flatness')
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        if parent is not None:
+            return
         self.CTM         = self.id_matrix # Current transformation matrix
         self.line_width  = 1.0
         self.line_cap    = 0
         self.line_join   = 0
         self.miter_limit = 10.0
-        self.dash_array  = []   # See p. 217
+        self.dash_array  = ()   # See p. 217
         self.dash_phase  = 0
         self.intent      = None # See p. 260
         self.flatness    = 0    # See S6.5.1 - p. 508
 
+    def __getattr__(self, name):
+        # Only called for the fields this state hasn't set
+        if name == '_parent':
+            raise AttributeError(name)
+        parent = self._parent
+        if parent is None:
+            raise AttributeError('GraphicsState has no attribute '
+                                 '"{}"'.format(name))
+        value = getattr(parent, name)
+        # The parent's frozen for as long as we're around, so remember it
+        setattr(self, name, value)
+        return value
 
+    def derive(self):
+        """New graphics state that starts out the same as this one"""
+        return GraphicsState(self)
@@ -100,6 +100,7 @@ class PdfTextRenderer(PdfBaseRenderer):
     been processed, it goes over each line determining spacing based on the gap
     between successive TextBlocks in the line and width of the space character
     in the first of the two."""
+    OPTYPE_MASK = PdfOperation.TEXT_EXTRACTION
 
     def __init__(self, page, fixed_width=True, tab_width=None):
         """Text line extractor.
@@ -0,0 +1,247 @@
+"""
+Compact cross reference index
+"""
+
+import re
+import struct
+from array import array
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections     import Mapping
+
+from .exc       import PdfParseError
+from .misc      import get_numpy
+from .pdf_types import PdfXref
+
+__all__ = ['XrefIndex']
+
+class XrefIndex(Mapping):
+    """All of a document's cross reference entries, stored in typed arrays
+    indexed by object number instead of as one PdfXref per object.  It looks
+    like a dict mapping (object number, generation) keys to PdfXref objects,
+    which are created on demand.
+
+    Entries are added newest first, i.e., starting with the last update's
+    xref section and following the Prev links back, and the first entry for
+    an object number wins.  That way incremental updates layer correctly.
+
+    Entry types are the same as in xref streams (Reference p. 109):
+        FREE       - Free object.  offset is the next free object number.
+        IN_USE     - offset is the object's position in the file.
+        COMPRESSED - Object is stored in an object stream.  offset is the
+                     stream's object number and index is the object's
+                     position in it.  The generation is always 0."""
+    ABSENT     = -1
+    FREE       = 0
+    IN_USE     = 1
+    COMPRESSED = 2
+
+    # Xref table lines are exactly 20 bytes: oooooooooo ggggg n eol
+    TABLE_REC  = struct.Struct('10sx5sxc2x')
+    TABLE_LINE = re.compile(br'(\d{10}) (\d{5}) ([nf])')
+
+    def __init__(self, document, size=0):
+        self._document = document
+        self._types    = array('b', [self.ABSENT]) * size
+        self._offsets  = array('q', [0]) * size
+        self._gens     = array('l', [0]) * size
+        self._indices  = array('l', [0]) * size
+        self._count    = 0
+
+    def __getstate__(self):
+        # The arrays are what's worth shipping around; the document stays put
+        state = self.__dict__.copy()
+        state['_document'] = None
+        return state
+
+    def attach(self, document):
+        """Make this the index for document (e.g., after unpickling)"""
+        self._document = document
+
+    def _grow(self, size):
+        """Make room for object numbers up to size-1, overallocating so that
+        we don't have to keep doing this"""
+        extra = max(size, 2*len(self._types)) - len(self._types)
+        self._types.extend(array('b', [self.ABSENT]) * extra)
+        self._offsets.extend(array('q', [0]) * extra)
+        self._gens.extend(array('l', [0]) * extra)
+        self._indices.extend(array('l', [0]) * extra)
+
+    def add(self, obj_no, rec_type, offset, generation=0, index=0):
+        """Add an entry, unless a newer one for obj_no is already there.
+        Returns whether or not the entry was added."""
+        if obj_no >= len(self._types):
+            self._grow(obj_no + 1)
+        elif self._types[obj_no] != self.ABSENT:
+            return False
+        self._types[obj_no]   = rec_type
+        self._offsets[obj_no] = offset
+        self._gens[obj_no]    = generation
+        self._indices[obj_no] = index
+        self._count += 1
+        return True
+
+    def add_records(self, id0, types, offsets, gens, indices):
+        """Bulk version of add() for the consecutive objects starting at id0.
+        The arguments are equal length sequences (or numpy arrays), and
+        records with type ABSENT are skipped."""
+        stop = id0 + len(types)
+        if stop > len(self._types):
+            self._grow(stop)
+        numpy = get_numpy()
+        if numpy is None:
+            if (self._types[id0:stop].count(self.ABSENT) == len(types)
+                    and self.ABSENT not in types):
+                # Nothing to skip or keep, so we can just copy it all in
+                for arr, vals in ((self._types, types), (self._offsets, offsets),
+                                  (self._gens, gens), (self._indices, indices)):
+                    arr[id0:stop] = array(arr.typecode, vals)
+                self._count += len(types)
+                return
+            for obj_no, rec in enumerate(zip(types, offsets, gens, indices),
+                                         id0):
+                if rec[0] != self.ABSENT:
+                    self.add(obj_no, *rec)
+            return
+        types = numpy.asarray(types)
+        cur   = numpy.frombuffer(self._types, self._types.typecode)[id0:stop]
+        new   = (cur == self.ABSENT) & (types != self.ABSENT)
+        cur[new] = types[new]
+        for arr, vals in ((self._offsets, offsets), (self._gens, gens),
+                          (self._indices, indices)):
+            arr_view = numpy.frombuffer(arr, arr.typecode)[id0:stop]
+            arr_view[new] = numpy.asarray(vals)[new]
+        self._count += int(new.sum())
+
+    def add_table(self, id0, data):
+        """Add the entries from the 20-byte xref table lines in data for the
+        objects starting at id0 (see PdfDocument._get_xref_table)"""
+        nrecs = len(data) // 20
+        numpy = get_numpy()
+        if numpy is not None and len(data) == 20*nrecs:
+            recs   = numpy.frombuffer(data, numpy.uint8).reshape(nrecs, 20)
+            digits = recs[:, :16].astype(numpy.int64) - 0x30
+            kinds  = recs[:, 17]
+            # Positions 10 and 16 are spaces, so they come out negative
+            if ((digits[:, :10] >= 0).all() and (digits[:, :10] <= 9).all()
+                    and (digits[:, 11:] >= 0).all()
+                    and (digits[:, 11:] <= 9).all()
+                    and ((kinds == 0x6E) | (kinds == 0x66)).all()):
+                offsets = digits[:, :10].dot(10**numpy.arange(9, -1, -1))
+                gens    = digits[:, 11:].dot(10**numpy.arange(4, -1, -1))
+                types   = numpy.where(kinds == 0x6E, self.IN_USE, self.FREE)
+                self.add_records(id0, types.astype(numpy.int8), offsets,
+                                 gens, numpy.zeros(nrecs, numpy.int64))
+                return
+        try:
+            recs = list(self.TABLE_REC.iter_unpack(data))
+            types = [{b'n': self.IN_USE, b'f': self.FREE}[r[2]] for r in recs]
+            offsets = [int(r[0]) for r in recs]
+            gens    = [int(r[1]) for r in recs]
+        except (struct.error, KeyError, ValueError):
+            # Not quite to spec, so do it the slow way
+            lines = [self.TABLE_LINE.match(l) for l in data.splitlines()]
+            if not all(lines):
+                raise PdfParseError('Invalid xref line')
+            types   = [self.IN_USE if l.group(3) == b'n' else self.FREE
+                       for l in lines]
+            offsets = [int(l.group(1)) for l in lines]
+            gens    = [int(l.group(2)) for l in lines]
+        self.add_records(id0, types, offsets, gens, [0]*len(types))
+
+    def add_stream(self, data, widths, index):
+        """Add the entries from the decoded data of an xref stream.
+
+        Arguments:
+            data   - The stream's decoded data
+            widths - The three field widths from the stream's /W
+            index  - Flat list of (first object number, count) pairs, as in
+                     the stream's /Index"""
+        ranges  = list(zip(index[::2], index[1::2]))
+        recsize = sum(widths)
+        nrecs   = min(sum(r[1] for r in ranges), len(data) // recsize)
+        numpy   = get_numpy()
+        if numpy is not None:
+            recs   = numpy.frombuffer(data, numpy.uint8, nrecs*recsize)
+            recs   = recs.reshape(nrecs, recsize).astype(numpy.int64)
+            fields = []
+            pos    = 0
+            for width in widths:
+                fields.append(recs[:, pos:pos+width].dot(
+                                 256**numpy.arange(width-1, -1, -1)))
+                pos += width
+            # Defaults: type 1 and a 0 for the third field
+            types = fields[0] if widths[0] else numpy.ones(nrecs, numpy.int64)
+            compressed = (types == self.COMPRESSED)
+            gens    = numpy.where(compressed, 0, fields[2])
+            indices = numpy.where(compressed, fields[2], 0)
+            # Anything else is to be treated as a reference to null
+            types   = numpy.where(types <= self.COMPRESSED, types, self.ABSENT)
+            types, offsets = types.astype(numpy.int8), fields[1]
+        else:
+            types, offsets, gens, indices = ([], [], [], [])
+            w0, w1, w2 = widths
+            for pos in range(0, nrecs*recsize, recsize):
+                rec_type = int.from_bytes(data[pos:pos+w0], 'big') if w0 else 1
+                val_2 = int.from_bytes(data[pos+w0:pos+w0+w1], 'big')
+                val_3 = int.from_bytes(data[pos+w0+w1:pos+recsize], 'big')
+                compressed = (rec_type == self.COMPRESSED)
+                types.append(rec_type if rec_type <= self.COMPRESSED
+                             else self.ABSENT)
+                offsets.append(val_2)
+                gens.append(0 if compressed else val_3)
+                indices.append(val_3 if compressed else 0)
+        pos = 0
+        for id0, count in ranges:
+            count = min(count, nrecs - pos)
+            self.add_records(id0, types[pos:pos+count], offsets[pos:pos+count],
+                             gens[pos:pos+count], indices[pos:pos+count])
+            pos += count
+
+    def merge(self, older):
+        """Add all of the entries from another index that aren't superseded
+        by the ones already here"""
+        self.add_records(0, older._types, older._offsets, older._gens,
+                         older._indices)
+
+    def entry(self, obj_no):
+        """The raw (type, offset, generation, index) entry for obj_no, or
+        None if there isn't one"""
+        if obj_no >= len(self._types) or self._types[obj_no] == self.ABSENT:
+            return None
+        return (self._types[obj_no], self._offsets[obj_no],
+                self._gens[obj_no],  self._indices[obj_no])
+
+    def _generation(self, obj_no):
+        if self._types[obj_no] == self.COMPRESSED:
+            return 0
+        return self._gens[obj_no]
+
+    def __getitem__(self, key):
+        obj_no, generation = key
+        entry = self.entry(obj_no) if obj_no >= 0 else None
+        if entry is None or self._generation(obj_no) != generation:
+            raise KeyError(key)
+        rec_type, offset, _, index = entry
+        if rec_type == self.COMPRESSED:
+            return PdfXref(self._document, obj_no, offset, 0, True, index)
+        return PdfXref(self._document, obj_no, offset, generation,
+                       rec_type == self.IN_USE)
+
+    def __contains__(self, key):
+        try:
+            obj_no, generation = key
+        except (TypeError, ValueError):
+            return False
+        return (0 <= obj_no < len(self._types)
+                and self._types[obj_no] != self.ABSENT
+                and self._generation(obj_no) == generation)
+
+    def __iter__(self):
+        types = self._types
+        return ((i, self._generation(i)) for i in range(len(types))
+                if types[i] != self.ABSENT)
+
+    def __len__(self):
+        return self._count
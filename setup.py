@@ -25,6 +25,7 @@ except ImportError:
 NAME = 'gymnast'
 URL = 'https://github.com/ajmarks/gymnast/'
 REQUIRES = ['bidict>=0.9', 'six>=1.0', 'intervaltree>=2.1.0']
+EXTRAS   = {'fast': ['numpy']}
 KEYWORDS = ['pdf', 'acrobat']
 LICENSE  = 'MIT License'
 CLASSIFIERS = ['Development Status :: 3 - Alpha',
@@ -50,6 +51,7 @@ setup(name=NAME,
       download_url=URL+'tarball/'+VERSION,
       keywords=KEYWORDS,
       install_requires=REQUIRES,
+      extras_require=EXTRAS,
       description='Gymnast: PDF document parser in Python 3',
       classifiers=CLASSIFIERS,
       include_package_data=True,
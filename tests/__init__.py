@@ -1,2 +1,14 @@
-from .test_simple_types import *
-from .test_string_types import *
+from .test_simple_types  import *
+from .test_string_types  import *
+from .test_lexer         import *
+from .test_xref_index    import *
+from .test_object_stream import *
+from .test_object_cache  import *
+from .test_batch         import *
+from .test_pages         import *
+from .test_fonts         import *
+from .test_cmap          import *
+from .test_matrix        import *
+from .test_renderer      import *
+from .test_operations    import *
+from .test_filters       import *
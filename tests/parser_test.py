@@ -1,7 +1,11 @@
 import unittest
-from ..pdf_parser.pdf_parser import PdfParser
+from gymnast.pdf_lexer  import PdfLexer
+from gymnast.pdf_parser import PdfParser
 
 class ParserTestCase(unittest.TestCase):
     """Test the parser"""
     def setUp(self):
         self.parser = PdfParser()
+        self.data   = None
+    def set_data(self, data):
+        self.data = PdfLexer(data)
@@ -0,0 +1,77 @@
+"""
+Helpers to build small PDFs for the tests
+"""
+
+def build_pdf(objects, size, prev=None, base=b'%PDF-1.4\n'):
+    """Build a PDF (or an incremental update to base) out of a dict of
+    {object number: object body}.  Returns the data and the xref offset."""
+    data    = bytearray(base)
+    offsets = {}
+    for obj_no in sorted(objects):
+        offsets[obj_no] = len(data)
+        data += '{} 0 obj\n'.format(obj_no).encode() + objects[obj_no] \
+                + b'\nendobj\n'
+    startxref = len(data)
+    data += b'xref\n'
+    for obj_no in sorted(offsets):
+        data += '{} 1\n{:010d} 00000 n\r\n'.format(obj_no,
+                                                  offsets[obj_no]).encode()
+    data += '\ntrailer\n<</Size {} /Root 1 0 R'.format(size).encode()
+    if prev is not None:
+        data += ' /Prev {}'.format(prev).encode()
+    data += '>>\nstartxref\n{}\n%%EOF\n'.format(startxref).encode()
+    return bytes(data), startxref
+
+def pdf_stream(data, entries=b''):
+    """The body of a stream object holding data, with any other entries
+    (e.g., b'/Filter/FlateDecode') in its dict"""
+    return '<</Length {}'.format(len(data)).encode() + entries \
+           + b'>>\nstream\n' + data + b'\nendstream'
+
+def page_pdf(contents, resources=b'<</Font<</F1 4 0 R>>>>', objects=None):
+    """Build a PDF with a single page whose contents are a content stream, or
+    a list of them that are treated as one.  Object 4 is Helvetica, which the
+    default resources call F1.  Any other objects the page needs are given in
+    a dict of {object number: object body}, numbered from 10."""
+    if isinstance(contents, bytes):
+        contents = [contents]
+    streams = {5 + i: pdf_stream(stream) for i, stream in enumerate(contents)}
+    objects = dict(objects or {})
+    objects.update(streams)
+    objects[1] = b'<</Type/Catalog/Pages 2 0 R>>'
+    objects[2] = b'<</Type/Pages/Kids[3 0 R]/Count 1/MediaBox[0 0 612 792]>>'
+    objects[3] = '<</Type/Page/Parent 2 0 R/Contents[{}]/Resources '\
+                 .format(' '.join('{} 0 R'.format(n) for n in streams))\
+                 .encode() + resources + b'>>'
+    objects[4] = b'<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>'
+    return build_pdf(objects, max(objects) + 1)[0]
+
+def one_page(contents, resources=b'<</Font<</F1 4 0 R>>>>', objects=None):
+    """The parsed PdfPage of page_pdf(contents, resources, objects)"""
+    from gymnast.pdf_doc import PdfDocument
+    return PdfDocument(page_pdf(contents, resources, objects)).parse().page(0)
+
+def text_pdf(pages):
+    """Build a PDF with one page per item in pages, each a list of lines of
+    text set in a simple TrueType font.  The font and MediaBox are inherited
+    from the page tree root."""
+    widths  = ' '.join(str(500 + (i % 7)*20) for i in range(32, 127))
+    objects = {1: b'<</Type/Catalog/Pages 2 0 R>>',
+               3: '<</Type/Font/Subtype/TrueType/BaseFont/Foo/FirstChar 32'
+                  '/LastChar 126/Widths[{}]/FontDescriptor 4 0 R'
+                  '/Encoding/WinAnsiEncoding>>'.format(widths).encode(),
+               4: b'<</Type/FontDescriptor/FontName/Foo/Flags 32/CapHeight 700>>'}
+    kids = []
+    for i, lines in enumerate(pages):
+        page_no, contents_no = 5 + 2*i, 6 + 2*i
+        kids.append('{} 0 R'.format(page_no))
+        objects[page_no] = '<</Type/Page/Parent 2 0 R/Contents {} 0 R>>'\
+                           .format(contents_no).encode()
+        stream = b'BT /F1 12 Tf 72 720 Td ' \
+                 + b' 0 -14 Td '.join(b'(' + line.encode() + b') Tj'
+                                      for line in lines) + b' ET'
+        objects[contents_no] = pdf_stream(stream)
+    objects[2] = '<</Type/Pages/Kids[{}]/Count {}/MediaBox[0 0 612 792]' \
+                 '/Resources<</Font<</F1 3 0 R>>>>>>'\
+                 .format(' '.join(kids), len(kids)).encode()
+    return build_pdf(objects, max(objects) + 1)[0]
@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from gymnast.batch    import extract_text
+from gymnast.pdf_doc  import PdfDocument
+from gymnast.renderer import PdfTextRenderer
+from .pdf_builder     import text_pdf
+
+class MisbehavingRenderer(PdfTextRenderer):
+    """Takes its time or kills the worker if the page text tells it to"""
+    def _return(self):
+        text = super(MisbehavingRenderer, self)._return()
+        if 'crash' in text:
+            os._exit(1)
+        if 'sleep' in text:
+            time.sleep(10)
+        return text
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_extract_text(self):
+        paths = [self.write('doc{}.pdf'.format(i),
+                            text_pdf([['Doc {}'.format(i)], ['Page 2']]))
+                 for i in range(6)]
+        paths.append(self.write('bad.pdf', b'Not a PDF'))
+        results = {r.path: r for r in extract_text(paths, jobs=2,
+                                                   chunksize=2)}
+        self.assertEqual(sorted(results), sorted(paths))
+        for i, path in enumerate(paths[:-1]):
+            self.assertIsNone(results[path].error)
+            self.assertEqual([p.strip() for p in results[path].pages],
+                             ['Doc {}'.format(i), 'Page 2'])
+        self.assertIsNone(results[paths[-1]].pages)
+        self.assertIn('PdfParseError', results[paths[-1]].error)
+
+    def test_misbehaving(self):
+        paths = [self.write(name + '.pdf', text_pdf([[name]]))
+                 for name in ('fine', 'crash', 'sleep', 'also fine')]
+        results = {os.path.basename(r.path): r
+                   for r in extract_text(paths, jobs=2, chunksize=2,
+                                         timeout=.5,
+                                         renderer=MisbehavingRenderer)}
+        self.assertEqual(results['fine.pdf'].pages[0].strip(), 'fine')
+        self.assertEqual(results['also fine.pdf'].pages[0].strip(),
+                         'also fine')
+        self.assertEqual(results['crash.pdf'].error, 'Worker process died')
+        self.assertIn('Timed out', results['sleep.pdf'].error)
+
+class TestExtractPages(unittest.TestCase):
+    def setUp(self):
+        self.data = text_pdf([['Page {}'.format(i)] for i in range(10)])
+        fd, self.path = tempfile.mkstemp(suffix='.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.data)
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_extract_pages(self):
+        with PdfDocument(self.path) as doc:
+            doc.parse()
+            pages = doc.extract_pages(workers=2, fixed_width=False)
+            self.assertEqual([p.strip() for p in pages],
+                             ['Page {}'.format(i) for i in range(10)])
+            pages = doc.extract_pages([7, 2, 2], workers=3)
+            self.assertEqual([p.strip() for p in pages],
+                             ['Page 7', 'Page 2', 'Page 2'])
+
+    def test_in_memory(self):
+        doc = PdfDocument(self.data).parse()
+        self.assertEqual([p.strip() for p in doc.extract_pages([1, 0])],
+                         ['Page 1', 'Page 0'])
@@ -0,0 +1,90 @@
+import unittest
+from gymnast.pdf_elements.fonts      import PdfFont
+from gymnast.pdf_elements.fonts.cmap import CMap, get_cmap
+from gymnast.pdf_types               import PdfDict, PdfName, PdfStream
+
+TO_UNICODE = b'''/CIDInit /ProcSet findresource begin
+12 dict begin
+begincmap
+/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def
+/CMapName /Adobe-Identity-UCS def
+/CMapType 2 def
+1 begincodespacerange
+<0000> <FFFF>
+endcodespacerange
+2 beginbfchar
+<0003> <0020>
+<0011> <00660069>
+endbfchar
+2 beginbfrange
+<0024> <0030> <0041>
+<0044> <0046> [<0061> <0062> <0063>]
+endbfrange
+endcmap
+CMapName currentdict /CMap defineresource pop
+end
+end
+'''
+
+def cmap_stream(data):
+    return PdfStream(PdfDict({PdfName('Length'): len(data)}), data)
+
+class TestCMap(unittest.TestCase):
+    def test_to_unicode(self):
+        cmap = CMap.parse(TO_UNICODE)
+        self.assertEqual(cmap.name, 'Adobe-Identity-UCS')
+        self.assertEqual(cmap.code_lengths, [2])
+        self.assertEqual(len(cmap), 2 + 13 + 3)
+        self.assertEqual(cmap[0x11], 'fi')
+        self.assertEqual(cmap[0x30], 'M')
+        self.assertEqual(cmap[0x45], 'b')
+        self.assertNotIn(0x31, cmap)
+        self.assertEqual(cmap.decode(b'\x00\x24\x00\x11\x00\x03\x00\x31'),
+                         'Afi ')
+
+    def test_ranges(self):
+        # Big enough that the ranges are searched instead of expanded
+        data = b'''1 begincodespacerange <0000> <FFFF> endcodespacerange
+                   2 beginbfrange
+                   <1000> <1FFF> <4E00>
+                   <0100> <01FF> <0041>
+                   endbfrange
+                   1 beginbfchar <1005> <0078> endbfchar'''
+        cmap = CMap.parse(data)
+        self.assertEqual(len(cmap._starts), 2)
+        self.assertEqual(cmap[0x1000], '一')
+        self.assertEqual(cmap[0x1FFF], chr(0x4e00 + 0xFFF))
+        self.assertEqual(cmap[0x1005], 'x')
+        self.assertEqual(cmap[0x0101], 'B')
+        self.assertIsNone(cmap.get(0x0200))
+        self.assertIsNone(cmap.get(0x00FF))
+
+    def test_mixed_codespace(self):
+        data = b'''2 begincodespacerange <00> <80> <8140> <9FFC>
+                   endcodespacerange
+                   1 begincidrange <00> <80> 1 endcidrange
+                   1 begincidchar <8140> 633 endcidchar'''
+        cmap = CMap.parse(data)
+        self.assertEqual(cmap.code_lengths, [1, 2])
+        self.assertEqual(cmap.split(b'A\x81\x40B'), [0x41, 0x8140, 0x42])
+        self.assertEqual([cmap[c] for c in cmap.split(b'A\x81\x40')],
+                         [0x42, 633])
+
+    def test_shared(self):
+        cmap = get_cmap(cmap_stream(TO_UNICODE))
+        self.assertIs(get_cmap(cmap_stream(TO_UNICODE)), cmap)
+        self.assertIs(get_cmap(TO_UNICODE), cmap)
+
+    def test_font(self):
+        data = b'''1 begincodespacerange <00> <FF> endcodespacerange
+                   1 beginbfchar <41> <00DF> endbfchar'''
+        font = PdfFont(PdfDict({PdfName('Type'): 'Font',
+                                PdfName('Subtype'): 'Type1',
+                                PdfName('BaseFont'): 'Helvetica',
+                                PdfName('ToUnicode'): cmap_stream(data)}))
+        self.assertEqual(font.decode_string('AB'), '\xdfB')
+        self.assertEqual(font.decode_char('A'), '\xdf')
+        self.assertIsNone(PdfFont(PdfDict({PdfName('Type'): 'Font',
+                                           PdfName('Subtype'): 'Type1',
+                                           PdfName('BaseFont'): 'Courier'}))
+                          .ToUnicode)
@@ -0,0 +1,97 @@
+import base64
+import binascii
+import io
+import zlib
+import unittest
+from gymnast.filters               import StreamFilter
+from gymnast.filters.stream_filter import until_marker
+from gymnast.pdf_types             import PdfStream, PdfDict, PdfName, \
+                                          PdfArray, PdfNull
+
+def stream(data, filters, params=None):
+    header = {PdfName('Length'): len(data),
+              PdfName('Filter'): PdfArray([PdfName(f) for f in filters])}
+    if params is not None:
+        header[PdfName('DecodeParms')] = params
+    return PdfStream(PdfDict(header), data)
+
+def png_rows(rows, algorithm, bpp):
+    """Encode rows with a PNG predictor (just Sub or Up, for the tests)"""
+    output = bytearray()
+    prev   = bytes(len(rows[0]))
+    for row in rows:
+        if algorithm == 1:
+            enc = bytes((b - a) & 0xFF for a, b in zip(bytes(bpp) + row, row))
+        else:
+            enc = bytes((b - a) & 0xFF for a, b in zip(prev, row))
+        output += bytes((algorithm, )) + enc
+        prev    = row
+    return bytes(output)
+
+class TestIterDecode(unittest.TestCase):
+    def setUp(self):
+        self.data = b''.join(b'%d 0 0 1 72 %d cm (line %d) Tj\n' % (i, i, i)
+                             for i in range(5000)) + bytes(1000)
+
+    def test_chain(self):
+        encoded = base64.a85encode(zlib.compress(self.data), wrapcol=72)
+        strm    = stream(encoded + b'~>', ['ASCII85Decode', 'FlateDecode'])
+        self.assertEqual(strm.decode(cache=False), self.data)
+        for size in (5, 64, 1000):
+            chunks = list(strm.iter_decode(size))
+            self.assertEqual(b''.join(chunks), self.data)
+            self.assertTrue(len(chunks) > 1)
+            self.assertTrue(all(chunks))
+            self.assertLessEqual(max(map(len, chunks)),
+                                 StreamFilter.CHUNK_SIZE)
+
+    def test_hex(self):
+        encoded = binascii.hexlify(zlib.compress(self.data))
+        strm    = stream(encoded[:99] + b'\n ' + encoded[99:] + b'>',
+                         ['ASCIIHexDecode', 'FlateDecode'])
+        self.assertEqual(b''.join(strm.iter_decode(7)), self.data)
+        # A final odd digit gets a 0 after it
+        self.assertEqual(b''.join(stream(b'4142 4>', ['ASCIIHexDecode'])
+                                  .iter_decode(3)), b'AB@')
+
+    def test_predictors(self):
+        rows = [bytes((i*j) & 0xFF for j in range(12)) for i in range(300)]
+        for algorithm in (1, 2):
+            params = PdfDict({PdfName('Predictor'): 12,
+                              PdfName('Columns'):   4,
+                              PdfName('Colors'):    3})
+            strm = stream(zlib.compress(png_rows(rows, algorithm, 3)),
+                          ['FlateDecode'], PdfArray([params]))
+            self.assertEqual(strm.decode(cache=False), b''.join(rows))
+            # The chunks come apart in the middle of rows
+            self.assertEqual(b''.join(strm.iter_decode(10)), b''.join(rows))
+
+    def test_fallback(self):
+        # Filters without an iter_decoder, unknown filters, and empty params
+        StreamFilter.register('TestReverse', lambda data, **kwargs: data[::-1])
+        encoded = base64.a85encode(self.data[::-1])
+        strm = stream(encoded + b'~>', ['ASCII85Decode', 'TestReverse', 'Foo'],
+                      PdfArray([PdfNull, PdfNull, PdfDict()]))
+        self.assertEqual(strm.decode(cache=False), self.data)
+        self.assertEqual(b''.join(strm.iter_decode(100)), self.data)
+
+    def test_source(self):
+        # Streams read from a file are read a chunk at a time too
+        encoded = zlib.compress(self.data)
+        source  = io.BytesIO(b'junk' + encoded + b'junk')
+        strm    = PdfStream(PdfDict({PdfName('Length'): len(encoded),
+                                     PdfName('Filter'):
+                                         PdfName('FlateDecode')}),
+                            source, 4)
+        self.assertEqual(b''.join(strm.iter_decode(100)), self.data)
+        self.assertEqual(strm.decode(), self.data)
+        self.assertEqual(b''.join(strm.iter_decode(100)), self.data)
+
+    def test_until_marker(self):
+        for size in (1, 2, 3, 10):
+            data   = b'abcdefg~>hij'
+            chunks = [data[i:i+size] for i in range(0, len(data), size)]
+            self.assertEqual(b''.join(until_marker(chunks, b'~>')),
+                             b'abcdefg')
+        self.assertEqual(b''.join(until_marker([b'ab', b'c~'], b'~>')),
+                         b'abc~')
@@ -0,0 +1,180 @@
+import subprocess
+import sys
+import unittest
+from gymnast.pdf_constants           import GLYPH_LIST, BASE_ENCODINGS
+from gymnast.pdf_elements.fonts      import PdfFont, Type1Font, Type0Font, \
+                                            CIDFont
+from gymnast.pdf_elements.fonts.type0 import CIDWidths
+from gymnast.pdf_elements.fonts.type1 import get_std_font_dict, get_std_kerning
+from gymnast.pdf_types               import PdfDict, PdfName, PdfArray, \
+                                            PdfHexString, PdfStream
+from gymnast.renderer                import PdfSimpleRenderer, \
+                                            PdfFastRenderer
+from .pdf_builder                    import one_page, pdf_stream
+
+def font_dict(**entries):
+    entries.setdefault('Type', 'Font')
+    entries.setdefault('Subtype', 'Type1')
+    return PdfDict({PdfName(k): v for k, v in entries.items()})
+
+class TestStandardFonts(unittest.TestCase):
+    def test_metrics(self):
+        font = PdfFont(font_dict(BaseFont='Helvetica'))
+        self.assertIsInstance(font, Type1Font)
+        self.assertEqual((font.FirstChar, font.LastChar), (32, 251))
+        self.assertEqual(len(font.Widths), 251 - 32 + 1)
+        self.assertEqual(font.get_glyph_width(ord('A')), 667)
+        self.assertEqual(font.space_width, 278)
+        # Codes with no glyph (e.g., 127) get the MissingWidth
+        self.assertEqual(font.get_glyph_width(127), 0)
+        fdesc = font.FontDescriptor
+        self.assertEqual(fdesc.CapHeight, 718)
+        self.assertEqual((fdesc.StemV, fdesc.StemH), (88, 76))
+        self.assertEqual(fdesc.Flags, 32)
+        self.assertEqual(fdesc.CharSet[:2], ['space', 'exclam'])
+        self.assertEqual(PdfFont(font_dict(BaseFont='Courier-Oblique'))
+                         .FontDescriptor.Flags, 1 + 2 + 32 + 64)
+
+    def test_overrides(self):
+        font = PdfFont(font_dict(BaseFont='Times-Roman', FirstChar=65,
+                                 LastChar=66, Widths=PdfArray([1, 2])))
+        self.assertEqual(font.get_glyph_width(66), 2)
+        self.assertEqual(font.FontDescriptor.FontName, 'Times-Roman')
+
+    def test_encoded_widths(self):
+        # The standard widths follow the font's own Encoding, not the code
+        # order of the built-in one
+        font = PdfFont(font_dict(BaseFont='Helvetica',
+                                 Encoding=PdfName('WinAnsiEncoding')))
+        self.assertEqual(font.get_glyph_width(0xE9), 556) # eacute
+        self.assertEqual(font.get_glyph_width(0xE1), 556) # aacute
+        self.assertEqual(font.get_glyph_width(0x92), 222) # quoteright
+        self.assertEqual(font.width_table[0xC6], 1000)    # AE
+        self.assertEqual((font.FirstChar, font.LastChar), (32, 255))
+        diffs = PdfDict({PdfName('Differences'):
+                             PdfArray([65, PdfName('Oslash')])})
+        font  = PdfFont(font_dict(BaseFont='Helvetica', Encoding=diffs))
+        self.assertEqual(font.width_table[65], 778)
+        self.assertEqual(font.width_table[ord('B')], 667)
+
+    def test_shared(self):
+        font1 = get_std_font_dict('Courier')
+        font2 = get_std_font_dict('Courier')
+        self.assertIsNot(font1, font2)
+        self.assertIs(font1['Widths'], font2['Widths'])
+        self.assertIs(font1['FontDescriptor'], font2['FontDescriptor'])
+
+    def test_builtin_encoding(self):
+        font = PdfFont(font_dict(BaseFont='Symbol'))
+        self.assertEqual(font.get_glyph_name(0x22), 'universal')
+        self.assertEqual(font.decode_char('"'), '\u2200')
+        self.assertEqual(font.FontDescriptor.Flags, 4)
+        font = PdfFont(font_dict(BaseFont='Helvetica'))
+        self.assertEqual(font.Encoding.BaseEncoding, 'StandardEncoding')
+
+    def test_kerning(self):
+        self.assertEqual(get_std_kerning('Helvetica')[('A', 'T')], -120)
+        self.assertEqual(get_std_kerning('Courier'), {})
+
+class TestConstants(unittest.TestCase):
+    def test_glyph_list(self):
+        self.assertEqual(GLYPH_LIST['A'], 'A')
+        # Both names work, and the first is used for the reverse lookup
+        self.assertEqual(GLYPH_LIST['universal'], '\u2200')
+        self.assertEqual(GLYPH_LIST['forall'], '\u2200')
+        self.assertEqual(GLYPH_LIST.inv['\u2200'], 'forall')
+        self.assertEqual(GLYPH_LIST[:'\u2200'], 'forall')
+        self.assertEqual(BASE_ENCODINGS['A']['WinAnsiEncoding'], 65)
+
+    def test_lazy_imports(self):
+        code = ('import sys, gymnast; '
+                'print(" ".join(m for m in ("numpy", "bidict", "pkg_resources")'
+                ' if m in sys.modules)); '
+                'print(gymnast.pdf_constants.GLYPH_LIST._data is None)')
+        out = subprocess.check_output([sys.executable, '-c', code],
+                                      universal_newlines=True)
+        self.assertEqual(out.split('\n')[:2], ['', 'True'])
+
+class TestFontTables(unittest.TestCase):
+    def setUp(self):
+        encoding = PdfDict({PdfName('Type'): 'Encoding',
+                            PdfName('Differences'): PdfArray([
+                                65, PdfName('uni20AC'), PdfName('B.swash')])})
+        self.font = PdfFont(font_dict(Subtype='TrueType', BaseFont='Foo',
+                                      FirstChar=65, LastChar=67,
+                                      Widths=PdfArray([100, 200, 300]),
+                                      Encoding=encoding))
+
+    def test_widths(self):
+        table = self.font.width_table
+        self.assertEqual(len(table), 256)
+        self.assertEqual(table[64:68], (0, 100, 200, 300))
+        codes = self.font.string_codes(PdfHexString(b'414243 44'))
+        self.assertEqual(codes, b'ABCD')
+        self.assertEqual(self.font.string_width(codes), 600)
+
+    def test_unicode(self):
+        self.assertEqual(self.font.decode_string(PdfHexString(b'41424344')),
+                         '\u20acBCD')
+        self.assertEqual(self.font.decode_string('C'), 'C')
+
+    def test_charmap(self):
+        charmap = self.font.charmap
+        self.assertEqual(len(charmap), 256)
+        self.assertEqual(charmap[65:68], '\u20acBC')
+        # Ligatures don't fit in a charmap
+        to_unicode = PdfStream(PdfDict(), b'1 begincodespacerange <00> <FF> '
+                               b'endcodespacerange 1 beginbfchar '
+                               b'<41> <00660069> endbfchar')
+        font = PdfFont(font_dict(BaseFont='Helvetica', ToUnicode=to_unicode))
+        self.assertIsNone(font.charmap)
+        self.assertEqual(font.decode_string('AB'), 'fiB')
+
+class TestTextShowing(unittest.TestCase):
+    def test_hex_strings(self):
+        page = one_page(b'BT /F1 10 Tf [<48656C6C6F> -250 (World)] TJ ET')
+        self.assertEqual(PdfSimpleRenderer(page).render(), 'HelloWorld')
+
+class TestType0Fonts(unittest.TestCase):
+    def setUp(self):
+        to_unicode = b'1 begincodespacerange <0000> <FFFF> endcodespacerange ' \
+                     b'1 beginbfrange <0001> <001A> <0061> endbfrange ' \
+                     b'1 beginbfchar <0003> <0020> endbfchar'
+        objects = {10: b'<</Type/Font/Subtype/Type0/BaseFont/Foo'
+                       b'/Encoding/Identity-H/DescendantFonts[11 0 R]'
+                       b'/ToUnicode 13 0 R>>',
+                   11: b'<</Type/Font/Subtype/CIDFontType2/BaseFont/Foo'
+                       b'/DW 1000/FontDescriptor 12 0 R'
+                       b'/W[1 [500 500 250 600] 10 20 700]>>',
+                   12: b'<</Type/FontDescriptor/FontName/Foo/Flags 4'
+                       b'/CapHeight 700>>',
+                   13: pdf_stream(to_unicode)}
+        self.page = one_page(b'BT /F1 10 Tf [<000800050003> -500 <0004>] '
+                             b'TJ ET', b'<</Font<</F1 10 0 R>>>>', objects)
+        self.font = self.page.Fonts['F1']
+
+    def test_widths(self):
+        widths = CIDWidths(PdfArray([1, PdfArray([500, 500, 250, 600]),
+                                     10, 20, 700, 5000, PdfArray([])]), 900)
+        # Runs of the same width are merged
+        self.assertEqual(len(widths), 4)
+        self.assertEqual([widths[c] for c in (0, 1, 2, 3, 4, 5, 10, 20, 21)],
+                         [900, 500, 500, 250, 600, 900, 700, 700, 900])
+        self.assertEqual(CIDWidths().get(7), 1000)
+
+    def test_font(self):
+        font = self.font
+        self.assertIsInstance(font, Type0Font)
+        self.assertIsInstance(font.DescendantFont, CIDFont)
+        self.assertEqual(font.FontDescriptor.CapHeight, 700)
+        self.assertEqual(font.Encoding.code_lengths, [2])
+        codes = font.string_codes(PdfHexString(b'0001 0003 000A 0FFF'))
+        self.assertEqual(font.code_counts(codes), (4, 0))
+        self.assertEqual(font.string_width(codes), 500 + 250 + 700 + 1000)
+        self.assertEqual(font.decode_codes(codes), 'a j')
+        self.assertEqual(font.space_width, 250)
+        self.assertEqual(font.get_glyph_width(4), 600)
+
+    def test_render(self):
+        self.assertEqual(PdfSimpleRenderer(self.page).render(), 'he d')
+        self.assertEqual(PdfFastRenderer(self.page).render(), 'he d')
@@ -0,0 +1,113 @@
+import unittest
+from gymnast.exc        import PdfParseError
+from gymnast.pdf_lexer  import PdfLexer
+from gymnast.pdf_parser import PdfParser
+from gymnast.pdf_types  import PdfObjectReference, PdfRaw
+
+class TestLexer(unittest.TestCase):
+    def tokens(self, data, closer=None, disallowed=frozenset()):
+        lexer  = PdfLexer(data)
+        tokens = []
+        token  = lexer.next_token(closer, disallowed)
+        while token:
+            tokens.append(token)
+            token = lexer.next_token(closer, disallowed)
+        return tokens
+
+    def test_simple_tokens(self):
+        self.assertEqual(self.tokens(b' /Name#20x 1.5\r\n-3 .5 true\x00null'),
+                         [b'/Name#20x', b'1.5', b'-3', b'.5', b'true',
+                          b'null'])
+        self.assertEqual(self.tokens(b'/A/B<</C(d)[e]{f}%g'),
+                         [b'/A', b'/B', b'<<', b'/C', b'(', b'd)', b'[',
+                          b'e]', b'{', b'f}', b'%', b'g'])
+        self.assertEqual(self.tokens(b'<ab>'), [b'<', b'ab>'])
+
+    def test_keywords(self):
+        self.assertEqual(self.tokens(b'1 0 R 2 0 obj'),
+                         [b'1', b'0', b'R', b'2', b'0', b'obj'])
+        self.assertEqual(self.tokens(b'RG objects streamy'),
+                         [b'R', b'G', b'obj', b'ects', b'stream', b'y'])
+        self.assertEqual(self.tokens(b'RG objects', disallowed={b'R', b'obj'}),
+                         [b'RG', b'objects'])
+
+    def test_closers(self):
+        self.assertEqual(self.tokens(b'1 2]', b']'), [b'1', b'2', b']'])
+        self.assertEqual(self.tokens(b'/A 1>>>>', b'>>'),
+                         [b'/A', b'1', b'>>', b'>>'])
+        self.assertEqual(self.tokens(b'5endobj', b'endobj'),
+                         [b'5', b'endobj'])
+
+    def test_stream_interface(self):
+        lexer = PdfLexer(memoryview(b'0123456789'))
+        self.assertEqual(lexer.read(3), b'012')
+        self.assertEqual(lexer.peek(2), b'34')
+        lexer.seek(-2, 1)
+        self.assertEqual(lexer.tell(), 1)
+        lexer.seek(-4, 2)
+        self.assertEqual(lexer.read(), b'6789')
+        self.assertEqual(lexer.read(), b'')
+
+    def test_read_view(self):
+        data  = bytearray(b'0123456789')
+        lexer = PdfLexer(data, 2)
+        view  = lexer.read_view(3)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(lexer.tell(), 5)
+        data[2] = ord('x')
+        self.assertEqual(bytes(view), b'x34')
+        self.assertEqual(bytes(lexer.read_view(100)), b'56789')
+
+    def test_strings(self):
+        lexer = PdfLexer(b'simple (nested) \\) esc) rest')
+        self.assertEqual(lexer.read_literal_string(),
+                         b'simple (nested) \\) esc')
+        self.assertEqual(lexer.read(), b' rest')
+        self.assertRaises(PdfParseError,
+                          PdfLexer(b'unterminated (').read_literal_string)
+        lexer = PdfLexer(b'dead beef> rest')
+        self.assertEqual(lexer.read_hex_string(), b'dead beef')
+        self.assertEqual(lexer.read_until({b'\r', b'\n'}), (b' rest', b''))
+
+class TestLexerParsing(unittest.TestCase):
+    def setUp(self):
+        self.parser = PdfParser()
+
+    def test_simple_object(self):
+        obj = self.parser.parse_simple_object(
+            b'<</Type/Page/Kids[1 0 R 2 0 R]/A<</B(str)>>/C<dead>>>')
+        self.assertEqual(obj['Type'], 'Page')
+        self.assertTrue(all(isinstance(k, PdfObjectReference)
+                            for k in obj['Kids']))
+        self.assertEqual(obj['A']['B'], 'str')
+        self.assertEqual(bytes(obj['C']), b'\xde\xad')
+
+    def test_position(self):
+        lexer = PdfLexer(b'[1 2] << /A 3 >> 4')
+        self.assertEqual(list(self.parser.parse_simple_object(lexer)), [1, 2])
+        self.assertEqual(self.parser.parse_simple_object(lexer)['A'], 3)
+        self.assertEqual(self.parser.parse_simple_object(lexer), 4)
+
+    def test_indirect_object(self):
+        obj = self.parser.parse_indirect_object(b'12 0 obj\n[1 2]\nendobj')
+        self.assertEqual(obj.object_key, (12, 0))
+        self.assertEqual(list(obj.value), [1, 2])
+
+    def test_deferred_stream(self):
+        data = bytearray(b'3 0 obj <</Length 5>>\nstream\r\nhello\r\n'
+                         b'endstream endobj')
+        obj  = self.parser.parse_indirect_object(data)
+        data[data.index(b'hello')] = ord('j')
+        self.assertEqual(obj.value.header['Length'], 5)
+        self.assertEqual(obj.value.data, b'jello')
+
+    def test_content_stream(self):
+        ops = list(self.parser.iterparse(b'BT /F1 12 Tf [(a) -250 (b)] TJ ET '
+                                         b'1 0 0 RG BI /W 1 ID \x00\xffEI Q'))
+        self.assertEqual(ops[0], b'BT')
+        self.assertEqual(ops[1:4], ['F1', 12, b'Tf'])
+        self.assertEqual(list(ops[4]), ['a', -250, 'b'])
+        self.assertIsInstance(ops[10], PdfRaw)
+        self.assertEqual(ops[10], b'RG')
+        self.assertEqual(ops[11:], [b'BI', {'W': 1}, b'\x00\xff', b'EI',
+                                    b'Q'])
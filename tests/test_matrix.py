@@ -0,0 +1,48 @@
+import copy
+import pickle
+import unittest
+from gymnast.pdf_matrix  import PdfMatrix
+from gymnast.renderer    import PdfTextRenderer
+from .pdf_builder        import one_page
+
+class TestPdfMatrix(unittest.TestCase):
+    def setUp(self):
+        self.m = PdfMatrix(2, 0.5, -1, 3, 10, 20)
+
+    def test_basics(self):
+        m = self.m
+        self.assertEqual((m.a, m.b, m.c, m.d, m.e, m.f),
+                         (2, 0.5, -1, 3, 10, 20))
+        self.assertIsInstance(m.a, float)
+        self.assertEqual(m.current_coords, (10, 20))
+        self.assertEqual(m.transform_coords(1, 1), (11, 23.5))
+        with self.assertRaises(AttributeError):
+            m.a = 1
+        self.assertIs(copy.copy(m), m)
+        self.assertIs(copy.deepcopy(m), m)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        self.assertEqual(repr(m), 'PdfMatrix(2.0, 0.5, -1.0, 3.0, 10.0, 20.0)')
+
+    def test_products(self):
+        m = self.m
+        ident = PdfMatrix(1, 0, 0, 1, 0, 0)
+        self.assertEqual(ident*m, m)
+        self.assertEqual(m*ident, m)
+        self.assertEqual(m.translate(3, -2), PdfMatrix(1, 0, 0, 1, 3, -2)*m)
+        self.assertEqual(m.scale_translate(2, 4, 0, 5),
+                         PdfMatrix(2, 0, 0, 4, 0, 5)*m)
+        self.assertIsInstance(m.translate(1, 1), PdfMatrix)
+        for bad in (lambda: m*2, lambda: 2*m, lambda: m + m):
+            self.assertRaises(TypeError, bad)
+
+class BatchedRenderer(PdfTextRenderer):
+    BATCH_TJ_LENGTH = 1
+
+class TestTextArrays(unittest.TestCase):
+    def test_batched(self):
+        # The numpy path (if it's installed) gives the same results
+        page  = one_page(b'BT /F1 10 Tf 72 700 Td 2 Tw [(He) -120 (llo) '
+                         b'250.5 (, ) 3 (there)] TJ 0 -14 Td [(again)] TJ ET')
+        plain = PdfTextRenderer(page).render()
+        self.assertEqual(BatchedRenderer(page).render(), plain)
+        self.assertEqual(plain.split(), ['Hello,', 'there', 'again'])
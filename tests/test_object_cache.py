@@ -0,0 +1,78 @@
+import random
+import threading
+import unittest
+from gymnast.object_cache import ObjectCache
+from gymnast.pdf_doc      import PdfDocument
+from gymnast.pdf_types    import PdfIndirectObject, PdfDict, PdfStream
+from .pdf_builder         import build_pdf
+
+def make_obj(obj_no, value):
+    return PdfIndirectObject(obj_no, 0, value, None)
+
+class TestObjectCache(unittest.TestCase):
+    def test_lru(self):
+        cache = ObjectCache(max_entries=2)
+        for i in range(3):
+            cache[(i, 0)] = make_obj(i, i)
+        self.assertEqual(sorted(cache), [(1, 0), (2, 0)])
+        cache[(1, 0)]
+        cache[(3, 0)] = make_obj(3, 3)
+        self.assertEqual(sorted(cache), [(1, 0), (3, 0)])
+        self.assertRaises(KeyError, cache.__getitem__, (0, 0))
+
+    def test_pinning(self):
+        cache = ObjectCache(max_entries=1)
+        cache[(1, 0)] = make_obj(1, PdfDict({'Type': 'Font'}))
+        cache[(2, 0)] = make_obj(2, PdfDict({'Type': 'Page'}))
+        cache.pin((2, 0))
+        cache[(3, 0)] = make_obj(3, 3)
+        cache[(4, 0)] = make_obj(4, 4)
+        self.assertEqual(sorted(cache), [(1, 0), (2, 0), (4, 0)])
+        cache.unpin((2, 0))
+        self.assertEqual(sorted(cache), [(1, 0), (2, 0)])
+        cache.evict_all()
+        self.assertEqual(list(cache), [(1, 0)])
+
+    def test_bytes(self):
+        cache  = ObjectCache(max_bytes=10000)
+        stream = PdfStream(PdfDict({'Length': 8000}), b'x'*8000)
+        cache[(1, 0)] = make_obj(1, stream)
+        cache[(2, 0)] = make_obj(2, 2)
+        self.assertIn((1, 0), cache)
+        self.assertGreater(cache.nbytes, 8000)
+        stream.decode()
+        cache[(1, 0)]  # Now it's twice the size
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_document(self):
+        objects = {1: b'<</Type/Catalog/Pages 2 0 R>>',
+                   2: b'<</Type/Pages/Kids[]/Count 0>>',
+                   3: b'(three)',
+                   4: b'(four)'}
+        doc = PdfDocument(build_pdf(objects, 5)[0], max_cached_objects=1)
+        doc.parse()
+        for _ in range(2):
+            self.assertEqual(doc.get_object(3, 0).value, 'three')
+            self.assertEqual(doc.get_object(4, 0).value, 'four')
+        self.assertEqual(sorted(doc.indirect_objects), [(1, 0), (4, 0)])
+
+    def test_threads(self):
+        objects = {i: '({})'.format(i).encode() for i in range(3, 300)}
+        objects[1] = b'<</Type/Catalog/Pages 2 0 R>>'
+        objects[2] = b'<</Type/Pages/Kids[]/Count 0>>'
+        doc = PdfDocument(build_pdf(objects, 300)[0], max_cached_objects=20)
+        doc.parse()
+        errors = []
+        def resolve(seed):
+            obj_nos = list(range(3, 300))
+            random.Random(seed).shuffle(obj_nos)
+            for obj_no in obj_nos:
+                if doc.get_object(obj_no, 0).value != str(obj_no):
+                    errors.append(obj_no)
+        threads = [threading.Thread(target=resolve, args=(i,))
+                   for i in range(8)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(doc.indirect_objects), 22)
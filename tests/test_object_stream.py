@@ -0,0 +1,65 @@
+import struct
+import unittest
+import zlib
+from gymnast.exc     import PdfError
+from gymnast.pdf_doc import PdfDocument
+
+def build_pdf(compressed, direct):
+    """Build a PDF with the objects in compressed ({object number: body}) in
+    an object stream (object 10) and those in direct at the top level, using
+    an xref stream (object 11)"""
+    data    = bytearray(b'%PDF-1.5\n')
+    entries = {}
+    for obj_no in sorted(direct):
+        entries[obj_no] = (1, len(data), 0)
+        data += '{} 0 obj\n'.format(obj_no).encode() + direct[obj_no] \
+                + b'\nendobj\n'
+    header, body = [], b''
+    for i, obj_no in enumerate(sorted(compressed)):
+        header += [obj_no, len(body)]
+        body   += compressed[obj_no] + b'\n'
+        entries[obj_no] = (2, 10, i)
+    header = ' '.join(map(str, header)).encode() + b'\n'
+    stream = zlib.compress(header + body)
+    entries[10] = (1, len(data), 0)
+    data += '10 0 obj\n<</Type/ObjStm/N {}/First {}/Length {}' \
+            '/Filter/FlateDecode>>\nstream\n'.format(len(compressed),
+                                                     len(header),
+                                                     len(stream)).encode()
+    data += stream + b'\nendstream\nendobj\n'
+    entries[11] = (1, len(data), 0)
+    recs = b''.join(struct.pack('>BIH', *entries.get(i, (0, 0, 0)))
+                    for i in range(12))
+    data += '11 0 obj\n<</Type/XRef/Size 12/W[1 4 2]/Root 1 0 R' \
+            '/Length {}>>\nstream\n'.format(len(recs)).encode()
+    data += recs + '\nendstream\nendobj\nstartxref\n{}\n%%EOF\n'\
+                   .format(entries[11][1]).encode()
+    return bytes(data)
+
+class TestObjectStream(unittest.TestCase):
+    def setUp(self):
+        self.data = build_pdf({1: b'<</Type/Catalog/Pages 2 0 R>>',
+                               2: b'<</Type/Pages/Kids[3 0 R]/Count 1>>',
+                               4: b'(compressed)',
+                               5: b'[1 2 4 0 R]'},
+                              {3: b'<</Type/Page/Parent 2 0 R>>'})
+
+    def test_objects(self):
+        doc = PdfDocument(self.data).parse()
+        self.assertEqual(doc.get_object(4, 0).value, 'compressed')
+        arr = doc.get_object(5, 0).value
+        self.assertEqual(list(arr[:2]), [1, 2])
+        self.assertEqual(arr[2].value, 'compressed')
+        self.assertEqual(len(doc.Pages), 1)
+        self.assertRaises(PdfError, doc.get_object, 4, 1)
+
+    def test_cache(self):
+        doc = PdfDocument(self.data).parse()
+        doc.get_object(4, 0)
+        objstm = doc.get_object_stream(10)
+        self.assertIs(doc.get_object_stream(10), objstm)
+        self.assertEqual(len(objstm), 4)
+        doc.OBJSTM_CACHE_SIZE = 0
+        self.assertIsNot(doc.get_object_stream(10), doc.get_object_stream(10))
+        self.assertEqual(doc.get_object(5, 0).value[1], 2)
+        self.assertRaises(PdfError, doc.get_object_stream, 1)
@@ -0,0 +1,214 @@
+import unittest
+import warnings
+from gymnast.exc           import PdfError, PdfOpWarning
+from gymnast.pdf_lexer     import PdfLexer
+from gymnast.pdf_operation import PdfOperation
+from gymnast.pdf_types     import PdfStream
+from gymnast.renderer      import PdfSimpleRenderer, PdfTextRenderer, \
+                                  PdfFastRenderer, render_many
+from .pdf_builder          import one_page
+
+class CountingRenderer(PdfSimpleRenderer):
+    def __init__(self, page):
+        super(CountingRenderer, self).__init__(page)
+        self.ops = []
+    def _preop(self, op):
+        self.ops.append(op.opcode)
+
+class TestDispatch(unittest.TestCase):
+    def setUp(self):
+        self.page = one_page(b'0 0 m 10 10 l S BT /F1 10 Tf (Hi) Tj '
+                             b'0 0 m 5 5 l S ET')
+
+    def test_compile(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            program = self.page.Contents.compile()
+            ops     = [str(op) for op in self.page.Contents.operations]
+        self.assertEqual([(f.__name__, args, c.opcode)
+                          for f, args, c in program],
+                         [('opcode_BT', (), 'BT'),
+                          ('opcode_Tf', ('F1', 10), 'Tf'),
+                          ('opcode_Tj', ('Hi',), 'Tj'),
+                          ('opcode_ET', (), 'ET')])
+        self.assertEqual(self.page.Contents.unknown_ops,
+                         {'m': 2, 'l': 2, 'S': 2})
+        # One warning for the lot each time
+        self.assertEqual(len(caught), 2)
+        self.assertIs(caught[0].category, PdfOpWarning)
+        # Unimplemented operations are still there as NOPs when asked for
+        self.assertEqual(ops, ['m(0, 0)', 'l(10, 10)', 'S()', 'BT()',
+                               'Tf(F1, 10)', 'Tj(Hi)', 'm(0, 0)', 'l(5, 5)',
+                               'S()', 'ET()'])
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            nops = self.page.Contents.get_program(nops=True)
+        self.assertEqual(len(nops), 10)
+        self.assertEqual(nops.unknown, program.unknown)
+        self.assertEqual([c.opcode for _, _, c in nops][:4],
+                         ['m', 'l', 'S', 'BT'])
+
+    def test_shared_nop(self):
+        # Unimplemented operators share one handler, so junk in a stream
+        # doesn't grow the global table
+        size = len(PdfOperation._handler_table)
+        page = one_page(b' '.join(b'%d junk%d' % (i, i) for i in range(100)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            program = page.Contents.get_program(nops=True)
+        self.assertEqual(len(PdfOperation._handler_table), size)
+        self.assertEqual(set(program.op_ids), {0})
+        self.assertEqual([str(c(*args)) for _, args, c in program][:2],
+                         ['junk0(0)', 'junk1(1)'])
+
+    def test_hooks(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertFalse(PdfSimpleRenderer(self.page)._has_hooks())
+            renderer = CountingRenderer(self.page)
+            self.assertTrue(renderer._has_hooks())
+            self.assertEqual(renderer.render(), 'Hi')
+        # Hooks see every operation, unimplemented ones included, unless the
+        # renderer sets its own OPTYPE_MASK
+        self.assertIsNone(renderer._optype_mask())
+        self.assertEqual(renderer.ops, ['m', 'l', 'S', 'BT', 'Tf', 'Tj',
+                                        'm', 'l', 'S', 'ET'])
+        class TextCountingRenderer(CountingRenderer):
+            OPTYPE_MASK = PdfOperation.TEXT_EXTRACTION
+        renderer = TextCountingRenderer(self.page)
+        self.assertEqual(renderer.render(), 'Hi')
+        self.assertEqual(renderer.ops, ['BT', 'Tf', 'Tj', 'ET'])
+        self.assertEqual(PdfTextRenderer(self.page)._optype_mask(),
+                         PdfOperation.TEXT_EXTRACTION)
+        # Hooks set on the renderer itself see every operation too
+        renderer = PdfTextRenderer(self.page)
+        ops      = []
+        def postop(op, postop=renderer._postop):
+            ops.append(op.opcode)
+            postop(op)
+        renderer._postop = postop
+        self.assertIsNone(renderer._optype_mask())
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertEqual(renderer.render(),
+                             PdfTextRenderer(self.page).render())
+        self.assertEqual(ops, ['m', 'l', 'S', 'BT', 'Tf', 'Tj',
+                               'm', 'l', 'S', 'ET'])
+
+    def test_lookup(self):
+        self.assertEqual(PdfOperation['Tj'].opcode, 'Tj')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(3):
+                PdfOperation['xyzzy']()(None)
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(PdfOperation.unknown_opcodes['xyzzy'], 3)
+
+class TestPrograms(unittest.TestCase):
+    def test_cached(self):
+        page = one_page(b'BT /F1 10 Tf 1 0 0 1 72 700 Tm (Hello) Tj '
+                        b'[(Wor) -50 (ld)] TJ ET')
+        program = page.Contents.program
+        self.assertEqual(len(program), 6)
+        self.assertEqual(list(program.counts), [0, 2, 6, 1, 1, 0])
+        self.assertEqual(len(program.operands), 10)
+        text = page.Contents.get_program(PdfSimpleRenderer.OPTYPE_MASK)
+        page.Contents.get_program(nops=True)
+        # Rendering again doesn't touch the stream
+        decode = PdfStream.decode
+        PdfStream.decode = None
+        try:
+            self.assertEqual(PdfSimpleRenderer(page).render(), 'HelloWorld')
+            self.assertEqual(CountingRenderer(page).render(), 'HelloWorld')
+            self.assertIs(page.Contents.program, program)
+            self.assertIs(page.Contents.get_program(
+                              PdfSimpleRenderer.OPTYPE_MASK), text)
+        finally:
+            PdfStream.decode = decode
+
+    def test_split_streams(self):
+        # Operands can carry over from one stream to the next
+        page = one_page([b'BT /F1 10 Tf (Hi)', b'Tj ET'])
+        self.assertEqual(PdfSimpleRenderer(page).render(), 'Hi')
+
+class TestRenderMany(unittest.TestCase):
+    def test_render_many(self):
+        stream = b'BT /F1 10 Tf 72 700 Td (Hello) Tj 100 0 Td (World) Tj ' \
+                 b'0 -20 Td [(Again) -200 (!)] TJ ET'
+        page   = one_page(stream)
+        counting = CountingRenderer(page)
+        results  = render_many(page, [PdfSimpleRenderer, PdfTextRenderer,
+                                      PdfTextRenderer(page, fixed_width=False),
+                                      counting])
+        self.assertEqual(results,
+                         [PdfSimpleRenderer(page).render(),
+                          PdfTextRenderer(page).render(),
+                          PdfTextRenderer(page, fixed_width=False).render(),
+                          'HelloWorldAgain!'])
+        self.assertEqual(results[0], 'HelloWorldAgain!')
+        self.assertEqual(counting.ops,
+                         ['BT', 'Tf', 'Td', 'Tj', 'Td', 'Tj', 'Td', 'TJ', 'ET'])
+
+class TestSkipping(unittest.TestCase):
+    stream = b'1 0 0 RG 0.5 w 0 0 m 10 10 l S /GS0 gs q 2 0 0 2 0 0 cm BT ' \
+             b'/F1 10 Tf 72 700 Td (Hello) Tj ET Q 0 0 m 5 5 l f* ' \
+             b'/P <</MCID 0>> BDC BT /F1 10 Tf [(Wor) -50 (ld)] TJ ET EMC'
+
+    def test_skipped_operators(self):
+        skipped = PdfOperation.skipped_operators(PdfOperation.TEXT_EXTRACTION)
+        for op in (b'm', b'l', b're', b'S', b'f*', b'w', b'rg', b'Do'):
+            self.assertIn(op, skipped)
+        for op in (b'q', b'Q', b'cm', b'BT', b'Tf', b'Td', b'TJ', b'BI',
+                   b'EI'):
+            self.assertNotIn(op, skipped)
+
+    def test_lexer(self):
+        skipped = PdfOperation.skipped_operators(PdfOperation.TEXT_EXTRACTION)
+        lexer   = PdfLexer(b'1 0 0 RG 10.5 -2 m .5 +3 l f* /GS0 gs q')
+        self.assertEqual(lexer.skip_operations(skipped), 5)
+        self.assertEqual(lexer.read(), b'q')
+        # Stops at anything that isn't an operation to skip
+        for data in (b'1 2 Tf', b'1 2 ma', b'1 2m', b'/P <<>> BDC'):
+            lexer = PdfLexer(data)
+            self.assertEqual(lexer.skip_operations(skipped), 0)
+            self.assertEqual(lexer.tell(), 0)
+
+    def test_program(self):
+        page    = one_page(self.stream)
+        mask    = PdfOperation.TEXT_EXTRACTION
+        program = page.Contents.get_program(mask)
+        self.assertEqual([c.opcode for _, _, c in program],
+                         ['q', 'cm', 'BT', 'Tf', 'Td', 'Tj', 'ET', 'Q',
+                          'BT', 'Tf', 'TJ', 'ET'])
+        self.assertIs(page.Contents.get_program(mask), program)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertIsNot(page.Contents.program, program)
+        # Only the unimplemented operators the mask wanted are counted
+        self.assertEqual(program.unknown, {})
+        self.assertEqual(PdfSimpleRenderer(page).render(), 'HelloWorld')
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertEqual(CountingRenderer(page).render(), 'HelloWorld')
+
+    def test_render_many(self):
+        page = one_page(self.stream)
+        render_many(page, [PdfSimpleRenderer, PdfTextRenderer])
+        # PdfTextRenderer has hooks, so the NOPs are kept
+        self.assertEqual(list(page.Contents._programs),
+                         [(PdfOperation.TEXT_EXTRACTION, True)])
+
+class TestFastRenderer(unittest.TestCase):
+    def test_render(self):
+        page = one_page(TestSkipping.stream + b' BT /F1 12 Tf 14 TL '
+                        b'(A) Tj (B) \' 1 2 (C) " [<44> 10 (E)] TJ ET')
+        self.assertEqual(PdfFastRenderer(page).render(), 'HelloWorldABCDE')
+        self.assertEqual(PdfFastRenderer(page).render(),
+                         PdfSimpleRenderer(page).render())
+        program = page.Contents.get_program(PdfFastRenderer.OPTYPE_MASK)
+        self.assertNotIn('Td', [c.opcode for _, _, c in program])
+
+    def test_invalid(self):
+        page = one_page(b'BT /F1 12 Tf [(A) [1]] TJ ET')
+        with self.assertRaises(PdfError):
+            PdfFastRenderer(page).render()
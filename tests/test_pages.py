@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from gymnast.exc      import PdfError
+from gymnast.pdf_doc  import PdfDocument
+from gymnast.renderer import PdfTextRenderer, PdfSimpleRenderer
+from .pdf_builder     import build_pdf, text_pdf
+
+def tree_pdf(shape):
+    """Build a PDF whose page tree has the given shape: a list of kids, each
+    either None (a page) or a list (a page node).  Returns the data and a
+    list of the pages' object numbers in order."""
+    objects = {1: None}
+    pages   = []
+    def add_node(kids, parent):
+        node_no = len(objects) + 1
+        objects[node_no] = None
+        kid_nos, count = [], 0
+        for kid in kids:
+            if kid is None:
+                kid_no = len(objects) + 1
+                objects[kid_no] = '<</Type/Page/Parent {} 0 R>>'\
+                                  .format(node_no).encode()
+                pages.append(kid_no)
+                count += 1
+            else:
+                kid_no, kid_count = add_node(kid, node_no)
+                count += kid_count
+            kid_nos.append(kid_no)
+        parent = ' /Parent {} 0 R'.format(parent) if parent else ''
+        objects[node_no] = '<</Type/Pages/Kids[{}]/Count {}{}>>'.format(
+            ' '.join('{} 0 R'.format(k) for k in kid_nos), count, parent
+        ).encode()
+        return node_no, count
+    root, _ = add_node(shape, None)
+    objects[1] = '<</Type/Catalog/Pages {} 0 R>>'.format(root).encode()
+    return build_pdf(objects, len(objects) + 1)[0], pages
+
+class TestPages(unittest.TestCase):
+    SHAPE = [None, [None, [None, None], None], [], [[None], None], None]
+
+    def setUp(self):
+        data, self.page_nos = tree_pdf(self.SHAPE)
+        self.doc = PdfDocument(data).parse()
+
+    def test_count(self):
+        self.assertEqual(self.doc.page_count, 8)
+        self.assertEqual(len(self.doc.Pages), 8)
+
+    def test_random_access(self):
+        for i, obj_no in enumerate(self.page_nos):
+            self.assertEqual(self.doc.page(i).object_key, (obj_no, 0))
+        self.assertEqual(self.doc.Pages[-1].object_key, (self.page_nos[-1], 0))
+        self.assertEqual([p.object_key[0] for p in self.doc.Pages[2:5]],
+                         self.page_nos[2:5])
+        self.assertRaises(IndexError, self.doc.page, 8)
+        self.assertRaises(IndexError, self.doc.page, -9)
+
+    def test_lazy(self):
+        self.doc.page(6)
+        parsed = {k[0] for k in self.doc.indirect_objects}
+        self.assertIn(self.page_nos[6], parsed)
+        # Nothing under the subtrees that got skipped
+        self.assertFalse(parsed.intersection(self.page_nos[1:5]))
+
+    def test_iteration(self):
+        pages = iter(self.doc.Pages)
+        self.assertEqual(next(pages).object_key, (self.page_nos[0], 0))
+        self.assertEqual([p.object_key[0] for p in self.doc.Pages],
+                         self.page_nos)
+
+    def test_page_index(self):
+        for i in (5, 0, 7, 3):
+            key  = (self.page_nos[i], 0)
+            page = self.doc.get_object(*key).parsed_object
+            self.assertEqual(page.pages_index, i)
+            self.assertEqual(self.doc.Pages.index(page), i)
+            self.assertIn(page, self.doc.Pages)
+        other = PdfDocument(tree_pdf(self.SHAPE)[0]).parse().page(0)
+        self.assertNotIn(other, self.doc.Pages)
+
+class TestSharedResources(unittest.TestCase):
+    def setUp(self):
+        self.doc = PdfDocument(text_pdf([['one'], ['two'], ['three']])).parse()
+
+    def test_lazy_fonts(self):
+        page  = self.doc.page(0)
+        fonts = page.Fonts
+        self.assertEqual(list(fonts), ['F1'])
+        self.assertNotIn((3, 0), self.doc.indirect_objects)
+        self.assertEqual(PdfTextRenderer(page).render().strip(), 'one')
+        self.assertIn((3, 0), self.doc.indirect_objects)
+
+    def test_sharing(self):
+        pages = list(self.doc.Pages)
+        self.assertIs(pages[0].Resources, pages[2].Resources)
+        font = pages[0].Fonts['F1']
+        self.assertIs(pages[1].Fonts['F1'], font)
+        # Even after the page and font objects are dropped from the cache
+        self.doc.indirect_objects.unpin((3, 0))
+        self.doc.indirect_objects.evict_all()
+        self.assertIs(self.doc.page(1).Fonts['F1'], font)
+        self.assertIs(font.FontDescriptor, font.FontDescriptor)
+        self.assertEqual(font.FontDescriptor.CapHeight, 700)
+        self.assertIs(font.Encoding, font.Encoding)
+        self.assertEqual(font.Widths[0], 580)
+
+class TestClose(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(text_pdf([['Page {}'.format(i)] for i in range(3)]))
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_parsed_streams(self):
+        # Stream bodies are views into the file's map, which keep it open
+        with PdfDocument(self.path) as doc:
+            doc.parse()
+            pages = list(doc.iter_pages())
+            streams = [page.Contents._contents[0].value for page in pages]
+        self.assertEqual(streams[1].decode(), b''.join(
+            streams[1].iter_decode()))
+        self.assertEqual([PdfSimpleRenderer(p).render() for p in pages],
+                         ['Page 0', 'Page 1', 'Page 2'])
+
+    def test_unparsed(self):
+        with PdfDocument(self.path) as doc:
+            doc.parse()
+            page = doc.page(2)
+        self.assertRaises(PdfError, lambda: page.Contents.program)
@@ -0,0 +1,33 @@
+import unittest
+from gymnast.pdf_matrix  import PdfMatrix
+from gymnast.renderer    import PdfTextRenderer
+from gymnast.renderer.renderer_states import GraphicsState
+from .pdf_builder        import one_page
+
+class TestGraphicsState(unittest.TestCase):
+    def test_stack(self):
+        page     = one_page(b'2 0 0 2 0 0 cm q 1 0 0 1 5 5 cm 3 w q 4 w Q Q '
+                            b'0.5 w', b'<</Font<<>>>>')
+        renderer = PdfTextRenderer(page)
+        states   = []
+        def postop(op):
+            states.append((renderer.gs.CTM, renderer.gs.line_width,
+                           len(renderer._state_stack)))
+        renderer._postop = postop
+        renderer.render()
+        scaled = PdfMatrix(2, 0, 0, 2, 0, 0)
+        moved  = PdfMatrix(2, 0, 0, 2, 10, 10) # Translated in scaled space
+        self.assertEqual(states, [(scaled, 1, 0), (scaled, 1, 1),
+                                  (moved, 1, 1), (moved, 3, 1),
+                                  (moved, 3, 2), (moved, 4, 2),
+                                  (moved, 3, 1), (scaled, 1, 0),
+                                  (scaled, 0.5, 0)])
+
+    def test_derive(self):
+        root  = GraphicsState()
+        child = root.derive()
+        self.assertEqual(child.miter_limit, 10.0)
+        child.line_width = 2
+        self.assertEqual((root.line_width, child.line_width), (1.0, 2))
+        self.assertRaises(AttributeError, getattr, child, 'nonsense')
+        self.assertRaises(AttributeError, setattr, child, 'nonsense', 1)
@@ -1,10 +1,10 @@
 from .parser_test import ParserTestCase
-from ..pdf_parser.exc        import PdfParseError
+from gymnast.exc    import PdfParseError
 
 class TestSimpleTypes(ParserTestCase):
     def setUp(self):
-        super(TestSimpleTypes, self).__init__()
-        self.func = self.parser._parse_literal
+        super(TestSimpleTypes, self).setUp()
+        self.func = self.parser.parse_literal
 
     def test_int(self):
         self.assertEqual(self.func(b'-10'), -10)
@@ -20,7 +20,7 @@ class TestSimpleTypes(ParserTestCase):
         self.assertIsNone(self.func(b'null'))
     def test_invalid(self):
         bad_vals = [b'slfkj', b'none', b'True', b'False', b'12..54',
-                    b'-123.55', b'123,456', b'(string)', b'<</Name1 1>>',
+                    b'-123.55.', b'123,456', b'(string)', b'<</Name1 1>>',
                     b'[1 2 3]',b'%comment', b'\x250\x249']
         for val in bad_vals:
             self.assertRaises(PdfParseError, self.func, val)
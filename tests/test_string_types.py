@@ -1,9 +1,10 @@
 from .parser_test import ParserTestCase
-from ..pdf_parser.pdf_types import PdfName
+from gymnast.pdf_types import PdfName
 
 class TestStringTypes(ParserTestCase):
     def test_literal_string(self):
-        func = self.parser._parse_literal_string
+        func = lambda objects: self.parser.parse_literal_string(self.data,
+                                                              objects)
         self.set_data(b'simple string)')
         self.assertEqual(func(None)._parsed_bytes, b'simple string')
         self.set_data(b'simple (string))')
@@ -12,15 +13,18 @@ class TestStringTypes(ParserTestCase):
         self.assertEqual(func(None)._parsed_bytes, b'simple ((string)')
         self.set_data(b'simple (string\\)))')
         self.assertEqual(func(None)._parsed_bytes, b'simple (string))')
+        self.set_data(b'a\\\\b\\101\\0053\\\nc)')
+        self.assertEqual(func(None)._parsed_bytes, b'a\\bA\x053c')
+        self.set_data(b'\xfe\xff\x00A\x00B)')
+        self.assertEqual(str(func(None)), 'AB')
 
     def test_hex_string(self):
-        func = self.parser._parse_hex_string
+        func = lambda objects: self.parser.parse_hex_string(self.data, objects)
         self.set_data(b'deadbeef>')
         self.assertEqual(func(None)._parsed_bytes, b'\xde\xad\xbe\xef')
 
     def test_name(self):
-        self.set_data(b'Bob#20Smith')
-        val = self.parser._parse_name
+        val = self.parser.parse_name(b'Bob#20Smith')
         self.assertTrue(isinstance(val, PdfName))
         self.assertTrue(isinstance(val, str))
         self.assertEqual(val, 'Bob Smith')
@@ -0,0 +1,84 @@
+import struct
+import unittest
+import zlib
+import gymnast.misc
+from gymnast.filters    import StreamFilter
+from gymnast.pdf_doc    import PdfDocument
+from gymnast.xref_index import XrefIndex
+from .pdf_builder       import build_pdf
+
+class TestXrefIndex(unittest.TestCase):
+    def test_layering(self):
+        xrefs = XrefIndex(None)
+        self.assertTrue(xrefs.add(3, XrefIndex.IN_USE, 100, 1))
+        self.assertFalse(xrefs.add(3, XrefIndex.IN_USE, 50, 0))
+        xrefs.add(1000, XrefIndex.FREE, 0, 2)
+        xrefs.add(7, XrefIndex.COMPRESSED, 12, 0, 4)
+        self.assertEqual(len(xrefs), 3)
+        self.assertEqual(sorted(xrefs), [(3, 1), (7, 0), (1000, 2)])
+        self.assertIn((3, 1), xrefs)
+        self.assertNotIn((3, 0), xrefs)
+        self.assertNotIn((4, 0), xrefs)
+        self.assertEqual(xrefs.entry(7), (XrefIndex.COMPRESSED, 12, 0, 4))
+        self.assertEqual(xrefs[(3, 1)].key, (3, 1))
+        self.assertRaises(KeyError, xrefs.__getitem__, (2000, 0))
+
+    def test_incremental_update(self):
+        objects = {1: b'<</Type/Catalog/Pages 2 0 R>>',
+                   2: b'<</Type/Pages/Kids[]/Count 0>>',
+                   3: b'(old)',
+                   4: b'(unchanged)'}
+        data, startxref = build_pdf(objects, 5)
+        data, _ = build_pdf({3: b'(new)'}, 5, startxref, data)
+        doc = PdfDocument(data).parse()
+        self.assertEqual(doc.get_object(3, 0).value, 'new')
+        self.assertEqual(doc.get_object(4, 0).value, 'unchanged')
+        self.assertEqual(doc.Size, 5)
+
+    def test_table(self):
+        xrefs = XrefIndex(None)
+        xrefs.add_table(0, b'0000000000 65535 f\r\n'
+                           b'0000000017 00000 n\r\n'
+                           b'0000001234 00002 n \n')
+        self.assertEqual(xrefs.entry(0), (XrefIndex.FREE, 0, 65535, 0))
+        self.assertEqual(xrefs.entry(1), (XrefIndex.IN_USE, 17, 0, 0))
+        self.assertEqual(xrefs.entry(2), (XrefIndex.IN_USE, 1234, 2, 0))
+        # Lines that are a byte short
+        xrefs.add_table(10, b'0000000017 00000 n\n0000000020 00000 n\n')
+        self.assertEqual(xrefs.entry(11), (XrefIndex.IN_USE, 20, 0, 0))
+        self.assertRaises(Exception, xrefs.add_table, 20, b'0000000017 0 n\n')
+
+    def test_stream(self):
+        recs = [(0, 0, 65535), (1, 500, 0), (2, 9, 3), (1, 70000, 1)]
+        data = b''.join(struct.pack('>BIH', *r) for r in recs)
+        xrefs = XrefIndex(None)
+        xrefs.add_stream(data, [1, 4, 2], [0, 2, 10, 2])
+        self.assertEqual(xrefs.entry(0), (XrefIndex.FREE, 0, 65535, 0))
+        self.assertEqual(xrefs.entry(1), (XrefIndex.IN_USE, 500, 0, 0))
+        self.assertIsNone(xrefs.entry(2))
+        self.assertEqual(xrefs.entry(10), (XrefIndex.COMPRESSED, 9, 0, 3))
+        self.assertEqual(xrefs.entry(11), (XrefIndex.IN_USE, 70000, 1, 0))
+        # No type field
+        xrefs = XrefIndex(None)
+        xrefs.add_stream(b'\x00\x10\x00\x20', [0, 2, 0], [5, 2])
+        self.assertEqual(xrefs.entry(6), (XrefIndex.IN_USE, 32, 0, 0))
+
+    def test_png_predictor(self):
+        rows = [b'\x01\x00\x10\x00', b'\x01\x00\x20\x01']
+        data = b'\x02' + rows[0] \
+              +b'\x02' + bytes((a-b) & 0xFF for a, b in zip(rows[1], rows[0]))
+        decoded = StreamFilter['FlateDecode'].decode(zlib.compress(data),
+                                                     Predictor=12, Columns=4)
+        self.assertEqual(decoded, b''.join(rows))
+        data = b'\x01\x01\x01\x01\x01\x03\x01\x01\x01\x01'
+        decoded = StreamFilter['FlateDecode'].decode(zlib.compress(data),
+                                                     Predictor=12, Columns=4)
+        self.assertEqual(decoded, b'\x01\x02\x03\x04\x01\x02\x03\x04')
+
+class TestXrefIndexNoNumpy(TestXrefIndex):
+    """Same again, but with the pure Python implementations"""
+    def setUp(self):
+        self._numpy = gymnast.misc.get_numpy()
+        gymnast.misc._numpy = False
+    def tearDown(self):
+        gymnast.misc._numpy = self._numpy